@@ -0,0 +1,254 @@
+#!/usr/bin/python3
+import os, sys, json, argparse, logging
+from collections import defaultdict, Counter
+from author_names import hash_names
+from normalize_institutions import normalize_and_validate_tokens
+import institution_resolver, influence
+
+"""
+	Author disambiguation stage, run between the publication and the author builds: finds the name hashes which
+	denote the same author (e.g. "j stiglitz", "joseph stiglitz" and "joseph e stiglitz") and writes a mapping
+	from alias name hash to canonical author ID (the name hash of the alias listed in top_authors if any, so that the
+	document of a top author keeps its ID from one build to the next, or else of the alias with the most
+	publications), which index_authors uses to fold all the authorships of an author into a single document.
+
+	Name hashes are grouped in blocks sharing the last name and first initial, or a phonetic key of the last name
+	and the first initial, and are only compared within their blocks (blocks larger than MAX_BLOCK_SIZE, e.g.
+	for very common names, are split by co-author and by institution). Two name hashes with compatible names
+	(same last name, first names and middle initials matching or abbreviated) are merged if they share a
+	co-author or an institution, or if an abbreviated first name has a single possible expansion in the block.
+	Last names which only match phonetically (spelling variants, typos) need a shared co-author or institution.
+
+	Usage: python3 author_disambiguation.py [--from-cache parse_cache] [--output author_aliases.json]
+	Publications are read from the publication index, or from the parse cache of index_publis.
+"""
+
+AUTHOR_ALIASES_FILE = 'author_aliases.json'
+
+# Blocks with more name hashes than that are split by co-author and by institution
+MAX_BLOCK_SIZE = 200
+
+SOUNDEX_CODES = dict([(c, str(i)) for i, letters in enumerate(["aeiouyhw", "bfpv", "cgjkqsxz", "dt", "l", "mn", "r"]) for c in letters])
+
+def soundex(token):
+	letters = [c for c in token if c.isalpha()]
+	if not letters:
+		return token
+	code = letters[0]
+	last = SOUNDEX_CODES.get(letters[0], '')
+	for c in letters[1:]:
+		d = SOUNDEX_CODES.get(c, '')
+		if d and d != '0' and d != last:
+			code += d
+		if c not in "hw":
+			last = d
+	return (code + "000")[:4]
+
+'''
+	Splits a name hash into first name (or initial), middle initials and last name.
+'''
+def name_parts(name_hash):
+	tokens = name_hash.split()
+	if len(tokens) < 2:
+		return None
+	return tokens[0], tokens[1:-1], tokens[-1]
+
+def first_names_compatible(f1, f2):
+	if len(f1) == 1 or len(f2) == 1:
+		return f1[0] == f2[0]
+	return f1 == f2
+
+def middles_compatible(m1, m2):
+	n = min(len(m1), len(m2))
+	return m1[:n] == m2[:n]
+
+def edit_distance_at_most_one(a, b):
+	if abs(len(a) - len(b)) > 1:
+		return False
+	if len(a) == len(b):
+		return sum([1 for x, y in zip(a, b) if x != y]) <= 1
+	if len(a) > len(b):
+		a, b = b, a
+	i = 0
+	while i < len(a) and a[i] == b[i]:
+		i += 1
+	return a[i:] == b[i + 1:]
+
+'''
+	Co-authors, institutions and number of authorships of each name hash.
+'''
+class AuthorProfiles:
+	def __init__(self, resolver=None):
+		self.resolver = resolver
+		self.pubs = Counter()
+		self.coauthors = defaultdict(set)
+		self.institutions = defaultdict(set)
+
+	def institution_id(self, inst):
+		cid = self.resolver.resolve(inst) if self.resolver else None
+		return cid or institution_resolver.institution_key(normalize_and_validate_tokens(inst))
+
+	def add_publication(self, publi, hashes):
+		authors = list([(hashes.get(author["full_name"]), author) for author in publi.get("authors", [])])
+		authors = list([(h, author) for h, author in authors if h])
+		for h, author in authors:
+			self.pubs[h] += 1
+			for other, _ in authors:
+				if other != h:
+					self.coauthors[h].add(other)
+			if author.get("institution"):
+				cid = self.institution_id(author["institution"])
+				if cid:
+					self.institutions[h].add(cid)
+
+	def add_publications(self, publis, chunk_size=1000):
+		chunk = []
+		for publi in publis:
+			chunk.append(publi)
+			if len(chunk) >= chunk_size:
+				self.add_chunk(chunk)
+				chunk = []
+		self.add_chunk(chunk)
+
+	def add_chunk(self, chunk):
+		hashes = hash_names([author["full_name"] for publi in chunk for author in publi.get("authors", [])])
+		for publi in chunk:
+			self.add_publication(publi, hashes)
+
+'''
+	Union-find structure over name hashes, in which each cluster keeps the most complete first name and middle
+	initials of its members, so that merging a cluster with an incompatible name (e.g. "j smith" being already
+	merged with "john smith", then compared with "jane smith") is refused.
+'''
+class Clusters:
+	def __init__(self):
+		self.parent = { }
+		self.first = { }
+		self.middles = { }
+
+	def find(self, h):
+		root = h
+		while self.parent.get(root, root) != root:
+			root = self.parent[root]
+		while h != root:
+			self.parent[h], h = root, self.parent[h]
+		return root
+
+	def add(self, h, first, middles):
+		if h not in self.parent:
+			self.parent[h] = h
+			self.first[h] = first
+			self.middles[h] = middles
+
+	def compatible(self, r1, r2):
+		return first_names_compatible(self.first[r1], self.first[r2]) and middles_compatible(self.middles[r1], self.middles[r2])
+
+	def union(self, h1, h2):
+		r1, r2 = self.find(h1), self.find(h2)
+		if r1 == r2 or not self.compatible(r1, r2):
+			return False
+		self.parent[r2] = r1
+		self.first[r1] = max(self.first[r1], self.first[r2], key=len)
+		self.middles[r1] = max(self.middles[r1], self.middles[r2], key=len)
+		return True
+
+'''
+	Returns the blocks of name hashes, as a mapping from blocking key to list of name hashes.
+'''
+def blocks(profiles, parts):
+	result = defaultdict(list)
+	for h, (first, middles, last) in parts.items():
+		result[("name", last, first[0])].append(h)
+		result[("phonetic", soundex(last), first[0])].append(h)
+	for key in list(result.keys()):
+		if len(result[key]) > MAX_BLOCK_SIZE:
+			members = result.pop(key)
+			for h in members:
+				for other in profiles.coauthors[h]:
+					result[key + ("coauthor", other)].append(h)
+				for cid in profiles.institutions[h]:
+					result[key + ("institution", cid)].append(h)
+	return result
+
+def shared_context(profiles, h1, h2):
+	return bool(profiles.coauthors[h1] & profiles.coauthors[h2]) or bool(profiles.institutions[h1] & profiles.institutions[h2])
+
+'''
+	Computes the mapping from alias name hash to canonical author ID.
+'''
+def disambiguate(profiles, preferred=()):
+	parts = dict([(h, p) for h, p in [(h, name_parts(h)) for h in profiles.pubs] if p])
+	clusters = Clusters()
+	for h, (first, middles, last) in parts.items():
+		clusters.add(h, first, middles)
+	comparisons = 0
+	for key, members in blocks(profiles, parts).items():
+		if len(members) < 2:
+			continue
+		# Full first names of the block, used to expand abbreviated ones
+		full_firsts = set([parts[h][0] for h in members if len(parts[h][0]) > 1])
+		for i, h1 in enumerate(members):
+			f1, m1, l1 = parts[h1]
+			for h2 in members[i + 1:]:
+				f2, m2, l2 = parts[h2]
+				comparisons += 1
+				if not first_names_compatible(f1, f2) or not middles_compatible(m1, m2):
+					continue
+				if l1 == l2:
+					unique_expansion = (len(f1) == 1 or len(f2) == 1) and len(full_firsts) == 1 and key[0] == "name"
+					if unique_expansion or shared_context(profiles, h1, h2):
+						clusters.union(h1, h2)
+				elif edit_distance_at_most_one(l1, l2) and shared_context(profiles, h1, h2):
+					clusters.union(h1, h2)
+	members = defaultdict(list)
+	for h in parts:
+		members[clusters.find(h)].append(h)
+	mapping = { }
+	for cluster in members.values():
+		if len(cluster) < 2:
+			continue
+		canonical = max(cluster, key=lambda h: (h in preferred, profiles.pubs[h], len(h), h))
+		for h in cluster:
+			if h != canonical:
+				mapping[h] = canonical
+	logging.info("Disambiguation: {} name hashes, {} comparisons, {} aliases".format(len(parts), comparisons, len(mapping)))
+	return mapping
+
+def save_aliases(mapping, path=AUTHOR_ALIASES_FILE):
+	tmp = path + ".tmp"
+	with open(tmp, 'w') as f:
+		json.dump(mapping, f, sort_keys=True)
+	os.replace(tmp, path)
+
+def load_aliases(path=AUTHOR_ALIASES_FILE):
+	try:
+		with open(path) as f:
+			return json.load(f)
+	except FileNotFoundError:
+		return { }
+
+def yield_index_publis():
+	from elasticsearch.helpers import scan
+	import local_search
+	from index_publis import ES_INDEX_PUBLI
+	client = local_search.create_client(os.environ.get('ECONFAST_BACKEND', 'es'))
+	for hit in scan(client, scroll='60m', index=ES_INDEX_PUBLI, query={ "query": { "match_all": {} } }, _source=["authors"]):
+		yield hit["_source"]
+
+def yield_cached_publis(d):
+	import publi_cache
+	for _, publis in publi_cache.read_cache(d):
+		for publi in publis:
+			yield publi
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Computes the mapping from alias author name hashes to canonical author IDs")
+	parser.add_argument("--from-cache", help="Directory of the parse cache to read publications from (instead of the publication index)")
+	parser.add_argument("--output", default=AUTHOR_ALIASES_FILE)
+	args = parser.parse_args()
+	logging.basicConfig(level=logging.INFO)
+	profiles = AuthorProfiles(institution_resolver.load_resolver())
+	profiles.add_publications(yield_cached_publis(args.from_cache) if args.from_cache else yield_index_publis())
+	mapping = disambiguate(profiles, influence.load_top_authors())
+	save_aliases(mapping, args.output)
+	print("Wrote {} aliases of {} name hashes to {}".format(len(mapping), len(profiles.pubs), args.output))
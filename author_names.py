@@ -0,0 +1,105 @@
+import re, logging
+from functools import lru_cache
+
+"""
+	Normalization of author names: name hashes used as author IDs, and selection of the best name variant.
+
+	The same names come up again and again (once per authorship), so results are memoized in bounded caches.
+"""
+
+# Maximum number of names kept in each memo cache
+NAME_CACHE_SIZE = 1 << 20
+
+DUMMY_NAMES = ["anonymous", "collective"]
+
+RE_NAME_SEPARATOR = re.compile(r'\.| ')
+
+def remove_comma(n):
+	l = list([i.strip() for i in n.split(",")])
+	if len(l) < 2:
+		return n
+	if len(l) > 2:
+		logging.warning("Found full name with several commas: {}".format(n))
+	return l[1] + " " + l[0]
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def hash_name(n):
+	if len(n) < 4:
+		return None
+	m = remove_comma(n)
+	l = list([i.lower().strip(". ") for i in RE_NAME_SEPARATOR.split(m) if len(i.strip(". ")) > 0])
+	if len(l) > 0:
+		r = [l[0]]
+		for i in range(1, len(l)-1):
+			mid = l[i].strip()
+			if len(mid) > 0:
+				r.append(mid[0])
+		if len(l) > 1:
+			r.append(l[-1])
+		name_hash = " ".join(r)
+		if any([n in name_hash.lower() for n in DUMMY_NAMES]):
+			return None
+		return name_hash
+	return None
+
+'''
+	Hashes all the names of a chunk at once (each distinct name being hashed only once),
+	and returns the mapping from name to name hash.
+'''
+def hash_names(names):
+	return dict([(n, hash_name(n)) for n in set(names)])
+
+def token_count(n, k):
+	m = remove_comma(n)
+	l = list([i.strip("-. ") for i in RE_NAME_SEPARATOR.split(m) if len(i.strip("-. ")) > k])
+	return len(l)
+
+'''
+	1st metric to select the best name variant
+'''
+def metric_token_count(n):
+	return token_count(n, 0)
+
+'''
+	2nd metric to select the best name variant
+'''
+def metric_full_token_count(n):
+	return token_count(n, 1)
+
+'''
+	3rd metric to select the best name variant
+'''
+def metric_comma_count(n):
+	return 0 if n.count(",") > 0 else 1
+
+'''
+	Used to sort name variants when picking the best one.
+'''
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def name_variant_key(n):
+	return metric_token_count(n), metric_full_token_count(n), metric_comma_count(n)
+
+def format_name(n):
+	return " ".join([i[0].upper() + (i[1:].lower() if len(i) > 1 else "") for i in n.split(" ") if len(i) > 0])
+
+'''
+	Picks the best variant among several full names for the same person.
+
+	The best variant first maximizes the token count, then maximizes the number of full tokens (as
+	opposed to initials), finally minimizes the number of commas.
+
+	For example with "Harvey, Andrew C.", "Andrew C. Harvey", "Andrew Harvey", "Andrew Charles Harvey",
+	the latter will be selected.
+'''
+def best_name_variant(names):
+	best = sorted(names, key=name_variant_key, reverse=True)[0]
+	return format_name(best)
+
+'''
+	Running version of best_name_variant: returns the best of the current best variant (which may be None)
+	and a new variant, the first variant seen being kept on ties.
+'''
+def better_name_variant(best, n):
+	if best is None or name_variant_key(n) > name_variant_key(best):
+		return n
+	return best
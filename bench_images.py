@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+import os, sys, glob, time, argparse, tempfile
+import numpy as np
+import cv2
+import image_analysis
+
+"""
+	Benchmark of image verification on a local folder of sample images (e.g. pictures and logos previously
+	crawled): the previous per-image checks at full resolution (one decode per check) versus the batched engine
+	(single decode, downsampling, process pool), with a cold and then a warm verdict cache.
+
+	Usage: python3 bench_images.py FOLDER [--workers 4] [--generate 200]
+	With --generate, the folder is first filled with synthetic color and grayscale images.
+"""
+
+EXTENSIONS = ["jpg", "jpeg", "png", "gif", "bmp", "webp"]
+
+def generate(folder, count, seed=0):
+	rnd = np.random.RandomState(seed)
+	os.makedirs(folder, exist_ok=True)
+	for i in range(count):
+		h, w = rnd.randint(300, 1600), rnd.randint(300, 1600)
+		img = np.full((h, w, 3), rnd.randint(0, 255, 3), dtype=np.uint8)
+		for _ in range(20):
+			y, x = rnd.randint(0, h), rnd.randint(0, w)
+			cv2.rectangle(img, (x, y), (x + rnd.randint(10, w // 2), y + rnd.randint(10, h // 2)), rnd.randint(0, 255, 3).tolist(), -1)
+		if i % 4 == 0:
+			img = cv2.cvtColor(cv2.cvtColor(img, cv2.COLOR_BGR2GRAY), cv2.COLOR_GRAY2BGR)
+		cv2.imwrite(os.path.join(folder, "sample{:04d}.jpg".format(i)), img)
+
+def load_images(folder):
+	files = sorted([f for ext in EXTENSIONS for f in glob.glob(os.path.join(folder, "*." + ext))])
+	images = []
+	for f in files:
+		with open(f, 'rb') as handle:
+			images.append(handle.read())
+	return images
+
+def timed(label, f, n):
+	start = time.perf_counter()
+	result = f()
+	elapsed = time.perf_counter() - start
+	print("{:>36}: {:8.3f} s  {:8.1f} images/s".format(label, elapsed, n / elapsed if elapsed > 0 else 0))
+	return result
+
+def legacy(images):
+	return list([(image_analysis.face_count(data), image_analysis.isgray(data)) for data in images])
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Benchmarks image verification on a folder of images")
+	parser.add_argument("folder")
+	parser.add_argument("--workers", type=int, default=4)
+	parser.add_argument("--generate", type=int, default=0, help="Number of synthetic images to generate first")
+	args = parser.parse_args()
+	if args.generate:
+		generate(args.folder, args.generate)
+	images = load_images(args.folder)
+	if not images:
+		print("No images found in", args.folder)
+		sys.exit(1)
+	print("{} images, {:.1f} MB".format(len(images), sum([len(data) for data in images]) / 1e6))
+	old = timed("full resolution, one by one", lambda: legacy(images), len(images))
+	with tempfile.TemporaryDirectory() as d:
+		cache = image_analysis.VerdictCache(os.path.join(d, "verdicts.sqlite"))
+		timed("downscaled, 1 process, cold cache", lambda: image_analysis.verify_images(images, cache, workers=1), len(images))
+		cache.close()
+		cache = image_analysis.VerdictCache(os.path.join(d, "verdicts_pool.sqlite"))
+		timed("downscaled, {} processes, cold cache".format(args.workers), lambda: image_analysis.verify_images(images, cache, workers=args.workers), len(images))
+		timed("warm cache", lambda: image_analysis.verify_images(images, cache, workers=args.workers), len(images))
+		new = list([cache.get(image_analysis.content_hash(data)) for data in images])
+		cache.close()
+	same_gray = sum([1 for (_, g1), (_, g2) in zip(old, new) if g1 == g2])
+	same_portrait = sum([1 for (f1, _), (f2, _) in zip(old, new) if (f1 == 1) == (f2 == 1)])
+	print("Agreement with full resolution checks: grayscale {}/{}, single face {}/{}".format(same_gray, len(images), same_portrait, len(images)))
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+import sys, time, random
+import author_names
+from redif_reader import lines
+
+"""
+	Micro-benchmark of author name handling: name hashing without memoization, with memoization and in batch,
+	and best variant selection by re-sorting all aliases versus keeping a running best variant.
+
+	Usage: python3 bench_names.py [number of authorships]
+	Authorships are drawn from variants of the names in top_authors, with a skewed distribution so that
+	prolific authors come up often, as in the real corpus.
+"""
+
+def variants(full_name):
+	tokens = full_name.split()
+	if len(tokens) < 2:
+		return [full_name]
+	first, last = tokens[:-1], tokens[-1]
+	initials = ' '.join([t[0] + '.' for t in first])
+	return [
+		full_name,
+		"{}, {}".format(last, ' '.join(first)),
+		"{} {}".format(initials, last),
+		"{}, {}".format(last, initials),
+		"{} {}".format(first[0], last)]
+
+def sample_authorships(n, seed=0):
+	rnd = random.Random(seed)
+	names = list([l.split("|")[0].strip() for l in lines("top_authors") if "|" in l])
+	weights = list([1.0 / (rank + 1) for rank in range(len(names))])
+	picked = rnd.choices(names, weights=weights, k=n)
+	return list([rnd.choice(variants(name)) for name in picked])
+
+def timed(label, f, n):
+	start = time.perf_counter()
+	f()
+	elapsed = time.perf_counter() - start
+	print("{:>28}: {:8.3f} s  {:10.0f} names/s".format(label, elapsed, n / elapsed))
+
+def best_by_sorting(authorships):
+	aliases = { }
+	for n in authorships:
+		h = author_names.hash_name(n)
+		l = aliases.setdefault(h, [])
+		if n not in l:
+			l.append(n)
+			# Previous behaviour: every new alias re-sorts all aliases, re-tokenizing each of them
+			sorted(l, key=author_names.name_variant_key.__wrapped__, reverse=True)[0]
+
+def best_running(authorships):
+	aliases, best = { }, { }
+	for n in authorships:
+		h = author_names.hash_name(n)
+		l = aliases.setdefault(h, [])
+		if n not in l:
+			l.append(n)
+			best[h] = author_names.better_name_variant(best.get(h), n)
+
+if __name__ == "__main__":
+	n = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+	authorships = sample_authorships(n)
+	print("{} authorships, {} distinct names".format(n, len(set(authorships))))
+	uncached = author_names.hash_name.__wrapped__
+	timed("hash_name (no memo)", lambda: [uncached(a) for a in authorships], n)
+	author_names.hash_name.cache_clear()
+	timed("hash_name (memo, cold)", lambda: [author_names.hash_name(a) for a in authorships], n)
+	timed("hash_name (memo, warm)", lambda: [author_names.hash_name(a) for a in authorships], n)
+	author_names.hash_name.cache_clear()
+	timed("hash_names (batch of 5000)", lambda: [author_names.hash_names(authorships[i:i + 5000]) for i in range(0, n, 5000)], n)
+	timed("best variant (re-sorting)", lambda: best_by_sorting(authorships), n)
+	timed("best variant (running)", lambda: best_running(authorships), n)
+	print(author_names.hash_name.cache_info())
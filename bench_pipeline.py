@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+import os, sys, glob, json, time, argparse, logging, subprocess
+from datetime import datetime
+from elasticsearch.serializer import JSONSerializer
+import synthetic_repec
+
+"""
+	Benchmark suite of the indexing pipeline, run on synthetic RePEc corpora of increasing sizes.
+
+	For each size, times ReDIF parsing, author name hashing, author aggregation (including the co-authorship graph),
+	author document building and bulk serialization. The import time of the indexer modules is measured as well, in
+	fresh interpreters. Results are saved in bench_results/ along with the current commit, and compared with the
+	previous results file.
+
+	Usage: python3 bench_pipeline.py [--sizes 10000,100000,1000000] [--compare FILE]
+"""
+
+BENCH_DATA_DIR = 'bench_data'
+
+BENCH_RESULTS_DIR = 'bench_results'
+
+# Modules whose import time is measured
+IMPORT_MODULES = ["author_names", "index_publis", "index_authors"]
+
+# Number of fresh interpreters in which each module is imported (the median time being kept)
+IMPORT_RUNS = 5
+
+def git_commit():
+	try:
+		return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+	except Exception:
+		return "unknown"
+
+def corpus(size, seed):
+	d = os.path.join(BENCH_DATA_DIR, "{}-{}".format(size, seed))
+	if not os.path.exists(os.path.join(d, "done")):
+		print("Generating synthetic corpus of {} publications in {}".format(size, d))
+		synthetic_repec.generate(d, size, seed)
+		open(os.path.join(d, "done"), 'w').close()
+	return sorted(glob.glob("{}/*/*/*.rdf".format(d)))
+
+'''
+	Returns the median time in seconds of importing a module in a fresh interpreter (excluding the startup of the
+	interpreter itself).
+'''
+def import_time(module, runs=IMPORT_RUNS):
+	code = "import time; start = time.perf_counter(); import {}; print(time.perf_counter() - start)".format(module)
+	times = sorted([float(subprocess.check_output([sys.executable, "-c", code]).decode().split()[-1]) for _ in range(runs)])
+	return times[len(times) // 2]
+
+def run_imports():
+	results = { }
+	for module in IMPORT_MODULES:
+		seconds = import_time(module)
+		results[module] = { "seconds": round(seconds, 4) }
+		print("  import {:<15} {:9.3f} s".format(module, seconds))
+	return results
+
+class Timer:
+	def __init__(self, results, stage, items):
+		self.results, self.stage, self.items = results, stage, items
+
+	def __enter__(self):
+		self.start = time.perf_counter()
+		return self
+
+	def __exit__(self, *args):
+		elapsed = time.perf_counter() - self.start
+		count = self.items() if callable(self.items) else self.items
+		self.results[self.stage] = { "seconds": round(elapsed, 4), "items": count, "items_per_s": round(count / elapsed, 1) if elapsed > 0 else None }
+		print("  {:<22} {:9.3f} s  {:>10} items  {:>12.0f} items/s".format(self.stage, elapsed, count, count / elapsed if elapsed > 0 else 0))
+
+def run_size(size, seed):
+	import index_publis, index_authors, author_names
+	index_authors.CRAWL_AUTHOR_PICS = False
+	index_authors.CRAWL_INST_LOGOS = False
+	files = corpus(size, seed)
+	results = { "files": len(files), "bytes": sum([os.path.getsize(f) for f in files]) }
+	print("{} publications, {} files, {:.1f} MB".format(size, len(files), results["bytes"] / 1e6))
+	parsed = []
+	with Timer(results, "parse", lambda: len(parsed)):
+		for f in files:
+			parsed.extend(index_publis.parse_repec_file(f))
+	# Publications as read back from the index, i.e. with dates serialized
+	serializer = JSONSerializer()
+	publis = list([(index_publis.publi_id("bench", i), json.loads(serializer.dumps(obj))) for i, obj in enumerate(parsed)])
+	names = list([author["full_name"] for _, publi in publis for author in publi["authors"]])
+	author_names.hash_name.cache_clear()
+	with Timer(results, "hash_name", len(names)):
+		for n in names:
+			author_names.hash_name(n)
+	author_names.hash_name.cache_clear()
+	index_authors.AUTHOR_SPECIALTIES.clear()
+	accs = { }
+	with Timer(results, "aggregate_authors", len(names)):
+		graph = index_authors.new_coauthor_graph()
+		accs = index_authors.aggregate_authors(publis, graph=graph)
+		index_authors.attach_top_coauthors(accs, graph)
+	results["authors"] = len(accs)
+	docs = []
+	with Timer(results, "author_documents", len(accs)):
+		for name_hash, acc in accs.items():
+			docs.append(index_authors.author_document(acc, name_hash))
+	with Timer(results, "bulk_serialize_publis", len(parsed)):
+		for i, obj in enumerate(parsed):
+			serializer.dumps({ "index": { "_index": index_publis.ES_INDEX_PUBLI, "_id": publis[i][0] } })
+			serializer.dumps(obj)
+	with Timer(results, "bulk_serialize_authors", len(docs)):
+		for name_hash, doc in zip(accs.keys(), docs):
+			serializer.dumps({ "index": { "_index": index_authors.ES_INDEX_AUTHOR, "_id": name_hash } })
+			serializer.dumps(doc)
+	return results
+
+def previous_results():
+	files = sorted(glob.glob(os.path.join(BENCH_RESULTS_DIR, "*.json")))
+	return files[-1] if files else None
+
+def compare(current, previous_file):
+	with open(previous_file) as f:
+		previous = json.load(f)
+	print("Comparison with {} (commit {})".format(previous_file, previous["commit"]))
+	for size, stages in current["sizes"].items():
+		for stage, r in stages.items():
+			if not isinstance(r, dict):
+				continue
+			p = previous["sizes"].get(size, { }).get(stage)
+			if p and p.get("items_per_s") and r.get("items_per_s"):
+				print("  {:>8} {:<22} {:+7.1f} %".format(size, stage, 100.0 * (r["items_per_s"] / p["items_per_s"] - 1)))
+	for module, r in current.get("imports", { }).items():
+		p = previous.get("imports", { }).get(module)
+		if p and p["seconds"] > 0:
+			print("  {:>8} {:<22} {:+7.1f} % import time".format("", module, 100.0 * (r["seconds"] / p["seconds"] - 1)))
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Benchmarks the indexing pipeline on synthetic corpora")
+	parser.add_argument("--sizes", default="10000,100000", help="Comma-separated numbers of publications")
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--compare", help="Results file to compare with (defaults to the latest one)")
+	args = parser.parse_args()
+	logging.basicConfig(level=logging.CRITICAL)
+	previous = args.compare or previous_results()
+	current = { "commit": git_commit(), "date": datetime.now().isoformat(), "sizes": { } }
+	print("Import times")
+	current["imports"] = run_imports()
+	for size in [int(s) for s in args.sizes.split(",")]:
+		current["sizes"][str(size)] = run_size(size, args.seed)
+	os.makedirs(BENCH_RESULTS_DIR, exist_ok=True)
+	out = os.path.join(BENCH_RESULTS_DIR, "{}-{}.json".format(datetime.now().strftime("%Y%m%d-%H%M%S"), current["commit"]))
+	with open(out, 'w') as f:
+		json.dump(current, f, indent=2)
+	print("Results saved to", out)
+	if previous:
+		compare(current, previous)
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+import io, sys, glob, time, logging, tempfile
+import redif_reader
+
+"""
+	Benchmark of the shared ReDIF reader against the previous reader (one open per encoding, with a fallback
+	to UTF-16 after an exception).
+
+	Usage: python3 bench_reader.py [directory containing .rdf files]
+	Without a directory, a sample of UTF-8 and UTF-16 files is generated in a temporary directory.
+"""
+
+ENCODINGS = ['utf-8', 'utf-16-le']
+
+def legacy_lines(f):
+	handle = None
+	for e in ENCODINGS:
+		if handle:
+			handle.close()
+			break
+		try:
+			handle = io.open(f, 'r', encoding=e)
+			for l in handle:
+				yield l.strip()
+		except:
+			logging.debug("Error opening file {} in {}".format(f, e), sys.exc_info()[0])
+
+SAMPLE_RECORD = """Template-Type: ReDIF-Article 1.0
+Author-Name: Joseph E. Stiglitz
+Author-Workplace-Name: Columbia University
+Title: Credit Rationing in Markets with Imperfect Information
+Abstract: Why is credit rationed? Interest rates act as a screening device
+ and affect the behavior of borrowers, so that the bank's expected return
+ may not increase with the interest rate.
+Classification-JEL: D82, E51, G21
+Creation-Date: 1981-06
+Handle: RePEc:aea:aecrev:v:71:y:1981:i:3:p:393-410
+
+"""
+
+def write_sample(d, files=200, records=50):
+	for i in range(files):
+		encoding = 'utf-16-le' if i % 10 == 0 else 'utf-8'
+		with io.open("{}/sample{}.rdf".format(d, i), 'w', encoding=encoding) as f:
+			f.write(SAMPLE_RECORD.replace("Stiglitz", "Stiglitzé") * records)
+
+def time_reader(reader, files):
+	start = time.perf_counter()
+	count = 0
+	for f in files:
+		for l in reader(f):
+			count += 1
+	return time.perf_counter() - start, count
+
+def run(files, rounds=3):
+	size = sum([len(open(f, 'rb').read()) for f in files])
+	print("{} files, {:.1f} MB".format(len(files), size / 1e6))
+	for name, reader in [("legacy", legacy_lines), ("redif_reader", redif_reader.lines)]:
+		elapsed, count = min([time_reader(reader, files) for _ in range(rounds)])
+		print("{:>14}: {:8.3f} s  {:8.1f} MB/s  {} lines".format(name, elapsed, size / 1e6 / elapsed, count))
+
+if __name__ == "__main__":
+	if len(sys.argv) > 1:
+		run(glob.glob("{}/**/*.rdf".format(sys.argv[1]), recursive=True))
+	else:
+		with tempfile.TemporaryDirectory() as d:
+			write_sample(d)
+			run(glob.glob("{}/*.rdf".format(d)))
@@ -0,0 +1,240 @@
+#!/usr/bin/python3
+import os, sys, json, time, random, argparse, threading, logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from elasticsearch.helpers import expand_action
+from elasticsearch.exceptions import TransportError, ConnectionError
+import metrics
+
+"""
+	Bulk sink shared by the indexers, which sends bulk actions to the search backend with backpressure.
+
+	Actions are serialized once and grouped in chunks of about chunk_bytes bytes, which are sent by a few threads, the
+	producer being blocked while all of them are busy. The chunk size adapts to the cluster: it is halved when a bulk
+	request takes longer than TARGET_LATENCY or is rejected, and grows while requests are fast. Items rejected with a
+	retryable status (429 when the write queue is full, or 502-504), or whole requests which time out, are retried
+	with exponential backoff; items which still fail, or fail with another status (e.g. a mapping error), are appended
+	to a dead-letter NDJSON file in bulk format. Throughput (docs/s and MB/s) is reported periodically.
+
+	Usage: python3 bulk_sink.py DEAD_LETTER_FILE
+	Replays the actions of a dead-letter file (those failing again being written to DEAD_LETTER_FILE.retry).
+"""
+
+BULK_THREADS = 2
+
+INITIAL_CHUNK_BYTES = 1 << 20
+
+MIN_CHUNK_BYTES = 64 << 10
+
+MAX_CHUNK_BYTES = 8 << 20
+
+MAX_CHUNK_DOCS = 5000
+
+# Bulk requests slower than that (in seconds) shrink the chunks, those faster than half of it grow them
+TARGET_LATENCY = 2.0
+
+REQUEST_TIMEOUT = 120
+
+RETRY_STATUSES = set([429, 502, 503, 504])
+
+MAX_RETRIES = 6
+
+INITIAL_BACKOFF = 0.5
+
+MAX_BACKOFF = 60
+
+DEAD_LETTER_FILE = 'bulk_dead_letter.ndjson'
+
+# Interval in seconds between throughput reports
+REPORT_INTERVAL = 10
+
+def is_retryable(e):
+	return isinstance(e, ConnectionError) or e.status_code in RETRY_STATUSES
+
+'''
+	Returns whether a bulk item succeeded (deleting a missing document being a success).
+'''
+def item_succeeded(op_type, status):
+	return 200 <= status < 300 or (op_type == "delete" and status == 404)
+
+class BulkSink:
+	def __init__(self, client, name="bulk", threads=BULK_THREADS, dead_letter_file=DEAD_LETTER_FILE):
+		self.client = client
+		self.name = name
+		self.threads = threads
+		self.dead_letter_file = dead_letter_file
+		self.serializer = client.transport.serializer
+		self.lock = threading.Lock()
+		self.chunk_bytes = INITIAL_CHUNK_BYTES
+		self.docs = 0
+		self.bytes = 0
+		self.retries = 0
+		self.failed = 0
+		self.start = time.time()
+		self.last_report = self.start
+
+	'''
+		Serializes an action (in the format of elasticsearch.helpers) into its bulk lines, as a pair (action line,
+		source line or None).
+	'''
+	def entry(self, action):
+		meta, source = expand_action(action)
+		head = (self.serializer.dumps(meta) + "\n").encode('utf-8')
+		return head, (self.serializer.dumps(source) + "\n").encode('utf-8') if source is not None else None
+
+	def chunks(self, entries):
+		chunk, size = [], 0
+		for entry in entries:
+			chunk.append(entry)
+			size += len(entry[0]) + (len(entry[1]) if entry[1] else 0)
+			if size >= self.chunk_bytes or len(chunk) >= MAX_CHUNK_DOCS:
+				yield chunk
+				chunk, size = [], 0
+		if chunk:
+			yield chunk
+
+	'''
+		Indexes the given actions, and returns the statistics of the sink.
+	'''
+	def run(self, actions):
+		return self.run_entries(self.entry(action) for action in actions)
+
+	def run_entries(self, entries):
+		with ThreadPoolExecutor(self.threads) as pool:
+			pending = set()
+			for chunk in self.chunks(entries):
+				while len(pending) >= self.threads:
+					done, pending = wait(pending, return_when=FIRST_COMPLETED)
+					for f in done:
+						f.result()
+				pending.add(pool.submit(self.send, chunk))
+				metrics.gauge("bulk_in_flight", len(pending))
+			for f in wait(pending)[0]:
+				f.result()
+		self.report(final=True)
+		return self.stats()
+
+	'''
+		Sends a chunk, retrying the rejected items (or the whole chunk on timeouts) with exponential backoff.
+	'''
+	def send(self, chunk):
+		attempt = 0
+		while chunk:
+			body = b''.join([line for entry in chunk for line in entry if line])
+			start = time.time()
+			try:
+				with metrics.timer("es_bulk", len(chunk)):
+					resp = self.client.bulk(body=body, request_timeout=REQUEST_TIMEOUT)
+			except TransportError as e:
+				if is_retryable(e) and attempt < MAX_RETRIES:
+					self.shrink()
+					self.backoff(attempt, len(chunk))
+					attempt += 1
+					continue
+				self.dead_letter(chunk, e)
+				return
+			self.adapt(len(body), time.time() - start)
+			done, retry, failed = 0, [], []
+			for item, entry in zip(resp["items"], chunk):
+				op_type, result = next(iter(item.items()))
+				status = result.get("status", 500)
+				if item_succeeded(op_type, status):
+					done += 1
+				elif status in RETRY_STATUSES:
+					retry.append(entry)
+				else:
+					failed.append((entry, result.get("error")))
+			self.record(done, len(body))
+			for entry, error in failed:
+				self.dead_letter([entry], error)
+			if retry and attempt >= MAX_RETRIES:
+				self.dead_letter(retry, "still rejected after {} retries".format(MAX_RETRIES))
+				return
+			if retry:
+				self.shrink()
+				self.backoff(attempt, len(retry))
+				attempt += 1
+			chunk = retry
+		self.maybe_report()
+
+	def backoff(self, attempt, count):
+		metrics.count("bulk_retries", count)
+		with self.lock:
+			self.retries += count
+		time.sleep(min(MAX_BACKOFF, INITIAL_BACKOFF * 2 ** attempt) * (0.5 + random.random() / 2))
+
+	def shrink(self):
+		with self.lock:
+			self.chunk_bytes = max(MIN_CHUNK_BYTES, self.chunk_bytes // 2)
+
+	def adapt(self, size, latency):
+		with self.lock:
+			if latency > TARGET_LATENCY:
+				self.chunk_bytes = max(MIN_CHUNK_BYTES, self.chunk_bytes // 2)
+			elif latency < TARGET_LATENCY / 2 and size >= self.chunk_bytes * 0.9:
+				self.chunk_bytes = min(MAX_CHUNK_BYTES, self.chunk_bytes * 5 // 4)
+
+	def record(self, docs, size):
+		metrics.count("bulk_bytes", size)
+		with self.lock:
+			self.docs += docs
+			self.bytes += size
+			metrics.gauge("bulk_chunk_kb", self.chunk_bytes >> 10)
+
+	def dead_letter(self, entries, error):
+		logging.error("{}: {} items failed: {}".format(self.name, len(entries), error))
+		metrics.count("bulk_failures", len(entries))
+		with self.lock:
+			self.failed += len(entries)
+			if self.dead_letter_file:
+				with open(self.dead_letter_file, 'ab') as f:
+					for entry in entries:
+						f.write(b''.join([line for line in entry if line]))
+
+	def stats(self):
+		with self.lock:
+			seconds = max(time.time() - self.start, 1e-6)
+			return {
+				"docs": self.docs,
+				"failed": self.failed,
+				"retries": self.retries,
+				"mb": self.bytes / 1e6,
+				"seconds": seconds,
+				"docs_per_second": self.docs / seconds,
+				"mb_per_second": self.bytes / 1e6 / seconds,
+				"chunk_kb": self.chunk_bytes >> 10
+			}
+
+	def maybe_report(self):
+		now = time.time()
+		with self.lock:
+			if now - self.last_report < REPORT_INTERVAL:
+				return
+			self.last_report = now
+		self.report()
+
+	def report(self, final=False):
+		s = self.stats()
+		print("{}: {} {} docs in {:.1f} s ({:.0f} docs/s, {:.2f} MB/s), {} failed, {} retried, chunks of {} KB".format(
+			self.name, "indexed" if final else "indexing", s["docs"], s["seconds"], s["docs_per_second"], s["mb_per_second"],
+			s["failed"], s["retries"], s["chunk_kb"]))
+
+'''
+	Yields the entries (action line, source line or None) of a dead-letter file.
+'''
+def read_dead_letters(path):
+	with open(path, 'rb') as f:
+		lines = iter(f)
+		for head in lines:
+			if not head.strip():
+				continue
+			op_type = next(iter(json.loads(head.decode('utf-8'))))
+			yield head, next(lines) if op_type != "delete" else None
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Replays the actions of a bulk dead-letter file")
+	parser.add_argument("path", nargs="?", default=DEAD_LETTER_FILE)
+	args = parser.parse_args()
+	import local_search
+	client = local_search.create_client(os.environ.get('ECONFAST_BACKEND', 'es'))
+	stats = BulkSink(client, "replay", dead_letter_file=args.path + ".retry").run_entries(read_dead_letters(args.path))
+	sys.exit(1 if stats["failed"] else 0)
@@ -0,0 +1,48 @@
+import re
+
+"""
+	Command-line options of the entry points, generated from their module-level flags: each flag gets an option
+	named after it (e.g. --crawl-author-pics and --no-crawl-author-pics for CRAWL_AUTHOR_PICS), whose default is the
+	value in the source and whose help is the comment above the flag.
+"""
+
+def option_name(flag):
+	return flag.lower().replace("_", "-")
+
+'''
+	Returns the comment lines above the definition of a flag in the source of a module, joined.
+'''
+def flag_comment(source, flag):
+	m = re.search(r"((?:^#.*\n)+)^{} = ".format(re.escape(flag)), source, re.M)
+	if not m:
+		return None
+	return " ".join([l.lstrip("#").strip() for l in m.group(1).splitlines()])
+
+'''
+	Adds an option for each of the given flags of a module (given as its globals).
+'''
+def add_flag_options(parser, module_globals, flags):
+	try:
+		with open(module_globals["__file__"], encoding="utf-8") as f:
+			source = f.read()
+	except (KeyError, OSError):
+		source = ""
+	group = parser.add_argument_group("flags")
+	for flag in flags:
+		value = module_globals[flag]
+		name = option_name(flag)
+		help = (flag_comment(source, flag) or flag).replace("%", "%%")
+		if isinstance(value, bool):
+			group.add_argument("--" + name, dest=flag, action="store_true", help="{} (default: {})".format(help, "on" if value else "off"))
+			group.add_argument("--no-" + name, dest=flag, action="store_false", help="Turns off --{}".format(name))
+		else:
+			group.add_argument("--" + name, dest=flag, type=type(value) if value is not None else str, metavar=flag,
+				help=help + " (default: %(default)s)")
+		parser.set_defaults(**{ flag: value })
+
+'''
+	Sets the flags of a module from the parsed options.
+'''
+def apply_flag_options(args, module_globals, flags):
+	for flag in flags:
+		module_globals[flag] = getattr(args, flag)
@@ -0,0 +1,138 @@
+from array import array
+import numpy as np
+
+"""
+	Co-authorship graph built during the author aggregation.
+
+	Each author gets an integer ID, and each publication emits one edge per ordered pair of co-authors. Edges are
+	buffered in flat integer arrays and periodically compacted into a sparse CSR matrix whose entries are numbers
+	of co-publications, so that the closest co-authors, degree statistics and connected components are then
+	computed in vectorized passes over the whole graph.
+"""
+
+# Number of buffered edges after which they are compacted into the sparse matrix
+COMPACT_EDGES = 1 << 24
+
+'''
+	If max_publi_authors is given, publications with more authors than that (e.g. large collaborations) add no edges, the
+	number of publications left out being kept in skipped.
+'''
+class CoauthorGraph:
+	def __init__(self, max_publi_authors=None):
+		# SciPy is imported when a graph is first built, so that importing the indexer stays fast
+		from scipy.sparse import csr_matrix
+		self.ids = { }
+		self.hashes = []
+		self.rows = array('i')
+		self.cols = array('i')
+		self.compacted = csr_matrix((0, 0), dtype=np.int32)
+		self.max_publi_authors = max_publi_authors
+		self.skipped = 0
+
+	def author_id(self, name_hash):
+		i = self.ids.get(name_hash)
+		if i is None:
+			i = self.ids[name_hash] = len(self.hashes)
+			self.hashes.append(name_hash)
+		return i
+
+	'''
+		Adds the edges between all distinct co-authors of a publication.
+	'''
+	def add_publication(self, name_hashes):
+		ids = list(set([self.author_id(h) for h in name_hashes if h]))
+		if len(ids) < 2:
+			return
+		if self.max_publi_authors and len(ids) > self.max_publi_authors:
+			self.skipped += 1
+			return
+		for i in ids:
+			for j in ids:
+				if i != j:
+					self.rows.append(i)
+					self.cols.append(j)
+		if len(self.rows) >= COMPACT_EDGES:
+			self.compact()
+
+	def compact(self):
+		from scipy.sparse import coo_matrix
+		n = len(self.hashes)
+		rows = np.frombuffer(self.rows, dtype=np.int32)
+		cols = np.frombuffer(self.cols, dtype=np.int32)
+		added = coo_matrix((np.ones(len(rows), dtype=np.int32), (rows, cols)), shape=(n, n)).tocsr()
+		old = self.compacted
+		old.resize((n, n))
+		self.compacted = old + added
+		self.rows, self.cols = array('i'), array('i')
+
+	'''
+		Returns the co-authorship matrix: entry (i, j) is the number of co-publications of authors i and j.
+	'''
+	def matrix(self):
+		self.compact()
+		self.compacted.sum_duplicates()
+		return self.compacted
+
+	'''
+		Returns the rows of the given authors in the co-authorship matrix, as a tuple (author hashes, row IDs, column IDs,
+		numbers of co-publications), IDs being positions in the list of author hashes.
+	'''
+	def rows_of(self, name_hashes):
+		m = self.matrix()
+		rows = np.repeat(np.arange(m.shape[0], dtype=np.int32), np.diff(m.indptr))
+		keep = np.array([h in name_hashes for h in self.hashes], dtype=bool)[rows]
+		return list(self.hashes), rows[keep], m.indices[keep], m.data[keep]
+
+'''
+	Builds the co-authorship matrix of a graph split in partitions from their rows (see CoauthorGraph.rows_of), each
+	author's row being given by exactly one partition. Authors are numbered in order of appearance.
+'''
+def matrix_from_rows(parts):
+	from scipy.sparse import csr_matrix
+	ids = { }
+	rows, cols, data = [], [], []
+	for hashes, r, c, d in parts:
+		global_ids = np.array([ids.setdefault(h, len(ids)) for h in hashes], dtype=np.int32)
+		rows.append(global_ids[r])
+		cols.append(global_ids[c])
+		data.append(d)
+	n = len(ids)
+	m = csr_matrix((np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))), shape=(n, n))
+	m.sum_duplicates()
+	return m
+
+'''
+	Selects the k closest co-authors of every author, i.e. those with the most co-publications (ties broken
+	by author ID). Returns three aligned arrays: author IDs, co-author IDs and numbers of co-publications.
+'''
+def top_coauthors(m, k):
+	rows = np.repeat(np.arange(m.shape[0]), np.diff(m.indptr))
+	order = np.lexsort((m.indices, -m.data, rows))
+	ranks = np.arange(len(order)) - m.indptr[rows[order]]
+	keep = order[ranks < k]
+	return rows[keep], m.indices[keep], m.data[keep]
+
+def degree_stats(m):
+	degrees = np.diff(m.indptr)
+	if len(degrees) == 0:
+		return { "authors": 0 }
+	return {
+		"authors": len(degrees),
+		"isolated": int(np.sum(degrees == 0)),
+		"mean_degree": float(degrees.mean()),
+		"median_degree": float(np.median(degrees)),
+		"max_degree": int(degrees.max()),
+		"edges": int(m.nnz // 2),
+		"copublications": int(m.data.sum() // 2)
+	}
+
+'''
+	Computes the connected components of the graph: returns the number of components, the size of the largest
+	one and the component label of each author.
+'''
+def components(m):
+	if m.shape[0] == 0:
+		return 0, 0, np.zeros(0, dtype=np.int32)
+	from scipy.sparse.csgraph import connected_components
+	count, labels = connected_components(m, directed=False)
+	return count, int(np.bincount(labels).max()), labels
@@ -1,9 +1,25 @@
-import base64, logging, cv2
+import base64, logging, hashlib, sqlite3, threading, importlib
 import numpy as np
+from multiprocessing import Pool
+import metrics, lazy
+
+# OpenCV, imported on first use since importing it takes longer than importing the whole indexer
+cv2 = lazy.Lazy(lambda: importlib.import_module("cv2"))
 
 logging.basicConfig(level=logging.WARNING)
 
+# Images are downsampled so that their largest side is at most that many pixels before face detection
+FACE_MAX_SIDE = 480
+
+# Images are downsampled so that their largest side is at most that many pixels before the grayscale check
+GRAY_MAX_SIDE = 128
+
+# Minimum size of a detected face, relative to the largest side of the (downsampled) image
+MIN_FACE_RATIO = 0.06
+
 def readb64(uri):
+	if isinstance(uri, bytes):
+		return cv2.imdecode(np.frombuffer(uri, np.uint8), cv2.IMREAD_COLOR)
 	try:
 	   encoded_data = uri.split(',')[1]
 	   nparr = np.fromstring(base64.b64decode(encoded_data), np.uint8)
@@ -12,15 +28,17 @@ def readb64(uri):
 	except:
 		return cv2.imread(uri)
 
+def downscale(img, max_side):
+	h, w = img.shape[:2]
+	scale = float(max_side) / max(h, w)
+	if scale >= 1:
+		return img
+	return cv2.resize(img, (max(1, int(w * scale)), max(1, int(h * scale))), interpolation=cv2.INTER_AREA)
+
 """
-	Method used to minimally filter logo images: since these include at least one color,
-	this is a fast and easy way to avoid most false negatives from Google Image Search.
+	Grayscale check on a decoded image.
 """
-def isgray(src):
-	img = readb64(src)
-	if img is None:
-		logging.error("Could not decode image {}".format(src))
-		return None
+def isgray_image(img):
 	if len(img.shape) < 3: return True
 	if img.shape[2]  == 1: return True
 	b,g,r = img[:,:,0], img[:,:,1], img[:,:,2]
@@ -30,22 +48,131 @@ def isgray(src):
 	ratio_br = float(np.sum(b == r))  / b.size
 	return ratio_bg > .9 and ratio_br > .9
 
-FACE_CASCADE = cv2.CascadeClassifier("haarcascade_frontalface_default.xml")
+"""
+	Method used to minimally filter logo images: since these include at least one color,
+	this is a fast and easy way to avoid most false negatives from Google Image Search.
+"""
+def isgray(src):
+	img = readb64(src)
+	if img is None:
+		logging.error("Could not decode image {}".format(src))
+		return None
+	return isgray_image(img)
+
+FACE_CASCADE = []
+
+def face_cascade():
+	if not FACE_CASCADE:
+		FACE_CASCADE.append(cv2.CascadeClassifier("haarcascade_frontalface_default.xml"))
+	return FACE_CASCADE[0]
+
+"""
+	Face detection on a decoded image.
+"""
+def face_count_image(img, min_size=(30, 30)):
+	grayscale = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+	faces = face_cascade().detectMultiScale(grayscale,
+		scaleFactor=1.1,
+		minNeighbors=5,
+		minSize=min_size,
+		flags=cv2.CASCADE_SCALE_IMAGE)
+	return len(faces)
 
 """
 	Method used to minimally filter author pictures images: results from Google Image Search
 	often include group pictures (in which case more than one face will be detected) or book
-	covers (and thus zero face). 
+	covers (and thus zero face).
 """
 def face_count(src):
 	img = readb64(src)
 	if img is None:
-		logging.error("Could not decode image", src)
+		logging.error("Could not decode image {}".format(src))
 		return None
-	grayscale = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-	faces = FACE_CASCADE.detectMultiScale(grayscale, 
-		scaleFactor=1.1, 
-		minNeighbors=5, 
-		minSize=(30, 30), 
-		flags=cv2.CASCADE_SCALE_IMAGE)
-	return len(faces)
+	return face_count_image(img)
+
+def content_hash(data):
+	return hashlib.sha1(data).hexdigest()
+
+"""
+	Runs both checks on the bytes of an image, which is decoded once and downsampled before each check. Returns
+	the verdict as a pair (number of faces, whether the image is grayscale), both None if the image can't be decoded.
+"""
+def verdict(data):
+	img = readb64(data)
+	if img is None:
+		return None, None
+	small = downscale(img, FACE_MAX_SIDE)
+	side = max(1, int(MIN_FACE_RATIO * max(small.shape[:2])))
+	faces = face_count_image(small, min_size=(min(30, side), min(30, side)))
+	return faces, isgray_image(downscale(small, GRAY_MAX_SIDE))
+
+def verdict_item(item):
+	digest, data = item
+	try:
+		return digest, verdict(data)
+	except Exception as e:
+		logging.error("Could not analyse image {}: {}".format(digest, e))
+		return digest, (None, None)
+
+def init_worker():
+	# One OpenCV thread per worker process, parallelism comes from the pool
+	cv2.setNumThreads(1)
+
+"""
+	Persistent store of image verdicts, keyed by the hash of the image content, so that an image is never
+	analysed twice, whatever URL it was found at.
+"""
+class VerdictCache:
+	def __init__(self, path):
+		self.lock = threading.Lock()
+		self.db = sqlite3.connect(path, check_same_thread=False)
+		self.db.execute("CREATE TABLE IF NOT EXISTS verdicts (hash TEXT PRIMARY KEY, faces INTEGER, gray INTEGER)")
+		self.db.commit()
+
+	def get(self, digest):
+		with self.lock:
+			row = self.db.execute("SELECT faces, gray FROM verdicts WHERE hash = ?", (digest,)).fetchone()
+		if row is None:
+			return None
+		return row[0], None if row[1] is None else bool(row[1])
+
+	def put_all(self, verdicts):
+		with self.lock:
+			self.db.executemany("INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?)",
+				[(digest, faces, None if gray is None else int(gray)) for digest, (faces, gray) in verdicts])
+			self.db.commit()
+
+	def close(self):
+		with self.lock:
+			self.db.close()
+
+"""
+	Returns the verdict on an image from the cache, analysing it (and caching the verdict) if needed.
+"""
+def cached_verdict(data, cache):
+	digest = content_hash(data)
+	v = cache.get(digest)
+	if v is None:
+		v = verdict_item((digest, data))[1]
+		cache.put_all([(digest, v)])
+	return v
+
+"""
+	Analyses a batch of images (given as bytes) which have no verdict in the cache yet, spreading them over a
+	process pool. Returns the number of images analysed.
+"""
+def verify_images(images, cache, workers=4, chunksize=8):
+	todo = dict()
+	for data in images:
+		digest = content_hash(data)
+		if digest not in todo and cache.get(digest) is None:
+			todo[digest] = data
+	if not todo:
+		return 0
+	with metrics.timer("image_check", len(todo)):
+		if workers > 1 and len(todo) > 1:
+			with Pool(workers, initializer=init_worker) as pool:
+				cache.put_all(pool.imap_unordered(verdict_item, todo.items(), chunksize))
+		else:
+			cache.put_all(map(verdict_item, todo.items()))
+	return len(todo)
@@ -1,18 +1,39 @@
-import json, os, argparse, time, sys, requests, urllib3, logging
+import json, os, time, sys, logging, base64, sqlite3, threading
+import urllib.request, urllib.parse, urllib3
+from concurrent.futures import ThreadPoolExecutor
 from urllib3.exceptions import InsecureRequestWarning
-from selenium import webdriver
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import WebDriverException
-from bs4 import BeautifulSoup
+import metrics
 
 '''
 Ce fichier est un utilitaire de scraping de résultats de Google Image Search.
 Il a été conçu dans le cadre spécifique du hackathon et ne se veut pas un outil générique.
+
+Image discovery runs as a separate stage before the author documents are built: a bounded pool of fetchers
+resolves search queries into image URLs through a pluggable backend (a Selenium-driven browser on Google Image
+Search, or a plain HTTP search service such as a local stand-in), with a rate limit per host, and downloads the
+images. Results are kept in a persistent on-disk cache (query -> image URLs, URL -> image bytes), so that the
+indexing loop only does cache lookups and a re-run of the build does not scrape everything again.
 '''
 
 urllib3.disable_warnings(InsecureRequestWarning)
 
+# Number of concurrent fetchers
+CRAWL_WORKERS = 4
+
+# Minimum delay in seconds between two requests sent to the same host
+HOST_DELAY = 1.0
+
+# Timeout in seconds of image downloads and HTTP search requests
+FETCH_TIMEOUT = 10
+
+# Images larger than that are not downloaded
+MAX_IMAGE_BYTES = 5 << 20
+
+# Failed downloads are retried by the crawls run more than that many seconds later
+FAILED_IMAGE_MAX_AGE = 24 * 3600
+
 def create_browser():
+    from selenium import webdriver
     options = webdriver.ChromeOptions()
     options.add_argument('--no-sandbox')
     try:
@@ -25,46 +46,270 @@ def create_browser():
     print("Chrome browser launched")
     return browser
 
-BROWSER = [create_browser()]
-
-def yield_image_urls(phrases, pages_down=0, max_images=3):
-    search_url = 'https://www.google.com/search?q=' + '+'.join(phrases) + '&source=lnms&tbm=isch&num=3'
-    try:
-        BROWSER[0].get(search_url)
-        time.sleep(0.2)
-        element = BROWSER[0].find_element_by_tag_name('body')
-        if pages_down > 0:
-            BROWSER[0].find_element_by_id('smb').click()
-            for i in range(pages_down):
-                element.send_keys(Keys.PAGE_DOWN)
-                time.sleep(0.3)
-    except WebDriverException as e:
-        logging.warning("WebDriverException", e)
-        BROWSER[0].close()
-        BROWSER[0] = create_browser()
-        return
-    page_source = BROWSER[0].page_source 
+'''
+    Extracts the URLs of the first images of a Google Image Search result page.
+'''
+def extract_image_urls(page_source, max_images):
+    from bs4 import BeautifulSoup
     soup = BeautifulSoup(page_source, 'lxml')
     # Remove carrousel images which are undesired
-    carrousels = soup.find_all('scrolling-carousel')
-    if carrousels:
-        for carrousel in carrousels:
-            carrousel.extract()
-    images = soup.find_all('img')
-    count = 0
-    for image in images:
-        try:
-            url = image['data-src']
-            yield url
-            count += 1
-            if count >= max_images:
-                return
-        except:
+    for carrousel in soup.find_all('scrolling-carousel'):
+        carrousel.extract()
+    urls = []
+    for image in soup.find_all('img'):
+        url = image.get('data-src') or image.get('src')
+        if not url:
+            print('No image source found')
+            continue
+        urls.append(url)
+        if len(urls) >= max_images:
+            break
+    return urls
+
+'''
+    Search backend scraping Google Image Search with a Chrome browser. Each fetcher thread drives its own browser,
+    launched on first use and quit by close().
+'''
+class SeleniumBackend:
+    host = 'www.google.com'
+
+    def __init__(self, pages_down=0):
+        self.pages_down = pages_down
+        self.lock = threading.Lock()
+        # Mapping from thread ID to the browser of the thread
+        self.browsers = { }
+
+    def browser(self):
+        thread = threading.get_ident()
+        with self.lock:
+            browser = self.browsers.get(thread)
+        if browser is None:
+            browser = create_browser()
+            with self.lock:
+                self.browsers[thread] = browser
+        return browser
+
+    def drop_browser(self):
+        with self.lock:
+            browser = self.browsers.pop(threading.get_ident(), None)
+        if browser is not None:
+            browser.quit()
+
+    '''
+        Quits the browsers of all threads.
+    '''
+    def close(self):
+        with self.lock:
+            browsers = list(self.browsers.values())
+            self.browsers.clear()
+        for browser in browsers:
             try:
-                url = image['src']
-                yield url
-                count += 1
-                if count >= max_images:
-                    return
+                browser.quit()
             except Exception as e:
-                print('No image source found', e)
+                logging.warning("Could not quit browser: {}".format(e))
+
+    def search(self, phrases, max_images):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions
+        from selenium.common.exceptions import WebDriverException
+        search_url = 'https://www.google.com/search?q=' + '+'.join(phrases) + '&source=lnms&tbm=isch&num=3'
+        browser = self.browser()
+        try:
+            browser.get(search_url)
+            # Wait for the result images rather than for a fixed delay
+            WebDriverWait(browser, FETCH_TIMEOUT).until(expected_conditions.presence_of_element_located((By.TAG_NAME, 'img')))
+            if self.pages_down > 0:
+                element = browser.find_element_by_tag_name('body')
+                browser.find_element_by_id('smb').click()
+                for i in range(self.pages_down):
+                    element.send_keys(Keys.PAGE_DOWN)
+            return extract_image_urls(browser.page_source, max_images)
+        except WebDriverException as e:
+            logging.warning("WebDriverException: {}".format(e))
+            self.drop_browser()
+            return None
+
+'''
+    Search backend querying an HTTP search service: GET <base_url>/search?q=<query>&max=<max_images> must return
+    a JSON object whose "images" field lists image URLs. Used with a local stand-in in tests.
+'''
+class HttpBackend:
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+        self.host = urllib.parse.urlparse(self.base_url).netloc
+
+    def search(self, phrases, max_images):
+        url = '{}/search?{}'.format(self.base_url, urllib.parse.urlencode({ "q": ' '.join(phrases), "max": max_images }))
+        try:
+            with urllib.request.urlopen(url, timeout=FETCH_TIMEOUT) as resp:
+                return json.loads(resp.read().decode('utf-8'))["images"][:max_images]
+        except Exception as e:
+            logging.warning("Search request {} failed: {}".format(url, e))
+            return None
+
+    def close(self):
+        pass
+
+'''
+    Creates the search backend described by the given setting: 'selenium', or the base URL of an HTTP search service.
+'''
+def create_backend(spec='selenium'):
+    if spec == 'selenium':
+        return SeleniumBackend()
+    if spec.startswith('http://') or spec.startswith('https://'):
+        return HttpBackend(spec)
+    raise ValueError("Unknown image search backend: {}".format(spec))
+
+'''
+    Enforces a minimum delay between two requests sent to the same host, across all fetcher threads.
+'''
+class RateLimiter:
+    def __init__(self, delay=HOST_DELAY):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.next_slot = { }
+
+    def wait(self, host):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
+
+def query_key(phrases):
+    return ' '.join(' '.join(phrases).lower().split())
+
+'''
+    Persistent cache of image searches (query -> image URLs) and images (URL -> bytes), stored in a SQLite file
+    shared by the fetcher threads.
+'''
+class ImageCache:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("CREATE TABLE IF NOT EXISTS queries (query TEXT PRIMARY KEY, urls TEXT NOT NULL, fetched REAL NOT NULL)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS images (url TEXT PRIMARY KEY, data BLOB, fetched REAL NOT NULL)")
+        self.db.commit()
+
+    '''
+        Returns the image URLs found for a query, or None if the query was never run (or was run more than
+        max_age seconds ago).
+    '''
+    def image_urls(self, phrases, max_age=None):
+        with self.lock:
+            row = self.db.execute("SELECT urls, fetched FROM queries WHERE query = ?", (query_key(phrases),)).fetchone()
+        if row is None or (max_age is not None and time.time() - row[1] > max_age):
+            return None
+        return json.loads(row[0])
+
+    def put_image_urls(self, phrases, urls):
+        with self.lock:
+            self.db.execute("INSERT OR REPLACE INTO queries VALUES (?, ?, ?)", (query_key(phrases), json.dumps(urls), time.time()))
+            self.db.commit()
+
+    '''
+        Returns whether an image was downloaded, or failed to be downloaded less than failed_max_age seconds ago.
+    '''
+    def has_image(self, url, failed_max_age=FAILED_IMAGE_MAX_AGE):
+        with self.lock:
+            row = self.db.execute("SELECT data IS NOT NULL, fetched FROM images WHERE url = ?", (url,)).fetchone()
+        return row is not None and (bool(row[0]) or time.time() - row[1] <= failed_max_age)
+
+    '''
+        Returns the bytes of an image, or None if it was not downloaded (or could not be).
+    '''
+    def image(self, url):
+        with self.lock:
+            row = self.db.execute("SELECT data FROM images WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else None
+
+    def put_image(self, url, data):
+        with self.lock:
+            self.db.execute("INSERT OR REPLACE INTO images VALUES (?, ?, ?)", (url, data, time.time()))
+            self.db.commit()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+def host_of(url):
+    return urllib.parse.urlparse(url).netloc
+
+'''
+    Downloads an image, decoding data URIs (as found in search result pages) in place.
+'''
+def download_image(url):
+    if url.startswith('data:'):
+        try:
+            return base64.b64decode(url.split(',', 1)[1])
+        except Exception:
+            return None
+    try:
+        req = urllib.request.Request(url, headers={ "User-Agent": "Mozilla/5.0" })
+        with urllib.request.urlopen(req, timeout=FETCH_TIMEOUT) as resp:
+            data = resp.read(MAX_IMAGE_BYTES + 1)
+            return data if len(data) <= MAX_IMAGE_BYTES else None
+    except Exception as e:
+        logging.debug("Could not download image {}: {}".format(url, e))
+        return None
+
+'''
+    Runs the given image searches (lists of phrases) which are not in the cache yet, then downloads the images
+    found, with a bounded pool of fetchers and a rate limit per host. Searches cached more than max_age seconds
+    ago are run again, as are downloads which failed more than FAILED_IMAGE_MAX_AGE seconds ago. The backend is
+    left open for the next crawl, the caller closing it at the end of its crawling stage. Returns the number of
+    searches run and of images downloaded.
+'''
+def crawl(queries, backend, cache, max_images=5, workers=CRAWL_WORKERS, limiter=None, fetch_images=True, max_age=None):
+    limiter = limiter or RateLimiter()
+    todo = list(dict([(query_key(q), q) for q in queries if cache.image_urls(q, max_age) is None]).values())
+
+    def search(phrases):
+        limiter.wait(backend.host)
+        with metrics.timer("image_search"):
+            urls = backend.search(phrases, max_images)
+        # Failed searches are not cached so that they are retried on the next run
+        if urls is not None:
+            cache.put_image_urls(phrases, urls)
+        return urls or []
+
+    def fetch(url):
+        if not url.startswith('data:'):
+            limiter.wait(host_of(url))
+        with metrics.timer("image_download"):
+            data = download_image(url)
+        cache.put_image(url, data)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        found = list(pool.map(search, todo))
+        images = []
+        if fetch_images:
+            images = list(set([url for q in queries for url in (cache.image_urls(q) or []) if not cache.has_image(url)]))
+            list(pool.map(fetch, images))
+    logging.info("Ran {} image searches ({} with results), downloaded {} images".format(len(todo), sum([1 for urls in found if urls]), len(images)))
+    return len(todo), len(images)
+
+'''
+    Returns the image URLs for a query from the cache, running the search (and caching its result) if needed.
+'''
+def image_urls(phrases, backend, cache, max_images=5):
+    urls = cache.image_urls(phrases)
+    if urls is None:
+        crawl([phrases], backend, cache, max_images, workers=1)
+        urls = cache.image_urls(phrases) or []
+    return urls[:max_images]
+
+BACKEND = [None]
+
+'''
+    Yields the URLs of the first images found for the given phrases with the Selenium backend (uncached).
+'''
+def yield_image_urls(phrases, pages_down=0, max_images=3):
+    if BACKEND[0] is None:
+        BACKEND[0] = SeleniumBackend(pages_down)
+    for url in BACKEND[0].search(phrases, max_images) or []:
+        yield url
@@ -1,12 +1,16 @@
 #!/usr/bin/python3
-import re, io, glob, logging, sys
-import normalize_institutions, image_crawl, image_analysis
+import re, os, glob, logging, sys, time, pickle, argparse, zlib, shutil, queue
+from datetime import datetime
+import image_crawl, image_analysis, logo_store, institution_resolver, synonyms, author_disambiguation, coauthor_graph, local_search
+import influence, bulk_sink, metrics, profiling, cli, lazy, publi_reader
+from redif_reader import lines
+from author_names import hash_name, hash_names, best_name_variant, better_name_variant, format_name
 from math import *
 from pathlib import Path
 from collections import defaultdict, Counter
-from multiprocessing import Pool
-from elasticsearch import Elasticsearch
-from elasticsearch.helpers import parallel_bulk, scan
+from itertools import islice
+from multiprocessing import Pool, Process, Event, Queue
+from elasticsearch.helpers import scan
 
 logging.basicConfig(level=logging.WARNING)
 
@@ -16,6 +20,7 @@ RECREATE_INDEX = True
 # Position these flags to False if you wish to build a quick index, without images (author pictures and institution logos)
 CRAWL_AUTHOR_PICS = True
 
+# If true, the logo of the current institution of each author is crawled
 CRAWL_INST_LOGOS = False
 
 # If true, a check will be done on pictures scraped for an author so as to validate that it's a portrait, and not 
@@ -26,1002 +31,323 @@ CHECK_FACE_PICTURES = True
 # (since any logo will have at least a non-monochromatic color scheme)
 CHECK_INST_LOGO = True
 
+# If true, all authorships are folded in memory during a single scan of the publication index, and finished author 
+# documents are then sent in bulk (instead of one ES get and update per authorship)
+AGGREGATE_IN_MEMORY = True
+
+# If true, the author index is not rebuilt but only updated with the publications indexed since the previous author 
+# build, as recorded in the checkpoint file (requires the author index to have been built in memory)
+DELTA_UPDATE = False
+
+# File holding the start date of the last successful author build
+AUTHOR_CHECKPOINT_FILE = 'author_checkpoint'
+
+# Log of the publications deleted by incremental runs of index_publis.py, read by delta updates
+PUBLI_DELETIONS_FILE = 'publis_deletions'
+
+# If true, the in-memory author build reads the publication index with parallel readers (see publi_reader.py) and
+# saves its progress periodically, so that an interrupted build resumes from its last checkpoint
+RESUMABLE_BUILD = True
+
+# Number of parallel readers of the publication index (in a partitioned build, the ranges of pub_ids they read are
+# shared out among the processes, each of which reads at least one)
+PUBLI_READERS = 4
+
+# File holding the progress of the current author build (cursors of the readers and partial aggregates), removed once
+# the build is done
+BUILD_CHECKPOINT_FILE = 'author_build_checkpoint.pickle'
+
+# Interval in seconds between checkpoints of the author build
+BUILD_CHECKPOINT_INTERVAL = 600
+
+# If greater than 1, the in-memory author build is split in that many partitions of the authors (by name hash), each
+# aggregated and indexed by its own process (see index_authors_partitioned), instead of being resumable
+AUTHOR_PARTITIONS = 1
+
+# Directory of the files exchanged between the processes of a partitioned build, removed once the build is done
+PARTITION_DIR = 'author_partitions'
+
+# If true, raw affiliations are resolved to canonical institutions (from top_institutions and registered_institutions), 
+# each of which is listed once per author
+CANONICALIZE_INSTITUTIONS = True
+
+# If true, the authorships of the name hashes found to be aliases of the same author by the disambiguation stage 
+# (see author_disambiguation.py) are folded into the document of the canonical author ID
+USE_AUTHOR_ALIASES = True
+
+# If true, institution acronyms (from synonyms_inst) are expanded in author documents, so that both the acronym and 
+# the full name of an institution match
+EXPAND_ACRONYMS = True
+
+# Image search backend used to crawl author pictures and institution logos: 'selenium' (Google Image Search in a 
+# Chrome browser) or the base URL of an HTTP search service
+IMAGE_BACKEND = os.environ.get('ECONFAST_IMAGE_BACKEND', 'selenium')
+
+# Persistent cache of image searches and downloaded images, reused across builds
+IMAGE_CACHE_FILE = 'image_cache.sqlite'
+
+# Number of concurrent image fetchers
+IMAGE_CRAWL_WORKERS = 4
+
+# Number of processes checking the crawled images (face detection and grayscale check)
+IMAGE_VERIFY_WORKERS = 4
+
+# If true (and institution logos are crawled), the logo store is first refreshed for all the institutions listed 
+# in top_institutions and registered_institutions
+WARM_LOGO_STORE = True
+
+# Number of author documents fetched per multi-get request during a delta update
+MGET_BATCH_SIZE = 500
+
+# Number of publications whose author names are hashed at once during aggregation
+HASH_CHUNK_SIZE = 1000
+
+# Number of closest co-authors stored in an author document
+MAX_COAUTHORS = 30
+
+# If set, publications with more authors than that (e.g. large collaborations) add no edges to the co-authorship graph
+MAX_GRAPH_PUBLI_AUTHORS = 0
+
+# Whether paginated publication digests are built for each author, so that a profile is loaded in one request
+BUILD_DIGESTS = True
+
+# Number of publications per digest page
+DIGEST_PAGE_SIZE = 50
+
+# Abstracts longer than that are truncated in digests (the full publication is fetched on demand)
+DIGEST_ABSTRACT_LENGTH = 600
+
+# File to which the metrics of the run are exported periodically (Prometheus text format, or JSON if not ending with .prom)
+METRICS_FILE = 'metrics_authors.prom'
+
+# Interval in seconds between metrics exports and progress lines
+METRICS_INTERVAL = 10
+
+# Directory to which profiles are written (see profiling.py)
+PROFILE_DIR = 'profile_authors'
+
 ES_PORT = 9200
 
 ES_INDEX_PUBLI = 'publication_a'
 
 ES_INDEX_AUTHOR = 'author_a'
 
+ES_INDEX_DIGEST = 'author_digest_a'
+
 '''
-	ES mapping used for the author index.
-'''	
-MAPPING_AUTHOR = {
-	"settings": {
-		"number_of_shards": 1,
-		# Custom similarity used to avoid discounting very common names
-		"similarity": {
-		  "tf_sim": {
-		    "type": "scripted",
-		    "script": {
-		      "source": "double tf = Math.sqrt(doc.freq); double norm = 1/Math.sqrt(doc.length); return query.boost * tf * norm;"
-		    }
-		  }
-		},
-		"index": {
-			"analysis": {
-				"analyzer": {
-					"synonym": {
-						"tokenizer": "whitespace",
-						"filter": [ "synonym" ]
-					}
-				},
-				"filter": { 
-					# Synonyms used to expand institution names
-					"synonym" : {
-					    "type" : "synonym",
-					    "synonyms" : [
-							"AAAE => African Association of Agricultural Economists",
-							"AACB => Association of African Central Banks",
-							"AAEA => Agricultural and Applied Economics Association",
-							"AAEE => Austrian Association for Energy Economics",
-							"AARES => Australian Agricultural and Resource Economics Society",
-							"AAYE => Association of African Young Economists",
-							"ABEF => Association of Behavioral Economics and Finance",
-							"ABF => Association for Banking and Finance",
-							"ABF => American Bar Foundation",
-							"ABH => Association of Business Historians",
-							"ACAES => American Committee on Asian Economic Studies",
-							"ACCF => American Council for Capital Formation",
-							"ACE => Association of Caribbean Economists",
-							"ACE => Association of Christian Economists",
-							"ACE => Association of Competition Economics",
-							"ACE => UK Association of Christian Economists",
-							"ACE => Aboa Centre for Economics",
-							"ACED => Agency for Cooperation, Education and Development",
-							"ACEI => Association for Cultural Economics International",
-							"ACEP => Africa Center for Energy Policy",
-							"ACERH => Australian Centre for Economic Research on Health",
-							"ACES => Association for Comparative Economic Studies",
-							"ACET => African Center for Economic Transformation",
-							"ACFEA => Asian Consumer and Family Economics Association",
-							"ACIAR => Australian Centre for International Agricultural Research",
-							"ACIT => Academic Consortium on International Trade",
-							"ADE => Association for Documentation in Economics",
-							"ADRI => Asian Development Research Institute",
-							"AEA => American Economic Association",
-							"AEA => Armenian Economic Association",
-							"AEAG => Agricultural Economics Association of Georgia",
-							"AEASA => Agricultural Economics Association of South Africa",
-							"AEF => Academy of Economics and Finance",
-							"AEFP => Association for Education Finance and Policy",
-							"AEHN => African Economic History Network",
-							"AERA => Agricultural Economics Research Association (India)",
-							"AES => African Econometric Society",
-							"AES => Agricultural Economics Society",
-							"AESA => Association for Economic and Social Analysis",
-							"AESS => Asian Economic and Social Society",
-							"AFA => African Finance Association",
-							"AFA => American Finance Association",
-							"AFA => Asian Finance Association",
-							"AFAANZ => Accounting and Finance Association of Australia and New Zealand",
-							"AFBM => Australasian Farm Business Management Network",
-							"AFDIE => Association Française pour le Développement de l'Intelligence Économique",
-							"AFEA => African Finance and Economics Association",
-							"AFEE => Association for Evolutionary Economics",
-							"AFESD => Arab Fund for Econimic and Social Development",
-							"AFI => Grupo Analistas",
-							"AFMA => African Farm Management Association",
-							"AFRA => Accounting and Finance Research Association",
-							"AFS => Asian Financial Society",
-							"AGE => Association of Gulf Economists",
-							"AHE => Association for Heterodox Economics",
-							"AHES => Australian Health Economics Society",
-							"AHWI => Australian Health Workforce Institute",
-							"AIAE => African Institute for Applied Economics",
-							"AIEA2 => Association Internationale d'Economie Alimentaire et Agroindustrielle",
-							"AIEFS => Association of Indian Economic and Financial Studies",
-							"AIFE => American Institute for Full Employment",
-							"AIFFA => Africa Institute for Forecasting and Financial Analysis",
-							"AIID => Amsterdam Institute for International Development",
-							"AIPRG => Armenian International Policy Research Group",
-							"AIRLEAP => Association for Integrity and Responsible Leadership in Economics and Associated Professions",
-							"AIT => Austrian Institute of Technology",
-							"AIUB => American International University-Bangladesh",
-							"ALBA => Athens Laboratory of Business Administration",
-							"ALCEE => Alabama Council on Economic Education",
-							"ALEA => American Law and Economics Association",
-							"AMF => Arab Monetary Fund",
-							"AMFET => Association for Modelling and Forecasting Economies in Transition",
-							"AMRO => ASEAN+3 Macroeconomic Research Office",
-							"AMS => Australasian Macroeconomics Society",
-							"APDU => Association of Public Data Users",
-							"APEC => Asia-Pacific Economic Cooperation",
-							"APEC => Atlantic Provinces Economic Council",
-							"APEE => Association of Private Enterprise Education",
-							"APET => Association for Public Economic Theory",
-							"APF => Athenian Policy Forum",
-							"APF => Athenian Policy Forum",
-							"API => Arab Planning Institute",
-							"APPAM => Association for Public Policy Analysis and Management",
-							"APRNet => Agricultural Policy Research Network",
-							"ARARI => Amhara Regional Agricultural Research Institute",
-							"AREA => American Rehabilitation Economics Association",
-							"ARES => American Real Estate Society",
-							"ARES => Association for Real Estate Securitization",
-							"ARETT => Association of Independent Centers of Economic Analysis",
-							"AREU => Afghanistan Research and Evaluation Unit",
-							"AREUEA => American Real Estate and Urban Economics Association",
-							"ARIA => American Risk and Insurance Association",
-							"ARSC => Applied Regional Science Council",
-							"ASA,B&E => American Statistical Association, Business and Economic Statistics Section",
-							"ASE => Association for Social Economics",
-							"ASEAN => Association of Southeast Asian Nations",
-							"ASGE => Association for the Study of the Grants Economy",
-							"ASHE => American Society of Hispanic Economists",
-							"ASLEA => Asian Law and Economics Association",
-							"ASMECI => Association marocaine d'études et de recherches en économie islamique",
-							"ASPE => Association for Studies in Public Economics",
-							"ASREC => Association for the Study of Religion, Economics, and Culture",
-							"ASSET => Association of Southern European Economic Theorists",
-							"ASUE => Armenian State University of Economics",
-							"ATHEA => Austrian Health Economics Association",
-							"ATINER => Athens Institute for Education and Research",
-							"AUBER => Association for University Business and Economic Research",
-							"AUEB => Athens University of Economics and Business",
-							"AWEPON => African Women's Economic Policy Network",
-							"Akroasis => Scientific Society for the Promotion and Advancement of Social Sciences",
-							"AustLEA => Australian Law and Economics Association",
-							"BAIPHIL => Bankers Institute of the Philippines",
-							"BALAS => Business Association of Latin American Studies",
-							"BdF => Bank of France",
-							"Banque de France => Bank of France",
-							"BDPEMS => Berlin Doctoral Program of Economics and Management Science",
-							"BFAP => Bureau for Food and Agricultural Policy",
-							"BFS => Bachelier Finance Society",
-							"BIEE => British Institute of Energy Economics",
-							"BIEF => Baltic Institute of Economy and Finance",
-							"BIISS => Bangladesh Institute of International and Strategic Studies",
-							"BIRD => Bankers Institute of Rural Development",
-							"BIS => Bank for International Settlements",
-							"BITS => Birla Institute of Technology and Science",
-							"BITS => Business and Information Technology School",
-							"BPATC => Bangladesh Public Administration Training Centre",
-							"BRDC => Bangladesh Development Research Center",
-							"BUBT => Bangladesh University of Business and Technology",
-							"CABE => Canadian Association for Business Economics",
-							"CAES => Caribbean Agro-Economic Society",
-							"CAIRN => Canadian Agricultural Innovation and Regulation Network",
-							"CANSEE => Canadian Society for Ecological Economics",
-							"CASSE => Center for the Advancement of the Steady State Economy",
-							"CATPRN => Canadian Agricultural Trade Policy Research Network",
-							"CBGA => Centre for Budget and Governance Accountability",
-							"CCEHPE => Chicago Center of Excellence in Health Promotion Economics",
-							"CCMF => Caribbean Centre for Money and Finance",
-							"CCS => Chaudhary Charan Singh Haryana Agricultural University",
-							"CDDEP => Center for Disease Dynamics, Economics and Policy",
-							"CDESG => Canadian Development Economics Study Group",
-							"CDRI => Cambodia Development Resource Institute",
-							"CEA => Canadian Economics Association",
-							"CEANA => Chinese Economic Association in North America",
-							"CEAUK => Chinese Economic Association (UK)",
-							"CEBERG => Canadian Experimental & Behavioral Economics Research Group",
-							"CEBRA => Central Bank Research Association",
-							"CEDA => Committee for Economic Development of Australia",
-							"CEEC => European Council of Construction Economists",
-							"CEEP => European Consortium on Landscape Economics",
-							"CEFIG => Center for Firms in the Global Economy",
-							"CEMMAP => Centre for Microdata Methods and Practice",
-							"CEPA => Centre for Policy Analysis",
-							"CEPA => Centre for Poverty Analysis",
-							"CEPR => Center for Economic and Policy Research",
-							"CERIK => Construction and Economy Research Institute of Korea",
-							"CERISE => Centre for Russian International Socio-political and Economic Studies",
-							"CES => Cyprus Economic Society",
-							"CESAA => Contemporary European Studies Association of Australia",
-							"CESG => Canadian Econometric Study Group",
-							"CESRAN => Centre for Strategic Research and Analysis",
-							"CESS => Centre for Economic and Social Studies",
-							"CFE => Korea Center for Free Enterprise",
-							"CGA => Certified General Accountants Association of Canada",
-							"CGIAR => Consultative Group on International Agricultural Research",
-							"CHILD => Centre for Household, Income, Labour and Demographic Economics",
-							"CIDEF => Chartered Institute of Development Finance",
-							"CIEM => Central Institution for Economic Management",
-							"CIESR => Caucasian Institute for Economic and Social Research",
-							"CIFAR => Canadian Institute for Advanced Research",
-							"CIIM => Cyprus International Institute of Management",
-							"CIMP => Chandragupt Institute of Management Patna",
-							"CIRET => Centre for International Research on Economic Tendency Surveys",
-							"CKF => Center for Economic Forecasting of Mexico",
-							"CLBC => Canadian Labour and Business Centre",
-							"CMDR => Centre for Multi-disciplinary Development Research",
-							"CNAC => CNA Corporation",
-							"CNEH => Canadian Network for Economic History",
-							"CNP => Center for National Policy",
-							"COMESA => Common Market for Eastern and Southern Africa",
-							"COPE => Congress Of Political Economists",
-							"CPD => Centre for Policy Dialogue",
-							"CPEG => Canadian Public Economics Study Group",
-							"CPR => Centre for Policy Research",
-							"CPRN => Canadian Policy Research Networks",
-							"CPRSPD => Centre for Poverty Reduction and Social Policy Development",
-							"CRCE => Centre for Research into Post-Communist Economies",
-							"CREC => Center for Regional Economic Competitiveness",
-							"CREE => Canadian Resource and Environmental Economics Study Group",
-							"CREEA => Canadian Resource and Environmental Economics Association",
-							"CREMA => Center for Research in Economics, Management and the Arts",
-							"CREST => Centre for Research on Economic and Social Transformation",
-							"CRIW => Conference on Research in Income and Wealth",
-							"CRSA => Canadian Regional Science Association",
-							"CSEA => Center for the Study of the Economies of Africa",
-							"CSH => Centre de Sciences Humaines",
-							"CSHET => China Society for the History of Economic Thought",
-							"CSIL => Centre for Industrial Studies",
-							"CSIRD => Centre for Studies in International Relations and Development",
-							"CSIRO => Commonwealth Scientific and Industrial Research Organisation",
-							"CSLS => Center for the Study of Living Standards",
-							"CSPET => Chinese Society for the Promotion of Economic Theory",
-							"CSPS => Centre for Strategic and Policy Studies",
-							"CSS => Centre for Social Studies",
-							"CSWE => China Society of World Economics",
-							"CUFE => Central University of Finance and Economics",
-							"CUNY => City University of New York",
-							"CURISES => Curacao Institute for Social and Economic Studies",
-							"CWAE => Committee on Women in Agricultural Economics",
-							"CWE => Chinese Women Economists",
-							"CWEN => Canadian Women Economists Network",
-							"Cheiron => International Society for the History of Behavioral and Social Sciences",
-							"DES => Dansk Energiøkonomisk Selskab",
-							"DIW => German Institute for Economic Research",
-							"DPI => Development Planning Institute",
-							"EAAE => European Association of Agricultural Economists",
-							"EABER => East Asian Bureau of Economic Research",
-							"EABH => European Association for Banking and Financial History E. V.",
-							"EADI => European Association of Development Research and Training Institutes",
-							"EAE => European Association of Economists",
-							"EAEA => East Asian Economic Association",
-							"EAEFEASA => European-Asian Economics, Finance, Econometrics and Accounting Science Association",
-							"EAEPE => European Association for Evolutionary Political Economy",
-							"EAERE => European Association of Environmental and Resource Economists",
-							"EAFE => European Association of Fisheries Economists",
-							"EALE => European Association of Law and Economics",
-							"EARIE => European Association for Research in Industrial Economics",
-							"EBEA => Economics and Business Education Association",
-							"EBHS => Economic and Business Historical Society",
-							"EBRD => European Bank for Reconstruction and Development",
-							"EBS => European Business School",
-							"ECDPM => European Centre for Development Policy Management",
-							"ECGI => European Corporate Governance Institute",
-							"ECHE => European Conference on the History of Economics",
-							"ECINEQ => Society for the Study of Economic Inequality",
-							"ECIPE => European Centre for International Political Economy",
-							"ECMI => European Capital Markets Institute",
-							"ECOWAS => Economic Community of West African States",
-							"ECRI => Economic Cycle Research Institute",
-							"EDAC => Economic Developers Association of Canada",
-							"EDF => Environmental Defense Fund",
-							"EDII => Entrepreneurship Development Institute of India",
-							"EDINEB => EDucational INnovation in Economics and Business Network",
-							"EEA => Eastern Economic Association",
-							"EEA => Ethiopian Economic Association",
-							"EEPRI => Ethiopian Economic Policy Research Institute",
-							"EFA => Eastern Finance Association",
-							"EGRG => Royal Geographical Society, Economic Geography Research Group",
-							"EHESS => École des Hautes Études en Sciences Sociales",
-							"EHS => Economic History Society",
-							"EHSANZ => Economic History Society of Australia and New Zealand",
-							"EHSSA => Economic History Society of Southern Africa",
-							"EIDE => European Institute for Development and Education",
-							"EIEE => RFF-CMCC European Institute on Economics and the Environment",
-							"EIF => European Investment Fund",
-							"EIILM => Eastern Institute for Integrated Learning in Management",
-							"EIPA => European Institute of Public Administration",
-							"EMS => European Management School",
-							"ENARPRI => European Network of Agricultural and Rural Policy Research Institutes",
-							"ENEPRI => European Network of Economic Policy Research Institutes",
-							"ENER => European Network on the Economics of Religion",
-							"ENSA => Economics of National Security Association",
-							"EPCS => European Public Choice Society",
-							"EPIP => European Policy for Intellectual Property",
-							"EPRC => Economic Policy Research Centre",
-							"EPS => Economists for Peace and Security",
-							"ER => Associazione-Fondazione EconomiaReale",
-							"ERA => Econometric Research Association",
-							"ERES => European Real Estate Society",
-							"ERF => Economic Research Forum",
-							"ERI => Economic Research Institute",
-							"ERI => Enterprise Research Institute",
-							"ERIA => Economic Research Institute for ASEAN and East Asia",
-							"ERINA => Economic Research Institute for Northeast Asia",
-							"ESA => Economic Science Association",
-							"ESCE => Economic and Social Research Center",
-							"ESHIA => Society for Economic Science with Heterogeneous Interacting Agents",
-							"ESHSI => Economic and Social History Society of Ireland",
-							"ESMT => European School of Management and Technology",
-							"ESRF => Economics and Social Research Foundation",
-							"ESRI => Economic and Social Research Institute",
-							"ETC => Entrepreneuship Training Center",
-							"EUDN => European Development Research Network",
-							"EUHEA => European Association of Health Economics",
-							"EUNIP => European Network on Industrial Policy",
-							"EURADA => European Association of Development Agencies",
-							"EUROFRAME => European Forecasting Research Association for the Macro-Economy",
-							"EXCAS => European Xtramile Centre of African Studies",
-							"FAERE => French Association of Environmental and Resource Economists",
-							"FDRS => Food Distribution Research Society",
-							"FEA => Financial Education Association",
-							"FECAP => Facultade de Economia e Comércio Álvares Penteado",
-							"FEED => Foundation for European Economic Development",
-							"FEPS => Foundation for European Progressive Studies",
-							"FIRS => Financial Intermediation Research Society",
-							"FITA => Federation of International Trade Associations",
-							"FPA => Financial Planning Association",
-							"FREIT => Forum for Research in Empirical International Trade",
-							"FTE => Foundation for Teaching Economics",
-							"GAEE => Global Association of Economics Education",
-							"GALE => Greek Association of Law and Economics",
-							"GAPE => Greek Scientific Association of Political Economy",
-							"GARP => Global Association of Risk Professionals",
-							"GCF => Global Commerce Forum",
-							"GDN => Global Development Network",
-							"GDRC => Global Development Research Center",
-							"GEM-IWG => Gender and Macro International Working Group",
-							"GEM-IWG => International Working Group on Gender, Macroeconomics and International Economics",
-							"GERA => Global Entrepreneurship Research Association",
-							"GESY => Sonderforschungsbereich/Transregio 15 Governance and the Efficiency of Economic Systems",
-							"GFA => Global Finance Association",
-							"GIGA => German Institute of Global and Area Studies",
-							"GIMPA => Ghana Institute of Management and Public Administration",
-							"GIPA => Georgian Institute of Public Affairs",
-							"GKEC => Global Knowledge Economics Council",
-							"GRIPS => National Graduate Institute for Policy Studies",
-							"GSEFM => Graduate School of Economics, Finance and Management",
-							"GSSI => Gran Sasso Science Institute",
-							"GTS => Game Theory Society",
-							"Globelics => Global Network for Economics of Learning, Innovation, and Competence Building Systems",
-							"HEAI => Health Economics Association of India",
-							"HEAI => Health Economics Association of Ireland",
-							"HECER => Helsinki Center for Economic Research",
-							"HESG => Health Economists' Study Group",
-							"HESPI => Horn Economic and Social Policy Institute",
-							"HKUST => Hong Kong University of Science and Technology",
-							"HSBA => Hamburg School of Business Administration",
-							"HSRC => Human Sciences Research Council",
-							"HWWI => Hamburg Institute of International Economics",
-							"I-SIE => Islamic Society of Institutional Economics",
-							"IAAE => International Association for Applied Econometrics",
-							"IAAE => International Association of Agricultural Economists",
-							"IAAEM => International Association of Aquaculture Economics and Management",
-							"IACMR => International Association for Chinese Management Research",
-							"IAEE => International Association for Energy Economics",
-							"IAEFL => International Academy of Economics, Finance and Law",
-							"IAES => International Atlantic Economic Society",
-							"IAES => Iranian Agricultural Economics Society",
-							"IAFA => Irish Accounting and Finance Association",
-							"IAFEP => International Association for the Economics of Participation",
-							"IAFFE => International Association for Feminist Economics",
-							"IAHPR => International Academy of Health Preference Research",
-							"IAME => International Association of Maritime Economists",
-							"IAOS => International Association for Official Statistics",
-							"IAPRI => Indaba Agricultural Policy Research Institute",
-							"IAREP => International Association for Research in Economic Psychology",
-							"IARI => Indian Agricultural Research Istitute",
-							"IARIW => International Association for Research in Income and Wealth",
-							"IASC => International Association for the Study of the Commons",
-							"IASRI => Indian Agricultural Statistics Research Institute",
-							"IATE => International Association for Tourism Economics",
-							"IBEC => International Bank for Economic Co-operation",
-							"IBEFA => International Banking, Economics and Finance Association",
-							"ICAPE => International Confederation of Associations for Pluralism in Economics",
-							"ICEG => International Center for Economic Growth",
-							"ICEN => Institute of Chartered Economists of Nigeria",
-							"ICER => Institute for Clinical and Economic Review",
-							"ICER => International Centre for Economic Research",
-							"ICLE => International Center for Law and Economics",
-							"ICMB => International Center for Monetary and Banking Studies",
-							"ICRIER => Indian Council for Research on International Economic Relations",
-							"ICSTAT => International Cooperation Center for Statistics 'Luigi Bodio'",
-							"ICTSD => International Centre for Trade and Sustainable Development",
-							"IDC => Interdisciplinary Center",
-							"IDEAS => Institute of Development and Economic Alternatives",
-							"IDRC => International Development Research Center",
-							"IEA => Indian Economic Association",
-							"IEA => International Economic Association",
-							"IEA => Iranian Economic Association",
-							"IEA => Irish Economic Association",
-							"IEA => Institute of Economic Affairs",
-							"IEA => International Energy Agency",
-							"IEDC => International Economic Development Council",
-							"IEML => Institute of Economics, Management and Law",
-							"IEWRI => International Economy & Work Research Institute",
-							"IFA => Indonesian Finance Association",
-							"IFAMA => International Food and Agribusiness Management Association",
-							"IFMR => Institute for Financial Management Research",
-							"IFPRI => International Food Policy Research Institute",
-							"IFREE => International Foundation for Research in Experimental Economics",
-							"IFS => Institute for Fiscal Studies",
-							"IGC => International Growth Centre",
-							"IGES => Institute for Global Environmental Strategies",
-							"IHD => Institute for Human Development",
-							"IIASA => International Institute for Applied Systems Analysis",
-							"IIDS => Indian Institute of Dalit Studies",
-							"IIE => Peter G. Peterson Institute for International Economics",
-							"IIEA => International Indian Economists Association",
-							"IIEA => International Iranian Economic Association",
-							"IIFET => International Institute of Fisheries Economics and Trade",
-							"IIFT => Indian Institute of Foreign Trade",
-							"IIHEM => International Institute for Higher Education in Morocco",
-							"IIM => International Institute of Management",
-							"IIMA => Indian Institute of Management Ahmedabad",
-							"IIMB => Indian Institute of Management Bangalore",
-							"IIMCAL => Indian Institute of Management Calcutta",
-							"IIME => Institute of Innovative Management of the Economy",
-							"IIMIDR => Indian Institute of Management Indore",
-							"IIML => Indian Institute of Management Lucknow",
-							"IIOA => International Input-Output Association",
-							"IIPM => Indian Institute of Planning and Management",
-							"IIPS => Institute for International Policy Studies",
-							"IISE => Institute for International Socio-Economic Studies",
-							"IISEPS => Independent Institute of Socio-Economic & Political Studies",
-							"IISRE => International Institute for Sustainable Regional Economies",
-							"IISWBM => Indian Institute of Social Welfare and Business Management",
-							"IIUM => International Islamic University Malaysia",
-							"ILCUK => International Longevity Centre-UK",
-							"ILEA => Israeli Association for Law and Economics",
-							"ILPF => Institute of Local Public Finance",
-							"IMA => International Microsimulation Association",
-							"IMD => International Institute for Management",
-							"IME => Inframarginal Economics Society",
-							"IME => Institute for Market Economics",
-							"IMEHA => International Maritime Economic History Association",
-							"IMF => International Monetary Fund",
-							"IMI => International Management Institute",
-							"IMPS => Institute for Management and Planning Studies",
-							"INAHEA => Indonesian Health Economics Association",
-							"INC => Innovations and Consulting Centre",
-							"INCEIF => International Centre for Education in Islamic Finance",
-							"INDEF => Institute for Development of Economics and Finance",
-							"INED => International Network for Economic Developers",
-							"INFORMS => Institute for Operations Research and the Management Sciences",
-							"INILAK => Independent Institute of Lay Adventists of Kigali",
-							"INSEE => Indian Society for Ecological Economics",
-							"INSIDE => Insight on Immigration and Development Economics",
-							"IOBE => Foundation for Economic and Industrial Research",
-							"IOS => Industrial Organization Society",
-							"IOSCO => International Organisation of Securities Commissions",
-							"IPA => Innovations for Poverty Action",
-							"IPAR => Institute for Policy Analysis and Research",
-							"IPEG => Barcelona Institute for Political Economy and Governance",
-							"IPM => Institute for Privatization and Management",
-							"IPPM => Institute of Public Policy Management",
-							"IPS => Institute of Policy Studies",
-							"IRAEE => Iranian Association for Energy Economics",
-							"IRES => International Real Estate Society",
-							"IRMA => Institute of Rural Management",
-							"ISAE => Indian Society of Agricultural Economics",
-							"ISBA => International Society for Bayesian Analysis",
-							"ISBEE => International Society of Business, Economics and Ethics",
-							"ISCR => New Zealand Institute for the Study of Competition and Regulation",
-							"ISE => Israel Society for Economics",
-							"ISEC => Institute for Social and Economic Change",
-							"ISED => Institute of Small Enterprises and Development",
-							"ISI => International Statistical Institute",
-							"ISID => Institute for Studies in Industrial Development",
-							"ISINI => International Society for Intercommunication of New Ideas",
-							"ISIR => International Society for Inventory Research",
-							"ISM => International School of Management",
-							"ISNE => Irish Society of New Economists",
-							"ISPOR => International Society for Pharmacoeconomics and Outcomes Research",
-							"ISQOLS => International Society for Quality-of-Life Studies",
-							"ISS => International Joseph A. Schumpeter Society",
-							"ISS => Institute of Social Studies",
-							"ISSBS => International School for Social and Business Studies",
-							"ISSER => Institute of Statistical, Social and Economic Research",
-							"IT&FA => International Trade and Finance Association",
-							"ITIF => Information Technology and Innovation Foundation",
-							"IUE => International Union of Economists",
-							"IUPUI => Indiana University-Purdue University",
-							"IWGVT => International Working Group on Value Theory",
-							"IWMI => International Water Management Institute",
-							"JACES => Japan Association for Comparative Economic Studies",
-							"JAEG => Japan Association of Economic Geographers",
-							"JAFEE => Japan Association for Evolutionary Economics",
-							"JASESS => Japan Association for Social and Economic Systems Studies",
-							"JASID => Japan Society for International Development",
-							"JBIMS => Jamnalal Bajaj Institute of Management Studies",
-							"JCER => Japan Center for Economic Research",
-							"JEA => Japanese Economic Association",
-							"JILAEE => Joint Initiative for Latin American Experimental Economics",
-							"JIMS => Jerusalem Institute for Market Studies",
-							"JPRI => Japan Policy Research Institute",
-							"JSCES => Japanese Society for Comparative Economic Studies",
-							"JSHET => Japanese Society for The History of Economic Thought",
-							"JSME => Japan Society of Monetary Economics",
-							"JSPE => Japan Society of Political Economy",
-							"JSPEHHC => Japanese Society for the Polical Economy of Health and Health Care",
-							"JSPKE => Japanese Society for Post Keynesian Economics",
-							"KACE => Korea Association of Cultural Economics",
-							"KAEA => Korea Agricultural Economics Association",
-							"KAFA => Korea-America Finance Association",
-							"KAIST => Korea Advanced Institute of Science and Technology",
-							"KALS => Korean Association of Labor Studies",
-							"KAPAE => Korea Association for Policy Analysis and Evaluation",
-							"KAPFE => Korean Association of Public Finance and Economics",
-							"KASBIT => Khadim Ali Shah Bukhari Institute of Technology",
-							"KASIO => Korea Academic Society of Industrial Organization",
-							"KATIS => Korean Association of Trade and Industry Studies",
-							"KDEA => Korea Development Economics Association",
-							"KDGW => Koreanisch-Deutsche Gesellschaft für Wirthschaftswissenschaften",
-							"KDI => Korea Development Institute",
-							"KDIC => Korea Deposit Insurance Corporation",
-							"KEA => Kentucky Economic Association",
-							"KEA => Korean Economics Association",
-							"KEBA => Korea Economics and Business Association",
-							"KEEA => Korean Environmental Economics Association",
-							"KEI => Korea Economic Institute",
-							"KEPE => Centre for Planning and Economic Research",
-							"KERC => Kyushu Economic Research Center",
-							"KERI => Korea Economic Research Institute",
-							"KES => Korean Econometric Society",
-							"KFIRI => Korea Fixed Income Research Institute",
-							"KFMA => Korean Financial Management Association",
-							"KIEP => Korea Institute for International Economic Policy",
-							"KIET => Korea Institute for Industrial Economics and Trade",
-							"KILF => Korea Institute of Local Finance",
-							"KIPF => Korea Institute of Public Finance",
-							"KIPPRA => Kenya Institute for Public Policy Research and Analysis",
-							"KIRI => Korea Insurance Research Institute",
-							"KISDI => Korea Information Society Development Institute",
-							"KIST => Korea Institute of Science and Technology",
-							"KJEM => The Korean-Japanese Economics & Management Association",
-							"KLEA => Korean Law and Economics Association",
-							"KLI => Korea Labor Institute",
-							"KMFA => Korea Money and Finance Association",
-							"KNUST => Kwame Nkrumah University of Science and Technology",
-							"KREI => Korea Rural Economic Institute",
-							"KRIHS => Korea Research Institute for Human Settlements",
-							"KRILA => Korea Research Institution for Local Administration",
-							"KRSA => Korean Regional Science Association",
-							"KSESA => Korean Social and Economic Studies Association",
-							"KSRI => Korea Security Research Institute",
-							"LACEEP => Latin American and Caribbean Environmental Economics Program",
-							"LAI => Lambda Alpha International",
-							"LARES => Latin American Real Estate Association",
-							"LBS => London Business School",
-							"LBSIM => Lal Bahadur Shastri Institute of Management",
-							"LEA => Lebanese Economic Association",
-							"LEANZ => Law and Economics Association of New Zealand",
-							"LFMI => Lithuanian Free Market Institute",
-							"LGERI => LG Economic Research Institute",
-							"LIDC => London International Development Centre",
-							"LIS => Luxembourg Income Study",
-							"LRSP => Laboratory for Research in Statistics and Probability",
-							"LSE => London School of Economics",
-							"MAEA => Malaysian Agricultural Economics Association",
-							"MAER => Meta-Analysis of Economic Research Network",
-							"MEA => Midwest Economics Association",
-							"MEA => Minnesota Economics Association",
-							"MEEA => Middle East Economic Association",
-							"MEG => Midwest Econometrics Group",
-							"MEPC => Mississippi Economic Policy Center",
-							"MERI => Mitsubishi Economic Research Institute",
-							"MESI => Moscow State University of Economics, Statistics and Informatics",
-							"METRIC => Modern Economics Training, Research and Innovation Center",
-							"MFS => Multinational Finance Society",
-							"MGIMO => Moscow State Institute of International Relations",
-							"MGUPP => Moscow State University for Food Production",
-							"MHHDC => Mahbub-ul-Haq Human Development Center",
-							"MIEPA => McKeever Institute of Economic Policy Analysis",
-							"MIER => Malaysian Institute of Economic Research",
-							"MIT => Massachusetts Institute of Technology",
-							"MIX => Microfinance Information Exchange",
-							"MLEA => Midwestern Law and Economics Association",
-							"MOVE => Consorci Markets, Organizations and Votes in Economics",
-							"MSM => Maastricht School of Management",
-							"MSSANZ => Modelling and Simulation Society of Australia and New Zealand",
-							"MSSES => Moscow School of Social and Economic Sciences",
-							"MUST => Misr University for Science and Technology",
-							"MWEIG => Midwestern International Economics Group",
-							"NAAE => Nigerian Association of Agricultural Economists",
-							"NAAFE => North American Association of Fisheries Economists",
-							"NAASE => North American Association of Sports Economists",
-							"NABARD => National Bank for Agriculture and Rural Development",
-							"NABE => National Association for Business Economics",
-							"NAEKOR => Russian Independent Agricultural Economics Association",
-							"NAFE => National Association of Forensic Economics",
-							"NAREA => Northeastern Agricultural and Resource Economics Association",
-							"NASB => National Academy of Sciences of Belarus",
-							"NASC => Nepal Administrative Staff College",
-							"NBEA => Northeast Business and Economics Association",
-							"NCAP => National Centre for Agricultural Economics and Policy Research",
-							"NCBAE => National College of Business Administration and Economics",
-							"NCCEE => North Carolina Council on Economic Eduation",
-							"NCER => National Centre for Econometric Research",
-							"NCFAP => National Center for Food and Agricultural Policy",
-							"NDRI => National Dairy Research Institute",
-							"NEA => National Economic Association",
-							"NEAK => Northeast Asia Economic Association of Korea",
-							"NEPS => Network of European Peace Scientists",
-							"NEREC => Network for Economic Research on Electronic Communications",
-							"NERI => Nagano Economic Research Institute",
-							"NERI => Nanto Economic Research Institute",
-							"NERI => Nevin Economic Research Institute",
-							"NES => New Economic School",
-							"NETA => National Economics Teaching Association",
-							"NETT => North East Think Tank of Japan",
-							"NEUDC => New England Universities Development Consortium",
-							"NFA => Northern Finance Association",
-							"NHEA => Nepal Health Economics Association",
-							"NIBM => National Institute of Bank Management",
-							"NICE => Newports Institute of Communications and Economics",
-							"NIDI => Netherlands Interdisciplinary Demographic Institute",
-							"NIPS => National Institute for Population Studies",
-							"NISER => Nigerian Institute of Social and Economic Research",
-							"NISTADS => National Institute of Science, Technology and Development Studies",
-							"NITIE => National Institute of Industrial Engineering",
-							"NIUA => National Institute of Urban Affairs",
-							"NLIHC => National Low Income Housing Coalition",
-							"NMIMS => Narsee Monjee Institute of Management Studies",
-							"NMIMS => SVKM's Narsee Monjee Institute of Management Studies",
-							"NOBE/REF => Network of Border Economics / Red de la Economía Fronteriza",
-							"NOBEM => Netherlands Organisation for Research in Business Economics and Management",
-							"NRRI => National Regulatory Research Institute",
-							"NSDRC => Northwest Socioeconomic Development Research Center",
-							"NTA => National Tax Association",
-							"NUS => National University of Singapore",
-							"NUST => National University of Sciences and Technology",
-							"NYU => New York University",
-							"NZARES => New Zealand Agricultural and Resource Economics Society",
-							"NZESG => New Zealand Econometric Study Group",
-							"ODE => Omicron Delta Epsilon",
-							"OECD => Organisation for Economic Co-operation and Development",
-							"OECD => Organization for Economic Cooperation and Development",
-							"OEF => Oxford Economic Forecasting",
-							"OIES => Oxford Institute for Energy Studies",
-							"OTEFA => Overseas Thai Economic and Finance Association",
-							"OUHK => Open University of Hong Kong",
-							"PAEP => Employment Observatory Research-Informatics",
-							"PAPAIOS => Pan Pacific Association of Input-Output Studies",
-							"PECC => Pacific Economic Cooperation Council",
-							"PEEHS => Political Economy and Economic History Society",
-							"PEF => Progressive Economic Forum",
-							"PEKEA => Political and Ethical Knowledge on Economic Acivities Research Programme",
-							"PEP => Partnership for Economic Policy",
-							"PERC => Property and Environment Research Center",
-							"PGSA => Pro Global Science Association",
-							"PIPFA => Pakistan Institute of Public Finance Accounts",
-							"PKES => Post Keynesian Economics Society",
-							"PPIC => Public Policy Institute of California",
-							"PRADEC => Prague Development Center",
-							"PRI => Policy Research Institute",
-							"PRMIA => Professional Risk Managers' International Association",
-							"PRRES => Pacific-Rim Real Estate Society",
-							"PRSCO => Pacific Regional Science Conference Organization",
-							"PSSRU => Personal Social Services Research Unit",
-							"QIIR => Qianhai Institute of Innovative Research",
-							"RAD => Researchers Alliance for Development",
-							"RANEPA => Russian Presidential Academy of National Economy and Public Administration",
-							"RAS => Russian Academy of Sciences",
-							"RCN => Economic Research Center of Niigata",
-							"RDC => Romanian Distribution Committee",
-							"RERI => Real Estate Research Institute",
-							"RES => Royal Economic Society",
-							"RESER => European Association for Research on Service",
-							"RFF => Resources for the Future",
-							"RFH => Research Foundation for Humanity",
-							"RIDGE => Research Institute for Development, Growth, and Economics",
-							"RIEF => Research in International Economics and Finance Network",
-							"RIES => Research Institute of the East-West Economy & Society",
-							"RIETI => Research Institute of Economy, Trade and Industry",
-							"RIOE => Research Institute for Ocean Economics",
-							"RISE => Research on Improving Systems of Education",
-							"RISEBA => Riga International School of Economics and Business Administration",
-							"RSA => Regional Studies Association",
-							"RSA-Nederland => Regional Science Association, Netherlands Section",
-							"RSAI => Regional Science Association International",
-							"RSAIBIS => Regional Science Association International, British and Irish Section",
-							"RSEE => Russian Society for Ecological Economics",
-							"RTI => Research Triangle Institute",
-							"RTS => Risk Theory Society",
-							"RTT => Romania Think Tank",
-							"RUDN => Peoples Friendship University of Russia",
-							"RUPRI => Rural Policy Research Institute",
-							"RePEc => Research Papers in Economics",
-							"Resanet => Research Africa Network",
-							"SABE => Society for the Advancement of Behavioral Economics",
-							"SADC => Southern African Development Community",
-							"SAEA => Southern Agricultural Economics Association",
-							"SAEE => Swiss Association for Energy Economics",
-							"SAET => Society for the Advancement of Economic Theory",
-							"SAFA => Southern African Finance Association",
-							"SALE => Scandinavian Association of Law and Economics",
-							"SAMA => Saudi Arabian Monetary Agency",
-							"SANE => South African New Economics Society",
-							"SANEI => South Asia Network of Economic Research Institutes",
-							"SASE => Society for the Advancement of Socio-Economics",
-							"SASS => School of Advanced Social Studies",
-							"SAWTEE => South Asia Watch on Trade, Economics and Environment",
-							"SBCA => Society for Benefit-Cost Analysis",
-							"SBE => Society of Business Economists",
-							"SCE => Society for Computational Economics",
-							"SCMHRD => Symbiosis Centre for Management and Human Resource Development",
-							"SCW => Society for Social Choice and Welfare",
-							"SDAE => Society for the Development of Austrian Economics",
-							"SDIC => School of Development Innovation and Change",
-							"SDS => System Dynamics Society",
-							"SEA => Southern Economic Association",
-							"SEA => Spacial Econometrics Association",
-							"SEARCA => Southeast Asian Regional Center for Graduate Study and Research in Agriculture",
-							"SEBH => Society for European Business History",
-							"SED => Society for Economic Dynamics",
-							"SEG => Society of Economic Geologists",
-							"SEHA => Swedish Economic History Association",
-							"SEM => Society for Economic Measurement",
-							"SERCI => Society for Economic Research on Copyright Issues",
-							"SERI => Samsung Economic Research Institute",
-							"SERI => Shikuoka Economic Research Institute",
-							"SES => Scottish Economic Society",
-							"SESS => Society for the Economic Studies of Securities",
-							"SET => Society for Economic Theory",
-							"SFS => Society for Financial Studies",
-							"SGBED => Society for Global Business and Economic Development",
-							"SGCA => Single Global Currency Association",
-							"SGE => Society of Government Economists",
-							"SHE => Society of Heterodox Economists",
-							"SHP => Swiss Household Panel",
-							"SID => Society for International Development",
-							"SIFR => Institute for Financial Research",
-							"SIMT => Stuttgart Institute of Management and Technology",
-							"SIOE => Society for Institutional and Organizational Economics",
-							"SIPRI => Stockholm International Peace Research Institute",
-							"SIRE => Scottish Institute for Research in Economics",
-							"SKOPE => Centre on Skills, Knowledge and Organisational Performance",
-							"SNDE => Society for Nonlinear Dynamics and Econometrics",
-							"SOAS => School of Oriental and African Studies",
-							"SOFEW => Southern Forest Economics Workers",
-							"SPDC => Social Policy and Development Centre",
-							"SPM => Society for Policy Modeling",
-							"SQG => Society of Quantitative Gastronomy",
-							"SRDC => Social Research and Demonstration Corporation",
-							"SRSA => Southern Regional Science Association",
-							"SSBF => Society for the Study of Business and Finance",
-							"SSSP => Society for the Study of Social Policy",
-							"SUNY => Stony Brook University",
-							"SUNY => Farmingdale State College",
-							"SUNY => State University of New York",
-							"SVIM => Sarva Vidyalaya Instritute of Management",
-							"SWFA => Southwestern Finance Association",
-							"SWUFE => Southwestern University of Finance and Economics",
-							"Sa-Dhan => Association of Community Development Finance Institutions",
-							"SoFiE => Society for Financial Econometrics",
-							"TAFA => Turkish American Finance Association",
-							"TBEN => The Black Economists Network",
-							"TCER => Tokyo Center for Economic Research",
-							"TDRI => Thailand Development Research Institute",
-							"TERI => The Energy and Resources Institute",
-							"TESDO => The Economic and Social Development Organization",
-							"TFA => Taiwan Finance Association",
-							"TIES => The Indian Econometric Society",
-							"TIES => The International Environmetrics Society",
-							"TIPS => Trade and Industrial Policy Secretariat",
-							"TPUG => Transportation and Public Utilities Group",
-							"TRAPCA => Trade Policy Training Centre in Africa",
-							"TSE => Toulouse School of Economics",
-							"UACES => University Association for Contemporary European Studies",
-							"UCL => University College London",
-							"UCLA => University of California-Los Angeles",
-							"UCSB => University of California-Santa Barbara",
-							"UCSC => University of California-Santa Cruz",
-							"UCSD => University of California-San Diego",
-							"UEA => Urban Economics Association",
-							"UERI => Urban Economic Research Institute",
-							"UIBE => University of International Business and Economics",
-							"UKNEE => UK Network of Environmental Economists",
-							"UMT => University of Management and Technology",
-							"UNISA => University of South Africa",
-							"UNISZA => Universiti Sultan Zainal Abidin",
-							"UPEG => Ukrainian Productivity and Efficiency Group",
-							"URPE => Union for Radical Political Economics",
-							"USAEE => United States Association for Energy Economics",
-							"USSEE => United States Society for Ecological Economics",
-							"UTAMU => Uganda Technology And Management University",
-							"UTI => Unit Trust of India",
-							"VCREME => Vietnam Center of Research in Economics, Management and Environment",
-							"VEA => Vietnamese Economics Association",
-							"VECON => Vietnamese Economics Network",
-							"VIAPI => All-Russian institute of agrarian problems and information theory",
-							"VNU => Vietnam National University",
-							"WAFA => Washington Area Finance Association",
-							"WASCAL => West African Science Service Center on Climate Change and Adapted Land Use",
-							"WDR => World Dialogue on Regulation for Network Economies",
-							"WEA => World Economics Association",
-							"WEF => World Economic Forum",
-							"WHEG => Welsh Health Economist Group",
-							"WPA => World Psychiatric Association, Section on Mental Health Economics",
-							"WPEG => Work Pensions and Labour Economics Study Group",
-							"WRIA => Western Risk and Insurance Association",
-							"WTO => World Trade Organization",
-							"XIME => Xavier Institute of Management and Entrepreneurship",
-							"XIMR => Xavier Institute of Management and Research",
-							"XJTLU => Xi'an Jiaotong-Liverpool University",
-							"XLRI => Xavier Labour Relations Institute",
-							"ZEPARU => Zimbabwe Economic Policy Analysis and Research Unit",
-							"ZIPAR => Zambia Institute for Policy Analysis and Research",
-							"ZISMG => Univeristy of Humanities 'Zaporizhia Institute of State and Municipial Government'",
-							"eBRN => E-Business Research Network",
-							"iDEAs => International Data Envelopment Analysis Society",
-							"iHEA => International Health Economics Association"
-							]
+	ES mapping used for the author index, built when the index is created since its synonym filter is read from a file.
+'''
+def author_mapping():
+	return {
+		"settings": {
+			"number_of_shards": 1,
+			# Custom similarity used to avoid discounting very common names
+			"similarity": {
+			  "tf_sim": {
+			    "type": "scripted",
+			    "script": {
+			      "source": "double tf = Math.sqrt(doc.freq); double norm = 1/Math.sqrt(doc.length); return query.boost * tf * norm;"
+			    }
+			  }
+			},
+			"index": {
+				"analysis": {
+					"analyzer": {
+						"synonym": {
+							"tokenizer": "whitespace",
+							"filter": [ "synonym" ]
+						}
+					},
+					"filter": { 
+						# Synonyms used to expand institution names (generated from synonyms_inst, see synonyms.py)
+						"synonym" : synonyms.synonym_filter()
 					}
 				}
 			}
+		},
+		"mappings": {
+			"properties": {
+				# Full name as found in the ReDIF file
+				"full_name": { "type": "text" },
+				# "full_name": { "type": "text", "similarity": "tf_sim" },
+				# Aliases are just used to pick the best full name
+	            "aliases": { "type": "text", "index": False },
+	            # Author homepage
+	            "home_url": { "type": "text", "index": False },
+	            # List of institutions (canonical names if institutions are canonicalized, otherwise raw affiliations, which appear 
+	            # n times if n publications signed by this author when affiliated to that institution)
+				"institutions": { "type": "text" },
+				# IDs (institution hashes) of the canonical institutions
+				"institution_ids": { "type": "keyword" },
+				# List of topics (in French) that will be displayed as part of search results
+				"show_specialites": { "type": "text", "index": False },
+				# List of topics as keywords, appear n times if n papers published by this author with that keyword
+				"keywords": { "type": "text" },
+				# List of publication titles
+				"titles": { "type": "text" },
+				# Last known affiliation
+				"current_institution": { "type": "text" },
+				# Latest publication seen
+				"latest_pub_date": { "type": "text" },
+				# List of pairs (pub_id, pub_date)
+				"pub_ids": { "type": "nested", "properties": { "pub_id": { "type": "keyword" } } },
+				# Number of publications with a non-empty abstract
+				"abstracts": { "type": "integer"},
+				# List of pairs (co-author name hash, number of co-publications)
+				"coauthors": { "type": "nested" },
+				# List of pairs (JEL label in French, number of publications), kept to merge specialties on delta updates
+				"specialties": { "type": "object", "enabled": False },
+				# Influence metric used to search search results
+				"influence": { "type": "integer"},
+				# Number of pages of the author's publication digest
+				"digest_pages": { "type": "integer", "index": False }
+			}
 		}
+	}
+
+MAPPING_AUTHOR = lazy.Lazy(author_mapping)
+
+'''
+	ES mapping used for the author digest index, whose documents (with ID "<author ID>:<page>") hold the digests of
+	a page of publications of an author, most recent first.
+'''
+MAPPING_DIGEST = {
+	"settings": {
+		"number_of_shards": 1
 	},
 	"mappings": {
 		"properties": {
-			# Full name as found in the ReDIF file
-			"full_name": { "type": "text" },
-			# "full_name": { "type": "text", "similarity": "tf_sim" },
-			# Aliases are just used to pick the best full name
-            "aliases": { "type": "text", "index": False },
-            # Author homepage
-            "home_url": { "type": "text", "index": False },
-            # List of institutions (appear n times if n publications signed by this author when affiliated to that institution)
-			"institutions": { "type": "text" },
-			# List of topics (in French) that will be displayed as part of search results
-			"show_specialites": { "type": "text", "index": False },
-			# List of topics as keywords, appear n times if n papers published by this author with that keyword
-			"keywords": { "type": "text" },
-			# List of publication titles
-			"titles": { "type": "text" },
-			# Last known affiliation
-			"current_institution": { "type": "text" },
-			# Latest publication seen
-			"latest_pub_date": { "type": "text" },
-			# List of pairs (pub_id, pub_date)
-			"pub_ids": { "type": "nested" },
-			# Number of publications with a non-empty abstract
-			"abstracts": { "type": "integer"},
-			# List of pairs (co-author name hash, number of co-publications)
-			"coauthors": { "type": "nested" },
-			# Influence metric used to search search results
-			"influence": { "type": "integer"}			
+			"author": { "type": "keyword" },
+			"page": { "type": "integer" },
+			"pages": { "type": "integer" },
+			"page_size": { "type": "integer", "index": False },
+			# Title, date, authors, URL, topics, keywords and (possibly truncated) abstract of each publication
+			"publis": { "type": "object", "enabled": False }
 		}
 	}
 }
 
-ES = Elasticsearch()
-
-ENCODINGS = ['utf-8', 'utf-16-le']
+# Search backend: 'es' for the Elasticsearch cluster, 'local' or 'local:<directory>' for the in-process backend
+SEARCH_BACKEND = os.environ.get('ECONFAST_BACKEND', 'es')
 
-def lines(f):
-	handle = None
-	for e in ENCODINGS:
-		if handle:
-			handle.close()
-			break
-		try:
-			handle = io.open(f, 'r', encoding=e)
-			for l in handle:
-				yield l.strip()
-		except:
-			logging.debug("Error opening file {} in {}".format(f, e), sys.exc_info()[0])
+# Search client, created on first use
+ES = lazy.Lazy(lambda: local_search.create_client(SEARCH_BACKEND))
 
 def valid_pubdate(t):
 	return t["pub_date"] if "pub_date" in t and t["pub_date"] else "2020-08"
 
-def remove_comma(n):
-	l = list([i.strip() for i in n.split(",")])
-	if len(l) < 2:
-		return n
-	if len(l) > 2:
-		logging.warning("Found full name with several commas: {}".format(n))
-	return l[1] + " " + l[0]	
+def load_top_authors():
+	top_authors = dict()
+	for l in lines('top_authors'):
+		items = list([i.strip() for i in l.split("|")])
+		if len(items) != 2:
+			logging.error("Invalid author row: {}".format(l))
+		# Keyed by canonical author ID, which may be the name hash of another spelling (see author_disambiguation.py)
+		name_hash = canonical_author(hash_name(items[0]))
+		home_url = items[1]
+		top_authors[name_hash] = home_url
+	logging.info("Loaded {} top authors".format(len(top_authors)))
+	return top_authors
 
-DUMMY_NAMES = ["anonymous", "collective"]
+def load_top_institutions():
+	top_insts = set(lines("top_institutions"))
+	logging.info("Loaded {} top institutions".format(len(top_insts)))
+	return top_insts
 
-def hash_name(n):
-	if len(n) < 4:
-		return None
-	m = remove_comma(n)
-	l = list([i.lower().strip(". ") for i in re.split(r'\.| ', m) if len(i.strip(". ")) > 0])
-	if len(l) > 0:
-		r = [l[0]]
-		for i in range(1, len(l)-1):
-			mid = l[i].strip()
-			if len(mid) > 0:
-				r.append(mid[0])
-		if len(l) > 1:
-			r.append(l[-1])
-		name_hash = " ".join(r)
-		if any([n in name_hash.lower() for n in DUMMY_NAMES]):
-			return None
-		return name_hash
-	return None
+# Map from author name hash to homepage URL, loaded on first use
+TOP_AUTHORS = lazy.Lazy(load_top_authors)
 
-'''
-	Picks the best variant among several full names for the same person.
-	
-	The best variant first maximizes the token count, then maximizes the number of full tokens (as 
-	opposed to initials), finally minimizes the number of commas.
-	
-	For example with "Harvey, Andrew C.", "Andrew C. Harvey", "Andrew Harvey", "Andrew Charles Harvey", 
-	the latter will be selected.
-'''
-def best_name_variant(names):
-	best = sorted(names, key=name_variant_key, reverse=True)[0]
-	return " ".join([i[0].upper() + (i[1:].lower() if len(i) > 1 else "") for i in best.split(" ") if len(i) > 0])
+# Mapping from author ID (name hash) to counter of JEL code frequencies
+AUTHOR_SPECIALTIES = defaultdict(Counter)
 
-'''
-	Used to sort name variants when picking the best one.
-'''	
-def name_variant_key(n):
-	return metric_token_count(n), metric_full_token_count(n), metric_comma_count(n)
+TOP_INSTITS = lazy.Lazy(load_top_institutions)
 
-def token_count(n, k):
-	m = remove_comma(n)
-	l = list([i.strip("-. ") for i in re.split(r'\.| ', m) if len(i.strip("-. ")) > k])
-	return len(l)
+# Influence weights, read again when influence_weights.json changes
+INFLUENCE_WEIGHTS = influence.Weights()
 
-'''
-	1st metric to select the best name variant
-'''	
-def metric_token_count(n):
-	return token_count(n, 0)
+# Image search backend, image cache, image verdict cache and institution logo store, created on first use
+IMAGE_CRAWL = []
 
-'''
-	2nd metric to select the best name variant
-'''	
-def metric_full_token_count(n):
-	return token_count(n, 1)
+def image_crawler():
+	if not IMAGE_CRAWL:
+		IMAGE_CRAWL.append(image_crawl.create_backend(IMAGE_BACKEND))
+		IMAGE_CRAWL.append(image_crawl.ImageCache(IMAGE_CACHE_FILE))
+		IMAGE_CRAWL.append(image_analysis.VerdictCache(IMAGE_CACHE_FILE))
+		IMAGE_CRAWL.append(logo_store.LogoStore(IMAGE_CACHE_FILE))
+	return IMAGE_CRAWL[0], IMAGE_CRAWL[1]
 
 '''
-	3rd metric to select the best name variant
-'''	
-def metric_comma_count(n):
-	return 0 if n.count(",") > 0 else 1
-
-# Map from author name hash to homepage URL
-TOP_AUTHORS = dict()
-for l in lines('top_authors'):
-	items = list([i.strip() for i in l.split("|")])
-	if len(items) != 2:
-		logging.error("Invalid author row: {}".format(l))
-	name_hash = hash_name(items[0])
-	home_url = items[1]
-	TOP_AUTHORS[name_hash] = home_url
-logging.info("Loaded {} top authors".format(len(TOP_AUTHORS)))
+	Quits the browsers of the image search backend at the end of an image crawling stage (the next stage launches new ones).
+'''
+def close_image_backend():
+	if IMAGE_CRAWL:
+		IMAGE_CRAWL[0].close()
 
-# Mapping from author ID (name hash) to counter of JEL code frequencies
-AUTHOR_SPECIALTIES = defaultdict(Counter)
+def inst_logos():
+	image_crawler()
+	return IMAGE_CRAWL[3]
 
-TOP_INSTITS = set(lines("top_institutions"))
-logging.info("Loaded {} top institutions".format(len(TOP_INSTITS)))
+def logo_query(inst):
+	return ["logo", ' '.join(inst.split("-")[:2])]
 
-# Mapping from an institution's name to its logo
-INST_LOGOS = dict()
+'''
+	Returns the verdict on a crawled image as a pair (number of faces, whether it is grayscale), both None if 
+	the image could not be downloaded or decoded.
+'''
+def image_verdict(url):
+	_, cache = image_crawler()
+	data = cache.image(url)
+	if not data:
+		return None, None
+	return image_analysis.cached_verdict(data, IMAGE_CRAWL[2])
 
 """
-	If settings include image crawling, this method will either fetch an already scraped institution's logo 
-	or will scrape it from Google Image Search results.
+	If settings include image crawling, this method looks up an institution's logo in the logo store, which is 
+	filled beforehand (see refresh_logos).
 """	
 def fetch_logo(inst, obj):
 	if CRAWL_INST_LOGOS:
-		inst_hash = normalize_institutions.hash_institution(inst)
-		if inst_hash not in INST_LOGOS:
-			query_str = ' '.join(inst.split("-")[:2])
-			img_urls = list(image_crawl.yield_image_urls(["logo", query_str]))
-			if CHECK_INST_LOGO:
-				logo_urls = list([logo_url for logo_url in logo_urls if not image_analysis.isgray(logo_url)])
-				logging.debug("{} out of {} pictures scraped for institution {} were color pics".format(len(logo_urls), len(img_urls), inst))
-			else:
-				logo_urls = img_urls
-			INST_LOGOS[inst_hash] = logo_urls
-		else:
-			logo_urls = INST_LOGOS[inst_hash]
-		if len(logo_urls) > 0:
+		logo_urls = inst_logos().get(inst)
+		if logo_urls:
 			obj["logo_urls"] = logo_urls
 
+"""
+	Searches the logos of the given institutions which are missing from the logo store or stale, checks them 
+	and saves them in the store.
+"""
+def refresh_logos(institutions):
+	store = inst_logos()
+	stale = store.stale(institutions)
+	if not stale:
+		return
+	backend, cache = image_crawler()
+	queries = list([logo_query(inst) for inst in stale])
+	# Searches more recent than the shortest staleness delay are reused
+	max_age = logo_store.EMPTY_LOGO_MAX_AGE_DAYS * logo_store.DAY_SECONDS
+	image_crawl.crawl(queries, backend, cache, max_images=3, workers=IMAGE_CRAWL_WORKERS, max_age=max_age)
+	if CHECK_INST_LOGO:
+		verify_images(queries)
+	entries = []
+	for inst, query in zip(stale, queries):
+		img_urls = cache.image_urls(query)
+		# Failed searches are left out of the store, so that they are retried
+		if img_urls is None:
+			continue
+		if CHECK_INST_LOGO:
+			logo_urls = list([logo_url for logo_url in img_urls if not image_verdict(logo_url)[1]])
+			logging.debug("{} out of {} pictures scraped for institution {} were color pics".format(len(logo_urls), len(img_urls), inst))
+		else:
+			logo_urls = img_urls
+		entries.append((inst, logo_urls))
+	store.put_all(entries)
+	print("Logo store: {} institutions refreshed, {} with a logo ({} in store)".format(len(entries), sum([1 for _, urls in entries if urls]), len(store)))
+
+def warm_logo_store():
+	try:
+		refresh_logos(list(TOP_INSTITS) + list([l for l in lines("registered_institutions") if l]))
+	finally:
+		close_image_backend()
+
 '''
 	Computes a measure of influence for an author, which will be used for ES search result scoring.
 
@@ -1031,39 +357,30 @@ def fetch_logo(inst, obj):
 	picture was found for the author.
 '''
 def new_author_influence(author, name_hash):
-	score_publi = 40 * min(log10(len(author["pub_ids"])), 4)
-	# Score publications with abstracts in [0, 400]
-	if "abstracts" in author and author["abstracts"] > 0:
-		score_publi += 80 * min(log10(author["abstracts"]), 4)
-	if "current_institution" in author:
-		score_inst = 400 if author["current_institution"] in TOP_INSTITS else 200
-		if "logo_urls" in author and len(author["logo_urls"]) > 0:
-			score_inst += 100
-	else:
-		score_inst = 0
-	score_pic = 150 if "pic_urls" in author and len(author["pic_urls"]) > 0 else 0
-	score_specs = 50 * min(len(AUTHOR_SPECIALTIES[name_hash]), 3)
-	score = score_publi + score_inst + score_pic + score_specs
-	if name_hash in TOP_AUTHORS:
-		score *= 2
-	return score
+	return influence.influence_score(influence.features(len(author["pub_ids"]), author.get("abstracts", 0), author.get("current_institution"),
+		bool(author.get("logo_urls")), bool(author.get("pic_urls")), len(AUTHOR_SPECIALTIES[name_hash]), name_hash, TOP_AUTHORS, TOP_INSTITS),
+		INFLUENCE_WEIGHTS.get())
 
 def existing_author_influence(pub_id_count, abstracts, inst, logo_urls, pic_urls, name_hash):
-	score_publi = 40 * min(log10(pub_id_count), 4)
-	if abstracts > 0:
-		score_publi += 80 * min(log10(abstracts), 4)
-	if inst:
-		score_inst = 400 if inst in TOP_INSTITS else 200
-		if logo_urls:
-			score_inst += 100
-	else:
-		score_inst = 0
-	score_pic = 150 if pic_urls else 0
-	score_specs = 50 * min(len(AUTHOR_SPECIALTIES[name_hash]), 3)
-	score = score_publi + score_inst + score_pic + score_specs
-	if name_hash in TOP_AUTHORS:
-		score *= 2
-	return score
+	return influence.influence_score(influence.features(pub_id_count, abstracts, inst, logo_urls, pic_urls,
+		len(AUTHOR_SPECIALTIES[name_hash]), name_hash, TOP_AUTHORS, TOP_INSTITS), INFLUENCE_WEIGHTS.get())
+
+'''
+	Computes the influence of all the authors of the accumulators in a single vectorized pass, once their images
+	are resolved (see resolve_images). Returns a dict from name hash to influence.
+'''
+def author_influences(accs):
+	name_hashes = list(accs.keys())
+	rows = []
+	for name_hash in name_hashes:
+		acc = accs[name_hash]
+		inst = acc["current_institution"]
+		has_logo = bool(inst and acc.get("logo_institution") == inst and acc.get("logo_urls"))
+		rows.append(influence.features(len(acc["pub_ids"]), acc["abstracts"], inst, has_logo, bool(acc.get("pic_urls")),
+			len(AUTHOR_SPECIALTIES[name_hash]), name_hash, TOP_AUTHORS, TOP_INSTITS))
+	if not rows:
+		return { }
+	return dict(zip(name_hashes, influence.influence_scores(rows, INFLUENCE_WEIGHTS.get()).tolist()))
 
 '''
 	Indexing method used for a publication author who is already in  the authors index.
@@ -1120,7 +437,6 @@ def index_existing_author(publi, pub_tuple, has_abstract, author, aid_by_hash, f
 		"logo_urls" in upd_author and len(upd_author["logo_urls"]) > 0, 
 		"pic_urls" in old_author and len(old_author["pic_urls"]) > 0,
 		name_hash)
-	# TODO see if abstracts can fit in
 	resp = ES.update(index=ES_INDEX_AUTHOR, id=aid, body={ "doc": upd_author })
 
 '''
@@ -1130,7 +446,8 @@ def crawl_profile_pic(full_name, name_hash):
 	return CRAWL_AUTHOR_PICS and name_hash in TOP_AUTHORS
 
 '''
-	Actually retrieves an author's pictures.
+	Actually retrieves an author's pictures, from the image cache only: searches are run by the image crawling stage
+	before the documents are built, and those missing from the cache (e.g. failed ones) are retried by the next stage.
 '''
 def fetch_pic_urls(full_name):
 	if full_name.endswith("Cette"):
@@ -1141,10 +458,11 @@ def fetch_pic_urls(full_name):
 		img_urls = [
 		"https://www.lopinion.fr/sites/nb.com/files/styles/w_838/public/images/2019/12/thomas_philippon_dr.jpeg?itok=03QTaEze"]
 	else:
-		img_urls = list(image_crawl.yield_image_urls([full_name], max_images=5))
+		_, cache = image_crawler()
+		img_urls = (cache.image_urls([full_name]) or [])[:5]
 	if len(img_urls) > 0:
 		if CHECK_FACE_PICTURES:
-			face_urls = list([img_url for img_url in img_urls if image_analysis.face_count(img_url) == 1])
+			face_urls = list([img_url for img_url in img_urls if image_verdict(img_url)[0] == 1])
 			logging.debug("{} out of {} pictures scraped for {} were a portrait".format(len(face_urls), len(img_urls), full_name))
 			return face_urls if len(face_urls) > 0 else img_urls
 		else:
@@ -1203,31 +521,51 @@ def specialties_label(specs):
 		return "; ".join([k for k, v in specs.most_common(MAX_DISPLAYED_SPECIALTIES)])
 		+ " (et {} autres)".format(len(specs) - MAX_DISPLAYED_SPECIALTIES)
 
+'''
+	Computes the name hash used as an author's ID, falling back on the institution name for anonymous publications.
+	Name hashes which are aliases of another author are replaced by the canonical author ID.
+
+	Returns a pair (full name, name hash), the name hash being None if no ID could be computed.
+'''
+def author_name_hash(author, hashes=None):
+	full_name = author["full_name"]
+	name_hash = hashes[full_name] if hashes is not None else hash_name(full_name)
+	if not name_hash:
+		logging.error("Could not compute name hash for {}...".format(full_name))
+		if "institution" in author:
+			full_name = author["institution"]
+			name_hash = hash_name(full_name)
+			if name_hash:
+				logging.error("... falling back on institution : {}".format(full_name))
+	return full_name, canonical_author(name_hash)
+
+# Mapping from alias name hash to canonical author ID, loaded on first use
+AUTHOR_ALIASES = []
+
+def canonical_author(name_hash):
+	if not USE_AUTHOR_ALIASES or not name_hash:
+		return name_hash
+	if not AUTHOR_ALIASES:
+		if not os.path.exists(author_disambiguation.AUTHOR_ALIASES_FILE):
+			logging.warning("No author aliases file {}, author_disambiguation.py must be run before the author build".format(author_disambiguation.AUTHOR_ALIASES_FILE))
+		AUTHOR_ALIASES.append(author_disambiguation.load_aliases())
+		logging.info("Loaded {} author aliases".format(len(AUTHOR_ALIASES[0])))
+	return AUTHOR_ALIASES[0].get(name_hash, name_hash)
+
 def index_authors_from_publis():
 	aid_by_hash = { }
+	metrics.set_total("es_scan", ES.count(index=ES_INDEX_PUBLI)["count"])
 	resp = scan(ES, scroll='360m', index=ES_INDEX_PUBLI, query={ "query": { "match_all": {} } })
-	c = 0
-	for hit in resp:
-		c += 1
-		if c % 10000 == 0:
-			print("Scanned {} publications".format(c))
+	for hit in metrics.timed_iter("es_scan", resp):
 		publi = hit["_source"]
 		pub_id = hit["_id"]
 		pub_date = publi["creation-date"] if "creation-date" in publi else None
 		has_abstract = "abstract" in publi and len(publi["abstract"]) > 0
 		pub_tuple = { "pub_id": pub_id, "pub_date": pub_date }
 		all_authors = publi["authors"]
-		all_name_hashes = dict([(hash_name(author["full_name"]), author["full_name"]) for author in all_authors])
+		all_name_hashes = dict([(canonical_author(hash_name(author["full_name"])), author["full_name"]) for author in all_authors])
 		for author in all_authors:
-			full_name = author["full_name"]
-			name_hash =  (full_name)
-			if not name_hash:
-				logging.error("Could not compute name hash for {}...".format(full_name, publi))
-				if "institution" in author:
-					full_name = author["institution"]
-					name_hash = hash_name(full_name)
-					if name_hash:
-						logging.error("... falling back on institution : {}".format(full_name))
+			full_name, name_hash = author_name_hash(author)
 			if not name_hash:
 				continue
 			if name_hash in aid_by_hash:
@@ -1236,12 +574,912 @@ def index_authors_from_publis():
 				index_new_author(publi, pub_tuple, has_abstract, pub_date, author, aid_by_hash, full_name, name_hash, all_name_hashes)
 	ES.indices.refresh(index=ES_INDEX_AUTHOR)
 
-if __name__ == "__main__":
+'''
+	Yields pairs (publication ID, publication) from a single scan of the publication index, or of its first limit
+	publications.
+'''
+def yield_publis(limit=None):
+	total = ES.count(index=ES_INDEX_PUBLI)["count"]
+	metrics.set_total("es_scan", min(total, limit) if limit else total)
+	hits = scan(ES, scroll='360m', index=ES_INDEX_PUBLI, query={ "query": { "match_all": {} } })
+	for hit in metrics.timed_iter("es_scan", islice(hits, limit)):
+		yield hit["_id"], hit["_source"]
+
+'''
+	Creates the in-memory accumulator for an author, which gathers everything needed to build its document.
+'''
+def new_accumulator():
+	return {
+		"aliases": [],
+		"best_alias": None,
+		"institutions": [],
+		"institution_ids": set(),
+		"current_institution": None,
+		"institution_date": None,
+		"latest_pub_date": None,
+		"jel-labels-en": [],
+		"jel-labels-fr": [],
+		"keywords": set(),
+		"titles": [],
+		"pub_ids": [],
+		"abstracts": 0,
+		"coauthors": Counter(),
+		"coauthor_names": { }
+	}
+
+# Resolver of raw affiliations to canonical institutions, created on first use
+INSTITUTION_RESOLVER = []
+
+# Expander of institution acronyms, created on first use
+ACRONYM_EXPANDER = []
+
+def institutions_resolver():
+	if not INSTITUTION_RESOLVER:
+		INSTITUTION_RESOLVER.append(institution_resolver.load_resolver())
+		logging.info("Loaded {} canonical institutions".format(len(INSTITUTION_RESOLVER[0])))
+	return INSTITUTION_RESOLVER[0]
+
+'''
+	Returns the value of the institutions field of an author document.
+'''
+def institutions_text(institutions):
+	if EXPAND_ACRONYMS:
+		if not ACRONYM_EXPANDER:
+			ACRONYM_EXPANDER.append(synonyms.load_expander())
+		institutions = list([ACRONYM_EXPANDER[0].expand(inst) for inst in institutions])
+	return institutions if CANONICALIZE_INSTITUTIONS else ' '.join(institutions)
+
+'''
+	Folds a publication's authorship into an author accumulator.
+
+	Co-authors are only counted in the accumulator if a mapping from co-author name hash to full name is given
+	(otherwise co-authorships are gathered in the co-authorship graph).
+
+	The current institution is the one found on the latest dated publication (or the first one seen if none is dated).
+'''
+def fold_authorship(acc, publi, pub_tuple, has_abstract, author, full_name, name_hash, all_name_hashes):
+	if full_name not in acc["aliases"]:
+		acc["aliases"].append(full_name)
+		acc["best_alias"] = better_name_variant(acc["best_alias"], full_name)
+	pub_date = pub_tuple["pub_date"]
+	if pub_date and (acc["latest_pub_date"] is None or acc["latest_pub_date"] < pub_date):
+		acc["latest_pub_date"] = pub_date
+	if "institution" in author:
+		inst = author["institution"]
+		if CANONICALIZE_INSTITUTIONS:
+			resolver = institutions_resolver()
+			cid = resolver.resolve(inst)
+			if cid:
+				inst = resolver.name(cid)
+				acc["institution_ids"].add(cid)
+			if inst not in acc["institutions"]:
+				acc["institutions"].append(inst)
+		else:
+			acc["institutions"].append(inst)
+		if acc["current_institution"] is None or (pub_date and (acc["institution_date"] is None or acc["institution_date"] < pub_date)):
+			acc["current_institution"] = inst
+			acc["institution_date"] = pub_date
+	if "jel-labels-en" in publi:
+		acc["jel-labels-en"].extend(publi["jel-labels-en"])
+	if "jel-labels-fr" in publi:
+		acc["jel-labels-fr"].extend(publi["jel-labels-fr"])
+		for jel_label in publi["jel-labels-fr"]:
+			AUTHOR_SPECIALTIES[name_hash][jel_label] += 1
+	if "keywords" in publi:
+		acc["keywords"].update(publi["keywords"])
+	if "title" in publi:
+		acc["titles"].append(publi["title"])
+	acc["pub_ids"].append(pub_tuple)
+	if has_abstract:
+		acc["abstracts"] += 1
+	if all_name_hashes is None:
+		return
+	for other_name_hash, other_full_name in all_name_hashes.items():
+		if other_name_hash == name_hash or not other_name_hash:
+			continue
+		acc["coauthors"][other_name_hash] += 1
+		if other_name_hash not in acc["coauthor_names"]:
+			acc["coauthor_names"][other_name_hash] = other_full_name
+
+'''
+	Folds all authorships of the given publications, passed as pairs (publication ID, publication), into 
+	a mapping from author name hash to accumulator (only those of the name hashes accepted by keep, if given).
+'''
+def aggregate_authors(publis, accs=None, graph=None, keep=None):
+	if not isinstance(accs, defaultdict):
+		accs = defaultdict(new_accumulator, accs if accs else { })
+	for chunk in yield_chunks(publis, HASH_CHUNK_SIZE):
+		names = list([author["full_name"] for _, publi in chunk for author in publi["authors"]])
+		with metrics.timer("hash_name", len(names)):
+			hashes = hash_names(names)
+		with metrics.timer("aggregate", len(chunk)):
+			for pub_id, publi in chunk:
+				fold_publication(accs, pub_id, publi, hashes, graph, keep)
+		metrics.gauge("authors", len(accs))
+	return accs
+
+'''
+	Folds the authorships of a publication into the accumulators. If keep is given, only the authors whose name hash
+	it accepts are folded (e.g. those of a partition), but all co-authors are added to the graph.
+'''
+def fold_publication(accs, pub_id, publi, hashes, graph=None, keep=None):
+	pub_date = publi["creation-date"] if "creation-date" in publi else None
+	has_abstract = "abstract" in publi and len(publi["abstract"]) > 0
+	pub_tuple = { "pub_id": pub_id, "pub_date": pub_date }
+	all_authors = publi["authors"]
+	all_name_hashes = dict([(canonical_author(hashes[author["full_name"]]), author["full_name"]) for author in all_authors]) if graph is None else None
+	name_hashes = []
+	for author in all_authors:
+		full_name, name_hash = author_name_hash(author, hashes)
+		if not name_hash:
+			continue
+		name_hashes.append(name_hash)
+		if keep is None or keep(name_hash):
+			fold_authorship(accs[name_hash], publi, pub_tuple, has_abstract, author, full_name, name_hash, all_name_hashes)
+	if graph is not None:
+		graph.add_publication(name_hashes)
+
+def yield_chunks(items, size):
+	chunk = []
+	for item in items:
+		chunk.append(item)
+		if len(chunk) >= size:
+			yield chunk
+			chunk = []
+	if chunk:
+		yield chunk
+
+'''
+	Builds the finished author document from its accumulator, including images and influence.
+'''
+def author_document(acc, name_hash, score=None):
+	obj = {
+		"full_name": format_name(acc["best_alias"]),
+		"aliases": acc["aliases"],
+		"institutions": institutions_text(acc["institutions"]),
+		"jel-labels-en": ' '.join(acc["jel-labels-en"]),
+		"jel-labels-fr": ' '.join(acc["jel-labels-fr"]),
+		"keywords": list(acc["keywords"]),
+		"titles": ' '.join(acc["titles"]),
+		"pub_ids": sorted(acc["pub_ids"], key=valid_pubdate, reverse=True),
+		"abstracts": acc["abstracts"]
+	}
+	if acc["current_institution"]:
+		inst = acc["current_institution"]
+		obj["current_institution"] = inst
+		if acc.get("logo_institution") == inst:
+			if acc["logo_urls"]:
+				obj["logo_urls"] = acc["logo_urls"]
+		else:
+			fetch_logo(inst, obj)
+	if acc["latest_pub_date"]:
+		obj["latest_pub_date"] = acc["latest_pub_date"]
+	if acc["institution_ids"]:
+		obj["institution_ids"] = sorted(acc["institution_ids"])
+	if name_hash in TOP_AUTHORS:
+		home_url = TOP_AUTHORS[name_hash]
+		if len(home_url) > 0:
+			obj["home_url"] = home_url
+	if acc.get("pic_urls"):
+		obj["pic_urls"] = acc["pic_urls"]
+	elif "pic_urls" not in acc and crawl_profile_pic(obj["full_name"], name_hash):
+		pic_urls = fetch_pic_urls(obj["full_name"])
+		if len(pic_urls) > 0:
+			obj["pic_urls"] = pic_urls
+	obj["show_specialites"] = specialties_label(AUTHOR_SPECIALTIES[name_hash])
+	obj["specialties"] = list([{ "label": k, "count": v } for k, v in AUTHOR_SPECIALTIES[name_hash].items()])
+	obj["coauthors"] = list([{
+		"coauthor_name": acc["coauthor_names"][other_name_hash], 
+		"coauthor_hash": other_name_hash, 
+		"copublications": copublis } for other_name_hash, copublis in acc["coauthors"].items()])
+	obj["influence"] = score if score is not None else new_author_influence(obj, name_hash)
+	if BUILD_DIGESTS:
+		obj["digest_pages"] = digest_page_count(len(obj["pub_ids"]))
+	return obj
+
+'''
+	Image crawling stage, run before the author documents are built: searches the pictures of the authors (and 
+	the missing logos of the current institutions) which will be displayed, with concurrent fetchers, so that 
+	building the documents then only involves image cache and logo store lookups.
+'''
+def crawl_images(accs):
+	crawl_image_requests(*image_requests(accs))
+
+'''
+	Returns the image searches needed by the authors, as a pair (picture queries, institutions whose logo is needed).
+'''
+def image_requests(accs):
+	queries = []
+	for name_hash, acc in accs.items():
+		if "pic_urls" not in acc:
+			full_name = format_name(acc["best_alias"])
+			if crawl_profile_pic(full_name, name_hash):
+				queries.append([full_name])
+	institutions = set([acc["current_institution"] for acc in accs.values() 
+		if acc["current_institution"] and acc.get("logo_institution") != acc["current_institution"]]) if CRAWL_INST_LOGOS else set()
+	return queries, institutions
+
+def crawl_image_requests(queries, institutions):
+	try:
+		if CRAWL_INST_LOGOS:
+			refresh_logos(institutions)
+		if not queries:
+			return
+		backend, cache = image_crawler()
+		searched, downloaded = image_crawl.crawl(queries, backend, cache, workers=IMAGE_CRAWL_WORKERS)
+	finally:
+		close_image_backend()
+	print("Image crawl: {} queries, {} searched, {} images downloaded".format(len(queries), searched, downloaded))
+	if CHECK_FACE_PICTURES or CHECK_INST_LOGO:
+		verify_images(queries)
+
+'''
+	Resolves the logos and pictures of the authors into their accumulators, from the logo store and the image
+	cache filled by crawl_images, so that their influence can be computed before their documents are built.
+'''
+def resolve_images(accs):
+	for name_hash, acc in accs.items():
+		inst = acc["current_institution"]
+		if CRAWL_INST_LOGOS and inst and acc.get("logo_institution") != inst:
+			obj = { }
+			fetch_logo(inst, obj)
+			acc["logo_institution"] = inst
+			acc["logo_urls"] = obj.get("logo_urls", [])
+		if "pic_urls" not in acc:
+			full_name = format_name(acc["best_alias"])
+			if crawl_profile_pic(full_name, name_hash):
+				acc["pic_urls"] = fetch_pic_urls(full_name)
+
+'''
+	Image verification stage: analyses the crawled images in batches over a process pool, the verdicts being 
+	cached by image content so that building the documents only involves verdict lookups.
+'''
+def verify_images(queries, batch_size=1000):
+	_, cache = image_crawler()
+	urls = list(set([url for q in queries for url in (cache.image_urls(q) or [])]))
+	analysed = 0
+	for i in range(0, len(urls), batch_size):
+		images = list([data for data in [cache.image(url) for url in urls[i:i + batch_size]] if data])
+		analysed += image_analysis.verify_images(images, IMAGE_CRAWL[2], workers=IMAGE_VERIFY_WORKERS)
+	print("Image verification: {} images, {} analysed".format(len(urls), analysed))
+
+'''
+	Returns the digest of a publication, as displayed in an author profile.
+'''
+def publication_digest(publi):
+	digest = { "title": publi.get("title", ""), "authors": list([author["full_name"] for author in publi.get("authors", [])]) }
+	if publi.get("creation-date"):
+		digest["creation_date"] = publi["creation-date"]
+	for field in ["url", "keywords"]:
+		if publi.get(field):
+			digest[field] = publi[field]
+	if publi.get("jel-labels-fr"):
+		digest["jel-labels-fr"] = publi["jel-labels-fr"][:3]
+	abstract = publi.get("abstract")
+	if abstract:
+		if len(abstract) > DIGEST_ABSTRACT_LENGTH:
+			digest["abstract"] = abstract[:DIGEST_ABSTRACT_LENGTH].rsplit(" ", 1)[0] + "…"
+			digest["truncated"] = True
+		else:
+			digest["abstract"] = abstract
+	return digest
+
+# Fields of the publications read to build their digests
+DIGEST_FIELDS = ["title", "authors.full_name", "creation-date", "url", "keywords", "jel-labels-fr", "abstract"]
+
+def digest_page_count(pub_count):
+	return max(1, -(-pub_count // DIGEST_PAGE_SIZE))
+
+'''
+	Fetches the digests of the given publications, using batched multi-gets on the publication index. Returns a
+	mapping from publication ID to digest.
+'''
+def fetch_publication_digests(pub_ids):
+	digests = { }
+	pub_ids = list(set(pub_ids))
+	for i in range(0, len(pub_ids), MGET_BATCH_SIZE):
+		with metrics.timer("es_mget", len(pub_ids[i:i + MGET_BATCH_SIZE])):
+			resp = ES.mget(index=ES_INDEX_PUBLI, body={ "ids": pub_ids[i:i + MGET_BATCH_SIZE] }, _source_includes=DIGEST_FIELDS)
+		for doc in resp["docs"]:
+			if doc.get("found"):
+				digests[doc["_id"]] = publication_digest(doc["_source"])
+	return digests
+
+'''
+	Yields bulk actions for the digest index: the publications of each author, in the order of its document's
+	pub_ids, split in pages of DIGEST_PAGE_SIZE publications.
+
+	Digests are fetched for MGET_BATCH_SIZE authors at a time rather than kept during aggregation, so that only those
+	of the current batch are held in memory.
+'''
+def yield_digest_bulk_items(accs):
+	for chunk in yield_chunks(accs.items(), MGET_BATCH_SIZE):
+		digests = fetch_publication_digests([t["pub_id"] for _, acc in chunk for t in acc["pub_ids"]])
+		for name_hash, acc in chunk:
+			for item in author_digest_items(name_hash, acc, digests):
+				yield item
+
+def author_digest_items(name_hash, acc, digests):
+	pub_ids = list([t["pub_id"] for t in sorted(acc["pub_ids"], key=valid_pubdate, reverse=True)])
+	pages = digest_page_count(len(pub_ids))
+	for page in range(pages):
+		publis = []
+		for pub_id in pub_ids[page * DIGEST_PAGE_SIZE:(page + 1) * DIGEST_PAGE_SIZE]:
+			digest = dict(digests.get(pub_id, { }))
+			digest["pub_id"] = pub_id
+			publis.append(digest)
+		yield { "_index": ES_INDEX_DIGEST, "_id": "{}:{}".format(name_hash, page), "author": name_hash, "page": page, "pages": pages,
+			"page_size": DIGEST_PAGE_SIZE, "publis": publis }
+
+def index_digests(accs):
+	if not ES.indices.exists(index=ES_INDEX_DIGEST):
+		ES.indices.create(index=ES_INDEX_DIGEST, body=MAPPING_DIGEST)
+	bulk_sink.BulkSink(ES, "author digests").run(yield_digest_bulk_items(accs))
+	ES.indices.refresh(index=ES_INDEX_DIGEST)
+
+'''
+	Yields bulk actions for the author index, using the name hash as document ID.
+'''
+def yield_author_bulk_items(accs):
+	with metrics.timer("resolve_images", len(accs)):
+		resolve_images(accs)
+	with metrics.timer("influence", len(accs)):
+		scores = author_influences(accs)
+	metrics.set_total("author_document", len(accs))
+	for name_hash, acc in accs.items():
+		with metrics.timer("author_document"):
+			obj = author_document(acc, name_hash, scores[name_hash])
+		obj["_index"] = ES_INDEX_AUTHOR
+		obj["_id"] = name_hash
+		yield obj
+
+'''
+	Fills the accumulators' co-authors with the closest co-authors found in the co-authorship graph, named after
+	their best name variant.
+
+	In a partitioned build, the graph also has the authors of other partitions, whose rows are skipped and whose
+	names are given (the statistics of the whole graph being then printed by the main process).
+'''
+def attach_top_coauthors(accs, graph, names=None):
+	if graph.skipped:
+		logging.warning("Left {} publications with more than {} authors out of the co-authorship graph".format(graph.skipped, graph.max_publi_authors))
+	m = graph.matrix()
+	if names is None:
+		print_graph_stats(m)
+	rows, cols, copublis = coauthor_graph.top_coauthors(m, MAX_COAUTHORS)
+	for i, j, c in zip(rows.tolist(), cols.tolist(), copublis.tolist()):
+		name_hash, other_name_hash = graph.hashes[i], graph.hashes[j]
+		if name_hash not in accs:
+			continue
+		acc = accs[name_hash]
+		acc["coauthors"][other_name_hash] = c
+		acc["coauthor_names"][other_name_hash] = format_name(accs[other_name_hash]["best_alias"]) if other_name_hash in accs else names[other_name_hash]
+
+def new_coauthor_graph():
+	return coauthor_graph.CoauthorGraph(MAX_GRAPH_PUBLI_AUTHORS or None)
+
+def print_graph_stats(m):
+	stats = coauthor_graph.degree_stats(m)
+	count, largest, _ = coauthor_graph.components(m)
+	print("Co-authorship graph: {}, {} connected components (largest has {} authors)".format(stats, count, largest))
+
+'''
+	Builds the author index from a single pass over the publications, the authors being then indexed in bulk.
+	Returns the number of authors indexed.
+'''
+def index_authors_in_memory(publis=None):
+	graph = new_coauthor_graph()
+	accs = aggregate_authors(publis if publis is not None else yield_publis(), graph=graph)
+	index_aggregated_authors(accs, graph)
+	return len(accs)
+
+'''
+	Saves the progress of the author build.
+'''
+def save_build_state(state, accs, graph):
+	graph.compact()
+	state = dict(state, accs=dict(accs), specialties=dict(AUTHOR_SPECIALTIES), graph=graph)
+	tmp = BUILD_CHECKPOINT_FILE + ".tmp"
+	with metrics.timer("checkpoint"):
+		with open(tmp, 'wb') as f:
+			pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+		os.replace(tmp, BUILD_CHECKPOINT_FILE)
+
+def load_build_state():
+	try:
+		with open(BUILD_CHECKPOINT_FILE, 'rb') as f:
+			return pickle.load(f)
+	except FileNotFoundError:
+		return None
+
+'''
+	Aggregates the authors of all publications read by parallel readers, saving a checkpoint every
+	BUILD_CHECKPOINT_INTERVAL seconds and once all publications are aggregated. If a checkpoint is found, the build
+	resumes from it. Returns the accumulators, the co-authorship graph and the start date of the build.
+'''
+def aggregate_authors_resumable(run_date):
+	state = load_build_state()
+	if state:
+		print("Resuming the author build started on {}, {} publications already aggregated".format(state["run_date"].isoformat(), state["publications"]))
+		accs = defaultdict(new_accumulator, state.pop("accs"))
+		AUTHOR_SPECIALTIES.clear()
+		AUTHOR_SPECIALTIES.update(state.pop("specialties"))
+		graph = state.pop("graph")
+	else:
+		state = { "run_date": run_date, "readers": PUBLI_READERS, "cursors": None, "publications": 0 }
+		accs, graph = defaultdict(new_accumulator), new_coauthor_graph()
+	reader = publi_reader.PubliReader(ES, ES_INDEX_PUBLI, state["readers"], state["cursors"])
+	metrics.set_total("aggregate", max(ES.count(index=ES_INDEX_PUBLI)["count"] - state["publications"], 0))
+	last_checkpoint = time.time()
+	for i, hits in reader.read():
+		aggregate_authors([(hit["_id"], hit["_source"]) for hit in hits], accs, graph=graph)
+		reader.done(i, hits)
+		state["cursors"] = reader.cursors
+		state["publications"] += len(hits)
+		if time.time() - last_checkpoint >= BUILD_CHECKPOINT_INTERVAL:
+			save_build_state(state, accs, graph)
+			last_checkpoint = time.time()
+	save_build_state(state, accs, graph)
+	return accs, graph, state["run_date"]
+
+'''
+	Builds the author index with a resumable aggregation (see aggregate_authors_resumable), or with a single scan if the
+	publication index has no pub_id field. Returns the start date of the build.
+'''
+def index_authors_resumable(run_date):
+	if not publi_reader.has_pub_ids(ES, ES_INDEX_PUBLI):
+		logging.warning("The publication index has no pub_id field (it must be rebuilt to have one), it is read with a single scroll")
+		index_authors_in_memory()
+		return run_date
+	accs, graph, run_date = aggregate_authors_resumable(run_date)
+	index_aggregated_authors(accs, graph)
+	os.remove(BUILD_CHECKPOINT_FILE)
+	return run_date
+
+'''
+	Completes the documents of aggregated authors (top co-authors, images) and indexes them.
+'''
+def index_aggregated_authors(accs, graph):
+	print("Aggregated {} authors".format(len(accs)))
+	with metrics.timer("coauthor_graph", len(accs)):
+		attach_top_coauthors(accs, graph)
+	with metrics.timer("image_crawl", len(accs)):
+		crawl_images(accs)
+	index_author_documents(accs)
+
+def index_author_documents(accs):
+	bulk_sink.BulkSink(ES, "authors").run(yield_author_bulk_items(accs))
+	ES.indices.refresh(index=ES_INDEX_AUTHOR)
+	if BUILD_DIGESTS:
+		index_digests(accs)
+
+'''
+	Returns the partition of an author in a partitioned build, from a hash of its name hash which (unlike hash()) is
+	the same in all processes.
+'''
+def author_partition(name_hash, partitions):
+	return zlib.crc32(name_hash.encode('utf-8')) % partitions
+
+def partition_file(kind, *ids):
+	return os.path.join(PARTITION_DIR, "{}-{}.pickle".format(kind, "-".join([str(i) for i in ids])))
+
+def save_partition_file(path, obj):
+	with open(path, 'wb') as f:
+		pickle.dump(obj, f, pickle.HIGHEST_PROTOCOL)
+
+def load_partition_file(path):
+	with open(path, 'rb') as f:
+		return pickle.load(f)
+
+'''
+	Yields the objects successively pickled in a file.
+'''
+def read_pickles(path):
+	with open(path, 'rb') as f:
+		while True:
+			try:
+				yield pickle.load(f)
+			except EOFError:
+				return
+
+'''
+	Prepares a process of a partitioned build: a search client or an image cache inherited from the parent process
+	must not share its connections, they are created again on first use. Only the main process is profiled.
+'''
+def init_partition_process():
+	if isinstance(ES, lazy.Lazy):
+		ES.reset()
+	del IMAGE_CRAWL[:]
+	del metrics.STAGE_HOOKS[:]
+	sys.setprofile(None)
+
+'''
+	Map phase of a partitioned build: reads the ranges of pub_ids of a mapper (see publi_reader.py), hashes the author
+	names and routes each publication, with the hashes of its author names, to the spill file of every partition owning
+	one of its authors. Returns the number of publications read and the metrics of the process.
+'''
+def map_publication_range(reader, partitions):
+	readers = max(PUBLI_READERS, partitions)
+	cursors = dict([(i, None if i % partitions == reader else publi_reader.DONE) for i in range(readers)])
+	publis = publi_reader.PubliReader(ES, ES_INDEX_PUBLI, readers, cursors)
+	files = list([open(partition_file("publis", reader, p), 'wb') for p in range(partitions)])
+	count = 0
+	try:
+		for _, hits in publis.read():
+			names = list([author["full_name"] for hit in hits for author in hit["_source"]["authors"]])
+			with metrics.timer("hash_name", len(names)):
+				hashes = hash_names(names)
+			with metrics.timer("route", len(hits)):
+				routed = list([[] for p in range(partitions)])
+				for hit in hits:
+					publi = hit["_source"]
+					publi_hashes = dict([(author["full_name"], hashes[author["full_name"]]) for author in publi["authors"]])
+					owners = set([author_partition(name_hash, partitions) for name_hash in 
+						[author_name_hash(author, publi_hashes)[1] for author in publi["authors"]] if name_hash])
+					for p in owners:
+						routed[p].append((hit["_id"], publi, publi_hashes))
+				for f, items in zip(files, routed):
+					if items:
+						pickle.dump(items, f, pickle.HIGHEST_PROTOCOL)
+			count += len(hits)
+	finally:
+		for f in files:
+			f.close()
+	return count, metrics.METRICS.drain()
+
+def run_map(args):
+	return map_publication_range(*args)
+
+'''
+	Reduce phase of a partitioned build, first step: folds the publications routed to a partition into the
+	accumulators of its authors, then writes the files exchanged with the other partitions: the names of its authors,
+	its rows of the co-authorship graph and its image searches. Returns the accumulators and the co-authorship graph.
+
+	Since a partition receives all the publications of its authors, their co-authors and numbers of co-publications are
+	complete, only the names of the co-authors from other partitions being missing.
+'''
+def aggregate_partition(partition, partitions):
+	accs, graph = defaultdict(new_accumulator), new_coauthor_graph()
+	for reader in range(partitions):
+		for publis in read_pickles(partition_file("publis", reader, partition)):
+			with metrics.timer("aggregate", len(publis)):
+				for pub_id, publi, hashes in publis:
+					fold_publication(accs, pub_id, publi, hashes, graph, lambda name_hash: author_partition(name_hash, partitions) == partition)
+	with metrics.timer("partition_exchange", len(accs)):
+		save_partition_file(partition_file("names", partition), dict([(name_hash, format_name(acc["best_alias"])) for name_hash, acc in accs.items()]))
+		save_partition_file(partition_file("edges", partition), graph.rows_of(accs))
+		save_partition_file(partition_file("images", partition), image_requests(accs))
+	return accs, graph
+
+'''
+	Reduce phase of a partitioned build, second step (once the images are crawled): attaches the top co-authors of the
+	authors of a partition, named from the files of the other partitions, and indexes their documents. Returns the
+	number of authors indexed.
+'''
+def index_partition(partition, partitions, accs, graph):
+	foreign = set(graph.hashes) - set(accs)
+	names = { }
+	for p in range(partitions):
+		if p != partition:
+			names.update([(name_hash, name) for name_hash, name in load_partition_file(partition_file("names", p)).items() if name_hash in foreign])
+	with metrics.timer("coauthor_graph", len(accs)):
+		attach_top_coauthors(accs, graph, names)
+	index_author_documents(accs)
+	return len(accs)
+
+'''
+	Process of a partition, which reports the end of each step to the main process. The main process crawls the images
+	of all partitions between the two steps, so that image searches are not run concurrently by several processes.
+'''
+def run_partition(partition, partitions, crawled, results):
+	init_partition_process()
+	accs, graph = aggregate_partition(partition, partitions)
+	results.put((partition, None, None))
+	crawled.wait()
+	count = index_partition(partition, partitions, accs, graph)
+	results.put((partition, count, metrics.METRICS.drain()))
+
+'''
+	Waits for a message from each partition process, and fails if one of them fails.
+'''
+def wait_partitions(processes, results):
+	messages = []
+	while len(messages) < len(processes):
+		try:
+			messages.append(results.get(timeout=1))
+		except queue.Empty:
+			if any([process.exitcode for process in processes]):
+				raise RuntimeError("A partition of the author build failed")
+	return messages
+
+'''
+	Crawls the images searched by all partitions.
+'''
+def crawl_partition_images(partitions):
+	queries, institutions = [], set()
+	for p in range(partitions):
+		q, insts = load_partition_file(partition_file("images", p))
+		queries.extend(q)
+		institutions.update(insts)
+	with metrics.timer("image_crawl", len(queries)):
+		crawl_image_requests(queries, institutions)
+
+def print_partition_graph_stats(partitions):
+	with metrics.timer("coauthor_graph"):
+		print_graph_stats(coauthor_graph.matrix_from_rows([load_partition_file(partition_file("edges", p)) for p in range(partitions)]))
+
+'''
+	Builds the author index in parallel processes, as a map-reduce over partitions of the authors by name hash.
+
+	In the map phase, each process reads its share of the PUBLI_READERS ranges of pub_ids and routes the publications to
+	the partitions of their authors through spill files. In the reduce phase, each partition is aggregated and indexed
+	by its own process (see aggregate_partition and index_partition), the co-authors from other partitions being named,
+	and the statistics of the whole co-authorship graph computed, from the intermediate files of the partitions. The build time thus scales
+	with the number of cores, as long as the cluster keeps up with the bulk requests. Unlike index_authors_resumable,
+	an interrupted build starts again from scratch. Returns the number of authors indexed (also when the publication
+	index has no pub_id field and the build falls back on a single process).
+'''
+def index_authors_partitioned(partitions):
+	if not publi_reader.has_pub_ids(ES, ES_INDEX_PUBLI):
+		logging.warning("The publication index has no pub_id field (it must be rebuilt to have one), it is read with a single scroll")
+		return index_authors_in_memory()
+	shutil.rmtree(PARTITION_DIR, ignore_errors=True)
+	os.makedirs(PARTITION_DIR)
+	# Created beforehand, as partitions index their digests concurrently
+	if BUILD_DIGESTS and not ES.indices.exists(index=ES_INDEX_DIGEST):
+		ES.indices.create(index=ES_INDEX_DIGEST, body=MAPPING_DIGEST)
+	routed = 0
+	with metrics.timer("partition_map"):
+		with Pool(partitions, initializer=init_partition_process) as pool:
+			for count, raw in pool.imap_unordered(run_map, [(reader, partitions) for reader in range(partitions)]):
+				metrics.METRICS.merge(raw)
+				routed += count
+	print("Routed {} publications to {} partitions".format(routed, partitions))
+	crawled, results = Event(), Queue()
+	processes = list([Process(target=run_partition, args=(p, partitions, crawled, results)) for p in range(partitions)])
+	for process in processes:
+		process.start()
+	authors = 0
+	try:
+		with metrics.timer("partition_reduce"):
+			wait_partitions(processes, results)
+			crawl_partition_images(partitions)
+			crawled.set()
+			print_partition_graph_stats(partitions)
+			for _, count, raw in wait_partitions(processes, results):
+				metrics.METRICS.merge(raw)
+				authors += count
+	except BaseException:
+		for process in processes:
+			process.terminate()
+		raise
+	finally:
+		for process in processes:
+			process.join()
+	print("Indexed {} authors from {} partitions".format(authors, partitions))
+	shutil.rmtree(PARTITION_DIR)
+	return authors
+
+'''
+	Yields pairs (publication ID, publication) for the publications indexed since the given date.
+'''
+def yield_publis_since(checkpoint):
+	query = { "query": { "range": { "indexed_at": { "gte": checkpoint } } } }
+	for hit in scan(ES, scroll='60m', index=ES_INDEX_PUBLI, query=query):
+		yield hit["_id"], hit["_source"]
+
+'''
+	Keeps the images already found for an author whose accumulator is rebuilt, the institution logo being only
+	fetched again if the current institution changes.
+'''
+def carry_images(acc, doc):
+	if "pic_urls" in doc:
+		acc["pic_urls"] = doc["pic_urls"]
+	if doc.get("current_institution"):
+		acc["logo_institution"] = doc["current_institution"]
+		acc["logo_urls"] = doc.get("logo_urls", [])
+
+'''
+	Fetches the documents of the already indexed authors among the given name hashes, using batched multi-gets.
+	Returns a mapping from name hash to document.
+'''
+def fetch_author_documents(name_hashes):
+	docs = { }
+	name_hashes = list(name_hashes)
+	for i in range(0, len(name_hashes), MGET_BATCH_SIZE):
+		with metrics.timer("es_mget", len(name_hashes[i:i + MGET_BATCH_SIZE])):
+			resp = ES.mget(index=ES_INDEX_AUTHOR, body={ "ids": name_hashes[i:i + MGET_BATCH_SIZE] })
+		for doc in resp["docs"]:
+			if doc.get("found"):
+				docs[doc["_id"]] = doc["_source"]
+	return docs
+
+'''
+	Fetches the given publications which are still in the publication index, as pairs (publication ID, publication).
+'''
+def fetch_publications(pub_ids):
+	publis = []
+	pub_ids = list(pub_ids)
+	for i in range(0, len(pub_ids), MGET_BATCH_SIZE):
+		with metrics.timer("es_mget", len(pub_ids[i:i + MGET_BATCH_SIZE])):
+			resp = ES.mget(index=ES_INDEX_PUBLI, body={ "ids": pub_ids[i:i + MGET_BATCH_SIZE] })
+		publis.extend([(doc["_id"], doc["_source"]) for doc in resp["docs"] if doc.get("found")])
+	return publis
+
+'''
+	Returns the name hashes of the indexed authors listing any of the given publications.
+'''
+def fetch_authors_of_publis(pub_ids):
+	name_hashes = set()
+	pub_ids = list(pub_ids)
+	for i in range(0, len(pub_ids), MGET_BATCH_SIZE):
+		query = { "query": { "nested": { "path": "pub_ids", "query": { "terms": { "pub_ids.pub_id": pub_ids[i:i + MGET_BATCH_SIZE] } } } }, "_source": False }
+		for hit in scan(ES, scroll='10m', index=ES_INDEX_AUTHOR, query=query):
+			name_hashes.add(hit["_id"])
+	return name_hashes
+
+'''
+	Returns the IDs of the publications deleted since the given date, from the log written by index_publis.py.
+'''
+def load_deleted_pub_ids(checkpoint):
+	since = datetime.fromisoformat(checkpoint)
+	deleted = set()
+	try:
+		with open(PUBLI_DELETIONS_FILE) as f:
+			for l in f:
+				date, pub_id = l.split()
+				if datetime.fromisoformat(date) >= since:
+					deleted.add(pub_id)
+	except FileNotFoundError:
+		pass
+	return deleted
+
+'''
+	Deletes the documents and digests of authors who have no publication left.
+'''
+def delete_authors(name_hashes):
+	bulk_sink.BulkSink(ES, "deleted authors").run(({ "_op_type": "delete", "_index": ES_INDEX_AUTHOR, "_id": name_hash } for name_hash in name_hashes))
+	ES.indices.refresh(index=ES_INDEX_AUTHOR)
+
+'''
+	Deletes the digest pages of the given authors, so that no page is left over when an author has fewer publications.
+'''
+def delete_digests(name_hashes):
+	if not ES.indices.exists(index=ES_INDEX_DIGEST):
+		return
+	name_hashes = list(name_hashes)
+	for i in range(0, len(name_hashes), MGET_BATCH_SIZE):
+		ES.delete_by_query(index=ES_INDEX_DIGEST, body={ "query": { "terms": { "author": name_hashes[i:i + MGET_BATCH_SIZE] } } })
+	ES.indices.refresh(index=ES_INDEX_DIGEST)
+
+'''
+	Names the co-authors who are not rebuilt by a delta update, from their indexed documents (or else from their best name
+	variant in the given publications).
+'''
+def coauthor_names(name_hashes, publis):
+	names = dict([(name_hash, doc["full_name"]) for name_hash, doc in fetch_author_documents(name_hashes).items()])
+	variants = { }
+	for _, publi in publis:
+		for author in publi["authors"]:
+			full_name, name_hash = author_name_hash(author)
+			if name_hash in name_hashes and name_hash not in names:
+				variants[name_hash] = better_name_variant(variants.get(name_hash), full_name)
+	names.update([(name_hash, format_name(full_name)) for name_hash, full_name in variants.items()])
+	return names
+
+'''
+	Updates the author index with the publications indexed or deleted since the given date.
+
+	The affected authors are those of the publications indexed since then (new ones, or re-parsed ones whose title or
+	authors may have changed), and those whose documents list a changed or deleted publication. Each of them is
+	aggregated again from all its publications still in the publication index, as in a full build (including its
+	MAX_COAUTHORS top co-authors, from the co-authorship graph of these publications), and its document written back
+	in bulk (or deleted if no publication is left).
+'''
+def index_authors_delta(checkpoint):
+	publis = list(yield_publis_since(checkpoint))
+	deleted = load_deleted_pub_ids(checkpoint)
+	print("Found {} publications indexed and {} deleted since {}".format(len(publis), len(deleted), checkpoint))
+	changed = set([pub_id for pub_id, _ in publis])
+	name_hashes = set()
+	for pub_id, publi in publis:
+		for author in publi["authors"]:
+			_, name_hash = author_name_hash(author)
+			if name_hash:
+				name_hashes.add(name_hash)
+	# Authors of the previous version of a publication may no longer be among its authors
+	name_hashes.update(fetch_authors_of_publis(changed | deleted))
+	docs = fetch_author_documents(name_hashes)
+	others = fetch_publications(set([t["pub_id"] for doc in docs.values() for t in doc["pub_ids"]]) - changed)
+	for name_hash in name_hashes:
+		AUTHOR_SPECIALTIES.pop(name_hash, None)
+	graph = new_coauthor_graph()
+	accs = aggregate_authors(publis + others, graph=graph, keep=name_hashes.__contains__)
+	for name_hash, doc in docs.items():
+		if name_hash in accs:
+			carry_images(accs[name_hash], doc)
+	with metrics.timer("coauthor_graph", len(accs)):
+		attach_top_coauthors(accs, graph, coauthor_names(set(graph.hashes) - set(accs), publis + others))
+	removed = list([name_hash for name_hash in docs if name_hash not in accs])
+	print("Updating {} existing authors, adding {} new authors, deleting {} authors".format(len(docs) - len(removed), len(accs) - len(docs) + len(removed), len(removed)))
+	if removed:
+		delete_authors(removed)
+	if BUILD_DIGESTS:
+		delete_digests(docs)
+	with metrics.timer("image_crawl", len(accs)):
+		crawl_images(accs)
+	index_author_documents(accs)
+
+def load_checkpoint():
+	try:
+		with open(AUTHOR_CHECKPOINT_FILE) as f:
+			return f.read().strip()
+	except FileNotFoundError:
+		return None
+
+def save_checkpoint(date):
+	with open(AUTHOR_CHECKPOINT_FILE, 'w') as f:
+		f.write(date.isoformat())
+
+FLAGS = ["RECREATE_INDEX", "SEARCH_BACKEND", "CRAWL_AUTHOR_PICS", "CRAWL_INST_LOGOS", "CHECK_FACE_PICTURES", "CHECK_INST_LOGO",
+	"AGGREGATE_IN_MEMORY", "DELTA_UPDATE", "AUTHOR_CHECKPOINT_FILE", "PUBLI_DELETIONS_FILE", "RESUMABLE_BUILD", "PUBLI_READERS",
+	"BUILD_CHECKPOINT_FILE", "BUILD_CHECKPOINT_INTERVAL", "AUTHOR_PARTITIONS", "PARTITION_DIR", "CANONICALIZE_INSTITUTIONS",
+	"USE_AUTHOR_ALIASES", "EXPAND_ACRONYMS", "IMAGE_BACKEND", "IMAGE_CACHE_FILE", "IMAGE_CRAWL_WORKERS", "IMAGE_VERIFY_WORKERS",
+	"WARM_LOGO_STORE", "MGET_BATCH_SIZE", "HASH_CHUNK_SIZE", "MAX_COAUTHORS", "MAX_GRAPH_PUBLI_AUTHORS", "BUILD_DIGESTS",
+	"DIGEST_PAGE_SIZE", "DIGEST_ABSTRACT_LENGTH", "METRICS_FILE", "METRICS_INTERVAL"]
+
+def parse_args():
+	parser = argparse.ArgumentParser(description="Builds the author index from the publication index")
+	cli.add_flag_options(parser, globals(), FLAGS)
+	parser.add_argument("--limit", type=int, default=0, help="Only aggregates the first publications scanned, without saving the checkpoint (in-memory build only)")
+	profiling.add_profile_options(parser, PROFILE_DIR)
+	return parser.parse_args()
+
+def main(limit=None):
+	run_date = datetime.now()
+	if CRAWL_INST_LOGOS and WARM_LOGO_STORE:
+		warm_logo_store()
+	if DELTA_UPDATE:
+		checkpoint = load_checkpoint()
+		if not checkpoint:
+			print("No checkpoint found in {}, a full author build is needed first".format(AUTHOR_CHECKPOINT_FILE))
+			return 1
+		index_authors_delta(checkpoint)
+		save_checkpoint(run_date)
+		return 0
 	if RECREATE_INDEX:
 		try:
 			ES.indices.delete(index=ES_INDEX_AUTHOR)
 			print("Re-creating index", ES_INDEX_AUTHOR)
 		except:
 			print("Creating index", ES_INDEX_AUTHOR)
-		ES.indices.create(index=ES_INDEX_AUTHOR, body=MAPPING_AUTHOR)
-	index_authors_from_publis()
+		ES.indices.create(index=ES_INDEX_AUTHOR, body=MAPPING_AUTHOR.resolve())
+		if BUILD_DIGESTS and ES.indices.exists(index=ES_INDEX_DIGEST):
+			ES.indices.delete(index=ES_INDEX_DIGEST)
+	if AGGREGATE_IN_MEMORY and limit:
+		# A build from a slice of the publications is not a checkpoint for delta updates
+		index_authors_in_memory(yield_publis(limit))
+	elif AGGREGATE_IN_MEMORY:
+		if AUTHOR_PARTITIONS > 1 and SEARCH_BACKEND.startswith('local'):
+			# The local backend keeps its indices in the memory of a single process
+			logging.warning("A partitioned build needs Elasticsearch, the authors are built in a single process")
+			index_authors_in_memory()
+		elif AUTHOR_PARTITIONS > 1:
+			index_authors_partitioned(AUTHOR_PARTITIONS)
+		elif RESUMABLE_BUILD:
+			run_date = index_authors_resumable(run_date)
+		else:
+			index_authors_in_memory()
+		save_checkpoint(run_date)
+	else:
+		index_authors_from_publis()
+	return 0
+
+if __name__ == "__main__":
+	args = parse_args()
+	cli.apply_flag_options(args, globals(), FLAGS)
+	metrics.start_reporting(METRICS_FILE, METRICS_INTERVAL)
+	with profiling.profiled(args):
+		status = main(args.limit)
+	metrics.stop_reporting()
+	sys.exit(status)
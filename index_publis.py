@@ -1,17 +1,58 @@
 #!/usr/bin/python3
-import re, io, glob, sys, logging
+import re, os, glob, sys, json, queue, hashlib, logging, argparse
 from datetime import datetime
 from pathlib import Path
 from collections import Counter
 from multiprocessing import Pool
-from elasticsearch import Elasticsearch
-from elasticsearch.helpers import parallel_bulk
+from elasticsearch.helpers import scan
+import publi_cache, local_search, bulk_sink, metrics, profiling, cli, lazy
+from redif_reader import lines
 
 logging.basicConfig(level=logging.WARNING)
 
 # Safety flag
 RECREATE_INDEX = True
 
+# Root directory of the ReDIF archives (one sub-directory per archive)
+REPEC_ROOT = './repec_data/data/'
+
+# Number of worker processes used to parse ReDIF files (the parsing is done in the main process if lower than 2)
+PARSE_WORKERS = 1
+
+# Number of ReDIF files handed at once to a parsing worker
+PARSE_CHUNK_FILES = 32
+
+# Maximum number of chunks of files being parsed or parsed but not yet indexed, per parsing worker (so that memory
+# stays bounded when indexing is slower than parsing)
+PARSE_CHUNKS_AHEAD = 2
+
+# If true, only the ReDIF files which are new or changed since the previous run (according to the manifest) are
+# parsed and indexed, and publications coming from removed files are deleted: the index is then never re-created
+INCREMENTAL = False
+
+# Manifest of the indexed ReDIF files (path, size, modification time and content hash), saved at the end of each run
+MANIFEST_FILE = 'publis_manifest.json'
+
+# Log of the publications deleted by incremental runs (run date and publication ID), from which delta updates of the
+# author index find the authors of deleted publications
+DELETIONS_FILE = 'publis_deletions'
+
+# If true, a full rebuild streams the publications from the parse cache (when there is one) instead of parsing the ReDIF
+# files, e.g. after a change of mapping or analyzer: otherwise the parsed publications are written to the cache
+USE_PARSE_CACHE = False
+
+# Directory of the parse cache
+PARSE_CACHE_DIR = 'parse_cache'
+
+# File to which the metrics of the run are exported periodically (Prometheus text format, or JSON if not ending with .prom)
+METRICS_FILE = 'metrics_publis.prom'
+
+# Interval in seconds between metrics exports and progress lines
+METRICS_INTERVAL = 10
+
+# Directory to which profiles are written (see profiling.py)
+PROFILE_DIR = 'profile_publis'
+
 ES_PORT = 9200
 
 ES_INDEX_PUBLI = 'publication_a'
@@ -39,6 +80,12 @@ MAPPING_PUBLI = {
             "keywords": { "type": "text" },
             # Publication date
             "creation_date": { "type": "text" },
+            # Path of the ReDIF file this publication was parsed from
+            "source_file": { "type": "keyword" },
+            # Publication ID (same as the document ID), on which the author build sorts and partitions its reads
+            "pub_id": { "type": "keyword" },
+            # Date of the run which indexed this publication (used to update the author index incrementally)
+            "indexed_at": { "type": "date" },
             # List of authors
             "authors":  { 
             	"type": "nested", 
@@ -54,32 +101,30 @@ MAPPING_PUBLI = {
 	}
 }
 
-ES = Elasticsearch()
+# Search backend: 'es' for the Elasticsearch cluster, 'local' or 'local:<directory>' for the in-process backend
+SEARCH_BACKEND = os.environ.get('ECONFAST_BACKEND', 'es')
 
-ENCODINGS = ['utf-8', 'utf-16-le']
+# Search client, created on first use
+ES = lazy.Lazy(lambda: local_search.create_client(SEARCH_BACKEND))
 
-def lines(f):
-	handle = None
-	for e in ENCODINGS:
-		if handle:
-			handle.close()
-			break
-		try:
-			handle = io.open(f, 'r', encoding=e)
-			for l in handle:
-				yield l.strip()
-		except:
-			logging.debug("Error opening file {} in {}".format(f, e), sys.exc_info()[0])
-
-JEL_CODEMAP_EN = { }
-JEL_CODEMAP_FR = { }
-for l in lines("./jel_map"):
-	cl = list([i.strip() for i in l.split("|")])
-	code = cl[1]
-	label_en = cl[0].replace("Other", "").replace("General", "").replace(":", "")
-	JEL_CODEMAP_EN[code] = label_en
-	label_fr = cl[2].replace("Autre", "").replace("Général", "").replace(":", "")
-	JEL_CODEMAP_FR[code] = label_fr
+'''
+	Returns the mappings from JEL code to English and French labels.
+'''
+def load_jel_codemaps():
+	codemap_en, codemap_fr = { }, { }
+	for l in lines("./jel_map"):
+		cl = list([i.strip() for i in l.split("|")])
+		code = cl[1]
+		label_en = cl[0].replace("Other", "").replace("General", "").replace(":", "")
+		codemap_en[code] = label_en
+		label_fr = cl[2].replace("Autre", "").replace("Général", "").replace(":", "")
+		codemap_fr[code] = label_fr
+	return codemap_en, codemap_fr
+
+JEL_CODEMAPS = lazy.Lazy(load_jel_codemaps)
+
+JEL_CODEMAP_EN = lazy.Lazy(lambda: JEL_CODEMAPS.resolve()[0])
+JEL_CODEMAP_FR = lazy.Lazy(lambda: JEL_CODEMAPS.resolve()[1])
 
 # RE_FIELD_VALUE = re.compile(r"([\w\-]+): (.+)")
 RE_FIELD_VALUE = re.compile(r"([^: ]+): ?(.+)")
@@ -96,6 +141,9 @@ AUTHOR_FIELDS = {
 
 INST_COUNTER = Counter()
 
+# Start of this indexing run, stored with each indexed publication
+RUN_DATE = datetime.now()
+
 def is_accepted_tpl(val):
 	return val in ["ReDIF-Article 1.0", "ReDIF-Paper 1.0"]
 	# return True
@@ -196,28 +244,229 @@ def parse_repec_file(f):
 			obj["authors"].append(grp)
 		yield obj
 
-def yield_bulk_items(d):
-	for f in glob.glob("{}/**/*.rdf".format(d)):
-		logging.debug("Processing file", f)
-		for obj in parse_repec_file(f):
+def count_institutions(obj, counter):
+	for author in obj["authors"]:
+		if "institution" in author:
+			counter[author["institution"]] += 1
+
+'''
+	Stable publication ID, derived from the source file and the rank of the publication within that file, 
+	so that re-indexing a file overwrites its publications.
+'''
+def publi_id(f, rank):
+	return hashlib.sha1("{}#{}".format(f, rank).encode('utf-8')).hexdigest()
+
+def yield_repec_files(p):
+	for d in Path(p).iterdir():
+		if d.is_dir():
+			print("Processing directory", d)
+			for f in glob.glob("{}/**/*.rdf".format(d)):
+				yield os.path.normpath(f)
+
+'''
+	Yields pairs (source file, list of parsed publications).
+'''
+def yield_parsed_files(files):
+	for f in files:
+		logging.debug("Processing file {}".format(f))
+		with metrics.timer("parse"):
+			publis = list(parse_repec_file(f))
+		metrics.count("publications", len(publis))
+		for obj in publis:
+			count_institutions(obj, INST_COUNTER)
+		yield f, publis
+
+'''
+	Parsing task run by a worker process: returns the publications parsed from a chunk of files, along with 
+	the partial institution counter for these publications and the worker's metrics.
+'''
+def parse_repec_files(files):
+	parsed, counter = [], Counter()
+	for f in files:
+		with metrics.timer("parse"):
+			publis = list(parse_repec_file(f))
+		metrics.count("publications", len(publis))
+		for obj in publis:
+			count_institutions(obj, counter)
+		parsed.append((f, publis))
+	return parsed, counter, metrics.METRICS.drain()
+
+def yield_file_chunks(files, size):
+	chunk = []
+	for f in files:
+		chunk.append(f)
+		if len(chunk) >= size:
+			yield chunk
+			chunk = []
+	if chunk:
+		yield chunk
+
+'''
+	Parses the ReDIF files across a pool of worker processes, and streams back the publications chunk by chunk 
+	while merging the workers' institution counters. At most max_pending chunks are submitted and not yet consumed,
+	a new chunk being submitted each time one is consumed.
+'''
+def yield_parsed_files_parallel(files, pool, max_pending):
+	chunks = yield_file_chunks(files, PARSE_CHUNK_FILES)
+	results = queue.Queue()
+	def submit():
+		chunk = next(chunks, None)
+		if chunk is None:
+			return 0
+		pool.apply_async(parse_repec_files, (chunk,), callback=results.put, error_callback=results.put)
+		return 1
+	pending = sum([submit() for _ in range(max_pending)])
+	while pending:
+		result = results.get()
+		if isinstance(result, BaseException):
+			raise result
+		pending += submit() - 1
+		parsed, counter, raw = result
+		metrics.METRICS.merge(raw)
+		metrics.gauge("parse_chunks_pending", pending)
+		INST_COUNTER.update(counter)
+		for f, publis in parsed:
+			yield f, publis
+
+'''
+	Yields the bulk actions for parsed publications, which are also written to the parse cache if one is given.
+'''
+def yield_bulk_items(parsed, cache=None):
+	for f, publis in parsed:
+		if cache:
+			cache.add(f, publis)
+		for rank, obj in enumerate(publis):
 			obj["_index"] = ES_INDEX_PUBLI
-			for author in obj["authors"]:
-				if "institution" in author:
-					INST_COUNTER[author["institution"]] += 1
+			obj["_id"] = obj["pub_id"] = publi_id(f, rank)
+			obj["source_file"] = f
+			obj["indexed_at"] = RUN_DATE
 			yield obj
 
-def parse_repec_root_bulk(p):
-	path = Path(p)
-	for f in path.iterdir():
-		if f.is_dir():
-			print("Processing directory", f)
-			for success, info in parallel_bulk(ES, yield_bulk_items(f)):
-				if not success:
-					logging.error('Failed to index a publication', info)
+def bulk_index(actions):
+	return bulk_sink.BulkSink(ES, "publications").run(actions)
+
+def index_repec_files(files, workers=PARSE_WORKERS, cache=None):
+	if isinstance(files, list):
+		metrics.set_total("parse", len(files))
+	if workers > 1:
+		with Pool(workers) as pool:
+			bulk_index(yield_bulk_items(yield_parsed_files_parallel(files, pool, PARSE_CHUNKS_AHEAD * workers), cache))
+	else:
+		bulk_index(yield_bulk_items(yield_parsed_files(files), cache))
+
+def parse_repec_root_bulk(p, workers=PARSE_WORKERS):
+	index_repec_files(yield_repec_files(p), workers)
+
+def yield_cached_files(d):
+	for f, publis in publi_cache.read_cache(d):
+		for obj in publis:
+			count_institutions(obj, INST_COUNTER)
+		yield f, publis
+
+'''
+	Indexes the publications from the parse cache, without reading any ReDIF file.
+'''
+def index_cached_publis(d=PARSE_CACHE_DIR):
+	print("Indexing publications from parse cache", d)
+	bulk_index(yield_bulk_items(yield_cached_files(d)))
+
+def load_manifest():
+	try:
+		with open(MANIFEST_FILE) as f:
+			return json.load(f)
+	except FileNotFoundError:
+		return { }
+
+def save_manifest(manifest):
+	tmp = MANIFEST_FILE + ".tmp"
+	with open(tmp, 'w') as f:
+		json.dump(manifest, f)
+	os.replace(tmp, MANIFEST_FILE)
+
+def file_digest(f):
+	h = hashlib.sha1()
+	with open(f, 'rb') as handle:
+		for block in iter(lambda: handle.read(1 << 20), b''):
+			h.update(block)
+	return h.hexdigest()
+
+'''
+	Compares the ReDIF files under the root directory with the previous manifest.
+
+	The content hash is only computed when the size or modification time has changed, so that a file which was
+	merely touched is not re-parsed. Returns the new manifest, the new or changed files and the removed files.
+'''
+def diff_manifest(p, old_manifest):
+	manifest, changed = { }, []
+	for f in yield_repec_files(p):
+		st = os.stat(f)
+		entry = old_manifest.get(f)
+		if entry and entry["size"] == st.st_size and entry["mtime"] == st.st_mtime:
+			manifest[f] = entry
+			continue
+		digest = file_digest(f)
+		manifest[f] = { "size": st.st_size, "mtime": st.st_mtime, "sha1": digest }
+		if not entry or entry["sha1"] != digest:
+			changed.append(f)
+	removed = list([f for f in old_manifest if f not in manifest])
+	return manifest, changed, removed
+
+DELETE_BATCH_FILES = 500
 
+'''
+	Deletes the publications of the given files, which are first appended to the deletions log.
+'''
+def delete_file_publis(files):
+	for i in range(0, len(files), DELETE_BATCH_FILES):
+		query = { "query": { "terms": { "source_file": files[i:i + DELETE_BATCH_FILES] } } }
+		with open(DELETIONS_FILE, 'a') as f:
+			for hit in scan(ES, scroll='10m', index=ES_INDEX_PUBLI, query=dict(query, _source=False)):
+				f.write("{}\t{}\n".format(RUN_DATE.isoformat(), hit["_id"]))
+		ES.delete_by_query(index=ES_INDEX_PUBLI, body=query)
+	ES.indices.refresh(index=ES_INDEX_PUBLI)
+
+'''
+	Re-indexes only the new or changed ReDIF files: the publications of changed and removed files are deleted first
+	(since a changed file may now contain fewer publications), then the changed files are parsed and upserted.
+'''
+def parse_repec_root_incremental(p, workers=PARSE_WORKERS):
+	old_manifest = load_manifest()
+	manifest, changed, removed = diff_manifest(p, old_manifest)
+	print("{} new or changed files, {} removed files".format(len(changed), len(removed)))
+	stale = list([f for f in changed if f in old_manifest]) + removed
+	if stale:
+		delete_file_publis(stale)
+	index_repec_files(changed, workers)
+	save_manifest(manifest)
+
+# If true, the most frequent affiliations are printed at the end of the run (see top_institutions)
 COMPUTE_TOP_INSTITUTIONS = False
 
-if __name__ == "__main__":
+FLAGS = ["RECREATE_INDEX", "SEARCH_BACKEND", "REPEC_ROOT", "PARSE_WORKERS", "PARSE_CHUNK_FILES", "PARSE_CHUNKS_AHEAD", "INCREMENTAL",
+	"MANIFEST_FILE", "DELETIONS_FILE", "USE_PARSE_CACHE", "PARSE_CACHE_DIR", "METRICS_FILE", "METRICS_INTERVAL", "COMPUTE_TOP_INSTITUTIONS"]
+
+'''
+	Returns a slice of the ReDIF files, in a stable order so that the same slice can be profiled again.
+'''
+def repec_files_slice(p, offset, limit):
+	files = sorted(yield_repec_files(p))
+	return files[offset:offset + limit if limit else None]
+
+def parse_args():
+	parser = argparse.ArgumentParser(description="Indexes the publications of the ReDIF files")
+	cli.add_flag_options(parser, globals(), FLAGS)
+	parser.add_argument("--limit", type=int, default=0, help="Only indexes this number of ReDIF files (without reading or saving the manifest)")
+	parser.add_argument("--offset", type=int, default=0, help="Skips this number of ReDIF files (with --limit)")
+	profiling.add_profile_options(parser, PROFILE_DIR)
+	return parser.parse_args()
+
+def main():
+	if INCREMENTAL:
+		if not ES.indices.exists(index=ES_INDEX_PUBLI):
+			print("Creating index", ES_INDEX_PUBLI)
+			ES.indices.create(index=ES_INDEX_PUBLI, body=MAPPING_PUBLI)
+		parse_repec_root_incremental(REPEC_ROOT, PARSE_WORKERS)
+		return
 	if RECREATE_INDEX:
 		try:
 			ES.indices.delete(index=ES_INDEX_PUBLI)
@@ -225,7 +474,36 @@ if __name__ == "__main__":
 		except:
 			print("Creating index", ES_INDEX_PUBLI)
 		ES.indices.create(index=ES_INDEX_PUBLI, body=MAPPING_PUBLI)
-	parse_repec_root_bulk("./repec_data/data/")
+		if USE_PARSE_CACHE and publi_cache.exists(PARSE_CACHE_DIR):
+			index_cached_publis(PARSE_CACHE_DIR)
+		else:
+			# The manifest is written after a full rebuild as well, so that the next run can be incremental
+			manifest, files, _ = diff_manifest(REPEC_ROOT, { })
+			if USE_PARSE_CACHE:
+				with publi_cache.CacheWriter(PARSE_CACHE_DIR) as cache:
+					index_repec_files(files, PARSE_WORKERS, cache=cache)
+			else:
+				index_repec_files(files, PARSE_WORKERS)
+			save_manifest(manifest)
+	else:
+		parse_repec_root_bulk(REPEC_ROOT, PARSE_WORKERS)
+
+if __name__ == "__main__":
+	args = parse_args()
+	cli.apply_flag_options(args, globals(), FLAGS)
+	if args.profile and PARSE_WORKERS > 1:
+		logging.warning("Only the main process is profiled, parsing workers are not")
+	metrics.start_reporting(METRICS_FILE, METRICS_INTERVAL)
+	with profiling.profiled(args):
+		if args.limit or args.offset:
+			if RECREATE_INDEX and not INCREMENTAL and ES.indices.exists(index=ES_INDEX_PUBLI):
+				ES.indices.delete(index=ES_INDEX_PUBLI)
+			if not ES.indices.exists(index=ES_INDEX_PUBLI):
+				ES.indices.create(index=ES_INDEX_PUBLI, body=MAPPING_PUBLI)
+			index_repec_files(repec_files_slice(REPEC_ROOT, args.offset, args.limit), PARSE_WORKERS)
+		else:
+			main()
+	metrics.stop_reporting()
 	if COMPUTE_TOP_INSTITUTIONS:
 		print("Most popular institutions")
 		for k, v in INST_COUNTER.most_common(10000):
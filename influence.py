@@ -0,0 +1,168 @@
+#!/usr/bin/python3
+import os, sys, json, time, argparse, logging
+import numpy as np
+from redif_reader import lines
+
+"""
+	Influence of authors, used to rank author search results.
+
+	Influence combines the number of publications with an abstract (because more valuable than the next), the
+	number of publications without an abstract, the number of specialties, whether the current affiliation is a
+	top institution, whether it has a logo to display, and whether a profile picture was found for the author,
+	the whole being multiplied for top authors. Weights are read from influence_weights.json, and scores are
+	computed in a single vectorized pass over all authors.
+
+	Usage: python3 influence.py [--dry-run] [--watch SECONDS]
+	Recomputes the influence of all authors in the author index and pushes it with partial bulk updates (only
+	for authors whose influence changed), e.g. after a change of weights, top_authors or top_institutions. With
+	--watch, keeps running and does it again whenever one of these files changes.
+"""
+
+INFLUENCE_WEIGHTS_FILE = 'influence_weights.json'
+
+TOP_AUTHORS_FILE = 'top_authors'
+
+TOP_INSTITUTIONS_FILE = 'top_institutions'
+
+DEFAULT_WEIGHTS = {
+	# Weight of log10(number of publications)
+	"publications": 40,
+	# Weight of log10(number of publications with an abstract)
+	"abstracts": 80,
+	# Cap on the above logarithms
+	"max_log_publications": 4,
+	# Score of a current affiliation which is (or is not) a top institution
+	"top_institution": 400,
+	"institution": 200,
+	# Bonus if the current affiliation has a logo
+	"logo": 100,
+	# Bonus if a profile picture was found
+	"picture": 150,
+	# Score per specialty, and cap on the number of specialties
+	"specialty": 50,
+	"max_specialties": 3,
+	# Factor applied to the score of top authors
+	"top_author_factor": 2
+}
+
+FEATURES = ["publications", "abstracts", "institution", "top_institution", "logo", "picture", "specialties", "top_author"]
+
+def load_weights(path=INFLUENCE_WEIGHTS_FILE):
+	weights = dict(DEFAULT_WEIGHTS)
+	try:
+		with open(path) as f:
+			weights.update(json.load(f))
+	except FileNotFoundError:
+		logging.warning("No influence weights file {}, using default weights".format(path))
+	return weights
+
+'''
+	Influence weights read from a file, which is read again when it was modified since, so that long-running
+	indexing processes pick up new weights without restarting.
+'''
+class Weights:
+	def __init__(self, path=INFLUENCE_WEIGHTS_FILE):
+		self.path = path
+		self.mtime = None
+		self.weights = None
+
+	def get(self):
+		mtime = os.path.getmtime(self.path) if os.path.exists(self.path) else None
+		if self.weights is None or mtime != self.mtime:
+			self.mtime = mtime
+			self.weights = load_weights(self.path)
+		return self.weights
+
+'''
+	Returns the name hashes of the top authors, mapped to their canonical author IDs if aliases are given (see
+	author_disambiguation.py).
+'''
+def load_top_authors(path=TOP_AUTHORS_FILE, aliases=None):
+	from author_names import hash_name
+	name_hashes = list([hash_name(l.split("|")[0].strip()) for l in lines(path) if "|" in l])
+	return set([aliases.get(h, h) if aliases else h for h in name_hashes])
+
+def load_top_institutions(path=TOP_INSTITUTIONS_FILE):
+	return set(lines(path))
+
+'''
+	Returns the influence features of an author, as a tuple aligned with FEATURES.
+'''
+def features(pub_count, abstracts, inst, has_logo, has_pic, specialty_count, name_hash, top_authors, top_insts):
+	return (pub_count, abstracts, 1 if inst else 0, 1 if inst and inst in top_insts else 0, 1 if inst and has_logo else 0,
+		1 if has_pic else 0, specialty_count, 1 if name_hash in top_authors else 0)
+
+'''
+	Returns the influence features of an author document.
+'''
+def document_features(doc, name_hash, top_authors, top_insts):
+	return features(len(doc.get("pub_ids", [])), doc.get("abstracts", 0), doc.get("current_institution"),
+		bool(doc.get("logo_urls")), bool(doc.get("pic_urls")), len(doc.get("specialties", [])), name_hash, top_authors, top_insts)
+
+'''
+	Computes the influence of many authors at once, from a list of feature tuples (or a 2D array with one row per
+	author). Returns an array of scores.
+'''
+def influence_scores(rows, weights):
+	m = np.asarray(rows, dtype=np.float64).reshape(-1, len(FEATURES))
+	f = dict([(name, m[:, i]) for i, name in enumerate(FEATURES)])
+	max_log = weights["max_log_publications"]
+	score_publi = weights["publications"] * np.minimum(np.log10(np.maximum(f["publications"], 1)), max_log)
+	score_publi += weights["abstracts"] * np.minimum(np.log10(np.maximum(f["abstracts"], 1)), max_log)
+	score_inst = f["institution"] * (np.where(f["top_institution"] > 0, weights["top_institution"], weights["institution"]) + weights["logo"] * f["logo"])
+	score_pic = weights["picture"] * f["picture"]
+	score_specs = weights["specialty"] * np.minimum(f["specialties"], weights["max_specialties"])
+	score = score_publi + score_inst + score_pic + score_specs
+	return score * np.where(f["top_author"] > 0, weights["top_author_factor"], 1)
+
+def influence_score(row, weights):
+	return float(influence_scores([row], weights)[0])
+
+INFLUENCE_SOURCE = ["pub_ids.pub_id", "abstracts", "current_institution", "logo_urls", "pic_urls", "specialties", "influence"]
+
+'''
+	Recomputes the influence of all authors of the index, and updates the authors whose influence changed.
+	Returns the number of authors and the number of updated authors.
+'''
+def update_influence(client, index, weights, top_authors, top_insts, dry_run=False):
+	from elasticsearch.helpers import scan
+	import bulk_sink
+	ids, rows, old = [], [], []
+	for hit in scan(client, scroll='60m', index=index, query={ "query": { "match_all": {} } }, _source=INFLUENCE_SOURCE):
+		ids.append(hit["_id"])
+		rows.append(document_features(hit["_source"], hit["_id"], top_authors, top_insts))
+		old.append(hit["_source"].get("influence", -1))
+	if not ids:
+		return 0, 0
+	scores = influence_scores(rows, weights)
+	changed = np.nonzero(np.abs(scores - np.asarray(old, dtype=np.float64)) > 1e-6)[0]
+	if not dry_run:
+		actions = ({ "_op_type": "update", "_index": index, "_id": ids[i], "doc": { "influence": float(scores[i]) } } for i in changed)
+		bulk_sink.BulkSink(client, "influence").run(actions)
+		client.indices.refresh(index=index)
+	return len(ids), len(changed)
+
+def watched_mtimes(paths):
+	return list([os.path.getmtime(p) if os.path.exists(p) else None for p in paths])
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Recomputes author influence and pushes it with partial updates")
+	parser.add_argument("--weights", default=INFLUENCE_WEIGHTS_FILE)
+	parser.add_argument("--dry-run", action="store_true", help="Only count the authors whose influence would change")
+	parser.add_argument("--watch", type=float, default=0, help="Polling interval in seconds of the weights and top files")
+	args = parser.parse_args()
+	import local_search, author_disambiguation
+	from index_authors import ES_INDEX_AUTHOR
+	client = local_search.create_client(os.environ.get('ECONFAST_BACKEND', 'es'))
+	paths = [args.weights, TOP_AUTHORS_FILE, TOP_INSTITUTIONS_FILE, author_disambiguation.AUTHOR_ALIASES_FILE]
+	mtimes = None
+	while True:
+		current = watched_mtimes(paths)
+		if current != mtimes:
+			mtimes = current
+			start = time.time()
+			total, updated = update_influence(client, ES_INDEX_AUTHOR, load_weights(args.weights), load_top_authors(aliases=author_disambiguation.load_aliases()), load_top_institutions(), args.dry_run)
+			print("{} authors, influence {} for {} of them ({:.1f} s)".format(total, "would change" if args.dry_run else "updated", updated, time.time() - start))
+		if not args.watch:
+			break
+		time.sleep(args.watch)
@@ -0,0 +1,125 @@
+import re
+from math import log
+from collections import defaultdict
+from redif_reader import lines
+from normalize_institutions import normalize_and_validate_tokens
+
+"""
+	Resolution of raw affiliations (free text from Author-Workplace-Name) to canonical institutions.
+
+	Canonical institutions are read from top_institutions and registered_institutions (in that order, so that
+	the names of top institutions prevail), and identified by their institution hash, i.e. the sorted set of
+	their normalized tokens (as computed by normalize_institutions.hash_institution). They are indexed in an
+	inverted token index, parenthesized acronyms being left out of their tokens. A raw affiliation is first
+	looked up by hash as a whole, then each of its comma-separated parts (the longest match winning, then the
+	last one, so that e.g. a university prevails over a preceding generic "Department of Economics"). Otherwise
+	its parts are matched in order against the candidates sharing one of their discriminant tokens (those found
+	in at most MAX_CANDIDATE_DF institutions), scored by the IDF-weighted share of the institution tokens they
+	contain.
+"""
+
+SOURCES = ["top_institutions", "registered_institutions"]
+
+# Tokens found in more institutions than that (university, institute...) do not produce candidates
+MAX_CANDIDATE_DF = 200
+
+# Minimum IDF-weighted share of an institution's tokens that an affiliation must contain to match it
+MIN_CONTAINMENT = 0.85
+
+# Minimum weight of a token, so that missing common tokens still count
+MIN_IDF = 1.0
+
+RE_SEGMENT_SEPARATOR = re.compile(r"[,;/()]| - ")
+
+RE_PARENTHESIZED = re.compile(r"\([^)]*\)")
+
+def institution_key(tokens):
+	return ' '.join(sorted(set(tokens)))
+
+class InstitutionResolver:
+	def __init__(self, names):
+		self.names = { }
+		self.tokens = { }
+		# Mapping from institution hash (of a name or of its variant without acronym) to institution ID
+		self.keys = { }
+		postings = defaultdict(list)
+		for name in names:
+			cid = institution_key(normalize_and_validate_tokens(name))
+			if not cid or cid in self.names:
+				continue
+			tokens = set(normalize_and_validate_tokens(RE_PARENTHESIZED.sub(' ', name))) or set(cid.split())
+			self.names[cid] = name
+			self.tokens[cid] = tokens
+			self.keys.setdefault(cid, cid)
+			self.keys.setdefault(institution_key(tokens), cid)
+			for t in tokens:
+				postings[t].append(cid)
+		self.postings = dict(postings)
+		n = max(1, len(self.names))
+		self.idfs = dict([(t, max(MIN_IDF, log(float(n) / len(p)))) for t, p in self.postings.items()])
+		self.max_idf = log(n) + 1
+		self.cache = { }
+
+	def __len__(self):
+		return len(self.names)
+
+	def idf(self, token):
+		return self.idfs.get(token, self.max_idf)
+
+	def name(self, cid):
+		return self.names.get(cid)
+
+	'''
+		Returns the best matching institution for a list of tokens as a pair (ID, score), or None.
+	'''
+	def match_tokens(self, tokens):
+		tokens = set(tokens)
+		candidates = set()
+		for t in tokens:
+			p = self.postings.get(t)
+			if p and len(p) <= MAX_CANDIDATE_DF:
+				candidates.update(p)
+		best = None
+		for cid in candidates:
+			inst_tokens = self.tokens[cid]
+			shared = sum([self.idf(t) for t in inst_tokens & tokens])
+			containment = shared / sum([self.idf(t) for t in inst_tokens])
+			if containment < MIN_CONTAINMENT:
+				continue
+			# Ties are broken by the weighted Jaccard similarity, then by ID for determinism
+			score = (containment, shared / sum([self.idf(t) for t in inst_tokens | tokens]), cid)
+			if best is None or score > best:
+				best = score
+		return (best[2], best[0]) if best else None
+
+	'''
+		Returns the ID of the canonical institution of a raw affiliation, or None if it can't be resolved.
+	'''
+	def resolve(self, raw):
+		if raw in self.cache:
+			return self.cache[raw]
+		cid = self.keys.get(institution_key(normalize_and_validate_tokens(raw)))
+		parts = list([tokens for tokens in [normalize_and_validate_tokens(s) for s in RE_SEGMENT_SEPARATOR.split(raw)] if tokens])
+		if cid is None:
+			exact = list([(len(tokens), i, self.keys[institution_key(tokens)]) for i, tokens in enumerate(parts) if institution_key(tokens) in self.keys])
+			if exact:
+				cid = max(exact)[2]
+		if cid is None:
+			# Parts are tried before the whole affiliation, in order (the institution usually precedes the city)
+			for tokens in parts + [normalize_and_validate_tokens(raw)]:
+				match = self.match_tokens(tokens)
+				if match:
+					cid = match[0]
+					break
+		self.cache[raw] = cid
+		return cid
+
+	'''
+		Returns the canonical name of a raw affiliation, or the affiliation itself if it can't be resolved.
+	'''
+	def canonical_name(self, raw):
+		cid = self.resolve(raw)
+		return self.names[cid] if cid else raw
+
+def load_resolver(sources=SOURCES):
+	return InstitutionResolver([l for f in sources for l in lines(f) if l])
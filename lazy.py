@@ -0,0 +1,60 @@
+import threading
+
+"""
+	Resources created on first use rather than at import time (search clients, lookup tables read from files...),
+	so that importing the indexers has no side effect and takes milliseconds, e.g. in tests, benchmarks and worker
+	processes which do not need all of them.
+"""
+
+'''
+	Proxy to a resource created by a factory on first use, to which attribute access, indexing, membership tests,
+	iteration and len() are forwarded. The resource can also be obtained with resolve(), or replaced with set().
+'''
+class Lazy:
+	def __init__(self, factory):
+		self.factory = factory
+		self.lock = threading.Lock()
+		self.value = None
+		self.created = False
+
+	def resolve(self):
+		if not self.created:
+			with self.lock:
+				if not self.created:
+					self.value = self.factory()
+					self.created = True
+		return self.value
+
+	def set(self, value):
+		with self.lock:
+			self.value = value
+			self.created = True
+
+	'''
+		Drops the resource, which is created again on next use.
+	'''
+	def reset(self):
+		with self.lock:
+			self.value = None
+			self.created = False
+
+	def __getattr__(self, name):
+		return getattr(self.resolve(), name)
+
+	def __getitem__(self, key):
+		return self.resolve()[key]
+
+	def __setitem__(self, key, value):
+		self.resolve()[key] = value
+
+	def __contains__(self, key):
+		return key in self.resolve()
+
+	def __iter__(self):
+		return iter(self.resolve())
+
+	def __len__(self):
+		return len(self.resolve())
+
+	def __repr__(self):
+		return "Lazy({})".format(repr(self.value) if self.created else getattr(self.factory, "__name__", "?"))
@@ -0,0 +1,587 @@
+import os, re, json, math, uuid, pickle, threading
+from collections import defaultdict, Counter
+from copy import deepcopy
+from types import SimpleNamespace
+from elasticsearch import Elasticsearch
+from elasticsearch.exceptions import NotFoundError, RequestError
+from elasticsearch.serializer import JSONSerializer
+
+"""
+	Pure-Python search backend which stands in for the Elasticsearch client, so that the indexing scripts can be
+	run, benchmarked and tested without a cluster.
+
+	It implements the subset of the client API used by index_publis and index_authors (including what the bulk
+	and scan helpers rely on), and the subset of the query DSL used by the server: an inverted index per text field
+	scored with BM25, match queries with boosts, operator and fuzziness, bool queries, ids, term(s) and range
+	filters (nested queries being evaluated on the flattened objects), sorting (e.g. by score then influence),
+	from/size, search_after and scrolling.
+"""
+
+BM25_K1 = 1.2
+
+BM25_B = 0.75
+
+RE_TOKEN = re.compile(r'\w+')
+
+# Number of sorted hit lists kept per index (e.g. one per reader paging through a range with search_after)
+SEARCH_CACHE_SIZE = 16
+
+def analyze(text):
+	return RE_TOKEN.findall(text.lower())
+
+def text_values(v):
+	if isinstance(v, str):
+		yield v
+	elif isinstance(v, list):
+		for i in v:
+			if isinstance(i, str):
+				yield i
+
+'''
+	Maximum number of edits allowed for a term with fuzziness 'auto' (as in Elasticsearch).
+'''
+def auto_edits(term, fuzziness):
+	if not fuzziness:
+		return 0
+	if str(fuzziness).lower().startswith('auto'):
+		return 0 if len(term) <= 2 else (1 if len(term) <= 5 else 2)
+	return int(fuzziness)
+
+def edit_distance(a, b, max_edits):
+	if abs(len(a) - len(b)) > max_edits:
+		return max_edits + 1
+	previous = list(range(len(b) + 1))
+	for i, ca in enumerate(a, 1):
+		current = [i]
+		for j, cb in enumerate(b, 1):
+			current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+		if min(current) > max_edits:
+			return max_edits + 1
+		previous = current
+	return previous[-1]
+
+'''
+	Returns the values of a field (a dotted path) in a document, arrays of objects being flattened as in Elasticsearch.
+'''
+def source_values(source, field):
+	values = [source]
+	for k in field.split('.'):
+		values = list([v[k] for v in flatten(values) if isinstance(v, dict) and k in v])
+	return flatten(values)
+
+def flatten(values):
+	flat = []
+	for v in values:
+		if isinstance(v, list):
+			flat.extend(v)
+		else:
+			flat.append(v)
+	return flat
+
+def compare(a, b):
+	return (a > b) - (a < b)
+
+def range_match(values, cond):
+	for v in values:
+		if v is None:
+			continue
+		try:
+			if "gte" in cond and compare(v, cond["gte"]) < 0: continue
+			if "gt" in cond and compare(v, cond["gt"]) <= 0: continue
+			if "lte" in cond and compare(v, cond["lte"]) > 0: continue
+			if "lt" in cond and compare(v, cond["lt"]) >= 0: continue
+		except TypeError:
+			continue
+		return True
+	return False
+
+class LocalIndex:
+	def __init__(self, name, body=None):
+		self.name = name
+		self.docs = { }
+		self.postings = defaultdict(lambda: defaultdict(dict))
+		self.lengths = defaultdict(dict)
+		self.cache = { }
+		self.unindexed = set()
+		properties = ((body or { }).get("mappings") or { }).get("properties", { })
+		for field, spec in properties.items():
+			if spec.get("index") is False or spec.get("enabled") is False or spec.get("type") in ["nested", "object", "keyword", "integer", "date"]:
+				self.unindexed.add(field)
+
+	def __getstate__(self):
+		state = dict(self.__dict__)
+		state["postings"] = dict([(f, dict(p)) for f, p in self.postings.items()])
+		state["lengths"] = dict(self.lengths)
+		state["cache"] = { }
+		return state
+
+	def __setstate__(self, state):
+		self.__dict__.update(state)
+		postings = defaultdict(lambda: defaultdict(dict))
+		for f, p in state["postings"].items():
+			postings[f].update(p)
+		self.postings = postings
+		self.lengths = defaultdict(dict, state["lengths"])
+		self.cache = { }
+
+	def put(self, doc_id, source):
+		self.remove(doc_id)
+		if self.cache:
+			self.cache.clear()
+		self.docs[doc_id] = source
+		for field, v in source.items():
+			if field in self.unindexed:
+				continue
+			tokens = list([t for s in text_values(v) for t in analyze(s)])
+			if not tokens:
+				continue
+			self.lengths[field][doc_id] = len(tokens)
+			for term, tf in Counter(tokens).items():
+				self.postings[field][term][doc_id] = tf
+
+	def remove(self, doc_id):
+		source = self.docs.pop(doc_id, None)
+		if source is None:
+			return
+		if self.cache:
+			self.cache.clear()
+		for field, v in source.items():
+			if doc_id not in self.lengths.get(field, { }):
+				continue
+			del self.lengths[field][doc_id]
+			for term in set([t for s in text_values(v) for t in analyze(s)]):
+				postings = self.postings[field][term]
+				postings.pop(doc_id, None)
+				if not postings:
+					del self.postings[field][term]
+
+	def expand_term(self, field, term, fuzziness):
+		max_edits = auto_edits(term, fuzziness)
+		if max_edits == 0:
+			return [(term, 1.0)] if term in self.postings[field] else []
+		expansions = []
+		for other in self.postings[field]:
+			d = edit_distance(term, other, max_edits)
+			if d <= max_edits:
+				expansions.append((other, 1.0 - float(d) / max(len(term), len(other))))
+		return expansions
+
+	'''
+		BM25 scores of a match query on a field, as a mapping from document ID to score.
+	'''
+	def match(self, field, spec):
+		if not isinstance(spec, dict):
+			spec = { "query": spec }
+		terms = analyze(str(spec["query"]))
+		boost = spec.get("boost", 1.0)
+		operator = spec.get("operator", "or").lower()
+		lengths = self.lengths.get(field, { })
+		if not terms or not lengths:
+			return { }
+		avgdl = float(sum(lengths.values())) / len(lengths)
+		scores, matched = defaultdict(float), Counter()
+		for term in terms:
+			term_scores = { }
+			for other, similarity in self.expand_term(field, term, spec.get("fuzziness")):
+				postings = self.postings[field][other]
+				idf = math.log(1 + (len(lengths) - len(postings) + 0.5) / (len(postings) + 0.5))
+				for doc_id, tf in postings.items():
+					norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / avgdl)
+					s = similarity * idf * tf * (BM25_K1 + 1) / norm
+					if s > term_scores.get(doc_id, 0.0):
+						term_scores[doc_id] = s
+			for doc_id, s in term_scores.items():
+				scores[doc_id] += boost * s
+				matched[doc_id] += 1
+		if operator == "and":
+			return dict([(doc_id, s) for doc_id, s in scores.items() if matched[doc_id] == len(terms)])
+		return dict(scores)
+
+	'''
+		Evaluates a query, returning a mapping from matching document ID to score.
+	'''
+	def evaluate(self, query):
+		if not query or "match_all" in query:
+			return dict.fromkeys(self.docs, 1.0)
+		if "match" in query:
+			field, spec = next(iter(query["match"].items()))
+			return self.match(field, spec)
+		if "ids" in query:
+			return dict([(i, 1.0) for i in query["ids"]["values"] if i in self.docs])
+		if "term" in query or "terms" in query:
+			field, expected = next(iter((query.get("term") or query.get("terms")).items()))
+			if isinstance(expected, dict):
+				expected = expected["value"]
+			expected = set(expected if isinstance(expected, list) else [expected])
+			if field == "_id":
+				return dict([(doc_id, 1.0) for doc_id in expected if doc_id in self.docs])
+			return dict([(doc_id, 1.0) for doc_id, source in self.docs.items() if any([v in expected for v in source_values(source, field) if not isinstance(v, (dict, list))])])
+		if "range" in query:
+			field, cond = next(iter(query["range"].items()))
+			return dict([(doc_id, 1.0) for doc_id, source in self.docs.items() if range_match(source_values(source, field), cond)])
+		if "bool" in query:
+			return self.evaluate_bool(query["bool"])
+		if "nested" in query:
+			return self.evaluate(query["nested"]["query"])
+		raise RequestError(400, "parsing_exception", "Unsupported query in local backend: {}".format(list(query.keys())))
+
+	def evaluate_bool(self, q):
+		def clauses(key):
+			c = q.get(key, [])
+			return c if isinstance(c, list) else [c]
+		candidates, scores = None, defaultdict(float)
+		for key in ["must", "filter"]:
+			for clause in clauses(key):
+				result = self.evaluate(clause)
+				candidates = set(result) if candidates is None else candidates & set(result)
+				if key == "must":
+					for doc_id, s in result.items():
+						scores[doc_id] += s
+		should = clauses("should")
+		if should:
+			minimum = q.get("minimum_should_match", 0 if candidates is not None else 1)
+			matched = Counter()
+			for clause in should:
+				for doc_id, s in self.evaluate(clause).items():
+					scores[doc_id] += s
+					matched[doc_id] += 1
+			if minimum > 0:
+				should_ok = set([doc_id for doc_id, c in matched.items() if c >= minimum])
+				candidates = should_ok if candidates is None else candidates & should_ok
+		if candidates is None:
+			candidates = set(self.docs)
+		for clause in clauses("must_not"):
+			candidates -= set(self.evaluate(clause))
+		return dict([(doc_id, scores.get(doc_id, 0.0)) for doc_id in candidates])
+
+	def sort_values(self, doc_id, score, sort):
+		values = []
+		for s in sort:
+			field, order = (s, "desc" if s == "_score" else "asc") if isinstance(s, str) else next(iter(s.items()))
+			if isinstance(order, dict):
+				order = order.get("order", "asc")
+			if field == "_score":
+				v = score
+			elif field == "_id":
+				v = doc_id
+			elif field == "_doc":
+				v = 0
+			else:
+				vs = source_values(self.docs[doc_id], field)
+				v = vs[0] if vs else None
+			values.append((v, order))
+		return values
+
+	'''
+		Returns the hits of a search as a triple (sorted hits, position of the first hit after search_after, maximum score of
+		the hits), hits being tuples (ID, score, sort values, source). Sources are the stored documents themselves, which are replaced and never modified
+		in place: the caller copies only the page it returns, and the hits of a scroll keep the state of the search.
+
+		The sorted hits of a query are cached until the index changes, so that paging through them with search_after finds
+		each page by binary search instead of scoring and sorting all the matches again.
+	'''
+	def search(self, body):
+		body = body or { }
+		sort = body.get("sort", ["_score"])
+		sort = sort if isinstance(sort, list) else [sort]
+		key = json.dumps([body.get("query"), sort, body.get("slice")], sort_keys=True, default=str)
+		if key not in self.cache:
+			hits = self.sorted_hits(body.get("query"), sort, body.get("slice"))
+			if len(self.cache) >= SEARCH_CACHE_SIZE:
+				self.cache.pop(next(iter(self.cache)))
+			self.cache[key] = (hits, max([h[1] for h in hits]) if hits else None)
+		hits, max_score = self.cache[key]
+		return hits, first_after(hits, body["search_after"]) if "search_after" in body else 0, max_score
+
+	def sorted_hits(self, query, sort, sl):
+		scores = self.evaluate(query)
+		hits = list([(doc_id, score, self.sort_values(doc_id, score, sort), self.docs[doc_id]) for doc_id, score in scores.items()])
+		for i in reversed(range(len(sort))):
+			reverse = hits[0][2][i][1] == "desc" if hits else False
+			present = [h for h in hits if h[2][i][0] is not None]
+			missing = [h for h in hits if h[2][i][0] is None]
+			hits = sorted(present, key=lambda h: h[2][i][0], reverse=reverse) + missing
+		if sl:
+			hits = list([h for h in hits if hash_slice(h[0], sl["max"]) == sl["id"]])
+		return hits
+
+'''
+	Whether sort values come after the search_after values, documents missing a sort value being sorted last.
+'''
+def is_after(values, after):
+	for (v, order), a in zip(values, after):
+		if v is None or a is None:
+			if (v is None) != (a is None):
+				return v is None
+			continue
+		c = compare(v, a)
+		if c != 0:
+			return c > 0 if order == "asc" else c < 0
+	return False
+
+'''
+	Position of the first of the sorted hits which comes after the search_after values, found by binary search.
+'''
+def first_after(hits, after):
+	lo, hi = 0, len(hits)
+	while lo < hi:
+		mid = (lo + hi) // 2
+		if is_after(hits[mid][2], after):
+			hi = mid
+		else:
+			lo = mid + 1
+	return lo
+
+'''
+	Builds the response hits of a page of sorted hits, with copies of their sources.
+'''
+def hit_documents(index, hits):
+	return list([{
+		"_index": index,
+		"_id": doc_id,
+		"_score": score,
+		"_source": deepcopy(source),
+		"sort": list([v for v, _ in values]) } for doc_id, score, values, source in hits])
+
+def hash_slice(doc_id, n):
+	return sum(doc_id.encode('utf-8')) % n
+
+class LocalIndices:
+	def __init__(self, client):
+		self.client = client
+
+	def create(self, index, body=None, **kwargs):
+		with self.client.lock:
+			if index in self.client.data:
+				raise RequestError(400, "resource_already_exists_exception", "index [{}] already exists".format(index))
+			self.client.data[index] = LocalIndex(index, body)
+		return { "acknowledged": True, "index": index }
+
+	def delete(self, index, **kwargs):
+		with self.client.lock:
+			if index not in self.client.data:
+				raise NotFoundError(404, "index_not_found_exception", "no such index [{}]".format(index))
+			del self.client.data[index]
+			self.client.drop(index)
+		return { "acknowledged": True }
+
+	def exists(self, index, **kwargs):
+		return index in self.client.data
+
+	def refresh(self, index=None, **kwargs):
+		self.client.persist(index)
+		return { "_shards": { "total": 1, "successful": 1, "failed": 0 } }
+
+class LocalSearch:
+	'''
+		In-process replacement for the Elasticsearch client. If a directory is given, each index is saved to it on
+		refresh and loaded back when the client is created, so that successive scripts can share their indices.
+	'''
+	def __init__(self, directory=None):
+		self.directory = directory
+		self.data = { }
+		self.scrolls = { }
+		self.lock = threading.RLock()
+		self.serializer = JSONSerializer()
+		self.transport = SimpleNamespace(serializer=self.serializer)
+		self.indices = LocalIndices(self)
+		if directory:
+			os.makedirs(directory, exist_ok=True)
+			for f in os.listdir(directory):
+				if f.endswith(".index"):
+					with open(os.path.join(directory, f), 'rb') as handle:
+						index = pickle.load(handle)
+						self.data[index.name] = index
+
+	def persist(self, index=None):
+		if not self.directory:
+			return
+		with self.lock:
+			for name in ([index] if index else list(self.data)):
+				if name in self.data:
+					with open(os.path.join(self.directory, name + ".index"), 'wb') as handle:
+						pickle.dump(self.data[name], handle)
+
+	def drop(self, index):
+		if self.directory and os.path.exists(os.path.join(self.directory, index + ".index")):
+			os.remove(os.path.join(self.directory, index + ".index"))
+
+	def get_index(self, index, create=False):
+		if index not in self.data:
+			if not create:
+				raise NotFoundError(404, "index_not_found_exception", "no such index [{}]".format(index))
+			self.data[index] = LocalIndex(index)
+		return self.data[index]
+
+	'''
+		Documents go through JSON serialization, as they would when sent to Elasticsearch (e.g. dates become strings).
+	'''
+	def normalize(self, body):
+		return json.loads(self.serializer.dumps(body))
+
+	def index(self, index, body, id=None, **kwargs):
+		with self.lock:
+			doc_id = id if id is not None else uuid.uuid4().hex
+			result = "updated" if doc_id in self.get_index(index, True).docs else "created"
+			self.data[index].put(doc_id, self.normalize(body))
+		return { "_index": index, "_id": doc_id, "result": result }
+
+	def get(self, index, id, **kwargs):
+		with self.lock:
+			idx = self.get_index(index)
+			if id not in idx.docs:
+				raise NotFoundError(404, "not_found", { "_index": index, "_id": id, "found": False })
+			return { "_index": index, "_id": id, "found": True, "_source": deepcopy(idx.docs[id]) }
+
+	def mget(self, body, index=None, **kwargs):
+		with self.lock:
+			idx = self.get_index(index)
+			return { "docs": list([
+				{ "_index": index, "_id": i, "found": True, "_source": deepcopy(idx.docs[i]) } if i in idx.docs
+				else { "_index": index, "_id": i, "found": False } for i in body["ids"]]) }
+
+	def update(self, index, id, body, **kwargs):
+		with self.lock:
+			idx = self.get_index(index)
+			if id not in idx.docs:
+				if not body.get("doc_as_upsert"):
+					raise NotFoundError(404, "document_missing_exception", { "_index": index, "_id": id })
+				source = { }
+			else:
+				source = deepcopy(idx.docs[id])
+			source.update(self.normalize(body["doc"]))
+			idx.put(id, source)
+		return { "_index": index, "_id": id, "result": "updated" }
+
+	def delete(self, index, id, **kwargs):
+		with self.lock:
+			idx = self.get_index(index)
+			if id not in idx.docs:
+				raise NotFoundError(404, "not_found", { "_index": index, "_id": id })
+			idx.remove(id)
+		return { "_index": index, "_id": id, "result": "deleted" }
+
+	def delete_by_query(self, index, body, **kwargs):
+		with self.lock:
+			idx = self.get_index(index)
+			ids = list(idx.evaluate(body.get("query")))
+			for doc_id in ids:
+				idx.remove(doc_id)
+		return { "deleted": len(ids) }
+
+	def count(self, index, body=None, **kwargs):
+		with self.lock:
+			return { "count": len(self.get_index(index).evaluate((body or { }).get("query"))) }
+
+	'''
+		Bulk API, accepting either the NDJSON body sent by the bulk helpers or a list of action and source dicts.
+	'''
+	def bulk(self, body, index=None, **kwargs):
+		if isinstance(body, (str, bytes)):
+			if isinstance(body, bytes):
+				body = body.decode('utf-8')
+			body = list([json.loads(l) for l in body.split("\n") if l.strip()])
+		items, errors, i = [], False, 0
+		with self.lock:
+			while i < len(body):
+				op_type, meta = next(iter(body[i].items()))
+				i += 1
+				target = meta.get("_index", index)
+				doc_id = meta.get("_id")
+				try:
+					if op_type in ["index", "create"]:
+						source = body[i]
+						i += 1
+						if op_type == "create" and doc_id in self.get_index(target, True).docs:
+							raise RequestError(409, "version_conflict_engine_exception", "document already exists")
+						resp = self.index(target, source, id=doc_id)
+						status = 201 if resp["result"] == "created" else 200
+						doc_id = resp["_id"]
+					elif op_type == "update":
+						source = body[i]
+						i += 1
+						self.update(target, doc_id, source)
+						status = 200
+					elif op_type == "delete":
+						self.delete(target, doc_id)
+						status = 200
+					else:
+						raise RequestError(400, "illegal_argument_exception", "Unknown bulk operation {}".format(op_type))
+					items.append({ op_type: { "_index": target, "_id": doc_id, "status": status } })
+				except (NotFoundError, RequestError) as e:
+					errors = True
+					items.append({ op_type: { "_index": target, "_id": doc_id, "status": e.status_code, "error": e.error } })
+		return { "took": 0, "errors": errors, "items": items }
+
+	def search(self, body=None, index=None, scroll=None, size=None, from_=None, **kwargs):
+		body = dict(body or { })
+		with self.lock:
+			hits, first, max_score = self.get_index(index).search(body)
+		start = first + (from_ if from_ is not None else body.get("from", 0))
+		size = size if size is not None else body.get("size", 10)
+		resp = {
+			"took": 0,
+			"timed_out": False,
+			"_shards": { "total": 1, "successful": 1, "skipped": 0, "failed": 0 },
+			"hits": {
+				"total": { "value": len(hits) - first, "relation": "eq" },
+				"max_score": max_score,
+				"hits": hit_documents(index, hits[start:start + size])
+			}
+		}
+		if scroll:
+			scroll_id = uuid.uuid4().hex
+			self.scrolls[scroll_id] = (index, hits, start + size, size)
+			resp["_scroll_id"] = scroll_id
+		return resp
+
+	def scroll(self, body=None, scroll_id=None, **kwargs):
+		scroll_id = scroll_id or body["scroll_id"]
+		if scroll_id not in self.scrolls:
+			raise NotFoundError(404, "search_context_missing_exception", "No search context found for id [{}]".format(scroll_id))
+		index, hits, position, size = self.scrolls[scroll_id]
+		self.scrolls[scroll_id] = (index, hits, position + size, size)
+		return {
+			"_scroll_id": scroll_id,
+			"_shards": { "total": 1, "successful": 1, "skipped": 0, "failed": 0 },
+			"hits": { "total": { "value": len(hits), "relation": "eq" }, "hits": hit_documents(index, hits[position:position + size]) }
+		}
+
+	def clear_scroll(self, body=None, scroll_id=None, **kwargs):
+		ids = scroll_id or (body or { }).get("scroll_id", [])
+		for i in (ids if isinstance(ids, list) else [ids]):
+			self.scrolls.pop(i, None)
+		return { "succeeded": True }
+
+'''
+	Creates the search client for the given backend: 'es' for the Elasticsearch cluster, 'local' for an in-memory
+	backend, or 'local:<directory>' for a local backend saved to that directory.
+'''
+def create_client(backend='es'):
+	if backend.startswith('local'):
+		return LocalSearch(backend.split(':', 1)[1] if ':' in backend else None)
+	return Elasticsearch()
+
+'''
+	Query used by the server to search authors (see server/search.js).
+'''
+def author_query(term, offset=0):
+	return {
+		"from": offset,
+		"sort": [
+			"_score",
+			{ "influence": "desc" }
+		],
+		"query": {
+			"bool": {
+				"should": [
+					{ "match": { "full_name": { "query": term, "boost": 64, "operator": "and", "fuzziness": "auto" } } },
+					{ "match": { "institutions": { "query": term, "boost": 32, "operator": "and", "fuzziness": "auto" } } },
+					{ "match": { "jel-labels-fr": { "query": term, "boost": 8, "operator": "and" } } },
+					{ "match": { "jel-labels-en": { "query": term, "boost": 8, "operator": "and" } } },
+					{ "match": { "keywords": { "query": term, "boost": 8, "operator": "and" } } },
+					{ "match": { "titles": { "query": term, "boost": 4, "operator": "and", "fuzziness": "auto" } } }
+				]
+			}
+		}
+	}
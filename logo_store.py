@@ -0,0 +1,75 @@
+import json, time, sqlite3, threading
+from functools import lru_cache
+import normalize_institutions
+
+"""
+	Persistent store of institution logos, keyed by institution hash (see normalize_institutions.hash_institution).
+
+	The whole store is loaded in memory when opened, so that a logo lookup in the author indexing loop is a dict
+	lookup. Entries record when the logo search was done, and are considered stale after LOGO_MAX_AGE_DAYS, or
+	after EMPTY_LOGO_MAX_AGE_DAYS for institutions for which no logo was found.
+"""
+
+LOGO_MAX_AGE_DAYS = 180
+
+EMPTY_LOGO_MAX_AGE_DAYS = 14
+
+DAY_SECONDS = 24 * 3600
+
+@lru_cache(maxsize=1 << 16)
+def institution_hash(inst):
+	return normalize_institutions.hash_institution(inst)
+
+class LogoStore:
+	def __init__(self, path):
+		self.lock = threading.Lock()
+		self.db = sqlite3.connect(path, check_same_thread=False)
+		self.db.execute("CREATE TABLE IF NOT EXISTS logos (hash TEXT PRIMARY KEY, institution TEXT, urls TEXT NOT NULL, checked REAL NOT NULL)")
+		self.db.commit()
+		self.logos = dict([(h, (json.loads(urls), checked)) for h, urls, checked in self.db.execute("SELECT hash, urls, checked FROM logos")])
+
+	def __len__(self):
+		return len(self.logos)
+
+	'''
+		Returns the logo URLs of an institution (possibly empty), or None if no logo search was done for it.
+	'''
+	def get(self, inst):
+		entry = self.logos.get(institution_hash(inst))
+		return entry[0] if entry else None
+
+	def is_stale(self, inst, now=None):
+		entry = self.logos.get(institution_hash(inst))
+		if entry is None:
+			return True
+		urls, checked = entry
+		max_age = LOGO_MAX_AGE_DAYS if urls else EMPTY_LOGO_MAX_AGE_DAYS
+		return (now or time.time()) - checked > max_age * DAY_SECONDS
+
+	'''
+		Returns the institutions (one per institution hash) whose logo is missing or stale.
+	'''
+	def stale(self, institutions):
+		now = time.time()
+		todo = dict()
+		for inst in institutions:
+			h = institution_hash(inst)
+			if h and h not in todo and self.is_stale(inst, now):
+				todo[h] = inst
+		return list(todo.values())
+
+	'''
+		Stores the logos found for institutions, given as pairs (institution, logo URLs).
+	'''
+	def put_all(self, entries):
+		now = time.time()
+		entries = list([(institution_hash(inst), inst, urls) for inst, urls in entries if institution_hash(inst)])
+		with self.lock:
+			self.db.executemany("INSERT OR REPLACE INTO logos VALUES (?, ?, ?, ?)", [(h, inst, json.dumps(urls), now) for h, inst, urls in entries])
+			self.db.commit()
+			for h, _, urls in entries:
+				self.logos[h] = (urls, now)
+
+	def close(self):
+		with self.lock:
+			self.db.close()
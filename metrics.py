@@ -0,0 +1,231 @@
+import os, sys, json, time, threading
+from contextlib import contextmanager
+
+"""
+	Lightweight instrumentation of the indexers: per-stage timers (time spent, calls and items processed, hence
+	rates), counters, gauges (e.g. queue depths) and expected totals (hence an ETA).
+
+	Stages may nest (e.g. "read" and "decode" are part of "parse"), so that their times do not add up. Worker
+	processes drain their own metrics and send them back with their results, to be merged in the main process.
+	While a run is reported (see start_reporting), metrics are exported periodically to a Prometheus text file
+	(if the path ends with .prom) or a JSON file, and a progress line is printed with the ETA of the stage whose
+	total is known.
+"""
+
+# Interval in seconds between exports and progress lines
+REPORT_INTERVAL = 10
+
+# Objects notified with enter(stage) and exit(stage) around each timed call of a stage (see profiling.py)
+STAGE_HOOKS = []
+
+class Metrics:
+	def __init__(self):
+		self.lock = threading.Lock()
+		self.start = time.time()
+		self.job = os.path.splitext(os.path.basename(sys.argv[0]))[0].strip("-") or "econfast"
+		self.reset()
+
+	def reset(self):
+		# Mapping from stage to [seconds, calls, items]
+		self.stages = { }
+		# Mapping from stage to the time it started, from which its ETA is computed
+		self.started = { }
+		self.counters = { }
+		self.gauges = { }
+		self.totals = { }
+
+	def add(self, stage, seconds, items=1, calls=1):
+		with self.lock:
+			s = self.stages.get(stage)
+			if s is None:
+				s = self.stages[stage] = [0.0, 0, 0]
+				self.started.setdefault(stage, time.time() - seconds)
+			s[0] += seconds
+			s[1] += calls
+			s[2] += items
+
+	'''
+		Times a block of code as a call of a stage, processing the given number of items.
+	'''
+	@contextmanager
+	def timer(self, stage, items=1):
+		for hook in STAGE_HOOKS:
+			hook.enter(stage)
+		start = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.add(stage, time.perf_counter() - start, items)
+			for hook in STAGE_HOOKS:
+				hook.exit(stage)
+
+	'''
+		Iterates over an iterable, timing each step as a call of a stage (e.g. waiting for the hits of a scroll).
+	'''
+	def timed_iter(self, stage, iterable):
+		it = iter(iterable)
+		while True:
+			for hook in STAGE_HOOKS:
+				hook.enter(stage)
+			start = time.perf_counter()
+			try:
+				item = next(it)
+			except StopIteration:
+				self.add(stage, time.perf_counter() - start, 0, 0)
+				return
+			finally:
+				for hook in STAGE_HOOKS:
+					hook.exit(stage)
+			self.add(stage, time.perf_counter() - start)
+			yield item
+
+	def count(self, name, n=1):
+		with self.lock:
+			self.counters[name] = self.counters.get(name, 0) + n
+
+	def gauge(self, name, value):
+		with self.lock:
+			self.gauges[name] = value
+
+	'''
+		Sets the expected number of items of a stage, from which its ETA is computed.
+	'''
+	def set_total(self, stage, total):
+		with self.lock:
+			self.totals[stage] = total
+
+	'''
+		Returns the raw metrics of this process and resets them (used by worker processes).
+	'''
+	def drain(self):
+		with self.lock:
+			raw = { "stages": self.stages, "counters": self.counters }
+			self.stages, self.counters = { }, { }
+		return raw
+
+	def merge(self, raw):
+		for stage, (seconds, calls, items) in raw["stages"].items():
+			self.add(stage, seconds, items, calls)
+		for name, n in raw["counters"].items():
+			self.count(name, n)
+
+	def snapshot(self):
+		with self.lock:
+			now = time.time()
+			uptime = now - self.start
+			return {
+				"job": self.job,
+				"uptime": round(uptime, 3),
+				"stages": dict([(stage, {
+					"seconds": round(seconds, 6),
+					"calls": calls,
+					"items": items,
+					"items_per_second": round(items / seconds, 3) if seconds > 0 else None,
+					"total": self.totals.get(stage),
+					"elapsed": round(now - self.started.get(stage, self.start), 3)
+				}) for stage, (seconds, calls, items) in self.stages.items()]),
+				"counters": dict(self.counters),
+				"gauges": dict(self.gauges)
+			}
+
+	def prometheus(self):
+		snap = self.snapshot()
+		job = snap["job"]
+		out = []
+		def metric(name, kind, help, samples):
+			out.append("# HELP econfast_{} {}".format(name, help))
+			out.append("# TYPE econfast_{} {}".format(name, kind))
+			for labels, value in samples:
+				out.append("econfast_{}{{{}}} {}".format(name, ",".join(['job="{}"'.format(job)] + ['{}="{}"'.format(k, v) for k, v in labels]), value))
+		stages = sorted(snap["stages"].items())
+		metric("stage_seconds_total", "counter", "Time spent in each stage", [([("stage", s)], d["seconds"]) for s, d in stages])
+		metric("stage_calls_total", "counter", "Calls of each stage", [([("stage", s)], d["calls"]) for s, d in stages])
+		metric("stage_items_total", "counter", "Items processed by each stage", [([("stage", s)], d["items"]) for s, d in stages])
+		metric("stage_expected_items", "gauge", "Expected number of items of each stage", [([("stage", s)], d["total"]) for s, d in stages if d["total"] is not None])
+		metric("events_total", "counter", "Counters", [([("name", n)], v) for n, v in sorted(snap["counters"].items())])
+		metric("gauge", "gauge", "Gauges (e.g. queue depths)", [([("name", n)], v) for n, v in sorted(snap["gauges"].items())])
+		metric("uptime_seconds", "gauge", "Time since the start of the run", [([], snap["uptime"])])
+		return "\n".join(out) + "\n"
+
+	def export(self, path):
+		tmp = path + ".tmp"
+		with open(tmp, 'w') as f:
+			if path.endswith(".prom"):
+				f.write(self.prometheus())
+			else:
+				json.dump(self.snapshot(), f, indent=1)
+		os.replace(tmp, path)
+
+	'''
+		Returns the progress line: rates of the busiest stages, and progress and ETA of the stages with a total.
+	'''
+	def progress_line(self):
+		snap = self.snapshot()
+		parts = []
+		for stage, d in snap["stages"].items():
+			if d["total"]:
+				rate = d["items"] / d["elapsed"] if d["elapsed"] > 0 else 0
+				eta = (d["total"] - d["items"]) / rate if rate > 0 else None
+				parts.append("{} {}/{} ({:.0f}%, ETA {})".format(stage, d["items"], d["total"], 100.0 * d["items"] / d["total"], format_duration(eta)))
+		busiest = sorted([s for s in snap["stages"].items() if not s[1]["total"]], key=lambda s: -s[1]["seconds"])[:4]
+		parts.extend(["{} {:.1f}s {:.0f}/s".format(stage, d["seconds"], d["items_per_second"] or 0) for stage, d in busiest])
+		parts.extend(["{}={}".format(name, v) for name, v in sorted(snap["gauges"].items())])
+		return "[{}] ".format(format_duration(snap["uptime"])) + " | ".join(parts)
+
+def format_duration(seconds):
+	if seconds is None:
+		return "?"
+	seconds = int(seconds)
+	return "{}:{:02d}:{:02d}".format(seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+# Metrics of this process
+METRICS = Metrics()
+
+def timer(stage, items=1):
+	return METRICS.timer(stage, items)
+
+def timed_iter(stage, iterable):
+	return METRICS.timed_iter(stage, iterable)
+
+def count(name, n=1):
+	METRICS.count(name, n)
+
+def gauge(name, value):
+	METRICS.gauge(name, value)
+
+def set_total(stage, total):
+	METRICS.set_total(stage, total)
+
+# Reporting thread and its stop event, while a run is reported
+REPORTER = []
+
+def report(path):
+	if path:
+		METRICS.export(path)
+	line = METRICS.progress_line()
+	if sys.stderr.isatty():
+		sys.stderr.write("\r\033[K" + line)
+	else:
+		sys.stderr.write(line + "\n")
+	sys.stderr.flush()
+
+'''
+	Starts exporting the metrics to a file (if a path is given) and printing a progress line, every interval seconds.
+'''
+def start_reporting(path=None, interval=REPORT_INTERVAL):
+	stop = threading.Event()
+	def loop():
+		while not stop.wait(interval):
+			report(path)
+	thread = threading.Thread(target=loop, daemon=True)
+	thread.start()
+	REPORTER.append((thread, stop, path))
+
+def stop_reporting():
+	while REPORTER:
+		thread, stop, path = REPORTER.pop()
+		stop.set()
+		thread.join()
+		report(path)
+		if sys.stderr.isatty():
+			sys.stderr.write("\n")
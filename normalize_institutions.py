@@ -1,5 +1,6 @@
 #!/usr/bin/python3
-import re, io, glob, sys, logging, unicodedata
+import re, glob, sys, logging, unicodedata
+from redif_reader import lines
 from datetime import datetime
 from pathlib import Path
 from multiprocessing import Pool
@@ -11,23 +12,8 @@ from functools import reduce
 
 logging.basicConfig(level=logging.WARNING)
 
-ENCODINGS = ['utf-8', 'utf-16-le']
-
 MAX_ITEMS = 10000
 
-def lines(f):
-	handle = None
-	for e in ENCODINGS:
-		if handle:
-			handle.close()
-			break
-		try:
-			handle = io.open(f, 'r', encoding=e)
-			for l in handle:
-				yield l.strip()
-		except:
-			logging.debug("Error opening file {} in {}".format(f, e), sys.exc_info()[0])
-
 def stripped(s): return s.strip(" -_.,'?!").strip('"').strip()
 
 def lower_or_not(token): return token.lower()
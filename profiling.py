@@ -0,0 +1,234 @@
+import os, sys, time, threading, cProfile, tracemalloc, logging
+from collections import Counter
+from contextlib import contextmanager
+import metrics
+
+"""
+	Profiling of the indexers, stage by stage (the stages being those timed with metrics.timer and metrics.timed_iter).
+
+	In "cpu" mode, a cProfile profile is recorded for each stage and written to STAGE.pstats (to be viewed with snakeviz,
+	or turned into a flame graph with flameprof). In "sample" mode, the stack of the main thread is sampled every few
+	milliseconds, and the samples of each stage are written to STAGE.folded, with one line per distinct stack and its
+	number of samples (the input format of flamegraph.pl, inferno and speedscope). Only the main thread is profiled
+	(bulk requests are sent by other threads, see bulk_sink.py), its time being charged to the innermost stage it is
+	in, or to "main" outside of any stage.
+
+	With memory profiling, allocations are traced with tracemalloc: memory.txt gives the peak of traced memory during
+	each stage (before Python 3.9, the traced memory when entering or leaving it), and the call sites holding the most
+	memory at the high-water mark of the run.
+"""
+
+PROFILE_MODES = ["cpu", "sample"]
+
+# Interval in seconds between two samples of the main thread stack
+SAMPLE_INTERVAL = 0.005
+
+# Number of frames kept by tracemalloc for each allocation
+MEMORY_FRAMES = 16
+
+# Number of call sites listed in memory.txt
+TOP_ALLOCATIONS = 30
+
+# A snapshot of the allocations is taken whenever the traced memory exceeds the previous high-water mark by this factor
+SNAPSHOT_GROWTH = 1.25
+
+# Stage to which the time spent outside of any stage is charged
+MAIN_STAGE = "main"
+
+'''
+	Returns the name of a frame in folded stacks.
+'''
+def frame_name(frame):
+	code = frame.f_code
+	return "{} ({}:{})".format(code.co_name, os.path.basename(code.co_filename), code.co_firstlineno)
+
+'''
+	Returns the folded stack (outermost frame first, separated by semicolons) of a frame.
+'''
+def folded_stack(frame):
+	names = []
+	while frame is not None:
+		names.append(frame_name(frame))
+		frame = frame.f_back
+	return ";".join(reversed(names))
+
+def file_name(stage):
+	return "".join([c if c.isalnum() or c in "-_" else "_" for c in stage])
+
+'''
+	Profiles the main thread of a run, stage by stage. It is notified by metrics each time a stage is entered or
+	exited, from any thread, and ignores the notifications from other threads than the one which started it.
+'''
+class Profiler:
+	def __init__(self, directory, mode="cpu", memory=False, interval=SAMPLE_INTERVAL):
+		if mode not in PROFILE_MODES + [None]:
+			raise ValueError("Unknown profile mode {}".format(mode))
+		self.directory = directory
+		self.mode = mode
+		self.memory = memory
+		self.interval = interval
+		self.stack = [MAIN_STAGE]
+		# Mapping from stage to its cProfile profile ("cpu" mode) or to the sample counts of its stacks ("sample" mode)
+		self.profiles = { }
+		# Mapping from stage to the peak of traced memory during the stage
+		self.peaks = Counter()
+		self.high_water = 0
+		self.high_water_stage = None
+		self.snapshot = None
+		self.thread = None
+		self.paused = False
+		self.sampler = None
+		self.stop_sampling = threading.Event()
+
+	def start(self):
+		os.makedirs(self.directory, exist_ok=True)
+		self.thread = threading.get_ident()
+		if self.memory:
+			tracemalloc.start(MEMORY_FRAMES)
+		if self.mode == "cpu":
+			self.profile(MAIN_STAGE).enable()
+		elif self.mode == "sample":
+			self.sampler = threading.Thread(target=self.sample_loop, daemon=True)
+			self.sampler.start()
+		metrics.STAGE_HOOKS.append(self)
+
+	def stop(self):
+		metrics.STAGE_HOOKS.remove(self)
+		if self.mode == "cpu":
+			self.profile(self.stack[-1]).disable()
+		elif self.mode == "sample":
+			self.stop_sampling.set()
+			self.sampler.join()
+		if self.memory:
+			self.track_memory()
+			tracemalloc.stop()
+		return self.write()
+
+	def profile(self, stage):
+		if stage not in self.profiles:
+			self.profiles[stage] = cProfile.Profile() if self.mode == "cpu" else Counter()
+		return self.profiles[stage]
+
+	def enter(self, stage):
+		if threading.get_ident() != self.thread:
+			return
+		self.pause()
+		self.stack.append(stage)
+		self.resume()
+
+	def exit(self, stage):
+		if threading.get_ident() != self.thread:
+			return
+		self.pause()
+		# Stages are normally exited in reverse order, unless a timed block spans the yield of a generator
+		for i in range(len(self.stack) - 1, 0, -1):
+			if self.stack[i] == stage:
+				del self.stack[i]
+				break
+		self.resume()
+
+	'''
+		Stops profiling the current stage (so that the work of the profiler itself is not profiled), and tracks the
+		memory it used.
+	'''
+	def pause(self):
+		if self.mode == "cpu":
+			self.profile(self.stack[-1]).disable()
+		self.paused = True
+		if self.memory:
+			self.track_memory()
+
+	def resume(self):
+		self.paused = False
+		if self.mode == "cpu":
+			self.profile(self.stack[-1]).enable()
+
+	'''
+		Charges the peak of traced memory since the previous call to the open stages, and takes a snapshot of the
+		allocations when the traced memory reaches a new high-water mark.
+	'''
+	def track_memory(self):
+		current, peak = tracemalloc.get_traced_memory()
+		if hasattr(tracemalloc, "reset_peak"):
+			tracemalloc.reset_peak()
+		else:
+			# Before Python 3.9 the peak cannot be reset, the memory traced at stage boundaries is charged instead
+			peak = current
+		for stage in set(self.stack):
+			self.peaks[stage] = max(self.peaks[stage], peak)
+		if current > self.high_water * SNAPSHOT_GROWTH:
+			self.high_water = current
+			self.high_water_stage = self.stack[-1]
+			self.snapshot = tracemalloc.take_snapshot().filter_traces([
+				tracemalloc.Filter(False, tracemalloc.__file__),
+				tracemalloc.Filter(False, __file__)
+			])
+
+	def sample_loop(self):
+		while not self.stop_sampling.wait(self.interval):
+			frame = sys._current_frames().get(self.thread)
+			if frame is not None and not self.paused:
+				self.profile(self.stack[-1])[folded_stack(frame)] += 1
+
+	'''
+		Writes the profiles to the profile directory, and returns the paths of the written files.
+	'''
+	def write(self):
+		paths = []
+		for stage, profile in sorted(self.profiles.items()):
+			if self.mode == "cpu":
+				path = os.path.join(self.directory, file_name(stage) + ".pstats")
+				profile.dump_stats(path)
+			else:
+				path = os.path.join(self.directory, file_name(stage) + ".folded")
+				with open(path, 'w') as f:
+					for stack, count in sorted(profile.items()):
+						f.write("{} {}\n".format(stack, count))
+			paths.append(path)
+		if self.memory:
+			path = os.path.join(self.directory, "memory.txt")
+			with open(path, 'w') as f:
+				self.write_memory(f)
+			paths.append(path)
+		return paths
+
+	def write_memory(self, f):
+		f.write("Peak of traced memory by stage\n")
+		for stage, peak in self.peaks.most_common():
+			f.write("{:>12.1f} MB  {}\n".format(peak / 1e6, stage))
+		if self.snapshot is None:
+			return
+		f.write("\nTop call sites at the high-water mark ({:.1f} MB, during {})\n".format(self.high_water / 1e6, self.high_water_stage))
+		for stat in self.snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+			frame = stat.traceback[0]
+			f.write("{:>12.1f} MB {:>10} blocks  {}:{}\n".format(stat.size / 1e6, stat.count, frame.filename, frame.lineno))
+		f.write("\nTop allocation stacks at the high-water mark\n")
+		for stat in self.snapshot.statistics('traceback')[:TOP_ALLOCATIONS // 3]:
+			f.write("\n{:.1f} MB in {} blocks\n".format(stat.size / 1e6, stat.count))
+			for line in stat.traceback.format(most_recent_first=True):
+				f.write(line + "\n")
+
+'''
+	Adds the profiling options to the parser of an entry point.
+'''
+def add_profile_options(parser, default_dir):
+	parser.add_argument("--profile", choices=PROFILE_MODES, help="Profiles each stage of the run, with cProfile (cpu) or by sampling the stack (sample)")
+	parser.add_argument("--profile-memory", action="store_true", help="Traces allocations with tracemalloc (much slower)")
+	parser.add_argument("--profile-dir", default=default_dir, help="Directory of the profiles (default: %(default)s)")
+
+'''
+	Profiles the block according to the profiling options, if any.
+'''
+@contextmanager
+def profiled(args):
+	if not args.profile and not args.profile_memory:
+		yield None
+		return
+	profiler = Profiler(args.profile_dir, args.profile, args.profile_memory)
+	profiler.start()
+	start = time.time()
+	try:
+		yield profiler
+	finally:
+		paths = profiler.stop()
+		logging.warning("Profiled {:.1f} s, {} profiles written to {}".format(time.time() - start, len(paths), args.profile_dir))
@@ -0,0 +1,154 @@
+import os, glob, zlib, struct, marshal
+from datetime import datetime
+
+"""
+	On-disk cache of parsed publications, used to rebuild the publication index without re-parsing the ReDIF files.
+
+	The cache is a directory of shards. Each shard starts with a header (magic and format version) followed by
+	length-prefixed blocks. A block holds the publications parsed from a group of ReDIF files: publications are
+	stored as tuples in a fixed field order, and repeated strings (template types, author names, institutions, JEL
+	labels, keywords, file paths) are interned in a string table local to the block. Blocks are marshalled then
+	compressed with zlib.
+"""
+
+MAGIC = b'PUBC'
+
+FORMAT_VERSION = 1
+
+HEADER = MAGIC + struct.pack('<B', FORMAT_VERSION)
+
+BLOCK_LENGTH = struct.Struct('<I')
+
+# A block is flushed once it holds that many publications
+BLOCK_PUBLIS = 5000
+
+# A new shard is started once the current one exceeds that size in bytes
+SHARD_BYTES = 64 * 1024 * 1024
+
+COMPRESSION_LEVEL = 1
+
+# Publication fields stored as plain strings
+TEXT_FIELDS = ["title", "abstract", "url"]
+
+# Publication fields stored as lists of interned strings
+LIST_FIELDS = ["jel-labels-en", "jel-labels-fr", "keywords"]
+
+AUTHOR_FIELDS = ["full_name", "first_name", "last_name", "email", "institution"]
+
+KNOWN_FIELDS = set(["type", "creation-date", "authors"] + TEXT_FIELDS + LIST_FIELDS)
+
+def shard_path(d, n):
+	return os.path.join(d, "shard-{:05d}.pubc".format(n))
+
+class CacheWriter:
+	'''
+		Writes parsed publications, grouped by source file, to a sharded cache directory.
+	'''
+	def __init__(self, d):
+		os.makedirs(d, exist_ok=True)
+		for f in glob.glob(os.path.join(d, "shard-*.pubc")):
+			os.remove(f)
+		self.dir = d
+		self.shard = -1
+		self.handle = None
+		self.new_block()
+		self.new_shard()
+
+	def new_block(self):
+		self.strings, self.string_ids, self.files, self.publi_count = [], { }, [], 0
+
+	def new_shard(self):
+		if self.handle:
+			self.handle.close()
+		self.shard += 1
+		self.handle = open(shard_path(self.dir, self.shard), 'wb')
+		self.handle.write(HEADER)
+
+	def intern(self, s):
+		if s is None:
+			return None
+		i = self.string_ids.get(s)
+		if i is None:
+			i = self.string_ids[s] = len(self.strings)
+			self.strings.append(s)
+		return i
+
+	def encode_publi(self, obj):
+		date = obj.get("creation-date")
+		extra = dict([(k, v) for k, v in obj.items() if k not in KNOWN_FIELDS])
+		return (
+			self.intern(obj.get("type")),
+			date.isoformat() if date else None,
+			tuple([obj.get(k) for k in TEXT_FIELDS]),
+			tuple([list([self.intern(v) for v in obj[k]]) if k in obj else None for k in LIST_FIELDS]),
+			list([tuple([self.intern(author.get(k)) for k in AUTHOR_FIELDS]) for author in obj["authors"]]),
+			extra if extra else None)
+
+	def add(self, f, publis):
+		self.files.append((self.intern(f), list([self.encode_publi(obj) for obj in publis])))
+		self.publi_count += len(publis)
+		if self.publi_count >= BLOCK_PUBLIS:
+			self.flush()
+
+	def flush(self):
+		if not self.files:
+			return
+		data = zlib.compress(marshal.dumps((self.strings, self.files)), COMPRESSION_LEVEL)
+		if self.handle.tell() > len(HEADER) and self.handle.tell() + len(data) > SHARD_BYTES:
+			self.new_shard()
+		self.handle.write(BLOCK_LENGTH.pack(len(data)))
+		self.handle.write(data)
+		self.new_block()
+
+	def close(self):
+		self.flush()
+		self.handle.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+def decode_publi(strings, rec):
+	type_id, date, texts, lists, authors, extra = rec
+	obj = { "type": strings[type_id] if type_id is not None else None, "authors": [] }
+	for author_rec in authors:
+		obj["authors"].append(dict([(k, strings[i]) for k, i in zip(AUTHOR_FIELDS, author_rec) if i is not None]))
+	for k, v in zip(TEXT_FIELDS, texts):
+		if v is not None:
+			obj[k] = v
+	if date:
+		obj["creation-date"] = datetime.fromisoformat(date)
+	for k, ids in zip(LIST_FIELDS, lists):
+		if ids is not None:
+			obj[k] = list([strings[i] for i in ids])
+	if extra:
+		obj.update(extra)
+	return obj
+
+'''
+	Yields the blocks of a shard, as pairs (string table, list of files).
+'''
+def read_shard(f):
+	with open(f, 'rb') as handle:
+		if handle.read(len(HEADER)) != HEADER:
+			raise ValueError("Not a publication cache shard (or unsupported version): {}".format(f))
+		while True:
+			prefix = handle.read(BLOCK_LENGTH.size)
+			if not prefix:
+				return
+			length, = BLOCK_LENGTH.unpack(prefix)
+			yield marshal.loads(zlib.decompress(handle.read(length)))
+
+'''
+	Yields pairs (source file, list of parsed publications) from all shards of the cache directory.
+'''
+def read_cache(d):
+	for f in sorted(glob.glob(os.path.join(d, "shard-*.pubc"))):
+		for strings, files in read_shard(f):
+			for path_id, recs in files:
+				yield strings[path_id], list([decode_publi(strings, rec) for rec in recs])
+
+def exists(d):
+	return len(glob.glob(os.path.join(d, "shard-*.pubc"))) > 0
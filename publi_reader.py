@@ -0,0 +1,157 @@
+import time, queue, random, logging, threading
+from elasticsearch.exceptions import TransportError
+import metrics
+from bulk_sink import is_retryable
+
+"""
+	Parallel and resumable reads of the publication index, used by the author build.
+
+	The index is split into ranges of the pub_id keyword field (publication IDs are SHA-1 hex digests, hence uniformly
+	distributed). Each range is read in pub_id order by its own thread, one page at a time with search_after, so that
+	no scroll context has to be kept alive for hours: the cursor of a reader is just the last pub_id it returned, and
+	a build interrupted by a crash or by the restart of a node carries on from the cursors of its last checkpoint.
+	(Elasticsearch 7.8 has no point-in-time searches, so the readers do not see a frozen view of the index: the
+	publications indexed during the build may or may not be read.)
+
+	Pages are handed over to the consumer through a bounded queue, and a reader only advances its cursor when the
+	consumer says that a page was processed (see PubliReader.done), so that the cursors saved in a checkpoint never
+	get ahead of the aggregates saved with them.
+"""
+
+# Number of parallel readers
+READERS = 4
+
+# Number of publications per page
+PAGE_SIZE = 1000
+
+# Number of pages read ahead by each reader
+READ_AHEAD = 2
+
+REQUEST_TIMEOUT = 120
+
+MAX_RETRIES = 8
+
+INITIAL_BACKOFF = 1.0
+
+MAX_BACKOFF = 120
+
+# Cursor of a range which has been read entirely
+DONE = True
+
+'''
+	Returns the bounds (lowest pub_id included, highest excluded, None meaning unbounded) of n ranges of pub_ids of
+	about the same size.
+'''
+def id_ranges(n):
+	bounds = [None] + list(["{:04x}".format(i * 0x10000 // n) for i in range(1, n)]) + [None]
+	return list(zip(bounds[:-1], bounds[1:]))
+
+def range_query(lo, hi):
+	cond = { }
+	if lo is not None:
+		cond["gte"] = lo
+	if hi is not None:
+		cond["lt"] = hi
+	return { "range": { "pub_id": cond } } if cond else { "match_all": { } }
+
+'''
+	Returns whether all the documents of an index have a pub_id, i.e. whether it can be read with a PubliReader
+	(indices created before the field was added cannot).
+'''
+def has_pub_ids(client, index):
+	total = client.count(index=index)["count"]
+	hits = client.search(index=index, body={ "size": 1, "query": { "match_all": { } }, "sort": [{ "pub_id": { "order": "asc", "missing": "_first", "unmapped_type": "keyword" } }] })["hits"]["hits"]
+	return total == 0 or bool(hits and hits[0]["_source"].get("pub_id"))
+
+'''
+	Reads an index with parallel readers, each of which reads a range of pub_ids starting after its cursor.
+'''
+class PubliReader:
+	def __init__(self, client, index, readers=READERS, cursors=None, page_size=PAGE_SIZE):
+		self.client = client
+		self.index = index
+		self.page_size = page_size
+		self.ranges = id_ranges(readers)
+		# Mapping from reader to the last pub_id processed by the consumer (None if none yet, DONE once read entirely)
+		self.cursors = dict(cursors) if cursors else dict([(i, None) for i in range(readers)])
+		if sorted(self.cursors) != list(range(readers)):
+			raise ValueError("Cursors of {} readers cannot be resumed with {} readers".format(len(self.cursors), readers))
+		self.pages = queue.Queue(readers * READ_AHEAD)
+		self.stop = threading.Event()
+
+	'''
+		Yields pairs (reader, page of hits) as they are read. The consumer calls done(reader, hits) once it has processed
+		a page.
+	'''
+	def read(self):
+		todo = list([i for i, cursor in self.cursors.items() if cursor is not DONE])
+		threads = list([threading.Thread(target=self.run_reader, args=(i,), daemon=True) for i in todo])
+		for t in threads:
+			t.start()
+		running = len(threads)
+		try:
+			while running:
+				reader, hits, error = self.pages.get()
+				if error is not None:
+					raise error
+				if hits is None:
+					running -= 1
+					continue
+				yield reader, hits
+		finally:
+			self.stop.set()
+			for t in threads:
+				t.join()
+
+	def done(self, reader, hits):
+		self.cursors[reader] = hits[-1]["_source"]["pub_id"] if hits else DONE
+
+	def put(self, item):
+		while not self.stop.is_set():
+			try:
+				self.pages.put(item, timeout=1)
+				return True
+			except queue.Full:
+				continue
+		return False
+
+	def run_reader(self, reader):
+		lo, hi = self.ranges[reader]
+		after = self.cursors[reader]
+		try:
+			while not self.stop.is_set():
+				hits = self.search(lo, hi, after)
+				if not hits:
+					# The empty page marks the end of the range
+					self.put((reader, [], None))
+					break
+				after = hits[-1]["_source"]["pub_id"]
+				if not self.put((reader, hits, None)):
+					return
+		except Exception as e:
+			self.put((reader, None, e))
+			return
+		self.put((reader, None, None))
+
+	'''
+		Returns the next page of a range, retrying with exponential backoff while the cluster is unavailable.
+	'''
+	def search(self, lo, hi, after):
+		body = { "size": self.page_size, "query": range_query(lo, hi), "sort": [{ "pub_id": "asc" }], "track_total_hits": False }
+		if after is not None:
+			body["search_after"] = [after]
+		attempt = 0
+		while True:
+			try:
+				start = time.perf_counter()
+				hits = self.client.search(index=self.index, body=body, request_timeout=REQUEST_TIMEOUT)["hits"]["hits"]
+				metrics.METRICS.add("es_search", time.perf_counter() - start, len(hits))
+				return hits
+			except TransportError as e:
+				if not is_retryable(e) or attempt >= MAX_RETRIES or self.stop.is_set():
+					raise
+				delay = min(MAX_BACKOFF, INITIAL_BACKOFF * 2 ** attempt) * (0.5 + random.random() / 2)
+				logging.warning("Publication read failed ({}), retrying in {:.0f} s".format(e, delay))
+				metrics.count("read_retries")
+				time.sleep(delay)
+				attempt += 1
@@ -1,13062 +1,8 @@
-const SUGGESTIONS_AUTHORS = [
-"A. Abigail Payne",
-"A. Colin Cameron ",
-"A. Leslie Robb",
-"A. Michael Spence ",
-"A. Mitchell Polinsky ",
-"A. Patrick L. Minford ",
-"A. Ronald Gallant ",
-"Aaditya Mattoo ",
-"Aaron Edlin",
-"Aaron Tornell ",
-"Aaron Yelowitz",
-"Aaron Nikolai Mehrotra",
-"Aart Kraay ",
-"Aart de Zeeuw",
-"Abbas Valadkhani",
-"Abdolkarim Sadrieh",
-"Abdul Abiad",
-"Abdullah Yavas",
-"Abdulnasser Hatemi-J ",
-"Abdurrahman Bekir Aydemir",
-"Abel Brodeur",
-"Abhinay Muthoo",
-"Abigail Wozniak",
-"Abigail Margaret Barr",
-"Abraham Neyman",
-"Achim Wambach",
-"Achim Zeileis",
-"Ada Ferrer-i-Carbonell ",
-"Adam Jaffe ",
-"Adam Storeygard",
-"Adam Szeidl ",
-"Adam B. Ashcraft ",
-"Adam Matthew Copeland",
-"Adam Michael Rosen",
-"Adam Simon Posen",
-"Adam Zachary Rose",
-"Adeline Delavande",
-"Adlai Julian Fisher",
-"Adolfo Figueroa",
-"Adolfo Meisel Roca ",
-"Adonis Yatchew",
-"Adriaan Kalwij",
-"Adriaan Soetevent",
-"Adrian Wood",
-"Adrian Paul Mander ",
-"Adrian Rodney Pagan ",
-"Adriana Kugler ",
-"Adriana Lleras-Muney ",
-"Adriano A. Rampini ",
-"Adrien Auclert",
-"Adrien Verdelhan ",
-"Afees Adebare Salisu",
-"Agar Brugiavini",
-"Agnes Benassy-Quere ",
-"Agnes Reynes Quisumbing ",
-"Ahmad Zubaidi Baharumshah",
-"Ahmed Mushfiq Mobarak ",
-"Aimee Chin",
-"Aitor Erce",
-"Ajay K. Agrawal ",
-"Ake Blomqvist",
-"Akihiko Matsui",
-"Akos Valentinyi",
-"Alain Guay",
-"Alain Monfort ",
-"Alain Trannoy ",
-"Alain Trognon",
-"Alain Venditti",
-"Alain de Janvry ",
-"Alan Auerbach ",
-"Alan Barrett",
-"Alan Beggs",
-"Alan Freeman",
-"Alan Greenspan ",
-"Alan Heston",
-"Alan Hughes",
-"Alan Kirman ",
-"Alan Manning ",
-"Alan Schwartz",
-"Alan de Brauw",
-"Alan D. White",
-"Alan Donald Woodland ",
-"Alan J. Krupnick",
-"Alan James Sutherland ",
-"Alan L. Gustman ",
-"Alan M. Taylor ",
-"Alan S Duncan ",
-"Alan S. Blinder ",
-"Alan V. Deardorff ",
-"Alastair Hall ",
-"Alban Thomas",
-"Albert Marcet ",
-"Albert Park",
-"Albert Saiz ",
-"Albert Sole-Olle",
-"Albert J. Menkveld ",
-"Albert N. Link ",
-"Albert S. Kyle ",
-"Alberto Abadie ",
-"Alberto Bisin ",
-"Alberto Chong ",
-"Alberto Martin ",
-"Alberto Russo",
-"Alberto Zazzaro ",
-"Alberto Felipe Cavallo",
-"Alberto Franco Pozzolo",
-"Albrecht Glitz",
-"Aldo Geuna",
-"Aldo Rustichini ",
-"Aleh Tsyvinski ",
-"Alejandro Gaviria ",
-"Alejandro Izquierdo",
-"Alejandro Micco ",
-"Aleksandar Vasilev",
-"Aleksander Berentsen ",
-"Ales Bulir",
-"Alessandra Casella ",
-"Alessandra Fogli ",
-"Alessandra Guariglia",
-"Alessandra Voena",
-"Alessandro Beber",
-"Alessandro Bucciol",
-"Alessandro Cigno ",
-"Alessandro Gavazza",
-"Alessandro Lizzeri ",
-"Alessandro Missale",
-"Alessandro Nicita",
-"Alessandro Nuvolari",
-"Alessandro Pavan ",
-"Alessandro Rebucci ",
-"Alessandro Sembenelli",
-"Alessandro Turrini ",
-"Alex Anas ",
-"Alex Bryson ",
-"Alex Coad ",
-"Alex Cukierman ",
-"Alex Edmans ",
-"Alexander Chudik",
-"Alexander Hijzen",
-"Alexander Ljungqvist ",
-"Alexander Ludwig",
-"Alexander Michaelides ",
-"Alexander Monge-Naranjo",
-"Alexander Popov ",
-"Alexander Tabarrok",
-"Alexander Wolitzky",
-"Alexander Daniel Klemm",
-"Alexander F. Wagner",
-"Alexander J. Field",
-"Alexander L. Wolman ",
-"Alexander S. Kritikos",
-"Alexander W. Butler",
-"Alexander W. Hoffmaister",
-"Alexander Wright Cappelen",
-"Alexandra Bozhechkova",
-"Alexandra Spitz-Oener",
-"Alexandros Kontonikas",
-"Alexei Onatski",
-"Alexia Furnkranz-Prskawetz ",
-"Alfons Oude Lansink",
-"Alfons Weersink",
-"Alfons J. Weichenrieder",
-"Alfonso Flores-Lagunes",
-"Alfonso Sousa-Poza",
-"Alfred Galichon",
-"Alfred Kleinknecht",
-"Alfred A. Haug ",
-"Alfredo Marvao Pereira ",
-"Ali Hortacsu ",
-"Ali M. Kutan ",
-"Alice O. Nakamura",
-"Alicia Adsera",
-"Alicia Garcia Herrero",
-"Alicia Haydock Munnell ",
-"Alireza Tahbaz-Salehi",
-"Alisdair McKay",
-"Alison Lee Booth ",
-"Alistair Milne",
-"Alistair Munro",
-"Allan Collard-Wexler",
-"Allan Drazen ",
-"Allan Timmermann ",
-"Allan W. Gregory ",
-"Allen Head",
-"Allen J. Scott",
-"Allen Merril Featherstone",
-"Allen N. Berger ",
-"Alma Cohen ",
-"Almas Heshmati ",
-"Alois Stutzer ",
-"Aloisio Araujo ",
-"Alok Bhargava",
-"Alok K. Bohara",
-"Aloysius Siow ",
-"Alpo Willman",
-"Alvaro Escribano",
-"Alvin E. Roth ",
-"Amalia Rebecca Miller",
-"Aman Ullah ",
-"Amanda Ellen Kowalski",
-"Amartya Lahiri",
-"Amartya Sen ",
-"Amelie F. Constant",
-"Amihai Glazer ",
-"Amine Tarazi",
-"Amir Sufi ",
-"Amir Yaron ",
-"Amit Goyal ",
-"Amit Seru ",
-"Amit K. Khandelwal ",
-"Amitabh Chandra",
-"Amitava Krishna Dutt",
-"Amitrajeet A Batabyal ",
-"Amiyatosh Purnanandam",
-"Amnon Rapoport",
-"Amos Golan",
-"Amrita Dhillon",
-"Amy Finkelstein ",
-"Amy Ellen Schwartz",
-"Ana Beatriz Galvão",
-"Ana Margarida Fernandes",
-"Ana Maria Herrera",
-"Ana Rute Cardoso ",
-"Ana-Maria Fuertes",
-"Analia Schlosser",
-"Ananish Chaudhuri",
-"Ananth Madhavan ",
-"Ananth Seshadri ",
-"Anastasios Xepapadeas ",
-"Anat Bracha",
-"Anat Ruth Admati ",
-"Anders Bjorklund ",
-"Anders Rahbek",
-"Anders Warne",
-"Andras Simonovits",
-"Andre Lucas ",
-"Andre Meier",
-"Andre Sapir ",
-"Andre Torre",
-"Andre van Stel",
-"Andre Jean-Louis de Palma ",
-"Andrea Bassanini ",
-"Andrea Brandolini ",
-"Andrea Carriero",
-"Andrea Ferrero",
-"Andrea Frazzini",
-"Andrea Gerali",
-"Andrea Ichino ",
-"Andrea Pescatori",
-"Andrea Prat ",
-"Andrea Repetto",
-"Andrea Roventini",
-"Andrea Tambalotti ",
-"Andrea Weber ",
-"Andrea Zaghini",
-"Andrea Filippo Presbitero ",
-"Andrea L. Eisfeldt",
-"Andreas Bergh",
-"Andreas Blume",
-"Andreas Freytag",
-"Andreas Fuster ",
-"Andreas Haufler ",
-"Andreas Hornstein ",
-"Andreas Irmen",
-"Andreas Lange ",
-"Andreas Leibbrandt",
-"Andreas Loschel ",
-"Andreas Moxnes",
-"Andreas Ortmann",
-"Andreas Peichl ",
-"Andreas Pyka",
-"Andreas Schabert",
-"Andreas Schrimpf",
-"Andreas Stephan ",
-"Andreas I. Mueller",
-"Andreas M Fischer",
-"Andrei Shleifer ",
-"Andrei Simonov",
-"Andrei A. Levchenko ",
-"Andres Erosa",
-"Andres Fernandez Martin",
-"Andres Rodriguez-Clare ",
-"Andres Rodriguez-Pose ",
-"Andrew Abel ",
-"Andrew Ang ",
-"Andrew Caplin ",
-"Andrew Chesher ",
-"Andrew Clark ",
-"Andrew Feltenstein",
-"Andrew Filardo ",
-"Andrew Foerster",
-"Andrew Foster ",
-"Andrew Henley",
-"Andrew McLennan",
-"Andrew Metrick ",
-"Andrew Mountford ",
-"Andrew Patton ",
-"Andrew Phiri",
-"Andrew Postlewaite ",
-"Andrew Powell",
-"Andrew Schmitz",
-"Andrew Schotter ",
-"Andrew Scott",
-"Andrew Shephard",
-"Andrew Sweeting",
-"Andrew Alan Samwick ",
-"Andrew B. Bernard ",
-"Andrew C. Harvey ",
-"Andrew Charles Worthington",
-"Andrew F. Daughety ",
-"Andrew F. Haughwout",
-"Andrew F. Newman ",
-"Andrew Gouinlock Berg",
-"Andrew Granger Atkeson ",
-"Andrew J. Oswald ",
-"Andrew Keith Leigh ",
-"Andrew Kenan Rose ",
-"Andrew M. Warner ",
-"Andrew Michael Jones ",
-"Andrew Murray Weiss ",
-"Andrew Theo Levin ",
-"Andrew Thomas Young",
-"Andrew W. Lo ",
-"Andries de Grip",
-"Andrzej Skrzypacz ",
-"André Kurmann",
-"Andy McKay",
-"Andy Snell",
-"Angel de La Fuente ",
-"Angela Maddaloni",
-"Angelo Melino",
-"Angelo Ranaldo",
-"Angelo Secchi",
-"Angus C. Chu",
-"Angus S. Deaton ",
-"Anil Markandya ",
-"Anil B. Deolalikar",
-"Anil K Kashyap ",
-"Anindya Banerjee ",
-"Anirban Basu",
-"Anjan V. Thakor ",
-"Anke Hoeffler ",
-"Ann Sherman",
-"Ann E. Harrison ",
-"Ann Huff Stevens ",
-"Ann L. Owen ",
-"Anna Aizer ",
-"Anna Alberini ",
-"Anna Dreber",
-"Anna Kovner",
-"Anna Pavlova",
-"Anna Vignoles",
-"Anna Maria Mayda ",
-"Annamaria Lusardi ",
-"Anne Case ",
-"Anne Sibert",
-"Anne-Celia Disdier",
-"Annette Vissing-Jorgensen ",
-"Anthony Murphy",
-"Anthony Richards",
-"Anthony A. Smith Jr.",
-"Anthony David Hall",
-"Anthony J. Culyer",
-"Anthony J. Venables ",
-"Anthony Philip Thirlwall ",
-"Antoine Bommier",
-"Antoine Dechezlepretre",
-"Antoine Martin ",
-"Antoinette Schoar ",
-"Anton Korinek ",
-"Anton A. Nakov",
-"Antonella Trigari",
-"Antonello D'Agostino",
-"Antonello Zanfei",
-"Antonia Diaz",
-"Antonio Afonso ",
-"Antonio Cabrales ",
-"Antonio Ciccone ",
-"Antonio Estache ",
-"Antonio Fatas ",
-"Antonio Mele",
-"Antonio Rua",
-"Antonio Spilimbergo ",
-"Antonio M Merlo ",
-"Antonio M. Bento",
-"Anusha Chari",
-"Anwar Shah",
-"Apostolos Serletis ",
-"Aprajit Mahajan",
-"Areendam Chanda",
-"Argia M Sbordone ",
-"Ari Kokko ",
-"Ariane Szafarz ",
-"Arie Kapteyn ",
-"Ariel Dinar",
-"Ariel Pakes ",
-"Ariel Rubinstein ",
-"Ariel Tomas Burstein ",
-"Ariell Reshef",
-"Arijit Mukherjee",
-"Arik Levinson ",
-"Arindrajit Dube ",
-"Arjun Singh Bedi",
-"Arlington Walton Williams",
-"Armin Falk ",
-"Armin Schmutzler",
-"Armin Schwienbacher",
-"Arnaud Chevalier",
-"Arnaud Costinot ",
-"Arnaud Jerome Mehl",
-"Arne Bigsten",
-"Arne Heise",
-"Arne Risa Hole ",
-"Arno Riedl ",
-"Arnold C. Harberger ",
-"Arnoud Boot ",
-"Arthur Grimes",
-"Arthur Hosios ",
-"Arthur Lewbel ",
-"Arthur Herman Otto Van Soest ",
-"Arthur Jan Hendricus Christoffel Schram ",
-"Arthur John Robson ",
-"Arturo Estrella ",
-"Arturo Jose Galindo",
-"Arunava Sen",
-"Arusha Cooray",
-"Arvind Panagariya ",
-"Arvind Subramanian ",
-"Arye L. Hillman ",
-"Asani Sarkar",
-"Asger Lunde ",
-"Asher Wolinsky ",
-"Ashima Goyal",
-"Ashish Arora ",
-"Ashok Kotwal",
-"Ashok K. Mishra ",
-"Ashoka Mody ",
-"Asim Ijaz Khwaja",
-"Asli Demirguc-Kunt ",
-"Assaf Razin ",
-"Assar Lindbeck ",
-"Athanasios Orphanides ",
-"Atif Rehman Mian ",
-"Atish Ghosh ",
-"Atsushi Inoue ",
-"Atsushi Kajii",
-"Attaullah Shah",
-"Attila Varga",
-"Aubhik Khan ",
-"Audra J. Bowlus",
-"Audrey Light",
-"Augustin Landier ",
-"Augustin Kwasi Fosu",
-"Aureo de Paula",
-"Aurora Amelia Castro Teixeira",
-"Austan Goolsbee ",
-"Austin Nichols ",
-"Avi Goldfarb ",
-"Avinash Kamalakar Dixit ",
-"Aviral Kumar Tiwari ",
-"Aviv Nevo ",
-"Avner Ben-Ner",
-"Avner Greif ",
-"Avraham Yehuda Ebenstein",
-"Awudu Abdulai ",
-"Axel Dreher ",
-"Axel Ockenfels ",
-"Ayhan Kose ",
-"Ayse Imrohoroglu ",
-"Aysegul Sahin ",
-"Aysit Tansel",
-"Azeem M. Shaikh ",
-"B Ravikumar ",
-"B Wade Brorsen ",
-"B. Curtis Eaton",
-"B. Douglas Bernheim ",
-"B. Espen Eckbo ",
-"Badi H. Baltagi ",
-"Balazs Egert ",
-"Bang Nam Jeon",
-"Barbara Petrongolo ",
-"Barbara Rossi ",
-"Barbara Sianesi ",
-"Barbara Spencer ",
-"Barbara L. Wolfe ",
-"Bard Harstad",
-"Barkley Rosser Jr.",
-"Barry Bozeman",
-"Barry Sopher",
-"Barry J. Nalebuff ",
-"Barry Julian Eichengreen ",
-"Barry Kent Goodwin ",
-"Barry P. Bosworth ",
-"Barry R. Chiswick ",
-"Barry R. Weingast ",
-"Barry T. Hirsch ",
-"Bart Hobijn ",
-"Bart Los ",
-"Bart Minten ",
-"Bart Nooteboom",
-"Bart Verspagen ",
-"Bart H. H. Golsteyn",
-"Bart J. Wilson",
-"Bart Leo Wim Cockx",
-"Barton Lipman ",
-"Barton Hughes Hamilton ",
-"Bartosz Mackowiak",
-"Bas ter Weel",
-"Bas van der Klaauw ",
-"Basit Zafar ",
-"Beata Smarzynska Javorcik ",
-"Beatrice Weder di Mauro ",
-"Been-Lon Chen",
-"Behzad T. Diba ",
-"Belton M. Fleisher",
-"Ben Craig",
-"Ben Greiner ",
-"Ben Heijdra",
-"Ben Jann ",
-"Ben Lockwood ",
-"Ben Shepherd",
-"Ben S. Bernanke ",
-"Benedikt M Potscher",
-"Bengt Holmstrom ",
-"Bengt-Ake Lundvall",
-"Benito Arrunada",
-"Benjamin Born",
-"Benjamin Eden ",
-"Benjamin Enke",
-"Benjamin Klein ",
-"Benjamin Moll ",
-"Benjamin Olken ",
-"Benjamin E. Hermalin ",
-"Benjamin F. Hobbs",
-"Benjamin F. Jones ",
-"Benjamin J. Keys ",
-"Benjamin Miranda Tabak ",
-"Benjamin R. Lester",
-"Benjamin Wild Pugsley",
-"Bennett McCallum ",
-"Benny Geys",
-"Benny Moldovanu ",
-"Benoit Mojon ",
-"Benoit Perron",
-"Bent Nielsen",
-"Bent E. Sorensen ",
-"Bent Jesper Christensen ",
-"Berk Ozler",
-"Bernard Fingleton ",
-"Bernard Fortin ",
-"Bernard Hoekman ",
-"Bernard Salanie ",
-"Bernard Sinclair-Desgagne",
-"Bernard J.-M. Caillaud",
-"Bernard M.S. van Praag ",
-"Bernard S. Black",
-"Bernardo Guimaraes",
-"Bernd Fitzenberger ",
-"Bernd Hayo ",
-"Bernt Bratsberg ",
-"Bert Scholtens ",
-"Berthold Herrendorf ",
-"Bertil Holmlund ",
-"Bertil Tungodden ",
-"Bertrand Candelon ",
-"Bertrand Melenberg",
-"Beth Fisher Ingram",
-"Betsey Stevenson ",
-"Bettina Klaus",
-"Bettina Peters",
-"Betty C. Daniel",
-"Bev Dahlby",
-"Beverly Hirtle",
-"Bharat Trehan",
-"Bhaskar Dutta ",
-"Bilin Neyapti",
-"Bill Dupor ",
-"Birger Wernerfelt ",
-"Bjorn Ockert",
-"Bjorn Terje Asheim",
-"Blaise Melly",
-"Blake Lebaron ",
-"Bo Becker ",
-"Bob Chirinko ",
-"Boqiang Lin ",
-"Boris Hofmann ",
-"Boriss Siliverstovs",
-"Botond Koszegi ",
-"Boyan Jovanovic ",
-"Brad Humphreys ",
-"Bradford D. Jordan",
-"Bradley Ruffle",
-"Bradley T. Ewing ",
-"Bradley T. Heim",
-"Bram De Rock ",
-"Branko Milanovic ",
-"Brent Kreider",
-"Brent Neiman ",
-"Brent R Moulton ",
-"Brent W. Ambrose",
-"Brian McCall",
-"Brian Davern Wright ",
-"Brian David Bell",
-"Brian E. Roe",
-"Brian Edward Dollery",
-"Brian G. Knight ",
-"Brian M. Lucey ",
-"Brian R. Copeland ",
-"Brian Thomas Nolan ",
-"Bridget Terry Long",
-"Brigitte C. Madrian ",
-"Bronwyn Hughes Hall ",
-"Bruce Fallick",
-"Bruce Mizrach",
-"Bruce Preston ",
-"Bruce Sacerdote ",
-"Bruce Wydick",
-"Bruce A. Blonigen ",
-"Bruce A. McCarl ",
-"Bruce A. Weinberg",
-"Bruce Alan Babcock ",
-"Bruce Clayton Petersen ",
-"Bruce D. Meyer ",
-"Bruce E. Hansen ",
-"Bruce James Chapman",
-"Bruno Amable",
-"Bruno Cassiman ",
-"Bruno Crepon ",
-"Bruno De Borger ",
-"Bruno Jullien ",
-"Bruno Van der Linden",
-"Bruno van Pottelsberghe de la Potterie ",
-"Bruno H. Strulovici",
-"Bruno R Biais ",
-"Bruno S. Frey ",
-"Bryan S. Graham ",
-"Burton Hollifield",
-"C. Kirabo Jackson ",
-"C. Knox Lovell ",
-"C. N. Teulings ",
-"C. Richard Shumway",
-"C.J. Krizan",
-"Calogero Carletto",
-"Calum G. Turvey",
-"Camelia Minoiu",
-"Camelia Mariana Kuhnen",
-"Cameron J. Hepburn",
-"Camille Landais",
-"Campbell Leith",
-"Campbell R. Harvey ",
-"Carl Davidson ",
-"Carl Gaigne",
-"Carl Shapiro ",
-"Carl Walsh ",
-"Carl A. Pasurka Jr.",
-"Carl Benedikt Frey",
-"Carl-Johan Dalgaard ",
-"Carlo Altavilla",
-"Carlo Carraro ",
-"Carlo Favero ",
-"Carlo Perroni",
-"Carlo Pietrobelli",
-"Carlos Alos-Ferrer",
-"Carlos Capistran",
-"Carlos Dobkin",
-"Carlos Garriga",
-"Carlos Thomas",
-"Carlos Velasco ",
-"Carlos A. Vegh ",
-"Carlos Alfredo Rodriguez",
-"Carlos Esteban Posada ",
-"Carlos Viana de Carvalho",
-"Carmen Pages",
-"Carmen M. Reinhart ",
-"Carol Propper ",
-"Carol A. Corrado",
-"Carol A. Dahl",
-"Carol Ann Rogers",
-"Carol Lee Graham",
-"Carolina Villegas-Sanchez",
-"Caroline Freund ",
-"Caroline Hoxby ",
-"Caroline Marie Betts",
-"Carolyn Fischer ",
-"Cars Hommes ",
-"Carsten Eckel",
-"Carsten Hefeker ",
-"Carsten Schroder",
-"Cary A. Deck",
-"Casey B. Mulligan ",
-"Casper G. de Vries ",
-"Cass Robert Sunstein",
-"Catalina Amuedo-Dorantes ",
-"Caterina Mendicino",
-"Cathal O'Donoghue ",
-"Catherine Mathieu",
-"Catherine Tucker",
-"Catherine C Eckel ",
-"Catherine Louise Kling ",
-"Cecilia Garcia-Penalosa ",
-"Cecilio Tamarit",
-"Cedric Tille ",
-"Cees Withagen ",
-"Celine Carrere",
-"Celine Nauges",
-"Cesaire Meh",
-"Cesar Martinelli",
-"Cesar A. Calderon ",
-"Cesar A. Hidalgo",
-"Chad Sparber",
-"Chad Syverson ",
-"Chad P. Bown ",
-"Chaim Fershtman ",
-"Chang-Jin Kim ",
-"Channing Arndt",
-"Charles Bellemare",
-"Charles Blackorby ",
-"Charles Brown ",
-"Charles Courtemanche",
-"Charles Engel ",
-"Charles Freedman",
-"Charles Nolan",
-"Charles Noussair ",
-"Charles Wyplosz ",
-"Charles A. Holt ",
-"Charles A. Trzcinka",
-"Charles Bram Cadsby",
-"Charles D. Kolstad ",
-"Charles David Sprenger ",
-"Charles F. Manski ",
-"Charles H. Whiteman ",
-"Charles I. Jones ",
-"Charles I. Plosser ",
-"Charles Ka Yui Leung",
-"Charles L. Evans ",
-"Charles M. C. Lee ",
-"Charles Milton Kahn ",
-"Charles Peter Timmer",
-"Charles R. Nelson ",
-"Charles Raymond Plott ",
-"Charles Richard Bean ",
-"Charles Robin Lindsey",
-"Charles T. Clotfelter ",
-"Charles Van Marrewijk",
-"Charles W. Calomiris ",
-"Charles Yuji Horioka ",
-"Charlie Karlsson",
-"Charlotte Christiansen",
-"Chen Lin ",
-"Cheng Hsiao ",
-"Cheng Wang",
-"Chenggang Xu",
-"Cheryl Renee Doss",
-"Chi-Keung Woo",
-"Chia-Lin Chang ",
-"Chiara Criscuolo ",
-"Chiara Scotti",
-"Chien-Chiang Lee ",
-"Chihwa Kao ",
-"Ching-chong Lai",
-"Ching-to Albert Ma ",
-"Chinhui Juhn ",
-"Chong Xiang",
-"Chong K. Yip",
-"Chong-En Bai",
-"Chor Foon Tang",
-"Chris Brooks ",
-"Chris Doucouliagos ",
-"Chris Edmond",
-"Chris Kirby",
-"Chris Papageorgiou ",
-"Chris Shannon",
-"Chris Starmer ",
-"Chris Telmer ",
-"Chris D Orme",
-"Chris M. Robinson",
-"Chris Robert Milner",
-"Christa H.S. Bouwman",
-"Christian Bayer",
-"Christian Belzil",
-"Christian Bjornskov ",
-"Christian Daude",
-"Christian Dreger ",
-"Christian Dustmann ",
-"Christian Francq",
-"Christian Gollier ",
-"Christian Hansen ",
-"Christian Hellwig ",
-"Christian Helmers",
-"Christian Julliard",
-"Christian Keuschnigg ",
-"Christian Leuz ",
-"Christian Lundblad ",
-"Christian Merkl",
-"Christian Pierdzioch ",
-"Christian Rammer ",
-"Christian Schumacher",
-"Christian Thoni",
-"Christian Traxler",
-"Christian Upper",
-"Christian Wey",
-"Christian Zehnder",
-"Christian Zimmermann",
-"Christian Albin Lukas Hilber",
-"Christian Allen Vossler",
-"Christian C.P. Wolff",
-"Christian Matthias Hafner ",
-"Christian S. Gourieroux ",
-"Christian Zimmermann",
-"Christiane Baumeister ",
-"Christina Gathmann",
-"Christina Paxson ",
-"Christina Duckworth Romer ",
-"Christoffer Kok",
-"Christoph Bohringer ",
-"Christoph Engel",
-"Christoph Rothe",
-"Christoph Trebesch",
-"Christoph A. Schaltegger",
-"Christoph M. Schmidt ",
-"Christophe Chamley ",
-"Christophe Hurlin ",
-"Christophe Perignon",
-"Christophe Rault",
-"Christopher Adam",
-"Christopher Blattman",
-"Christopher Carpenter",
-"Christopher Cornwell",
-"Christopher Flinn ",
-"Christopher Harris",
-"Christopher Heady",
-"Christopher House",
-"Christopher Kilby",
-"Christopher Martin",
-"Christopher Mayer ",
-"Christopher Otrok ",
-"Christopher Phelan",
-"Christopher Polk",
-"Christopher Ruhm ",
-"Christopher Sims ",
-"Christopher Tonetti",
-"Christopher Waller ",
-"Christopher Woodruff ",
-"Christopher Worswick",
-"Christopher A Pissarides ",
-"Christopher Andrew Neilson",
-"Christopher B. Barrett ",
-"Christopher D Carroll ",
-"Christopher F Baum ",
-"Christopher J. Neely ",
-"Christopher James Gust",
-"Christopher John Erceg ",
-"Christopher John McDermott",
-"Christopher John O'Donnell",
-"Christopher L. Smith",
-"Christopher Lee Foote",
-"Christopher M. Meissner ",
-"Christopher Mark Snyder",
-"Christopher N. Avery",
-"Christopher P. Chambers",
-"Christopher R. Knittel ",
-"Christopher R. Udry ",
-"Christopher Robert Bollinger",
-"Christos Genakos",
-"Christos Kotsogiannis",
-"Chun-Ping Chang",
-"Chun-Yan Kuo",
-"Chung-Ming Kuan",
-"Chunrong Ai ",
-"Claire Lelarge",
-"Clara Vega",
-"Claude Diebolt",
-"Claude Fluet",
-"Claude Montmarquette ",
-"Claude d'Aspremont ",
-"Claudia Goldin ",
-"Claudia Kemfert ",
-"Claudia Olivetti ",
-"Claudia Ringler",
-"Claudia Senik ",
-"Claudia M. Buch ",
-"Claudio Borio ",
-"Claudio Ferraz",
-"Claudio Lucifora",
-"Claudio Mezzetti",
-"Claudio Michelacci",
-"Claudio Morana",
-"Claudio Enrique Raddatz ",
-"Claus Schnabel",
-"Claus Thustrup Kreiner ",
-"Clemens Fuest ",
-"Clemens Sialm",
-"Clemens Dieter Puppe",
-"Clemens J.M. Kool",
-"Clement Allan Tisdell ",
-"Cletus C. Coughlin",
-"Clifford M. Hurvich",
-"Clifford M. Winston ",
-"Climent Quintana-Domeque",
-"Clive L. Spash ",
-"Clive Laurence George Bell",
-"Colin Camerer ",
-"Colin Carter",
-"Colin Mayer ",
-"Colin Vance",
-"Colin C. Williams",
-"Colin Peter Green",
-"Colm P. Harmon ",
-"Conchita D'Ambrosio",
-"Conny Wunsch",
-"Constantinos Syropoulos",
-"Cormac O Grada ",
-"Cosmin Liviu Ilut",
-"Costas Arkolakis ",
-"Costas Azariadis ",
-"Costas Meghir ",
-"Costas Milas",
-"Courtney Coile",
-"Craig Brett",
-"Craig Burnside ",
-"Craig Elliott Landry",
-"Craig S. Hakkio ",
-"Cristian Pop-Eleches",
-"Cristiano Antonelli ",
-"Cristina Arellano ",
-"Cuong Le Van",
-"Cuong Viet Nguyen ",
-"Curtis J Simon",
-"Curtis R. Taylor",
-"Cyril Monnet",
-"D.S. Prasada Rao ",
-"Daan van Soest",
-"Dabo Guan",
-"Dagfinn Rime",
-"Dagobert Llanos Brito",
-"Daiji Kawaguchi",
-"Dale Jorgenson ",
-"Dale O. Stahl II",
-"Dale William Henderson ",
-"Dalia Marin",
-"Dalia S. Hakura",
-"Dallas Burtraw",
-"Damien de Walque",
-"Damien J. Neven ",
-"Damon Clark",
-"Dan Andrews",
-"Dan Ben-David",
-"Dan Bernhardt ",
-"Dan Kovenock ",
-"Dan Levin ",
-"Dan Rickman ",
-"Dan Silverman ",
-"Dan A. Black ",
-"Dan-Olof Rooth ",
-"Dana P. Goldman",
-"Dani Rodrik ",
-"Daniel Aaronson ",
-"Daniel Ackerberg ",
-"Daniel Berkowitz",
-"Daniel Chiquiar",
-"Daniel Cohen ",
-"Daniel Dias",
-"Daniel Friedman ",
-"Daniel Gros ",
-"Daniel Hamermesh ",
-"Daniel Houser ",
-"Daniel Kahneman ",
-"Daniel Kaufmann ",
-"Daniel Lederman ",
-"Daniel Levy ",
-"Daniel McMillen ",
-"Daniel Parent ",
-"Daniel Schunk",
-"Daniel Sichel ",
-"Daniel Trefler ",
-"Daniel Treisman ",
-"Daniel Tsiddon ",
-"Daniel Waldenstrom",
-"Daniel Alan Sumner",
-"Daniel F. Spulber ",
-"Daniel F. Waggoner ",
-"Daniel G. Sullivan ",
-"Daniel I. Rees",
-"Daniel J. Henderson",
-"Daniel J. Seidmann",
-"Daniel J. Slottje",
-"Daniel Jacob Benjamin",
-"Daniel John Wilson ",
-"Daniel John Zizzo ",
-"Daniel Joseph Graham",
-"Daniel L Thornton ",
-"Daniel L. McFadden ",
-"Daniel L. Millimet ",
-"Daniel M. Hungerman",
-"Daniel M. Sturm ",
-"Daniel Patrick Murphy",
-"Daniel R. Vincent",
-"Daniel Richard Feenberg",
-"Daniel Wood Bromley",
-"Daniela Del Boca ",
-"Daniele Checchi ",
-"Daniele Coen-Pirani",
-"Daniele Nosenzo",
-"Daniele Schiliro' ",
-"Daniele Terlizzese",
-"Danny Quah ",
-"Danny Yagan",
-"Danyang Xie",
-"Daria Taglioni",
-"Dario Caldara",
-"Darius Noshir Lakdawalla ",
-"Daron Acemoglu ",
-"Darrell Duffie ",
-"Darren Lubotsky",
-"David Altig",
-"David Andolfatto ",
-"David Autor ",
-"David Berger",
-"David Besanko ",
-"David Blake ",
-"David Blau ",
-"David Bloom ",
-"David Brownstone",
-"David Canning ",
-"David Cesarini",
-"David Colander ",
-"David Dollar ",
-"David Domeij",
-"David Donaldson ",
-"David Dorn ",
-"David Dranove ",
-"David Easley ",
-"David Fielding ",
-"David Figlio ",
-"David Genesove ",
-"David Gill",
-"David Hemous",
-"David Hirshleifer ",
-"David Huffman ",
-"David Joulfaian ",
-"David Kelsey",
-"David Lagakos",
-"David Laidler ",
-"David Lando",
-"David Levine ",
-"David Lopez-Salido ",
-"David Marques-Ibanez",
-"David Masclet",
-"David McAdams",
-"David McKenzie ",
-"David Neumark ",
-"David Orden",
-"David Parker",
-"David Parsley ",
-"David Perez-Castrillo ",
-"David Porter",
-"David Powell",
-"David Reiley ",
-"David Roland-Holst",
-"David Romer ",
-"David Scharfstein ",
-"David Schmeidler ",
-"David Sjoquist",
-"David Stromberg ",
-"David Thesmar ",
-"David Throsby",
-"David VanHoose",
-"David Vestin",
-"David Vines",
-"David Weinstein ",
-"David Wildasin ",
-"David Wise ",
-"David Yanagizawa-Drott",
-"David Zilberman ",
-"David de Meza ",
-"David de la Croix ",
-"David A Bessler ",
-"David A. Dickey ",
-"David A. Green ",
-"David A. Hennessy ",
-"David A. Hensher ",
-"David A. Jaeger",
-"David A. Macpherson",
-"David A. Peel ",
-"David Alexandre Sraer",
-"David Allen Lam",
-"David Arie Mayer-Foulkes",
-"David B. Audretsch ",
-"David B. Gordon ",
-"David B. Mustard",
-"David C Wheelock ",
-"David C. Ling",
-"David C. Ribar ",
-"David Christopher Mare",
-"David E. A. Giles",
-"David E. Card ",
-"David E. M. Sappington ",
-"David Edmund Allen",
-"David Edward Cook",
-"David Ezra Sahn ",
-"David F. Hendry ",
-"David G. Blanchflower ",
-"David Gerald Tarr ",
-"David Guy Atkin",
-"David H. Papell ",
-"David Ian Stern ",
-"David Isaac Laibson ",
-"David J Deming ",
-"David J. Pannell",
-"David J. Teece ",
-"David Jacob Cooper ",
-"David John Zimmerman",
-"David Kenneth Miles",
-"David Knudsen Levine ",
-"David L Dickinson",
-"David L. Hummels ",
-"David Larry Yermack ",
-"David M Newbery ",
-"David M. Cutler ",
-"David M. Gould",
-"David M. Grether",
-"David M. Kreps ",
-"David M. Reeb",
-"David Malin Roodman ",
-"David Matthew Levinson ",
-"David N. DeJong",
-"David N. Margolis ",
-"David N. Weil ",
-"David Neil Laband",
-"David O. Cushman",
-"David Olivier Lucca",
-"David Peter Myatt",
-"David R. Just",
-"David R. Skeie",
-"David Rezza Baqaee",
-"David S. Evans ",
-"David S. Jacks",
-"David T. Robinson ",
-"David Theodore Coe",
-"David W. Johnston",
-"David W. Wilcox ",
-"David Walter Galenson",
-"David Yves Albouy",
-"David-Jan Jansen",
-"Davide Cantoni",
-"Davide Castellani",
-"Davide Furceri ",
-"Davin Chor ",
-"Dean Croushore ",
-"Dean Jolliffe",
-"Dean Yang ",
-"Dean P. Foster",
-"Dean Robert Hyslop",
-"Dean S. Karlan ",
-"Deborah A. Cobb-Clark ",
-"Deborah J. Lucas ",
-"Deborah L. Swenson",
-"Debraj Ray ",
-"Deirdre N. McCloskey",
-"Denis Fougere ",
-"Denis Gromb ",
-"Denise Osborn ",
-"Deniz Igan",
-"Dennis Coates",
-"Dennis Epple ",
-"Dennis Kristensen ",
-"Dennis Novy",
-"Dennis Snower ",
-"Dennis C. Mueller ",
-"Dennis Lee Hoffman",
-"Dennis R. Capozza",
-"Dennis Tao Yang ",
-"Dennis W. Carlton ",
-"Dennis W. Jansen",
-"Denzil G. Fiebig",
-"Deon Filmer ",
-"Derek A. Neal ",
-"Derek Charles Jones",
-"Derek D. Headey",
-"Dermot Leahy",
-"Dermot James Hayes ",
-"Devashish Mitra ",
-"Devin Pope",
-"Dhammika Dharmapala ",
-"Dhaval M. Dave",
-"Diane G. Del Guercio",
-"Dick van Dijk ",
-"Didier Laussel",
-"Diego Comin ",
-"Diego Puga ",
-"Diego Restuccia ",
-"Dierk Herzer ",
-"Dieter Nautz",
-"Dietmar Harhoff ",
-"Dietrich Vollrath",
-"Dilip Mookherjee ",
-"Dimitri Vayanos ",
-"Dimitrios Panayotis Tsomocos",
-"Dimitris Christelis",
-"Dimitris Christopoulos",
-"Dimitris Georgarakos",
-"Dimitris Korobilis ",
-"Dimitris Papanikolaou",
-"Dirk Bergemann ",
-"Dirk Czarnitzki ",
-"Dirk Engelmann ",
-"Dirk Hackbarth",
-"Dirk Jenter",
-"Dirk Krueger ",
-"Dirk Niepelt",
-"Dirk Schoenmaker",
-"Dirk Sliwka",
-"Dirk Van den Poel",
-"Dirk G. Baur",
-"Dirk T.G. Rubbelke",
-"Dmitry Taubinsky",
-"Domenico Delli Gatti",
-"Domenico Giannone ",
-"Dominic Rohner ",
-"Dominik H. Enste Sr.",
-"Dominique Goux",
-"Dominique van de Walle",
-"Dominique van der Mensbrugghe",
-"Don Fullerton ",
-"Don Harding",
-"Don Edward Schlagenhauf",
-"Donal O'Neill",
-"Donald Brown",
-"Donald Cox ",
-"Donald Robertson",
-"Donald Wittman",
-"Donald B. Keim ",
-"Donald F. Larson",
-"Donald O. Parsons",
-"Donald P. Morgan ",
-"Donald R. Davis ",
-"Donald Richard Haurin ",
-"Donald S. Kenkel ",
-"Donald S. Siegel ",
-"Donald W. K. Andrews ",
-"Dong He",
-"Donggyu Sul ",
-"Donghoon Lee",
-"Donghyun Park ",
-"Donna B. Gilleskie",
-"Donna K. Ginther",
-"Dora L. Costa ",
-"Dorothea Kubler",
-"Dorothea Schafer ",
-"Doug Staiger ",
-"Douglas Almond ",
-"Douglas Gale ",
-"Douglas Gollin ",
-"Douglas A. Irwin ",
-"Douglas A. Shackelford",
-"Douglas D. Davis",
-"Douglas Darrell Evanoff",
-"Douglas J. Cumming ",
-"Douglas Kenneth Pearce",
-"Douglas Lee Miller ",
-"Douglas Michael Laxton ",
-"Douglas Russell Nelson",
-"Douglas W. Allen",
-"Douglas W. Diamond ",
-"Douglas W. Elmendorf",
-"Dov Samet ",
-"Drew Fudenberg ",
-"Drusilla K. Brown",
-"Duc Khuong Nguyen ",
-"Duncan Thomas ",
-"Duncan K. Foley ",
-"Dwayne Benjamin ",
-"E Philip Davis ",
-"Eckhard Hein ",
-"Eckhard Janeba",
-"Eckhard Platen",
-"Ed Hopkins",
-"Ed Nosal",
-"Eddie Dekel ",
-"Eddy K.A. Van Doorslaer ",
-"Edgar K. Browning",
-"Edgar L Feige ",
-"Edgar L. W. Morgenroth",
-"Edi Karni ",
-"Edmund S. Phelps ",
-"Eduardo Fernandez-Arias",
-"Eduardo Levy Yeyati ",
-"Eduardo Lora",
-"Eduardo Alfredo Cavallo",
-"Eduardo Amaral Haddad",
-"Eduardo M.R.A. Engel ",
-"Edward Lazear ",
-"Edward Nelson ",
-"Edward Tower",
-"Edward Vytlacil ",
-"Edward Whitehouse",
-"Edward Andrew Miguel ",
-"Edward B. Barbier ",
-"Edward C. Norton ",
-"Edward C. Prescott ",
-"Edward E. Leamer ",
-"Edward J. Balistreri",
-"Edward J. Kane ",
-"Edward John Driffill ",
-"Edward Ludwig Glaeser ",
-"Edward Nathan Wolff ",
-"Edward Simpson Prescott",
-"Edwin Leuven ",
-"Edwin L.-C. Lai",
-"Edwin Malcolm Truman",
-"Efe A. Ok ",
-"Efraim Benmelech ",
-"Efraim Sadka ",
-"Efrem Castelnuovo ",
-"Egon Zakrajsek ",
-"Egon Peter Franck",
-"Ehsan U. Choudhri",
-"Ehud Kalai ",
-"Ehud Lehrer",
-"Eiji Yamamura ",
-"Eilon Solan",
-"Ekaterina Zhuravskaya ",
-"Ekkehart Boehmer ",
-"Ekkehart Schlicht",
-"Elena Katok",
-"Elena Ivanova Ianchovichina",
-"Eleonora Patacchini ",
-"Elhanan Helpman ",
-"Eli Berman ",
-"Eli Remolona",
-"Eliana La Ferrara ",
-"Elias Papaioannou ",
-"Elias Tzavalis",
-"Elie Appelbaum",
-"Elie Tamer ",
-"Elie I. Bouri",
-"Elisabet Rutstrom ",
-"Elisabeth Sadoulet ",
-"Elisabetta Iossa",
-"Elizabeth Asiedu",
-"Elizabeth Brainerd ",
-"Elizabeth Hoffman",
-"Elizabeth Peters",
-"Elizabeth M. King",
-"Elizabeth U. Cascio",
-"Ellen R. McGrattan ",
-"Ellis W. Tallman",
-"Elmar G. Wolfstetter",
-"Eloi Laurent",
-"Elroy Dimson",
-"Elyes Jouini",
-"Emad Abd Elmessih Shehata ",
-"Emanuel Moench ",
-"Emanuel Ornelas ",
-"Emanuela Cardia",
-"Emek Basker",
-"Emi Nakamura ",
-"Emili Tortosa-Ausina",
-"Emily Oster ",
-"Emmanuel Dhyne",
-"Emmanuel Duguet ",
-"Emmanuel Flachaire",
-"Emmanuel Petrakis",
-"Emmanuel Saez ",
-"Emmanuel Skoufias ",
-"Emmanuelle Auriol",
-"Emre Ozdenoren",
-"Engelbert Stockhammer ",
-"Enghin Atalay",
-"Enisse Kharroubi",
-"Enno Mammen",
-"Enrica Detragiache ",
-"Enrico Moretti ",
-"Enrico Perotti ",
-"Enrico Santarelli",
-"Enrico Sette",
-"Enrico Spolaore ",
-"Enrique Lopez-Bazo",
-"Enrique Moral-Benito",
-"Enrique Sentana ",
-"Enrique G. Mendoza ",
-"Enzo Weber",
-"Ephraim Leibtag",
-"Eran Yashiv",
-"Erdal Tekin ",
-"Eric Edmonds",
-"Eric Fisher",
-"Eric Ghysels ",
-"Eric Heyer ",
-"Eric Jondeau ",
-"Eric Leeper ",
-"Eric Maurin ",
-"Eric Neumayer ",
-"Eric Rosengren ",
-"Eric Sims ",
-"Eric Verhoogen ",
-"Eric Zitzewitz ",
-"Eric Zivot ",
-"Eric van Damme ",
-"Eric van Wincoop ",
-"Eric A. Hanushek ",
-"Eric Albert Strobl ",
-"Eric B Rasmusen",
-"Eric Baird French ",
-"Eric D. Gould ",
-"Eric F. Smith",
-"Eric J. Bartelsman ",
-"Eric Jan Van den Steen",
-"Eric Michel Renault ",
-"Eric P. Bettinger ",
-"Eric R. Young ",
-"Eric S. Maskin ",
-"Eric T. Swanson ",
-"Eric W. Bond ",
-"Erica Lynn Groshen",
-"Erich Battistin",
-"Erich Gundlach",
-"Erich Muehlegger",
-"Erik Berglof",
-"Erik Brynjolfsson ",
-"Erik Dietzenbacher ",
-"Erik Hurst ",
-"Erik Lichtenberg",
-"Erik Plug ",
-"Erik Schokkaert ",
-"Erik Stafford ",
-"Erik Stam",
-"Erik Theissen",
-"Erik Wengstrom",
-"Erik E. Lehmann",
-"Erik O. Sorensen",
-"Erik Teodoor Verhoef ",
-"Erin T. Mansur ",
-"Erling Barth",
-"Ernesto Dal Bo",
-"Ernesto Reuben",
-"Ernesto Schargrodsky",
-"Ernesto Stein ",
-"Ernst Fehr ",
-"Ernst-Ludwig von Thadden ",
-"Erwan Quintin",
-"Erwin Bulte ",
-"Erzo F.P. Luttmer ",
-"Erzo G.J. Luttmer ",
-"Esfandiar Maasoumi ",
-"Espen R. Moen ",
-"Esteban Rossi-Hansberg ",
-"Esteban F. Klor",
-"Ester Faia ",
-"Esther Duflo ",
-"Esther Gal-Or ",
-"Esther Ruiz",
-"Eswar Prasad ",
-"Ethan Ilzetzki ",
-"Ethan Ligon",
-"Ethan Daniel Kaplan",
-"Ethan G. Lewis",
-"Etienne Lehmann",
-"Etienne Wasmer ",
-"Eugene Kandel ",
-"Eugene F. Fama Sr.",
-"Eugene Nelson White",
-"Eugenio Proto",
-"Eugenio J. Miravete",
-"Eugenio Martin Cerutti ",
-"Evan F. Koenig",
-"Eve Caroli ",
-"Evi Paraskevi Pappa ",
-"Evzen Kocenda ",
-"Eyal Winter ",
-"Eytan Sheshinski ",
-"Ezra Oberfield",
-"F. Halsey Rogers",
-"Fabian Lange ",
-"Fabian Valencia ",
-"Fabian Waldinger",
-"Fabiano Schivardi ",
-"Fabien Postel-Vinay ",
-"Fabio Canova ",
-"Fabio Ghironi ",
-"Fabio Milani",
-"Fabio Rumler",
-"Fabio Sabatini",
-"Fabio Schiantarelli ",
-"Fabio Trojani",
-"Fabio José Sanchez Torres ",
-"Fabrice Collard ",
-"Fabrice Murtin",
-"Fabrizio Coricelli ",
-"Fabrizio Perri ",
-"Fabrizio Zilibotti ",
-"Facundo Alvaredo",
-"Fahad Khalil",
-"Faiz Gallouj",
-"Fallaw Broadus Sowell",
-"Farid Toubal ",
-"Farley Grubb",
-"Farshid Vahid",
-"Faruk Gul ",
-"Fatih Guvenen ",
-"Federico Belotti ",
-"Federico Ciliberto",
-"Federico Cingano",
-"Federico Echenique ",
-"Federico Etro ",
-"Federico Ravenna",
-"Federico Revelli",
-"Federico Sturzenegger ",
-"Federico M. Signoretti",
-"Felipe Barrera-Osorio",
-"Felix FitzRoy",
-"Felix Jimenez ",
-"Felix Kubler ",
-"Felix Rioja",
-"Felix Tintelnot",
-"Ferda Halicioglu",
-"Ferdinand Akthar Gul",
-"Ferdinand Gordian Rauch",
-"Fernanda Nechio",
-"Fernando Alvarez ",
-"Fernando Broner",
-"Fernando Estrada ",
-"Fernando Lefort",
-"Fernando Parro",
-"Fernando Perez de Gracia",
-"Fernando Rios-Avila",
-"Fernando Vega-Redondo ",
-"Fernando V. Ferreira ",
-"Filipe Campante",
-"Filippo di Mauro",
-"Finn Tarp ",
-"Finn E. Kydland ",
-"Finn R. Forsund",
-"Firouz Gahvari ",
-"Flavio Cunha ",
-"Flavio Marques Menezes",
-"Flip Klijn",
-"Florencio Lopez-de-Silanes ",
-"Florian Heider",
-"Florian Huber",
-"Florian Mayneris",
-"Florian Scheuer",
-"Florin O. Bilbiie ",
-"Fotios Pasiouras",
-"Franc Klaassen",
-"Frances Stewart ",
-"Francesc Ortega",
-"Francesca Lotti",
-"Francesca Molinari",
-"Francesco Bianchi",
-"Francesco Bogliacino",
-"Francesco Caselli ",
-"Francesco Daveri",
-"Francesco Giavazzi ",
-"Francesco Lippi ",
-"Francesco Lissoni ",
-"Francesco Pastore",
-"Francesco Quatraro",
-"Francesco Ravazzolo ",
-"Francesco Saraceno",
-"Francesco Squintani",
-"Francesco Trebbi ",
-"Francesco Zanetti",
-"Francine Blau ",
-"Francine Lafontaine ",
-"Francis Bloch ",
-"Francis Green ",
-"Francis Kramarz ",
-"Francis Vella ",
-"Francis Warnock ",
-"Francis A. Longstaff ",
-"Francis John Teal",
-"Francis T. Lui",
-"Francis X. Diebold ",
-"Francisco Gomes",
-"Francisco Venegas-Martinez ",
-"Francisco A. Gallego",
-"Francisco H. G. Ferreira ",
-"Francisco J. Ruge-Murcia ",
-"Francisco Javier Buera ",
-"Francisco Jose Veiga",
-"Francisco L. Rivera-Batiz ",
-"Francisco Rafael Rodriguez",
-"Franck Portier ",
-"Franco Malerba ",
-"Franco Peracchi ",
-"Francois Gourio ",
-"Francois Laisney",
-"Francois Langot",
-"Francois Ortalo-Magne",
-"Francois Rycx ",
-"Francois Salanie",
-"Francois Velde",
-"Francois J. Bourguignon ",
-"Francois Paul Maniquet ",
-"Francois-Charles Wolff ",
-"Francoise Forges ",
-"Frank Asche",
-"Frank Kleibergen ",
-"Frank Levy ",
-"Frank Lichtenberg ",
-"Frank Milne",
-"Frank Riedel",
-"Frank Schorfheide ",
-"Frank Stahler",
-"Frank Verboven ",
-"Frank Westerhoff ",
-"Frank Westermann",
-"Frank Windmeijer ",
-"Frank Alan Cowell ",
-"Frank Allen Sloan ",
-"Frank C. J. M. de Jong",
-"Frank G. Mixon Jr.",
-"Frank Hismith Page Jr.",
-"Frank J. Fabozzi ",
-"Frank Joseph Chaloupka IV",
-"Frank M. Fossen",
-"Frank Peter Stafford ",
-"Frank Rafael Smets ",
-"Frank Van Oort ",
-"Franklin Allen ",
-"Frans A.A.M. van Winden ",
-"Franz Dietrich",
-"Franz Wirl ",
-"Franz C. Palm ",
-"Frederic Koessler",
-"Frederic Marty",
-"Frederic Mishkin ",
-"Frederic Robert-Nicoud ",
-"Frederic Vermeulen ",
-"Frederic Warzynski",
-"Frederick (Rick) van der Ploeg ",
-"Frederick Douglas Foster",
-"Frederico Finan ",
-"Frederik Paul Schlingemann",
-"Fredj Jawadi",
-"Fredrik Carlsson ",
-"Fredrik Sjoholm",
-"Friedel Bolle",
-"Friedhelm Pfeiffer",
-"Friedrich Breyer",
-"Friedrich Heinemann ",
-"Friedrich Georg Schneider ",
-"Fritz Breuss ",
-"Frédéric Docquier ",
-"Fukunari Kimura",
-"Fulvio Castellacci",
-"Fulvio Corsi",
-"Fumio Hayashi ",
-"Furio Camillo Rosati",
-"G. Andrew Karolyi ",
-"G. William Schwert ",
-"Gaaitzen J. de Vries ",
-"Gabriel Jimenez ",
-"Gabriel Montes-Rojas",
-"Gabriel Perez Quiros ",
-"Gabriel Rodriguez",
-"Gabriel Zucman ",
-"Gabriel J Felbermayr ",
-"Gabriel Martins Ahlfeldt ",
-"Gabriele Camera ",
-"Gabriele Fiorentini",
-"Gabriele Galati",
-"Gabrielle Demange ",
-"Gadi Barlevy ",
-"Gaetan J.A. Nicodeme ",
-"Galina B Hale",
-"Gara M. Afonso",
-"Garance Genicot",
-"Gareth Donald Myles ",
-"Garey Ramey ",
-"Garry Barrett",
-"Garry Young",
-"Garth Heutel",
-"Gary Charness ",
-"Gary Gorton ",
-"Gary King ",
-"Gary Koop ",
-"Gary Richardson",
-"Gary Solon ",
-"Gary Clyde Hufbauer ",
-"Gary D. Ferrier",
-"Gary D. Hansen ",
-"Gary D. Libecap",
-"Gary E. Bolton ",
-"Gary H. Jefferson",
-"Gary S. Fields ",
-"Gary Thomas Burtless ",
-"Gaurav Datt",
-"Gautam Kaul ",
-"Gauti B. Eggertsson ",
-"Gavin Wright ",
-"Gavin Peter Swann",
-"Geert Bekaert ",
-"Geert Duysters",
-"Geert Ridder ",
-"Geeta Gandhi Kingdon",
-"Geir B. Asheim ",
-"Gene Amromin",
-"Gene Grossman ",
-"Geng Li",
-"Geoff(rey) Colin Harcourt",
-"Geoffrey Brennan",
-"Geoffrey Heal ",
-"Geoffrey J. D. Hewings ",
-"Geoffrey M. B. Tootell",
-"Geoffrey Martin Hodgson ",
-"Geoffroy de Clippel",
-"Georg Kirchsteiger ",
-"Georg Noldeke",
-"Georg Wamser",
-"Georg Weizsacker",
-"George Alessandria",
-"George Alogoskoufis",
-"George Borjas ",
-"George Deltas",
-"George Filis",
-"George Hondroyiannis",
-"George Loewenstein ",
-"George Norman",
-"George Psacharopoulos ",
-"George Tauchen ",
-"George A. Akerlof ",
-"George E. Halkos ",
-"George G. Pennacchi ",
-"George J. Mailath ",
-"George John Hall",
-"George L. Perry ",
-"George M. Constantinides ",
-"George M. von Furstenberg ",
-"George R. Zodrow",
-"George R.G. Clarke ",
-"George S. Tavlas ",
-"George William Evans ",
-"George-Marios Angeletos ",
-"Georges Dionne ",
-"Georges Zaccour",
-"Georgios Chortareas",
-"Georgios Georgiadis",
-"Georgios Karras ",
-"Georgios P. Kouretas",
-"Geraint Johnes",
-"Gerald A. Carlino ",
-"Gerald E. Shively",
-"Gerald P Dwyer ",
-"Gerard Caprio Jr.",
-"Gerard Charreaux",
-"Gerard Gaudet",
-"Gerard Pfann",
-"Gerard Roland ",
-"Gerard van der Laan",
-"Gerard J. van den Berg ",
-"Gerardo Esquivel",
-"Gerhard Glomm ",
-"Gerhard Sorger ",
-"Germa Bel",
-"Gernot Muller ",
-"Gernot Nerb",
-"Gerrit Cornelis van Kooten ",
-"Gershon Feder ",
-"Gershon Mandelker",
-"Gert Peersman ",
-"Gert G. Wagner ",
-"Ghazala Azmat",
-"Giacomo Bonanno",
-"Giacomo Calzolari",
-"Giacomo Corneo ",
-"Giacomo De Giorgi",
-"Giacomo A. M. Ponzetto",
-"Giampiero M. Gallo",
-"Gian Maria Milesi-Ferretti ",
-"GianCarlo Moschini ",
-"Giancarlo Corsetti ",
-"Giancarlo Spagnolo ",
-"Gianluca D. Benigno ",
-"Gianmarco I.P. Ottaviano ",
-"Gianni Amisano",
-"Gianni De Fraja ",
-"Gijs Van De Kuilen",
-"Gikas A. Hardouvelis ",
-"Gil S. Epstein",
-"Gilat Levy",
-"Gilbert Cette ",
-"Gilbert Metcalf ",
-"Gilbert W. Bassett Jr.",
-"Gilberto Turati",
-"Gilberto Tadeu Lima",
-"Gilles Dufrenot",
-"Gilles Duranton ",
-"Gilles Grolleau",
-"Gilles Hilary",
-"Gilles Saint-Paul ",
-"Gino Gancia",
-"Giora Hanoch",
-"Giordano Mion",
-"Giorgio Barba Navaretti",
-"Giorgio Brunello ",
-"Giorgio Calzolari",
-"Giorgio Fagiolo ",
-"Giorgio Topa ",
-"Giorgio Valente",
-"Giorgio E. Primiceri ",
-"Giovanni Cerulli",
-"Giovanni Dell'ariccia ",
-"Giovanni Di Bartolomeo",
-"Giovanni Dosi ",
-"Giovanni Facchini ",
-"Giovanni Ferri ",
-"Giovanni Gallipoli",
-"Giovanni Lombardo",
-"Giovanni Mastrobuoni",
-"Giovanni Peri ",
-"Giovanni Pica",
-"Giovanni Urga",
-"Giovanni Andrea Cornia",
-"Giovanni Luca Violante ",
-"Giovanni S.F. Bruno",
-"Giray Gozgor",
-"Gita Gopinath ",
-"Giulio Bottazzi",
-"Giulio Fella",
-"Giuseppe Bertola ",
-"Giuseppe Cavaliere",
-"Giuseppe Moscarini ",
-"Giuseppe Nicoletti ",
-"Glenn Ellison ",
-"Glenn MacDonald",
-"Glenn Schepens",
-"Glenn C Blomquist",
-"Glenn Cartman Loury ",
-"Glenn D. Rudebusch ",
-"Glenn Paul Jenkins ",
-"Glenn W. Harrison ",
-"Goetz von Peter",
-"Gordon Hanson ",
-"Gordon B. Dahl ",
-"Gordon C. Rausser ",
-"Gordon J. Alexander",
-"Gordon M. Bodnar",
-"Gordon M. Phillips ",
-"Govinda R. Timilsina",
-"Graciela Chichilnisky ",
-"Graciela Laura Kaminsky ",
-"Graeme Guthrie",
-"Graham Bird ",
-"Graham Elliott ",
-"Graham Loomes ",
-"Grayham E. Mizon",
-"Graziella Bertocchi",
-"Greg Duffee",
-"Greg John Duncan ",
-"Greg Warren Kaplan ",
-"Gregor W. Smith ",
-"Gregory Chow ",
-"Gregory Clark ",
-"Gregory Connor",
-"Gregory Ponthiere",
-"Gregory Udell ",
-"Gregory Dawson Hess ",
-"Gregory S Crawford",
-"Gregory W. Huffman ",
-"Guanghua Wan",
-"Guay C. Lim",
-"Gueorgui Kambourov",
-"Guglielmo Barone",
-"Guglielmo Weber ",
-"Guido Ascari ",
-"Guido Cozzi ",
-"Guido Friebel",
-"Guido Heineck",
-"Guido Imbens ",
-"Guido Lorenzoni ",
-"Guido Menzio ",
-"Guido Schwerdt",
-"Guido Tabellini ",
-"Guido Gustavo Porto",
-"Guido M. Kuersteiner",
-"Guillaume Gaulier",
-"Guillaume Plantin",
-"Guillaume Rocheteau ",
-"Guillaume Vandenbroucke",
-"Guillaume R. Frechette",
-"Guillermo Cruces",
-"Guillermo A. Calvo ",
-"Guillermo Javier Vuletin",
-"Guillermo L. Ordonez",
-"Gunnar S. Eskeland",
-"Gunter Coenen ",
-"Gunther Schnabl ",
-"Gunther G. Schulze",
-"Guntram Wolff ",
-"Guofu Tan",
-"Guofu Zhou ",
-"Guojun Wu",
-"Guoqiang Tian",
-"Gur Huberman ",
-"Gustav Feichtinger",
-"Gustavo Suarez",
-"Gustavo Yamada ",
-"Gustavo A. Crespi",
-"Gustavo J. Bobonis",
-"Gustavo Jaime Ventura ",
-"Guttorm Schjelderup",
-"Guy Debelle",
-"Guy Lacroix",
-"Guy Laroque ",
-"Guy Michaels ",
-"Guyonne Kalb",
-"Gylfi Zoega ",
-"H. Peter Boswijk",
-"H. Peyton Young ",
-"Ha-Joon Chang",
-"Hadi Salehi Esfahani",
-"Hafedh Bouakez",
-"Hai Yang ",
-"Hai-Jun Huang",
-"Hakan Yilmazkuday",
-"Hakan J Holm",
-"Hal Hill",
-"Hal Ronald Varian ",
-"Hali Edison ",
-"Halvor Mehlum ",
-"Hamid Beladi ",
-"Hamid Faruqee",
-"Hamid Mehran ",
-"Hamid Sabourian",
-"Hamish Low ",
-"Han Hong ",
-"Hanan Jacoby ",
-"Hanming Fang ",
-"Hannes Winner",
-"Hanno Lustig ",
-"Hans Bloemen",
-"Hans Carlsson",
-"Hans Degryse ",
-"Hans Dewachter",
-"Hans Fehr",
-"Hans Genberg",
-"Hans Gersbach ",
-"Hans Loof",
-"Hans J.M. Peters ",
-"Hans Jarle Kind",
-"Hans K. Hvide",
-"Hans-Joachim Voth ",
-"Hans-Martin Krolzig",
-"Hans-Theo Normann ",
-"Hans-Ulrich Brautzsch",
-"Hans-Werner Sinn ",
-"Hao Li",
-"Hao Zhou ",
-"Harald Badinger",
-"Harald Hau ",
-"Harald Uhlig ",
-"Harold Alderman ",
-"Harold James",
-"Harold Huibing Zhang",
-"Harold Linh Cole ",
-"Haroon Mumtaz ",
-"Harounan Kazianga",
-"Harris Dellas ",
-"Harris Selod",
-"Harrison Hong ",
-"Harry Bloch",
-"Harry Flam",
-"Harry Garretsen ",
-"Harry Anthony Patrinos ",
-"Harry J Paarsch ",
-"Harry J. Holzer ",
-"Harry M. Kaiser",
-"Harry M. Markowitz ",
-"Harry P. Huizinga ",
-"Hartmut Egger",
-"Hartmut Lehmann",
-"Harvey Rosen ",
-"Harvey E. Lapan ",
-"Hashmat U Khan",
-"Hassan Benchekroun",
-"Hayne Ellis Leland ",
-"Heather M. Anderson",
-"Heather North Royer",
-"Heidi L. Williams ",
-"Heinrich W. Ursprung ",
-"Heinz Welsch ",
-"Heinz D. Kurz",
-"Helen Simpson",
-"Helen F. Ladd",
-"Helen H. Jensen",
-"Helena Skyt Nielsen",
-"Helene Rey ",
-"Helge Berger",
-"Helmut Bester ",
-"Helmut Lutkepohl ",
-"Helmut Rainer",
-"Helmut Reisen",
-"Helmut Stix",
-"Helmuth Cremer ",
-"Hendrik Bessembinder ",
-"Hendrik Juerges",
-"Heng-Fu Zou ",
-"Henk Folmer",
-"Henning Bohn ",
-"Henri Servaes ",
-"Henri Sterdyniak ",
-"Henri L.F. de Groot ",
-"Henrik Cronqvist",
-"Henrik Hansen ",
-"Henrik Horn ",
-"Henrik Jensen",
-"Henry Ohlsson",
-"Henry Saffer",
-"Henry Tulkens ",
-"Henry E. Siu",
-"Henry G. Overman ",
-"Henry J. Aaron",
-"Henry Richard Hyatt",
-"Herbert Gintis ",
-"Herbert G. Grubel",
-"Herman J. Bierens ",
-"Herman K. van Dijk ",
-"Hernando Zuleta",
-"Herve Le Bihan ",
-"Herve Moulin ",
-"Heski Bar-Isaac",
-"Hessel Oosterbeek ",
-"Hiau Looi Kee",
-"Hidehiko Ichimura ",
-"Hideo Konishi ",
-"Hilary A. Sigman",
-"Hilary Williamson Hoynes ",
-"Hilde C. Bjornland",
-"Hillel Rapoport ",
-"Hippolyte d'Albis",
-"Hiro Ito ",
-"Hiroyuki Kasahara",
-"Hitoshi Matsushima ",
-"Holger Breinlich",
-"Holger Gorg ",
-"Holger Strulik ",
-"Holly Sutherland",
-"Hongbin Cai",
-"Hongbin Li ",
-"Hongyi Li",
-"Hooi Hooi Lean ",
-"Horacio Sapriza",
-"Horst Raff",
-"Howard Bodenhorn",
-"Howard White",
-"Howard J. Wall",
-"Hoyt Bleakley ",
-"Hrabrin Ianouchev Bachev",
-"Hrishikesh D. Vinod",
-"Hua He",
-"Hua Wang",
-"Hubert Kempf",
-"Huberto M. Ennis",
-"Hugh Gravelle ",
-"Hugh Rockoff ",
-"Hugo A. Hopenhayn ",
-"Hugo F. Sonnenschein ",
-"Hugo Rolando Nopo",
-"Hui Chen",
-"Hui Guo",
-"Hui Tong",
-"Huining Henry Cao",
-"Hulya K. K. Eraslan",
-"Hung-Jen Wang",
-"Hunt Allcott",
-"Huw Lloyd-Ellis",
-"Huw Pill",
-"Huw David Dixon ",
-"Hylke Vandenbussche",
-"Hyun Song Shin ",
-"Hyungsik Roger Moon ",
-"Iain Fraser",
-"Iain M. Cockburn ",
-"Ian Crawford",
-"Ian Domowitz ",
-"Ian Gale",
-"Ian Jewitt",
-"Ian Parry ",
-"Ian Tonks",
-"Ian Walker ",
-"Ian Wooton",
-"Ian J. Bateman ",
-"Ian Louis Dew-Becker",
-"Ian Martin McDonald",
-"Ian Paul King",
-"Ian Peter Preston ",
-"Ian W Marsh",
-"Ichiro Iwasaki",
-"Iftekhar Hasan ",
-"Ignacio Hernando",
-"Ignacio Palacios-Huerta",
-"Ignacio Velez-Pareja",
-"Ignacio N. Lobato",
-"Ignatius J. Horstmann",
-"Ignazio Angeloni ",
-"Iikka Korhonen",
-"Ilan Goldfajn",
-"Ilan Noy ",
-"Ilhan Ozturk ",
-"Ilhyock Shim",
-"Ilian Mihov ",
-"Ilya A. Strebulaev",
-"Iman Van Lelyveld",
-"Imran Rasul ",
-"Imre Ferto",
-"Ina Simonovska",
-"Ines Macho-Stadler",
-"Inessa Love ",
-"Ingmar R. Prucha ",
-"Ingo Vogelsang",
-"Inmaculada Martinez-Zarzoso ",
-"Ioana Elena Marinescu",
-"Iourii Manovskii ",
-"Ippei Fujiwara",
-"Ira N. Gang ",
-"Iris Bohnet",
-"Isaac Ehrlich ",
-"Isaac Sorkin",
-"Isaac M. Mbiti",
-"Isabel Correia",
-"Isabel Schnabel",
-"Isabelle Jeanne Mejean",
-"Itzhak Ben-David ",
-"Itzhak Gilboa ",
-"Itzhak Zilcha ",
-"Ivan Fernandez-Val ",
-"Ivan Hascic",
-"Ivan Petrella",
-"Ivan Werning ",
-"Ivan Alexis Canay",
-"Ivan Kumanov",
-"Ivan P.L. Png",
-"Ivana Komunjer",
-"Ivo Welch ",
-"Iwan Barankay",
-"J. Bradford Jensen ",
-"J. David Brown",
-"J. Doyne Farmer",
-"J. Edward Taylor ",
-"J. Huston McCulloch",
-"J. Ignacio Conde-Ruiz",
-"J. Ignacio Garcia Perez",
-"J. Miguel Villas-Boas",
-"J. Peter Neary ",
-"J. S. Butler",
-"J. Scott Armstrong ",
-"J. Stephen Ferris",
-"J. Vernon Henderson ",
-"J.Paul Elhorst ",
-"Jaap H. Abbring",
-"Jacinta Chikaodi Nwachukwu",
-"Jack Knetsch ",
-"Jack Meyer",
-"Jack Strauss",
-"Jack M. Mintz ",
-"Jack P.C. Kleijnen",
-"Jackline Wahba",
-"Jacob Glazer",
-"Jacob Vigdor ",
-"Jacob Antoon Bikker ",
-"Jacob K Goeree ",
-"Jacob Louis Weisdorf ",
-"Jacques Cremer ",
-"Jacques Le Cacheux ",
-"Jacques Mairesse ",
-"Jacques Melitz ",
-"Jacques Poot ",
-"Jacques Silber",
-"Jacques François Thisse ",
-"Jacques H. Dreze ",
-"Jae Song ",
-"Jae Hoon Kim",
-"Jae W. Sim",
-"Jaewoo Lee",
-"Jagadeesh Sivadasan",
-"Jagjit S. Chadha",
-"Jaime A.P. de Melo ",
-"Jaime Alfredo Bonet ",
-"Jakob Svensson ",
-"Jakob de Haan ",
-"Jakob B. Madsen ",
-"Jakob Roland Munch",
-"Jamal Bouoiyour ",
-"James Albrecht ",
-"James Alm ",
-"James Andreoni ",
-"James Banks ",
-"James Bergin",
-"James Bessen",
-"James Bullard ",
-"James Bushnell ",
-"James Dow",
-"James Fenske",
-"James Hamilton ",
-"James Harrigan ",
-"James Konow",
-"James Levinsohn ",
-"James MacKinnon ",
-"James Mitchell",
-"James Morley",
-"James Peck",
-"James Pesando",
-"James Poterba ",
-"James Schmitz ",
-"James Thurlow",
-"James Vickery",
-"James Yetman",
-"James A Kahn ",
-"James A. Brander ",
-"James A. Roumasset",
-"James Alan Robinson ",
-"James B. Ang ",
-"James B. Rebitzer ",
-"James B. Thomson",
-"James Bott McDonald",
-"James Bradford DeLong ",
-"James Byron Davies ",
-"James C. Cox ",
-"James D. Adams ",
-"James D. Dana Jr.",
-"James Dana Fearon ",
-"James Donald Feyrer ",
-"James E West",
-"James E. Anderson ",
-"James E. Foster ",
-"James E. H. Davidson ",
-"James E. Payne ",
-"James E. Rauch ",
-"James E. Wilen",
-"James H. Stock ",
-"James J. Heckman ",
-"James J. Murphy",
-"James Jinwoo Choi ",
-"James Joseph McAndrews ",
-"James K. Hammitt ",
-"James L. Smith",
-"James M Malcomson ",
-"James M. Nason ",
-"James M. Snyder Jr.",
-"James Marvin Walker ",
-"James P. LeSage ",
-"James P. Smith ",
-"James P. Ziliak",
-"James R. Brown",
-"James R. Hines Jr.",
-"James R. Lothian ",
-"James R. Markusen ",
-"James R. Melvin",
-"James R. Spletzer",
-"James R. Tybout ",
-"James R. Walker",
-"James Raymond Vreeland",
-"James Samuel Cloyne",
-"James W Friedman",
-"James Xavier Sullivan",
-"Jan Babecky",
-"Jan Boone ",
-"Jan Eeckhout ",
-"Jan Fidrmuc",
-"Jan Hanousek ",
-"Jan Jacobs",
-"Jan Kregel ",
-"Jan Potters ",
-"Jan Rouwendal",
-"Jan Svejnar ",
-"Jan Tuinstra",
-"Jan Zabojnik",
-"Jan in 't Veld",
-"Jan van Ours ",
-"Jan Ernst Fagerberg ",
-"Jan F. Kiviet ",
-"Jan J. J. Groen",
-"Jan K. Brueckner ",
-"Jan K. De Loecker ",
-"Jan Leonard Stuhler",
-"Jan Luiten van Zanden",
-"Jan Pieter Krahnen",
-"Jan R. Magnus ",
-"Jan Willem Gunning ",
-"Jan-Egbert Sturm ",
-"Jane G. Gravelle",
-"Janet Currie ",
-"Janet L. Yellen ",
-"Jang-Ting Guo",
-"Janice Eberly",
-"Janine Aron",
-"Janos Kornai ",
-"Jared Rubin",
-"Jaren C. Pope",
-"Jarkko Turunen",
-"Jarko Fidrmuc",
-"Jarrad Harford ",
-"Jasmina Arifovic",
-"Jason Abrevaya",
-"Jason Faberman",
-"Jason Fletcher ",
-"Jason Shogren ",
-"Jason M. Lindo",
-"Jaume Ventura ",
-"Javier Andres",
-"Javier Bianchi ",
-"Javier Diaz-Gimenez",
-"Javier Gardeazabal",
-"Javier Miranda ",
-"Javier Ruiz-Castillo",
-"Javier Suarez ",
-"Javier Valles",
-"Javier G. Gomez-Pineda",
-"Javier J. Perez",
-"Jay Shanken ",
-"Jay C. Shambaugh ",
-"Jay P. Shimshack",
-"Jay Pil Choi ",
-"Jay R. Ritter ",
-"Jayant Menon",
-"Jayasri Dutta",
-"Jayson L. Lusk ",
-"Jean Boivin ",
-"Jean Gabszewicz ",
-"Jean Hindriks",
-"Jean Pisani-Ferry",
-"Jean Tirole ",
-"Jean Charles Rochet ",
-"Jean M. Imbs ",
-"Jean-Christophe Bureau",
-"Jean-Claude Berthelemy",
-"Jean-Francois Hennart",
-"Jean-Francois Laslier",
-"Jean-Francois Richard ",
-"Jean-Guillaume Sahuc",
-"Jean-Louis Arcand",
-"Jean-Louis Combes",
-"Jean-Luc Gaffard",
-"Jean-Marc Robin ",
-"Jean-Marc Tallon",
-"Jean-Marie Baland ",
-"Jean-Marie Dufour ",
-"Jean-Michel Grandmont ",
-"Jean-Michel Zakoian ",
-"Jean-Olivier Hairault",
-"Jean-Pascal Benassy ",
-"Jean-Paul Azam",
-"Jean-Paul Chavas ",
-"Jean-Paul Fitoussi ",
-"Jean-Philippe Platteau",
-"Jean-Pierre Danthine ",
-"Jean-Pierre Florens",
-"Jean-Robert Tyran ",
-"Jean-Yves Duclos ",
-"Jed Kolko",
-"Jeff Dominitz",
-"Jeff Frank",
-"Jeff E. Biddle",
-"Jeffrey Carpenter ",
-"Jeffrey Dorfman",
-"Jeffrey Lacker",
-"Jeffrey Lin",
-"Jeffrey Mackie-Mason",
-"Jeffrey Milyo",
-"Jeffrey Pontiff",
-"Jeffrey Wurgler ",
-"Jeffrey Zabel",
-"Jeffrey Zax",
-"Jeffrey A Miron ",
-"Jeffrey Alexander Frankel ",
-"Jeffrey Andrew Smith ",
-"Jeffrey B. Liebman ",
-"Jeffrey B. Nugent ",
-"Jeffrey C. Ely ",
-"Jeffrey C. Fuhrer ",
-"Jeffrey Gale Williamson ",
-"Jeffrey H. Bergstrand ",
-"Jeffrey H. Harris",
-"Jeffrey L. Coles ",
-"Jeffrey M. Perloff ",
-"Jeffrey Marc Wooldridge ",
-"Jeffrey P. Clemens",
-"Jeffrey R. Campbell ",
-"Jeffrey Richard Kling ",
-"Jeffrey Robert Brown ",
-"Jeffrey Scott Racine ",
-"Jeffrey Stuart Hammer",
-"Jeffrey T. Grogger ",
-"Jeffrey Thomas LaFrance",
-"Jeffrey William Bennett",
-"Jennifer Hunt ",
-"Jennifer Roberts",
-"Jennifer F. Reinganum ",
-"Jennifer M. Mellor",
-"Jens Hainmueller ",
-"Jens Hilscher",
-"Jens Suedekum ",
-"Jens Matthias Arnold",
-"Jere Richard Behrman ",
-"Jeremy Fox",
-"Jeremy Greenwood ",
-"Jeremy Lise",
-"Jeremy Smith",
-"Jeremy Tobacman",
-"Jeremy C. Stein ",
-"Jeremy Edmund Clark",
-"Jeremy M. Piger ",
-"Jeroen Swinkels ",
-"Jeroen C.J.M. van den Bergh ",
-"Jeroen Vk Rombouts",
-"Jerold Zimmerman",
-"Jerome Adda ",
-"Jerome Creel ",
-"Jeromin Zettelmeyer ",
-"Jerry Coakley",
-"Jerry Green ",
-"Jerry A. Hausman ",
-"Jerry G. Thursby ",
-"Jesper Linde ",
-"Jesper Roine",
-"Jess Benhabib ",
-"Jesse Rothstein ",
-"Jesse M. Shapiro ",
-"Jessica Pan",
-"Jessica A. Wachter ",
-"Jesus Crespo Cuaresma ",
-"Jesus Felipe",
-"Jesus Fernandez-Huertas Moraga",
-"Jesus Fernandez-Villaverde ",
-"Jesus Gonzalo ",
-"Jian Yang",
-"Jianjun Miao ",
-"Jianping Mei",
-"Jianqing Fan ",
-"Jidong Zhou",
-"Jie Gan",
-"Jie Zhang",
-"Jihai Yu",
-"Jikun Huang ",
-"Jill J. McCluskey",
-"Jim Malley",
-"Jin-Li Hu",
-"Jin-Tan Liu",
-"Jing Zhang",
-"Jing Cynthia Wu ",
-"Jinhua Zhao",
-"Jinill Kim",
-"Jiri Slacalek",
-"Jishnu Das",
-"Jiti Gao ",
-"Jo Thori Lind",
-"Joachim De Weerdt",
-"Joachim Schleich",
-"Joachim Wagner ",
-"Joachim Weimann",
-"Joachim von Braun ",
-"Joachim Klaus Winter ",
-"Joakim Westerlund ",
-"Joan Costa-Font ",
-"Joan Esteban ",
-"Joann Jasiak",
-"Joanna Stavins",
-"Joanna Tyrowicz",
-"Joanne Blanden",
-"Joao Santos ",
-"Joao F Gomes",
-"Joao M.C. Santos Silva ",
-"Joao Pedro Azevedo ",
-"Joao Ricardo Faria",
-"Joao Tovar Jalles ",
-"Joao Victor Issler",
-"Joaquim Silvestre",
-"Joaquin Maudos",
-"Joaquin Vespignani",
-"Jochen Kluve",
-"Jock R. Anderson",
-"Joe Peek ",
-"Joe A. Stone",
-"Joel Peress",
-"Joel Shapiro",
-"Joel Slemrod ",
-"Joel Sobel ",
-"Joel Waldfogel ",
-"Joel Watson ",
-"Joel L. Horowitz ",
-"Joep Sonnemans ",
-"Joerg Baten ",
-"Joern H. Block",
-"Joffre Dan Swait Jr.",
-"Johan Fourie",
-"Johan Swinnen ",
-"Johanna Wallenius",
-"Johannes Horner ",
-"Johannes Stroebel",
-"Johannes Van Biesebroeck ",
-"Johannes F. Schmieder ",
-"Johannes Friedrich Wieland",
-"Johannes Wolfgang Fedderke",
-"John Addison ",
-"John Asker",
-"John Baffes",
-"John Barron ",
-"John Bound ",
-"John Burbidge",
-"John Cantwell",
-"John Cawley ",
-"John Cotter",
-"John Creedy ",
-"John Duffy ",
-"John Duggan",
-"John Elder",
-"John Ermisch ",
-"John Fernald ",
-"John Foster",
-"John Gathergood",
-"John Geweke ",
-"John Gibson ",
-"John Gilbert ",
-"John Giles",
-"John Goddard",
-"John Gowdy",
-"John Hagedoorn",
-"John Haltiwanger ",
-"John Hassler ",
-"John Hoddinott ",
-"John Hudson",
-"John Kennan ",
-"John Leahy ",
-"John List ",
-"John Loomis ",
-"John McCallum",
-"John Micklewright ",
-"John Moore ",
-"John Morgan ",
-"John Muellbauer ",
-"John Mullahy ",
-"John Pencavel ",
-"John Piggott",
-"John Ries ",
-"John Roberts ",
-"John Roemer ",
-"John Romalis ",
-"John Schmitt",
-"John Shea",
-"John Simon",
-"John Strauss ",
-"John Tatom",
-"John Thornton",
-"John Tschirhart",
-"John Vickers ",
-"John Weinberg",
-"John Whalley ",
-"John Wooders",
-"John Yinger ",
-"John A. Knowles",
-"John Allan Weymark ",
-"John B Knight ",
-"John B. Taylor ",
-"John Bailey Jones ",
-"John C. Anyanwu",
-"John C. Driscoll ",
-"John C. Frain",
-"John C. Quiggin ",
-"John C. Whitehead ",
-"John C. Williams ",
-"John Christopher Beghin ",
-"John D. Fitzgerald",
-"John David Cummins ",
-"John Denis Hey ",
-"John Douglas Wilson ",
-"John Edward McLaren ",
-"John F. Helliwell ",
-"John F. McDonald ",
-"John F. O. Bilson",
-"John G. Matsusaka ",
-"John Graham Riley ",
-"John H. Cochrane ",
-"John H. Kagel ",
-"John H. Komlos ",
-"John H. Rogers ",
-"John Harold Williamson ",
-"John J. Donohue ",
-"John J. Seater ",
-"John J. Siegfried ",
-"John K. Dagsvik",
-"John K.-H. Quah ",
-"John Karl Scholz ",
-"John Kevin Stranlund",
-"John Leonard Pender",
-"John M. Abowd ",
-"John M. Antle",
-"John M. Clapp",
-"John M. Hartwick ",
-"John M. Maheu",
-"John M. Roberts ",
-"John Mark Ramseyer",
-"John Matthew Reilly",
-"John Matthew Rose",
-"John Michael van Reenen ",
-"John N. Friedman ",
-"John O. Ledyard ",
-"John O.S. Wilson",
-"John P. Haisken-DeNew",
-"John Patrick Conley",
-"John Paul Dunne",
-"John Philip Rust ",
-"John Preston Laitner ",
-"John Robert Krainer",
-"John Russel Baldwin ",
-"John S. Heywood ",
-"John Stanley Metcalfe",
-"John Stuart Landreth McCombie",
-"John Sutherland Earle",
-"John T. Cuddington",
-"John T. Warner",
-"John Troy Scott",
-"John V. Duca ",
-"John V. Pepper",
-"John V. Winters",
-"John W. Galbraith",
-"John William Freebairn",
-"John Y. Campbell ",
-"Jon Danielsson",
-"Jon Elster",
-"Jon Faust ",
-"Jon Steinsson ",
-"Jon Strand",
-"Jon P. Nelson",
-"Jonah B. Gelbach ",
-"Jonas Dovern",
-"Jonas Vlachos",
-"Jonas D.M. Fisher ",
-"Jonathan Brogaard",
-"Jonathan Chiu",
-"Jonathan Eaton ",
-"Jonathan Feinstein",
-"Jonathan Gruber ",
-"Jonathan Guryan ",
-"Jonathan Heathcote ",
-"Jonathan Levin ",
-"Jonathan Meer",
-"Jonathan Morduch ",
-"Jonathan Reuter",
-"Jonathan Robinson ",
-"Jonathan Skinner ",
-"Jonathan Temple ",
-"Jonathan Thomas ",
-"Jonathan Wadsworth ",
-"Jonathan Zinman ",
-"Jonathan A. Parker ",
-"Jonathan Andrew Batten",
-"Jonathan David Ostry ",
-"Jonathan E. Haskel ",
-"Jonathan E. Vogel",
-"Jonathan H. Hamilton",
-"Jonathan H. Wright ",
-"Jonathan L. Willis",
-"Jonathan Mark Karpoff ",
-"Jonathan S. Leonard",
-"Jong-Wha Lee ",
-"Joni Hersch",
-"Joon Y. Park ",
-"Joop Hartog ",
-"Joost Driessen",
-"Jordan Rappaport",
-"Jordi Brandts ",
-"Jordi Caballe",
-"Jordi Gali ",
-"Jordi Jaumandreu",
-"Jordi Surinach",
-"Jorg Breitung ",
-"Jorg Oechssler ",
-"Jorg Stoye",
-"Jorge Martinez-Vazquez ",
-"Jorgen W. Weibull ",
-"Joris Pinkse",
-"Jorn Rattso",
-"Jorn-Steffen Pischke ",
-"Jos van Ommeren ",
-"Joscha Beckmann",
-"Jose Apesteguia",
-"Jose De Gregorio ",
-"Jose Mata ",
-"Jose Tavares ",
-"Jose A. Lopez ",
-"Jose Alberto Molina",
-"Jose Alexandre Scheinkman ",
-"Jose Antonio Ocampo ",
-"Jose Antonio Ferreira Machado",
-"Jose Eduardo Gomez-Gonzalez",
-"Jose Luis Moraga-Gonzalez",
-"Jose Luis Zofio",
-"Jose M. Labeaga",
-"Jose Manuel Campa ",
-"Jose-Luis Peydro ",
-"Jose-Victor Rios-Rull ",
-"Josef Falkinger",
-"Josef Zechner ",
-"Josef Zweimuller ",
-"Josef C. Brada ",
-"Josep Pijoan-Mas",
-"Josep Lluis Carrion-i-Silvestre",
-"Joseph Farrell ",
-"Joseph Gyourko ",
-"Joseph Haslag",
-"Joseph Haubrich ",
-"Joseph Henrich",
-"Joseph Ostroy ",
-"Joseph Persky",
-"Joseph Price",
-"Joseph Tracy ",
-"Joseph Vavra",
-"Joseph Zeira ",
-"Joseph A. Herriges Sr.",
-"Joseph E. Aldy ",
-"Joseph E. Gagnon ",
-"Joseph E. Harrington Jr.",
-"Joseph E. Stiglitz ",
-"Joseph Francis Francois ",
-"Joseph G. Altonji ",
-"Joseph Gerson Pearlman",
-"Joseph P. Hughes",
-"Joseph P. Kaboski ",
-"Joseph P. Newhouse ",
-"Joseph Vincent Terza",
-"Josh Lerner ",
-"Joshua Aizenman ",
-"Joshua Gans ",
-"Joshua Goodman",
-"Joshua Graff Zivin ",
-"Joshua Linn ",
-"Joshua Rosenberg",
-"Joshua Schwartzstein",
-"Joshua C. Hall",
-"Joshua C.C. Chan",
-"Joshua D Angrist ",
-"Joshua D. Gottlieb",
-"José Manuel Barrueco Cruz",
-"Jouchi Nakajima",
-"Jouko Vilmunen",
-"Joydeep Bhattacharya",
-"Joze P. Damijan",
-"Jozef Barunik",
-"Jozef Konings ",
-"Jozsef Sakovics",
-"Juan Dubra",
-"Juan Carlos Conesa",
-"Juan Carlos Escanciano",
-"Juan Carlos Cordoba",
-"Juan Carlos Cuestas",
-"Juan Carlos Hallak",
-"Juan Carlos Hatchondo",
-"Juan Carlos Reboredo ",
-"Juan D. Moreno-Ternero",
-"Juan F Jimeno ",
-"Juan F Rubio-Ramirez ",
-"Juan Fernando Vargas",
-"Juan J. Dolado ",
-"Juan M. Sanchez",
-"Juan Pablo Nicolini ",
-"Juan-Camilo Cardenas ",
-"Juan-Pablo Montero ",
-"Judith Ann Chevalier ",
-"Judith K. Hellerstein",
-"Juergen von Hagen ",
-"Jukka Pirttila",
-"Julapa A. Jagtiani",
-"Jules Hans van Binsbergen",
-"Julia Lane ",
-"Julia Kathryn Thomas",
-"Julia Maria Woerz",
-"Julian Messina ",
-"Julian Wright ",
-"Julian di Giovanni ",
-"Julian M. Alston ",
-"Julie Le Gallo ",
-"Julie Nelson",
-"Julie Berry Cullen",
-"Julie L. Hotchkiss",
-"Julien Chevallier ",
-"Julien Matheron",
-"Julien Prat",
-"Julio D. Raffo",
-"Jun Ishii",
-"Jun Liu",
-"Jun Qian",
-"Jun Yu ",
-"Juncal Cunado",
-"Jungmin Lee",
-"Junsen Zhang ",
-"Junsoo Lee ",
-"Jurgen Eichberger",
-"Jurgen Schupp ",
-"Jurgen A. Doornik",
-"Jushan Bai ",
-"Justin Tobias",
-"Justin Wolfers ",
-"Justin R. Pierce",
-"Justin Yifu Lin ",
-"Justina A. V. Fischer",
-"Justine S. Hastings",
-"Justus Haucap ",
-"Juuso Valimaki ",
-"Jyotsna Jalan",
-"K. Geert Rouwenhorst ",
-"Kaddour Hadri",
-"Kai Carstensen",
-"Kai Li",
-"Kai A. Konrad ",
-"Kaiji Chen",
-"Kaivan Munshi ",
-"Kajal Lahiri ",
-"Kala Krishna ",
-"Kaliappa Kalirajan",
-"Kalin Ognianov Nikolov",
-"Kamal Saggi ",
-"Kamiar Mohaddes",
-"Kamil Yilmaz ",
-"Karel Janda",
-"Karel Mertens ",
-"Karen Palmer ",
-"Karen Pence",
-"Karen A. Kopecky",
-"Karen Helene Ulltveit-Moe",
-"Karin S. Thorburn",
-"Karine Nyborg",
-"Karl Aiginger ",
-"Karl Schmedders",
-"Karl Shell ",
-"Karl Taylor",
-"Karl Whelan ",
-"Karl H. Schlag",
-"Karl Ove Moene ",
-"Karla Hoff",
-"Karolina Ekholm",
-"Karsten Staehr",
-"Karsten Michael Neuhoff ",
-"Karthik Muralidharan ",
-"Kartik Athreya",
-"Katarina Juselius ",
-"Kate Ho",
-"Kate Phylaktis",
-"Katharina Wrohlich",
-"Katharina Christa Spiess",
-"Katharine Gail Abraham ",
-"Kathleen Beegle",
-"Kathleen McGarry ",
-"Kathleen Segerson ",
-"Kathleen Weiss Hanley",
-"Kathryn Graddy",
-"Kathryn Shaw ",
-"Kathryn Mary Elizabeth Dominguez ",
-"Kathy Yuan",
-"Katrin Hussinger",
-"Katrin Rehdanz",
-"Katrine Vellesen Loken",
-"Katsumi Shimotsu",
-"Katsushi S. Imai",
-"Kaushik Basu ",
-"Kaushik Mitra",
-"Kaz Miyagiwa",
-"Kazunobu Hayakawa",
-"Kazuo Mino",
-"Kazuo Nishimura ",
-"Kazuo Ueda",
-"Kazuyuki Motohashi",
-"Kei-Mu Yi ",
-"Keijiro Otsuka ",
-"Keisuke Hirano ",
-"Keith Blackburn",
-"Keith Hartley",
-"Keith Head ",
-"Keith Ihlanfeldt ",
-"Keith Kuester ",
-"Keith Sill",
-"Keith E. Maskus ",
-"Keith H. Coble",
-"Keith M Marzilli Ericson",
-"Keld Laursen",
-"Kelly Bedard",
-"Kelvin George Balcombe",
-"Kenneth Burdett ",
-"Kenneth Chay ",
-"Kenneth Kasa",
-"Kenneth Kletzer ",
-"Kenneth Mcconnell",
-"Kenneth Singleton ",
-"Kenneth Train ",
-"Kenneth A. Couch",
-"Kenneth A. Froot ",
-"Kenneth A. Small ",
-"Kenneth D. Garbade",
-"Kenneth D. West ",
-"Kenneth Frank Wallis ",
-"Kenneth John Button ",
-"Kenneth L. Judd ",
-"Kenneth L. Leonard",
-"Kenneth Neil Kuttner ",
-"Kenneth R. Ahern",
-"Kenneth R. French ",
-"Kenneth R. Troske ",
-"Kenneth S Rogoff ",
-"Kenneth S. Corts",
-"Kenneth Thomas Gillingham",
-"Kenneth W. Clements",
-"Kent Smetters",
-"Kent Gerard Matthews",
-"Keun Lee",
-"Kevin Grier",
-"Kevin Lang ",
-"Kevin McCabe ",
-"Kevin Milligan ",
-"Kevin Roberts ",
-"Kevin Stiroh ",
-"Kevin Allen Hassett ",
-"Kevin Charles Lee",
-"Kevin D. Hoover ",
-"Kevin F. Hallock ",
-"Kevin Hjortshoj O'Rourke ",
-"Kevin J. Boyle",
-"Kevin J. Fox",
-"Kevin J. Lansing ",
-"Kevin J. Murphy ",
-"Kevin John Denny",
-"Kevin Keith Sheppard",
-"Kevin L. Kliesen",
-"Kevin M. Murphy ",
-"Kevin N. Cowan",
-"Kevin X. D. Huang",
-"Kewei Hou",
-"Kfir Eliaz",
-"Khalid Sekkat ",
-"Kim Oosterlinck",
-"Kim Joseph Ruhl ",
-"Kim P. Huynh",
-"Kimberly A. Clausing",
-"Kiminori Matsuyama ",
-"Kirstin Hubrich",
-"Kishore Gawande",
-"Kjell Hausken ",
-"Kjell Arne Brekke",
-"Kjell Erik Lommerud",
-"Kjell G Salvanes ",
-"Kjell G. Nyborg",
-"Kjetil Storesletten ",
-"Kjetil Telle",
-"Klara Sabirianova Peter",
-"Klaus Abberger",
-"Klaus Abbink ",
-"Klaus Adam ",
-"Klaus Desmet ",
-"Klaus Gugler",
-"Klaus Prettner",
-"Klaus Rennings",
-"Klaus Schaeck",
-"Klaus Schmidt-Hebbel ",
-"Klaus Walde",
-"Klaus Wohlrabe ",
-"Klaus D. Nehring",
-"Klaus E. Meyer ",
-"Klaus F. Zimmermann ",
-"Klaus M. Schmidt ",
-"Klaus W. Deininger ",
-"Knick Harley",
-"Knut Roed ",
-"Knut Einar Rosendahl",
-"Koen Frenken ",
-"Koen Jochmans",
-"Koen Schoors",
-"Koichi Futagami",
-"Koichiro Ito",
-"Koji Shimomura",
-"Konstantin Sonin ",
-"Konstantin Arkadievich Kholodilin ",
-"Konstantinos Tatsiramos",
-"Konstantinos Theodoridis",
-"Kornelius Kraft",
-"Kosali Ilayperuma Simon",
-"Kose John ",
-"Kostas Tsatsaronis",
-"Kosuke Aoki",
-"Kozo Kiyota",
-"Krishna Kumar",
-"Krishna Pendakur",
-"Kristiaan H. J. Kerstens",
-"Kristian Behrens ",
-"Kristin Forbes ",
-"Kristin F. Butcher",
-"Kristoffer P. Nimark",
-"Kristopher Gerardi",
-"Kul B Luintel",
-"Kunal Sen",
-"Kurt Annen ",
-"Kurt Mitman",
-"Kurt Schmidheiny",
-"Kwanho Shin",
-"Kyle Bagwell ",
-"Kyle L. Handley",
-"Kym Anderson ",
-"Kyoji Fukao ",
-"L. Alan Winters ",
-"L. Rachel Ngai",
-"L. Randall Wray ",
-"L. Vanessa Smith",
-"Lajos Horvath",
-"Lakshmi Iyer",
-"Lance Lochner ",
-"Lans Bovenberg ",
-"Lant Pritchett ",
-"Larry Samuelson ",
-"Larry D. Wall",
-"Larry Dongxiao Qiu",
-"Larry E. Jones ",
-"Larry G. Epstein ",
-"Larry H. P. Lang ",
-"Larry S. Karp ",
-"Lars Ehlers",
-"Lars Lefgren ",
-"Lars Ljungqvist ",
-"Lars Norden",
-"Lars Persson",
-"Lars Sorgard",
-"Lars A Stole ",
-"Lars Birger Jonung ",
-"Lars E. O. Svensson ",
-"Lars P. Feld ",
-"Lars Patrick Nesheim",
-"Lars Peter Hansen ",
-"Lars Spencer Osberg",
-"Lasse Heje Pedersen ",
-"Laszlo Goerke",
-"Laszlo Halpern",
-"Lata Gangadharan ",
-"Laura Alfaro ",
-"Laura Bottazzi",
-"Laura Schechter",
-"Laura Veldkamp ",
-"Laura M. Giuliano",
-"Laura O. Taylor",
-"Laure Latruffe",
-"Laurence Ball ",
-"Laurence J. Kotlikoff ",
-"Laurence Marc Weiss",
-"Laurence R. Iannaccone",
-"Laurens Cherchye ",
-"Laurent Ferrara",
-"Laurent Gobillon ",
-"Laurent Linnemer",
-"Laurent Weill ",
-"Laurent E. Calvet ",
-"Laurie Simon Hodrick",
-"Lawrence Kahn ",
-"Lawrence Edward Blume ",
-"Lawrence F. Katz ",
-"Lawrence H. Summers ",
-"Lawrence J. Christiano ",
-"Lawrence J. White ",
-"Lawrence James Haddad",
-"Lawrence M. Seiford",
-"Lawrence W. Kenny",
-"Leah Platt Boustan ",
-"Leandro Prados de la Escosura",
-"Lee Edward Ohanian ",
-"Lee J. Alston",
-"Leif Danziger",
-"Leigh L. Linden",
-"Leigh S Tesfatsion ",
-"Lena Edlund",
-"Leo Kaas",
-"Leo K. Simon",
-"Leonard Isamu Nakamura",
-"Leonardo Becchetti ",
-"Leonardo Bursztyn ",
-"Leonardo Felli",
-"Leonardo Gambacorta ",
-"Leonardo Iacovone",
-"Leonardo Melosi",
-"Leonardo C. Gasparini",
-"Leonid Kogan",
-"Leopold Simar ",
-"Leopoldo Fergusson",
-"Leora Friedberg",
-"Leora F. Klapper ",
-"Les Oxley ",
-"Leslie Young",
-"Leslie E. Papke ",
-"Leslie George Godfrey ",
-"Lester Charles Hunt",
-"Lev Ratnovski",
-"Levon Barseghyan",
-"Lex Borghans ",
-"Li Gan",
-"Li-An Zhou",
-"Liangjun Su ",
-"Libertad Gonzalez",
-"Lieven Baele",
-"Lilia Maliar",
-"Liliana Rojas-Suarez",
-"Lin Zhou",
-"Lina Song",
-"Linda L. Tesar ",
-"Linda S. Goldberg ",
-"Linxiu Zhang",
-"Lion Hirth",
-"Lionel Fontagne ",
-"Lionel Nesta",
-"Lisa Barrow",
-"Lisa Lynch",
-"Lisa Ann Cameron",
-"Lisa B. Kahn ",
-"Lisa R. Anderson",
-"Lise Vesterlund ",
-"Liuren Wu ",
-"Livio Stracca ",
-"Lixin Colin Xu ",
-"Loet Leydesdorff ",
-"Lones Smith ",
-"Long Chen",
-"Loren Brandt ",
-"Lorenz Goette ",
-"Lorenzo Caliendo",
-"Lorenzo Cappellari ",
-"Lorenzo Forni",
-"Loretta J. Mester ",
-"Lori Beaman",
-"Loriana Pelizzon",
-"Lorin Moultrie Hitt ",
-"Lorne Hugh Carmichael",
-"Lorraine Dearden ",
-"Louis Eeckhoudt ",
-"Louis Kaplow ",
-"Louis Putterman ",
-"Louis John Maccini",
-"Louis N. Christofides",
-"Loukas Karabarbounis ",
-"Lu Zhang ",
-"Lu Zheng",
-"Lubos Pastor ",
-"Luc Anselin ",
-"Luc Arrondel",
-"Luc Bauwens ",
-"Luc Behaghel",
-"Luc Christiaensen ",
-"Luc Laeven ",
-"Luc Renneboog ",
-"Luc Savard",
-"Luc L. Soete ",
-"Luca Anderlini",
-"Luca Benati ",
-"Luca Dedola ",
-"Luca Flabbi",
-"Luca Fornaro",
-"Luca Gambetti ",
-"Luca Grilli",
-"Luca Guerrieri ",
-"Luca Lambertini ",
-"Luca Nunziata",
-"Luca Sala",
-"Luca Stanca",
-"Luca Antonio Ricci ",
-"Luca David Opromolla",
-"Lucas Bretschger",
-"Lucas W. Davis ",
-"Lucia Smith Foster ",
-"Lucian Bebchuk ",
-"Lucian Liviu Albu",
-"Luciano Fanti",
-"Lucio Sarno ",
-"Lucrezia Reichlin ",
-"Lucy F. Ackert",
-"Ludger Schuknecht ",
-"Ludger Woessmann ",
-"Luigi Guiso ",
-"Luigi Mittone",
-"Luigi Montrucchio",
-"Luigi Pistaferri ",
-"Luigi Siciliani ",
-"Luigi Zingales ",
-"Luis Garicano ",
-"Luis Orea",
-"Luis Serven ",
-"Luis A.V. Catao",
-"Luis Alberiko Gil-Alana ",
-"Luis C. Corchon",
-"Luis Eduardo Arango Thomas",
-"Luis Felipe Cespedes",
-"Luis Fernando Melo-Velandia",
-"Luis J. Alvarez",
-"Luis M B Cabral ",
-"Luis M. Viceira ",
-"Luisa Corrado",
-"Luisa Fuster",
-"Luisa Lambertini",
-"Luiz de Mello ",
-"Lukas Menkhoff ",
-"Lukas Vogel",
-"Lung-Fei Lee ",
-"Luojia Hu",
-"Lutz Bornmann ",
-"Lutz Hendricks",
-"Lutz Kilian ",
-"Lykke E. Andersen",
-"Lyn Squire ",
-"Lynda Khalaf",
-"Lynne G. Zucker",
-"M Hashem Pesaran ",
-"M Niaz Asadullah",
-"M. Ali Khan ",
-"M. Bumin Yenmez",
-"M. Daniele Paserman ",
-"M. Kabir Hassan ",
-"M. Scott Taylor ",
-"Maarten Janssen",
-"Maarten Lindeboom ",
-"Maarten van Rooij ",
-"Maarten L. Buis",
-"Madeline Zavodny ",
-"Madhu Khanna",
-"Magda ElSayed Kandil",
-"Magne Mogstad ",
-"Magnus Blomstrom ",
-"Magnus Henrekson ",
-"Magnus Johannesson ",
-"Magnus Lofstrom",
-"Mahvash Saeed Qureshi",
-"Maik Schmeling",
-"Maik Wolters",
-"Maitreesh Ghatak ",
-"Makoto Nakajima",
-"Makoto Yano",
-"Malcolm Baker ",
-"Malin Adolfson",
-"Mamoru Kaneko",
-"Manfred Zeller",
-"Manfred M. Fischer",
-"Manisha Shah",
-"Manju Puri ",
-"Mans M. Soderbom",
-"Manthos D. Delis ",
-"Manuel Amador",
-"Manuel Arellano ",
-"Manuel Frondel",
-"Manuel Santos",
-"Manuel Trajtenberg ",
-"Manuela Angelucci",
-"Mara Faccio ",
-"Marc Bourreau",
-"Marc Flandreau ",
-"Marc Fleurbaey ",
-"Marc Gurgand",
-"Marc Hallin ",
-"Marc Ivaldi",
-"Marc Lavoie ",
-"Marc Nerlove ",
-"Marc Rysman ",
-"Marc Willinger",
-"Marc F. Bellemare",
-"Marc Georges Goergen",
-"Marc J. Melitz ",
-"Marc P. Giannoni ",
-"Marc-Andreas Muendler ",
-"Marcel Boyer ",
-"Marcel Fafchamps ",
-"Marcel Fratzscher ",
-"Marcel P. Thum",
-"Marcel Peter Timmer ",
-"Marcela Eslava",
-"Marcelle Chauvet",
-"Marcelo Olarreaga ",
-"Marcelo C. Medeiros",
-"Marcelo J. Moreira",
-"Marcelo Luis Veracierto",
-"Marciano Siniscalchi",
-"Marcin Kacperczyk ",
-"Marcin Kolasa",
-"Marco Bassetto",
-"Marco Battaglini ",
-"Marco Becht",
-"Marco Caliendo ",
-"Marco Casari",
-"Marco Da Rin",
-"Marco Del Negro ",
-"Marco Francesconi ",
-"Marco Hoeberichts",
-"Marco Leonardi",
-"Marco Lippi ",
-"Marco Lo Duca",
-"Marco Mariotti",
-"Marco Ottaviani ",
-"Marco Pagano ",
-"Marco Ratto",
-"Marco Scarsini",
-"Marco Vivarelli ",
-"Marco E. Terrones ",
-"Marco Jacopo Lombardi",
-"Marcos Chamon ",
-"Marcus Berliant ",
-"Marcus Hagedorn",
-"Marcus Noland ",
-"Marcus Scheiblecker",
-"Marcus Wagner",
-"Marcus Hay Miller ",
-"Marcus J. Chambers",
-"Marek Jarocinski",
-"Marek Rusnak",
-"Margaret McMillan ",
-"Margaret Meyer",
-"Margaret Stevens",
-"Margaret Walls",
-"Margaret Emily Slade ",
-"Margarida Duarte",
-"Margit Schratzenstaller",
-"Mari Rege",
-"Maria De Paola",
-"Maria Demertzis",
-"Maria Guadalupe",
-"Maria Luengo-Prado",
-"Maria Petrova",
-"Maria Savona",
-"Maria Donovan Fitzpatrick",
-"Maria L. Loureiro",
-"Maria Paz Espinosa",
-"Maria Soledad Martinez Peria ",
-"Maria Vittoria Levati",
-"Maria-Carmen Guisan ",
-"Mariacristina De Nardi ",
-"Mariacristina Piva",
-"Marian Rizov",
-"Mariana Mazzucato",
-"Marianna Kudlyak",
-"Marianne Baxter ",
-"Marianne Bertrand ",
-"Marianne Ojo D Delaney PhD",
-"Marianne Elizabeth Page ",
-"Marianne P. Bitler",
-"Mariano Bosch",
-"Mariano Tommasi",
-"Mariassunta Giannetti ",
-"Marie Hoerova",
-"Marie Claire Villeval ",
-"Marie Currie Thursby ",
-"Marilda Antonia de Oliveira Sotomayor",
-"Marina Azzimonti",
-"Marine Carrasco",
-"Mario Forni ",
-"Mario Larch ",
-"Mario Macis",
-"Mario Padula",
-"Mario Pianta",
-"Mario John Crucini ",
-"Marius Brulhart ",
-"Marius Schwartz",
-"Mark Aguiar ",
-"Mark Armstrong ",
-"Mark Carhart ",
-"Mark Dean",
-"Mark Duggan ",
-"Mark Grinblatt ",
-"Mark Harrison",
-"Mark Hoekstra",
-"Mark Huggett ",
-"Mark Machina ",
-"Mark McGillivray",
-"Mark Mitchell ",
-"Mark Rush",
-"Mark Setterfield",
-"Mark Skidmore",
-"Mark Stabile",
-"Mark Steel ",
-"Mark Stewart ",
-"Mark Weder",
-"Mark Wright ",
-"Mark Wynne",
-"Mark A. Carlson",
-"Mark A. Cohen",
-"Mark C Strazicich",
-"Mark D. Partridge ",
-"Mark E Schaffer ",
-"Mark E. Doms ",
-"Mark E. Wohar ",
-"Mark J. Holmes ",
-"Mark J. Ready ",
-"Mark J. Roberts ",
-"Mark Jeffrey Flannery ",
-"Mark Joseph Bils ",
-"Mark L. Gertler ",
-"Mark M Spiegel ",
-"Mark M. Pitt ",
-"Mark N. Harris",
-"Mark O. Wilhelm",
-"Mark P. Taylor ",
-"Mark Peter Wooden",
-"Mark Philip Taylor",
-"Mark R. Rosenzweig ",
-"Mark V. Siegler ",
-"Mark W. Rosegrant",
-"Mark W. Watson ",
-"Markku Lanne ",
-"Markus Bruckner ",
-"Markus Eberhardt",
-"Markus Frolich ",
-"Markus Poschke",
-"Markus Bruno Jantti",
-"Markus K. Brunnermeier ",
-"Markus M. Grabka",
-"Markus Michael Mobius",
-"Markus P. Goldstein",
-"Marno Verbeek ",
-"Marta Banbura",
-"Marten Palme ",
-"Martha Starr",
-"Martha J. Bailey",
-"Martin Andersson",
-"Martin Biewen",
-"Martin Bodenstein",
-"Martin Brown ",
-"Martin Cihak ",
-"Martin Eichenbaum ",
-"Martin Ellison",
-"Martin Evans ",
-"Martin Feldkircher",
-"Martin Floden",
-"Martin Gassebner",
-"Martin Gaynor ",
-"Martin Gervais",
-"Martin Halla",
-"Martin Hoesli",
-"Martin Huber",
-"Martin Karlsson",
-"Martin Lettau ",
-"Martin Paldam ",
-"Martin Peitz ",
-"Martin Pesendorfer",
-"Martin Rama",
-"Martin Ravallion ",
-"Martin Schindler",
-"Martin Schneider ",
-"Martin Sefton ",
-"Martin Sola",
-"Martin Srholec",
-"Martin Strobel",
-"Martin Wagner",
-"Martin Weber ",
-"Martin Werding",
-"Martin A Rossi ",
-"Martin Anthony Carree",
-"Martin C. McGuire",
-"Martin F. Hellwig ",
-"Martin F. Quaas",
-"Martin Georg Kocher ",
-"Martin J. Conyon",
-"Martin J. Osborne ",
-"Martin James Browning ",
-"Martin Robert Weale ",
-"Martin Thomas Falk",
-"Martin William Cripps",
-"Martina Lawless",
-"Martín Uribe ",
-"Mary Amiti ",
-"Mary O'Mahony",
-"Mary Colleen Daly",
-"Marzio Galeotti ",
-"Masahiro Kawai ",
-"Masahiro Okuno-Fujiwara",
-"Masahisa Fujita ",
-"Masaki Aoyagi",
-"Masanao Aoki",
-"Masao Nakamura",
-"Masao Ogaki ",
-"Masayuki Morikawa",
-"Massimiliano Bratti",
-"Massimiliano Caporin",
-"Massimiliano Marcellino ",
-"Massimiliano Pisani",
-"Massimo Bordignon",
-"Massimo Filippini ",
-"Massimo Florio",
-"Massimo Giuliodori",
-"Massimo Guidolin ",
-"Massimo Marinacci ",
-"Massimo Morelli ",
-"Massimo Motta ",
-"Massimo Tavoni",
-"Massimo V Rostagno ",
-"Mathias Dewatripont ",
-"Mathias Drehmann ",
-"Mathias Thoenig ",
-"Mathias Trabandt ",
-"Mathilde Maurel",
-"Matias Busso",
-"Matias Damian Cattaneo ",
-"Mats Persson",
-"Matteo Cervellati",
-"Matteo Ciccarelli ",
-"Matteo Iacoviello ",
-"Matteo Manera",
-"Matteo G. Richiardi",
-"Matthew Neidell ",
-"Matthew Rabin ",
-"Matthew Rhodes-Kropf",
-"Matthew Shum ",
-"Matthew Turner ",
-"Matthew A. Cole ",
-"Matthew Aaron Gentzkow ",
-"Matthew Buford Canzoneri ",
-"Matthew C Weinzierl",
-"Matthew D. Shapiro ",
-"Matthew E. Kahn ",
-"Matthew J. Lindquist",
-"Matthew J. Notowidigdo ",
-"Matthew James Wiswall",
-"Matthew Jason Kotchen ",
-"Matthew John Baker",
-"Matthew O. Jackson ",
-"Matthew T. Holt",
-"Matthias Busse",
-"Matthias Doepke ",
-"Matthias Krakel",
-"Matthias Neuenkirch",
-"Matthias Sutter ",
-"Matthias Wrede",
-"Matthieu Bussiere ",
-"Matthieu Crozet",
-"Matthieu Glachant",
-"Matti Keloharju ",
-"Matti Tuomala",
-"Mattias Villani",
-"Mattias K Polborn",
-"Matz Dahlberg",
-"Maureen L. Cropper ",
-"Maurice Bun",
-"Maurice Obstfeld ",
-"Maurice Schiff ",
-"Maurice David Kugler ",
-"Maurice David Levi",
-"Mauricio Cardenas",
-"Maurizio Zanardi",
-"Mauro Gallegati ",
-"Mauro Napoletano",
-"Max Gillman",
-"Maxim Boycko",
-"Maximilian Auffhammer",
-"Maximo Camacho",
-"Maximo Torero ",
-"Maxwell Leslie King",
-"McKinley L. Blackburn",
-"Mehmet Balcilar ",
-"Mehmet Caner",
-"Mehmet Yorukoglu",
-"Melinda Smale",
-"Melissa Schettini Kearney ",
-"Melvin Stephens Jr.",
-"Melvyn Glyn Coles ",
-"Menno Prasad Pradhan",
-"Menzie Chinn ",
-"Meredith Allison Crowley",
-"Micael Castanheira",
-"Michael Baker ",
-"Michael Beenstock",
-"Michael Berlemann",
-"Michael Bleaney ",
-"Michael Brennan ",
-"Michael Burton",
-"Michael Darby ",
-"Michael Dooley ",
-"Michael Ehrmann ",
-"Michael Elsby ",
-"Michael Finus",
-"Michael Fritsch ",
-"Michael Funke ",
-"Michael Gerfin",
-"Michael Gibbs",
-"Michael Gordy",
-"Michael Greenstone ",
-"Michael Grimm",
-"Michael Grossman ",
-"Michael Haliassos",
-"Michael Hoy",
-"Michael Jansson",
-"Michael Keen ",
-"Michael Koetter ",
-"Michael Kosfeld ",
-"Michael Kremer ",
-"Michael Kumhof ",
-"Michael Lechner ",
-"Michael Lokshin ",
-"Michael Magill",
-"Michael Manove",
-"Michael McAleer ",
-"Michael McBride",
-"Michael McCracken ",
-"Michael McKee ",
-"Michael Melvin",
-"Michael Neugart",
-"Michael Ostrovsky",
-"Michael Parkin",
-"Michael Peters ",
-"Michael Pfaffermayr ",
-"Michael Reiter",
-"Michael Rockinger",
-"Michael Rosholm",
-"Michael Rothschild ",
-"Michael Sattinger ",
-"Michael Shields ",
-"Michael Smart ",
-"Michael Storper ",
-"Michael Svarer",
-"Michael Waldman ",
-"Michael Waterson ",
-"Michael Weber ",
-"Michael Wedow",
-"Michael Whinston ",
-"Michael Wolf ",
-"Michael Woodford ",
-"Michael Woolcock",
-"Michael A. Clemens ",
-"Michael A. Toman",
-"Michael Alroy Landesmann",
-"Michael Alvin Salinger",
-"Michael B. Devereux ",
-"Michael C. Jensen ",
-"Michael C. Lovell",
-"Michael Christopher Burda ",
-"Michael D. Hurd ",
-"Michael David Bordo ",
-"Michael Dominic Bauer",
-"Michael E. Waugh",
-"Michael F. Lovenheim ",
-"Michael Francis McMahon",
-"Michael Gerald Pollitt ",
-"Michael H. Riordan ",
-"Michael J. Fleming ",
-"Michael J. Grubb",
-"Michael J. Stutzer",
-"Michael James Roberts",
-"Michael John Moore",
-"Michael Josef Lamla",
-"Michael K. Price ",
-"Michael L. Anderson ",
-"Michael L. Katz ",
-"Michael Mercier Hutchison ",
-"Michael Olaf Hoel ",
-"Michael P Keane ",
-"Michael P. Devereux ",
-"Michael Peter Clements ",
-"Michael Peter Murray",
-"Michael R Ransom ",
-"Michael R. Baye ",
-"Michael R. Carter ",
-"Michael R. King",
-"Michael R. Roberts ",
-"Michael R. Veall",
-"Michael R. Wickens ",
-"Michael Robert Haines",
-"Michael Rupert Peneder",
-"Michael Steven Weisbach ",
-"Michael T Kiley ",
-"Michael T. Belongia",
-"Michael T. Owyang ",
-"Michael U. Krause",
-"Michael W. Klein ",
-"Michaela Trippl",
-"Michal Brzoza-Brzezina",
-"Michal Wiktor Krawczyk",
-"Michel Beine ",
-"Michel Grabisch",
-"Michel Juillard",
-"Michel Lubrano",
-"Michel Moreaux ",
-"Michel Andre Marechal",
-"Michel M Dacorogna",
-"Michel R. De Vroey",
-"Michela Redoano",
-"Michele Boldrin ",
-"Michele Cincera",
-"Michele Fratianni ",
-"Michele Lenza ",
-"Michele Pellizzari",
-"Michele Polo",
-"Michele Ruta",
-"Michele Tertilt ",
-"Michelle Alexopoulos",
-"Michelle Lowry",
-"Michelle R Garfinkel",
-"Michihiro Kandori ",
-"Michèle Belot",
-"Miet Maertens",
-"Miguel Leon-Ledesma ",
-"Miguel Urquiola",
-"Miguel A. Costa-Gomes",
-"Miguel A. Delgado",
-"Miguel A. Ferreira ",
-"Miguel D. Ramirez",
-"Mika Maliranta",
-"Mikael Lindahl ",
-"Mike Brewer",
-"Mike Burkart",
-"Mike Tsionas ",
-"Mike Wright ",
-"Mikhail Chernov ",
-"Mikhail Golosov ",
-"Miklos Koren",
-"Mikolaj Czajkowski",
-"Milan Vodopivec",
-"Miles Corak ",
-"Miles Spencer Kimball ",
-"Milton Harris ",
-"Min Wei",
-"Mine Kuban Yucel",
-"Ming Huang",
-"Miren Lafourcade",
-"Miriam Bruhn ",
-"Miriam Manchin",
-"Mirjam Van Praag ",
-"Mirko Draca",
-"Mirko Wiederholt",
-"Mitchell Berlin",
-"Mitchell Petersen ",
-"Mogens Fosgerau",
-"Mohamed Arouri ",
-"Mohammad Reza Farzanegan",
-"Mohammed Abdellaoui",
-"Mohsen Bahmani-Oskooee ",
-"Mohsin Khan ",
-"Monica Billio ",
-"Monica Costa Dias ",
-"Monica Paiella",
-"Monika Merz",
-"Monika Piazzesi ",
-"Monika Schnitzer ",
-"Morgan Kelly",
-"Moritz Schularick ",
-"Morley Gunderson",
-"Morris Goldstein ",
-"Morris A. Davis",
-"Morten Lau ",
-"Morten L. Bech",
-"Morten Orregaard Nielsen ",
-"Morten Overgaard Ravn ",
-"Moshe Buchinsky ",
-"Moshe Hazan",
-"Moshe Justman",
-"Moshe Kim",
-"Moshe Shiki Levy",
-"Motohiro Yogo ",
-"Mototsugu Shintani",
-"Motty Perry ",
-"Muhamet Yildiz",
-"Muhammad Shahbaz ",
-"Mukesh Eswaran",
-"Mun Sing Ho",
-"Murat F. Iyigun",
-"Muriel Niederle ",
-"Murillo Campello",
-"Murray C. Kemp ",
-"Murray Z. Frank",
-"Mustafa Caglayan",
-"Muzafar Shah Habibullah",
-"Myeong-Su Yun",
-"Myoung-jae Lee",
-"Myrna Wooders ",
-"Myron S. Scholes ",
-"N. Edward Coulson",
-"N. Gregory Mankiw ",
-"Nabanita Datta Gupta",
-"Nachum Sicherman",
-"Naci H. Mocan ",
-"Naercio Menezes-Filho",
-"Nagore Iriberri",
-"Nancy Birdsall ",
-"Nancy Qian ",
-"Nancy H. Chau",
-"Nancy L. Stokey ",
-"Nancy Lin Rose ",
-"Nancy Theresa Gallini",
-"Narayana Kocherlakota ",
-"Natalia Tamirisa",
-"Natalie A. Chen",
-"Nathan Balke ",
-"Nathan Nunn ",
-"Nathaniel Baum-Snow",
-"Nathaniel Hendren",
-"Nathaniel T. Wilcox",
-"Nattavudh Powdthavee ",
-"Nauro F. Campos ",
-"Navin Kartik",
-"Neeltje Van Horen ",
-"Neeraj Sood",
-"Neil Bruce",
-"Neil Foster-McGregor",
-"Neil Gandal ",
-"Neil Shephard ",
-"Neil Wallace ",
-"Neil R. Ericsson ",
-"Nejat Anbarci",
-"Nelson C. Mark ",
-"Neng Wang ",
-"Nezih Guner ",
-"Ngo Van Long ",
-"Nicholas Apergis ",
-"Nicholas Bardsley",
-"Nicholas Bloom ",
-"Nicholas Cox ",
-"Nicholas Crafts ",
-"Nicholas Oulton ",
-"Nicholas H. Stern ",
-"Nicholas M. Kiefer ",
-"Nicholas Mbaya Odhiambo ",
-"Nicholas S Souleles ",
-"Nicholas S. Economides ",
-"Nicholas William Minot",
-"Nicholas Z. Muller",
-"Nick Feltovich",
-"Nick Hanley ",
-"Nick Johnstone",
-"Nickolaos Tzeremes",
-"Niclas Berggren",
-"Nico Voigtlander ",
-"Nicola Cetorelli ",
-"Nicola Fuchs-Schuendeln",
-"Nicola Gennaioli ",
-"Nicola Lacetera",
-"Nicola Pavoni",
-"Nicola Persico ",
-"Nicola Spagnolo",
-"Nicolai Foss",
-"Nicolas Berman",
-"Nicolas Coeurdacier ",
-"Nicolas Jacquemet",
-"Nicolas Schmitt",
-"Nicolas Treich",
-"Nicolas Vieille",
-"Nicolas Robert Ziebarth",
-"Nicole Jonker",
-"Nicole M. Fortin ",
-"Nicoletta Batini",
-"Niels Haldrup",
-"Niels Hermes",
-"Niels Johannesen",
-"Nigel Key",
-"Nigel Pain",
-"Nigel Rice",
-"Nigel L. Driffield",
-"Niklas Potrafke ",
-"Nikola Tarashev",
-"Nikolai Roussanov",
-"Nikolaos Antonakakis",
-"Nikolaus Hautsch",
-"Nikolaus Wolf",
-"Nikolay Gospodinov",
-"Nikolay Nenov Nenovsky",
-"Nikos Nikiforakis",
-"Nils Gottfries",
-"Nils-Petter Lagerlof",
-"Nina Boyarchenko",
-"Nina Pavcnik ",
-"Nina Smith",
-"Ning Zhu",
-"Nir Jaimovich ",
-"Nirvikar Singh ",
-"Noah Williams ",
-"Noam Yuchtman",
-"Noel Gaston",
-"Nora Claudia Lustig ",
-"Norbert Schady ",
-"Noriaki Matsushima",
-"Norman Gemmell ",
-"Norman Schofield",
-"Norman Rasmus Swanson ",
-"Norman V. Loayza ",
-"Nour Meddahi",
-"Nouriel Roubini ",
-"Nuno Garoupa",
-"Nuno M. Limao",
-"Nuria Rodriguez-Planas",
-"Odd Rune Straume ",
-"Oddbjorn Raaum",
-"Oded Galor ",
-"Oded Stark ",
-"Ofer H. Azar",
-"Ola Olsson",
-"Olav Sorenson",
-"Ole E. Barndorff-Nielsen ",
-"Oleg Itskhoki ",
-"Oleksandr Talavera",
-"Oleksiy Kryvtsov",
-"Oliver Falck ",
-"Oliver Holtemoller",
-"Oliver Kirchkamp",
-"Oliver Musshoff",
-"Oliver Bruce Linton ",
-"Oliver D. Hart ",
-"Oliver Meng Rui",
-"Olivia S. Mitchell ",
-"Olivier Armantier",
-"Olivier Bargain ",
-"Olivier Coibion ",
-"Olivier Compte",
-"Olivier Darne",
-"Olivier De Bandt",
-"Olivier De Jonghe",
-"Olivier Deschenes ",
-"Olivier Gossner",
-"Olivier Jeanne ",
-"Olivier L'Haridon",
-"Olivier Ledoit",
-"Olivier Scaillet ",
-"Olivier Tercieux",
-"Olivier J Blanchard ",
-"Olli Tahvonen",
-"Olmo Silva",
-"Olof Aslund",
-"Olof Johansson-Stenman ",
-"Olympia Bover ",
-"Omar Licandro ",
-"Omer Moav ",
-"Omer Ozak",
-"Orazio Attanasio ",
-"Oreste Tristani",
-"Ori Heffetz",
-"Oriana Bandiera ",
-"Orley Ashenfelter ",
-"Oscar Jorda ",
-"Oscar Volij",
-"Oskar Nordstrom Skans",
-"Ottmar Edenhofer ",
-"Otto Swank",
-"Otto Toivanen",
-"Ouarda Merrouche",
-"Owen O'Donnell",
-"Owen A. Lamont ",
-"Owen F. Humpage",
-"Owen M. Zidar",
-"Oz Shy ",
-"Ozlem Onaran",
-"P. Dean Corbae ",
-"P. Jean-Jacques Herings ",
-"Pablo Branas-Garza",
-"Pablo Fernandez ",
-"Pablo A. Acosta",
-"Pablo A. Guerron ",
-"Pablo Andres Neumeyer",
-"Pablo D. Fajgelbaum",
-"Pablo Emilio Guidotti",
-"Pablo T. Spiller ",
-"Pami Dua",
-"Panicos O. Demetriades ",
-"Panle Jia Barwick",
-"Panu Poutvaara ",
-"Paola Conconi",
-"Paola Giuliano ",
-"Paola Manzini",
-"Paola Profeta",
-"Paola Sapienza ",
-"Paolo Angelini",
-"Paolo Buonanno",
-"Paolo Epifani",
-"Paolo Ghirardato",
-"Paolo Giordani",
-"Paolo Manasse",
-"Paolo Mauro ",
-"Paolo Naticchioni",
-"Paolo Paruolo",
-"Paolo Pasquariello",
-"Paolo Pinotti",
-"Paolo Sodini",
-"Paolo Surico ",
-"Paolo Verme",
-"Paolo Volpin ",
-"Paolo A. Pesenti ",
-"Paolo Emilio Mistrulli",
-"Paolo Giorgio Garella",
-"Par Osterholm",
-"Parag Pathak ",
-"Paresh Kumar Narayan ",
-"Parkash Chander",
-"Partha Deb",
-"Pascal Courty",
-"Pascal Michaillat",
-"Pascaline Dupas ",
-"Pascual Restrepo ",
-"Patric H. Hendershott ",
-"Patricia Funk",
-"Patricia Frances Apps",
-"Patricia Lyon Mokhtarian ",
-"Patricia M. Danzon",
-"Patricia Mary Anderson",
-"Patrick Bayer ",
-"Patrick Bolton ",
-"Patrick Feve ",
-"Patrick Francois ",
-"Patrick Gagliardini",
-"Patrick Guillaumont",
-"Patrick Honohan ",
-"Patrick Kehoe ",
-"Patrick Legros ",
-"Patrick Llerena",
-"Patrick Moyes",
-"Patrick Rey ",
-"Patrick Sevestre",
-"Patrick A. Puhani ",
-"Patrick M. Kline ",
-"Patrick M. McGuire",
-"Patrick Paul Walsh",
-"Patrick W. Schmitz ",
-"Patrik Guggenberger",
-"Patrik Soderholm",
-"Patrizio Tirelli",
-"Pau Rabanal ",
-"Paul Beaudry ",
-"Paul Belleflamme",
-"Paul Bergin ",
-"Paul Collier ",
-"Paul Davidson ",
-"Paul Frijters ",
-"Paul Gertler ",
-"Paul Goldsmith-Pinkham",
-"Paul Gomme ",
-"Paul Gregg ",
-"Paul Heidhues",
-"Paul Hubert",
-"Paul Johnson",
-"Paul Joskow ",
-"Paul Klein",
-"Paul Klemperer ",
-"Paul Milgrom ",
-"Paul Oyer ",
-"Paul Pecorino",
-"Paul Seabright",
-"Paul Segerstrom ",
-"Paul Soderlind ",
-"Paul Wachtel ",
-"Paul Welfens",
-"Paul A. David ",
-"Paul A. Ruud ",
-"Paul Alan Gompers ",
-"Paul Anthony Brenton",
-"Paul Anthony Cashin",
-"Paul Anthony Dorosh",
-"Paul Anthony Grout",
-"Paul Anton Raschky",
-"Paul C. Winters",
-"Paul Charles Cheshire",
-"Paul David Mizen",
-"Paul H. Kupiec",
-"Paul H. Rubin",
-"Paul J Ferraro",
-"Paul J. Burke",
-"Paul J. Devereux ",
-"Paul Joseph Van den Noord",
-"Paul Leonard Stoneman",
-"Paul Leslie Levine ",
-"Paul Michael Romer ",
-"Paul Noah Courant",
-"Paul R. Krugman ",
-"Paul Robert Masson ",
-"Paul S. Willen ",
-"Paul V. Preckel",
-"Paul W. Rhode",
-"Paul W. Wilson ",
-"Paul William Glewwe ",
-"Paula Bustos",
-"Paula E. Stephan ",
-"Pauline Grosjean",
-"Paulo Guimaraes ",
-"Paulo Klinger Monteiro",
-"Paulo M. M. Rodrigues",
-"Pavel Ciaian ",
-"Pavel Trunin",
-"Pedro Bordalo",
-"Pedro Carneiro ",
-"Pedro Dal Bo",
-"Pedro Gomes",
-"Pedro Gomis-Porqueras",
-"Pedro Mira",
-"Pedro Portugal ",
-"Pedro Rey-Biel",
-"Pedro Teles",
-"Pedro C. Vicente",
-"Pedro Pita Barros",
-"Pedro S. Martins ",
-"Pehr-Johan Norback",
-"Pekka Ilmakunnas",
-"Peng Zhou ",
-"Pengfei Wang ",
-"Pentti Saikkonen ",
-"Per Johansson",
-"Per Krusell ",
-"Per Pettersson-Lidbom",
-"Per Stromberg ",
-"Per G. Fredriksson ",
-"Per-Anders Edin",
-"Pete Klenow ",
-"Peter Arcidiacono",
-"Peter Bogetoft",
-"Peter Borm ",
-"Peter Cramton ",
-"Peter Flaschel",
-"Peter Fredriksson ",
-"Peter Gottschalk ",
-"Peter Haan",
-"Peter Hordahl",
-"Peter Howitt ",
-"Peter Huber ",
-"Peter Karadi ",
-"Peter Kondor",
-"Peter Kooreman",
-"Peter Kort ",
-"Peter McAdam ",
-"Peter Mieszkowski ",
-"Peter Murrell ",
-"Peter Nijkamp ",
-"Peter Nunnenkamp ",
-"Peter Orazem ",
-"Peter Pedroni ",
-"Peter Rousseau ",
-"Peter Rupert ",
-"Peter Schmidt ",
-"Peter Skott",
-"Peter Temin",
-"Peter Thompson ",
-"Peter Winker",
-"Peter Wysocki",
-"Peter A. Diamond ",
-"Peter A. Savelyev",
-"Peter A.G. van Bergeijk",
-"Peter Bishop Dixon ",
-"Peter Blair Henry",
-"Peter C. B. Phillips ",
-"Peter Charles Boxall",
-"Peter E. Rossi ",
-"Peter Frederik Lanjouw",
-"Peter George Warr ",
-"Peter Grant Moffatt",
-"Peter H. Egger ",
-"Peter H. Lindert ",
-"Peter J Hammond ",
-"Peter J Wilcoxen",
-"Peter J. Boettke ",
-"Peter J. Montiel ",
-"Peter James Sloane",
-"Peter John Dolton ",
-"Peter Joseph Kuhn ",
-"Peter K. Clark ",
-"Peter K. Schott ",
-"Peter Lawrence Swan",
-"Peter M. DeMarzo ",
-"Peter M. Garber ",
-"Peter M. Robinson ",
-"Peter N. Ireland ",
-"Peter Norman Sorensen",
-"Peter P. Wakker ",
-"Peter Reinhard Hansen ",
-"Peter T. Leeson ",
-"Peter William Wright",
-"Petia Topalova ",
-"Petra Moser",
-"Petra Elisabeth Todd ",
-"Petra Maria Geraats",
-"Petri Bockerman",
-"Petter Lundborg",
-"Philip Arestis ",
-"Philip Du Caju",
-"Philip Keefer ",
-"Philip McCann ",
-"Philip Molyneux ",
-"Philip Oreopoulos ",
-"Philip Vermeulen",
-"Philip Verwimp",
-"Philip A. Haile ",
-"Philip E. Graves",
-"Philip G. Pardey",
-"Philip H. Dybvig ",
-"Philip Hans Franses ",
-"Philip J Cook",
-"Philip J. Grossman ",
-"Philip J. Reny ",
-"Philip Kenneth Robins ",
-"Philip Richard Lane ",
-"Philipp Hartmann",
-"Philipp Koellinger",
-"Philipp Schnabl ",
-"Philipp Albert Theodor Kircher ",
-"Philippe Aghion ",
-"Philippe Andrade",
-"Philippe Askenazy",
-"Philippe Bacchetta ",
-"Philippe Chone",
-"Philippe De Donder",
-"Philippe Jehiel ",
-"Philippe Jorion ",
-"Philippe Martin ",
-"Philippe Mongin",
-"Philippe Quirion",
-"Philippe Van Kerm",
-"Philippe Weil ",
-"Phillip B. Levine ",
-"Phillip Lee Swagel",
-"Phoebe Koundouri",
-"Pia Orrenius",
-"Pier Paolo Saviotti",
-"Pierluigi Balduzzi",
-"Piero Gottardi ",
-"Pierpaolo Battigalli ",
-"Pierpaolo Benigno ",
-"Pierre Cahuc ",
-"Pierre Chiappori ",
-"Pierre Dubois",
-"Pierre Mohnen ",
-"Pierre Perron ",
-"Pierre Pestieau ",
-"Pierre Picard",
-"Pierre Siklos ",
-"Pierre Yared ",
-"Pierre Daniel Sarte ",
-"Pierre M. Picard ",
-"Pierre Yves Geoffard",
-"Pierre-Carl Michaud",
-"Pierre-Guillaume Meon ",
-"Pierre-Olivier Gourinchas ",
-"Pierre-Olivier Weill ",
-"Pierre-Philippe Combes ",
-"Pierre-Richard Agenor ",
-"Pieter A. Gautier ",
-"Pietro Garibaldi ",
-"Pietro Ortoleva",
-"Pietro F. Peretto ",
-"Pinelopi Koujianou Goldberg ",
-"Ping Wang ",
-"Piti Disyatat",
-"Plutarchos Sakellaris",
-"Po-Hsuan P Hsu",
-"Pol Antras ",
-"Pontus Brodde Braunerhjelm",
-"Poonam Gupta",
-"Pradeep Dubey ",
-"Pradeep K. Chintagunta ",
-"Prakash Loungani ",
-"Pramila Krishnan",
-"Pranab K. Bardhan ",
-"Praveen Kumar",
-"Pravin Krishna",
-"Pravin K Trivedi ",
-"Prema-chandra Athukorala ",
-"Price Vanmeter Fishback ",
-"Priyaranjan Jha",
-"Pushkar Maitra",
-"Quamrul H. Ashraf ",
-"Quentin Wodon ",
-"Quy-Toan Do",
-"R. Alton Gilbert",
-"R. Anton Braun",
-"R. Gaston Gelos",
-"R. Mark Isaac ",
-"R. Quentin Grafton",
-"Raaj Kumar Sah ",
-"Rabah Amir ",
-"Rabah Arezki",
-"Rachel Croson ",
-"Rachel Glennerster",
-"Rachel Griffith ",
-"Rachel Kranton ",
-"Rachel M. Friedberg",
-"Radhakrishnan Gopalan",
-"Radu Vranceanu",
-"Raf Wouters ",
-"Rafael Di Tella ",
-"Rafael Domenech",
-"Rafael La Porta ",
-"Rafael Lalive ",
-"Rafael Repullo ",
-"Rafael Robb ",
-"Rafal Weron ",
-"Raffaele Paci",
-"Raffaella Giacomini",
-"Raffaella Sadun ",
-"Ragan Petrie",
-"Raghavendra Rau",
-"Raghbendra Jha",
-"Raghuram G. Rajan ",
-"Ragnar Torvik ",
-"Ragui A. Assaad",
-"Raimundo Soto",
-"Rainald Borck",
-"Rainer Thiele",
-"Rainer Winkelmann ",
-"Raj Aggarwal",
-"Raj Chetty ",
-"Rajeev Dehejia ",
-"Rajeev K. Goel ",
-"Rajesh K. Aggarwal",
-"Rajeswari Sengupta ",
-"Rajiv Sethi",
-"Rajiv Vohra ",
-"Rajneesh Narula",
-"Rajnish Mehra ",
-"Ralf Martin",
-"Ralph Chami",
-"Ralph De Haas ",
-"Ralph Koijen",
-"Ralph Ossa",
-"Ralph Stinebrickner",
-"Ralph A. Winter",
-"Ram Mudambi ",
-"Raman Uppal ",
-"Ramana Nanda ",
-"Ramazan Sari",
-"Ramkishen S. Rajan",
-"Ramon Caminal",
-"Ramon Marimon ",
-"Ramon Moreno",
-"Ramon E. Lopez ",
-"Ran Abramitzky",
-"Ran Spiegler ",
-"Randall Eberts",
-"Randall Filer",
-"Randall Wright ",
-"Randall G. Holcombe ",
-"Randall Karl Morck ",
-"Randall P. Ellis",
-"Randall Phillip Walsh ",
-"Randi Jill Hjalmarsson",
-"Randolph Sloof",
-"Randolph Preston McAfee ",
-"Rangan Gupta ",
-"Ranjan Ray ",
-"Raouf Boucekkine ",
-"Raoul Minetti ",
-"Raphael Franck",
-"Raphael Anton Auer ",
-"Raphael S. Schoenle",
-"Raquel Bernal",
-"Raquel Carrasco",
-"Raquel Fernandez ",
-"Rasmus Fatum",
-"Rasmus Lentz",
-"Raul Caruso",
-"Raul Ramos",
-"Ravi Bansal ",
-"Ravi Jagannathan ",
-"Ravi Kanbur ",
-"Ray Ball ",
-"Ray C. Fair ",
-"Ray Yeutien Chou",
-"Raymond Fisman ",
-"Raymond G. Riezman ",
-"Rebecca Diamond",
-"Rebecca L. Thornton",
-"Rebecca M. Blank ",
-"Rebecca M. Henderson ",
-"Rebel Allen Cole ",
-"Reed Walker",
-"Refet S. Gurkaynak ",
-"Refk Selmi",
-"Regina Therese Riphahn ",
-"Regis Barnichon",
-"Reinhard Madlener ",
-"Reinhilde Veugelers ",
-"Reint Eberhard Gropp ",
-"Rema Hanna",
-"Remi Camille Jedwab",
-"Rene Belderbos",
-"Rene Garcia ",
-"Rene Kemp",
-"Rene van den Brink",
-"Rene M. Stulz ",
-"Renee Adams ",
-"Renee A. Fry-McKibbin",
-"Reto Foellmi",
-"Reuben Gronau ",
-"Reuven Glick ",
-"Reyer Gerlagh ",
-"Ricard Gil",
-"Ricardo Correa",
-"Ricardo Hausmann ",
-"Ricardo Lagos ",
-"Ricardo Nunes",
-"Ricardo Perez-Truglia",
-"Ricardo Reis ",
-"Ricardo J. Caballero ",
-"Ricardo M. Sousa ",
-"Riccardo Colacito",
-"Riccardo Crescenzi",
-"Riccardo Scarpa ",
-"Richard Akresh",
-"Richard Baldwin ",
-"Richard Blundell ",
-"Richard Dennis",
-"Richard Friberg",
-"Richard Holden",
-"Richard Hornbeck ",
-"Richard Layard ",
-"Richard Paap ",
-"Richard Payne",
-"Richard Pomfret",
-"Richard Rogerson ",
-"Richard Roll ",
-"Richard Rosen",
-"Richard Schmalensee ",
-"Richard Startz ",
-"Richard Upward",
-"Richard A. Brecher",
-"Richard A. Jensen",
-"Richard A. Meese ",
-"Richard A. Posner ",
-"Richard Anthony Kneller ",
-"Richard B. Freeman ",
-"Richard B. Howarth",
-"Richard D. F. Harris",
-"Richard David Portes ",
-"Richard E. Just ",
-"Richard Evans Romano ",
-"Richard G. Anderson",
-"Richard G. Newell ",
-"Richard George Lipsey ",
-"Richard Glen Harris",
-"Richard H. Adams Jr.",
-"Richard H. Clarida ",
-"Richard H. Steckel ",
-"Richard H. Thaler ",
-"Richard Ian Harris",
-"Richard J. Arnott ",
-"Richard J. Cebula ",
-"Richard J. Gilbert ",
-"Richard J. Murnane ",
-"Richard J. Smith ",
-"Richard J. Zeckhauser ",
-"Richard John Green",
-"Richard K. Crump",
-"Richard K. Green",
-"Richard K. Lyons ",
-"Richard L. Smith II",
-"Richard Martin Cantor",
-"Richard Miller Bird ",
-"Richard Normand Langlois",
-"Richard R. Nelson ",
-"Richard S. Grossman",
-"Richard S.J. Tol ",
-"Richard T. Baillie ",
-"Richard T. Carson ",
-"Richard V. Burkhauser ",
-"Rik Hafer",
-"Rikard Forslid ",
-"Rima Turk Ariss",
-"Rita Almeida",
-"Ritva Reinikka",
-"Riza Demirer",
-"Rob Alessie ",
-"Rob J Hyndman ",
-"Robert Brooks",
-"Robert Cull ",
-"Robert De Jong",
-"Robert Dekle",
-"Robert Dur",
-"Robert Gibbons ",
-"Robert Holzmann",
-"Robert Inklaar ",
-"Robert Innes ",
-"Robert Kollmann ",
-"Robert Korajczyk ",
-"Robert Lensink ",
-"Robert Litterman ",
-"Robert Moffitt ",
-"Robert Noland",
-"Robert Picard ",
-"Robert Shimer ",
-"Robert Stehrer ",
-"Robert Sugden ",
-"Robert Taylor ",
-"Robert Waldmann ",
-"Robert A Jarrow ",
-"Robert A. Amano",
-"Robert A. Becker",
-"Robert A. Hart",
-"Robert A. Mundell",
-"Robert A. Pollak ",
-"Robert Alain Plasman",
-"Robert Allen Eisenbeis",
-"Robert Andrew Margo ",
-"Robert B Barsky ",
-"Robert Burton Ekelund Jr.",
-"Robert Butler Wilson ",
-"Robert C. Feenstra ",
-"Robert C. Merton ",
-"Robert Carson Allen ",
-"Robert Christopher Johnson ",
-"Robert D Metcalfe",
-"Robert Douglas Cairns",
-"Robert E. Cumby ",
-"Robert E. Forsythe ",
-"Robert E. Lucas Jr.",
-"Robert E. Wright",
-"Robert E.B. Lucas ",
-"Robert Ernest Hall ",
-"Robert F Tamura ",
-"Robert F. Dittmar",
-"Robert F. Engle III",
-"Robert F. Schoeni",
-"Robert F. Stambaugh ",
-"Robert G Chambers ",
-"Robert G. King ",
-"Robert G. Valletta ",
-"Robert George Gregory",
-"Robert Glenn Hubbard ",
-"Robert H. Bates",
-"Robert H. Frank ",
-"Robert H. Haveman ",
-"Robert H. Porter ",
-"Robert H. Topel ",
-"Robert J R Elliott ",
-"Robert J. Aumann ",
-"Robert J. Barro ",
-"Robert J. Gordon ",
-"Robert J. Hill",
-"Robert J. Johnston",
-"Robert J. Kohn",
-"Robert J. Shiller ",
-"Robert J. Tetlow",
-"Robert J. Willis ",
-"Robert Jack MacCulloch ",
-"Robert James Hodrick ",
-"Robert James Town",
-"Robert James Weber ",
-"Robert Jean Michel Gary-Bobo",
-"Robert John Kaestner ",
-"Robert John Vigfusson ",
-"Robert K. Kaufmann",
-"Robert K. Triest",
-"Robert L Slonim",
-"Robert L. Geske",
-"Robert M. Feinberg",
-"Robert M. Hunt",
-"Robert M. Solow ",
-"Robert M. Townsend ",
-"Robert Neil McCauley ",
-"Robert Norman Stavins ",
-"Robert Owen Mendelsohn ",
-"Robert P. Berrens",
-"Robert P. Flood ",
-"Robert Philip Strauss",
-"Robert S. Pindyck ",
-"Robert Seth Shupp",
-"Robert T. Deacon",
-"Robert W Rich",
-"Robert W. Dimand",
-"Robert W. Fairlie ",
-"Robert W. Hahn ",
-"Robert W. Helsley",
-"Robert W. Staiger ",
-"Robert W. Vishny ",
-"Robert William Faff ",
-"Robert Zachary Lawrence ",
-"Roberta Capello",
-"Roberta Gatti",
-"Roberta Rabellotti",
-"Roberto Alvarez",
-"Roberto Basile",
-"Roberto Cellini",
-"Roberto Chang ",
-"Roberto Galbiati",
-"Roberto Golinelli",
-"Roberto Perotti ",
-"Roberto Rigobon ",
-"Roberto Roson",
-"Roberto Serrano ",
-"Roberto Steiner",
-"Roberto A. Weber ",
-"Roberto M. Billi",
-"Roberto Mantaro Samaniego",
-"Roberto S. Mariano ",
-"Roberton C. Williams III",
-"Robin Burgess ",
-"Robin Cowan",
-"Robin Cubitt",
-"Robin Andrew Naylor",
-"Robin C. Sickles ",
-"Robin Miles Hogarth",
-"Robin W. Boadway ",
-"Roc Armenter",
-"Rochelle Edge",
-"Rocio Titiunik",
-"Rodney Ramcharan",
-"Rodney Tyers",
-"Rodney D. Ludema",
-"Rodney Edward Falvey",
-"Rodney John Garratt",
-"Rodolfo M. Nayga Jr.",
-"Rodolphe Dos Santos Ferreira",
-"Rodrigo Pinto",
-"Rodrigo O. Valdes",
-"Rodrigo Reis Soares ",
-"Roel Maria Wilhelmus Jozef Beetsma ",
-"Roger Guesnerie ",
-"Roger Koenker ",
-"Roger Lagunoff",
-"Roger B. Myerson ",
-"Roger Benedict Newson ",
-"Roger D. Congleton",
-"Roger E. A. Farmer ",
-"Roger E. Backhouse",
-"Roger G. Noll ",
-"Roger H. Gordon ",
-"Roger W. Klein",
-"Rohini Pande ",
-"Rohini Somanathan",
-"Roland Hodler",
-"Roland Rathelot",
-"Roland Straub ",
-"Roland Strausz ",
-"Roland Vaubel",
-"Roland Gerhard Fryer ",
-"Roland J. Benabou ",
-"Rolf Aaberge ",
-"Rolf J. Langhammer ",
-"Romain Ranciere ",
-"Romain Wacziarg ",
-"Romain Alexandre Duval ",
-"Roman Horvath ",
-"Roman Inderst ",
-"Roman M. Sheremeta ",
-"Rommert Dekker",
-"Ron Alquist",
-"Ron Boschma ",
-"Ron Johnston",
-"Ron Mittelhammer",
-"Ron S. Jarmin ",
-"Ronald Davies ",
-"Ronald Findlay ",
-"Ronald MacDonald ",
-"Ronald Wintrobe",
-"Ronald A. Ratti ",
-"Ronald David Fischer",
-"Ronald Demos Lee ",
-"Ronald G. Ehrenberg ",
-"Ronald L. Oaxaca ",
-"Ronald Leonard Martin ",
-"Ronald M. Harstad",
-"Ronald Patrick Smith ",
-"Roni Michaely ",
-"Ronnie Schoeb",
-"Rosanne Altshuler",
-"Rosemarie Chariklia Nagel ",
-"Rosina Moreno",
-"Ross Levine ",
-"Ross Leslie Watts ",
-"Rossen Valkanov ",
-"Rowena Ann Pecchenino",
-"Roy Brouwer",
-"Roy Thurik ",
-"Roy Wada ",
-"Ruben Durante",
-"Ruben Enikolopov",
-"Rudi Vander Vennet",
-"Rudiger Pethig",
-"Rudolf Kerschbamer",
-"Rudolf Winter-Ebmer ",
-"Rudolfs Bems",
-"Ruediger Bachmann ",
-"Ruediger Fahlenbrach ",
-"Ruhul Amin Salim",
-"Rui Albuquerque",
-"Rui Luis de Castro",
-"Rupert Sausgruber",
-"Ruqu Wang",
-"Russell Cooper ",
-"Russell Davidson ",
-"Russell Hillberry",
-"Russell Pittman",
-"Russell Smyth ",
-"Russell S. Sobel ",
-"Ruth Suseela Meinzen-Dick",
-"Ruud Aloysius de Mooij ",
-"Ruut Veenhoven",
-"Ryan Kellogg",
-"S Viswanathan ",
-"S. Boragan Aruoba ",
-"Sabina Alkire ",
-"Sagiri Kitao ",
-"Sahra Khaleel Mickaiel",
-"Saibal Ghosh",
-"Sajal Lahiri ",
-"Sajid Anwar",
-"Salvador Barbera ",
-"Salvador Barrios ",
-"Salvador Navarro",
-"Salvatore Di Falco",
-"Salvatore Piccolo",
-"Sam Bucovetsky",
-"Sam Ouliaris",
-"Sam Peltzman ",
-"Sam Schulhofer-Wohl",
-"Sambit Bhattacharyya",
-"Samuel Bazzi",
-"Samuel Bentolila ",
-"Samuel Kortum ",
-"Sandeep Baliga",
-"Sandra Eickmeier",
-"Sandra McNally",
-"Sandra Poncet ",
-"Sandra E. Black ",
-"Sandro Brusco",
-"Sanford Jay Grossman ",
-"Sanjeev Goyal ",
-"Sanjiv Ranjan Das",
-"Santanu Roy",
-"Santiago Carbo Valverde",
-"Sara Markowitz",
-"Sarah Brown",
-"Sarah Zubairy",
-"Sarah E. West",
-"Sarah Elizabeth Turner",
-"Sarah Louise Smith ",
-"Sarbajit Chaudhuri",
-"Sari Pekkala Kerr",
-"Sascha Steffen",
-"Sascha O. Becker ",
-"Satoru Takahashi",
-"Satoshi Shimizutani",
-"Satya P. Das",
-"Satyajit Chatterjee ",
-"Saul Lach ",
-"Saul D. Hoffman",
-"Sauro Mocetti",
-"Sayantan Ghosal",
-"Scott Rozelle ",
-"Scott Schuh ",
-"Scott Duke Kominers",
-"Scott E Masten",
-"Scott E. Atkinson",
-"Scott E. Carrell ",
-"Scott H. Irwin ",
-"Scott L. Baier ",
-"Seamus McGuinness",
-"Sean Holly",
-"Sean Lyons",
-"Sebastian Calonico",
-"Sebastian Edwards ",
-"Sebastian Galiani ",
-"Sebastian Kripfganz",
-"Sebastian Siegloch",
-"Sebastien Jean",
-"Sebastien Laurent ",
-"Sebastien Roux",
-"Sebnem Kalemli-Ozcan ",
-"Seema Jayachandran ",
-"Seema Narayan ",
-"Selahattin Imrohoroglu ",
-"Selva Demiralp",
-"Sendhil Mullainathan ",
-"Seong-Min Yoon",
-"Seppo Mikko Sakari Honkapohja ",
-"Ser-Huang Poon",
-"Serena Ng ",
-"Sergei Guriev ",
-"Sergei Sarkissian",
-"Sergey Tsukhlo",
-"Sergi Jimenez-Martin",
-"Sergio Cesaratto",
-"Sergio Firpo ",
-"Sergio Perelman",
-"Sergio Horacio Lence",
-"Sergio Luis Schmukler ",
-"Sergio Ribeiro da Costa Werlang",
-"Sergio S Urzua ",
-"Sergio T Rebelo ",
-"Sergiu Hart ",
-"Sergiy Radyakin",
-"Serguei Maliar",
-"Servaas van der Berg",
-"Seung C. Ahn",
-"Seung-Hoon Yoo",
-"Severin Borenstein ",
-"Shaghil Ahmed",
-"Shahidur Rahman Khandker ",
-"Shakeeb Khan",
-"Shane A. Johnson",
-"Shane Mick Sherlund",
-"Shane Mitchell Greenstein ",
-"Shang-Jin Wei ",
-"Shanjun Li",
-"Shankha Chakraborty",
-"Shaohua Chen ",
-"Shapour Mohammadi",
-"Sharon Kozicki ",
-"Shawkat Hammoudeh ",
-"Shawn Cole",
-"Shawn Kantor",
-"Shawn Ni",
-"Sheila Christine Dow",
-"Shekhar Aiyar",
-"Shelly J Lundberg ",
-"Shenggen Fan ",
-"Sheridan Titman ",
-"Sherman Robinson ",
-"Sherrill Shaffer ",
-"Shi Li ",
-"Shigeru Fujita",
-"Shigeyuki Hamori ",
-"Shin-ichi Fukuda",
-"Shing-Yi Wang",
-"Shiqing Ling",
-"Shiu-Sheng Chen",
-"Shlomo Weber ",
-"Shlomo Yitzhaki ",
-"Shmuel Zamir",
-"Shmuel Israel Nitzan ",
-"Shoshana Amyra Grossbard",
-"Shouyong Shi ",
-"Shu-Chun S. Yang",
-"Shujiro Urata",
-"Shulamit Kahn",
-"Shunsuke Managi ",
-"Shyam Sunder ",
-"Sidney Winter ",
-"Siem Jan Koopman ",
-"Siew Hong Teoh ",
-"Silvana Tenreyro ",
-"Silvia Fabiani",
-"Silvia Goncalves",
-"Simeon Djankov ",
-"Simon Anderson ",
-"Simon Board",
-"Simon Burgess ",
-"Simon Gachter ",
-"Simon Gervais",
-"Simon Gilchrist ",
-"Simon Grant ",
-"Simon Johnson ",
-"Simon Luechinger",
-"Simon Potter ",
-"Simon Sosvilla-Rivero ",
-"Simon Wren-Lewis ",
-"Simon van Norden",
-"Simon C. Parker ",
-"Simon George Cowan",
-"Simon H. Kwan",
-"Simon John Evenett",
-"Simon Mark Appleton",
-"Simona Iammarino",
-"Simone Bertoli",
-"Simone Manganelli ",
-"Simonetta Longhi",
-"Simplice A Asongu ",
-"Siong Hook Law",
-"Siqi Zheng",
-"Sir David Greenaway ",
-"Siwan Anderson",
-"Sjak Smulders ",
-"Sjoerd Beugelsdijk",
-"Skander J. Van den Heuvel",
-"Snorre Kverndokk",
-"Sofia Berto Villas-Boas",
-"Sofronis Clerides",
-"Sohnke M. Bartram",
-"Sokbae (Simon) Lee ",
-"Soledad Zignago",
-"Solomon William Polachek ",
-"Song Xi Chen",
-"Songqing Jin",
-"Sonia Radhika Bhalotra ",
-"Sophia Rabe-Hesketh",
-"Sophocles Mavroeidis",
-"Sophocles N. Brissimis",
-"Soren Blomquist ",
-"Soren Johansen ",
-"Soren Leth-Petersen",
-"Soren T. Anderson",
-"Soumyananda Dinda",
-"Sourafel Girma ",
-"Soyoung Kim ",
-"Spencer Banzhaf ",
-"Spiro E Stefanou",
-"Spiros Bougheas",
-"Spyros Arvanitis",
-"Stacey L Schreft",
-"Stan Hurn",
-"Stan J Liebowitz",
-"Stanislav Anatolyev",
-"Stanley E. Zin ",
-"Stanley L Winer",
-"Stavros Peristiani",
-"Stavros Antonios Degiannakis",
-"Stef Proost ",
-"Stefan Ambec",
-"Stefan Avdjiev",
-"Stefan Bach",
-"Stefan Dercon ",
-"Stefan Gerlach ",
-"Stefan Hoderlein",
-"Stefan Homburg ",
-"Stefan Laseen",
-"Stefan Mittnik",
-"Stefan Nagel ",
-"Stefan Reichelstein",
-"Stefan Szymanski ",
-"Stefan Voigt ",
-"Stefan C. Wolter",
-"Stefan T. Trautmann",
-"Stefania Albanesi ",
-"Stefanie Stantcheva ",
-"Stefano Battiston",
-"Stefano Breschi",
-"Stefano DellaVigna ",
-"Stefano Eusepi",
-"Stefano Fenoaltea",
-"Stefano Giglio ",
-"Stefano Neri ",
-"Stefano Rossi",
-"Stefano Scarpetta ",
-"Stefano Schiavo",
-"Steffen Andersen ",
-"Steffen Huck ",
-"Stein Terje Holden",
-"Steinar Holden ",
-"Steinar Strom",
-"Stelios Bekiros",
-"Stelios Michalopoulos ",
-"Sten Nyberg",
-"Stephan Heblich",
-"Stephan Klasen ",
-"Stephan Marette",
-"Stephan Meier ",
-"Stephan Siegel",
-"Stephan J. Goetz",
-"Stephan Lothar Thomsen",
-"Stephane Auray",
-"Stephane Bonhomme ",
-"Stephane Dees",
-"Stephane Hallegatte ",
-"Stephane Straub",
-"Stephanie Schmitt-Grohe ",
-"Stephen Broadberry ",
-"Stephen Cecchetti ",
-"Stephen Coate ",
-"Stephen DeCanio",
-"Stephen Gibbons ",
-"Stephen Leybourne ",
-"Stephen Littlechild",
-"Stephen Machin ",
-"Stephen Malpezzi",
-"Stephen Martin",
-"Stephen Morris ",
-"Stephen Parente ",
-"Stephen Polasky ",
-"Stephen Pudney ",
-"Stephen Roper",
-"Stephen Ross ",
-"Stephen Spear",
-"Stephen Wu",
-"Stephen A. Woodbury",
-"Stephen Brock Blomberg",
-"Stephen C. Smith",
-"Stephen Charles Sheppard",
-"Stephen D. Oliner ",
-"Stephen D. Williamson ",
-"Stephen F. Hamilton",
-"Stephen F. LeRoy ",
-"Stephen G. Bronars",
-"Stephen Geoffrey Donald ",
-"Stephen George Hall ",
-"Stephen J Turnovsky ",
-"Stephen J. Brown ",
-"Stephen J. Trejo ",
-"Stephen James Redding ",
-"Stephen John Nickell ",
-"Stephen M. Miller ",
-"Stephen P. Holland",
-"Stephen P. Jenkins ",
-"Stephen P. Ryan",
-"Stephen P. Zeldes ",
-"Stephen Ross Yeaple ",
-"Stephen Roy Bond ",
-"Stephen S. Golub",
-"Stephen Walter Salant ",
-"Stergios Skaperdas ",
-"Steve Sorrell",
-"Steven Allen",
-"Steven Ambler",
-"Steven Berry ",
-"Steven Callander",
-"Steven Deller",
-"Steven Globerman",
-"Steven Lehrer",
-"Steven Levitt ",
-"Steven Ongena ",
-"Steven Poelhekke",
-"Steven Shavell ",
-"Steven Sheffrin",
-"Steven Stern ",
-"Steven Stillman ",
-"Steven Tadelis ",
-"Steven Venti ",
-"Steven A. Matthews ",
-"Steven A. Sharpe ",
-"Steven B Caudill",
-"Steven G. Rivkin ",
-"Steven J. Brams ",
-"Steven J. Davis ",
-"Steven J. Haider ",
-"Steven J. Huddart",
-"Steven J. Matusz",
-"Steven James Tucker",
-"Steven L. Puller",
-"Steven Mark Fazzari ",
-"Steven N. Durlauf ",
-"Steven Neil Kaplan ",
-"Stijn Claessens ",
-"Stijn Van Nieuwerburgh ",
-"Stilianos Fountas",
-"Stuart Mestelman",
-"Stuart A. Gabriel",
-"Stuart S. Rosenthal ",
-"Subal C. Kumbhakar ",
-"Subhash C. Ray",
-"Subhayu Bandyopadhyay",
-"Sudhanshu Kumar Mishra",
-"Sudipta Sarangi",
-"Sugato Chakravarty",
-"Sujoy Mukerji ",
-"Sule Alan",
-"Suleyman Basak ",
-"Sumit Agarwal ",
-"Sumon K. Bhaumik",
-"Sumru Altug",
-"Sun-Bin Kim",
-"Sune Karlsson",
-"Sune Karlsson",
-"Sunil Sharma",
-"Suresh P. Sethi",
-"Susan Parker",
-"Susan Pozo",
-"Susan Vroman ",
-"Susan Carleton Athey ",
-"Susan Chun Zhu",
-"Susan K. Laury ",
-"Susan L. Averett",
-"Susan M. Wachter",
-"Susan Marie Dynarski ",
-"Susan N. Houseman",
-"Susan Sunila Sharma",
-"Susann Rohwedder",
-"Susanne M. Schennach ",
-"Susanto Basu ",
-"Sushanta K. Mallick ",
-"Sushil Bikhchandani ",
-"Sushil Wadhwani ",
-"Susmita Dasgupta",
-"Suzi Kerr",
-"Sven Rady",
-"Sven Wunder",
-"Sweder van Wijnbergen ",
-"Sweta C. Saxena",
-"Sydney C. Ludvigson ",
-"Syed Abul Basher",
-"Syed Jawad Hussain Shahzad",
-"Sylvain Chassang",
-"Sylvain Leduc ",
-"Sylvester Eijffinger ",
-"Sylvie Démurger",
-"Syngjoo Choi",
-"T. D. Stanley ",
-"T. Paul Schultz ",
-"Tack Yun",
-"Tae Hwy Lee",
-"Tae-Hwan Kim",
-"Taisuke Nakata",
-"Takao Kato",
-"Takashi Kamihigashi",
-"Takashi Yamagata",
-"Takatoshi Ito ",
-"Takatoshi Tabuchi ",
-"Takeo Hoshi ",
-"Takushi Kurozumi",
-"Tamim A Bayoumi ",
-"Tan Wang",
-"Tanguy van Ypersele",
-"Tanjim Hossain",
-"Tanju Yorulmazer",
-"Tanya S. Rosenblat",
-"Tao Zha ",
-"Tarek Alexander Hassan ",
-"Tarjei Havnes",
-"Tarun Ramadorai ",
-"Taryn Dinkelman",
-"Tatiana Kirsanova",
-"Tatsuyoshi Saijo",
-"Tayfun Sonmez ",
-"Teck Hua Ho ",
-"Ted Bergstrom ",
-"Ted Joyce",
-"Ted O'Donoghue ",
-"Ted Temzelides",
-"Ted To",
-"Ted C. Schroeder",
-"Terence Tai Leung Chong ",
-"Teresa C. Fort",
-"Terrance Odean ",
-"Terry J Fitzgerald",
-"Terry Lee Roe",
-"Thanasis Stengos ",
-"Theo Nijman ",
-"Theo Offerman",
-"Theo Vermaelen ",
-"Theo Stefan Eicher ",
-"Theodor Valentin Purcarea",
-"Theodore Palivos",
-"Theodore Francis Groves Jr.",
-"Theofanis P. Mamuneas",
-"Thibault Fally",
-"Thiemo Rene Fetzer",
-"Thierry Foucault ",
-"Thierry Magnac ",
-"Thierry Mayer ",
-"Thierry Tressel",
-"Thierry A. Verdier ",
-"Thiess Buttner ",
-"Thijs ten Raa",
-"Thomas Astebro",
-"Thomas Brenner",
-"Thomas Buchmueller",
-"Thomas Chaney ",
-"Thomas DeLeire",
-"Thomas Dee ",
-"Thomas Demuynck",
-"Thomas Glauben",
-"Thomas Gries",
-"Thomas Hellmann ",
-"Thomas Laubach ",
-"Thomas Lemieux ",
-"Thomas Lubik ",
-"Thomas Lux",
-"Thomas Miceli ",
-"Thomas Nechyba",
-"Thomas Philippon ",
-"Thomas Piketty ",
-"Thomas Reardon ",
-"Thomas Siedler",
-"Thomas Stratmann ",
-"Thomas Straubhaar Sr.",
-"Thomas Zwick",
-"Thomas A Garrett",
-"Thomas A. Gresik",
-"Thomas A. Mroz",
-"Thomas B. Fomby",
-"Thomas D Tallarini Jr.",
-"Thomas F. Cooley ",
-"Thomas F. Cosimano",
-"Thomas F. Crossley ",
-"Thomas Fox Rutherford ",
-"Thomas George Rawski",
-"Thomas H. McInish",
-"Thomas H. Noe ",
-"Thomas H.W. Ziesemer",
-"Thomas I. Palley ",
-"Thomas J Chemmanur ",
-"Thomas J. Holmes ",
-"Thomas J. Kniesner ",
-"Thomas J. Prusa ",
-"Thomas J. Sargent ",
-"Thomas Johannes Dohmen ",
-"Thomas K. Bauer ",
-"Thomas Krichel",
-"Thomas Mathiasen Selden",
-"Thomas Michael Steger",
-"Thomas Nils Samuel Sterner ",
-"Thomas P. Gehrig",
-"Thomas Peyton Lyon",
-"Thomas S. Jayne ",
-"Thomas Warren Hertel ",
-"Thomas Wayne Ross ",
-"Thorsten Beck ",
-"Thorsten Schank",
-"Thorvaldur Gylfason ",
-"Thushyanthan Baskaran",
-"Tiago V de V Cavalcanti",
-"Til Schuermann ",
-"Till Requate ",
-"Till Marco von Wachter ",
-"Tilman Bruck",
-"Tilman Matthias Borgers",
-"Tim Bollerslev ",
-"Tim Callan",
-"Tim Friehe",
-"Tim Jenkinson ",
-"Tim Krieger",
-"Tim Roger Sass",
-"Timo Boppart",
-"Timo Kuosmanen",
-"Timo Terasvirta ",
-"Timo Wollmershauser",
-"Timothy Bresnahan ",
-"Timothy Cason ",
-"Timothy Cogley ",
-"Timothy Dunne ",
-"Timothy Vogelsang ",
-"Timothy Guy Conley ",
-"Timothy H. Hannan ",
-"Timothy J. Bartik ",
-"Timothy J. Besley ",
-"Timothy J. Kehoe ",
-"Timothy James Coelli ",
-"Timothy James Hatton ",
-"Timothy Km Beatty",
-"Timothy M. Bates",
-"Timothy Simon Worrall",
-"Timothy W. Guinnane ",
-"Tito Boeri ",
-"Tito Cordella",
-"Tobias Adrian ",
-"Tobias Kretschmer",
-"Tobias Schmidt",
-"Todd Clark ",
-"Todd Elder ",
-"Todd Keister",
-"Todd Sandler ",
-"Todd Schoellman",
-"Todd Sinai ",
-"Todd B. Walker ",
-"Todd L. Cherry",
-"Todd R. Kaplan",
-"Todd R. Stinebrickner ",
-"Toke S Aidt ",
-"Tom Doan ",
-"Tom Engsted",
-"Tom Kompas",
-"Tom Krebs",
-"Tom McCurdy",
-"Tomas Havranek ",
-"Tomas Sjostrom ",
-"Tomas J Philipson ",
-"Tomaso Duso",
-"Tomasz Strzalecki ",
-"Tomasz Marek Mickiewicz",
-"Tomasz Wojciech Wieladek ",
-"Tommaso Frattini",
-"Tommaso Monacelli ",
-"Tommaso Nannicini ",
-"Tommaso Proietti",
-"Tommaso Valletti ",
-"Tomoya Mori",
-"Toni M Whited ",
-"Tony Lancaster ",
-"Tooraj Jamasb ",
-"Tor Eriksson",
-"Torben G. Andersen ",
-"Tore Ellingsen ",
-"Torsten Persson ",
-"Torsten Slok",
-"Toshihiko Mukoyama ",
-"Toshihiro Okubo ",
-"Tracy R. Lewis ",
-"Travis J. Lybbert",
-"Treb Allen",
-"Trevor Breusch",
-"Trevor Tombe",
-"Trond E. Olsen",
-"Troy Davig",
-"Trudy Ann Cameron ",
-"Tullio Jappelli ",
-"Tuomas Antero Peltonen",
-"Udo Ebert",
-"Udo Kreickemeier",
-"Udo Ludwig",
-"Ufuk Akcigit ",
-"Ugo Panizza ",
-"Ugur Soytas ",
-"Ujjayant Chakravorty",
-"Ulf Soderstrom",
-"Ulf-G. Gerdtham ",
-"Ulrich Fritsche",
-"Ulrich Hege",
-"Ulrich Kaiser",
-"Ulrich Schmidt ",
-"Ulrich Witt",
-"Urban Joseph Jermann ",
-"Uri Gneezy ",
-"Urs Fischbacher ",
-"Uschi Backes-Gellner",
-"Uta Schoenberg ",
-"Utku Unver ",
-"Utpal Bhattacharya",
-"Uwe Cantner",
-"Uwe Hassler",
-"Uwe Jirjahn",
-"Uwe Sunde ",
-"Uwe Walz",
-"Uzi Segal ",
-"V Bhaskar ",
-"V. Joseph Hotz ",
-"V. Kerry Smith ",
-"Vadym Volosovych",
-"Val Eugene Lambson",
-"Valentin Zelenyuk",
-"Valentina Bosetti",
-"Valentina Corradi",
-"Valentino Dardanoni",
-"Valeria Costantini",
-"Valerie Cerra",
-"Valerie Lechene",
-"Valerie Mignon ",
-"Valerie Ann Ramey ",
-"Valerie R. Bencivenga",
-"Vance Lindsay Martin",
-"Vanessa Simen Tchamyou",
-"Vani Kant Borooah ",
-"Varadarajan Chari ",
-"Varouj Aram Aivazian",
-"Vasco Curdia ",
-"Vasco Marques de Carvalho",
-"Vasiliki Skreta",
-"Vassilis Argyrou Hajivassiliou",
-"Vasso Ioannidou",
-"Venky Venkateswaran",
-"Venus Khim-Sen Liew",
-"Vernon L. Smith ",
-"Veronica Guerrieri ",
-"Vicente Cunat",
-"Victor Aguirregabiria ",
-"Victor Chernozhukov ",
-"Victor Matheson",
-"Victor Stango",
-"Victor A. Ginsburgh ",
-"Victor Chaim Lavy ",
-"Victor R. Fuchs ",
-"Victor Меерович Polterovich",
-"Victoria Liza Prowse",
-"Vidhan K. Goyal",
-"Vijay Krishna ",
-"Vijayendra Rao ",
-"Vikram Nanda ",
-"Vikrant Vig ",
-"Viktoria V. Hnatkovska",
-"Vincent Vannetelbosch",
-"Vincent Vicard",
-"Vincent P. Crawford ",
-"Vincent Raymond Reinhart ",
-"Vincenzo Atella",
-"Vincenzo Denicolo'",
-"Vincenzo Galasso ",
-"Vincenzo Quadrini ",
-"Vincenzo Scoppa",
-"Vincenzo Verardi",
-"Viral V. Acharya ",
-"Virgiliu Midrigan ",
-"Virginie Coudert",
-"Vito Peragine",
-"Vito Antonio Muscatelli",
-"Vittorio Corbo",
-"Vivian Zhanwei Yue",
-"Viviana Fernandez",
-"Vladimir Popov",
-"Vojislav Maksimovic ",
-"Volker Grossmann",
-"Volker Nitsch",
-"Volker Nocke ",
-"Volker Wieland ",
-"Vudayagiri N. Balasubramanyam",
-"W Kip Viscusi ",
-"W Scott Frame",
-"W. Adam Looney",
-"W. Bentley Macleod ",
-"W. Craig Riddell ",
-"W. D. Walls",
-"W. Robert Reed ",
-"Walter Bossert ",
-"Walter Enders ",
-"Walter Kramer",
-"Walter Erwin Diewert ",
-"Warren E. Weber ",
-"Warwick J. McKibbin ",
-"Wayne Ferson ",
-"Wayne B. Gray",
-"Wei Jiang",
-"Wei Li",
-"Wei Xiong ",
-"Wei-Bin Zhang ",
-"Wei-Xing Zhou",
-"Wendy Carlin",
-"Werner Antweiler",
-"Werner Eichhorst",
-"Werner Guth ",
-"Werner Holzl",
-"Werner Ploberger ",
-"Wesley W. Wilson",
-"Whitney Newey ",
-"Wieland Muller",
-"Wiji Arulampalam ",
-"Wiktor Adamowicz ",
-"Wilbert H van der Klaauw ",
-"Wilbur John Coleman II",
-"Wilfred John Ethier ",
-"Wilko Bolt",
-"Will J Martin ",
-"Willem Thorbecke",
-"Willem Hendrik Buiter ",
-"Willi Semmler Sr.",
-"William Easterly ",
-"William Gould",
-"William Harbaugh",
-"William Jack",
-"William Kerr ",
-"William Neilson",
-"William Poole ",
-"William Roberds ",
-"William Thomson ",
-"William Wascher ",
-"William A. Branch",
-"William A. Brock ",
-"William A. Pizer ",
-"William Alan Masters",
-"William Alexander Darity Jr.",
-"William Alexander Kerr",
-"William Arnold Barnett ",
-"William C. Horrace",
-"William C. Strange ",
-"William D. Lastrapes ",
-"William D. Nordhaus ",
-"William E. Taylor",
-"William Edward Becker Jr.",
-"William F. Maloney ",
-"William F. Sharpe ",
-"William F. Shughart II",
-"William Glenn Gale ",
-"William H Greene ",
-"William J. Collins",
-"William M. Gentry",
-"William M. Landes",
-"William N. Evans ",
-"William N. Goetzmann ",
-"William R. Cline ",
-"William R. Johnson ",
-"William R. Zame ",
-"William Robert Maurice Perraudin",
-"William Thomas Gavin",
-"Wim Naude ",
-"Wim P. M. Vijverberg",
-"Winand Emons",
-"Winfried Koeniger",
-"Wing Suen",
-"Wing Thye Woo",
-"Wing-Keung Wong ",
-"Winston Harrington",
-"Witold Jerzy Henisz",
-"Wojciech Kopczuk ",
-"Wolf Wagner ",
-"Wolfgang Franz",
-"Wolfgang Keller ",
-"Wolfgang Maennig",
-"Wolfgang Nierhaus ",
-"Wolfgang Ochel",
-"Wolfgang Pesendorfer ",
-"Wolfgang Karl Hardle ",
-"Wolfram F. Richter",
-"Wouter Denhaan ",
-"Wouter Dessein",
-"Xavier D'Haultfoeuille",
-"Xavier Debrun",
-"Xavier Fageda",
-"Xavier Freixas ",
-"Xavier Gabaix ",
-"Xavier Gine ",
-"Xavier Jaravel",
-"Xavier Ragot",
-"Xavier Sala-i-Martin ",
-"Xavier Timbeau ",
-"Xavier Vives ",
-"Xiaobo Zhang ",
-"Xiaodong Liu",
-"Xiaodong Zhu ",
-"Xiaoji Lin",
-"Xiaoyan Zhang ",
-"Xin Meng ",
-"Xinshen Diao",
-"Xuezhong He",
-"Y. Hossein Farzin",
-"Y. K. Tse",
-"Yacine Ait-Sahalia ",
-"Yacov Tsur",
-"Yair Mundlak ",
-"Yair Tauman",
-"Yakov Amihud ",
-"Yan Bai",
-"Yang Yao",
-"Yangru Wu",
-"Yaniv Grinstein",
-"Yann Algan ",
-"Yann Bramoulle",
-"Yannick L'Horty",
-"Yannis Georgellis",
-"Yannis M. Ioannides ",
-"Yanrui 吴延瑞 Wu",
-"Yasusada Murata",
-"Yasushi Hamao",
-"Yasuyuki Sawada ",
-"Yasuyuki Todo",
-"Yaw Nyarko ",
-"Yeneng Sun",
-"Yener Altunbas",
-"Yeon-Koo Che ",
-"Yew-Kwang Ng ",
-"Yi Lu",
-"Yi Wen ",
-"Yi Daniel Xu",
-"Yi-Ming Wei ",
-"Yifan Zhang",
-"Yin-Wong Cheung ",
-"Yingyao Hu",
-"Yixiao Sun ",
-"Yochanan Shachmurove",
-"Yona Rubinstein ",
-"Yongcheol Shin ",
-"Yongheng Deng ",
-"Yongmiao Hong ",
-"Yongmin Chen ",
-"Yongseok Shin ",
-"Yongsheng Xu",
-"Yongsung Chang ",
-"Yoon-Jae Whang",
-"Yoosoon Chang",
-"Yoram Halevy",
-"Yoram Weiss ",
-"Yoshitsugu Kanemoto",
-"Yoshiyasu Ono",
-"Yothin Jinjarak",
-"Yoto V. Yotov ",
-"Yu Yuan",
-"Yudong Wang",
-"Yue Ma ",
-"Yue-Jun Zhang",
-"Yuhang Xing ",
-"Yuliya Demyanyk",
-"Yuriy Gorodnichenko ",
-"Yuyu Chen",
-"Yves Balasko",
-"Yves Sprumont ",
-"Yves Zenou ",
-"Zacharias Psaradakis",
-"Zheng Liu ",
-"Zheng Michael Song",
-"Zhenyu Wang",
-"Zhi Wang ",
-"Zhigang Tao",
-"Zhiguo He ",
-"Zhijie Xiao ",
-"Zhiqi Chen",
-"Zhong Zhao",
-"ZhongXiang Zhang ",
-"Zhongjun Qu",
-"Zoltan J. Acs ",
-"Zongwu Cai",
-"Zsolt Darvas",
-"Zubair Hasan",
-"Zuzana Irsova",
-"Zvi Bodie ",
-"Zvi Eckstein ",
-"Zvi Hercowitz ",
-"Zvika Neeman",
-"d'Artis Kancs"
-]
-
-const SUGGESTIONS_INST = [
-"İnönü Üniversitesi",
-"1 December 1918 University in Alba Iulia",
-"18 March University",
-"AAB College",
-"AEI-Brookings Joint Institute for Regulatory Studies",
-"ARC Centre of Excellence for Children and Families over the Life Course (Life Course Centre)",
-"ARU Foundation",
-"ASEAN+3 Macroeconomic Research Office (AMRO)",
-"Aalborg Business College",
-"Aalen University of Applied Sciences",
-"Aalto University",
-"Abai University",
-"Abant Izzet Baysal University",
-"Abderrahmane Mira University of Bejaia",
-"Abdullah Gul University",
-"Aberystwyth University",
-"Abo Academy",
-"Aboa Centre for Economics (ACE)",
-"Abou Bekr Belkaid University of Tlemcen",
-"Abu Dhabi School of Management",
-"Abu Dhabi University",
-"Academia Sinica",
-"Academic College of Tel Aviv Jaffa",
-"Academic Consortium for Socioeconomics and Environment",
-"Academic Consortium on International Trade - ACIT",
-"Academic University Lahr",
-"Academy for Spacial Reasearch and Planning",
-"Academy of Bordeaux",
-"Academy of Central-America",
-"Academy of Clermont-Ferrand",
-"Academy of Commerce",
-"Academy of Dijon",
-"Academy of Economic Studies",
-"Academy of Economics and Finance - AEF",
-"Academy of Finance",
-"Academy of Grenoble",
-"Academy of Lyon",
-"Academy of Management",
-"Academy of Management and Administration",
-"Academy of Municipal Administration",
-"Academy of Nice",
-"Academy of Policy and Development",
-"Academy of Public Administration under the Aegis of the President of the Republic of Belarus",
-"Academy of Public Administration under the President of the Republic of Azerbaijan",
-"Academy of Public Administration under the President of the Republic of Uzbekistan",
-"Academy of Sciences",
-"Academy of Sciences of the Republic of Tatarstan",
-"Academy of Social and Political Research",
-"Academy of State and Municipal Administration",
-"Acadia University",
-"Account Chamber of the Russian Federation",
-"Accounting and Finance Association of Australia and New Zealand - AFAANZ",
-"Accounting and Finance Research Association - AFRA",
-"Adam Mickiewicz University",
-"Adam Smith Center",
-"Adam Smith Institute",
-"Adamas University",
-"Adaptative Economics Association",
-"Addis Ababa University",
-"Adekunle Ajasin University",
-"Adelphi University",
-"Adiyaman University",
-"Adnan Menderes University",
-"Adolfo Ibanez University",
-"Adrian College",
-"Advanced School of Economics in Venice",
-"Adventist University of Bolivia",
-"Adventist University of Indonesia",
-"Adventist University of La Plata",
-"Aegean Finance Association",
-"Aeronautics Technology Institute",
-"Affinity Business School",
-"Afghanistan Research and Evaluation Unit (AREU)",
-"Africa Center for Energy Policy (ACEP)",
-"Africa Institute for Forecasting and Financial Analysis (AIFFA)",
-"African Association of Agricultural Economists - AAAE",
-"African Capacity Building Foundation",
-"African Center for Economic Transformation (ACET)",
-"African Development Bank",
-"African Econometric Society - AES",
-"African Economic History Network - AEHN",
-"African Economic Research Consortium",
-"African Farm Management Association - AFMA",
-"African Finance Association - AFA",
-"African Finance and Economics Association - AFEA",
-"African Institute for Applied Economics (AIAE)",
-"African Institute for Managerial Studies and Technology",
-"African School of Economics",
-"African Society for Ecological Economics",
-"African Women's Economic Policy Network - AWEPON",
-"Agency for Cooperation, Education and Development (ACED)",
-"Agenda Austria",
-"Agnes Scott College",
-"Agostinho Neto University",
-"Agricultural Academy",
-"Agricultural Economics Association of Georgia - AEAG",
-"Agricultural Economics Association of South Africa - AEASA",
-"Agricultural Economics Research Association (India) - AERA",
-"Agricultural Economics Society - AES",
-"Agricultural Policy Research Network - APRNet",
-"Agricultural University of Ecuador",
-"Agricultural and Applied Economics Association - AAEA",
-"AgroParisTech",
-"Ahi Evran University",
-"Ahmad Dahlan University",
-"Ahmedabad University",
-"Aichi Gakusen University",
-"Aishwarya Institute of Management",
-"Aix-Marseille University",
-"Ajman University of Science and Technology",
-"Ajou University",
-"Akamai University",
-"Akdeniz University",
-"Aksaray University",
-"Al Ahliyya Amman University",
-"Al Akhawayn University",
-"Al Falah University",
-"Al Jouf University",
-"Al al-Bayt University",
-"Al-Balqa' Applied University",
-"Al-Farabi Kazakh National University",
-"Al-Isra Private University",
-"Al-Quds University",
-"Al.I. Cuza University",
-"Alabama A&M University",
-"Alabama Council on Economic Education (ALCEE)",
-"Alabama State University",
-"Alaska Pacific University",
-"Albany State University",
-"Albert Jacquard College",
-"Albion College",
-"Albright College",
-"Alcorn State University",
-"Alexander Dubcek University of Trencine",
-"Alexander Technological Education Institute",
-"Alfa University",
-"Alfred Nobel University",
-"Alfred University",
-"Algoma University",
-"Aligarh Muslim University",
-"All-Russian institute of agrarian problems and information theory (VIAPI)",
-"Allahabad University",
-"Allameh Tabataba'i University",
-"Allegheny College",
-"Allegheny Institute for Public Policy",
-"Allen University",
-"Allensbach Univeristy",
-"Alliance University",
-"Alliance for Financial Inclusion",
-"Alliant International University",
-"Alma College",
-"Alpen-Adria University of Klagenfurt",
-"Alps University of Grenoble",
-"Altai State University",
-"Alvernia College",
-"Alves Faria Faculties",
-"Alzahra University",
-"Amadeo Avogadro University of the Eastern Piedmont",
-"Ambedkar University Delhi",
-"American Antitrust Institute",
-"American Bar Foundation (ABF)",
-"American College of Greece",
-"American Committee on Asian Economic Studies - ACAES",
-"American Council for Capital Formation (ACCF)",
-"American Council for an Energy-Efficient Economy",
-"American Economic Association - AEA",
-"American Enterprise Institute",
-"American Finance Association - AFA",
-"American Institute for Economic Research",
-"American Institute for Full Employment (AIFE)",
-"American International College",
-"American International University-Bangladesh (AIUB)",
-"American Law and Economics Association - ALEA",
-"American Real Estate Society - ARES",
-"American Real Estate and Urban Economics Association - AREUEA",
-"American Rehabilitation Economics Association - AREA",
-"American Risk and Insurance Association - ARIA",
-"American Society of Hispanic Economists - ASHE",
-"American Sociological Association, Economic Sociology Section",
-"American Statistical Association, Business and Economic Statistics Section - ASA,B&E",
-"American University",
-"American University in Bulgaria",
-"American University of Afghanistan",
-"American University of Beirut",
-"American University of Ras Al Khaimah",
-"American University of Sharjah",
-"American University of Technology",
-"Amhara Regional Agricultural Research Institute (ARARI)",
-"Amirkabir University of Technology",
-"Amity University",
-"Amman Arab University",
-"Amsterdam Institute for International Development (AIID)",
-"Amsterdam University of Applied Sciences",
-"Amur State University",
-"An-Najah National University",
-"Ana G. Mendez University",
-"Ananda Chandra College of Commerce",
-"Andalas University",
-"Andalusian Institute for Social Studies",
-"Andean Development Corporation - Development Bank of Latin America",
-"Anderson University",
-"Andine University of Cuzco",
-"Andrei Saguna University",
-"Andres Bello National University",
-"Andrews University",
-"Andrzej Frycz-Modrzewski Cracow University",
-"Andrássy Gyula German Speaking University",
-"Angelo State University",
-"Angers School of Agriculture",
-"Anglia Ruskin University",
-"Anglo-American University",
-"Anhui University of Finance and Economics",
-"Anhui University of Technology",
-"Ankara Haci Bayram Veli University",
-"Ankara Yildirim Beyazit University",
-"Annamalai University",
-"Antioch New England Graduate School",
-"Antioquia University",
-"Antonio de Nebrija University",
-"Aoyama Gakuin University",
-"Apeejay School of Management",
-"Appalachian State University",
-"Applied Regional Science Council - ARSC",
-"Applied Research and Communications Fund (ARC Fund)",
-"Aquinas College",
-"Aquino Bolivian University",
-"Arab Academy for Science & Technlogy and Maritime Transport",
-"Arab American University",
-"Arab Bank for Economic Development in Africa",
-"Arab Fund for Econimic and Social Development (AFESD)",
-"Arab Monetary Fund (AMF)",
-"Arab Planning Institute (API)",
-"Arcadia University",
-"Ardahan University",
-"Argentine Center for International Studies",
-"Argentine Institute for Economic Development",
-"Argentine National Academy of Economic Sciences",
-"Argentinian Association of Agricultural Economics",
-"Argentinian Association of Economic History",
-"Argentinian Association of Political Economy",
-"Argentinian Health Economics Association",
-"Ariel University",
-"Aristotle University of Thessaloniki",
-"Arizona State University",
-"Arizona State University Polytechnic",
-"Arkansas State University",
-"Arkansas Tech University",
-"Armenian Economic Association - AEA",
-"Armenian International Policy Research Group (AIPRG)",
-"Armenian State University of Economics (ASUE)",
-"Artistide Merloni Foundation, Institute for Social and Economic Development",
-"Arts, Sciences and Technology University in Lebanon",
-"Artsakh State University",
-"Asan",
-"Asbury College",
-"Aschaffenburg University of Applied Sciences",
-"Ashesi University College",
-"Ashland University",
-"Asia School of Business",
-"Asia University",
-"Asia e University",
-"Asia-Pacific Economic Cooperation (APEC)",
-"Asia-Pacific Policy Center",
-"Asian Consumer and Family Economics Association - ACFEA",
-"Asian Development Bank",
-"Asian Development Research Institute (ADRI)",
-"Asian Economic and Social Society - AESS",
-"Asian Finance Association - AFA",
-"Asian Financial Society - AFS",
-"Asian Infrastructure Investment Bank",
-"Asian Institute of Communication and Research (AICAR) Business School",
-"Asian Institute of Management",
-"Asian Law and Economics Association - ASLEA",
-"Assiut University",
-"Assocation of Economists of Puerto Rico",
-"Association Française pour le Développement de l'Intelligence Économique - AFDIE",
-"Association Internationale Léon Walras",
-"Association Internationale d'Economie Alimentaire et Agroindustrielle - AIEA2",
-"Association for Banking and Finance - ABF",
-"Association for Comparative Economic Studies - ACES",
-"Association for Cultural Economics International - ACEI",
-"Association for Documentation in Economics - ADE",
-"Association for Ecological Economics",
-"Association for Economic and Social Analysis - AESA",
-"Association for Education Finance and Policy - AEFP",
-"Association for Evolutionary Economics - AFEE",
-"Association for Financial Economics",
-"Association for Heterodox Economics - AHE",
-"Association for Integrity and Responsible Leadership in Economics and Associated Professions - AIRLEAP",
-"Association for Modelling and Forecasting Economies in Transition - AMFET",
-"Association for Public Economic Theory - APET",
-"Association for Public Policy Analysis and Management - APPAM",
-"Association for Real Estate Securitization - ARES",
-"Association for Social Economics - ASE",
-"Association for Social Policy",
-"Association for Social Policy, Committee for Accounting",
-"Association for Social Policy, Committee for Business Theory and Policy",
-"Association for Social Policy, Committee for Development Economics",
-"Association for Social Policy, Committee for Econometrics",
-"Association for Social Policy, Committee for Economic History",
-"Association for Social Policy, Committee for Economic Policy",
-"Association for Social Policy, Committee for Economic Systems and Institutional Economics",
-"Association for Social Policy, Committee for Economic Theory",
-"Association for Social Policy, Committee for Environmental and Resource Economics",
-"Association for Social Policy, Committee for Evolutionary Economics",
-"Association for Social Policy, Committee for Health Economics",
-"Association for Social Policy, Committee for Industrial Economics",
-"Association for Social Policy, Committee for International Economics",
-"Association for Social Policy, Committee for Regional Theory and Policy",
-"Association for Social Policy, Committee for Social Economics",
-"Association for Social Policy, Committee for Social Policy",
-"Association for Social Studies of Finance",
-"Association for Studies in Public Economics - ASPE",
-"Association for University Business and Economic Research - AUBER",
-"Association for interdisciplinary Study and Research of Labor",
-"Association for the Developemt of Economic History",
-"Association for the Development of Research on Economics and Statistics",
-"Association for the Study of Religion, Economics, and Culture - ASREC",
-"Association for the Study of the Grants Economy - ASGE",
-"Association marocaine d'études et de recherches en économie islamique - ASMECI",
-"Association of African Central Banks - AACB",
-"Association of African Young Economists - AAYE",
-"Association of Agricultural Economists",
-"Association of Agricultural Economists in Slovakia",
-"Association of Behavioral Economics and Finance - ABEF",
-"Association of Business Historians - ABH",
-"Association of Caribbean Economists - ACE",
-"Association of Christian Economists - ACE",
-"Association of Community Development Finance Institutions - Sa-Dhan",
-"Association of Competition Economics - ACE",
-"Association of Construction Economists in Finland",
-"Association of Critical Economics",
-"Association of Economic Consultants in Poland",
-"Association of Economics and Social Sciences Teachers",
-"Association of Economists of Latin America and the Caribbean",
-"Association of European Business Economics Lawyers",
-"Association of German Economic Engineers",
-"Association of Gulf Economists - AGE",
-"Association of Independent Centers of Economic Analysis - ARETT",
-"Association of Indian Economic and Financial Studies - AIEFS",
-"Association of Latin American Economics Faculties, Schools and Institutes",
-"Association of Private Enterprise Education - APEE",
-"Association of Public Data Users - APDU",
-"Association of Quebec Economists",
-"Association of Southeast Asian Nations (ASEAN)",
-"Association of Southern European Economic Theorists - ASSET",
-"Association of Tunisian Economists",
-"Associazione-Fondazione EconomiaReale - ER",
-"Assumption College",
-"Aston University",
-"Ataturk University",
-"Ateneo de Manila University",
-"Athabasca University",
-"Athenaeum University",
-"Athenian Policy Forum (APF)",
-"Athenian Policy Forum - APF",
-"Athens Graduate School of Management",
-"Athens Institute for Education and Research - ATINER",
-"Athens Laboratory of Business Administration (ALBA)",
-"Athens State University",
-"Athens University of Economics and Business (AUEB)",
-"Atilim University",
-"Atlantic Council",
-"Atlantic Institute for Market Studies",
-"Atlantic Provinces Economic Council (APEC)",
-"Atlantic Union College",
-"Atlantico Business School",
-"Atlas Economic Research Foundation",
-"Atma Jaya Catholic University of Indonesia",
-"Atria Institute of Technology",
-"Auburn University",
-"Auckland University of Technology",
-"Audencia Nantes School of Management",
-"Augsburg College",
-"Augsburg University of Applied Sciences",
-"Augusta University",
-"Augustana College",
-"Aurel Vlaicu University of Arad",
-"Austin Community College",
-"Austin Peay State University",
-"Australasian Farm Business Management Network - AFBM",
-"Australasian Macroeconomics Society - AMS",
-"Australian Agricultural and Resource Economics Society - AARES",
-"Australian Centre for Economic Research on Health (ACERH)",
-"Australian Centre for International Agricultural Research (ACIAR)",
-"Australian Defense Force Academy",
-"Australian Health Economics Society - AHES",
-"Australian Health Workforce Institute (AHWI)",
-"Australian Law and Economics Association - AustLEA",
-"Australian National University",
-"Austrian Academy of Sciences",
-"Austrian Association for Energy Economics - AAEE",
-"Austrian Economic Association",
-"Austrian Feminist Economists",
-"Austrian Health Economics Association - ATHEA",
-"Austrian Institute for SME Research",
-"Austrian Institute of Economic Research",
-"Austrian Institute of Technology (AIT)",
-"Austrian Research Foundation for International Development",
-"Austrian Society for Agricultural Economics",
-"Autonomous Technological Institute of Mexico",
-"Autonomous University of Barcelona",
-"Autonomous University of Chihuahua",
-"Autonomous University of Chiriqui",
-"Autonomous University of Coahulia",
-"Autonomous University of Hidalgo State",
-"Autonomous University of Lisbon",
-"Autonomous University of Lower California",
-"Autonomous University of Madrid",
-"Autonomous University of Mexico State",
-"Autonomous University of Nayarit",
-"Autonomous University of Nuevo Leon",
-"Autonomous University of Queretaro",
-"Autonomous University of Santo Domingo",
-"Autonomous University of Sinaloa",
-"Autonomous University of Southern Lower California",
-"Autonomous University of Tamaulipas",
-"Autonomous University of Tlaxcala",
-"Autonomous University of Yucatan",
-"Autonomous University of Zacatecas",
-"Autonomous University of the Caribbean",
-"Autonomous University of the West",
-"Averett University",
-"Avrasya University",
-"Azerbaijan Diplomatic Academy",
-"Azerbaijan National Academy of Sciences",
-"Azerbaijan State Economic University",
-"Azerbaijan Technical University",
-"BAU Bahcesehir University",
-"BBVA Bancomer Foundation",
-"BBVA Group",
-"BGC Trust University Bangladesh",
-"BI Norwegian Business School",
-"BSP Business School Berlin Potsdam",
-"Babes-Bolyai University",
-"Babson College",
-"Bachelier Finance Society - BFS",
-"Baden-Wuerttemberg Corporate State University",
-"Bahamas Central Bank",
-"Bahamas Financial Services Board",
-"Bahauddin Zakariya University",
-"Bahir Dar University",
-"Bahrain Institute for Banking and Finance",
-"Bahria University",
-"Baikal National University of Economics and Law",
-"Baker University",
-"Baldwin-Wallace University",
-"Balikesir University",
-"Balkanu Development Corporation",
-"Ball State University",
-"Baltic Institute of Economy and Finance (BIEF)",
-"Banaras Hindu University",
-"Bandung Fe Institute",
-"Bangabandhu Sheikh Mujibur Rahman Agricultural University",
-"Bangkok University",
-"Bangladesh Bank",
-"Bangladesh Development Research Center (BRDC)",
-"Bangladesh Institute of International and Strategic Studies (BIISS)",
-"Bangladesh Public Administration Training Centre (BPATC)",
-"Bangladesh University of Business and Technology (BUBT)",
-"Bangor University",
-"Bank for International Settlements",
-"Bank for International Settlements (BIS)",
-"Bank of Albania",
-"Bank of Botswana",
-"Bank of Canada",
-"Bank of England",
-"Bank of Eritrea",
-"BdF",
-"Banque de France",
-"Bank of France",
-"Bank of Greece",
-"Bank of Israel",
-"Bank of Italy",
-"Bank of Jamaica",
-"Bank of Korea",
-"Bank of Latvia",
-"Bank of Lebanon",
-"Bank of Lithuania",
-"Bank of Mauritius",
-"Bank of Mexico",
-"Bank of Mongolia",
-"Bank of Namibia",
-"Bank of Sierra Leone",
-"Bank of Somaliland",
-"Bank of South Sudan",
-"Bank of Spain",
-"Bank of Tanzania",
-"Bank of Thailand",
-"Bank of Zambia",
-"Bank of the Central African States",
-"Bank of the Lao PDR",
-"Bankers Institute of Rural Development (BIRD)",
-"Bankers Institute of the Philippines (BAIPHIL)",
-"Banking Academy",
-"Banking Institution of Higher Education",
-"Banking University in Kyiv",
-"Banking University of Ho Chi Minh City",
-"Banking and Finance Academy of the Rebublic of Uzbekistan",
-"Bar Ilan University",
-"Barcelona Graduate School of Economics (Barcelona GSE)",
-"Barcelona Institute for Political Economy and Governance (IPEG)",
-"Barcelona Tech",
-"Bard College",
-"Barry University",
-"Barton College",
-"Basel Economics",
-"Bashkir State University",
-"Baskent University",
-"Basrah University",
-"Bayburt University",
-"Bayero University",
-"Bayesian Institute for Research and Development",
-"Baylor University",
-"Bayreuth Research Institute on Small and Medium-Size Enterprises",
-"Beaconhouse National University",
-"Beeronomics Society",
-"Beijing City University",
-"Beijing Language and Culture University",
-"Beijing Normal University",
-"Beijing University of Aeronautics and Astronautics (Beihang University)",
-"Beijing University of Chemical Technology",
-"Beijing University of Posts and Telecommunications",
-"Beijing University of Technology",
-"Beijing Wuzi University",
-"Belarusian State University",
-"Belarussian Trade and Economy University of Consumer Cooperatives",
-"Belgian Association for Agricultural Economics",
-"Belgorod University of Cooperation, Economics and Law",
-"Belgrade Banking Academy",
-"Belgrano University",
-"Belhadj Bouchaib University Center",
-"Bellevue Community College",
-"Belotserkovny State Agrarian University",
-"Ben Gurion University of the Negev",
-"Benazir Bhutto Shaheed University",
-"Benedict College",
-"Benemeta Autonomous University of Puebla",
-"Bengaluru Dr. B. R. Ambedkar School of Economics (BASE) University",
-"Bennett University",
-"Benue State University",
-"Berdyansk University of Management and Business",
-"Bergen University College",
-"Berkeley College",
-"Berlin Doctoral Program of Economics and Management Science (BDPEMS)",
-"Berlin Free University",
-"Berlin Institute for Finanical Market Research",
-"Berlin School of Economics and Law",
-"Berlin University of Applied Sciences",
-"Bermuda Monetary Authority",
-"Bern University for Applied Sciences",
-"Bethany College",
-"Bethel College",
-"Bethune-Cookman College",
-"Beuth University of Applied Sciences",
-"Beykent University",
-"Bharathiar University",
-"Bharathidasan University",
-"Bharati Vidyapeeth Institute of Management and Research",
-"Bhayangkara Jakarta Raya University",
-"Bidhan Chandra Agricultural University",
-"Bielsko-Biala School of Finance and Law",
-"Bifröst School of Business",
-"Bilecik Seyh Edebali University",
-"Bilkent University",
-"Bina Darma University",
-"Bina Nusantara University",
-"Binary University of Management and Entrepreneurship",
-"Bio-Bio University",
-"Biola University",
-"Birkbeck College",
-"Birla Institute of Management Technology",
-"Birla Institute of Technology and Science (BITS)",
-"Birmingham City University",
-"Birzeit University",
-"Bishop's University",
-"Bissau Economics Lab",
-"Black Hills State University",
-"Blackburn College",
-"Blekinge Institute of Technology",
-"Bloomsburg University",
-"Blue Crest University College",
-"Bluefield State College",
-"Bob Jones University",
-"Bocconi University",
-"Bodø Graduate School of Business",
-"Bogazici University",
-"Bogor Agricultural University",
-"Boise State University",
-"Bolivar Pontifical University",
-"Bolivar Technological University",
-"Bolivian Institute of Agricultural Economics and Policy",
-"Bolivian Private University",
-"Bond University",
-"Bonn Institute for Economic and Social Research",
-"Boston College",
-"Boston University",
-"Botswana College of Agriculture",
-"Bournemouth University",
-"Bowdoin College",
-"Brac University",
-"Bradley University",
-"Brandeis University",
-"Brandenburg University of Technology Cottbus",
-"Brandon University",
-"Bratsky State University",
-"Brazilian Association for Research in Economic History",
-"Brazilian Institute for Financial Innovation",
-"Brazilian Keynesian Association",
-"Brazilian Society of Ecological Economics",
-"Brazilian Society of Econometrics",
-"Brazilian Society of Finance",
-"Brazlian Society of Rural Economics and Sociology",
-"Bremen Energy Institute",
-"Bremen University of Applied Sciences",
-"Brescia University",
-"Brest Business School",
-"Brest State Technical University",
-"Briar Cliff University",
-"Bridgewater College",
-"Bridgewater State University",
-"Brigham Young University",
-"British Institute of Energy Economics - BIEE",
-"British University in Dubai",
-"British University in Egypt",
-"Brno Technical University",
-"Brock University",
-"Brookings Institution",
-"Brown University",
-"Bruegel",
-"Brunel University",
-"Bruno Leoni Institute",
-"Brussels Free University",
-"Bryn Mawr College",
-"Bu-Ali Sina University",
-"Bucharest Academy of Economic Studies",
-"Bucknell University",
-"Budapest Business School",
-"Budapest Institute for Policy Analysis",
-"Budapest Metropolitan University of Applied Sciences",
-"Budapest University of Technology and Economics",
-"Buena Vista University",
-"Bulent Ecevit University",
-"Bulgarian Academy of Sciences",
-"Bulgarian National Bank",
-"Bung Hatta University",
-"Burapha University",
-"Bureau for Food and Agricultural Policy (BFAP)",
-"Bureau of Economic Analysis",
-"Burgundy School of Business",
-"Bursa Orhangazi University",
-"Business Academy Copenhagen North",
-"Business Association of Latin American Studies - BALAS",
-"Business School",
-"Business School of Par",
-"Business University of Argentina",
-"Business University of the 21st Century",
-"Business and Information Technology School (BITS)",
-"C. D. Howe Institute",
-"C. V. Raman College of Engineering",
-"CASE-Center for Social and Economic Research",
-"CEMA University",
-"CENPO Public Policy Centre",
-"CERES, Research School for Resource Studies for Development",
-"CESAG Business School",
-"CESifo",
-"CFVG",
-"CNA Corporation (CNAC)",
-"CRA International",
-"Cadi Ayyad University",
-"Cag University",
-"Cairo University",
-"Cajamar Institute of the Cajamar Foundation",
-"Calcutta Business School",
-"Caldwell College",
-"California Institute of Technology",
-"California Lutheran University",
-"California Polytechnic State University",
-"California State Polytechnic University",
-"California State University Channel Islands",
-"California State University-Bakersfield",
-"California State University-Chico",
-"California State University-Dominguez Hills",
-"California State University-East Bay",
-"California State University-Fresno",
-"California State University-Fullerton",
-"California State University-Los Angeles",
-"California State University-Sacramento",
-"California State University-San Bernardino",
-"California State University-San Marcos",
-"Calvert Institute for Policy Research",
-"Calvin College",
-"Calvin K. Kazanjian Economics Foundation",
-"Cambodia Development Resource Institute (CDRI)",
-"Cambodian Mekong University",
-"Cambridge Econometrics",
-"Cameron University",
-"Camosun College",
-"Campbellsville University",
-"Campinas Faculties",
-"Can Tho University",
-"Canadian Agricultural Innovation and Regulation Network (CAIRN)",
-"Canadian Agricultural Trade Policy Research Network (CATPRN)",
-"Canadian Association for Business Economics - CABE",
-"Canadian Centre for Health Economics",
-"Canadian Centre for Policy Alternatives",
-"Canadian Council on Social Development",
-"Canadian Development Economics Study Group - CDESG",
-"Canadian Econometric Study Group - CESG",
-"Canadian Economics Association - CEA",
-"Canadian Experimental & Behavioral Economics Research Group - CEBERG",
-"Canadian Institute for Advanced Research (CIFAR)",
-"Canadian Labour and Business Centre (CLBC)",
-"Canadian Network for Economic History - CNEH",
-"Canadian Policy Research Networks (CPRN)",
-"Canadian Public Economics Study Group - CPEG",
-"Canadian Regional Science Association - CRSA",
-"Canadian Resource and Environmental Economics Association (CREEA)",
-"Canadian Resource and Environmental Economics Study Group - CREE",
-"Canadian Society for Ecological Economics - CANSEE",
-"Canadian Women Economists Network - CWEN",
-"Canisius College",
-"Cankaya University",
-"Canterbury Christ Church University",
-"Cape Breton University",
-"Capella University",
-"Capilano University",
-"Capital University of Science and Technology",
-"Cardenal Herrera CEU University",
-"Cardiff University",
-"Cardus",
-"Caribbean Agro-Economic Society - CAES",
-"Caribbean Centre for Money and Finance (CCMF)",
-"Carleton College",
-"Carleton University",
-"Carlo Cattaneo Free University",
-"Carlos III University of Madrid",
-"Carlow University",
-"Carnegie Mellon University",
-"Carolo-Wilhelmina Technical University of Braunschweig",
-"Carroll College",
-"Carroll University",
-"Carson-Newman College",
-"Cascade Policy Institute",
-"Case Western Reserve University",
-"Catawba College",
-"Catholic Institute",
-"Catholic Pontifical University of Peru",
-"Catholic Portuguese University",
-"Catholic University",
-"Catholic University Our Lady of Good Counsel",
-"Catholic University of America",
-"Catholic University of Angola",
-"Catholic University of Brussels",
-"Catholic University of Bukavu",
-"Catholic University of Cordoba",
-"Catholic University of Cuyo",
-"Catholic University of El Salvador",
-"Catholic University of Goias",
-"Catholic University of Korea",
-"Catholic University of La Plata",
-"Catholic University of Lille",
-"Catholic University of Louvain-la-Neuve",
-"Catholic University of Mons",
-"Catholic University of Mozambique",
-"Catholic University of Pernambuco",
-"Catholic University of Salta",
-"Catholic University of Santa Fe",
-"Catholic University of Tachira",
-"Catholic University of the East",
-"Catholic University of the North",
-"Catholic University of the Sacred Heart",
-"Cato Institute",
-"Caucasian Institute for Economic and Social Research (CIESR)",
-"Cedar Crest College",
-"Cedarville University",
-"Celal Bayar University",
-"CentMA International Center for Management, Communication and Research",
-"Centenary College",
-"Centenary College of Louisiana",
-"Center for American Progress",
-"Center for Applied Ecnomics",
-"Center for Disease Dynamics, Economics and Policy (CDDEP)",
-"Center for Economic Analyses",
-"Center for Economic Development",
-"Center for Economic Forecasting of Mexico (CKF)",
-"Center for Economic History Research",
-"Center for Economic Options",
-"Center for Economic Research and Graduate Education and Economics Institute (CERGE-EI)",
-"Center for Economic Research and its Applications",
-"Center for Economic and Fiscal Research",
-"Center for Economic and Policy Research (CEPR)",
-"Center for Economic, Sociological and Market Studies of Construction and Territory",
-"Center for Education on Economic Knowledge",
-"Center for Europe Research",
-"Center for Excellence in Finance",
-"Center for Financial Studies",
-"Center for Firms in the Global Economy (CEFIG)",
-"Center for Free Enterprise",
-"Center for Health Research Kaiser Permanente",
-"Center for Independent Studies",
-"Center for Interuniversity Research and Analysis on Organizations",
-"Center for Interuniversity Research in Quantitative Economics",
-"Center for Iranian Economic Progress",
-"Center for Labor Studies and Research - Program for Economic Research on Technology, Work and Employment",
-"Center for Law and Social Policy",
-"Center for Liberal-Democratic Studies",
-"Center for Local and Regional Development",
-"Center for Monetary and Financial Studies",
-"Center for National Policy (CNP)",
-"Center for Political Economy and New Developmentalism",
-"Center for Public Policy Alternatives",
-"Center for Regional Economic Competitiveness (CREC)",
-"Center for Regional, Coffee and Business Studies",
-"Center for Research and Studies of the Republic of Argentina",
-"Center for Research and Teaching  of Economics",
-"Center for Research in Economics, Management and the Arts (CREMA)",
-"Center for Research in International Economics",
-"Center for Research on Education, Training and Employment",
-"Center for Research on International Economic and Political Relations",
-"Center for Research on Transformation",
-"Center for Research on the Economies of the Mediterranean (CREMed)",
-"Center for Research on the World Economy",
-"Center for Social Research and Action",
-"Center for Social and Economic Research (CASE-Kyrgystan)",
-"Center for Socio-Economic Research (C-SER)",
-"Center for Strategic Research 'North West'",
-"Center for Strategic and International Studies",
-"Center for an Urban Future",
-"Center for development Cooperation Research",
-"Center for the Advancement of the Steady State Economy (CASSE)",
-"Center for the Development of Industrial Technology",
-"Center for the Implementation of Public Policies promoting Equity and Growth",
-"Center for the Study of Argentinean Development",
-"Center for the Study of Democracy",
-"Center for the Study of Democratic Societies",
-"Center for the Study of Living Standards (CSLS)",
-"Center for the Study of the Economies of Africa (CSEA)",
-"Center of Economic Research for Development",
-"Center of the American Experiment",
-"Center on Budget and Policy Priorities",
-"Center on Economic Research and Reforms",
-"Central American Integration System",
-"Central Bank Research Association - CEBRA",
-"Central Bank of Armenia",
-"Central Bank of Azerbaijan Republic",
-"Central Bank of Bahrain",
-"Central Bank of Barbados",
-"Central Bank of Belize",
-"Central Bank of Bosnia and Herzegovina",
-"Central Bank of Brazil",
-"Central Bank of Cabo Verde",
-"Central Bank of Colombia",
-"Central Bank of Comoros",
-"Central Bank of Cuba",
-"Central Bank of Curacao and Saint Martin",
-"Central Bank of Cyprus",
-"Central Bank of Djibouti",
-"Central Bank of Egypt",
-"Central Bank of Guatemala",
-"Central Bank of Hungary",
-"Central Bank of Iceland",
-"Central Bank of Iraq",
-"Central Bank of Ireland",
-"Central Bank of Jordan",
-"Central Bank of Kenya",
-"Central Bank of Lesotho",
-"Central Bank of Liberia",
-"Central Bank of Luxembourg",
-"Central Bank of Madagascar",
-"Central Bank of Malta",
-"Central Bank of Montenegro",
-"Central Bank of Myanmar",
-"Central Bank of Nicaragua",
-"Central Bank of Norway",
-"Central Bank of Oman",
-"Central Bank of Paraguay",
-"Central Bank of Peru",
-"Central Bank of Portugal",
-"Central Bank of Samoa",
-"Central Bank of Seychelles",
-"Central Bank of Sudan",
-"Central Bank of Surinam",
-"Central Bank of Tunisia",
-"Central Bank of Turkmenistan",
-"Central Bank of Uruguay",
-"Central Bank of Venezuela",
-"Central Bank of Yemen",
-"Central Bank of the Dominican Republic",
-"Central Bank of the Islamic Republic of Iran",
-"Central Bank of the Republic of Burundi",
-"Central Bank of the Republic of China",
-"Central Bank of the Republic of Guinea",
-"Central Bank of the Republic of San Marino",
-"Central Bank of the Republic of Turkey",
-"Central Bank of the Republic of Uzbekistan",
-"Central Bank of the Russian Federation",
-"Central Bank of the Solomon Islands",
-"Central Bank of the Turkish Republic of Northern Cyprus",
-"Central Bank of the United Arab Emirates",
-"Central Bank of the West African States",
-"Central Christian College",
-"Central European University",
-"Central Institution for Economic Management (CIEM)",
-"Central Methodist College",
-"Central Michigan University",
-"Central Mindanao University",
-"Central Queensland University",
-"Central South University",
-"Central University",
-"Central University College",
-"Central University of Bayamon",
-"Central University of Ecuador",
-"Central University of Finance and Economics (CUFE)",
-"Central University of Himachal Pradesh",
-"Central University of Karnataka",
-"Central University of Tamil Nadu",
-"Central University of Venezuela",
-"Central University of the Valley",
-"Central Washington University",
-"Central-American Society for Ecological Economics",
-"Central-American University",
-"Central-American University for Business Studies",
-"Centralamerican Bank for Economic Integration",
-"Centre de Sciences Humaines (CSH)",
-"Centre for Associative Economics",
-"Centre for Budget and Governance Accountability (CBGA)",
-"Centre for Business and Policy Studies",
-"Centre for Cities",
-"Centre for Civil Society",
-"Centre for Economic Research",
-"Centre for Economic and Regional Studies",
-"Centre for Economic and Social Studies (CESS)",
-"Centre for Environmental and Resource Economics",
-"Centre for European Research in Microfinance (CERMi)",
-"Centre for Experimental Social Sciences Nuffield - FLAME University",
-"Centre for Higher Education and Research in Agronomy",
-"Centre for Household, Income, Labour and Demographic Economics (CHILD)",
-"Centre for Industrial Studies (CSIL)",
-"Centre for International Research on Economic Tendency Surveys (CIRET)",
-"Centre for Labour Studies",
-"Centre for Latin American Monetary Studies",
-"Centre for Marine Socioecology",
-"Centre for Microdata Methods and Practice (CEMMAP)",
-"Centre for Multi-disciplinary Development Research (CMDR)",
-"Centre for North South Economic Research",
-"Centre for Planning and Economic Research (KEPE)",
-"Centre for Policy Analysis (CEPA)",
-"Centre for Policy Dialogue (CPD)",
-"Centre for Policy Research (CPR)",
-"Centre for Poverty Analysis (CEPA)",
-"Centre for Poverty Reduction and Social Policy Development (CPRSPD)",
-"Centre for Research into Post-Communist Economies (CRCE)",
-"Centre for Research on Economic and Social Transformation (CREST)",
-"Centre for Research on Multinational Corporations",
-"Centre for Russian International Socio-political and Economic Studies (CERISE)",
-"Centre for Social Studies (CSS)",
-"Centre for Strategic Research and Analysis (CESRAN)",
-"Centre for Strategic and Policy Studies (CSPS)",
-"Centre for Studies in Economics and Finance",
-"Centre for Studies in International Relations and Development (CSIRD)",
-"Centre for Trade, Globalisation and Development",
-"Centre for Transdisciplinary Studies of Institutions, Evolution and Policies",
-"Centre for social, Judicial and Economic Documentation and Studies",
-"Centre of Excellence for  China Pakistan Economic Corridor (CoE-CPEC)",
-"Centre on Skills, Knowledge and Organisational Performance (SKOPE)",
-"Certified General Accountants Association of Canada - CGA",
-"Chabahar Maritime University",
-"Chadron State College",
-"Chalmers Institute of Technology",
-"Chamber of Labour",
-"Chambéry School of Business",
-"Chancellor University",
-"Chandragupt Institute of Management Patna (CIMP)",
-"Changchun University of Science and Technology",
-"Chanpagnat University",
-"Chapman University",
-"Charles Darwin University",
-"Charles Sturt University",
-"Charles University",
-"Charleston Southern University",
-"Chartered Institute of Development Finance - CIDEF",
-"Chatham College",
-"Chatham House",
-"Chaudhary Charan Singh Haryana Agricultural University (CCS)",
-"Cheikh Anta Diop University",
-"Chemnitz University of Technology",
-"Cherkasy National University named after Bohdan Khmelnytskyi",
-"Chernihiv National University of Technology",
-"Chestnut Hill College",
-"Cheung Kong Graduate School of Business",
-"Chiba Keizai College",
-"Chiba University",
-"Chicago Center of Excellence in Health Promotion Economics (CCEHPE)",
-"Chicago State University",
-"China Agricultural University",
-"China Europe International Business School",
-"China Population and Development Research Centre",
-"China Society for the History of Economic Thought - CSHET",
-"China Society of World Economics - CSWE",
-"China University of Geosciences",
-"China University of Petroleum",
-"China University of Technology",
-"Chinese Academy of Agricultural Sciences",
-"Chinese Academy of Sciences",
-"Chinese Academy of Social Sciences",
-"Chinese Culture University",
-"Chinese Economic Association (UK) - CEAUK",
-"Chinese Economic Association in North America - CEANA",
-"Chinese Society for the Promotion of Economic Theory - CSPET",
-"Chinese University of Hong Kong",
-"Chinese University of Hong Kong (Shenzhen)",
-"Chinese Women Economists - CWE",
-"Chonbuk National University",
-"Chongju University",
-"Chongqing Technology and Business University",
-"Chongqing University of Technology",
-"Chonnam National University",
-"Chosun University",
-"Chowan College",
-"Chr. Michelsen Institute",
-"Christ University",
-"Christendom College",
-"Christian University fo the Assemblies of God",
-"Christopher Newport University",
-"Chronic Poverty Research Centre",
-"Chulalongkorn University",
-"Chung Yuan Christian University",
-"Chungnam National University",
-"Chuo University",
-"City University",
-"City University of New York (CUNY)",
-"City of New York",
-"Claflin University",
-"Claremont Graduate University",
-"Claremont McKenna College",
-"Clark University",
-"Clarkson University",
-"Clausthal University of Technology",
-"Clayton College and State University",
-"Clemson University",
-"Clermont Business School",
-"Clermont Center for Research in Management",
-"Clermont Recherche Management (CleRMa)",
-"Cleveland State University",
-"Coastal Carolina University",
-"Cobden Centre",
-"Cochin University of Science and Technology",
-"Cochise Community College",
-"Coe College",
-"Coimbra Institute of Accounting and Administration",
-"Coker College",
-"Colby-Sawyer College",
-"Colima University",
-"Collective for Social Science Research",
-"College of Business Education",
-"College of Business Studies",
-"College of Charleston",
-"College of Coastal Georgia",
-"College of Economists of A Coruna",
-"College of Economists of Andorra",
-"College of Economists of Aragon",
-"College of Economists of Asturias",
-"College of Economists of Cantabria",
-"College of Economists of La Rioja",
-"College of Economists of Madrid",
-"College of Economists of the Basque Country",
-"College of Europe",
-"College of Finance and Banking",
-"College of Judea and Sameria",
-"College of Mexico",
-"College of Modern Business Studies",
-"College of Mount Saint Vincent",
-"College of Mount St. Joseph",
-"College of Nyiregyhaza",
-"College of Saint Elizabeth",
-"College of Saint Rose",
-"College of St. Benedict and St. John's University",
-"College of William and Mary",
-"College of the Bahamas",
-"College of the Northern Frontier",
-"Collège de France",
-"Cologne Institute for Management Research",
-"Colombian Association of Economic History",
-"Colombian Society of Economists",
-"Colorado Mesa University",
-"Colorado School of Mines",
-"Colorado State University",
-"Colorado State University-Pueblo",
-"Columbia College",
-"Columbia College of Missouri",
-"Columbia University",
-"Comenius University",
-"Committee for Economic Development",
-"Committee for Economic Development of Australia (CEDA)",
-"Committee for Social, Economic and Environmental Policy Alternatives",
-"Committee on Women in Agricultural Economics - CWAE",
-"Common Market for Eastern and Southern Africa (COMESA)",
-"Commonwealth Foundation for Public Policy Alternatives",
-"Commonwealth Institute",
-"Commonwealth Scientific and Industrial Research Organisation (CSIRO)",
-"Commonwealth of Independent States",
-"Competitive Enterprise Institute",
-"Complutense University of Madrid",
-"Computing Centre for Economics and Social Sciences",
-"Comsats Institute of Information Technology",
-"Concord University",
-"Concordia University",
-"Concordia University Chicago",
-"Conference on Research in Income and Wealth (CRIW)",
-"Congress Of Political Economists - COPE",
-"Connecticut College",
-"Consensus Economics",
-"Conservation Economics Institute",
-"Consorci Markets, Organizations and Votes in Economics (MOVE)",
-"Constantin Brancoveanu University of Pitesti",
-"Constantin Brancusi University",
-"Construction and Economy Research Institute of Korea (CERIK)",
-"Consultative Group on International Agricultural Research (CGIAR)",
-"Consumer Unity & Trust Society (CUTS International)",
-"Contemporary European Studies Association of Australia - CESAA",
-"Contemporary Knowledge Institute",
-"Converse College",
-"Copenhagen Business School",
-"Copperbelt University",
-"Coppin State University",
-"Corban College",
-"Cornell College",
-"Cornell University",
-"Cornerstone Research",
-"Cornerstone University",
-"Corvinus University of Budapest",
-"Costa Rica Institute of Technology",
-"Council for Budget Responsibility",
-"Council for Community and Economic Research (C2ER)",
-"Council for Investment Promotion",
-"Council of Spanish Economists",
-"Council on Food, Agricultural, and Resource Economics (C-FARE)",
-"Cournot Centre for Economic Research",
-"Covenant University",
-"Coventry University",
-"Cracow University of Economics",
-"Cranfield University",
-"Crawford University",
-"Croatian Agricultural Economics Association",
-"Croatian Society of Economists",
-"Cukurova University",
-"Curacao Institute for Social and Economic Studies (CURISES)",
-"Curtin University",
-"Cyprus Economic Society - CES",
-"Cyprus International Institute of Management (CIIM)",
-"Cyprus International University",
-"Cyprus University of Technology",
-"Czech Academy of Agricultural Sciences",
-"Czech Econometric Society",
-"Czech Economic Society",
-"Czech Technical University in Prague",
-"D'Youville College",
-"D. A. Tsenov Academy of Economics",
-"DESCO Centre for the Study and Promotion of Development",
-"DIAL",
-"DOBA Faculty of Applied Business and Social Studies Maribor",
-"Da Yeh University",
-"Dadahboy Institute of Higher Education",
-"Daegu University",
-"Daffodil International University",
-"Daigin Economic and Management Institute",
-"Daishin Economic Research Institute",
-"Daito Bunka University",
-"Dakota State University",
-"Dalarna College",
-"Dalat University",
-"Dalhousie University",
-"Dalian Maritime University",
-"Damascus University",
-"Danish Association of Lawyers and Economists",
-"Danish Economic Society",
-"Danish Institute for International Studies",
-"Danish Institute of Governmental Research",
-"Danish Society for Economic and Social History",
-"Dankook University",
-"Dansk Energiøkonomisk Selskab - DES",
-"Danube University of Krems",
-"Danubius University",
-"Darma Persada University",
-"Darmstadt University of Technology",
-"Dartmouth College",
-"Datamétrica Consultoria Econômica",
-"Davenport University",
-"David Suzuki Foundation",
-"Davidson College",
-"Dayalbagh Educational Institute",
-"De La Salle University",
-"DePaul University",
-"DeSales University",
-"DeVry University",
-"Deakin University",
-"Debre Berhan University",
-"Deggendorf Institute of Technology",
-"Delaware State University",
-"Delaware Valley College",
-"Delta College",
-"Delta State University",
-"Democritus University of Thrace",
-"Demos",
-"Denison University",
-"Design of Situational Action",
-"Development Bank of Nigeria",
-"Development Bank of Southern Africa",
-"Development Institute",
-"Development Management Institute",
-"Development Planning Institute (DPI)",
-"Development Research Institute",
-"Development University",
-"Development and Policies Research Center (Depocen)",
-"Dhananjayrao Gadgil College of Commerce",
-"Dhofar University",
-"Dhurakij Pundit University",
-"Dickinson College",
-"Dickinson State University",
-"Diego Portales University",
-"Dillard University",
-"Dimitrie Cantemir Christian University",
-"Diponegoro University",
-"Discovery Institute",
-"Dmytro Motornyi Tavria State Agrotechnological University",
-"Dnipropetrovsk State Financial Academy",
-"Doane College",
-"Dogus University",
-"Dokkyo University",
-"Dokuz Eylul University",
-"Dom Cabral Foundation",
-"Dominican University",
-"Dominican University of California",
-"Don State Technical University",
-"Donetsk National Technical University",
-"Donetsk National University",
-"Donga University",
-"Dongbei University of Finance and Economics",
-"Dongduk Women's University",
-"Dongeui University",
-"Dongguk University",
-"Donor Association for German Science",
-"Dordt College",
-"Dortmund University of Technology",
-"Doshisha University",
-"Dr. Jose Matias Delgado University",
-"Dr. Rajendra Prasad Central Agricultural University",
-"Dr. Soetomo University",
-"Drake University",
-"Dresden University of Applied Sciences",
-"Dresden University of Technology",
-"Drew University",
-"Drexel University",
-"Drohobych State Pedagogical University named after Ivan Franko",
-"Dubai School of Government",
-"Dublin City University",
-"Dublin Institute of Technology",
-"Duisenberg School of Finance",
-"Duke University",
-"Dumlupinar University",
-"Dunarea de Jos University",
-"Durban University of Technlogy",
-"Durham University",
-"E-Business Research Network - eBRN",
-"EAFIT University",
-"EBS Business and Law University",
-"EDC Paris Business School",
-"EDHEC Business School",
-"EDucational INnovation in Economics and Business Network - EDINEB",
-"ENDA Tiers-Monde",
-"ENI Enrico Mattei Foundation",
-"ESC Rennes School of Business",
-"ESCEM School of Business and Management",
-"ESCP Europe",
-"ESRC Econometric Study Group",
-"ESSCA Graduate School of Management",
-"ESSEC Business School",
-"ETEA Business School",
-"EU LAC Foundation",
-"Earlham College",
-"Earth Economics",
-"EarthSharing",
-"East Asian Bureau of Economic Research (EABER)",
-"East Asian Economic Association - EAEA",
-"East Carolina University",
-"East Central University",
-"East China Normal University",
-"East China University of Science and Technology",
-"East Stroudsburg University",
-"East Tennessee State University",
-"East Texas Baptist University",
-"East West University",
-"East-Ukrainian Volodymyr Dahl National University",
-"East-West Center",
-"Eastern Asia University",
-"Eastern Caribbean Central Bank",
-"Eastern Connecticut State University",
-"Eastern Economic Association - EEA",
-"Eastern Finance Association - EFA",
-"Eastern Illinois University",
-"Eastern Institute for Integrated Learning in Management (EIILM)",
-"Eastern Kentucky University",
-"Eastern Mediterranean University",
-"Eastern Mennonite University",
-"Eastern Michigan University",
-"Eastern Nazarene College",
-"Eastern Oregon University",
-"Eastern University",
-"Eastern Washington University",
-"Eckerd College",
-"EcoAustria Institute for Economic Research",
-"Ecological University in Bucharest",
-"Econ Analys",
-"Econometric Research Association - ERA",
-"Econometric Society",
-"Economic Center of Simulation and Modeling",
-"Economic Community of West African States (ECOWAS)",
-"Economic Cycle Research Institute (ECRI)",
-"Economic Developers Association of Canada - EDAC",
-"Economic Development Initiatives (E.D.I.)",
-"Economic Development Institute",
-"Economic Development Research Center",
-"Economic History Society - EHS",
-"Economic History Society of Australia and New Zealand - EHSANZ",
-"Economic History Society of Southern Africa - EHSSA",
-"Economic Institute of Cambodia",
-"Economic Policy Institute",
-"Economic Policy Research Centre (EPRC)",
-"Economic Policy Research Foundation of Turkey",
-"Economic Research Center of Niigata (RCN)",
-"Economic Research Forum (ERF)",
-"Economic Research Institute",
-"Economic Research Institute (ERI)",
-"Economic Research Institute for ASEAN and East Asia (ERIA)",
-"Economic Research Institute for Fishery and Aquaculture",
-"Economic Research Institute for Northeast Asia (ERINA)",
-"Economic Science Association - ESA",
-"Economic Society of Chile",
-"Economic Statistics Centre of Excellence (ESCoE)",
-"Economic Strategy Institute",
-"Economic and Business Historical Society - EBHS",
-"Economic and Development Analysis",
-"Economic and Monetary Union in Central Africa",
-"Economic and Social History Society of Ireland - ESHSI",
-"Economic and Social Research Center (ESCE)",
-"Economic and Social Research Consortium",
-"Economic and Social Research Group",
-"Economic and Social Research Institute",
-"Economic and Social Research Institute (ESRI)",
-"Economic and Social Research Institute of Piedmont",
-"Economic and Statistical Observatory of Subsaharian Africa",
-"Economics Institute",
-"Economics Pennsylvania",
-"Economics and Business Education Association - EBEA",
-"Economics and Management Research Center",
-"Economics and Management State Academy of Far East",
-"Economics and Social Research Foundation (ESRF)",
-"Economics for Equity and the Environment Network (E3)",
-"Economics of Inequality and Poverty Analysis",
-"Economics of National Security Association - ENSA",
-"Economics, Armament, Defense and Security",
-"Economist Research Network",
-"Economists for Peace and Security - EPS",
-"Ecorys",
-"Ecuadorian Institute for Political Economy",
-"Edgewood College",
-"Edinburgh Napier University",
-"Eduardo Mondlane University",
-"Ege University",
-"Egerton University",
-"Ekiti State University",
-"Elizabeth City State University",
-"Elizabethtown College",
-"Elizade University",
-"Elms College",
-"Elon University",
-"Embry-Riddle Aeronautical University",
-"Emek Yezreel Academic College",
-"Emerging Markets Forum",
-"Emirates Canadian University College",
-"Emirates Center For Strategic Studies and Research",
-"Emirates Institute for Banking and Financial Studies",
-"Emmanuel College",
-"Emory University",
-"Emory and Henry College",
-"Empire State College",
-"Employee Benefit Research Institute",
-"Employment Observatory Research-Informatics (PAEP)",
-"Emporia State University",
-"Endicott College",
-"Engineering School Telecom ParisTech",
-"Enrico Mattei School",
-"Enrique Guzma y Valle National University of Education",
-"Enterprise Research Institute (ERI)",
-"Entrepreneurship Development Institute of India (EDII)",
-"Entrepreneuship Training Center (ETC)",
-"Environmental Defense Fund (EDF)",
-"Eotvos Lorand University",
-"Epoka University",
-"Erasmus University of Rotterdam",
-"Erciyes University",
-"Erskine College",
-"Esa Unggul University",
-"Espana University",
-"Esterhazy Karoly College",
-"Estey Centre for Law and Economics in International Trade",
-"Estonian Economic Association",
-"Estonian Institute for Futures Studies",
-"Estonian Institute of Economic Research",
-"Estonian University of Life Sciences",
-"Ethan Allen Institute",
-"Ethiopian Civil Service University",
-"Ethiopian Economic Association - EEA",
-"Ethiopian Economic Policy Research Institute (EEPRI)",
-"Eurasian Development Bank",
-"Europe College",
-"European Academy of Management and Business Economics",
-"European Association for Banking and Financial History E. V. - EABH",
-"European Association for Evolutionary Political Economy - EAEPE",
-"European Association for Research in Industrial Economics - EARIE",
-"European Association for Research on Service - RESER",
-"European Association of Agricultural Economists - EAAE",
-"European Association of Development Agencies - EURADA",
-"European Association of Development Research and Training Institutes - EADI",
-"European Association of Economists - EAE",
-"European Association of Environmental and Resource Economists - EAERE",
-"European Association of Fisheries Economists - EAFE",
-"European Association of Health Economics - EUHEA",
-"European Association of Law and Economics - EALE",
-"European Bank for Reconstruction and Development (EBRD)",
-"European Business School (EBS)",
-"European Capital Markets Institute (ECMI)",
-"European Centre for Development Policy Management (ECDPM)",
-"European Centre for International Political Economy (ECIPE)",
-"European Centre for Social Welfare Policy and Research",
-"European Commission",
-"European Committee of Construction Economists",
-"European Community",
-"European Community Studies Association Austria - ECSA Austria",
-"European Community Studies Association New Zealand - ECSA NZ",
-"European Conference on the History of Economics - ECHE",
-"European Consortium on Landscape Economics - CEEP",
-"European Corporate Governance Institute (ECGI)",
-"European Council of Construction Economists - CEEC",
-"European Development Research Network - EUDN",
-"European Forecasting Research Association for the Macro-Economy - EUROFRAME",
-"European Humanities University",
-"European Institute for Development and Education (EIDE)",
-"European Institute for International Economic Relations",
-"European Institute of Geo-Economics",
-"European Institute of Higher Education Brussels",
-"European Institute of Public Administration (EIPA)",
-"European Investment Fund (EIF)",
-"European Management School (EMS)",
-"European Microfinance Network",
-"European Network of Agricultural and Rural Policy Research Institutes - ENARPRI",
-"European Network of Economic Policy Research Institutes - ENEPRI",
-"European Network on Industrial Policy - EUNIP",
-"European Network on the Economics of Religion - ENER",
-"European Policy for Intellectual Property - EPIP",
-"European Public Choice Society - EPCS",
-"European Real Estate Society - ERES",
-"European Research Institute on Cooperative and Social Enterprises (Euricse)",
-"European School of Economics",
-"European School of Management and Technology (ESMT)",
-"European Union",
-"European University",
-"European University Institute",
-"European University of Lefke",
-"European University of Madrid",
-"European University of Rome",
-"European University of Tirana",
-"European Xtramile Centre of African Studies (EXCAS)",
-"European-Asian Economics, Finance, Econometrics and Accounting Science Association - EAEFEASA",
-"Europlace Institute of Finance",
-"Evangel University",
-"Evangelical University in Africa",
-"Evangelical University of Paraguay",
-"Evatt Foundation",
-"Ewing Marion Kauffman Foundation",
-"Expert Institute",
-"Externado University",
-"Ezoneplus",
-"F. A. Hayek Foundation",
-"FAE Business School",
-"FIT Institute",
-"FLAME University",
-"FONDAD - Forum on Debt and Development",
-"FORE School of Management",
-"FORMIT Foundation",
-"FPT University",
-"Facultade de Economia e Comércio Álvares Penteado (FECAP)",
-"Faculty of Economic Informatics",
-"Fairfield University",
-"Fairleigh Dickinson University",
-"Fairmont State College",
-"Far East State Technical University",
-"Far Eastern Federal University",
-"Farmingdale State College (SUNY)",
-"Farook College",
-"Fatih University",
-"Faulkner University",
-"Fayetteville State University",
-"Federal Association of German Economists and Business People",
-"Federal Economics Council",
-"Federal Institute of Technology Zurich",
-"Federal Polytechnic Ilaro",
-"Federal Reserve Bank of Atlanta",
-"Federal Reserve Bank of Boston",
-"Federal Reserve Bank of Chicago",
-"Federal Reserve Bank of Cleveland",
-"Federal Reserve Bank of Dallas",
-"Federal Reserve Bank of El Salvador",
-"Federal Reserve Bank of Kansas City",
-"Federal Reserve Bank of Minneapolis",
-"Federal Reserve Bank of New York",
-"Federal Reserve Bank of Philadelphia",
-"Federal Reserve Bank of Richmond",
-"Federal Reserve Bank of San Francisco",
-"Federal Reserve Bank of St. Louis",
-"Federal Reserve Board (Board of Governors of the Federal Reserve System)",
-"Federal Rural University of Pernambuco",
-"Federal Rural University of Rio de Janeiro",
-"Federal University fo Rio Grande",
-"Federal University of ABC",
-"Federal University of Alagoas",
-"Federal University of Applied Administrative Sciences",
-"Federal University of Bahia",
-"Federal University of Ceara",
-"Federal University of Espirito Santo",
-"Federal University of Fluminense",
-"Federal University of Goias",
-"Federal University of Juiz de Fora",
-"Federal University of Lafia",
-"Federal University of Lavras",
-"Federal University of Maranhao",
-"Federal University of Mato Grosso",
-"Federal University of Minas Gerais",
-"Federal University of Paraiba",
-"Federal University of Parana",
-"Federal University of Pelotas",
-"Federal University of Pernambuco",
-"Federal University of Piaui",
-"Federal University of Rio Grande do Norte",
-"Federal University of Rio Grande do Sul",
-"Federal University of Rio de Janeiro",
-"Federal University of Roraima",
-"Federal University of Sanata Catarina",
-"Federal University of Santa Maria",
-"Federal University of Sao Carlos",
-"Federal University of Sergipe",
-"Federal University of Technology",
-"Federal University of Vicosa",
-"Federal Urdu University of Arts, Sciences and Technology",
-"Federation University Australia",
-"Federation of International Trade Associations - FITA",
-"Federation of Pakistan Chambers of Commerce and Industry",
-"Federico II University of Naples",
-"Federico Santa Maria Technical University",
-"Felix Houphouet-Boigny University",
-"Feng Chia University",
-"Ferdowsi University of Mashhad",
-"Ferhat Abbas University of Setif",
-"Fermin Toro University",
-"Ferris State University",
-"Fiji National University",
-"Financial Education Association - FEA",
-"Financial Intermediation Research Society - FIRS",
-"Financial Planning Association - FPA",
-"Financial Regulation Excellence Laboratory",
-"Financial University under the Government of the Russian Federation",
-"Finnish Economic Association",
-"Finnish Economic History Association",
-"Finnish Pension Alliance",
-"Fisk University",
-"Fitchburg State University",
-"Flagler College",
-"Flinders University of South Australia",
-"Florida Agricultural and Mechanical University",
-"Florida Atlantic University",
-"Florida Council on Economic Education",
-"Florida Institute of Technology",
-"Florida International University",
-"Florida Memorial College",
-"Florida State University",
-"Fondation for Studies and Research on International Development",
-"Fontbonne University",
-"Food Distribution Research Society - FDRS",
-"Fordham University",
-"Foreign Trade University",
-"Forman Christian College",
-"Fort Hays State University",
-"Fort Lewis College",
-"Fort Valley State University",
-"Forum for Research in Empirical International Trade - FREIT",
-"Foshan University",
-"Foundation Institute Capixaba of Research in Accounting, Economics and Finance",
-"Foundation for Agrarian Studies",
-"Foundation for Economic Education",
-"Foundation for Economic Research on Latin America",
-"Foundation for Economic and Industrial Research (IOBE)",
-"Foundation for European Economic Development - FEED",
-"Foundation for European Progressive Studies (FEPS)",
-"Foundation for Research in Economics and Business Administration",
-"Foundation for Teaching Economics (FTE)",
-"Foundation for World Agriculture and Rurality",
-"Foundation for a Market Economy",
-"Foundation for the Euro-Mediterranean Centre on Climate Change",
-"Foundation for the Future of Switzerland",
-"Foundation of the Savings Banks",
-"Fountain University Osogbo",
-"Francis Marion University",
-"Francis Xavier Engineering College",
-"Francisco Gavidia University",
-"Francisco Marroquin University",
-"Francisco de Vitora University",
-"Francois Rabelais University of Tours",
-"Frankfurt School of Finance and Management",
-"Franklin College",
-"Franklin Pierce College",
-"Franklin University",
-"Franklin and Marshall College",
-"Fraser Institute",
-"Fraunhofer Society",
-"Frederic Bastiat Institute",
-"Frederick Institute of Technology",
-"Frederikshavn Business College",
-"Free Enterprise Institute",
-"Free International University of Moldova",
-"Free University",
-"Free University of Brussels",
-"Freed-Hardeman University",
-"French Association of Business Economists",
-"French Association of Environmental and Resource Economists - FAERE",
-"French Center for Population and Development",
-"French Center in International Economics",
-"French Civil Aviation University",
-"French Economics Association",
-"French Experimental Economics Association",
-"French Finance Association",
-"French Financial Management Association",
-"French Language Regional Science Association",
-"French National Institute for Agr",
-"French National Institute for Environment and Agriculture Science and Technology Research",
-"French National Institute for Transport and Safety Research",
-"French Political Economy Association",
-"French Society for Rural Economics",
-"French University in Armenia",
-"Fresno Pacific University",
-"Friends University",
-"Frostburg State University",
-"Fu Jen Catholic University",
-"Fudan University",
-"Fuji University",
-"Fujian Agriculture and Forestry University",
-"Fujian Normal University",
-"Fukui Prefectural University",
-"Fukuoka University",
-"Fukuyama University",
-"Fulbright Economics Teaching Program",
-"Fullerton College",
-"Fund for the Research on Economic Ethics",
-"Furman University",
-"Furtwangen University",
-"Fuzhou University",
-"GERENS Graduate School of Business",
-"GESIS - Leibniz-Institute for the Social Sciences",
-"GKI Economic Research",
-"Gabes Higher Institute of Management",
-"Gabriel Rene Moreno Autonomous University",
-"Gadjah Mada University",
-"Gafsa Higher Institute of Business Management",
-"Galatasaray University",
-"Gallatin Institute",
-"Gallaudet University",
-"Galway Mayo Institute of Technology",
-"Game Theory Society - GTS",
-"Gannon University",
-"Garden City University College",
-"Gauhati Commerce College",
-"Gautam Buddha University",
-"Gaziosmanpasa University",
-"Gdansk Institute for Market Economics",
-"Gdańsk University of Technology",
-"Gebze Technical University",
-"Gediz University",
-"Geeta Institute of Management and Technology",
-"Gender and Macro International Working Group - GEM-IWG",
-"General Association of Economists of Romania",
-"General San Martin National University",
-"General Sarmiento National University",
-"Geneva Association (International Association for the Study of Insurance Economics)",
-"Geneva Business School",
-"Geneva College",
-"Geneva School of Business Administration",
-"Genoa Chamber of Commerce",
-"George Asachi Technical University of Iasi",
-"George C. Marshall Institute",
-"George Mason University",
-"George Morris Centre",
-"George Washington University",
-"Georgetown University",
-"Georgia College and State University",
-"Georgia Gwinnett College",
-"Georgia Institute of Technology",
-"Georgia Southern University",
-"Georgia Southwestern University",
-"Georgia State University",
-"Georgian Court College",
-"Georgian Institute of Public Affairs (GIPA)",
-"Gerardo Barrios University",
-"German Academic Association for Business Research",
-"German Association for Insurance Studies",
-"German Economic Institute",
-"German Federal Bank",
-"German Finance Association",
-"German Institute for Development Evaluation",
-"German Institute for Economic Research (DIW)",
-"German Institute for Japanese Studies",
-"German Institute for Retirement Provision",
-"German Institute of Global and Area Studies (GIGA)",
-"German National Library of Economics - Leibniz Information Centre for Economics",
-"German Society for East European Studies",
-"German Sport University",
-"German University",
-"Gettysburg College",
-"Getulio Vargas Foundation",
-"Ghana Institute of Management and Public Administration (GIMPA)",
-"Gifu Keizai University",
-"Giordano Dell'Amore Foundation",
-"Gitam University",
-"Glasgow Caledonian University",
-"Glendale College",
-"Glendale Community College",
-"Global Association of Economics Education - GAEE",
-"Global Association of Risk Professionals - GARP",
-"Global Business School",
-"Global Commerce Forum - GCF",
-"Global Development Network",
-"Global Development Network (GDN)",
-"Global Development Research Center (GDRC)",
-"Global Entrepreneurship Research Association - GERA",
-"Global Finance Association - GFA",
-"Global Financial Integrity",
-"Global Footprint Network",
-"Global Insight",
-"Global Knowledge Economics Council - GKEC",
-"Global Network for Economics of Learning, Innovation, and Competence Building Systems - Globelics",
-"Globalisation Institute",
-"Globsyn Business School",
-"Goa Institute of Management",
-"Goa University",
-"Goce Delchev University",
-"Goethe University Frankfurt",
-"Gold Mercury International",
-"Goldsmiths",
-"Goldwater Institute",
-"Gomal University",
-"Gomel State University",
-"Gonzaga University",
-"Gordon College",
-"Goshen College",
-"Goucher College",
-"Goverment of Tokelau",
-"Goverment of Wallis and Futuna",
-"Goverment of the Falkland Islands",
-"Government College University",
-"Government of Afghanistan",
-"Government of Alabama",
-"Government of Alagoas",
-"Government of Alaska",
-"Government of Albania",
-"Government of Alberta",
-"Government of Algeria",
-"Government of American Samoa",
-"Government of Andalusia",
-"Government of Angola",
-"Government of Anguilla",
-"Government of Antigua",
-"Government of Aragon",
-"Government of Argentina",
-"Government of Arizona",
-"Government of Arkansas",
-"Government of Armenia",
-"Government of Aruba",
-"Government of Australia",
-"Government of Austria",
-"Government of Azerbaidjan",
-"Government of Baden-Württemberg",
-"Government of Bahamas",
-"Government of Bahia",
-"Government of Bahrain",
-"Government of Bangladesh",
-"Government of Barbados",
-"Government of Bavaria",
-"Government of Belarus",
-"Government of Belgium",
-"Government of Benin",
-"Government of Berlin",
-"Government of Bermuda",
-"Government of Bhutan",
-"Government of Bolivia",
-"Government of Bosnia and Herzegovina",
-"Government of Botswana",
-"Government of Brandenburg",
-"Government of Brazil",
-"Government of Bremen",
-"Government of British Columbia",
-"Government of Brunei Darussalam",
-"Government of Bulgaria",
-"Government of Burkina Faso",
-"Government of Cabo Verde",
-"Government of California",
-"Government of Cambodia",
-"Government of Cameroun",
-"Government of Canada",
-"Government of Cantabria",
-"Government of Castile and Leon",
-"Government of Catalonia",
-"Government of Ceará",
-"Government of Chile",
-"Government of China",
-"Government of Colombia",
-"Government of Colorado",
-"Government of Congo",
-"Government of Connecticut",
-"Government of Cook Islands",
-"Government of Costa Rica",
-"Government of Croatia",
-"Government of Cuba",
-"Government of Curaçao",
-"Government of Cyprus",
-"Government of Delaware",
-"Government of Denmark",
-"Government of Djbouti",
-"Government of Dominica",
-"Government of Dubai",
-"Government of Ecuador",
-"Government of Egypt",
-"Government of El Salvador",
-"Government of Espírito Santo",
-"Government of Estonia",
-"Government of Ethopia",
-"Government of Faroes",
-"Government of Fiji",
-"Government of Finland",
-"Government of Flanders",
-"Government of Florida",
-"Government of France",
-"Government of French Polynesia",
-"Government of Gabon",
-"Government of Georgia",
-"Government of Germany",
-"Government of Ghana",
-"Government of Gibraltar",
-"Government of Goiás",
-"Government of Greece",
-"Government of Greenland",
-"Government of Grenada",
-"Government of Guam",
-"Government of Guatemala",
-"Government of Guernsey",
-"Government of Guinea",
-"Government of Guyana",
-"Government of Hamburg",
-"Government of Hawaii",
-"Government of Hesse",
-"Government of Honduras",
-"Government of Hong Kong",
-"Government of Hungary",
-"Government of Iceland",
-"Government of Idaho",
-"Government of Illinois",
-"Government of India",
-"Government of Indiana",
-"Government of Indonesia",
-"Government of Iowa",
-"Government of Iran",
-"Government of Iraq",
-"Government of Ireland",
-"Government of Israel",
-"Government of Italy",
-"Government of Jamaica",
-"Government of Japan",
-"Government of Jersey",
-"Government of Jordan",
-"Government of Kansas",
-"Government of Kazakhstan",
-"Government of Kentucky",
-"Government of Kenya",
-"Government of Kiribati",
-"Government of Kuwait",
-"Government of Kyrgystan",
-"Government of Laos",
-"Government of Latvia",
-"Government of Lebanon",
-"Government of Lesotho",
-"Government of Liberia",
-"Government of Liechtenstein",
-"Government of Lithuania",
-"Government of Louisiana",
-"Government of Lower Saxony",
-"Government of Luxembourg",
-"Government of Macao",
-"Government of Madagascar",
-"Government of Maine",
-"Government of Malawi",
-"Government of Malaysia",
-"Government of Mali",
-"Government of Malta",
-"Government of Manitoba",
-"Government of Maryland",
-"Government of Massachusetts",
-"Government of Mato Grosso do Sul",
-"Government of Mauritania",
-"Government of Mauritius",
-"Government of Mecklenburg-Vorpommern",
-"Government of Mexico",
-"Government of Michigan",
-"Government of Minas Gerais",
-"Government of Minnesota",
-"Government of Mississippi",
-"Government of Missouri",
-"Government of Moldova",
-"Government of Mongolia",
-"Government of Montana",
-"Government of Montenegro",
-"Government of Montserrat",
-"Government of Morocco",
-"Government of Mozambique",
-"Government of Murcia",
-"Government of Myanmar",
-"Government of Namibia",
-"Government of Nauru",
-"Government of Nebraska",
-"Government of Nepal",
-"Government of Nevada",
-"Government of New Brunswick",
-"Government of New Caledonia",
-"Government of New Hampshire",
-"Government of New Jersey",
-"Government of New Mexico",
-"Government of New South Wales",
-"Government of New York",
-"Government of New Zealand",
-"Government of Newfoundland and Labrador",
-"Government of Nicaragua",
-"Government of Niger",
-"Government of Nigeria",
-"Government of Niue",
-"Government of North Carolina",
-"Government of North Dakota",
-"Government of North Macedonia",
-"Government of North Rhine Westphalia",
-"Government of Northern Ireland",
-"Government of Northern Territory",
-"Government of Norway",
-"Government of Nova Scotia",
-"Government of Nunavut",
-"Government of Ohio",
-"Government of Oklahoma",
-"Government of Oman",
-"Government of Ontario",
-"Government of Oregon",
-"Government of Pakistan",
-"Government of Papua New Guinea",
-"Government of Paraguay",
-"Government of Paraná",
-"Government of Paraíba",
-"Government of Pennsylvania",
-"Government of Pernambuco",
-"Government of Peru",
-"Government of Piauí",
-"Government of Poland",
-"Government of Portugal",
-"Government of Prince Edward Island",
-"Government of Puerto Rico",
-"Government of Qatar",
-"Government of Queensland",
-"Government of Québec",
-"Government of Rhineland-Palatinate",
-"Government of Rhode Island",
-"Government of Rio Grande do Norte",
-"Government of Rio Grande do Sul",
-"Government of Romania",
-"Government of Rwanda",
-"Government of Saint Lucia",
-"Government of Samoa",
-"Government of San Marino",
-"Government of Sarre",
-"Government of Saskatchewan",
-"Government of Saudi Arabia",
-"Government of Saxony-Anhalt",
-"Government of Schleswig-Holstein",
-"Government of Senegal",
-"Government of Serbia",
-"Government of Sergipe",
-"Government of Sierra Leone",
-"Government of Singapore",
-"Government of Slovakia",
-"Government of Slovenia",
-"Government of Solomon Islands",
-"Government of South Africa",
-"Government of South Australia",
-"Government of South Carolina",
-"Government of South Dakota",
-"Government of South Korea",
-"Government of South Sudan",
-"Government of Spain",
-"Government of Sri Lanka",
-"Government of St. Kitts and Nevis",
-"Government of Sudan",
-"Government of Suriname",
-"Government of Swaziland",
-"Government of Sweden",
-"Government of Switzerland",
-"Government of Syria",
-"Government of São Paulo",
-"Government of São Tomé e Príncipe",
-"Government of Taiwan",
-"Government of Tajikistan",
-"Government of Tanzania",
-"Government of Tasmania",
-"Government of Tchad",
-"Government of Tennessee",
-"Government of Texas",
-"Government of Thailand",
-"Government of The Gambia",
-"Government of Thuringia",
-"Government of Timor-Leste",
-"Government of Tocantins",
-"Government of Togo",
-"Government of Tonga",
-"Government of Trinidad and Tobago",
-"Government of Tunisia",
-"Government of Turkey",
-"Government of Turks and Caicos",
-"Government of Uganda",
-"Government of Ukraine",
-"Government of Uruguay",
-"Government of Utah",
-"Government of Uzbekistan",
-"Government of Valenciá",
-"Government of Vanuatu",
-"Government of Venezuela",
-"Government of Vermont",
-"Government of Victoria",
-"Government of Vietnam",
-"Government of Virginia",
-"Government of Washington",
-"Government of West Virginia",
-"Government of Western Australia",
-"Government of Western Cape",
-"Government of Wisconsin",
-"Government of Wyoming",
-"Government of Yemen",
-"Government of Yukon",
-"Government of Zambia",
-"Government of Zimbabwe",
-"Government of Zurich",
-"Government of the British Virgin Islands",
-"Government of the Canary Islands",
-"Government of the Cayman Islands",
-"Government of the Centralafrican Republic",
-"Government of the Czech Republic",
-"Government of the District of Columbia",
-"Government of the Dominican Republic",
-"Government of the Federal District",
-"Government of the Federated States of Micronesia",
-"Government of the Isle of Man",
-"Government of the Marshall Islands",
-"Government of the Netherlands",
-"Government of the Northern Mariana Islands",
-"Government of the Northwest Territories",
-"Government of the Philippines",
-"Government of the Russian Federation",
-"Government of the United Arab Emirates",
-"Government of the United Kingdom",
-"Government of the United States",
-"Government of the United States Virgin Islands",
-"Government of the Walloon Region",
-"Government of Åland",
-"Governmená of Panama",
-"Governors State University",
-"Govind Ballabh Pant University of Agriculture and Technology",
-"Grace College",
-"Graceland College",
-"Graduate School for Business Administration",
-"Graduate School of Economics, Finance and Management (GSEFM)",
-"Grambling State University",
-"Gran Sasso Science Institute (GSSI)",
-"Grand Canyon University",
-"Grant MacEwan University",
-"Grattan Institute",
-"Great Lakes Institute of Management",
-"Great Zimbabwe University",
-"Greek Association of Law and Economics - GALE",
-"Greek General Confederation of Labour",
-"Greek Scientific Association of Political Economy - GAPE",
-"Green University of Bangladesh",
-"Greensboro College",
-"Greenwich School of Management (GSM London)",
-"Greenwich University",
-"Grenoble Graduate School of Management",
-"Griffith University",
-"Grigol Robakidze University",
-"Grodno State University",
-"Group for Research in Decision Analysis",
-"Group for the Analysis of Development",
-"Group of Applied Economists",
-"Group of Thirty",
-"Groupe Paris Graduate School of Management",
-"Grove City College",
-"Growth Dialogue",
-"Grupo Analistas (AFI)",
-"Guangdong University of Finance and Economics",
-"Guangdong University of Foreign Studies",
-"Guangxi Normal University",
-"Guangxi University",
-"Guangzhou University",
-"Guglielmo Marconi University",
-"Guglielmo Tagliacarne Institute for the Promotion of the Economic Culture",
-"Guilford College",
-"Guizhou College of Finance and Economics",
-"Gujarat Institute of Development Research",
-"Gulf Centre for Development Policies",
-"Gulf University",
-"Gulf University of Science and Technology",
-"Gumushane University",
-"Gunadarma University",
-"Guru Arjan Dev Institute of Development Studies (IDSAsr)",
-"Guru Jambheshwar University of Science and Technology",
-"Gustavus Adolphus College",
-"Gwynedd-Mercy University",
-"Gyeonggi Research Institute",
-"HEC Montreal Business School",
-"HECM Business School",
-"HERMIN Network of European Policy Advisers",
-"HETFA Research Institute",
-"HMKW University of Applied Sciences",
-"Hacettepe University",
-"Haci Bayram Veli University",
-"Haderslev Business College",
-"Hagen Distance Teaching University",
-"Haigazian University",
-"Hajee Mohammad Danesh Science and Technology University",
-"Hallym University",
-"Halmstad College",
-"Halu Oleo University",
-"Hamburg Institute of International Economics (HWWI)",
-"Hamburg School of Business Administration (HSBA)",
-"Hamburg University of Applied Sciences",
-"Hamburg-Harburg University of Technology",
-"Hamilton College",
-"Hamline University",
-"Hampden-Sydney College",
-"Hampton University",
-"Hang Seng Management College",
-"Hanken School of Economics",
-"Hankuk University of Foreign Studies",
-"Hannan University",
-"Hanoi University of Technology",
-"Hans Böckler Foundation",
-"Hanwha Economic Research Institute",
-"Hanyang University",
-"Haramaya University",
-"Harbin Engineering University",
-"Harbin Institute of Technology",
-"Hardin-Simmons University",
-"Harding University",
-"Harokopio University",
-"Harper Adams University",
-"Harran University",
-"Harsányi János College",
-"Harvard University",
-"Hashemite University",
-"Hasselt University",
-"Hatinh University",
-"Haverford College",
-"Hawaii Pacific University",
-"Hayek Center for Interdisciplinary Research",
-"Health Economics Association of India - HEAI",
-"Health Economics Association of Ireland - HEAI",
-"Health Economics and Policy Association",
-"Health Economists' Study Group - HESG",
-"Heartland Forward",
-"Heartland Institute",
-"Hebei University",
-"Hebei University of Economics and Trade",
-"Hebrew University of Jerusalem",
-"Hefei University of Technology",
-"Hellenic Economics Chamber",
-"Hellenic Open University",
-"Helmholtz Centre for Environmental Research",
-"Helmholtz Centre for Health and Environment",
-"Helmut Schmidt University",
-"Helsinki Center for Economic Research (HECER)",
-"Helsinki Graduate School of Economics",
-"Henan Institute of Technology",
-"Henan University",
-"Henan University of Technology",
-"Henderson State University",
-"Hendrix College",
-"Heriot-Watt University",
-"Heritage Foundation",
-"Hertie School of Governance",
-"Hesston College",
-"High School of Commerce Algiers",
-"High School of Management in Konin",
-"High School of Managerial Informatics and Economics",
-"Higher Institute of Coomercial Studies",
-"Higher Institute of Management and Entrepreneurship",
-"Higher Polytechnic School of Chimborazo",
-"Higher Polytechnic School of the Coast",
-"Higher School for Economics and Business Administration",
-"Higher School for Economics and Commerce",
-"Higher School of Insurance and Finance",
-"Higher School of Public Administration",
-"Himachal Pradesh University",
-"Himalayan Institute of Development",
-"Hirosaki University",
-"Hiroshima Shudo University",
-"Hiroshima University",
-"Hiroshima University of Economics",
-"Hispano-Portuguese Association for Resource and Environmental Economics",
-"Hitit University",
-"Hitotsubashi University",
-"Ho Chi Minh City Open University",
-"Hofstra University",
-"Hogeschool van Arnhem en Nijmegen",
-"Hogeschool-Universiteit Brussel (HUBrussel)",
-"Hohai University",
-"Hokkai-Gakuen University",
-"Hokkaido University",
-"Hollins University",
-"Holy See",
-"Holy Spirit Specialty University",
-"Holy Spirit University of Kaslik",
-"Hong Kong Baptist University",
-"Hong Kong Monetary Authority",
-"Hong Kong Policy Research Institute",
-"Hong Kong Polytechnic University",
-"Hong Kong Trade and Development Council",
-"Hong Kong University of Science and Technology (HKUST)",
-"Hongik University",
-"Hood College",
-"Hope College",
-"Horn Economic and Social Policy Institute (HESPI)",
-"Horsens Business College",
-"Hosei University",
-"Houghton College",
-"Houston Baptist University",
-"Howard University",
-"Hsuan Chuang University",
-"Huachiew Chalermprakiet University",
-"Huazhong University of Science and Technology",
-"Hubei University of Economics",
-"Hudson Institute",
-"Hue University",
-"Human Sciences Research Council (HSRC)",
-"Humber Institute of Technology",
-"Humboldt University Berlin",
-"Humphreys College",
-"Hunan Institute of Science and Technology",
-"Hungarian Society of Economics",
-"Hyakujushi Economic Research Institute",
-"Hyogo University",
-"Hyperion University",
-"IBMEC Business School - Distrito Federal",
-"IBMEC Business School - Minas Gerais",
-"IBMEC Business School - Rio de Janeiro",
-"ICAR Research Complex for Eastern Region",
-"ICFAI University",
-"ICICI Research Centre",
-"IDATE",
-"IDESAA Business School",
-"IDRAC Business School",
-"IEEE Computational Intelligence Society, Computational Finance and Economics Technical Committee - IEEE CIS CFETC",
-"IESA School of Management",
-"IFP School",
-"IFPEN",
-"ILMA University",
-"IMT Atlantique Bretagne Pays de la Loire",
-"IMT Lucca Institute for Advanced Studies",
-"INESC",
-"INSEAD",
-"IPAG Business School",
-"IPMI Business School",
-"ISC Paris School of Management",
-"ISCAM Busines School",
-"ISI Foundation",
-"ISM University of Economics and Management",
-"ITSMI School of Management",
-"Ibero-American Network of Environmental Economics",
-"Ibero-American Observatory of Employment and Social and Cooperative Economies",
-"Ibero-American University",
-"Ibn Haldun University",
-"Ibn Khaldoun Center for Development Studies",
-"Ibn Tofail University",
-"Ibn Zhor University",
-"Ibrahim Badamasi Badangida University",
-"Icesi University",
-"Idaho State University",
-"Ifo Institute for Economic Research at the University of Munich",
-"Illinois College",
-"Illinois Institute of Technology",
-"Illinois State University",
-"Ilmenau University of Technology",
-"Imam Bonjol State Islamic University",
-"Imam Sadegh University",
-"Imani Center for Policy and Education",
-"Immanuel Kant Baltic Federal University",
-"Imperial College",
-"In-Je University",
-"Incheon National University",
-"Indaba Agricultural Policy Research Institute (IAPRI)",
-"Independence Institute",
-"Independent Institute",
-"Independent Institute of Lay Adventists of Kigali (INILAK)",
-"Independent Institute of Socio-Economic & Political Studies (IISEPS)",
-"Independent University Bangladesh",
-"India Development Foundation",
-"India Policy Institute",
-"Indian Agricultural Research Istitute (IARI)",
-"Indian Agricultural Statistics Research Institute (IASRI)",
-"Indian Council for Research on International Economic Relations (ICRIER)",
-"Indian Economic Association - IEA",
-"Indian Education Society",
-"Indian Institute of Banking and Finance",
-"Indian Institute of Dalit Studies (IIDS)",
-"Indian Institute of Economics",
-"Indian Institute of Finance",
-"Indian Institute of Foreign Trade (IIFT)",
-"Indian Institute of Management Ahmedabad (IIMA)",
-"Indian Institute of Management Bangalore (IIMB)",
-"Indian Institute of Management Calcutta (IIMCAL)",
-"Indian Institute of Management Indore (IIMIDR)",
-"Indian Institute of Management Lucknow (IIML)",
-"Indian Institute of Management Ranchi",
-"Indian Institute of Management Rohtak",
-"Indian Institute of Management Shillong",
-"Indian Institute of Planning and Management (IIPM)",
-"Indian Institute of Social Welfare and Business Management (IISWBM)",
-"Indian Institute of Technology Bombay",
-"Indian Institute of Technology Delhi",
-"Indian Institute of Technology Kanpur",
-"Indian Institute of Technology Madras",
-"Indian School of Business",
-"Indian School of Business and Finance",
-"Indian Society for Ecological Economics - INSEE",
-"Indian Society of Agricultural Economics - ISAE",
-"Indian Statistical Institute",
-"Indiana Institute of Technology",
-"Indiana State University",
-"Indiana University",
-"Indiana University East",
-"Indiana University Northwest",
-"Indiana University-Purdue University",
-"Indiana University-Purdue University (IUPUI)",
-"Indiana Wesleyan University",
-"Indonesian Economists Association",
-"Indonesian Finance Association - IFA",
-"Indonesian Health Economics Association - INAHEA",
-"Indus University",
-"Indus World School of Business",
-"Industrial Organization Society - IOS",
-"Infometrics",
-"Information Technology and Innovation Foundation (ITIF)",
-"Inframarginal Economics Society - IME",
-"Inha University",
-"Inland Norway University of Applied Sciences",
-"Inner Mongolia University of Finance and Economics",
-"Innovation Research Network",
-"Innovations and Consulting Centre (INC)",
-"Innovations for Poverty Action (IPA)",
-"Innsbruck University",
-"Insight on Immigration and Development Economics - INSIDE",
-"Insper Institute of Education and Research",
-"Institut Aceh",
-"Institute des Hautes Études Internationales et du Développement",
-"Institute for Advanced Studies",
-"Institute for Agriculture & Trade Policy",
-"Institute for Applied Economic Research",
-"Institute for Argentine Public Finance Studies",
-"Institute for Banking and Financial History",
-"Institute for Christian Economics",
-"Institute for Clinical and Economic Review (ICER)",
-"Institute for Competitiveness and Prosperity",
-"Institute for Development",
-"Institute for Development and International Relations",
-"Institute for Development of Economics and Finance (INDEF)",
-"Institute for Ecological Economy Research",
-"Institute for Economic Analysis",
-"Institute for Economic Policy Studies",
-"Institute for Economic Research",
-"Institute for Economic Research and Policy Consulting",
-"Institute for Economic and Enterprise Research",
-"Institute for Education and Socio-Economic Research and Consulting",
-"Institute for Employment Research",
-"Institute for Financial Management Research (IFMR)",
-"Institute for Financial Research (SIFR)",
-"Institute for Financial and Regional Analyses",
-"Institute for Fiscal Studies (IFS)",
-"Institute for Future Studies",
-"Institute for Futures Studies and Technology Assesment",
-"Institute for Global Economy",
-"Institute for Global Environmental Strategies (IGES)",
-"Institute for Human Development (IHD)",
-"Institute for Human Economics",
-"Institute for Industrial Research",
-"Institute for Integrated Learning in Management: Graduate School",
-"Institute for International Management and Technology",
-"Institute for International Policy Studies (IIPS)",
-"Institute for International Socio-Economic Studies (IISE)",
-"Institute for International and Development Economics",
-"Institute for Laboir Market Policy",
-"Institute for Management and Planning Studies (IMPS)",
-"Institute for Market Economics (IME)",
-"Institute for Market, Consumption and Business Cycles Research",
-"Institute for New Economic Thinking",
-"Institute for Operations Research and the Management Sciences - INFORMS",
-"Institute for Peruvian Studies",
-"Institute for Policy Analysis and Research (IPAR)",
-"Institute for Privatization and Management (IPM)",
-"Institute for Public Policy Research",
-"Institute for Pure and Applied Mathematics",
-"Institute for Regional Development",
-"Institute for Rural Development and Sustainability",
-"Institute for Service Industry Research",
-"Institute for Social Research",
-"Institute for Social and Economic Change (ISEC)",
-"Institute for Social and Economic Research",
-"Institute for Social and Economics Studies",
-"Institute for Strategic Studies and Prognoses",
-"Institute for Studies in Industrial Development (ISID)",
-"Institute for Studies on Economics and Employment",
-"Institute for Studies on Labor and Society",
-"Institute for Work and Technology",
-"Institute for the Professional Development of Workers",
-"Institute for the Study of Political Economy, Garcas House",
-"Institute for the Study of Politics, Economics and Social Sciences",
-"Institute for the Study of Transport within the European Economic Integration",
-"Institute for the Study of the Argentine and Latinamerican Reality",
-"Institute for the Study of the Russian Economy",
-"Institute of Accounting and Finance",
-"Institute of African Economics (InafEcon)",
-"Institute of Agricultural Economics",
-"Institute of Baltic Studies",
-"Institute of Bankers Pakistan",
-"Institute of Business Administration",
-"Institute of Business Forecasting",
-"Institute of Business Management",
-"Institute of Chartered Economists of Nigeria - ICEN",
-"Institute of Development Studies Kolkata",
-"Institute of Development and Economic Alternatives (IDEAS)",
-"Institute of Development and Environmental Applied Studies",
-"Institute of Economic Affairs (IEA)",
-"Institute of Economic Research",
-"Institute of Economic Sciences",
-"Institute of Economics Zagreb",
-"Institute of Economics and Business",
-"Institute of Economics, Management and Law (IEML)",
-"Institute of Education",
-"Institute of Energy Economics, Japan",
-"Institute of Environmental Economics and Sustainable Development",
-"Institute of Finance",
-"Institute of Finance Management",
-"Institute of Financial Studies",
-"Institute of Free Market Economics",
-"Institute of Health Economics",
-"Institute of Innovative Management of the Economy (IIME)",
-"Institute of International Economic Relations",
-"Institute of International Finance",
-"Institute of International Trade and Law",
-"Institute of Islamic Banking and Takaful Insurance",
-"Institute of Local Public Finance (ILPF)",
-"Institute of Management Technology",
-"Institute of Microfinance",
-"Institute of National Housing Fund for Workers Studies",
-"Institute of Policy Analysis and Research",
-"Institute of Policy Analysis and Research (IPAR)",
-"Institute of Policy Studies (IPS)",
-"Institute of Public Enterprise",
-"Institute of Public Finance",
-"Institute of Public Policy Management (IPPM)",
-"Institute of Rural Management (IRMA)",
-"Institute of Small Enterprises and Development (ISED)",
-"Institute of Social Studies (ISS)",
-"Institute of Statistical, Social and Economic Research (ISSER)",
-"Institute of Strategic Capital Market Research",
-"Institute of Strategic Thinking",
-"Institute of Transport Economics",
-"Institute of Transportation Economics Japan",
-"Institute of the German Taxpayer",
-"Institute to Forment Economic Research",
-"Instituto Libertad y Prosperidad",
-"Inter-American Center of Tax Administrations",
-"Inter-American Development Bank",
-"Inter-American Institute for Cooperation on Agriculture",
-"Inter-American University of Puerto Rico",
-"Interamerican Open University",
-"Interdepartmental Analytical Center",
-"Interdisciplinary Center (IDC)",
-"Interdisciplinary Center for the Analysis of Human and Social Processes",
-"International Academy of Business and Banking",
-"International Academy of Economics, Finance and Law (IAEFL)",
-"International Academy of Health Preference Research - IAHPR",
-"International Association for Applied Econometrics - IAAE",
-"International Association for Applied Economics",
-"International Association for Chinese Management Research - IACMR",
-"International Association for Energy Economics - IAEE",
-"International Association for Feminist Economics - IAFFE",
-"International Association for Official Statistics - IAOS",
-"International Association for Research in Economic Psychology - IAREP",
-"International Association for Research in Income and Wealth - IARIW",
-"International Association for Tourism Economics - IATE",
-"International Association for the Economics of Participation - IAFEP",
-"International Association for the Study of the Commons - IASC",
-"International Association of Agricultural Economists - IAAE",
-"International Association of Aquaculture Economics and Management - IAAEM",
-"International Association of Italian Economists",
-"International Association of Maritime Economists - IAME",
-"International Atlantic Economic Society - IAES",
-"International Bank for Economic Co-operation (IBEC)",
-"International Banking, Economics and Finance Association - IBEFA",
-"International Black Sea University",
-"International Burch University",
-"International Business Academy",
-"International Business School",
-"International Center for Economic Growth (ICEG)",
-"International Center for Economic Growth (ICEG), European Center",
-"International Center for Law and Economics (ICLE)",
-"International Center for Monetary and Banking Studies (ICMB)",
-"International Center for Peace and Development",
-"International Center of Research and Information on the Public and Cooperative Economy",
-"International Center of Research and Information on the Public, Social and Cooperative Economy",
-"International Centre for Economic Research (ICER)",
-"International Centre for Education in Islamic Finance (INCEIF)",
-"International Centre for Policy Studies",
-"International Centre for Research on the Environment and the Economy (ICRE8)",
-"International Centre for Socio-Economic Research 'Leontief Centre'",
-"International Centre for Trade and Sustainable Development (ICTSD)",
-"International Christian University",
-"International Confederation of Associations for Pluralism in Economics - ICAPE",
-"International Cooperation Center for Statistics 'Luigi Bodio' (ICSTAT)",
-"International Data Envelopment Analysis Society - iDEAs",
-"International Development Research Center (IDRC)",
-"International Development Research Centre",
-"International Economic Association - IEA",
-"International Economic Development Council (IEDC)",
-"International Economics and Finance Society Japan - IEFS Japan",
-"International Economy & Work Research Institute (IEWRI)",
-"International Energy Agency (IEA)",
-"International Food Policy Research Institute (IFPRI)",
-"International Food and Agribusiness Management Association - IFAMA",
-"International Foundation Global Economic Challenge",
-"International Foundation for Research in Experimental Economics (IFREE)",
-"International Free University of Social Sciences Guido Carli",
-"International Growth Centre (IGC)",
-"International Health Economics Association - iHEA",
-"International Herbert A. Simon Society",
-"International Indian Economists Association - IIEA",
-"International Initiative for Impact Evaluation (3ie)",
-"International Input-Output Association - IIOA",
-"International Institute for Applied Systems Analysis (IIASA)",
-"International Institute for Higher Education in Morocco (IIHEM)",
-"International Institute for Management (IMD)",
-"International Institute for Policy Review and Development Strategies",
-"International Institute for Sustainable Regional Economies (IISRE)",
-"International Institute of Fisheries Economics and Trade - IIFET",
-"International Institute of Infonomics",
-"International Institute of Management (IIM)",
-"International Iranian Economic Association - IIEA",
-"International Islamic University Chittagong",
-"International Islamic University Malaysia (IIUM)",
-"International Joseph A. Schumpeter Society - ISS",
-"International Longevity Centre-UK (ILCUK)",
-"International Maize and Wheat Improvement Center",
-"International Management Institute (IMI)",
-"International Management Institute Kolkata",
-"International Maritime Economic History Association - IMEHA",
-"International Microsimulation Association - IMA",
-"International Monetary Fund (IMF)",
-"International Network for Economic Developers - INED",
-"International Organisation of Securities Commissions (IOSCO)",
-"International Real Estate Society - IRES",
-"International Relations Institute of Cameroon",
-"International Research Center on the Environment and Development",
-"International School for Social and Business Studies (ISSBS)",
-"International School of Business",
-"International School of Management",
-"International School of Management (ISM)",
-"International Society for Bayesian Analysis - ISBA",
-"International Society for Intercommunication of New Ideas - ISINI",
-"International Society for Inventory Research - ISIR",
-"International Society for Pharmacoeconomics and Outcomes Research - ISPOR",
-"International Society for Quality-of-Life Studies - ISQOLS",
-"International Society for the History of Behavioral and Social Sciences - Cheiron",
-"International Society of Business, Economics and Ethics - ISBEE",
-"International Statistical Institute (ISI)",
-"International Sugar Organization",
-"International Tax and Investment Center",
-"International Trade and Finance Association - IT&FA",
-"International Turkmen Turkish University",
-"International Union for Land Value Taxation and Free Trade (The International Georgist Union)",
-"International Union of Economists - IUE",
-"International University of Catalonia",
-"International University of Ecuador",
-"International University of Grand-Bassam",
-"International University of Kagoshima",
-"International University of Kyrgystan",
-"International University of Monaco",
-"International University of Sarajevo",
-"International Water Management Institute (IWMI)",
-"International Working Group on Gender, Macroeconomics and International Economics - GEM-IWG",
-"International Working Group on Value Theory - IWGVT",
-"Interregional Academy of Personnel Management",
-"Interuniversity Center of Economics Applied to Industrial, Local Development and Globalization Policy",
-"Interuniversity Centre of Econometrics",
-"Interuniversity Research Center on Public Economics",
-"Iona College",
-"Iowa State University",
-"Ipek University",
-"Iqra University",
-"Iranian Agricultural Economics Society - IAES",
-"Iranian Association for Energy Economics - IRAEE",
-"Iranian Economic Association - IEA",
-"Iris Knowledge Foundation",
-"Irish Accounting and Finance Association - IAFA",
-"Irish Agriculture and Food Development Authority (Teagasc)",
-"Irish Economic Association - IEA",
-"Irish Society of New Economists - ISNE",
-"Irkutsk State Technical University",
-"Irkutsk State University",
-"Isik University",
-"Islamia University",
-"Islamic Azad University",
-"Islamic Development Bank",
-"Islamic Society of Institutional Economics - I-SIE",
-"Islamic University of Gaza",
-"Islamic University of Indonesia",
-"Islamic University of Science and Technology",
-"Israel Institute of Technology (Technion)",
-"Israel Society for Economics - ISE",
-"Israeli Association for Law and Economics - ILEA",
-"Istanbul Aydin Unversity",
-"Istanbul Bilgi University",
-"Istanbul Commerce University",
-"Istanbul Gelisim University",
-"Istanbul Medipol University",
-"Istanbul Sehir University",
-"Istanbul Technical University",
-"Italian Association for Health Economics",
-"Italian Association for Labor Economics",
-"Italian Association for Regional Science",
-"Italian Association for the History of Economic Thought",
-"Italian Association for the History of Political Economy",
-"Italian Association for the Study of Comparative Economic Systems",
-"Italian Association for the Study of Economic Asymmetries",
-"Italian Association of Agricultural and Applied Economics",
-"Italian Association of Environmental and Resource Economists",
-"Italian Group of Economic Policy Research",
-"Italian Society for Economic Demography and Statistics",
-"Italian Society of Agricultural Economics",
-"Italian Society of Econometrics",
-"Italian Society of Economists",
-"Italian Society of Law and Economics",
-"Ithaca College",
-"Ivan Franko National Technical University of Oil and Gas",
-"Ivan Franko National University",
-"Iwate University",
-"Izmir Katip Celebi University",
-"Izmir University of Economics",
-"J. J. Strossmayer University of Osijek",
-"Jacksonville State University",
-"Jadavpur University",
-"Jade University of Applied Sciences",
-"Jagiellonian University of Krakow",
-"Jahangirnagar University",
-"Jaime Isaza Cadavid Colombian Polytechnic",
-"Jamal Mohamed College",
-"James Cook University of North Queensland",
-"James Madison Institute",
-"James Madison University",
-"Jamestown College",
-"Jamnalal Bajaj Institute of Management Studies (JBIMS)",
-"Jan Evangelista Purkyne University",
-"Jan Kochanowski University in Kielce",
-"Japan Association for Comparative Economic Studies - JACES",
-"Japan Association for Evolutionary Economics - JAFEE",
-"Japan Association for Social and Economic Systems Studies - JASESS",
-"Japan Association of Economic Geographers - JAEG",
-"Japan Center for Economic Research (JCER)",
-"Japan Law and Economics Assocation",
-"Japan Policy Research Institute (JPRI)",
-"Japan Public Choice Society",
-"Japan Society for International Development - JASID",
-"Japan Society of Monetary Economics - JSME",
-"Japan Society of Political Economy - JSPE",
-"Japanese Economic Association - JEA",
-"Japanese Society for Comparative Economic Studies - JSCES",
-"Japanese Society for Post Keynesian Economics - JSPKE",
-"Japanese Society for The History of Economic Thought - JSHET",
-"Japanese Society for the Polical Economy of Health and Health Care - JSPEHHC",
-"Jarvis Christian College",
-"Jaume I University",
-"Javeriana Pontifical University",
-"Jawaharlal Nehru University",
-"Jayabaya University",
-"Jaypee Business School",
-"Jean Lorougnon Guede University",
-"Jean Moulin University of Lyon",
-"Jean Piaget University of Cabo Verde",
-"Jefferson School of Philosophy, Economics, and Psychology",
-"Jerash Private University",
-"Jerusalem",
-"Jerusalem Institute for Market Studies (JIMS)",
-"Jiangsu University",
-"Jilin University",
-"Jinan University",
-"Joanneum Research",
-"John Brown University",
-"John Cabot University",
-"John Carroll University",
-"John F. Kennedy University",
-"John von Neumann University",
-"Johns Hopkins University",
-"Johnson & Wales University",
-"Johnson-Shoyama Graduate School of Public Policy",
-"Joint Initiative for Latin American Experimental Economics (JILAEE)",
-"Joint Vienna Institute",
-"Jonkoping University",
-"Jorge Basadre Grohmann National University",
-"Jorge Tadeo Lozano University of Bogota",
-"Jose Simeon Canas Central-American University",
-"Juan Misael Saracho Autonomous University",
-"Judson College",
-"Julio Garavito Colombian Engineering School",
-"Juniata College",
-"KIT Royal Tropical Institute",
-"KTO Karatay University",
-"Kabarak University",
-"Kadir Has University",
-"Kafkas University",
-"Kagawa University",
-"Kagoshima University",
-"Kahramanmaras Sutcu Imam University",
-"Kainan University",
-"Kakatiya University",
-"Kalamazoo College",
-"Kalinga Institute of Industrial Technology",
-"Kaliningrad State Technical University",
-"Kalmizky State University",
-"Kanagawa University",
-"Kanazawa Seiryo University",
-"Kanazawa University",
-"Kangwon National University",
-"Kansas State University",
-"Karadeniz Technical University",
-"Karaganda Economic University of Kazpotrebsouz",
-"Kardan University",
-"Karlsruhe Institute of Technology",
-"Karoly Robert College",
-"Karunya University",
-"Kasetsart University",
-"Kathmandu University",
-"Katowice School of Economics",
-"Katowice University of Economics",
-"Kaunas University of Technology",
-"Kazakh American University",
-"Kazakh British Technical University",
-"Kazakhstan Securities Market Development Project",
-"Kazan Federal University",
-"Kazan Financial-Economical Institute",
-"Kazan State Architectural and Construction Academy",
-"Kazan State Technical University",
-"Kebangsaan University of Malaysia",
-"Keene State College",
-"Keiai University",
-"Keimyung University",
-"Keio University",
-"Kemerovo Institute of Food Science and Technology",
-"Kemerovo State University",
-"Kennesaw State University",
-"Kent State University",
-"Kentucky Council on Economic Education",
-"Kentucky Economic Association - KEA",
-"Kentucky State University",
-"Kentucky Wesleyan College",
-"Kenya Institute for Public Policy Research and Analysis (KIPPRA)",
-"Kenyatta University",
-"Kesatuan School of Business",
-"Kettering University",
-"Keuka College",
-"Keynes Gesellschaft",
-"Khadim Ali Shah Bukhari Institute of Technology (KASBIT)",
-"Kharkiv National Academy of Municipal Economy",
-"Kharkiv National University",
-"Kharkiv Regional Institute of Public Administration",
-"Khazar University",
-"Khon Kaen University",
-"Khulna University",
-"Kigali Independent University",
-"Kigali Institute of Science, Technology and Management",
-"Kim Il Sung University",
-"Kindai University",
-"King Abdulaziz University",
-"King Fahd University of Petroleum and Minerals",
-"King Juan Carlos University",
-"King Saud University",
-"King Sigismond College",
-"King University",
-"King's College",
-"King's College London",
-"King's Fund",
-"King's University College",
-"Kingston University",
-"Kinki University",
-"Kirikkale University",
-"Kirklareli University",
-"Klabat University",
-"Klaipeda University",
-"Knox College",
-"Kobe Gakuin University",
-"Kobe University",
-"Koc University",
-"Kocaeli University",
-"Kochi University",
-"Kochi University of Technology",
-"Kofi Annan University",
-"Kokugakuin University",
-"Kokumin Keizai Research Institute",
-"Kokushikan University",
-"Komazawa University",
-"Konan University",
-"Kongju National University",
-"Konkuk University",
-"Konrad Lorenz Foundation",
-"Konya Food and Agriculture University",
-"Kopint-Datorg Economic Research Institute",
-"Korea Academic Society of Industrial Organization - KASIO",
-"Korea Advanced Institute of Science and Technology (KAIST)",
-"Korea Agricultural Economics Association - KAEA",
-"Korea Association for Policy Analysis and Evaluation  - KAPAE",
-"Korea Association of Cultural Economics - KACE",
-"Korea Center for Free Enterprise (CFE)",
-"Korea Deposit Insurance Corporation (KDIC)",
-"Korea Development Economics Association - KDEA",
-"Korea Development Institute (KDI)",
-"Korea Economic Institute (KEI)",
-"Korea Economic Research Institute (KERI)",
-"Korea Economics and Business Association - KEBA",
-"Korea Fair Trade Mediation Agency",
-"Korea Fixed Income Research Institute (KFIRI)",
-"Korea Information Society Development Institute (KISDI)",
-"Korea Institute for Industrial Economics and Trade (KIET)",
-"Korea Institute for International Economic Policy (KIEP)",
-"Korea Institute of Local Finance (KILF)",
-"Korea Institute of Public Finance (KIPF)",
-"Korea Institute of Science and Technology (KIST)",
-"Korea Insurance Research Institute (KIRI)",
-"Korea Labor Institute (KLI)",
-"Korea Money and Finance Association - KMFA",
-"Korea National Defense University",
-"Korea National Open University",
-"Korea Research Institute for Human Settlements (KRIHS)",
-"Korea Research Institution for Local Administration (KRILA)",
-"Korea Rural Economic Institute (KREI)",
-"Korea Security Research Institute (KSRI)",
-"Korea University",
-"Korea-America Finance Association - KAFA",
-"Korean Association of Labor Studies - KALS",
-"Korean Association of Public Finance and Economics - KAPFE",
-"Korean Association of Trade and Industry Studies - KATIS",
-"Korean Econometric Society - KES",
-"Korean Economics Association - KEA",
-"Korean Environmental Economics Association - KEEA",
-"Korean Financial Management Association - KFMA",
-"Korean Law and Economics Association - KLEA",
-"Korean Regional Science Association - KRSA",
-"Korean Social and Economic Studies Association - KSESA",
-"Koreanisch-Deutsche Gesellschaft für Wirthschaftswissenschaften - KDGW",
-"Kostanay State University 'A. Baytursynov'",
-"Kostroma State University",
-"Kozminski University",
-"Kraka",
-"Krasnoyarsk State Technical University",
-"Krasnoyarsk State Trade Economic Institute",
-"Krasnoyarsk State Trading and Economics Institute",
-"Krasnoyarsk State University",
-"Krea University",
-"Krida Wacana Christian University",
-"Krisnadwipayana University",
-"Kristianstad University",
-"Kuban State Technological University",
-"Kumamoto Gakuen University",
-"Kumasi Technical University",
-"Kunsan National University",
-"Kurume University",
-"Kuwait Institute for Scientific Research",
-"Kuwait University",
-"Kwame Nkrumah University of Science and Technology (KNUST)",
-"Kwangju University",
-"Kwansei Gakuin University",
-"Kyiv National Linguistic University",
-"Kyiv National University of Trade and Economics",
-"Kyiv School of Economics",
-"Kyoto College of Economics",
-"Kyoto Sangyo University",
-"Kyoto University",
-"Kyrgystan-Turkish Manas University",
-"Kyung Hee University",
-"Kyungpook National University",
-"Kyungsung University",
-"Kyushu Economic Research Center (KERC)",
-"Kyushu International University",
-"Kyushu Kyoritsu University",
-"Kyushu Sangyo University",
-"Kyushu University",
-"Køge Business College",
-"Kühne Logistics University",
-"LG Economic Research Institute (LGERI)",
-"LUM Jean Monnet University",
-"La Jolla Institute",
-"La Molina National Agricultural University",
-"La Salle University",
-"La Salle University Center",
-"La Selva National Agricultural University",
-"La Trobe University",
-"Laboratory for Research in Statistics and Probability (LRSP)",
-"Laboratory of Forest Economics",
-"Labour Institute for Economic Research",
-"Ladoke Akintola University of Technology",
-"Lahore School of Economics",
-"Lahore University of Management Sciences",
-"Lake Forest College",
-"Lake Superior State University",
-"Lakehead University",
-"Lal Bahadur Shastri Institute of Management (LBSIM)",
-"Lala Lajpatrai College of Commerce and Economics",
-"Lamar University",
-"Lambda Alpha International - LAI",
-"Lambung Mangkurat University",
-"Lancaster University",
-"Land Forces Military Academy",
-"Lander University",
-"Lanzhou University",
-"Lappeenranta University of Technology",
-"Lasell College",
-"Latin American Association of Development Financing Institutions",
-"Latin American Center for a Human Economy",
-"Latin American Real Estate Association - LARES",
-"Latin American Trade Network",
-"Latin American and Caribbean Environmental Economics Program (LACEEP)",
-"Latin American and Iberian Law and Economics Association",
-"Latin University of Panama",
-"Latin-America Europe Research Center",
-"Latin-American Autonomous University",
-"Latin-American Faculty of Social Sciences",
-"Latinamerican Society for Political Economy and Critical Thinking",
-"Latvian Academy of Sciences",
-"Latvian State Institute of Agrarian Economics",
-"Latvian University of Agriculture",
-"Lauder Business School",
-"Laurentian University",
-"Laval University",
-"Law and Economics Association of New Zealand - LEANZ",
-"Lawrence Technological University",
-"Lawrence University",
-"Le Mirail University of Toulouse",
-"LeMoyne College",
-"League of Arab States",
-"Lebanese American University",
-"Lebanese Economic Association - LEA",
-"Lebanese University",
-"Lee University",
-"Leeds Beckett University",
-"Lees-McRae College",
-"Legatum Institute",
-"Lehigh University",
-"Leibniz Center for the Study of Agricultural Land",
-"Leibniz Centre for European Economic Research",
-"Leibniz Institute of Agricultural Development in Transition Economies",
-"Leipzig Graduate School of Management",
-"Leipzig University of Applied Sciences",
-"Lenoir-Rhyne University",
-"Lesley University",
-"Leuphana University of Luneburg",
-"Lewis University",
-"Lewis and Clark College",
-"Lewis-Clark State College",
-"Liaoning University",
-"Liberal Institute",
-"Liberty Fund",
-"Liberty Institute",
-"Liberty University",
-"Liberty and Development",
-"Liberty and Progress",
-"Liechtenstein Institute",
-"Lilongwe University of Agriculture and Natural Resources",
-"Lincoln Institute of Land Policy",
-"Lincoln University",
-"Lincoln University of Missouri",
-"Lindavista Center",
-"Linfield College",
-"Lingnan University",
-"Linkoping University",
-"Linneaus University",
-"Lipscomb University",
-"Lisbon University Institute",
-"List Society",
-"Lithuanian Free Market Institute (LFMI)",
-"Lithuanian Institute of Agrarian Economics",
-"Lobachevsky University",
-"Lock Haven University of Pennsylvania",
-"Locke Institute",
-"London Business School (LBS)",
-"London International Development Centre (LIDC)",
-"London Metropolitan University",
-"London School of Economics (LSE)",
-"London School of Hygiene and Tropical Medecine",
-"London South Bank University",
-"Long Island University-Brooklyn",
-"Long Island University-C.W. Post",
-"Longwood University",
-"Loras College",
-"Los Lagos University",
-"Loughborough University",
-"Louisiana State University",
-"Louisiana State University-Alexandria",
-"Louisiana State University-Shreveport",
-"Louisiana Technological University",
-"Lourdes College",
-"Lovely Professional University",
-"Lower Saxony Institute for Economic Research",
-"Lowy Institute for International Policy",
-"Loyola Marymount University",
-"Loyola University",
-"Loyola University Andalusia",
-"Loyola University in Andalusia",
-"Loyola University of Maryland",
-"Lubbock Christian University",
-"Luca D'Agliano Study Center",
-"Lucerne University of Applied Sciences and Arts",
-"Luigi Einaudi Research and Documentation Centre",
-"Luigi Vanvitelli University of Campania",
-"Lulea Technical University",
-"Lumiere University of Lyon",
-"Lund University",
-"Lupane State University",
-"Lusiada University of Lisbon",
-"Lusofona University of Humanities and Technologies",
-"Lusofona University of Porto",
-"Luther College",
-"Lutheran University of Brazil",
-"Luxembourg Income Study (LIS)",
-"Luxembourg Institute of Socio-Economic Research (LISER, CEPS/INSTEAD)",
-"Lviv University of Business and Law",
-"Lycoming College",
-"Lyndon State College",
-"Lynn University",
-"Lyon College",
-"M. V. Lomonosov Moscow State University",
-"MDRC",
-"MEDalics Research Center on Mediterranean Relations",
-"MINES ParisTech",
-"Maastricht School of Management (MSM)",
-"Maastricht University",
-"Macao Polytechnic Institute",
-"Macaulay Land Use Research Institute",
-"Macquarie University",
-"Macro Center for Political Economics",
-"Madda Walabu University",
-"Madonna University",
-"Madurai Kamaraj University",
-"Mae Fah Luang University",
-"Magellan University",
-"Magna Graecia University of Catanzaro",
-"Maharaja Sayajirao University of Baroda",
-"Maharishi University of Management",
-"Maharshi Dayanand University",
-"Mahbub-ul-Haq Human Development Center (MHHDC)",
-"Mahidol University",
-"Maia University Institute",
-"Maine Maritime Academy",
-"Majmaah University",
-"Major University",
-"Makerere University",
-"Malardalen University",
-"Malaviya National Institute of Technology",
-"Malaysian Agricultural Economics Association - MAEA",
-"Malaysian Economic Association",
-"Malaysian Institute of Economic Research (MIER)",
-"Malaysian University of Kelantan",
-"Malaysian University of Sabah",
-"Maltepe University",
-"Management Development Institute",
-"Management Development Institute of Singapore in Tashkent",
-"Managers of Quality and Production Association",
-"Manchester College",
-"Manchester Metropolitan University",
-"Mangalore University",
-"Manhattan Institute",
-"Manhattanville College",
-"Manipal University Jaipur",
-"Manisa Celal Bayar University",
-"Manlio Rossi-Doria Study and Research Association",
-"Mannheim Centre for Competition and Innovation (MaCCI)",
-"Mansoura University",
-"Maranatha Baptist Bible College",
-"Mardin Artuklu University",
-"Maria Curie-Sklodowska University of Lublin",
-"Marian College",
-"Mariano Marcos State University",
-"Marietta College",
-"Marist College",
-"Marista University of Merida",
-"Mariysky State Technical University",
-"Marmara University",
-"Marquette University",
-"Mars Hill College",
-"Marshall University",
-"Marta Abreu Central University",
-"Marwadi Education Foundation's Group of Institutions",
-"Mary Baldwin College",
-"Marylhurst University",
-"Marymount Manhattan College",
-"Marymount University",
-"Maryville College",
-"Maryville University",
-"Maseno University",
-"Massachusetts Institute for a New Commonwealth (MassINC)",
-"Massachusetts Institute of Technology (MIT)",
-"Massey University",
-"Master's College",
-"Matej Bel University",
-"Mathematica Policy Research",
-"Matsuyama University",
-"Max Planck Society",
-"Maynooth University",
-"McDaniel College",
-"McGill University",
-"McKeever Institute of Economic Policy Analysis (MIEPA)",
-"McKibbin Software Group",
-"McMaster University",
-"McNeese State University",
-"Mediobanca Research and Studies",
-"Mediterranean University",
-"Mediterranean University of Reggio Calabria",
-"Megatrend International University Vienna",
-"Meghnad Desai Academy of Economics",
-"Mehmet Akit Ersoy University",
-"Meiji Gakuin University",
-"Meiji University",
-"Meikai University",
-"Meisei University",
-"Mekelle University",
-"Mekong Development Research Institute",
-"Meliksah University",
-"Memorial University of Newfoundland",
-"Mendel University in Brno",
-"Mentouri University of Constantine",
-"Mercosur Economic Research Network",
-"Mercy College",
-"Mercyhurst College",
-"Merdeka Malang University",
-"Meredith College",
-"Merrimack College",
-"Mesa Community College",
-"Messiah College",
-"Meta-Analysis of Economic Research Network - MAER",
-"Methodist University of Piracicaba",
-"Metropolitan Autonomous University",
-"Metropolitan State University",
-"Metropolitan State University of Denver",
-"Metropolitan Technological University",
-"Metropolitan University",
-"Metropolitan University Prague",
-"Metropolitan University of Asuncion",
-"Mettu University",
-"Mexican Association of Energy Economics",
-"Mexican Institute of Finance Executives",
-"Miami University",
-"Michacan University of San Nicolas de Hidalgo",
-"Michael Okpara University of Agriculture",
-"Michigan State University",
-"Michigan Technological University",
-"Microfinance Information Exchange (MIX)",
-"Mid-Sweden University",
-"Middle East Economic Association - MEEA",
-"Middle East Technical University",
-"Middle Georgia State College",
-"Middle Hessen University of Applied Sciences",
-"Middle Tennessee State University",
-"Middlebury College",
-"Middlebury Institute of International Studies",
-"Middlesex University",
-"Midland University",
-"Midwest Econometrics Group - MEG",
-"Midwest Economics Association - MEA",
-"Midwestern International Economics Group - MWEIG",
-"Midwestern Law and Economics Association - MLEA",
-"Midwestern State University",
-"Mie Chukyo University",
-"Mie University",
-"Miguel Hernandez University",
-"Milken Institute",
-"Millersville University",
-"Millikin University",
-"Mills College",
-"Millsaps College",
-"Milwaukee School of Engineering",
-"Ming Chuan University",
-"Minnesota Economics Association - MEA",
-"Minnesota State University",
-"Minot State University",
-"Minufiya University",
-"Minzu University",
-"Mirbis Moscow Business School",
-"Misr International University",
-"Misr University for Science and Technology (MUST)",
-"Mississippi College",
-"Mississippi Economic Policy Center (MEPC)",
-"Mississippi State University",
-"Mississippi University for Women",
-"Missouri State University",
-"Missouri Western State University",
-"Misurata University",
-"Mitsubishi Economic Research Institute (MERI)",
-"Miyazaki Sangyo-keiei University",
-"Mizan Tepi University",
-"Modelling and Simulation Society of Australia and New Zealand - MSSANZ",
-"Modern Economics Training, Research and Innovation Center (METRIC)",
-"Modibbo Adama University of Technology",
-"Mofid University",
-"Mohamed Bougara University of Boumerdes",
-"Mohammed V University",
-"Mohammed VI Polytechnic University",
-"Molde University College",
-"Molloy College",
-"Momoyama Gakuin University",
-"Monash University",
-"Mondragon University",
-"Monetary Authority of Singapore",
-"Monetary and Foreign Exchange Authority of Macao",
-"Money and Finance Research group (Mo.Fi.R.)",
-"Monmouth College",
-"Monplaisir Private University",
-"Monroe College",
-"Montan University Leoben",
-"Montana State University-Billings",
-"Montana State University-Bozeman",
-"Monterrey Institute of Technology and Higher Studies",
-"Montpellier Business School",
-"Montreal Financial Mathematics Institute",
-"Montreux School of Business University",
-"Moravian College",
-"Morehead State University",
-"Morgan State University",
-"Morris College",
-"Moscow Air Institute",
-"Moscow Institute of Economics, Politics and Law",
-"Moscow Institute of Physics and Technology",
-"Moscow School of Social and Economic Sciences (MSSES)",
-"Moscow State Forest University",
-"Moscow State Institute of International Relations (MGIMO)",
-"Moscow State University for Food Production (MGUPP)",
-"Moscow State University of Economics, Statistics and Informatics (MESI)",
-"Moscow Witte University",
-"Mother's Service Society",
-"Mount Aloysius College",
-"Mount Holyoke College",
-"Mount Ida College",
-"Mount Mercy College",
-"Mount Olive College",
-"Mount Royal University",
-"Mount Saint Mary College",
-"Mount Saint Mary's College",
-"Mount St. Mary's university",
-"Mountain Top University",
-"Mountains of the Moon University",
-"Mu'tah University",
-"Muhammadiyah University of Makassar",
-"Muhammadiyah University of Malang",
-"Muhammadiyah University of Yogyakarta",
-"Muhlenberg College",
-"Multimedia University",
-"Multinational Finance Society - MFS",
-"Munich Business School",
-"Munich University of Applied Sciences",
-"Murdoch University",
-"Murmansk State Technical University",
-"Murray State University",
-"Mus Alparslan University",
-"Muskingum College",
-"Mustafa Kemal University",
-"Myongji University",
-"NHL University of Applied Sciences",
-"Nagano Economic Research Institute (NERI)",
-"Nagoya City University",
-"Nagoya Keizai University",
-"Namik Kemal University",
-"Nanhua University",
-"Nanjing Agriculture University",
-"Nanjing Audit University",
-"Nanjing Forestry University",
-"Nanjing Institute of Technology",
-"Nanjing Normal University",
-"Nanjing University",
-"Nanjing University of Aeroneautics and Astronautics",
-"Nanjing University of Finance and Economics",
-"Nanjing University of Science and Technology",
-"Nankai University",
-"Nanto Economic Research Institute (NERI)",
-"Nantong University",
-"Nanyang Technological University",
-"Nara Sangyo University",
-"Narsee Monjee Institute of Management Studies (NMIMS)",
-"Narxoz University",
-"Nassau Institute",
-"National Academy of Agricultural Research Management (ICAR-NAARM)",
-"National Academy of Governance",
-"National Academy of Pedagocial Sciences",
-"National Academy of Science",
-"National Academy of Sciences",
-"National Academy of Sciences of Belarus (NASB)",
-"National Academy of Sciences of the Republic of Armenia",
-"National Association for Business Economics - NABE",
-"National Association of Forensic Economics - NAFE",
-"National Association of Romanian Valuers",
-"National Autonomous University of Mexico",
-"National Autonomous University of Nicaragua-Leon",
-"National Autonomous University of Nicaragua-Managua",
-"National Bank for Agriculture and Rural Development (NABARD)",
-"National Bank of Angola",
-"National Bank of Austria",
-"National Bank of Belgium",
-"National Bank of Cambodia",
-"National Bank of Croatia",
-"National Bank of Ethiopia",
-"National Bank of Georgia",
-"National Bank of Kazakhstan",
-"National Bank of Moldova",
-"National Bank of Poland",
-"National Bank of Rwanda",
-"National Bank of Serbia",
-"National Bank of the Republic of Belarus",
-"National Bank of the Republic of Tajikistan",
-"National Center for Food and Agricultural Policy (NCFAP)",
-"National Center for Policy Analysis",
-"National Center for Public Policy Research",
-"National Center for Scientific Research",
-"National Central University",
-"National Centre for Agricultural Economics and Policy Research (NCAP)",
-"National Centre for Econometric Research (NCER)",
-"National Chao Tung University",
-"National Cheng Kung University",
-"National Chengchi University",
-"National Chi Nan University",
-"National Chiao Tung University",
-"National Chung Cheng University",
-"National College for Statistics and Applied Economics",
-"National College of Business Administration and Economics (NCBAE)",
-"National College of Economists of Mexico",
-"National College of Ireland",
-"National Conservatory of Arts and Crafts",
-"National Dairy Research Institute (NDRI)",
-"National Defense University",
-"National Distance Learning University",
-"National Dong-Hwa University",
-"National Economic Association - NEA",
-"National Economics Teaching Association - NETA",
-"National Education University",
-"National Engneering University",
-"National Graduate Institute for Policy Studies (GRIPS)",
-"National Huaqiao University",
-"National Innovation Council for Development",
-"National Institute for Agricultural Research",
-"National Institute for Higher Studies",
-"National Institute for Population Studies (NIPS)",
-"National Institute of Bank Management (NIBM)",
-"National Institute of Demographic Studies",
-"National Institute of Development Administration",
-"National Institute of Economic Research",
-"National Institute of Financial Management",
-"National Institute of Industrial Engineering (NITIE)",
-"National Institute of Population and Social Security Research",
-"National Institute of Rural Development",
-"National Institute of Science, Technology and Development Studies (NISTADS)",
-"National Institute of Statistics",
-"National Institute of Statistics and Applied Economics",
-"National Institute of Urban Affairs (NIUA)",
-"National Kaohsiung First University of Science and Technology",
-"National Kaohsiung University of Applied Sciences",
-"National Law University",
-"National Louis University",
-"National Low Income Housing Coalition (NLIHC)",
-"National Major University of San Marcos",
-"National Open University of Nigeria",
-"National Pingtung University",
-"National Polytechnic School",
-"National Regulatory Research Institute (NRRI)",
-"National Research Council",
-"National Research University Higher School of Economics",
-"National Reserve Bank of Tonga",
-"National School for Applied Economics",
-"National School for Commerce and Management",
-"National School for Statistics and Applied Economics",
-"National School of Agriculture",
-"National Scientific Centre",
-"National Scientific Institute for Labour and Social Protection",
-"National Scientific and Technical Research Council",
-"National Society of Contruction Economists",
-"National Sun Yat-Sen University",
-"National Taichung University of Science and Technology",
-"National Taipei University",
-"National Taiwan Ocean University",
-"National Taiwan University",
-"National Taiwan University of Science and Technology",
-"National Tax Association - NTA",
-"National Technical University 'Kharkov Politechnical Institute'",
-"National Technical University of Athens",
-"National Tsing Hua University",
-"National University",
-"National University of Altiplano",
-"National University of Asuncion",
-"National University of Catamarca",
-"National University of Chimborazo",
-"National University of Colombia",
-"National University of Cordoba",
-"National University of Cuyo",
-"National University of East Timor",
-"National University of Ireland",
-"National University of Jujuy",
-"National University of Kaohsiung",
-"National University of La Pampa",
-"National University of La Plata",
-"National University of Lanus",
-"National University of Lesotho",
-"National University of Life and Environmental Sciences",
-"National University of Mar del Plata",
-"National University of Mongolia",
-"National University of Ostroh Academy",
-"National University of Piura",
-"National University of Political Studies and Public Administration",
-"National University of Quilmes",
-"National University of Rio Cuarto",
-"National University of Rosario",
-"National University of Salta",
-"National University of San Agustin",
-"National University of San Juan",
-"National University of San Luis",
-"National University of San Martin",
-"National University of Science and Technology",
-"National University of Sciences and Technology (NUST)",
-"National University of Singapore (NUS)",
-"National University of Trujillo",
-"National University of Tucuman",
-"National University of Uzbekistan",
-"National University of the Center of Peru",
-"National University of the Center of the Buenos Aires Province",
-"National University of the Coast",
-"National University of the East",
-"National University of the South",
-"National and Kapodistrian University of Athens",
-"Naval Postgraduate School",
-"Nazarbayev University",
-"Near East University",
-"Nebraska Wesleyan University",
-"Necmettin Erbakan University",
-"Negocia Business School",
-"Neofit Rilski Southwestern University",
-"Nepal Administrative Staff College (NASC)",
-"Nepal Health Economics Association - NHEA",
-"Netherlands Central Bank",
-"Netherlands Environmental Assessment Agency",
-"Netherlands Insitute for Social Security and Public Employment Service",
-"Netherlands Interdisciplinary Demographic Institute (NIDI)",
-"Netherlands Organisation for Research in Business Economics and Management (NOBEM)",
-"Network for Economic Research on Electronic Communications - NEREC",
-"Network for Studies on Pensions, Aging and Retirement (NetSPAR)",
-"Network for the Study of the World Economy",
-"Network of Applied Economics",
-"Network of Border Economics / Red de la Economía Fronteriza - NOBE/REF",
-"Network of European Peace Scientists - NEPS",
-"Network of Swiss Economists Abroad",
-"Nevin Economic Research Institute (NERI)",
-"New Bulgarian University",
-"New College of the Humanities",
-"New Economic School (NES)",
-"New Economy Studies",
-"New England Universities Development Consortium - NEUDC",
-"New Granada Military University",
-"New Jersey City University",
-"New Mexico Highlands University",
-"New Mexico Institute of Mining and Technology",
-"New Mexico State University",
-"New York Institute of Technology",
-"New York University (NYU)",
-"New York University Abu Dhabi",
-"New York University Shanghai",
-"New Zealand Agricultural and Resource Economics Society - NZARES",
-"New Zealand Business Roundtable",
-"New Zealand Econometric Study Group - NZESG",
-"New Zealand Institute for the Study of Competition and Regulation (ISCR)",
-"Newbury College",
-"Newcastle University",
-"Newports Institute of Communications and Economics (NICE)",
-"Newton College",
-"Newton Paiva University Center",
-"Niagara University",
-"Nicaraguayan Foundation for Economic and Social Development",
-"Nicholls State University",
-"Nichols College",
-"Nicolae Titulescu University",
-"Nicosia",
-"Niger Delta University",
-"Nigerian Association of Agricultural Economists - NAAE",
-"Nigerian Institute of Social and Economic Research (NISER)",
-"Nihon Fukushi University",
-"Nihon University",
-"Niigata Sangyo University",
-"Niigata University",
-"Nikola Vaptsarov Naval Academy",
-"Nile University of Nigeria",
-"Nimes University",
-"Ningbo University",
-"Ninth of July University",
-"Nipissing University",
-"Nirma University",
-"Niskanen Center",
-"Nizniy Novgorod State University",
-"Nkafu Policy Institute",
-"Nnamdi Azikiwe University",
-"Noakhali Science and Technology University",
-"Nomisma",
-"Nomura Research Institute",
-"Nordic Investment Bank",
-"Normandy Management School",
-"North American Association of Fisheries Economists - NAAFE",
-"North American Association of Sports Economists - NAASE",
-"North American Development Bank",
-"North Asia University",
-"North Carolina Agricultural and Technical State University",
-"North Carolina Central University",
-"North Carolina Council on Economic Eduation (NCCEE)",
-"North Carolina State University",
-"North Central College",
-"North China Electric Power University",
-"North China University of Technology",
-"North Dakota State University",
-"North East Think Tank of Japan (NETT)",
-"North East Wales Institute of Higher Education",
-"North Maharashtra University",
-"North Park University",
-"North University of China",
-"North-Eastern Hill University",
-"North-South Institute",
-"North-West University",
-"Northeast Asia Economic Association of Korea - NEAK",
-"Northeast Business and  Economics Association - NBEA",
-"Northeast Dianli University",
-"Northeast Normal University",
-"Northeast-Midwest Institute",
-"Northeastern Agricultural and Resource Economics Association - NAREA",
-"Northeastern Illinois University",
-"Northeastern State University",
-"Northeastern University",
-"Northern (Arctic) Federal University",
-"Northern Arizona University",
-"Northern Finance Association - NFA",
-"Northern Illinois University",
-"Northern Institute for Integrated Learning and Management - Centre for Management Studies (NIILM-CMS)",
-"Northern Kentucky University",
-"Northern Michigan University",
-"Northern University of Malaysia",
-"Northland College",
-"Northwest Agriculture and Forestry University",
-"Northwest College",
-"Northwest Missouri State University",
-"Northwest Nazarene University",
-"Northwest Socioeconomic Development Research Center (NSDRC)",
-"Northwest University",
-"Northwestern College",
-"Northwestern State University",
-"Northwestern State University of Louisiana",
-"Northwestern University",
-"Norwegian Agricultural Economics Research Institute",
-"Norwegian Institute for Air Research",
-"Norwegian Institute for Nature Research",
-"Norwegian Institute for Urban and Regional Research",
-"Norwegian School of Economics",
-"Norwegian University of Life Sciences",
-"Norwegian University of Science and Technology",
-"Norwich University",
-"Notre Dame College",
-"Notre Dame University",
-"Notre Dame de Namur University",
-"Nottingham Trent University",
-"Nour Bachir University Center",
-"Nova Southeastern University",
-"Nova University of Lisbon",
-"Novancia Business School",
-"Novosibirsk State Technical University",
-"Novosibirsk State University",
-"Novosibirsk State University of Architecture and Civil Engineering",
-"Novosibirsk State University of Economics and Management",
-"Nueva Esparta University",
-"Nuh Naci Yazgan University",
-"Nusantara Islamic University",
-"Nyenrode Business University",
-"O.P. Jindal Global University",
-"ORT University of Uruguay",
-"Oakland City University",
-"Oakland University",
-"Obafemi Awolowo University",
-"Oberlin College",
-"Observer Research Foundation",
-"Occidental College",
-"Ocean University of China",
-"October 6 University",
-"October University for Modern Sciences and Arts",
-"Odessa National Economic University",
-"Office of the Fiscal Council",
-"Oglethorpe University",
-"Ohio State University",
-"Ohio University",
-"Ohio Valley University",
-"Ohio Wesleyan University",
-"Ohrid Institute for Economic Strategies and International Affairs",
-"Okanagan College",
-"Okayama Economic Research Institute",
-"Okayama Shoka University",
-"Okayama University",
-"Okinawa International University",
-"Okinawa University",
-"Oklahoma Baptist University",
-"Oklahoma Christian University",
-"Oklahoma Panhandle State University",
-"Oklahoma State University",
-"Oklahoma State University-Oklahoma City",
-"Olabisi Onabanjo University",
-"Old Dominion University",
-"Oles Honchar Dnipro National University",
-"Olsen Ltd.",
-"Omar Bongo University",
-"Omicron Delta Epsilon - ODE",
-"Omsk State Agrarian University",
-"Omsk State University",
-"Ondokuz Mayis University",
-"Ono Academic College",
-"Open Republic Institute",
-"Open University",
-"Open University of Catalonia",
-"Open University of Cyprus",
-"Open University of Hong Kong (OUHK)",
-"Open University of Malaysia",
-"Oregon State University",
-"Organisation for Economic Co-operation and Development (OECD)",
-"Organization for Economic Cooperation and Development (OECD)",
-"Organization of American States",
-"Organization of Islamic Countries",
-"Osaka Gakuin University",
-"Osaka Sangyo University",
-"Osaka University",
-"Osaka University of Commerce",
-"Osaka University of Economics",
-"Osaka University of Economics and Law",
-"Oslo Metropolitan University",
-"Oslo School of Management",
-"Osmangazi University",
-"Osmania University",
-"Osmaniye Korkut Atat University",
-"Osun State University",
-"Otaru University of Commerce",
-"Otemon Gakuin University",
-"Otta Wolff Institute for Economic Order",
-"Otterbein College",
-"Otto Beisheim Graduate School of Management",
-"Ouachita Baptist University",
-"Ouargla University",
-"Our Lady of Asuncion Catholic University",
-"Our Lady of the Lake University",
-"Overseas Development Institute",
-"Overseas Thai Economic and Finance Association - OTEFA",
-"Oxford Brookes University",
-"Oxford Economic Forecasting (OEF)",
-"Oxford Institute for Energy Studies (OIES)",
-"Oxford University",
-"Ozyegin University",
-"PSB Academy",
-"Pablo de Olavide University",
-"Pace University",
-"Pacific Economic Cooperation Council (PECC)",
-"Pacific Institute for Studies in Development, Environment, and Security",
-"Pacific Lutheran University",
-"Pacific Regional Science Conference Organization - PRSCO",
-"Pacific-Rim Real Estate Society - PRRES",
-"Padang State University",
-"Paderborn University",
-"Padjadjaran University",
-"Pakistan Institute of Development Economics",
-"Pakistan Institute of Public Finance Accounts (PIPFA)",
-"Palestina National Authority",
-"Palestine Monetary Authority",
-"Pamukkale University",
-"Pan Pacific Association of Input-Output Studies - PAPAIOS",
-"Pan-American University",
-"Pan-Atlantic University",
-"Pan-European University",
-"Pancasakti University",
-"Pandir Deendayal Petroleum University",
-"Panjab University",
-"Panteion University of Social and Political Sciences",
-"Panyapiwat Institute of Management",
-"Parahyangan Catholic University",
-"Parana State University",
-"Paris Higher Normal School",
-"Paris School of Economics",
-"Parthenope University of Naples",
-"Partnership for Economic Policy (PEP)",
-"Pasim School of Business",
-"Pasquale Paoli University of Corsica",
-"Pasundan School of Economics",
-"Pasundan University",
-"Pau Business School",
-"Paul Scherrer Institute",
-"Paul Smith's College",
-"Paula Santander Franciscan University",
-"Pavaresia University of Vlore",
-"Paññāsāstra University of Cambodia",
-"Peace College",
-"Pedagogical and Technological University of Colombia",
-"Pedro Henriquez Urena National University",
-"Pedro Ruiz Gallo National University",
-"Peking University",
-"Pellervo Economic Research Institute",
-"Pembangunan National Veteran University",
-"Pennsylvania College of Technology",
-"Pennsylvania State University",
-"Pennsylvania State University-Altoona",
-"Pennsylvania State University-Erie",
-"Pennsylvania State University-Harrisburg",
-"Pension Institute",
-"Pentecost University College",
-"Penza State University",
-"Penza Technological Institute",
-"Peoples Friendship University of Russia (RUDN)",
-"Pepperdine University",
-"Pereyaslav-Khmelnitsky State Pedagogical University named after Grigory Skovoroda",
-"Perm State Technical University",
-"Personal Social Services Research Unit (PSSRU)",
-"Pertiba School of Economics",
-"Peruvian Economics and Law Association",
-"Peruvian Institute for Business Management",
-"Peruvian University for Applied Sciences",
-"Peter G. Peterson Institute for International Economics (IIE)",
-"Petrozavodsk State University",
-"Petru maior University",
-"Phenikaa University",
-"Philadelphia University",
-"Phoenix Center for Advanced Legal and Economic Policy Studies",
-"Pi-Touch Institute",
-"Pine Manor College",
-"Pioneer Institute",
-"Piri Reis University",
-"Pitzer College",
-"Plekhanov Russian University of Economics",
-"Plymouth State College",
-"Podolsky State Agrarian Technical University",
-"Point Park University",
-"Point University",
-"Pokhara University",
-"Policy Center for the New South",
-"Policy Research & Consultancy",
-"Policy Research Institute (PRI)",
-"Polish Academy of Sciences",
-"Political Economy Workgroup",
-"Political Economy and Economic History Society - PEEHS",
-"Political and Ethical Knowledge on Economic Acivities Research Programme - PEKEA",
-"Polonia University",
-"Polytechnic Institute of Braganca",
-"Polytechnic Institute of Castelo Branco",
-"Polytechnic Institute of Leiria",
-"Polytechnic Institute of Lisbon",
-"Polytechnic Institute of Milan",
-"Polytechnic Institute of Porto",
-"Polytechnic Institute of Santarem",
-"Polytechnic Institute of Setubal",
-"Polytechnic Institute of Tomar",
-"Polytechnic Institute of Viana do Castelo",
-"Polytechnic School",
-"Polytechnic School of Tunisia",
-"Polytechnic University",
-"Polytechnic University of Bucharest",
-"Polytechnic University of Cartagena",
-"Polytechnic University of Madrid",
-"Polytechnic University of Marche",
-"Polytechnic University of Timisoara",
-"Polytechnic University of Valencia",
-"Polytechnic University of the Philippines",
-"Pomona College",
-"Pompeu Fabra University",
-"Pondicherry University",
-"Pontifical Catholic University of Argentina",
-"Pontifical Catholic University of Chile",
-"Pontifical Catholic University of Minas Gerais",
-"Pontifical Catholic University of Puerto Rico",
-"Pontifical Catholic University of Rio de Janeiro",
-"Pontifical Catholic University of Sao Paulo",
-"Pontifical Catholic University of Valparaiso",
-"Popular Autonomous University of Puebla State",
-"Portland Community College",
-"Portland State University",
-"Portuguese Agricultural Economics Association",
-"Portuguese Association for Health Economics",
-"Portuguese Association of Economists",
-"Portuguese Institute of Marketing Management",
-"Portuguese Society for Economic Research",
-"Post Keynesian Economics Society - PKES",
-"Potsdam Institute for Climate Impact Research",
-"Poznan University of Economics",
-"Prague Development Center (PRADEC)",
-"Prairie View Agricultural and Mechanical University",
-"Prasetiya Mulya University",
-"Pratt Institute",
-"Praxis Center for Policy Studies",
-"Prefectural University of Kumamoto",
-"Presbyterian College",
-"Presentation College",
-"Presidency University",
-"Prince Mohammad Bin Fahd University",
-"Prince of Songkla University",
-"Princess Sumaya University for Technology",
-"Princeton University",
-"Private Faculty of Management and Adminitrative Sciences of Sousse",
-"Private University for Health, Medical Informatics and Technology",
-"Private University of Santa Cruz de la Sierra",
-"Private University of Tacna",
-"Pro Global Science Association - PGSA",
-"Professional Risk Managers' International Association - PRMIA",
-"Progressive Economic Forum - PEF",
-"Prometeia",
-"Property and Environment Research Center (PERC)",
-"Protestant University in Congo",
-"Providence College",
-"Providence University",
-"Pryazovskyi State Technical University",
-"Public Choice Society",
-"Public Policy Institute of California (PPIC)",
-"Public University of Navarra",
-"Pukyong National University",
-"Punjab Economic Research Institute",
-"Purdue University",
-"Purdue University Fort Wayne",
-"Purdue University-Calumet",
-"Purdue University-Fort Wayne",
-"Purdue University-North Central",
-"Purna Graha School of Business",
-"Pusan National University",
-"Putra Indonesia YPTK University",
-"Qafqay University",
-"Qassim University",
-"Qatar Central Bank",
-"Qazvin Islamic Azad University",
-"Qianhai Institute of Innovative Research (QIIR)",
-"Qingdao University",
-"Quaid-i-Azam University",
-"Quantitative Economic Research Bureau (Quanterb)",
-"Queen Mary University of London",
-"Queen's University",
-"Queens University of Charlotte",
-"Queensland University of Technology",
-"Quinnipiac University",
-"Quisqueya University",
-"RAND",
-"RFF-CMCC European Institute on Economics and the Environment (EIEE)",
-"RMIT University",
-"RMIT University Vietnam",
-"RSconsult",
-"RWI - Leibniz Institute for Economic Research",
-"RWTH Aachen University",
-"Rabat International University",
-"Radboud University of Nijmegen",
-"Radcliffe College",
-"Radford University",
-"Rafael Landivar University",
-"Rajagiri Business School",
-"Rajiv Gandhi Institute of Petroleum Technology",
-"Ramakrishna Mission Vivekananda University",
-"Ramapo College",
-"Ramkhamhaeng University",
-"Ramon Llull University",
-"Rangsit University",
-"Ratio Institute",
-"Razi University",
-"Re-define",
-"Real Estate Research Institute (RERI)",
-"Reason Foundation",
-"Recep Tayyip Erdogan University",
-"Redeemer's University",
-"Redemptoris Mater Catholic University",
-"Reference Network for Research in Public Economics and Policy",
-"Regensburg University of Applied Sciences",
-"Regent University",
-"Regiomontana University",
-"Regional Science Association International - RSAI",
-"Regional Science Association International, British and Irish Section - RSAIBIS",
-"Regional Science Association International, Israeli Section - Israel RSA",
-"Regional Science Association, Netherlands Section - RSA-Nederland",
-"Regional Studies Association - RSA",
-"Regional University of the Northeast of the State of Rio Grande do Sul",
-"Regis College",
-"Regulatory Assistance Project",
-"Regulatory Policy Institute",
-"Reims Management School",
-"Rembang School of Business",
-"Renmin University of China",
-"Rensselaer Polytechnic Institute",
-"Republic University",
-"Republican Graduate School of Business and Management",
-"Res Foundation",
-"Research Africa Network - Resanet",
-"Research Center for Comparative Studies in Latin America",
-"Research Center for Economics Applied to Development",
-"Research Center for Savings Bank Development",
-"Research Center for the Study and Observation of Living Conditions",
-"Research Center on International Development",
-"Research Center on Remittances",
-"Research Chair in Intergenerational Economics",
-"Research Consulting and Development",
-"Research Foundation for Humanity (RFH)",
-"Research Institute for Development, Growth, and Economics (RIDGE)",
-"Research Institute for Ocean Economics (RIOE)",
-"Research Institute of Agricultural Economics",
-"Research Institute of Economy, Trade and Industry (RIETI)",
-"Research Institute of Financial Law",
-"Research Institute of Fiscal Policy",
-"Research Institute of Industrial Economics",
-"Research Institute of the East-West Economy & Society (RIES)",
-"Research Institute on the Contemporaneaous Economy",
-"Research Papers in Economics - RePEc",
-"Research Triangle Institute (RTI)",
-"Research and Development Solutions",
-"Research in International Economics and Finance Network - RIEF",
-"Research on Economics, Society and Territory",
-"Research on Improving Systems of Education (RISE)",
-"Researchers Alliance for Development - RAD",
-"Reserve Bank of Australia",
-"Reserve Bank of Fiji",
-"Reserve Bank of India",
-"Reserve Bank of Malawi",
-"Reserve Bank of Zimbabwe",
-"Resources for the Future (RFF)",
-"Rezekne Higher Education Institution",
-"Rhode Island College",
-"Rhodes University",
-"Rhone-Alps Institute for Complex Systems",
-"Riau University",
-"Ricardo Palma University",
-"Rice University",
-"Rider University",
-"Riga International School of Economics and Business Administration (RISEBA)",
-"Riga Technical University",
-"Riinvest Institute for Development Research",
-"Rikkyo University",
-"Rimac Institute for Social Studies",
-"Ripon College",
-"Risk Theory Society - RTS",
-"RiskLab Finland",
-"Rissho University",
-"Ritsumeikan University",
-"Rivier College",
-"Roanoke College",
-"Robert Gordon University",
-"Robert Morris College",
-"Roberts Wesleyan College",
-"Rochester Institute of Technology",
-"Rockford College",
-"Rockhurst University",
-"Rockwool Foundation Research Unit",
-"Rodolfo DeBenedetti Foundation",
-"Roger Williams University",
-"Rogers State University",
-"Rollins College",
-"Romania Think Tank (RTT)",
-"Romanian Academy",
-"Romanian American University",
-"Romanian Association for Regional Sciences",
-"Romanian Distribution  Committee - RDC",
-"Romanian Econometric Society",
-"Ronald Coase Institute",
-"Rondonia Federal University Foundation",
-"Roosevelt Institute",
-"Roosevelt University",
-"Rosemont College",
-"Rosselli Foundation",
-"Rostov State University of Economics",
-"Rotterdam University of Applied Sciences",
-"Rovira I Virgili University of Tarragon",
-"Rowan University",
-"Royal Agricultural University",
-"Royal Belgian Society for Economics",
-"Royal Economic Society - RES",
-"Royal Geographical Society, Economic Geography Research Group - EGRG",
-"Royal Holloway",
-"Royal Institute of Technology",
-"Royal Military College",
-"Royal Monetary Authority",
-"Royal Roads University",
-"Royal Swedish Academy of Sciences",
-"Royal University of Agriculture",
-"Royal University of Groningen",
-"Royal University of Phnom Penh",
-"Ruhr Graduate School in Economics",
-"Rural Policy Research Institute (RUPRI)",
-"Russell Sage Foundation",
-"Russian Academy of Entrepreneurship",
-"Russian Academy of Foreign Trade",
-"Russian Academy of Sciences (RAS)",
-"Russian Customs Academy",
-"Russian Independent Agricultural Economics Association - NAEKOR",
-"Russian Presidential Academy of National Economy and Public Administration (RANEPA)",
-"Russian Society for Ecological Economics - RSEE",
-"Russian State University for the Humanities",
-"Russian State University of Oil and Gas named after I. M. Gubkin",
-"Russian Timiryazev State Agrarian University",
-"Russian-Armenian (Slavonic) State University",
-"Rutgers University-Camden",
-"Rutgers University-New Brunswick",
-"Rutgers University-Newark",
-"Rutgers Universty-Piscataway",
-"Ryerson University",
-"Ryukoku University",
-"Ryutsu Keizai University",
-"Ríos Pérez Center for Analyses and Studies",
-"S.P. Jain Institute of Management and Research",
-"SEGi University",
-"SEK International University",
-"SK Research Institute",
-"SMERU Research Institute",
-"SOL Foundation",
-"SRM Institute of Science and Technology",
-"SVKM's Narsee Monjee Institute of Management Studies (NMIMS)",
-"Saarland University of Applied Sciences",
-"Sabanci University",
-"Sabaragamuwa University of Sri Lanka",
-"Saga University",
-"Saint Anselm College",
-"Saint Augustine's College",
-"Saint Francis University",
-"Saint Francis Xavier University",
-"Saint Joseph University",
-"Saint Louis University",
-"Saint Mary's College",
-"Saint Mary's University",
-"Saint Mary-of-the-Woods College",
-"Saint Peters University",
-"Saint Thomas University",
-"Saint Ursula University",
-"Saint Vincent College",
-"Saint Xavier University",
-"Saintest Conception Catholic University",
-"Saintgits",
-"Salem College",
-"Salman Bin Abdulaziz University",
-"Salvadoran Foundation for Economic and Social Development",
-"Salve Regina University",
-"Salzburg University",
-"Sam Houston State University",
-"Samara Academy of State and Municipal Management",
-"Samara State Technical University",
-"Samara State University",
-"Samara State University of Economics",
-"Samarkand Institute of Economics and Service",
-"Sambalpur University",
-"Sambodhi Research & Management Institute",
-"Samsung Economic Research Institute (SERI)",
-"Samudra Langsa University",
-"San Andres Major University",
-"San Andres University",
-"San Antonio Catholic University",
-"San Buenaventura University",
-"San Diego State University",
-"San Francisco State University",
-"San Francisco University in Quito",
-"San Ignacio de Loyola University",
-"San Jose State University",
-"San Juan Bautista Private University",
-"San Juan Bosco National University of Patagonia",
-"San Luis Gonzaga National University",
-"San Martin de Porres University",
-"San Pablo Bolivian Catholic University",
-"San Pablo CEU University",
-"Sangji University",
-"Sangmyung University",
-"Sant'Anna Higher School",
-"Santa Clara University",
-"Santa Fe Institute",
-"Santa Maria La Antiqua Catholic University",
-"Santiago Antunez de Mayolo National University",
-"Santo Toribio de Mogrovejo Catholic University",
-"Sao Paulo State University",
-"Sapienza University of Rome",
-"Sapporo University",
-"Saratov State Socio-Economic University",
-"Sardar Patel Institute of Economic & Social Research",
-"Sari Agricultural Sciences and Natural Resources University",
-"Sarjanawiyata University",
-"Sarva Vidyalaya Instritute of Management (SVIM)",
-"Satbayev Universty",
-"Saudi Arabian Monetary Agency (SAMA)",
-"Savannah State University",
-"Scandinavian Association of Law and Economics - SALE",
-"Scandinavian Society of Forest Economics",
-"School of Advanced Social Studies (SASS)",
-"School of Banking",
-"School of Business",
-"School of Development Innovation and Change (SDIC)",
-"School of Economics",
-"School of Economics and Administration",
-"School of Economics and Management",
-"School of Higher Commercial Studies",
-"School of International Trade",
-"School of Management and Banking",
-"School of Oriental and African Studies (SOAS)",
-"Schreiner University",
-"Science & Finance",
-"Sciences Po",
-"Scientific Society for the Promotion and Advancement of Social Sciences - Akroasis",
-"Scientific University of the South",
-"Scotland's Rural College",
-"Scottish Economic Policy Network (scotecon)",
-"Scottish Economic Society - SES",
-"Scottish Institute for Research in Economics (SIRE)",
-"Scripps College",
-"Seattle Pacific University",
-"Seattle University",
-"Sebelas Maret University",
-"Seikei University",
-"Seinan Gakuin University",
-"Sejong University",
-"Selcuk University",
-"Senegalese Institute of Agricultural Research",
-"Seoul Development Institute",
-"Seoul National University",
-"Seoul National University of Science and Technology",
-"Seoul Women's University",
-"Seowon University",
-"Serbian Association of Agricultural Economists",
-"Serbian Association of Economists",
-"Sergio Arboleda University",
-"Severoosetinsky State University",
-"Shaanxi Normal University",
-"Shah Abdul Latif University",
-"Shahid Javed Burki Institute of Public Policy at NetSol",
-"Shahjalal University of Science and Technology",
-"Shandong Normal University",
-"Shandong University",
-"Shandong University of Technology",
-"Shanghai Academy of Social Sciences",
-"Shanghai Danji University",
-"Shanghai Finance University",
-"Shanghai Jiao Tong University",
-"Shanghai Lixin University of Accounting and Finance",
-"Shanghai Ocean University",
-"Shanghai University",
-"Shanghai University of Finance and Economics",
-"Shanghai University of International Business and Economics",
-"ShanghaiTech University",
-"Shanti Business School",
-"Shantou University",
-"Shanxi University",
-"Shanxi University of Finance and Economics",
-"Shaoguan University",
-"Sharif Think Tank",
-"Sharif University of Technology",
-"Sheffield Hallam University",
-"Sheikh Saud bin Saqr Al Qasimi Foundation for Policy Research",
-"Shenyang Normal University",
-"Shenzhen University",
-"Shepherd University",
-"Sher-e-Bangla Agricultural University",
-"Sheridan College",
-"Shiga University",
-"Shih Chien University",
-"Shih-Hsin University",
-"Shihezi University",
-"Shikuoka Economic Research Institute (SERI)",
-"Shinshu University",
-"Shiraz University",
-"Shiv Nadar University",
-"Shivaji University",
-"Shizuoka University",
-"Shorter College",
-"Shri Vaishnav Institute of Management",
-"Siberian Academy of Finance and Banking",
-"Siberian Federal University",
-"Siberian University of Consumer Cooperation",
-"Sichuan Normal University",
-"Sichuan University",
-"Sidi Mohamed Ben Abdellah University",
-"Siirt University",
-"Sikkim University",
-"Silesian College of Economics and Administration",
-"Silesian University",
-"Silesian University of Technology",
-"Siliwangi University",
-"Silla University",
-"Silliman University",
-"Silva Henriquez Catholic University",
-"Silver Lake College",
-"Simmons College",
-"Simon Bolivar Andine University",
-"Simon Fraser University",
-"Simop University",
-"Simpson University",
-"Sindh Madressatul Islam University",
-"Singapore Management University",
-"Single Global Currency Association - SGCA",
-"Sinhgad Institute of Management",
-"Sino-US School of International Management",
-"Siva Sivani Institute of Management",
-"Skidmore College",
-"Skive Business College",
-"Skolkovo School of Management",
-"Skovde University",
-"Skyline University College",
-"Slippery Rock University",
-"Slovak Academy of Sciences",
-"Slovak Agricultural University",
-"Slovak Economic Association",
-"Slovak Governance Institute",
-"Slovenian Association of Agricultural Economists",
-"Smith College",
-"Social Business School",
-"Social Fund for Development",
-"Social Policy and Development Centre (SPDC)",
-"Social Research and Demonstration Corporation (SRDC)",
-"Social Research and Studies Association",
-"Social Science Research Center",
-"Social Sciences Research Society",
-"Social Sciences University of Ankara",
-"Social Weather Stations",
-"Social and Economic Council",
-"Society for Agricultural Economics and Social Sciences",
-"Society for Benefit-Cost Analysis - SBCA",
-"Society for Business History",
-"Society for Computational Economics - SCE",
-"Society for Critical Economics",
-"Society for Economic Dynamics - SED",
-"Society for Economic Measurement - SEM",
-"Society for Economic Research on Copyright Issues - SERCI",
-"Society for Economic Science with Heterogeneous Interacting Agents - ESHIA",
-"Society for Economic Structural Research",
-"Society for Economic Theory - SET",
-"Society for Energy Science and Policy",
-"Society for European Business History - SEBH",
-"Society for Financial Econometrics - SoFiE",
-"Society for Financial Studies - SFS",
-"Society for Global Business and Economic Development - SGBED",
-"Society for Institutional and Organizational Economics - SIOE",
-"Society for International Development - SID",
-"Society for Law and Economics",
-"Society for Neuroeconomics",
-"Society for Nonlinear Dynamics and Econometrics - SNDE",
-"Society for Policy Modeling - SPM",
-"Society for Regional Studies",
-"Society for Social Choice and Welfare - SCW",
-"Society for the Advancement of Behavioral Economics - SABE",
-"Society for the Advancement of Economic Theory - SAET",
-"Society for the Advancement of Law and Economics",
-"Society for the Advancement of Socio-Economics - SASE",
-"Society for the Development of Austrian Economics - SDAE",
-"Society for the Economic Studies of Securities - SESS",
-"Society for the Study of Business and Finance - SSBF",
-"Society for the Study of Economic Inequality - ECINEQ",
-"Society for the Study of Social Policy - SSSP",
-"Society of Business Economists - SBE",
-"Society of Economic Geologists - SEG",
-"Society of Government Economists - SGE",
-"Society of Heterodox Economists - SHE",
-"Society of Quantitative Gastronomy - SQG",
-"Society of World Economics",
-"Socionomics Foundation",
-"Sofia University St. Kliment Ohridski",
-"Sogang University",
-"Sokoine University of Agriculture",
-"Solbridge International School of Business",
-"Solidarity Lab",
-"Solutions for the Economic System",
-"Sonderforschungsbereich/Transregio 15 Governance and the Efficiency of Economic Systems (GESY)",
-"Sonoma State University",
-"Soochow University",
-"Sookmyung Women's University",
-"Soonchunhyang University",
-"Soongsil University",
-"Sophia Group",
-"Sophia University",
-"Sophia University Institute",
-"Sopot School of Finance and Accountancy",
-"Soputh Sjælland Business College",
-"South African Institute of International Affairs",
-"South African New Economics Society - SANE",
-"South Asia Network of Economic Research Institutes (SANEI)",
-"South Asia Watch on Trade, Economics and Environment (SAWTEE)",
-"South Asian University",
-"South Carolina State University",
-"South China Agricultural University",
-"South China Normal University",
-"South East Asian Central Banks (SEACEN) Research and Training  Centre",
-"South-Ural State University",
-"Southampton Solent University",
-"Southeast Asian Regional Center for Graduate Study and Research in Agriculture (SEARCA)",
-"Southeast Missouri State University",
-"Southeast University",
-"Southeastern Louisiana University",
-"Southern Adventist University",
-"Southern African Development Community (SADC)",
-"Southern African Finance Association - SAFA",
-"Southern Agricultural Economics Association - SAEA",
-"Southern Arkansas University",
-"Southern Connecticut State University",
-"Southern Cross University",
-"Southern Economic Association - SEA",
-"Southern Federal University",
-"Southern Forest Economics Workers - SOFEW",
-"Southern Illinois University",
-"Southern Methodist University",
-"Southern Nazarene University",
-"Southern New Hampshire University",
-"Southern Oregon University",
-"Southern Regional Science Association - SRSA",
-"Southern University",
-"Southern University of Chile",
-"Southern University of Sfax",
-"Southern Utah University",
-"Southern Vermont College",
-"Southern Voice",
-"Southern Wesleyan University",
-"Southwest Minnesota State University",
-"Southwest University",
-"Southwestern Finance Association - SWFA",
-"Southwestern University",
-"Southwestern University of Finance and Economics (SWUFE)",
-"Spacial Econometrics Association - SEA",
-"Spanish Association for Accounting and Business Administration",
-"Spanish Association for Economic History",
-"Spanish Association for Labor Economics",
-"Spanish Association for Regional Science",
-"Spanish Association of Accounting University Professors",
-"Spanish Economic Association",
-"Spanish Environmental Economics Association",
-"Spanish Health Economics Association",
-"Spanish National Research Council",
-"Spanish Society for Agricultural History",
-"Spelman College",
-"Spiru Haret University",
-"Sports Economics Observatory Foundation",
-"Spring Hill College",
-"Springfield College",
-"Sri Krishnadevaraya University",
-"Sri Sri Institute of Management Studies",
-"St Mary's University, Twickenham",
-"St. Aloysius College",
-"St. Ambrose University",
-"St. Bonaventure University",
-"St. Catherine University",
-"St. Cloud State University",
-"St. Cyril and St. Methodius University of Veliko Tarnovo",
-"St. Francis College",
-"St. Francis Institute of Management and Research",
-"St. Gregory's University",
-"St. John Fisher College",
-"St. Joseph Engineering College",
-"St. Joseph's College",
-"St. Joseph's University",
-"St. Lawrence University",
-"St. Olaf College",
-"St. Petersburg State Technical University",
-"St. Petersburg State University",
-"St. Petersburg State University of Economics",
-"St. Pius V Free University",
-"St. Thomas Aquinas College",
-"St. Xavier's College",
-"Staffordshire University",
-"Stanford University",
-"Stata User Group",
-"State Agrarian University of Moldova",
-"State Bank of Pakistan",
-"State Bank of Vietnam",
-"State Higher Vocational School",
-"State University of Distance Learning",
-"State University of Haiti",
-"State University of Indonesia Sunan kalijaga Yogyakarta",
-"State University of Londrina",
-"State University of Management",
-"State University of Maringa",
-"State University of Moldova",
-"State University of New York College-Fredonia",
-"State University of New York College-Oneonta",
-"State University of New York Institute of Technology",
-"State University of New York Maritime College (SUNY)",
-"State University of New York, College at Brockport",
-"State University of New York-Albany (SUNY)",
-"State University of New York-Buffalo (SUNY)",
-"State University of New York-Cobleskill (SUNY)",
-"State University of New York-New Paltz (SUNY)",
-"State University of New York-Old Westbury (SUNY)",
-"State University of New York-Oswego (SUNY)",
-"State University of New York-Potsdam (SUNY)",
-"State University of New York-Purchase (SUNY)",
-"State University of Ponta Grossa",
-"State University of Rio Grande do Norte",
-"State University of Santa Catarina",
-"State University of Santa Cruz",
-"State University of Tetova",
-"Statistics Research Associates Limited",
-"Steinbeis University Berlin",
-"Stephen F. Austin State University",
-"Stetson University",
-"Stevens Institute of Technology",
-"Stockholm International Peace Research Institute (SIPRI)",
-"Stockholm Network",
-"Stockholm School of Economics",
-"Stockholm School of Economics in Riga (SSE Riga)",
-"Stockholm University",
-"Stonehill College",
-"Stony Brook University - SUNY",
-"Stuttgart Institute of Management and Technology (SIMT)",
-"Sukkur Institute of Business Administration",
-"Sul Ross State University",
-"Sultan Ageng Tirtasaya University",
-"Sultan Agung Islamic University",
-"Sultan Idris University of Education",
-"Sultan Qaboos University",
-"Sultan Sharif Ali Islamic University",
-"Sumy National Agrarian University",
-"Sun Yat-Sen University",
-"Sunderland University",
-"Sungkyunkwan University",
-"Sungshil Women's University",
-"Sunway University",
-"Sunyani Polytechnic",
-"Supreme Knowledge Foundation",
-"Sur University College",
-"Surabaya School of Business",
-"Surabaya State University",
-"SurveyMETER",
-"Susquehanna University",
-"Sustainability Institute",
-"Sustainable Development and Energy Economics",
-"Suwon University",
-"Swansea University",
-"Swedish Economic History Association - SEHA",
-"Swedish Entrepreneurshipforum",
-"Swedish Retail Institute",
-"Swedish University of Agricultural Sciences",
-"Sweet Briar College",
-"Swiss Association for Construction Economics",
-"Swiss Association for Energy Economics - SAEE",
-"Swiss Association for Health Economics",
-"Swiss College of Public Health",
-"Swiss Federal Institute of Technology of Lausanne",
-"Swiss Finance Institute",
-"Swiss Graduate School of Public Administration",
-"Swiss Household Panel (SHP)",
-"Swiss Management Center",
-"Swiss National Bank",
-"Swiss Society for Economics and Social Studies",
-"Swiss Society of Economics and Statistics",
-"Sybir State University of Transport",
-"Symbiosis Centre for Management and Human Resource Development (SCMHRD)",
-"Symbiosis Institute of International Business",
-"Symbiosis School of Banking Management",
-"Symbiosis School of Economics",
-"Syracuse University",
-"System Dynamics Society - SDS",
-"Szent Istvan University",
-"Süleyman Demirel University",
-"T. C. Bozok University",
-"T. J. Ryan Foundation",
-"TED University",
-"TEPP Institute for Labor Studies and Public Policies",
-"TERI University",
-"TIAA-CREF Institute",
-"Tafila Technical University",
-"Taganrog Institute of Technology",
-"Taiwan Academy of Banking and Finance",
-"Taiwan Finance Association - TFA",
-"Taiwan Institute of Economic Research",
-"Takasaki City University of Economics",
-"Takushoku University",
-"Talladega College",
-"Tallinn University of Technology",
-"Tambov State Technical University",
-"Tambov State University",
-"Tamilnadu Agricultural University",
-"Tamkang University",
-"Tampere University of Technology",
-"Tanta University",
-"Tarbiat Modarres University",
-"Tarleton State University",
-"Tarsus University",
-"Tashkent Financial Institute",
-"Tashkent State University of Economics",
-"Tata Institute of Social Sciences",
-"Tatarsky Institute for the Promotion of Business",
-"Tavricheskij National University",
-"Tax Foundation",
-"Tax Justice Network",
-"Tax Reform Australia",
-"Taylor University",
-"Taylor's University",
-"Tbilisi State University",
-"Technical State University of Quevedo",
-"Technical University Bergakademie Freiberg",
-"Technical University of Berlin",
-"Technical University of Crete",
-"Technical University of Denmark",
-"Technical University of Koszalin",
-"Technical University of Liberec",
-"Technical University of Mombasa",
-"Technical University of Munich",
-"Technical University of Sofia",
-"Technical University of Zvolen",
-"Technical University of Łódź",
-"Technichal University Delft",
-"Technichal University Eindhoven",
-"Technological Educational Institute of Athens",
-"Technological Educational Institute of Crete",
-"Technological Educational Institute of Epirus",
-"Technological Educational Institute of Kavala",
-"Technological Educational Institute of Larisa",
-"Technological Educational Institute of Peloponnese",
-"Technological Educational Institute of Western Macedonia",
-"Technological Institute of Celaya",
-"Technological Institute of Colima",
-"Technological Institute of Durango",
-"Technological Institute of Ensenada",
-"Technological Institute of Santo Domingo",
-"Technology Faculty of Guaratingueta",
-"Technology University of Belfort-Montbeliard",
-"Tel Aviv University",
-"Telkom University",
-"Temple University",
-"Tenaga Nasional University",
-"Tennessee State University",
-"Tennessee Technological University",
-"Ternopil National Economic University",
-"Texas A&M International University",
-"Texas A&M University",
-"Texas A&M University-Commerce",
-"Texas A&M University-Corpus Christi",
-"Texas A&M University-Texarkana",
-"Texas Christian University",
-"Texas Lutheran University",
-"Texas Southern University",
-"Texas State University",
-"Texas Tech University",
-"Tezpur University",
-"Thai Nguyen University of Economics and Business",
-"Thailand Development Research Institute (TDRI)",
-"Thammasat University",
-"The Black Economists Network (TBEN)",
-"The Century Foundation",
-"The Citadel",
-"The Clute Institute",
-"The College of New Jersey",
-"The Conference Board",
-"The Danish Business Academy Minerva",
-"The Economic and Social Development Organization (TESDO)",
-"The Energy and Resources Institute (TERI)",
-"The Indian Econometric Society - TIES",
-"The International Environmetrics Society - TIES",
-"The Korean-Japanese Economics & Management Association - KJEM",
-"The New School",
-"The New Zealand Initiative",
-"The People's Bank of China",
-"The Research Institute of the Finnish Economy",
-"The Vienna Institute for International Economic Studies",
-"Theoretical Research Institute",
-"Thiagarajar School of Management",
-"Thiel College",
-"Thompson Rivers University",
-"Thunderbird, The American Graduate School of International Management",
-"Thurgau Institute of Economics",
-"Tianjin University",
-"Tianjin University of Finance & Economics",
-"Tibet University",
-"Tibiscus University of Timisoara",
-"Tietgen Business College",
-"Tiffin University",
-"Tilburg University",
-"Timbro",
-"Timiryazev Agricultural Academy",
-"Timor-Leste Institute for Development Monitoring and Analysis",
-"Tipaza University Center",
-"Titu Maiorescu University",
-"Toccoa Falls College",
-"Tohoku Gakuin University",
-"Tohoku University",
-"Tokushima Economic Research Institute",
-"Tokyo Center for Economic Research (TCER)",
-"Tokyo Foundation for Policy Research",
-"Tokyo Institute of Technology",
-"Tokyo International University",
-"Tokyo University of Science",
-"Tokyo Woman's Christian University",
-"Tolani Commerce College",
-"Tomas Bata University in Zlin",
-"Tomori Pal College",
-"Tongji University",
-"Tor Vergata University of Rome",
-"Torcuato di Tella Institute",
-"Torcuato di Tella University",
-"Torino Polytechnic University",
-"Toulouse Business School",
-"Toulouse School of Economics (TSE)",
-"Touro College",
-"Toyo University",
-"Trade Policy Training Centre in Africa (TRAPCA)",
-"Trade and Industrial Policy Secretariat (TIPS)",
-"Transilvanian University",
-"Transportation and Public Utilities Group - TPUG",
-"Trecht University of Applied Sciences",
-"Trent University",
-"Trevecca Nazarene University",
-"Tri-State University",
-"Tribhuvan University",
-"Trinity College",
-"Trinity College Dublin",
-"Trinity International University",
-"Trinity University",
-"Tripura University",
-"Trisaki University",
-"Trollhattan/Uddevalla University",
-"Tropical Agricultural Research and Higher Education Center",
-"Troy University",
-"Truman State University",
-"Tshwane University of Technology",
-"Tsinghua University",
-"Tufts University",
-"Tula State University",
-"Tulane University",
-"Tunghai University",
-"Tunku Abdul Rahman University",
-"Turgut Ozal University",
-"Turkish Agricultural Economics Association",
-"Turkish American Finance Association - TAFA",
-"Turkish-German University",
-"Tuscany's Regional Institute for Economic Planning",
-"Tusculum College",
-"Twente University",
-"Tyumen State University",
-"UFJ Institute",
-"UK Association of Christian Economists - ACE",
-"UK Network of Environmental Economists - UKNEE",
-"UNICEF Office of Research Innocenti",
-"UNSW Sydney",
-"USDA Economists Group",
-"Ufuk University",
-"Uganda Management Institute",
-"Uganda Technology And Management University (UTAMU)",
-"Ukrainian National Academy of Sciences",
-"Ukrainian Productivity and Efficiency Group (UPEG)",
-"Uljanovsk State University",
-"Ulsan National Institute of Science and Technology",
-"Uludag University",
-"Union College",
-"Union Peruvian University",
-"Union University",
-"Union for Radical Political Economics - URPE",
-"Union of Scientists - Varna, Economic Sciences Section",
-"Unit Trust of India (UTI)",
-"United Arab Emirates University",
-"United International College - Bijing Normal University - Hong Kong Baptist University",
-"United Nations",
-"United Nations University",
-"United States Air Force Academy",
-"United States Association for Energy Economics - USAEE",
-"United States International University-Africa",
-"United States Naval Academy",
-"United States Society for Ecological Economics - USSEE",
-"Unity University College",
-"Univeristy of Humanities 'Zaporizhia Institute of State and Municipial Government' (ZISMG)",
-"Univeristy of Muslim Maros",
-"Universal Business School",
-"Universidad Técnica de Ambato",
-"Universiti Sultan Zainal Abidin (UNISZA)",
-"University American College",
-"University Association for Contemporary European Studies - UACES",
-"University Association for European Studies",
-"University Center of Araraquara",
-"University College Dublin",
-"University College London (UCL)",
-"University College of Management Studies",
-"University College of Maresme",
-"University College of the Cayman Islands",
-"University Foundation of America",
-"University St. Kliment Ohridski",
-"University West",
-"University for Applied Sciences for Economics and Management",
-"University for Business and Technology",
-"University for Development Studies",
-"University for Finance and Banking",
-"University of 'Kiev-Mohyla Academy'",
-"University of A Coruna",
-"University of Aalborg",
-"University of Aarhus",
-"University of Aberdeen",
-"University of Aconcagua",
-"University of Adelaide",
-"University of Agder",
-"University of Agricultural Sciences",
-"University of Agricultural Sciences and Veterinary Medecine",
-"University of Agriculture Faisalabad",
-"University of Agriculture Malaysia",
-"University of Agriculture in Cracow",
-"University of Akron",
-"University of Alabama-Birmingham",
-"University of Alabama-Huntsville",
-"University of Alabama-Tuscaloosa",
-"University of Alaska",
-"University of Alaska-Fairbanks",
-"University of Alberta",
-"University of Alcala de Henares",
-"University of Aleppo",
-"University of Algarve",
-"University of Algiers",
-"University of Alicante",
-"University of Almeria",
-"University of Amsterdam",
-"University of Anatolia",
-"University of Angers",
-"University of Ankara",
-"University of Antwerp",
-"University of Apllied Sciences",
-"University of Applied Labour Studies of the Federal Employment Agency",
-"University of Applied Sciences Aachen",
-"University of Applied Sciences Bielefeld",
-"University of Applied Sciences Bonn",
-"University of Applied Sciences Brandenburg",
-"University of Applied Sciences Burgenland",
-"University of Applied Sciences Constance",
-"University of Applied Sciences Darmstadt",
-"University of Applied Sciences Eberswalde",
-"University of Applied Sciences Emden-Leer",
-"University of Applied Sciences Erfurt",
-"University of Applied Sciences Esslingen",
-"University of Applied Sciences Frankfurt",
-"University of Applied Sciences Heidelberg",
-"University of Applied Sciences Heilbronn",
-"University of Applied Sciences Jena",
-"University of Applied Sciences Kiel",
-"University of Applied Sciences Koblenz",
-"University of Applied Sciences Lausitz",
-"University of Applied Sciences Lower Rhine",
-"University of Applied Sciences Mainz",
-"University of Applied Sciences Merseburg",
-"University of Applied Sciences Mittweida",
-"University of Applied Sciences Munich",
-"University of Applied Sciences Munster",
-"University of Applied Sciences Oldenburg",
-"University of Applied Sciences Ostwestfalen-Lippe",
-"University of Applied Sciences Reutlingen",
-"University of Applied Sciences Stralsund",
-"University of Applied Sciences TH Koeln",
-"University of Applied Sciences Trier",
-"University of Applied Sciences Westphalia",
-"University of Applied Sciences Worms",
-"University of Applied Sciences Zittau-Gorlitz",
-"University of Applied Sciences and Arts Coburg",
-"University of Applied Sciences and Arts of Southern Switzerland",
-"University of Applied Sciences for Public Administration",
-"University of Aquila",
-"University of Arid Agriculture",
-"University of Arizona",
-"University of Arkansas",
-"University of Arkansas-Fort Smith",
-"University of Arkansas-Little Rock",
-"University of Arkansas-Pine Bluff",
-"University of Artois",
-"University of Aruba",
-"University of Asia Pacific",
-"University of Asia and the Pacific",
-"University of Auckland",
-"University of Augsburg",
-"University of Aveiro",
-"University of Bacau",
-"University of Baghdad",
-"University of Bahrain",
-"University of Balamand",
-"University of Ballarat",
-"University of Balochistan",
-"University of Baltimore",
-"University of Bamberg",
-"University of Banjaluka",
-"University of Banking of the National Bank of Ukraine",
-"University of Barcelona",
-"University of Bari",
-"University of Barisal",
-"University of Basel",
-"University of Bath",
-"University of Bayreuth",
-"University of Bedfordshire",
-"University of Beira Interior",
-"University of Belgrade",
-"University of Belize",
-"University of Benghazi",
-"University of Benha",
-"University of Benin",
-"University of Bergamo",
-"University of Bergen",
-"University of Berne",
-"University of Bialymstok",
-"University of Bielefeld",
-"University of Birmingham",
-"University of Bochum",
-"University of Bologna",
-"University of Bolton",
-"University of Bonn",
-"University of Bordeaux",
-"University of Boyaca",
-"University of Bradford",
-"University of Brasilia",
-"University of Bremen",
-"University of Bridgeport",
-"University of Brighton",
-"University of Bristol",
-"University of British Columbia",
-"University of British Columbia Okanagan",
-"University of Brunei Darussalam",
-"University of Buckingham",
-"University of Buenos Aires",
-"University of Burdwan",
-"University of Burgos",
-"University of Burgundy",
-"University of Cabo Verde",
-"University of Cadiz",
-"University of Caen Lower Normandy",
-"University of Cagliari",
-"University of Calabar",
-"University of Calabria",
-"University of Calcutta",
-"University of Calgary",
-"University of California",
-"University of California-Berkeley",
-"University of California-Davis",
-"University of California-Irvine",
-"University of California-Los Angeles (UCLA)",
-"University of California-Riverside",
-"University of California-San Diego (UCSD)",
-"University of California-Santa Barbara (UCSB)",
-"University of California-Santa Cruz (UCSC)",
-"University of Camaguey",
-"University of Cambridge",
-"University of Canberra",
-"University of Cantabria",
-"University of Canterbury",
-"University of Cape Coast",
-"University of Cape Town",
-"University of Carobobo",
-"University of Carthago",
-"University of Cassino",
-"University of Castilla La Mancha",
-"University of Catania",
-"University of Cauca",
-"University of Caxias do Sul",
-"University of Central Arkansas",
-"University of Central Asia",
-"University of Central Florida",
-"University of Central Missouri",
-"University of Central Oklahoma",
-"University of Central Punjab",
-"University of Cergy-Pontoise",
-"University of Chester",
-"University of Chicago",
-"University of Chiclayo",
-"University of Chieti and Pescara",
-"University of Chile",
-"University of Chinese Academy of Sciences",
-"University of Chittagong",
-"University of Ciego de Avila",
-"University of Cienfuegos",
-"University of Cincinnati",
-"University of Cincinnati - Blue Ash",
-"University of Clermont-Auvergne",
-"University of Coimbra",
-"University of Cologne",
-"University of Colombo",
-"University of Colorado",
-"University of Colorado Denver",
-"University of Concepcion",
-"University of Connecticut",
-"University of Constantine 2",
-"University of Copenhagen",
-"University of Cordoba",
-"University of Costa Rica",
-"University of Crete",
-"University of Cruz Alta",
-"University of Cundinamarca",
-"University of Curaçao",
-"University of Customs and Finance",
-"University of Cyprus",
-"University of Dallas",
-"University of Danang",
-"University of Dar es Salaam",
-"University of Daugavpils",
-"University of Defense",
-"University of Delaware",
-"University of Delhi",
-"University of Denver",
-"University of Detroit Mercy",
-"University of Deusto",
-"University of Dhaka",
-"University of Dobrovnik",
-"University of Dortmund",
-"University of Douala",
-"University of Dschang",
-"University of Dubai",
-"University of Duisburg-Essen",
-"University of Dundee",
-"University of Dusseldorf",
-"University of East Anglia",
-"University of East London",
-"University of East Sarajevo",
-"University of Eastern Finland",
-"University of Economics",
-"University of Economics Ho Chi Minh City",
-"University of Economics Prague",
-"University of Economics and Human Sciences in Warsaw",
-"University of Economics in Bratislava",
-"University of Economy in Bydgoszcz",
-"University of Edinburgh",
-"University of El Salvador",
-"University of Eldortet",
-"University of Electronic Science and Technology of China",
-"University of Erfurt",
-"University of Erlangen-Nuremberg",
-"University of Essex",
-"University of Evora",
-"University of Exeter",
-"University of Extremadura",
-"University of Finance and Management in Bialymstok",
-"University of Finance-Marketing",
-"University of Findlay",
-"University of Flensburg",
-"University of Florence",
-"University of Florida",
-"University of Foggia",
-"University of Fort Hare",
-"University of Fortaleza",
-"University of Franche-Comte",
-"University of Freiburg",
-"University of French Polynesia",
-"University of Fribourg",
-"University of Gdansk",
-"University of Geneva",
-"University of Genoa",
-"University of Georgia",
-"University of Gezira",
-"University of Ghana",
-"University of Ghent",
-"University of Giessen",
-"University of Girona",
-"University of Glasgow",
-"University of Gondar",
-"University of Gothenburg",
-"University of Gottingen",
-"University of Granada",
-"University of Grande Rio",
-"University of Graz",
-"University of Greenwich",
-"University of Guadalajara",
-"University of Guam",
-"University of Guanajuato",
-"University of Guelph",
-"University of Guelph-Humber",
-"University of Gujrat",
-"University of Haifa",
-"University of Halle",
-"University of Hamburg",
-"University of Hannover",
-"University of Hartford",
-"University of Hawaii-Hilo",
-"University of Hawaii-Manoa",
-"University of Heidelberg",
-"University of Helsinki",
-"University of Hertfordshire",
-"University of Higher Alsace",
-"University of Hohenheim",
-"University of Hong Kong",
-"University of Houston",
-"University of Houston-Clear Lake",
-"University of Huelva",
-"University of Hull",
-"University of Hyderabad",
-"University of Hyogo",
-"University of Ibadan",
-"University of Ibague",
-"University of Iceland",
-"University of Idaho",
-"University of Illinois at Chicago",
-"University of Illinois at Springfield",
-"University of Illinois at Urbana-Champaign",
-"University of Ilorin",
-"University of Indianapolis",
-"University of Indonesia",
-"University of Information Technology and Management",
-"University of Insubria",
-"University of International Business and Economics (UIBE)",
-"University of International Students",
-"University of Iowa",
-"University of Isfahan",
-"University of Istanbul",
-"University of Izmir",
-"University of Jaen",
-"University of Jaffna",
-"University of Jena",
-"University of Johannesburg",
-"University of Jordan",
-"University of Jos",
-"University of Juba",
-"University of Jyvaskyla",
-"University of Kairouan",
-"University of Kaiserslautern",
-"University of Kalyani",
-"University of Kansas",
-"University of Kaposvar",
-"University of Kara",
-"University of Karachi",
-"University of Keele",
-"University of Kelaniya",
-"University of Kent",
-"University of Kentucky",
-"University of Kerala",
-"University of Khartoum",
-"University of Kiel",
-"University of Kinshasa",
-"University of Kisangani",
-"University of Kitakyushu",
-"University of Koblenz-Landau",
-"University of Kurdistan",
-"University of KwaZulu-Natal",
-"University of La Habana",
-"University of La Laguna",
-"University of La Salle",
-"University of Labour and Social Affairs",
-"University of Lagos",
-"University of Lahore",
-"University of Lahore City Campus",
-"University of Lausanne",
-"University of Leeds",
-"University of Leiden",
-"University of Leipzig",
-"University of Leon",
-"University of Leuven",
-"University of Liberal Arts Bangladesh",
-"University of Liechtenstein",
-"University of Liege",
-"University of Lille",
-"University of Lima",
-"University of Limerick",
-"University of Limoges",
-"University of Limpopo",
-"University of Lincoln",
-"University of Linz",
-"University of Lisbon",
-"University of Ljubljana",
-"University of Lleida",
-"University of Lodz",
-"University of Lorraine",
-"University of Louisiana",
-"University of Lubumbashi",
-"University of Lucerne",
-"University of Lucknow",
-"University of Lugano",
-"University of Luxembourg",
-"University of Lyon",
-"University of Macau",
-"University of Macedonia",
-"University of Macerata",
-"University of Madeira",
-"University of Madras",
-"University of Maine",
-"University of Maine-Fort Kent",
-"University of Mainz",
-"University of Malaga",
-"University of Malawi",
-"University of Malaya",
-"University of Malta",
-"University of Management and Economics KPC",
-"University of Management and Technology (UMT)",
-"University of Manchester",
-"University of Manitoba",
-"University of Manizales",
-"University of Mannheim",
-"University of Manouba",
-"University of Marburg",
-"University of Maribor",
-"University of Marketing and Distribution Sciences",
-"University of Mary",
-"University of Mary Hardin-Baylor",
-"University of Mary Washington",
-"University of Maryland",
-"University of Maryland Eastern Shore",
-"University of Maryland-Baltimore County",
-"University of Massachusetts-Amherst",
-"University of Massachusetts-Boston",
-"University of Massachusetts-Dartmouth",
-"University of Mauritius",
-"University of Mazandaran",
-"University of Medicine and Dentistry of New Jersey",
-"University of Melbourne",
-"University of Memphis",
-"University of Mersin",
-"University of Miami",
-"University of Michigan",
-"University of Michigan-Dearborn",
-"University of Michigan-Flint",
-"University of Milan",
-"University of Milan-Bicocca",
-"University of Minho",
-"University of Minnesota",
-"University of Minnesota-Crookston",
-"University of Minnesota-Duluth",
-"University of Minnesota-St. Paul",
-"University of Mississippi",
-"University of Missouri",
-"University of Missouri-Kansas City",
-"University of Missouri-St. Louis",
-"University of Mobile",
-"University of Modena and Reggio Emilia",
-"University of Molise",
-"University of Moncton",
-"University of Montana",
-"University of Montana Western",
-"University of Montenegro",
-"University of Monterrey",
-"University of Montevideo",
-"University of Montpellier",
-"University of Montreal",
-"University of Mostar",
-"University of Mount Union",
-"University of Mumbai",
-"University of Munich",
-"University of Munster",
-"University of Murcia",
-"University of Mysore",
-"University of Nairobi",
-"University of Namibia",
-"University of Namur",
-"University of Nantes",
-"University of National and World Economy",
-"University of Natural Resources and Applied Life Sciences",
-"University of Natural Sciences and Humanities",
-"University of Navarra",
-"University of Nebraska",
-"University of Nebraska-Kearney",
-"University of Nebraska-Omaha",
-"University of Neuchatel",
-"University of Nevada-Las Vegas",
-"University of Nevada-Reno",
-"University of Nevsehir Haci Bektas",
-"University of New Brunswick",
-"University of New England",
-"University of New Hampshire",
-"University of New Haven",
-"University of New Mexico",
-"University of New Orleans",
-"University of Newcastle",
-"University of Ngaoundere",
-"University of Nice Sophia Antipolis",
-"University of Nigeria Nsukka",
-"University of Niigata Prefecture",
-"University of North Carolina-Chapel-Hill",
-"University of North Carolina-Greensboro",
-"University of North Carolina-Wilmington",
-"University of North Dakota",
-"University of North Florida",
-"University of North Sumatra",
-"University of North Texas",
-"University of Northern British Columbia",
-"University of Northern Iowa",
-"University of Northumbria",
-"University of Northwest Ohio",
-"University of Notre Dame",
-"University of Notre Dame Australia",
-"University of Nottingham",
-"University of Nouakchott",
-"University of Novi Sad",
-"University of Oklahoma",
-"University of Oldenburg",
-"University of Ontario Institute of Technology",
-"University of Oradea",
-"University of Oregon",
-"University of Orleans",
-"University of Oslo",
-"University of Osnabruck",
-"University of Otago",
-"University of Ouagadougou 2",
-"University of Oulu",
-"University of Oviedo",
-"University of Padua",
-"University of Palermo",
-"University of Pannonia",
-"University of Papua",
-"University of Pardubice",
-"University of Paris 1",
-"University of Paris 2",
-"University of Paris 5",
-"University of Paris 6",
-"University of Paris 7",
-"University of Paris 8",
-"University of Paris 9",
-"University of Paris-13",
-"University of Paris-East",
-"University of Paris-Nanterre",
-"University of Paris-South",
-"University of Parma",
-"University of Passau",
-"University of Passo Fundo",
-"University of Patras",
-"University of Pavia",
-"University of Pecs",
-"University of Peloponnese",
-"University of Pennsylvania",
-"University of Peradeniya",
-"University of Pereslavl",
-"University of Perpignan",
-"University of Perugia",
-"University of Peshawar",
-"University of Petra",
-"University of Petrosani",
-"University of Physical Education",
-"University of Picardy",
-"University of Pinar del Rio",
-"University of Piraeus",
-"University of Pisa",
-"University of Pitesti",
-"University of Pittsburgh",
-"University of Piura",
-"University of Plovdiv",
-"University of Plymouth",
-"University of Poitiers",
-"University of Port Elizabeth",
-"University of Port Harcourt",
-"University of Portland",
-"University of Porto",
-"University of Portsmouth",
-"University of Potsdam",
-"University of Pretoria",
-"University of Primorska",
-"University of Pristina",
-"University of Professional Studies Accra",
-"University of Puerto Rico",
-"University of Puget Sound",
-"University of Pune",
-"University of Qatar",
-"University of Quebec in Montreal",
-"University of Quebec in Outaouais",
-"University of Quebec in Rimouski",
-"University of Quebec in Trois-Rivieres",
-"University of Queensland",
-"University of Quindio",
-"University of Quintana Roo",
-"University of Quy Nhon",
-"University of Rajshahi",
-"University of Reading",
-"University of Redlands",
-"University of Regensburg",
-"University of Regina",
-"University of Reims Champagne-Ardenne",
-"University of Rennes 1",
-"University of Reunion",
-"University of Rhode Island",
-"University of Rijeka",
-"University of Rio Grande",
-"University of Rochester",
-"University of Roehampton",
-"University of Rome Tre",
-"University of Roskilde",
-"University of Rostock",
-"University of Rouen",
-"University of Rousse",
-"University of Ruhuna",
-"University of Rwanda",
-"University of Saarland",
-"University of Saint Francis",
-"University of Saint Mary",
-"University of Sakarya",
-"University of Salamanca",
-"University of Salento",
-"University of Salerno",
-"University of San Carlos",
-"University of San Francisco",
-"University of Sannio",
-"University of Santander",
-"University of Santiago de Chile",
-"University of Santiago de Compostela",
-"University of Santo Thomas",
-"University of Sao Paulo",
-"University of Sarabaya",
-"University of Sarajevo",
-"University of Saskatchewan",
-"University of Sassari",
-"University of Science Malaysia",
-"University of Science and Arts of Oklahoma",
-"University of Science and Technology Beijing",
-"University of Science and Technology of China",
-"University of Scranton",
-"University of Seoul",
-"University of Seville",
-"University of Shahid Beheshti",
-"University of Sharjah",
-"University of Sheffield",
-"University of Sherbrooke",
-"University of Siegen",
-"University of Siena",
-"University of Silesia",
-"University of Sindh",
-"University of Sioux Falls",
-"University of Sistan and Baluchestan",
-"University of Sopron",
-"University of Sousse",
-"University of South Africa (UNISA)",
-"University of South Alabama",
-"University of South Australia",
-"University of South Bohemia",
-"University of South Carolina",
-"University of South Carolina Upstate",
-"University of South Carolina-Sumter",
-"University of South Dakota",
-"University of South Eastern Norway",
-"University of South Florida",
-"University of South Wales",
-"University of Southeastern Philippines",
-"University of Southern California",
-"University of Southern Denmark",
-"University of Southern Indiana",
-"University of Southern Mississippi",
-"University of Southern Queensland",
-"University of Split",
-"University of Sri Jayewardenepura",
-"University of St. Andrews",
-"University of St. Gallen",
-"University of St. Thomas",
-"University of Stavanger",
-"University of Stellenbosch",
-"University of Stirling",
-"University of Strasbourg",
-"University of Strathclyde",
-"University of Stuttgart",
-"University of Sulaimani",
-"University of Surabaya",
-"University of Surrey",
-"University of Sussex",
-"University of Swaziland",
-"University of Sydney",
-"University of Szczecin",
-"University of Szeged",
-"University of Tabriz",
-"University of Talca",
-"University of Tampa",
-"University of Tampere",
-"University of Tartu",
-"University of Tasmania",
-"University of Taubate",
-"University of Technology Sydney",
-"University of Teesside",
-"University of Tehran",
-"University of Tennessee-Knoxville",
-"University of Tennessee-Martin",
-"University of Teramo",
-"University of Texas of the Permian Basin",
-"University of Texas-Arlington",
-"University of Texas-Austin",
-"University of Texas-Dallas",
-"University of Texas-El Paso",
-"University of Texas-Rio Grande Valley",
-"University of Texas-San Antonio",
-"University of Texas-School of Public Health",
-"University of Texas-Tyler",
-"University of Tirana",
-"University of Tishreen",
-"University of Tokyo",
-"University of Tolima",
-"University of Toronto",
-"University of Toulon and Var",
-"University of Tourism and Management",
-"University of Tras-os-Montes and Alto Douro",
-"University of Trento",
-"University of Trier",
-"University of Trieste",
-"University of Tsukuba",
-"University of Tuebingen",
-"University of Tunis",
-"University of Tunis Carthago",
-"University of Tunis El Manar",
-"University of Turin",
-"University of Turku",
-"University of Tuscia",
-"University of Udayana",
-"University of Udine",
-"University of Ulm",
-"University of Ulster",
-"University of Uppsala",
-"University of Urbino",
-"University of Utah",
-"University of Utrecht",
-"University of Uyo",
-"University of Vaasa",
-"University of Valencia",
-"University of Valenciennes and Hainaut-Cambresis",
-"University of Valladolid",
-"University of Valle",
-"University of Valparaiso",
-"University of Venda",
-"University of Vermont",
-"University of Versailles and Saint-Quentin-en-Yvelines",
-"University of Victoria",
-"University of Vienna",
-"University of Vigo",
-"University of Virginia",
-"University of Vlora Ismail Qemali",
-"University of Waikato",
-"University of Warsaw",
-"University of Warwick",
-"University of Washington",
-"University of Washington-Bothell",
-"University of Washington-Tacoma",
-"University of Waterloo",
-"University of West Alabama",
-"University of West Florida",
-"University of West Georgia",
-"University of Western Australia",
-"University of Western Brittany",
-"University of Western Greece",
-"University of Western Ontario",
-"University of Westminster",
-"University of Windsor",
-"University of Winnipeg",
-"University of Wisconsin",
-"University of Wisconsin-Eau Claire",
-"University of Wisconsin-Green Bay",
-"University of Wisconsin-La Crosse",
-"University of Wisconsin-Madison",
-"University of Wisconsin-Oshkosh",
-"University of Wisconsin-River Falls",
-"University of Wisconsin-Stevens Point",
-"University of Wisconsin-Superior",
-"University of Wisconsin-Whitewater",
-"University of Wollongong in Dubai",
-"University of Wolverhampton",
-"University of Worcester",
-"University of World Economy and Diplomacy",
-"University of Wroclaw",
-"University of Wuppertal",
-"University of Wurzburg",
-"University of Wyoming",
-"University of York",
-"University of Zadar",
-"University of Zagreb",
-"University of Zambia",
-"University of Zaragoza",
-"University of Zielona Gora",
-"University of Zimbabwe",
-"University of Zulia",
-"University of Zululand",
-"University of Zurich",
-"University of la Salle",
-"University of las Palmas de Gran Canaria",
-"University of the Aegean",
-"University of the Americas",
-"University of the Andes",
-"University of the Antilles",
-"University of the Aosta Valley",
-"University of the Argentinian Social Museum",
-"University of the Azores",
-"University of the Balearic Islands",
-"University of the Basque Country",
-"University of the Campanha Region",
-"University of the District of Columbia",
-"University of the East",
-"University of the Faroe Islands",
-"University of the Federal Army",
-"University of the Free State",
-"University of the Great Colombia",
-"University of the Incarnate Word",
-"University of the La Plata Basin",
-"University of the Latin-American Education Center",
-"University of the North",
-"University of the Ozarks",
-"University of the Pacific",
-"University of the Philippines at Diliman",
-"University of the Philippines at Los Baños",
-"University of the Punjab",
-"University of the Republic",
-"University of the Republic of San Marino",
-"University of the Sabana",
-"University of the South",
-"University of the South Pacific",
-"University of the South of Santa Catarina",
-"University of the Thai Chamber of Commerce",
-"University of the Turkish Aeronautical Association",
-"University of the West Indies",
-"University of the West of England",
-"University of the West of Scotland",
-"University of the Western Cape",
-"University of the Witwatersrand",
-"Université Senghor",
-"Université d'Antananarivo",
-"Université d'Ottawa / University of Ottawa",
-"Université de Toamasina",
-"Univerzitet Donja Gorica",
-"Ural Federal University",
-"Ural State Mining University",
-"Ural State Technical University",
-"Ural State University",
-"Ural State University of Economics",
-"Ural State Woods Academy",
-"Urban Economic Research Institute (UERI)",
-"Urban Economics Association - UEA",
-"Urban Research Institute",
-"Urgench State University",
-"Ursinus College",
-"Ursuline College",
-"Uruguay College of Accountants and Economists",
-"Uruguay Interdisciplinary Center for Development Studies",
-"Utah State University",
-"Utah Valley University",
-"Utica College",
-"V. V. Giri National Labour Institute",
-"VSB-Technical University Ostrava",
-"VTT Technical Research Centre of Finland",
-"VU University Amsterdam",
-"Valahia University",
-"Valdosta State University",
-"Valencian Institute of Economic Research",
-"Vanderbilt University",
-"Vanguard University of Southern California",
-"Vanier College",
-"Varna Free University",
-"Varna University of Management",
-"Vasconcelos University",
-"Vasile Goldis Western University",
-"Vasyl Stefanyk Precarpathian National University",
-"Veer Narmad South Gujarat University",
-"Vejle Business College",
-"Vellore Institute of Technology (VIT University)",
-"Veneto Institute of Economic and Social Research",
-"Ventspils University College",
-"Veracruzan University",
-"Viadrina Europe University of Frankfurt",
-"Vianna Junior Institute",
-"Viborg Business College",
-"Victoria University",
-"Victoria University of Wellington",
-"Victory University",
-"Vienna Graduate School of Economics",
-"Vienna Graduate School of Finance",
-"Vienna University of Technology",
-"Vietnam Academy of Social Sciences",
-"Vietnam Center of Research in Economics, Management and Environment (VCREME)",
-"Vietnam German University",
-"Vietnam Institute for Economics and Policy Research",
-"Vietnam Institute of Economics",
-"Vietnam Maritime University",
-"Vietnam National University",
-"Vietnam National University (VNU)",
-"Vietnam National University of Agriculture",
-"Vietnamese Economics Association - VEA",
-"Vietnamese Economics Network - VECON",
-"Villanova University",
-"Vilnius Gediminas Technical University",
-"Vilnius University",
-"Vinnitsa National Technical University",
-"Virginia Commonwealth University",
-"Virginia Polytechnic Institute and State University (Virginia Tech)",
-"Visayas State University",
-"Viseu Technology College",
-"Vistula University",
-"Visva Bharati University",
-"Vitebsk State Technological University",
-"Viterbo University",
-"Vitez University",
-"Vladimir State University",
-"Vlerick Business School",
-"Vojvodine Economists Association",
-"Volgogradsky State Technical",
-"Voorhees College",
-"Voronezh State Agricultural University",
-"Voronezh State University",
-"Vytautas Magnus University",
-"W.E. Upjohn Institute for Employment Research",
-"WU Vienna University of Economics and Business",
-"Wabash College",
-"Wageningen University and Research Center",
-"Wagner College",
-"Wakayama University",
-"Wake Forest University",
-"Wako University",
-"Walter Eucken Insitute",
-"Walter Sisulu University",
-"Warner Pacific College",
-"Warner Southern College",
-"Warsaw School of Economics",
-"Warsaw University of Life Sciences",
-"Wartburg College",
-"Waseda University",
-"Washburn University",
-"Washington Area Finance Association - WAFA",
-"Washington Center for Equitable Growth",
-"Washington College",
-"Washington Institute for Policy Studies",
-"Washington State University",
-"Washington State University-Tri-Cities",
-"Washington University in St. Louis",
-"Washington and Jefferson College",
-"Washington and Lee University",
-"Wast Asia - North Africa (WANA) Institute",
-"Wayland Baptist University",
-"Wayne State College",
-"Wayne State University",
-"Waynesburg University",
-"Weber State University",
-"Webster University",
-"Welingkar Institute of Management Development and Research",
-"Welsh Health Economist Group - WHEG",
-"Wesleyan University",
-"West African Science Service Center on Climate Change and Adapted Land Use (WASCAL)",
-"West End University College",
-"West Texas A&M University",
-"West Virginia State University",
-"West Virginia University",
-"West Virginia University-Parkersburg",
-"West Virginia Wesleyan College",
-"Western African Monetary Institute",
-"Western Carolina University",
-"Western Connecticut State University",
-"Western Finance Association -WFA",
-"Western Illinois University",
-"Western Kentucky University",
-"Western Michigan University",
-"Western New Mexico University",
-"Western Risk and Insurance Association - WRIA",
-"Western University",
-"Western University Center",
-"Western Washington University",
-"Westfield State College",
-"Westminster College",
-"Westminster International University in Tashkent",
-"Wheeling Jesuit University",
-"Whitman College",
-"Whittier College",
-"Whitworth College",
-"Wichita State University",
-"Widener University",
-"Widya Mandala Catholic University",
-"Widyagama University",
-"Wiley College",
-"Wilfrid Laurier University",
-"William Carey College",
-"William Jewell College",
-"William Paterson University",
-"William Penn University",
-"Williams College",
-"Wilmington College",
-"Wilmington University",
-"Wingate University",
-"Winona State University",
-"Winston-Salem State University",
-"Winthrop University",
-"Wofford College",
-"Wolaita Sodo University",
-"Wolkite University",
-"Wollega University",
-"Women's Christian College",
-"Worcester Polytechnic Institute",
-"Work Pensions and Labour Economics Study Group - WPEG",
-"Workforce Intelligence Network",
-"Workgroup on Computational Economics at Technical Universities",
-"World Bank",
-"World Bank Group",
-"World Dialogue on Regulation for Network Economies (WDR)",
-"World Economic Forum (WEF)",
-"World Economics Association - WEA",
-"World Economics Society",
-"World Federation of Exchanges",
-"World Inequality Lab",
-"World Psychiatric Association, Section on Mental Health Economics - WPA",
-"World Resources Institute",
-"World Society of Socio-Economics, Spanish Chapter",
-"World Trade Organization (WTO)",
-"Wright State University",
-"Wroclaw University of Economics",
-"Wroclaw University of Science and Technology",
-"Wuhan University",
-"Wuhan University of Technology",
-"Wuyi University",
-"Xavier Institute of Management",
-"Xavier Institute of Management and  Research (XIMR)",
-"Xavier Institute of Management and Entrepreneurship (XIME)",
-"Xavier Labour Relations Institute (XLRI)",
-"Xavier University",
-"Xavier University Bhubaneswar",
-"Xavier University of Louisiana",
-"Xi'an Jiaotong University",
-"Xi'an Jiaotong-Liverpool University (XJTLU)",
-"Xi'an University of Technology",
-"Xiamen University",
-"Xiangtan University",
-"Xidian University",
-"Xuchang University",
-"Yaba College of Technology",
-"Yahia Fares University of Medea",
-"Yale University",
-"Yalova University",
-"Yamaguchi University",
-"Yamanashi Prefectural University",
-"Yankee Institute for Public Policy",
-"Yanshan University",
-"Yantai University",
-"Yaroslavl State Technical University",
-"Yaroslavl State University",
-"Yarsi University",
-"Yasar University",
-"Yazd University",
-"Yerevan State University",
-"Yerevan University of Haybusak",
-"Yeshiva University",
-"Yeungnam University",
-"Yobe State University",
-"Yokohama National University",
-"Yonsei University",
-"York College",
-"York College of Pennsylvania",
-"York University",
-"Youngstown State University",
-"Yuan Ze University",
-"Yuanpei University",
-"Yugorsk State University",
-"Yunnan University of Finance and Economics",
-"Yuzuncu Yil University",
-"Zagazig University",
-"Zagreb School of Economics and Management",
-"Zambia Institute for Policy Analysis and Research (ZIPAR)",
-"Zaporizhzhya Institute of Economics and Information Technologies",
-"Zaporizhzhya National University",
-"Zayed University",
-"ZenTra - Center for Transnational Studies",
-"Zeppelin University",
-"Zhaoqing University",
-"Zhejiang Gongshang University",
-"Zhejiang University",
-"Zhejiang University of Finance and Economics",
-"Zhejiang University of Technology",
-"Zhengzhou University",
-"Zhezkazgan Baikonurov University",
-"Zhongnan University of Economics and Law",
-"Zimbabwe Economic Policy Analysis and Research Unit (ZEPARU)",
-"Zimbabwe Open University",
-"Zirve University",
-"Zonguldak Karaelmas University",
-"Zurich University of Applied Sciences",
-"`Atenisi University",
-"briq Institute on Behavior and Inequality",
-"national University of the North-East",
-"university of Marne La Vallee",
-"university of kassel",
-"von Mises Institute Europe",
-"École des Hautes Études en Sciences Sociales (EHESS)",
-"Østfold University College"
-]
-
-const SUGGESTIONS_JEL = [
-// French
-"Économie générale et enseignement",
-"Économie générale: généralités",
-"Rôle de l'économie; Rôle des économistes; Marché pour les économistes",
-"Relation de l'économie à d'autres disciplines",
-"Relation de l'économie aux valeurs sociales",
-"Sociologie de l'économie",
-"Économie générale: autre",
-"Éducation économique et enseignement de l'économie: généralités",
-"Éducation économique et enseignement de l'économie: pré-universitaire",
-"Éducation économique et Enseignement de l'économie: premier cycle",
-"Education économique et enseignement de l'économie: diplômé",
-"Education économique et enseignement de l'économie: autre",
-"Travaux collectifs: généralités",
-"Écrits collectés d'individus",
-"Volumes collectifs",
-"Manuels",
-"Travaux collectifs: Autre",
-"Histoire de la pensée économique, méthodologie , et approches hétérodoxes",
-"Histoire de la pensée économique jusqu'en 1925: généralités",
-"Histoire de la pensée économique: préclassique (ancienne, médiévale, mercantiliste, physiocratique)",
-"Histoire de la pensée économique: classique (inclut Adam Smith)",
-"Histoire de la pensée économique: néoclassique jusqu'en 1925 (Autrichien, Marshallien, Walrasien, Wicksellien)",
-"Histoire de la pensée économique jusqu'en 1925: socialiste; Marxiste",
-"Histoire de la pensée économique jusqu'en 1925: historique; Institutionnel; Évolutionnaire",
-"Histoire de la pensée économique jusqu'en 1925: Quantitative et mathématique",
-"Histoire de la pensée économique jusqu'en 1925: Commerce international et finance",
-"Histoire de la pensée économique jusqu'en 1925: Autre",
-"Histoire de la pensée économique depuis 1925: Généralités",
-"Histoire de la pensée économique: Microéconomie",
-"Histoire de la pensée économique: Macroéconomie",
-"Histoire de la pensée économique: quantitative et mathématique",
-"Histoire de la pensée économique depuis 1925: socialiste; Marxiste; Sraffian",
-"Histoire de la pensée économique depuis 1925: historique; Institutionnel; Évolutionniste; Autrichien; École de Stockholm",
-"Histoire de la pensée économique depuis 1925: Économie financière",
-"Histoire de la pensée économique depuis 1925: Commerce international et finances",
-"Histoire de la pensée économique depuis 1925: Autre",
-"Histoire de la pensée économique: Individus: généralités",
-"Histoire de la pensée économique: Individus",
-"Nécrologie",
-"Méthodologie économique: généralités",
-"Méthodologie économique",
-"Méthodologie économique: Autre",
-"Approches hétérodoxes actuelles: généralités",
-"Approches hétérodoxes actuelles: socialiste; Marxien; Sraffian",
-"Approches hétérodoxes actuelles: historique; Institutionnel; Évolutionniste; Théorie monétaire moderne †",
-"Approches hétérodoxes actuelles: autrichienne",
-"Économie féministe",
-"Économie sociale",
-"Approches hétérodoxes actuelles: Autres",
-"Méthodes mathématiques et quantitatives: générales",
-"Économétrie",
-"Méthodes mathématiques",
-"Méthodes et méthodologie économétriques et statistiques: généralités",
-"Analyse bayésienne: généralités",
-"Hypothèse Essais: généralités",
-"Estimation: généralités",
-"Méthodes semi-paramétriques et non paramétriques: généralités",
-"Méthodes de simulation statistique: généralités",
-"Questions méthodologiques: généralités",
-"Méthodes économétriques et statistiques: Autre",
-"Modèles à équation unique; Variables simples: généralités",
-"Modèles à équation unique; Variables uniques: modèles en coupe transversale; Modèles spatiaux; Modèles d'effets de traitement; Régressions quantiles",
-"Modèles à équation unique; Variables uniques: modèles de séries chronologiques; Régressions quantiles dynamiques; Modèles d'effet de traitement dynamique; Processus de diffusion",
-"Modèles à équation unique; Variables uniques: modèles de données de panneau; Modèles spatio-temporels",
-"Modèles à équation unique; Variables uniques: modèles tronqués et censurés; Changement de modèles de régression; Modèles de régression à seuil",
-"Modèles à équation unique; Variables uniques: régression discrète et modèles de choix qualitatifs; Régresseurs discrets; Proportions; Probabilités",
-"Modèles à équation unique: Variables uniques: Estimation des variables instrumentales (IV)",
-"Modèles à équation unique; Variables simples: autres",
-"Modèles d'équations multiples ou simultanées; Variables multiples: généralités",
-"Modèles d'équations multiples ou simultanées: modèles en coupe transversale; Modèles spatiaux; Modèles d'effets de traitement; Régressions quantiles; Modèles d'interaction sociale",
-"Modèles d'équations multiples ou simultanées: modèles de séries chronologiques; Régressions quantiles dynamiques; Modèles d'effet de traitement dynamique; Processus de diffusion; Modèles d'espace d'état",
-"Modèles d'équations multiples ou simultanés: modèles de données de panneau; Modèles spatio-temporels",
-"Modèles à équations multiples ou simultanées: modèles tronqués et censurés; Changement de modèles de régression",
-"Modèles d'équations multiples ou simultanées: modèles de régression discrète et de choix qualitatif; Régresseurs discrets; Proportions",
-"Modèles d'équations multiples ou simultanées: Estimation des variables instrumentales (IV)",
-"Modèles d'équations multiples ou simultanées: méthodes de classification; L'analyse par grappes; Composants principaux; Modèles à facteurs",
-"Modèles à équations multiples ou simultanées; Variables multiples: Autres",
-"Méthodes économétriques et statistiques: Thèmes spéciaux: généralités",
-"Analyse de la durée; Stratégies de synchronisation optimales",
-"Classification abandonnée 2008. Voir C83.",
-"Numéros d'index et agrégation; Indicateurs avancés",
-"Recherche opérationnelle; Théorie de la décision statistique",
-"Réseaux de neurones et sujets connexes",
-"Distributions spécifiques; Statistiques spécifiques",
-"Méthodes économétriques et statistiques: Thèmes spéciaux: Autres",
-"Modélisation économétrique: généralités",
-"Construction et estimation de modèles",
-"Évaluation, validation et sélection de modèles",
-"Modèles de prévision; Méthodes de simulation",
-"Modélisation quantitative des politiques",
-"Grands ensembles de données: modélisation et analyse",
-"Économétrie des jeux et des enchères",
-"Économétrie financière",
-"Modélisation économétrique: autres",
-"Méthodes mathématiques; Modèles de programmation; Modélisation Mathématique et Simulation: généralités",
-"Techniques d'optimisation; Modèles de programmation; Analyse dynamique",
-"Conditions d'équilibre d'existence et de stabilité",
-"Techniques de calcul; Modélisation de simulation",
-"Outils mathématiques divers",
-"Modèles d'entrée-sortie",
-"Modèles d'équilibre général calculables",
-"Méthodes mathématiques; Modèles de programmation; Modélisation mathématique et de simulation: Autre",
-"Théorie des jeux et théorie de la négociation: généralités",
-"Jeux coopératifs",
-"Jeux non coopératifs",
-"Jeux stochastiques et dynamiques; Jeux évolutifs; Jeux répétés",
-"Théorie de la négociation; Théorie de l'appariement",
-"Théorie des jeux et théorie de la négociation: Autre",
-"Méthodologie de collecte et d'estimation des données; Programmes informatiques: généralités",
-"Méthodologie de collecte, d'estimation et d'organisation des données microéconomiques; Accès aux données",
-"Méthodologie de collecte, d'estimation et d'organisation des données macroéconomiques; Accès aux données",
-"Méthodes d'enquête; Méthodes d'échantillonnage",
-"Logiciel économétrique",
-"Méthodologie de collecte et d'estimation des données; Programmes informatiques: Autres logiciels informatiques",
-"Méthodologie de collecte et d'estimation des données; Programmes informatiques: Autre",
-"Conception d'expériences: généralités",
-"Conception d'expériences: Laboratoire, Individuel",
-"Conception d'expériences: Laboratoire, Comportement de groupe",
-"Expériences sur le terrain",
-"Conception d'expériences: Autre",
-"Microéconomie: généralités",
-"Comportement microéconomique: Principes sous-jacents",
-"Institutions: Conception , Formation, opérations et impact",
-"Politique microéconomique: formulation, mise en œuvre et évaluation",
-"Comportement des ménages: généralités",
-"Économie de la consommation: théorie",
-"Économie de la consommation: analyse empirique",
-"Production des ménages et allocation intra-ménage",
-"Épargne des ménages; Finances personnelles",
-"Choix intertemporel des ménages; Modèles de cycle de vie et épargne",
-"Consommation collaborative",
-"Protection des consommateurs",
-"Comportement des ménages et économie de la famille: Autre",
-"Production et organisations: généralités",
-"Comportement de l'entreprise: théorie",
-"Comportement de l'entreprise: analyse empirique",
-"Comportement organisationnel; Coûts de transaction; Droits de propriété",
-"Production; Coût; Capitale; Capital, productivité totale des facteurs et productivité multifactorielle; Capacité",
-"Choix d'entreprise intertemporel: investissement, capacité et financement",
-"Entreprises participatives",
-"Production et organisations: autres",
-"Distribution: généralités",
-"Revenu personnel, richesse et leurs distributions",
-"Distribution du revenu des facteurs",
-"Distribution: autre",
-"Structure du marché, prix, et conception: généralités",
-"Structure du marché, tarification et conception: concurrence parfaite",
-"Structure du marché, tarification et conception: monopole",
-"Structure du marché, tarification et conception: Oligopole et autres formes d'imperfection du marché",
-"Enchères",
-"Rationnement; Licences",
-"Théorie de la valeur",
-"Conception du marché",
-"Structure du marché et prix: autres",
-"Équilibre général et déséquilibre: généralités",
-"Économies d'échange et de production",
-"Marchés incomplets",
-"Équilibre général et déséquilibre: marchés financiers",
-"Équilibre général et déséquilibre: tableaux et analyse des entrées-sorties",
-"Modèles calculables et autres modèles d'équilibre général appliqués",
-"Équilibre général et déséquilibre: autres",
-"Économie du bien-être: généralités",
-"Efficacité d'allocation; Analyse coûts-avantages",
-"Externalités",
-"Équité, justice, inégalités et autres critères et mesures normatifs",
-"Altruisme; Philanthropie; Transferts intergénérationnels",
-"Économie du bien-être: Autre",
-"Analyse de la prise de décision collective: généralités",
-"Choix social; Clubs; Comités; Associations",
-"Processus politiques: recherche de rente, lobbying, élections, législatures et comportement électoral",
-"Bureaucratie; Processus administratifs dans les organisations publiques; Corruption",
-"Conflit; Résolution de conflit; Alliances; Révolutions",
-"Analyse positive de la formulation et de la mise en œuvre des politiques",
-"Analyse de la prise de décision collective: Autre",
-"Information, connaissances et incertitude: généralités",
-"Critères de prise de décision en cas de risque et d'incertitude",
-"Informations asymétriques et privées; Conception de mécanismes",
-"Recherche; Apprentissage; Information et connaissances; La communication; Croyance; Inconscience",
-"Attentes; Spéculations",
-"Formation et analyse de réseaux: Théorie",
-"Économie du contrat: Théorie",
-"Neuroéconomie",
-"Information et incertitude: Autre",
-"Économie comportementale micro-basée: généralités",
-"Économie comportementale micro-basée: Rôle et effets des facteurs psychologiques, émotionnels, sociaux et cognitifs sur la prise de décision",
-"Macroéconomie et économie monétaire: généralités",
-"Mesure et données sur le revenu national et les comptes de produits et la richesse; Comptes environnementaux",
-"Institutions et macroéconomie",
-"Modèles agrégatifs généraux: généralités",
-"Modèles agrégatifs généraux: Marxian; Sraffian; Kaleckian",
-"Modèles agrégatifs généraux: Keynes; Keynésien; Post-keynésien; Théorie monétaire moderne †",
-"Modèles agrégatifs généraux: néoclassique",
-"autrichien; Évolutionniste; Institutionnel",
-"Modèles agrégatifs généraux: Matrice de comptabilité sociale",
-"Modèles agrégatifs généraux: Prévisions et simulation: modèles et applications",
-"Modèles agrégatifs généraux: Autres",
-"Consommation, épargne, production, investissement, marchés du travail et économie informelle: généralités (comprend mesures et données)",
-"Macroéconomie: consommation; Économie; Richesse",
-"Investissement; Capitale; Capital immatériel; Capacité",
-"Macroéconomie: Production",
-"Emploi; Chômage; Les salaires; Distribution intergénérationnelle des revenus; Capital humain agrégé; Productivité agrégée du travail",
-"Répartition des revenus des facteurs agrégés",
-"Économie informelle; Économie souterraine",
-"Macroéconomie: consommation, épargne, production, emploi et investissement: prévisions et simulation: modèles et applications",
-"Consommation, épargne, production, investissement, marchés du travail et économie informelle: autres",
-"Prix, fluctuations des entreprises et cycles: généralités (comprend les mesures et les données)",
-"Niveau de prix; Inflation; Déflation",
-"Fluctuations des affaires; Cycles",
-"Prix, fluctuations des affaires et cycles: prévision et simulation: modèles et applications",
-"Prix, fluctuations des affaires et cycles: autres",
-"Monnaie et taux d'intérêt: généralités",
-"Demande de monnaie",
-"Systèmes monétaires; Normes; Régimes; Gouvernement et système monétaire; Systèmes de paiement",
-"Taux d'intérêt: détermination, structure des termes et effets",
-"Marchés financiers et macroéconomie",
-"Monnaie et taux d'intérêt: prévision et simulation: modèles et applications",
-"Monnaie et taux d'intérêt: autres",
-"Politique monétaire, banque centrale et offre de Monnaie et crédit: généralités",
-"Crédit; Multiplicateurs monétaires",
-"Politique monétaire",
-"Les banques centrales et leurs politiques",
-"Politique monétaire, banque centrale et offre de monnaie et de crédit: autres",
-"Politique macroéconomique, aspects macroéconomiques des finances publiques et perspectives générales: généralités",
-"Objectifs de la politique; Conception et cohérence des politiques; Coordination des politiques",
-"Politique budgétaire",
-"Analyse comparative ou conjointe de la politique budgétaire et monétaire; Stabilisation; Politique du Trésor",
-"Politique des revenus; Politique des prix",
-"Études d'épisodes politiques particuliers",
-"Perspectives générales et conditions",
-"Politique macroéconomique, aspects macroéconomiques des finances publiques et perspectives générales: autres",
-"Économie comportementale macroéconomique: généralités",
-"Économie comportementale macroéconomique: rôle et effets de la psychologie, de l'émotion , Facteurs sociaux et cognitifs de la macro-économie",
-"Économie internationale: généralités",
-"Perspectives mondiales",
-"Ordre économique international et intégration",
-"Commerce: généralités",
-"Modèles néoclassiques de commerce",
-"Modèles de commerce avec concurrence imparfaite et économies d'échelle; Fragmentation",
-"Politique commerciale; Organisations du commerce international",
-"Études empiriques du commerce",
-"Intégration économique",
-"Interactions entre le commerce et le marché du travail",
-"Commerce: prévisions et simulation",
-"Commerce et environnement",
-"Commerce: autre",
-"Mouvements de facteurs internationaux et affaires internationales: généralités",
-"Investissement international; Mouvements de capitaux à long terme",
-"Migration internationale",
-"Entreprises multinationales; Affaires internationales",
-"Envois de fonds",
-"Mouvements internationaux de facteurs: autres",
-"Finances internationales: généralités",
-"Change",
-"Ajustement du compte courant; Mouvements de capitaux à court terme",
-"Arrangements et institutions monétaires internationaux",
-"Problèmes de prêt et de dette internationaux",
-"Aide étrangère",
-"Aspects financiers de l'intégration économique",
-"Prévisions et simulation de la finance internationale: modèles et applications",
-"Politique financière internationale: taxe sur les transactions financières; Contrôle des capitaux",
-"Finance internationale: Autres",
-"Aspects macroéconomiques du commerce et de la finance internationaux: généralités",
-"Macroéconomie en économie ouverte",
-"Coordination et transmission des politiques internationales",
-"Croissance économique des économies ouvertes",
-"Cycles commerciaux internationaux",
-"Questions macroéconomiques des unions monétaires",
-"Aspects macroéconomiques du commerce international et Finances: prévisions et simulation: modèles et applications",
-"Aspects macroéconomiques du commerce international et des finances: autres",
-"Relations internationales, sécurité nationale et économie politique internationale: généralités",
-"Conflits internationaux; Négociations; Sanctions",
-"Sécurité nationale; Nationalisme économique",
-"Accords internationaux et respect; Organisations internationales",
-"Colonialisme; Impérialisme; Postcolonialisme",
-"Arrangements institutionnels internationaux",
-"Relations internationales et économie politique internationale: Autre",
-"Impacts économiques de la mondialisation: généralités",
-"Impacts économiques de la mondialisation: impacts microéconomiques",
-"Impacts économiques de la mondialisation: impacts macroéconomiques",
-"Impacts économiques de la mondialisation: développement économique",
-"Impacts économiques de la mondialisation : Environnement",
-"Impacts économiques de la mondialisation: Finance",
-"Impacts économiques de la mondialisation: Travail",
-"Impacts économiques de la mondialisation: Politique",
-"Impacts économiques de la mondialisation: Autre",
-"Économie financière: généralités",
-"Crises financières",
-"Marchés d'actifs et tarification",
-"Choix de portefeuille; Décisions d'investissement",
-"Actions; Titres à revenu fixe †",
-"Prix conditionnels; Prix ??des contrats à terme; prix des options",
-"Information et efficacité du marché; Études d'événements; Délit d'initié",
-"Marchés financiers internationaux",
-"Prévisions et simulation financières",
-"Marchés financiers généraux: politique et réglementation du gouvernement",
-"Marchés financiers généraux: autres",
-"Institutions et services financiers: généralités",
-"Banques; Institutions de dépôt; Institutions de microfinance; Prêts hypothécaires",
-"Assurances; Les compagnies d'assurance; Études actuarielles",
-"Fonds de pension; Institutions financières non bancaires; Instruments financiers; Investisseurs institutionnels",
-"Banque d'investissement; Capital-risque; Courtage; Agences de notation et de notation",
-"Institutions et services financiers: politique et réglementation gouvernementales",
-"Institutions et services financiers: autres",
-"Finance d'entreprise et gouvernance: généralités",
-"Budget des immobilisations; Investissements fixes et études d'inventaire; Capacité",
-"Politique de financement; Risque financier et gestion des risques; Structure du capital et de la propriété; Valeur des entreprises; Goodwill",
-"Faillite; Liquidation",
-"Fusions; Acquisitions; Restructuration; Vote; Concours de procuration; Gouvernance d'entreprise",
-"Politique de paiement",
-"Finance d'entreprise et gouvernance: Politique et réglementation gouvernementales",
-"Finance d'entreprise et gouvernance: Autre",
-"Finance comportementale: généralités",
-"Finance comportementale: Rôle et effets des facteurs psychologiques, émotionnels, sociaux et cognitifs sur la prise de décision sur les marchés financiers",
-"Financement des ménages: généralités ‡",
-"Épargne, emprunt, dette et richesse des ménages ‡",
-"Financement des ménages: Assurances ‡",
-"Financement des ménages: Littératie financière ‡",
-"Financement des ménages: Autre ‡",
-"Économie publique: généralités",
-"Structure et étendue du gouvernement: généralités",
-"Structure, portée et performance du gouvernement",
-"Gestion de crise",
-"Économie d'un domaine éminent; Expropriation; Nationalisation",
-"Structure et portée du gouvernement: Autres",
-"Fiscalité, subventions et recettes: généralités",
-"Fiscalité et subventions: efficacité; Fiscalité optimale",
-"Fiscalité et subventions: incidence",
-"Fiscalité et subventions: externalités; Effets redistributifs; Taxes et subventions environnementales",
-"Revenu personnel et autres taxes et subventions non commerciales; comprend les droits de succession et de donation",
-"Taxes commerciales et subventions, y compris les ventes et la valeur ajoutée (TVA)",
-"Évasion et évasion fiscales",
-"Fiscalité, subventions et revenus: autres sources de revenus",
-"Taxation et subventions: autres",
-"Politiques fiscales et comportement des agents économiques : généralités",
-"Politiques fiscales et comportement des agents économiques: Ménage",
-"Politiques fiscales et comportement des agents économiques: Entreprise",
-"Politiques fiscales et comportement des agents économiques: Autres",
-"Biens fournis par le public: généralités",
-"Biens publics",
-"Biens privés fournis par le public",
-"Évaluation de projet; Taux d'escompte social",
-"Biens fournis par le public: marchés mixtes",
-"Biens fournis par le public: autres",
-"Dépenses du gouvernement national et politiques connexes: généralités",
-"Dépenses du gouvernement national et santé",
-"Dépenses du gouvernement national et éducation",
-"Dépenses du gouvernement national et programmes de bien-être",
-"Dépenses du gouvernement national et connexes Politiques: infrastructures; Autres investissements publics et stock de capital",
-"Sécurité sociale et pensions publiques",
-"Sécurité nationale et guerre",
-"Dépenses du gouvernement national et politiques connexes: marchés publics",
-"Dépenses du gouvernement national et politiques connexes: Autres",
-"Budget national, déficit et dette: généralités",
-"Budget national; Systèmes budgétaires",
-"Déficit national; Excédent",
-"Dette nationale; Gestion de la dette; Dette souveraine",
-"Prévisions des budgets, des déficits et de la dette",
-"Budget national, déficit et dette: autres",
-"État et collectivités locales; Relations intergouvernementales: généralités",
-"Fiscalité, subventions et recettes de l'État et locales",
-"Budget et dépenses de l'État et des collectivités locales",
-"État et collectivités locales; Relations intergouvernementales: différentiels intergouvernementaux et leurs effets",
-"Emprunts d'État et locaux",
-"Gouvernements étatiques et locaux: santé; Éducation; Aide sociale; Pensions publiques",
-"État et collectivités locales: autres catégories de dépenses",
-"Relations intergouvernementales; Fédéralisme; Sécession",
-"État et gouvernement local; Relations intergouvernementales: Autre",
-"Économie publique: Questions diverses: généralités",
-"Prêts gouvernementaux; Garanties de prêt; Crédits; Subventions; Sauvetage",
-"Propriété gouvernementale",
-"Administration publique; Comptabilité et audits du secteur public",
-"Aide en cas de catastrophe",
-"Questions fiscales internationales; Biens publics internationaux",
-"Économie publique: Questions diverses: Autres",
-"Santé, éducation et bien-être: généralités",
-"Santé: généralités",
-"Analyse des marchés de la santé",
-"Comportement sanitaire",
-"Assurance maladie publique et privée",
-"Santé et inégalités",
-"Santé et développement économique",
-"Santé: politique gouvernementale; Régulation; Santé publique",
-"Santé: Autre",
-"Établissements d'enseignement et de recherche: généralités",
-"Analyse de l'éducation",
-"Financement de l'éducation; Aide financière",
-"Enseignement supérieur; Institutions de recherche",
-"Éducation et inégalités",
-"Éducation et développement économique",
-"Rendement de l'éducation",
-"Éducation: politique gouvernementale",
-"Éducation: autre",
-"Bien-être, bien-être et pauvreté: généralités",
-"Bien-être général; Bien-être",
-"Mesure et analyse de la pauvreté",
-"Bien-être, bien-être et pauvreté: programmes gouvernementaux; Fourniture et effets des programmes de protection sociale",
-"Bien-être, bien-être et pauvreté: autres",
-"Travail et économie démographique: généralités",
-"Économie du travail: généralités",
-"Politiques d'économie du travail",
-"Économie démographique: généralités",
-"Tendances démographiques, effets macroéconomiques et prévisions",
-"Mariage; Dissolution conjugale; Structure familiale; Abus domestique",
-"Fertilité; Planification familiale; Garde d'enfants; Les enfants; Jeunesse",
-"Économie des personnes âgées; Économie des handicapés; Discrimination non liée au marché du travail",
-"Économie des minorités, des races, des peuples autochtones et des immigrants; Discrimination non liée au travail",
-"Économie du genre; Discrimination non liée au travail",
-"Valeur de la vie; Revenu oublié",
-"Économie démographique: Politiques publiques",
-"Économie démographique: Autre",
-"Demande et offre de travail: généralités",
-"Population active et emploi, taille et structure",
-"Répartition du temps et offre de travail",
-"Demande de main-d'œuvre",
-"Capital humain; Compétences; Choix professionnel; Productivité du travail",
-"Retraite; Politiques de retraite",
-"Sécurité; Satisfaction au travail; Politiques publiques connexes",
-"Répartition du temps, comportement au travail et détermination de l'emploi: autres",
-"Salaires, rémunération et coûts de main-d'œuvre: généralités",
-"Niveau et structure des salaires; Différentiels salariaux",
-"Coûts et avantages de la main-d'œuvre non salariale; Plans de retraite; Pensions privées",
-"Paquets de compensation; Méthodes de paiement",
-"Salaires, indemnités et coûts de main-d'œuvre: Politique publique",
-"Salaires, indemnités et coûts de main-d'œuvre: Autres",
-"Marchés du travail particuliers: généralités",
-"Contrats de travail",
-"Monopsone; Marchés du travail segmentés",
-"Marchés du travail agricoles",
-"Marchés du travail professionnel; Licences professionnelles",
-"Marchés du travail du secteur public",
-"Marchés du travail informels",
-"Marchés du travail coercitifs",
-"Marchés du travail particuliers: politique publique",
-"Marchés du travail particuliers: autres",
-"Relations patronales-syndicales, syndicats et négociation collective: généralités",
-"Syndicats: objectifs, structure, et effets",
-"Règlement des différends: grèves, arbitrage et médiation; Négociation collective",
-"Relations patronales-syndicales; Jurisprudence industrielle",
-"Coopératives de producteurs; Entreprises gérées par des travailleurs; Actionnariat salarié",
-"Relations patronales-syndicales, syndicats et négociations collectives: politique publique",
-"Relations patronales-syndicales, syndicats et négociations collectives: autres",
-"Mobilité, chômage, postes vacants et travailleurs immigrés: généralités",
-"Mobilité géographique de la main-d'œuvre; Travailleurs immigrés",
-"Mobilité professionnelle, professionnelle et intergénérationnelle; Promotion",
-"Rotation de la main-d'oeuvre; Postes vacants; Mises à pied",
-"Chômage: modèles, durée, incidence et recherche d'emploi",
-"Assurance-chômage; Indemnité de licenciement; Fermetures d'usines",
-"Mobilité, chômage et postes vacants: politiques publiques",
-"Mobilité, chômage et postes vacants: autres",
-"Discrimination du travail: généralités",
-"Discrimination du travail",
-"Discrimination du travail: politique publique",
-"Discrimination du travail: autre",
-"Normes du travail: générales",
-"Normes du travail: travail Conditions",
-"Normes du travail: Composition de la main-d'oeuvre",
-"Normes du travail: Droits des travailleurs",
-"Normes du travail: Politiques publiques",
-"Normes du travail: Autres",
-"Droit et économie: généralités",
-"Domaines fondamentaux du droit: généralités (droit constitutionnel)",
-"Droit de la propriété",
-"Droit des contrats",
-"Droit de la responsabilité délictuelle et responsabilité des produits; Économie légale",
-"Droit pénal",
-"Droit civil; Common Law",
-"Droit électoral",
-"Domaines fondamentaux du droit: Autre",
-"Réglementation et droit des affaires: généralités",
-"Droit antitrust",
-"Droit des affaires et des valeurs mobilières",
-"Droit des industries réglementées et droit administratif",
-"Cyber-droit",
-"Droit immobilier",
-"Réglementation et droit des affaires: Autre",
-"Autre fond Domaines de droit: généralités",
-"Droit du travail",
-"Droit de l'énergie, de l'environnement, de la santé et de la sécurité",
-"Droit international",
-"Droit fiscal",
-"Droit des faillites personnelles",
-"Droit de la famille et des personnes",
-"Droit de l'immigration",
-"Droit des droits de l'homme; Droit de l'égalité des sexes",
-"Autres domaines de droit substantiels: Autres",
-"Procédure juridique, système juridique et comportement illégal: généralités",
-"Procédure de litige",
-"Comportement illégal et application de la loi",
-"Procédure juridique, système juridique et comportement illégal: Autre",
-"Organisation industrielle : généralités",
-"Structure du marché, stratégie d'entreprise et performance du marché: généralités",
-"Production, tarification et structure du marché; Répartition par taille des entreprises",
-"Monopole; Stratégies de monopolisation",
-"Oligopole et autres marchés imparfaits",
-"Relations transactionnelles; Contrats et réputation; Réseaux",
-"Information et qualité des produits; Standardisation et compatibilité",
-"Organisation industrielle et macroéconomie: structure industrielle et changement structurel; Indices de prix industriels",
-"Produits et marchés open source",
-"Structure du marché, stratégie de l'entreprise et performance du marché: autres",
-"Objectifs, organisation et comportement de l'entreprise: généralités",
-"Objectifs commerciaux de l'entreprise",
-"Organisation de l'entreprise et structure du marché",
-"Organisation de la production",
-"Sous-traitance ; Coentreprises; Licences technologiques",
-"Performance de l'entreprise: taille, diversification et portée",
-"Entrepreneuriat",
-"Objectifs, organisation et comportement de l'entreprise: autres",
-"Organisations à but non lucratif et entreprise publique: généralités",
-"Institutions à but non lucratif; Les ONG; Entrepreneuriat social",
-"Entreprises publiques; Entreprises publiques-privées",
-"Comparaison des entreprises publiques et privées et des institutions à but non lucratif; Privatisation; Sous-traitance",
-"Politiques publiques",
-"Organisations à but non lucratif et entreprises publiques: Autres",
-"Questions et politiques antitrust: généralités",
-"Monopolisation; Pratiques anticoncurrentielles horizontales",
-"Contraintes verticales; Imposition du prix de revente; Remises sur quantité",
-"Monopoles juridiques et réglementation ou déréglementation",
-"Politique antitrust et entreprises publiques, institutions à but non lucratif et organisations professionnelles",
-"Politique antitrust: autre",
-"Réglementation et politique industrielle: généralités",
-"Économie de la réglementation",
-"Politique industrielle; Méthodes de planification sectorielle",
-"Politique d'entreprise",
-"Réglementation et politique industrielle: autres",
-"Études de l'industrie: Fabrication: généralités",
-"Métaux et produits métalliques; Ciment; Verre; Céramiques",
-"Automobiles; Autre matériel de transport; Pièces et équipements connexes",
-"Microélectronique; Des ordinateurs; Matériel de communication",
-"Autres machines; Équipement de bureau; Armements",
-"Produits chimiques; Caoutchouc; Drogues; Biotechnologie; Plastiques",
-"Aliments; Breuvages; Produits de beauté; Le tabac; Vins et spiritueux",
-"Autres biens de consommation non durables: vêtements, textiles, chaussures et articles en cuir; Articles ménagers; Équipement de sport",
-"Appareils électroménagers; Meubles; Autres biens de consommation durables",
-"Études de l'industrie: Fabrication: Autres",
-"Études de l'industrie: Produits primaires et construction: généralités",
-"Exploitation minière, extraction et raffinage: Hydrocarbures",
-"Exploitation minière, extraction et raffinage: Autres ressources non renouvelables",
-"Produits forestiers",
-"Construction",
-"Études de l'industrie: Produits primaires et construction: Politique gouvernementale",
-"Études de l'industrie: Produits primaires et construction: autres",
-"Études de l'industrie: Services: généralités",
-"Commerce de détail et de gros; Commerce électronique",
-"Divertissement; Médias",
-"Sports; Jeux d'argent; Restaurants; Des loisirs; Tourisme",
-"Services personnels, professionnels et commerciaux",
-"Services immobiliers",
-"Services d'information et Internet; Logiciels informatiques",
-"Services postaux et de livraison",
-"Études de l'industrie: Services: Politique gouvernementale",
-"Études de l'industrie: Services: Autres",
-"Études de l'industrie: Transport et services publics: généralités",
-"Transport: généralités",
-"Chemins de fer et autres transports de surface",
-"Transport aérien",
-"Services publics d'électricité",
-"Services de gaz ; Pipelines; Services des eaux",
-"Télécommunications",
-"Services publics: généralités",
-"Études de l'industrie: Services publics et transports: Politique gouvernementale",
-"Études de l'industrie: Services publics et transports: autres",
-"Administration des affaires et économie d'entreprise; Commercialisation; Comptabilité; Économie du personnel: généralités",
-"Administration des affaires: généralités",
-"Gestion de la production",
-"Gestion du personnel; Cadres; Rémunération des cadres",
-"Nouvelles entreprises; Startups",
-"Culture d'entreprise; La diversité; Responsabilité sociale",
-"Gestion informatique",
-"Administration des affaires internationales",
-"Administration des affaires: Autre",
-"Économie des affaires: généralités",
-"Économie des affaires",
-"Économie des affaires: Autre",
-"Marketing et publicité: généralités",
-"Marketing",
-"Publicité",
-"Marketing et publicité: politique et réglementation gouvernementales",
-"Marketing et publicité : Autre",
-"Comptabilité et audit: généralités",
-"Comptabilité",
-"Audit",
-"Comptabilité et audit: politique et réglementation du gouvernement",
-"Comptabilité: autre",
-"Économie du personnel: généralités",
-"Économie du personnel: décisions d'emploi des entreprises; Promotions",
-"Économie du personnel: Méthodes de rémunération et de rémunération et leurs effets",
-"Économie du personnel: Formation",
-"Économie du personnel: Gestion du travail",
-"Économie du personnel: Dispositifs de sous-traitance du travail",
-"Économie du personnel: Autre",
-"Histoire économique: généralités",
-"Développement de la discipline: historiographique; Sources et méthodes",
-"Histoire économique: macroéconomie et économie monétaire; Structure industrielle; Croissance; Fluctuations: générales, internationales ou comparatives",
-"Histoire économique: macroéconomie et économie monétaire; Structure industrielle; Croissance; Fluctuations: États-Unis; Canada: avant 1913",
-"Histoire économique: macroéconomie et économie monétaire; Structure industrielle; Croissance; Fluctuations: États-Unis; Canada: 1913-",
-"Histoire économique: macroéconomie et économie monétaire; Structure industrielle; Croissance; Fluctuations: Europe: avant 1913",
-"Histoire économique: macroéconomie et économie monétaire; Structure industrielle; Croissance; Fluctuations: Europe: 1913-",
-"Histoire économique: macroéconomie et économie monétaire; Structure industrielle; Croissance; Fluctuations: Asie, Moyen-Orient",
-"Histoire économique: macroéconomie et économie monétaire; Structure industrielle; Croissance; Fluctuations: Amérique latine; Caraïbes",
-"Histoire économique: macroéconomie et économie monétaire; Structure industrielle; Croissance; Fluctuations: Afrique; Océanie",
-"Histoire économique: marchés et institutions financiers: général, international ou comparatif",
-"Histoire économique: marchés et institutions financiers: États-Unis; Canada: avant 1913",
-"Histoire économique: marchés et institutions financiers: États-Unis; Canada: 1913-",
-"Histoire économique: Marchés et institutions financiers: Europe: Avant 1913",
-"Histoire économique: Marchés et institutions financiers: Europe: 1913-",
-"Histoire économique: Marchés et institutions financiers: Asie, Moyen-Orient",
-"Histoire économique: Marchés financiers et institutions: Amérique latine; Caraïbes",
-"Histoire économique: marchés et institutions financiers: Afrique; Océanie",
-"Histoire économique: travail et consommateurs, démographie, éducation, santé, bien-être, revenu, richesse, religion et philanthropie: général, international ou comparatif",
-"Histoire économique: travail et consommateurs, démographie, éducation, santé, bien-être, revenu, Richesse, religion et philanthropie: États-Unis; Canada: avant 1913",
-"Histoire économique: travail et consommateurs, démographie, éducation, santé, bien-être, revenu, richesse, religion et philanthropie: États-Unis; Canada: 1913-",
-"Histoire économique: travail et consommateurs, démographie, éducation, santé, bien-être, revenu, richesse, religion et philanthropie: Europe: avant 1913",
-"Histoire économique: travail et consommateurs, démographie, éducation, santé, bien-être, Revenu, richesse, religion et philanthropie: Europe: 1913-",
-"Histoire économique: travail et consommateurs, démographie, éducation, santé, bien-être, revenu, richesse, religion et philanthropie: Asie, Moyen-Orient",
-"Histoire économique: travail et consommateurs, Démographie, éducation, santé, protection sociale, revenu, richesse, religion et philanthropie: Amérique latine; Caraïbes",
-"Histoire économique: travail et consommateurs, démographie, éducation, santé, protection sociale, revenu, richesse, religion et philanthropie: Afrique; Océanie",
-"Histoire économique: gouvernement, guerre, droit, relations internationales et réglementation: générale, internationale ou comparée",
-"Histoire économique: gouvernement, guerre, droit, relations internationales et réglementation: États-Unis; Canada: avant 1913",
-"Histoire économique: gouvernement, guerre, droit, relations internationales et réglementation: États-Unis; Canada: 1913-",
-"Histoire économique: gouvernement, guerre, droit, relations internationales et réglementation: Europe: avant 1913",
-"Histoire économique: gouvernement, guerre, droit, relations internationales et réglementation: Europe: 1913-",
-"Histoire économique: gouvernement , Guerre, droit, relations internationales et réglementation: Asie, y compris le Moyen-Orient",
-"Histoire économique: gouvernement, guerre, droit, relations internationales et réglementation: Amérique latine; Caraïbes",
-"Histoire économique: gouvernement, guerre, droit, relations internationales et réglementation: Afrique; Océanie",
-"Histoire économique: agriculture, ressources naturelles, environnement et industries extractives: général, international ou comparatif",
-"Histoire économique: agriculture, ressources naturelles, environnement et industries extractives: États-Unis; Canada: avant 1913",
-"Histoire économique: agriculture, ressources naturelles, environnement et industries extractives: États-Unis; Canada: 1913-",
-"Histoire économique: agriculture, ressources naturelles, environnement et industries extractives: Europe: avant 1913",
-"Histoire économique: agriculture, ressources naturelles, environnement et industries extractives: Europe: 1913-",
-"Histoire économique: agriculture, naturel Ressources, environnement et industries extractives: Asie, y compris le Moyen-Orient",
-"Histoire économique: agriculture, ressources naturelles, environnement et industries extractives: Amérique latine; Caraïbes",
-"Histoire économique: agriculture, ressources naturelles, environnement et industries extractives: Afrique; Océanie",
-"Histoire économique: fabrication et construction: générale, internationale ou comparée",
-"Histoire économique: fabrication et construction: États-Unis .; Canada: avant 1913",
-"Histoire économique: fabrication et construction: États-Unis; Canada: 1913-",
-"Histoire économique: Fabrication et construction: Europe: Avant 1913",
-"Histoire économique: Fabrication et construction: Europe: 1913-",
-"Histoire économique: Fabrication et construction: Asie, Moyen-Orient",
-"Histoire économique: Fabrication et construction: Latin Amérique; Caraïbes",
-"Histoire économique: Fabrication et construction: Afrique; Océanie",
-"Histoire économique: transports, commerce international et intérieur, énergie, technologie et autres services: général, international ou comparatif",
-"Histoire économique: transports, commerce, énergie, technologie et autres services: États-Unis; Canada: avant 1913",
-"Histoire économique: transports, commerce, énergie, technologie et autres services: États-Unis; Canada: 1913-",
-"Histoire économique: transports, commerce, énergie, technologie et autres services: Europe: avant 1913",
-"Histoire économique: transports, commerce, énergie, technologie et autres services: Europe: 1913-",
-"Histoire économique: transports , Commerce, énergie, technologie et autres services: Asie, y compris le Moyen-Orient",
-"Histoire économique: transports, commerce, énergie, technologie et autres services: Amérique latine; Caraïbes",
-"Histoire économique: transports, commerce, énergie, technologie et autres services: Afrique; Océanie",
-"Histoire de la micro-entreprise: générale, internationale ou comparée",
-"Histoire de la micro-entreprise: États-Unis; Canada: avant 1913",
-"Histoire de la micro-entreprise: États-Unis; Canada: 1913-",
-"Histoire de la micro-entreprise: Europe: avant 1913",
-"Histoire de la micro-entreprise: Europe: 1913-",
-"Histoire de la micro-entreprise: Asie, Moyen-Orient",
-"Histoire de la micro-entreprise: Amérique latine; Caraïbes",
-"Histoire de la micro-entreprise: Afrique; Océanie",
-"Histoire régionale et urbaine: généralités",
-"Histoire régionale et urbaine: États-Unis .; Canada: avant 1913",
-"Histoire régionale et urbaine: États-Unis; Canada: 1913-",
-"Histoire régionale et urbaine: Europe: avant 1913",
-"Histoire régionale et urbaine: Europe: 1913-",
-"Histoire régionale et urbaine: Asie, Moyen-Orient",
-"Histoire régionale et urbaine: Amérique latine; Caraïbes",
-"Histoire régionale et urbaine: Afrique; Océanie",
-"Développement économique, innovation, changement technologique et croissance",
-"Développement économique: généralités",
-"Analyses macroéconomiques du développement économique",
-"Analyses microéconomiques du développement économique",
-"Développement économique: agriculture; Ressources naturelles; Énergie; Environnement; Autres produits primaires",
-"Industrialisation; Industries de fabrication et de services; Choix de la technologie",
-"Développement économique: Ressources humaines; Développement humain; La répartition des revenus; Migration",
-"Développement économique: marchés financiers; Épargne et investissement en capital; Finance et gouvernance d'entreprise",
-"Secteurs formel et informel; Économie fantôme; Dispositions institutionnelles",
-"Développement économique: analyse urbaine, rurale, régionale et des transports; Logement; Infrastructure",
-"Liens internationaux avec le développement; Rôle des organisations internationales",
-"Planification et politique de développement: généralités",
-"Modèles de planification; Politique de planification",
-"Analyse de projet",
-"Politique budgétaire et monétaire dans le développement",
-"Planification et politique de développement: politique commerciale; Mouvement des facteurs; Politique de change",
-"Politique industrielle",
-"Planification et politique de développement: autres",
-"Innovation; Recherche et développement; Changement technologique; Droits de propriété intellectuelle: généralités",
-"Innovation et invention: processus et incitations",
-"Gestion de l'innovation technologique et de la R&D",
-"Changement technologique: choix et conséquences; Processus de diffusion",
-"Propriété intellectuelle et capital intellectuel",
-"Innovation sociale",
-"Innovation ouverte ‡",
-"Changement technologique: politique gouvernementale",
-"Changement technologique: autre",
-"Croissance économique et productivité globale: généralités",
-"Modèles de croissance à un, deux et multisectoriels",
-"Modèles de croissance monétaire",
-"Institutions et Croissance",
-"Environnement et croissance",
-"Études empiriques de la croissance économique; Productivité globale; Convergence de la production entre les pays",
-"Croissance économique et productivité globale: autres",
-"Études de pays à l'échelle de l'économie: généralités",
-"Études de pays à l'échelle de l'économie: États-Unis; Canada",
-"Études de pays à l'échelle de l'économie: Europe",
-"Études de pays à l'échelle de l'économie: Asie, Moyen-Orient",
-"Études de pays à l'échelle de l'économie: Amérique latine; Caraïbes",
-"Études de pays à l'échelle de l'économie: Afrique",
-"Études de pays à l'échelle de l'économie: Océanie",
-"Études comparatives des pays",
-"Systèmes économiques: généralités",
-"Systèmes capitalistes: généralités",
-"Systèmes capitalistes: planification, coordination et réforme",
-"Entreprises capitalistes",
-"Entreprises coopératives",
-"Systèmes capitalistes: droits de propriété",
-"Systèmes capitalistes: économie politique",
-"Systèmes capitalistes: performances et perspectives",
-"Énergie; Environnement",
-"Systèmes capitalistes: autres",
-"Systèmes socialistes et économies de transition: généralités",
-"Systèmes socialistes et économies de transition: planification, coordination et réforme",
-"Systèmes socialistes et économies de transition: prix",
-"Systèmes socialistes et économies de transition: marchés des facteurs et des produits; Études industrielles; Population",
-"Systèmes socialistes et économies de transition: revenu national, produits et dépenses; Argent; Inflation",
-"Systèmes socialistes et économies de transition: économie urbaine, rurale et régionale",
-"Systèmes socialistes et économies de transition: économie politique; Droits de propriété",
-"Systèmes socialistes et économies de transition: performances et perspectives",
-"Systèmes socialistes et économies de transition: ressources naturelles; Énergie; Environnement",
-"Systèmes socialistes et économies de transition: autres",
-"Institutions socialistes et leurs transitions: généralités",
-"Entreprises socialistes et leurs transitions",
-"Collectifs; Communes; Agriculture",
-"Institutions socialistes et leurs transitions: commerce international, finances, investissement, relations et aide",
-"Institutions socialistes et leurs transitions: économie financière",
-"Institutions socialistes et leurs transitions: économie publique",
-"Institutions socialistes et leurs transitions: économie de la consommation; Santé; Éducation et formation: bien-être, revenu, richesse et pauvreté",
-"Systèmes socialistes et économies de transition: institutions juridiques; Comportement illégal",
-"Institutions socialistes et leurs transitions: autres",
-"Autres systèmes économiques: généralités",
-"Autres systèmes économiques: planification, coordination et réforme",
-"Autres systèmes économiques: entreprises productives; Marchés des facteurs et des produits; Des prix; Population",
-"Autres systèmes économiques: économie publique; Économie financière",
-"Autres systèmes économiques: revenus, produits et dépenses nationaux; Argent; Inflation",
-"Autres systèmes économiques: commerce international, finances, investissement et aide",
-"Autres systèmes économiques: économie de la consommation; Santé; Éducation et formation; Bien-être, revenu, richesse et pauvreté",
-"Autres systèmes économiques: performances et perspectives",
-"Autres systèmes économiques: économie politique; Institutions juridiques; Droits de propriété; Ressources naturelles; Énergie; Environnement; Études régionales",
-"Autres systèmes économiques: autres",
-"Systèmes économiques comparés: généralités",
-"Analyse comparative des systèmes économiques",
-"Études comparatives d'économies particulières",
-"Systèmes économiques comparés: autres",
-"Économie agricole et des ressources naturelles; Économie environnementale et écologique: généralités",
-"Développement durable",
-"Marchés des produits de base",
-"Agriculture: généralités",
-"Agriculture: Analyse de l'offre et de la demande agrégées; Prix",
-"Micro-analyse des entreprises agricoles, des ménages agricoles et des marchés des intrants agricoles",
-"Marchés agricoles et commercialisation; Coopératives; Agro-industrie",
-"Financement agricole",
-"Propriété et régime foncier; Réforme agraire; L'utilisation des terres; Irrigation; Agriculture et environnement",
-"R&D agricole; Technologie agricole; Les biocarburants; Services de vulgarisation agricole",
-"L'agriculture dans le commerce international",
-"Politique agricole; Politique alimentaire",
-"Agriculture: Autre",
-"Ressources renouvelables et conservation: généralités",
-"Ressources renouvelables et conservation: demande et offre; Prix",
-"Ressources renouvelables et conservation: pêche; Aquaculture",
-"Ressources renouvelables et conservation: foresterie",
-"Ressources renouvelables et conservation: terres",
-"Ressources renouvelables et conservation: eau",
-"Aspects récréatifs des ressources naturelles",
-"Ressources renouvelables et conservation: enjeux du commerce international",
-"Ressources renouvelables et conservation: politique gouvernementale",
-"Ressources renouvelables et Conservation: Autres",
-"Ressources non renouvelables et conservation: généralités",
-"Ressources non renouvelables et conservation: demande et offre; Prix",
-"Ressources épuisables et développement économique",
-"Flambée des ressources",
-"Ressources naturelles et conflits nationaux et internationaux",
-"Ressources d'hydrocarbures",
-"Ressources non renouvelables et conservation: enjeux du commerce international",
-"Ressources non renouvelables et conservation: politique gouvernementale",
-"Ressources non renouvelables et conservation: autres",
-"Énergie: généralités",
-"Énergie: demande et offre; Prix",
-"Sources d'énergie alternatives",
-"Énergie et macroéconomie",
-"Prévisions énergétiques",
-"Énergie: politique gouvernementale",
-"Énergie: autre",
-"Économie environnementale: généralités",
-"Évaluation des effets environnementaux",
-"Adoption et coûts du contrôle de la pollution; Effets distributifs; Effets sur l'emploi",
-"Pollution atmosphérique; Pollution de l'eau; Bruit; Déchets dangereux; Déchets solides; Recyclage",
-"Climat; Catastrophes naturelles et leur gestion; Réchauffement climatique",
-"Économie de l'environnement: innovation technologique",
-"Environnement et développement; Environnement et commerce; Durabilité; Comptes environnementaux et comptabilité; Équité environnementale; Croissance démographique",
-"Économie écologique: services écosystémiques; Conservation de la biodiversité; Bioéconomie; Écologie industrielle",
-"Économie de l'environnement: politique gouvernementale",
-"Économie de l'environnement: autre",
-"Économie urbaine, rurale, régionale, immobilière et des transports: généralités",
-"Économie régionale générale (comprend les données régionales)",
-"Activité économique régionale: croissance, développement, questions environnementales et Changements",
-"Taille et distributions spatiales de l'activité économique régionale",
-"Analyse économique de l'équilibre général et du bien-être des économies régionales",
-"Modèles d'utilisation des terres",
-"Économie régionale générale: modèles économétriques et entrées-sorties; Autres modèles",
-"Économie régionale générale: Autre",
-"Économie urbaine, rurale, régionale, immobilière et des transports: Analyse des ménages: généralités",
-"Économie urbaine, rurale, régionale, immobilière et des transports: Demande de logement",
-"Urbain, rural, régional, réel Économie de l'immobilier et des transports: autre demande",
-"Économie urbaine, rurale, régionale, immobilière et des transports: migration régionale; Marchés du travail régionaux; Population; Caractéristiques du quartier",
-"Économie urbaine, rurale, régionale, immobilière et des transports: politique gouvernementale",
-"Économie urbaine, rurale, régionale, immobilière et des transports: analyse des ménages: autre",
-"Marchés immobiliers, analyse de la production spatiale et emplacement de l'entreprise: généralités",
-"Offre et marchés de logement",
-"Autre analyse de la production spatiale et des prix",
-"Marchés immobiliers non agricoles et non résidentiels",
-"Analyse de la production et emplacement de l'entreprise: Politique gouvernementale",
-"Marchés immobiliers, analyse de la production spatiale et emplacement de l'entreprise: Autre",
-"Économie des transports: généralités",
-"Transport: Demande, offre et congestion; Temps de voyage; Sécurité et accidents; Bruit des transports",
-"Économie des transports: analyse des investissements gouvernementaux et privés; Entretien des routes, planification des transports",
-"Économie des transports: politique et prix gouvernementaux",
-"Économie des transports: autres",
-"Analyse des administrations régionales: généralités",
-"Finances dans les économies urbaines et rurales",
-"Analyse des administrations régionales: utilisation des terres et autres réglementations",
-"Analyse de l'emplacement des installations publiques; Investissement public et stock de capital",
-"Planification et politique de développement régional",
-"Analyse des gouvernements régionaux: Autres",
-"Données: Tableaux et graphiques",
-"Matériel d'introduction",
-"Revues de livres (non classés)",
-"Thèses (non classées)",
-"Lectures complémentaires (non classées)",
-"Extrait",
-"Aucun auteur Discussions générales",
-"Disciplines connexes",
-"Catégories diverses: Autres",
-"Images et cartes",
-"Romans, livres d'auto-assistance, etc.",
-"Autres sujets spéciaux: généralités",
-"Économie culturelle; Sociologie économique; Anthropologie économique: généralités",
-"Économie culturelle: Économie des arts et de la littérature",
-"Économie culturelle: Religion",
-"Sociologie économique; Anthropologie économique; Langue; Stratification sociale et économique",
-"Économie culturelle: politiques publiques",
-"Économie culturelle: autre",
-"Économie du sport: généralités",
-"Économie du sport: études de l'industrie",
-"Économie du sport: questions de travail",
-"Économie du sport: Finance",
-"Économie du sport: politique",
-"Économie du sport: autre",
-"Économie du tourisme : généralités",
-"Tourisme: Études de l'industrie",
-"Tourisme et développement",
-"Tourisme: Marketing et finance",
-"Tourisme: Politique",
-"Tourisme: Autre",
-
-// English
-"Economics and Teaching",
-"Economics",
-"Role of Economics; Role of Economists; Market for Economists",
-"Relation of Economics to  Disciplines",
-"Relation of Economics to Social Values",
-"Sociology of Economics",
-"Economics",
-"Economic Education and Teaching of Economics",
-"Economic Education and Teaching of Economics Pre-college",
-"Economic Education and Teaching of Economics Undergraduate",
-"Economic Education and Teaching of Economics Graduate",
-"Economic Education and Teaching of Economics",
-"Collective Works",
-"Collected Writings of Individuals",
-"Collective Volumes",
-"Handbooks",
-"Collective Works",
-"History of Economic Thought, Methodology, and Heterodox Approaches",
-"History of Economic Thought through 1925",
-"History of Economic Thought Preclassical (Ancient, Medieval, Mercantilist, Physiocratic)",
-"History of Economic Thought Classical (includes Adam Smith)",
-"History of Economic Thought Neoclassical through 1925 (Austrian, Marshallian, Walrasian, Wicksellian)",
-"History of Economic Thought through 1925 Socialist; Marxist",
-"History of Economic Thought through 1925 Historical; Institutional; Evolutionary",
-"History of Economic Thought through 1925 Quantitative and Mathematical",
-"History of Economic Thought through 1925 International Trade and Finance",
-"History of Economic Thought through 1925",
-"History of Economic Thought since 1925",
-"History of Economic Thought Microeconomics",
-"History of Economic Thought Macroeconomics",
-"History of Economic Thought Quantitative and Mathematical",
-"History of Economic Thought since 1925 Socialist; Marxist; Sraffian",
-"History of Economic Thought since 1925 Historical; Institutional; Evolutionary; Austrian; Stockholm School",
-"History of Economic Thought since 1925 Financial Economics",
-"History of Economic Thought since 1925 International Trade and Finance",
-"History of Economic Thought since 1925",
-"History of Economic Thought Individuals",
-"History of Economic Thought Individuals",
-"Obituaries",
-"Economic Methodology",
-"Economic Methodology",
-"Economic Methodology",
-"Current Heterodox Approaches",
-"Current Heterodox Approaches Socialist; Marxian; Sraffian",
-"Current Heterodox Approaches Historical; Institutional; Evolutionary; Modern Monetary Theory†",
-"Current Heterodox Approaches Austrian",
-"Feminist Economics",
-"Social Economics",
-"Current Heterodox Approaches",
-"Mathematical and Quantitative Methods",
-"Econometrics",
-"Mathematical Methods",
-"Econometric and Statistical Methods and Methodology",
-"Bayesian Analysis",
-"Hypothesis Testing",
-"Estimation",
-"Semiparametric and Nonparametric Methods",
-"Statistical Simulation Methods",
-"Methodological Issues",
-"Econometric and Statistical Methods",
-"Single Equation Models; Single Variables",
-"Single Equation Models; Single Variables Cross-Sectional Models; Spatial Models; Treatment Effect Models; Quantile Regressions",
-"Single Equation Models; Single Variables Time-Series Models; Dynamic Quantile Regressions; Dynamic Treatment Effect Models; Diffusion Processes",
-"Single Equation Models; Single Variables Panel Data Models; Spatio-temporal Models",
-"Single Equation Models; Single Variables Truncated and Censored Models; Switching Regression Models; Threshold Regression Models",
-"Single Equation Models; Single Variables Discrete Regression and Qualitative Choice Models; Discrete Regressors; Proportions; Probabilities",
-"Single Equation Models Single Variables Instrumental Variables (IV) Estimation",
-"Single Equation Models; Single Variables",
-"Multiple or Simultaneous Equation Models; Multiple Variables",
-"Multiple or Simultaneous Equation Models Cross-Sectional Models; Spatial Models; Treatment Effect Models; Quantile Regressions; Social Interaction Models",
-"Multiple or Simultaneous Equation Models Time-Series Models; Dynamic Quantile Regressions; Dynamic Treatment Effect Models; Diffusion Processes; State Space Models",
-"Multiple or Simultaneous Equation Models Panel Data Models; Spatio-temporal Models",
-"Multiple or Simultaneous Equation Models Truncated and Censored Models; Switching Regression Models",
-"Multiple or Simultaneous Equation Models Discrete Regression and Qualitative Choice Models; Discrete Regressors; Proportions",
-"Multiple or Simultaneous Equation Models Instrumental Variables (IV) Estimation",
-"Multiple or Simultaneous Equation Models Classification Methods; Cluster Analysis; Principal Components; Factor Models",
-"Multiple or Simultaneous Equation Models; Multiple Variables",
-"Econometric and Statistical Methods Special Topics",
-"Duration Analysis; Optimal Timing Strategies",
-"Classification Discontinued 2008. See C83.",
-"Index Numbers and Aggregation; Leading indicators",
-"Operations Research; Statistical Decision Theory",
-"Neural Networks and Related Topics",
-"Specific Distributions; Specific Statistics",
-"Econometric and Statistical Methods Special Topics",
-"Econometric Modeling",
-"Model Construction and Estimation",
-"Model Evaluation, Validation, and Selection",
-"Forecasting Models; Simulation Methods",
-"Quantitative Policy Modeling",
-"Large Data Sets Modeling and Analysis",
-"Econometrics of Games and Auctions",
-"Financial Econometrics",
-"Econometric Modeling",
-"Mathematical Methods; Programming Models; Mathematical and Simulation Modeling",
-"Optimization Techniques; Programming Models; Dynamic Analysis",
-"Existence and Stability Conditions of Equilibrium",
-"Computational Techniques; Simulation Modeling",
-"Miscellaneous Mathematical Tools",
-"Input-Output Models",
-"Computable  Equilibrium Models",
-"Mathematical Methods; Programming Models; Mathematical and Simulation Modeling",
-"Game Theory and Bargaining Theory",
-"Cooperative Games",
-"Noncooperative Games",
-"Stochastic and Dynamic Games; Evolutionary Games; Repeated Games",
-"Bargaining Theory; Matching Theory",
-"Game Theory and Bargaining Theory",
-"Data Collection and Data Estimation Methodology; Computer Programs",
-"Methodology for Collecting, Estimating, and Organizing Microeconomic Data; Data Access",
-"Methodology for Collecting, Estimating, and Organizing Macroeconomic Data; Data Access",
-"Survey Methods; Sampling Methods",
-"Econometric Software",
-"Data Collection and Data Estimation Methodology; Computer Programs  Computer Software",
-"Data Collection and Data Estimation Methodology; Computer Programs",
-"Design of Experiments",
-"Design of Experiments Laboratory, Individual",
-"Design of Experiments Laboratory, Group Behavior",
-"Field Experiments",
-"Design of Experiments",
-"Microeconomics",
-"Microeconomic Behavior Underlying Principles",
-"Institutions Design, Formation, Operations, and Impact",
-"Microeconomic Policy Formulation, Implementation, and Evaluation",
-"Household Behavior",
-"Consumer Economics Theory",
-"Consumer Economics Empirical Analysis",
-"Household Production and Intrahousehold Allocation",
-"Household Saving; Personal Finance",
-"Intertemporal Household Choice; Life Cycle Models and Saving",
-"Collaborative Consumption",
-"Consumer Protection",
-"Household Behavior and Family Economics",
-"Production and Organizations",
-"Firm Behavior Theory",
-"Firm Behavior Empirical Analysis",
-"Organizational Behavior; Transaction Costs; Property Rights",
-"Production; Cost; Capital; Capital, Total Factor, and Multifactor Productivity; Capacity",
-"Intertemporal Firm Choice Investment, Capacity, and Financing",
-"Crowd-Based Firms",
-"Production and Organizations",
-"Distribution",
-"Personal Income, Wealth, and Their Distributions",
-"Factor Income Distribution",
-"Distribution",
-"Market Structure, Pricing, and Design",
-"Market Structure, Pricing, and Design Perfect Competition",
-"Market Structure, Pricing, and Design Monopoly",
-"Market Structure, Pricing, and Design Oligopoly and  Forms of Market Imperfection",
-"Auctions",
-"Rationing; Licensing",
-"Value Theory",
-"Market Design",
-"Market Structure and Pricing",
-"Equilibrium and Disequilibrium",
-"Exchange and Production Economies",
-"Incomplete Markets",
-"Equilibrium and Disequilibrium Financial Markets",
-"Equilibrium and Disequilibrium Input-Output Tables and Analysis",
-"Computable and  Applied  Equilibrium Models",
-"Equilibrium and Disequilibrium",
-"Welfare Economics",
-"Allocative Efficiency; Cost-Benefit Analysis",
-"Externalities",
-"Equity, Justice, Inequality, and  Normative Criteria and Measurement",
-"Altruism; Philanthropy; Intergenerational Transfers",
-"Welfare Economics",
-"Analysis of Collective Decision-Making",
-"Social Choice; Clubs; Committees; Associations",
-"Political Processes Rent-seeking, Lobbying, Elections, Legislatures, and Voting Behavior",
-"Bureaucracy; Administrative Processes in Public Organizations; Corruption",
-"Conflict; Conflict Resolution; Alliances; Revolutions",
-"Positive Analysis of Policy Formulation and Implementation",
-"Analysis of Collective Decision-Making",
-"Information, Knowledge, and Uncertainty",
-"Criteria for Decision-Making under Risk and Uncertainty",
-"Asymmetric and Private Information; Mechanism Design",
-"Search; Learning; Information and Knowledge; Communication; Belief; Unawareness",
-"Expectations; Speculations",
-"Network Formation and Analysis Theory",
-"Economics of Contract Theory",
-"Neuroeconomics",
-"Information and Uncertainty",
-"Micro-Based Behavioral Economics",
-"Micro-Based Behavioral Economics Role and Effects of Psychological, Emotional, Social, and Cognitive Factors on Decision Making",
-"Macroeconomics and Monetary Economics",
-"Measurement and Data on National Income and Product Accounts and Wealth; Environmental Accounts",
-"Institutions and the Macroeconomy",
-"Aggregative Models",
-"Aggregative Models Marxian; Sraffian; Kaleckian",
-"Aggregative Models Keynes; Keynesian; Post-Keynesian; Modern Monetary Theory†",
-"Aggregative Models Neoclassical",
-"Austrian; Evolutionary; Institutional",
-"Aggregative Models Social Accounting Matrix",
-"Aggregative Models Forecasting and Simulation Models and Applications",
-"Aggregative Models",
-"Consumption, Saving, Production, Investment, Labor Markets, and Informal Economy  (includes Measurement and Data)",
-"Macroeconomics Consumption; Saving; Wealth",
-"Investment; Capital; Intangible Capital; Capacity",
-"Macroeconomics Production",
-"Employment; Unemployment; Wages; Intergenerational Income Distribution; Aggregate Human Capital; Aggregate Labor Productivity",
-"Aggregate Factor Income Distribution",
-"Informal Economy; Underground Economy",
-"Macroeconomics Consumption, Saving, Production, Employment, and Investment Forecasting and Simulation Models and Applications",
-"Consumption, Saving, Production, Investment, Labor Markets, and Informal Economy",
-"Prices, Business Fluctuations, and Cycles  (includes Measurement and Data)",
-"Price Level; Inflation; Deflation",
-"Business Fluctuations; Cycles",
-"Prices, Business Fluctuations, and Cycles Forecasting and Simulation Models and Applications",
-"Prices, Business Fluctuations, and Cycles",
-"Money and Interest Rates",
-"Demand for Money",
-"Monetary Systems; Standards; Regimes; Government and the Monetary System; Payment Systems",
-"Interest Rates Determination, Term Structure, and Effects",
-"Financial Markets and the Macroeconomy",
-"Money and Interest Rates Forecasting and Simulation Models and Applications",
-"Money and Interest Rates",
-"Monetary Policy, Central Banking, and the Supply of Money and Credit",
-"Money Supply; Credit; Money Multipliers",
-"Monetary Policy",
-"Central Banks and Their Policies",
-"Monetary Policy, Central Banking, and the Supply of Money and Credit",
-"Macroeconomic Policy, Macroeconomic Aspects of Public Finance, and  Outlook",
-"Policy Objectives; Policy Designs and Consistency; Policy Coordination",
-"Fiscal Policy",
-"Comparative or Joint Analysis of Fiscal and Monetary Policy; Stabilization; Treasury Policy",
-"Incomes Policy; Price Policy",
-"Studies of Particular Policy Episodes",
-"Outlook and Conditions",
-"Macroeconomic Policy, Macroeconomic Aspects of Public Finance, and  Outlook",
-"Macro-Based Behavioral Economics",
-"Macro-Based Behavioral Economics Role and Effects of Psychological, Emotional, Social, and Cognitive Factors on the Macro Economy",
-"International Economics",
-"Global Outlook",
-"International Economic Order and Integration",
-"Trade",
-"Neoclassical Models of Trade",
-"Models of Trade with Imperfect Competition and Scale Economies; Fragmentation",
-"Trade Policy; International Trade Organizations",
-"Empirical Studies of Trade",
-"Economic Integration",
-"Trade and Labor Market Interactions",
-"Trade Forecasting and Simulation",
-"Trade and Environment",
-"Trade",
-"International Factor Movements and International Business",
-"International Investment; Long-term Capital Movements",
-"International Migration",
-"Multinational Firms; International Business",
-"Remittances",
-"International Factor Movements",
-"International Finance",
-"Foreign Exchange",
-"Current Account Adjustment; Short-term Capital Movements",
-"International Monetary Arrangements and Institutions",
-"International Lending and Debt Problems",
-"Foreign Aid",
-"Financial Aspects of Economic Integration",
-"International Finance Forecasting and Simulation Models and Applications",
-"International Financial Policy Financial Transactions Tax; Capital Controls",
-"International Finance",
-"Macroeconomic Aspects of International Trade and Finance",
-"Open Economy Macroeconomics",
-"International Policy Coordination and Transmission",
-"Economic Growth of Open Economies",
-"International Business Cycles",
-"Macroeconomic Issues of Monetary Unions",
-"Macroeconomic Aspects of International Trade and Finance Forecasting and Simulation Models and Applications",
-"Macroeconomic Aspects of International Trade and Finance",
-"International Relations, National Security, and International Political Economy",
-"International Conflicts; Negotiations; Sanctions",
-"National Security; Economic Nationalism",
-"International Agreements and Observance; International Organizations",
-"Colonialism; Imperialism; Postcolonialism",
-"International Institutional Arrangements",
-"International Relations and International Political Economy",
-"Economic Impacts of Globalization",
-"Economic Impacts of Globalization Microeconomic Impacts",
-"Economic Impacts of Globalization Macroeconomic Impacts",
-"Economic Impacts of Globalization Economic Development",
-"Economic Impacts of Globalization Environment",
-"Economic Impacts of Globalization Finance",
-"Economic Impacts of Globalization Labor",
-"Economic Impacts of Globalization Policy",
-"Economic Impacts of Globalization",
-"Financial Economics",
-"Financial Crises",
-"Asset Markets and Pricing",
-"Portfolio Choice; Investment Decisions",
-"Equities; Fixed Income Securities†",
-"Contingent Pricing; Futures Pricing; option pricing",
-"Information and Market Efficiency; Event Studies; Insider Trading",
-"International Financial Markets",
-"Financial Forecasting and Simulation",
-"Financial Markets Government Policy and Regulation",
-"Financial Markets",
-"Financial Institutions and Services",
-"Banks; Depository Institutions; Micro Finance Institutions; Mortgages",
-"Insurance; Insurance Companies; Actuarial Studies",
-"Pension Funds; Non-bank Financial Institutions; Financial Instruments; Institutional Investors",
-"Investment Banking; Venture Capital; Brokerage; Ratings and Ratings Agencies",
-"Financial Institutions and Services Government Policy and Regulation",
-"Financial Institutions and Services",
-"Corporate Finance and Governance",
-"Capital Budgeting; Fixed Investment and Inventory Studies; Capacity",
-"Financing Policy; Financial Risk and Risk Management; Capital and Ownership Structure; Value of Firms; Goodwill",
-"Bankruptcy; Liquidation",
-"Mergers; Acquisitions; Restructuring; Voting; Proxy Contests; Corporate Governance",
-"Payout Policy",
-"Corporate Finance and Governance Government Policy and Regulation",
-"Corporate Finance and Governance",
-"Behavioral Finance",
-"Behavioral Finance Role and Effects of Psychological, Emotional, Social, and Cognitive Factors on Decision Making in Financial Markets",
-"Household Finance ‡",
-"Household Saving, Borrowing, Debt, and Wealth‡",
-"Household Finance Insurance‡",
-"Household Finance Financial Literacy‡",
-"Household Finance ‡",
-"Public Economics",
-"Structure and Scope of Government",
-"Structure, Scope, and Performance of Government",
-"Crisis Management",
-"Economics of Eminent Domain; Expropriation; Nationalization",
-"Structure and Scope of Government",
-"Taxation, Subsidies, and Revenue",
-"Taxation and Subsidies Efficiency; Optimal Taxation",
-"Taxation and Subsidies Incidence",
-"Taxation and Subsidies Externalities; Redistributive Effects; Environmental Taxes and Subsidies",
-"Personal Income and  Nonbusiness Taxes and Subsidies; includes inheritance and gift taxes",
-"Business Taxes and Subsidies including sales and value-added (VAT)",
-"Tax Evasion and Avoidance",
-"Taxation, Subsidies, and Revenues  Sources of Revenue",
-"Taxation and Subsidies",
-"Fiscal Policies and Behavior of Economic Agents",
-"Fiscal Policies and Behavior of Economic Agents Household",
-"Fiscal Policies and Behavior of Economic Agents Firm",
-"Fiscal Policies and Behavior of Economic Agents",
-"Publicly Provided Goods",
-"Public Goods",
-"Publicly Provided Private Goods",
-"Project Evaluation; Social Discount Rate",
-"Publicly Provided Goods Mixed Markets",
-"Publicly Provided Goods",
-"National Government Expenditures and Related Policies",
-"National Government Expenditures and Health",
-"National Government Expenditures and Education",
-"National Government Expenditures and Welfare Programs",
-"National Government Expenditures and Related Policies Infrastructures;  Public Investment and Capital Stock",
-"Social Security and Public Pensions",
-"National Security and War",
-"National Government Expenditures and Related Policies Procurement",
-"National Government Expenditures and Related Policies",
-"National Budget, Deficit, and Debt",
-"National Budget; Budget Systems",
-"National Deficit; Surplus",
-"National Debt; Debt Management; Sovereign Debt",
-"Forecasts of Budgets, Deficits, and Debt",
-"National Budget, Deficit, and Debt",
-"State and Local Government; Intergovernmental Relations",
-"State and Local Taxation, Subsidies, and Revenue",
-"State and Local Budget and Expenditures",
-"State and Local Government; Intergovernmental Relations Interjurisdictional Differentials and Their Effects",
-"State and Local Borrowing",
-"State and Local Government Health; Education; Welfare; Public Pensions",
-"State and Local Government  Expenditure Categories",
-"Intergovernmental Relations; Federalism; Secession",
-"State and Local Government; Intergovernmental Relations",
-"Public Economics Miscellaneous Issues",
-"Governmental Loans; Loan Guarantees; Credits; Grants; Bailouts",
-"Governmental Property",
-"Public Administration; Public Sector Accounting and Audits",
-"Disaster Aid",
-"International Fiscal Issues; International Public Goods",
-"Public Economics Miscellaneous Issues",
-"Health, Education, and Welfare",
-"Health",
-"Analysis of Health Care Markets",
-"Health Behavior",
-"Health Insurance, Public and Private",
-"Health and Inequality",
-"Health and Economic Development",
-"Health Government Policy; Regulation; Public Health",
-"Health",
-"Education and Research Institutions",
-"Analysis of Education",
-"Educational Finance; Financial Aid",
-"Higher Education; Research Institutions",
-"Education and Inequality",
-"Education and Economic Development",
-"Returns to Education",
-"Education Government Policy",
-"Education",
-"Welfare, Well-Being, and Poverty",
-"Welfare; Well-Being",
-"Measurement and Analysis of Poverty",
-"Welfare, Well-Being, and Poverty Government Programs; Provision and Effects of Welfare Programs",
-"Welfare, Well-Being, and Poverty",
-"Labor and Demographic Economics",
-"Labor Economics",
-"Labor Economics Policies",
-"Demographic Economics",
-"Demographic Trends, Macroeconomic Effects, and Forecasts",
-"Marriage; Marital Dissolution; Family Structure; Domestic Abuse",
-"Fertility; Family Planning; Child Care; Children; Youth",
-"Economics of the Elderly; Economics of the Handicapped; Non-labor Market Discrimination",
-"Economics of Minorities, Races, Indigenous Peoples, and Immigrants; Non-labor Discrimination",
-"Economics of Gender; Non-labor Discrimination",
-"Value of Life; Forgone Income",
-"Demographic Economics Public Policy",
-"Demographic Economics",
-"Demand and Supply of Labor",
-"Labor Force and Employment, Size, and Structure",
-"Time Allocation and Labor Supply",
-"Labor Demand",
-"Human Capital; Skills; Occupational Choice; Labor Productivity",
-"Retirement; Retirement Policies",
-"Safety; Job Satisfaction; Related Public Policy",
-"Time Allocation, Work Behavior, and Employment Determination",
-"Wages, Compensation, and Labor Costs",
-"Wage Level and Structure; Wage Differentials",
-"Nonwage Labor Costs and Benefits; Retirement Plans; Private Pensions",
-"Compensation Packages; Payment Methods",
-"Wages, Compensation, and Labor Costs Public Policy",
-"Wages, Compensation, and Labor Costs",
-"Particular Labor Markets",
-"Labor Contracts",
-"Monopsony; Segmented Labor Markets",
-"Agricultural Labor Markets",
-"Professional Labor Markets; Occupational Licensing",
-"Public Sector Labor Markets",
-"Informal Labor Markets",
-"Coercive Labor Markets",
-"Particular Labor Markets Public Policy",
-"Particular Labor Markets",
-"Labor-Management Relations, Trade Unions, and Collective Bargaining",
-"Trade Unions Objectives, Structure, and Effects",
-"Dispute Resolution Strikes, Arbitration, and Mediation; Collective Bargaining",
-"Labor-Management Relations; Industrial Jurisprudence",
-"Producer Cooperatives; Labor Managed Firms; Employee Ownership",
-"Labor-Management Relations, Trade Unions, and Collective Bargaining Public Policy",
-"Labor-Management Relations, Trade Unions, and Collective Bargaining",
-"Mobility, Unemployment, Vacancies, and Immigrant Workers",
-"Geographic Labor Mobility; Immigrant Workers",
-"Job, Occupational, and Intergenerational Mobility; Promotion",
-"Labor Turnover; Vacancies; Layoffs",
-"Unemployment Models, Duration, Incidence, and Job Search",
-"Unemployment Insurance; Severance Pay; Plant Closings",
-"Mobility, Unemployment, and Vacancies Public Policy",
-"Mobility, Unemployment, and Vacancies",
-"Labor Discrimination",
-"Labor Discrimination",
-"Labor Discrimination Public Policy",
-"Labor Discrimination",
-"Labor Standards",
-"Labor Standards Working Conditions",
-"Labor Standards Labor Force Composition",
-"Labor Standards Workers' Rights",
-"Labor Standards Public Policy",
-"Labor Standards",
-"Law and Economics",
-"Basic Areas of Law  (Constitutional Law)",
-"Property Law",
-"Contract Law",
-"Tort Law and Product Liability; Forensic Economics",
-"Criminal Law",
-"Civil Law; Common Law",
-"Election Law",
-"Basic Areas of Law",
-"Regulation and Business Law",
-"Antitrust Law",
-"Business and Securities Law",
-"Regulated Industries and Administrative Law",
-"Cyber Law",
-"Real Estate Law",
-"Regulation and Business Law",
-"Substantive Areas of Law",
-"Labor Law",
-"Energy, Environmental, Health, and Safety Law",
-"International Law",
-"Tax Law",
-"Personal Bankruptcy Law",
-"Family and Personal Law",
-"Immigration Law",
-"Human Rights Law; Gender Law",
-"Substantive Areas of Law",
-"Legal Procedure, the Legal System, and Illegal Behavior",
-"Litigation Process",
-"Illegal Behavior and the Enforcement of Law",
-"Legal Procedure, the Legal System, and Illegal Behavior",
-"Industrial Organization",
-"Market Structure, Firm Strategy, and Market Performance",
-"Production, Pricing, and Market Structure; Size Distribution of Firms",
-"Monopoly; Monopolization Strategies",
-"Oligopoly and  Imperfect Markets",
-"Transactional Relationships; Contracts and Reputation; Networks",
-"Information and Product Quality; Standardization and Compatibility",
-"Industrial Organization and Macroeconomics Industrial Structure and Structural Change; Industrial Price Indices",
-"Open Source Products and Markets",
-"Market Structure, Firm Strategy, and Market Performance",
-"Firm Objectives, Organization, and Behavior",
-"Business Objectives of the Firm",
-"Firm Organization and Market Structure",
-"Organization of Production",
-"Contracting Out; Joint Ventures; Technology Licensing",
-"Firm Performance Size, Diversification, and Scope",
-"Entrepreneurship",
-"Firm Objectives, Organization, and Behavior",
-"Nonprofit Organizations and Public Enterprise",
-"Nonprofit Institutions; NGOs; Social Entrepreneurship",
-"Public Enterprises; Public-Private Enterprises",
-"Comparison of Public and Private Enterprises and Nonprofit Institutions; Privatization; Contracting Out",
-"Public Policy",
-"Nonprofit Organizations and Public Enterprise",
-"Antitrust Issues and Policies",
-"Monopolization; Horizontal Anticompetitive Practices",
-"Vertical Restraints; Resale Price Maintenance; Quantity Discounts",
-"Legal Monopolies and Regulation or Deregulation",
-"Antitrust Policy and Public Enterprises, Nonprofit Institutions, and Professional Organizations",
-"Antitrust Policy",
-"Regulation and Industrial Policy",
-"Economics of Regulation",
-"Industrial Policy; Sectoral Planning Methods",
-"Enterprise Policy",
-"Regulation and Industrial Policy",
-"Industry Studies Manufacturing",
-"Metals and Metal Products; Cement; Glass; Ceramics",
-"Automobiles;  Transportation Equipment; Related Parts and Equipment",
-"Microelectronics; Computers; Communications Equipment",
-"Machinery; Business Equipment; Armaments",
-"Chemicals; Rubber; Drugs; Biotechnology; Plastics",
-"Food; Beverages; Cosmetics; Tobacco; Wine and Spirits",
-"Consumer Nondurables Clothing, Textiles, Shoes, and Leather Goods; Household Goods; Sports Equipment",
-"Appliances; Furniture;  Consumer Durables",
-"Industry Studies Manufacturing",
-"Industry Studies Primary Products and Construction",
-"Mining, Extraction, and Refining Hydrocarbon Fuels",
-"Mining, Extraction, and Refining  Nonrenewable Resources",
-"Forest Products",
-"Construction",
-"Industry Studies Primary Products and Construction Government Policy",
-"Industry Studies Primary Products and Construction",
-"Industry Studies Services",
-"Retail and Wholesale Trade; e-Commerce",
-"Entertainment; Media",
-"Sports; Gambling; Restaurants; Recreation; Tourism",
-"Personal, Professional, and Business Services",
-"Real Estate Services",
-"Information and Internet Services; Computer Software",
-"Postal and Delivery Services",
-"Industry Studies Services Government Policy",
-"Industry Studies Services",
-"Industry Studies Transportation and Utilities",
-"Transportation",
-"Railroads and  Surface Transportation",
-"Air Transportation",
-"Electric Utilities",
-"Gas Utilities; Pipelines; Water Utilities",
-"Telecommunications",
-"Utilities",
-"Industry Studies Utilities and Transportation Government Policy",
-"Industry Studies Utilities and Transportation",
-"Business Administration and Business Economics; Marketing; Accounting; Personnel Economics",
-"Business Administration",
-"Production Management",
-"Personnel Management; Executives; Executive Compensation",
-"New Firms; Startups",
-"Corporate Culture; Diversity; Social Responsibility",
-"IT Management",
-"International Business Administration",
-"Business Administration",
-"Business Economics",
-"Business Economics",
-"Business Economics",
-"Marketing and Advertising",
-"Marketing",
-"Advertising",
-"Marketing and Advertising Government Policy and Regulation",
-"Marketing and Advertising",
-"Accounting and Auditing",
-"Accounting",
-"Auditing",
-"Accounting and Auditing Government Policy and Regulation",
-"Accounting",
-"Personnel Economics",
-"Personnel Economics Firm Employment Decisions; Promotions",
-"Personnel Economics Compensation and Compensation Methods and Their Effects",
-"Personnel Economics Training",
-"Personnel Economics Labor Management",
-"Personnel Economics Labor Contracting Devices",
-"Personnel Economics",
-"Economic History",
-"Development of the Discipline Historiographical; Sources and Methods",
-"Economic History Macroeconomics and Monetary Economics; Industrial Structure; Growth; Fluctuations , International, or Comparative",
-"Economic History Macroeconomics and Monetary Economics; Industrial Structure; Growth; Fluctuations U.S.; Canada Pre-1913",
-"Economic History Macroeconomics and Monetary Economics; Industrial Structure; Growth; Fluctuations U.S.; Canada 1913-",
-"Economic History Macroeconomics and Monetary Economics; Industrial Structure; Growth; Fluctuations Europe Pre-1913",
-"Economic History Macroeconomics and Monetary Economics; Industrial Structure; Growth; Fluctuations Europe 1913-",
-"Economic History Macroeconomics and Monetary Economics; Industrial Structure; Growth; Fluctuations Asia including Middle East",
-"Economic History Macroeconomics and Monetary Economics; Industrial Structure; Growth; Fluctuations Latin America; Caribbean",
-"Economic History Macroeconomics and Monetary Economics; Industrial Structure; Growth; Fluctuations Africa; Oceania",
-"Economic History Financial Markets and Institutions , International, or Comparative",
-"Economic History Financial Markets and Institutions U.S.; Canada Pre-1913",
-"Economic History Financial Markets and Institutions U.S.; Canada 1913-",
-"Economic History Financial Markets and Institutions Europe Pre-1913",
-"Economic History Financial Markets and Institutions Europe 1913-",
-"Economic History Financial Markets and Institutions Asia including Middle East",
-"Economic History Financial Markets and Institutions Latin America; Caribbean",
-"Economic History Financial Markets and Institutions Africa; Oceania",
-"Economic History Labor and Consumers, Demography, Education, Health, Welfare, Income, Wealth, Religion, and Philanthropy , International, or Comparative",
-"Economic History Labor and Consumers, Demography, Education, Health, Welfare, Income, Wealth, Religion, and Philanthropy U.S.; Canada Pre-1913",
-"Economic History Labor and Consumers, Demography, Education, Health, Welfare, Income, Wealth, Religion, and Philanthropy U.S.; Canada 1913-",
-"Economic History Labor and Consumers, Demography, Education, Health, Welfare, Income, Wealth, Religion, and Philanthropy Europe Pre-1913",
-"Economic History Labor and Consumers, Demography, Education, Health, Welfare, Income, Wealth, Religion, and Philanthropy Europe 1913-",
-"Economic History Labor and Consumers, Demography, Education, Health, Welfare, Income, Wealth, Religion, and Philanthropy Asia including Middle East",
-"Economic History Labor and Consumers, Demography, Education, Health, Welfare, Income, Wealth, Religion, and Philanthropy Latin America; Caribbean",
-"Economic History Labor and Consumers, Demography, Education, Health, Welfare, Income, Wealth, Religion, and Philanthropy Africa; Oceania",
-"Economic History Government, War, Law, International Relations, and Regulation , International, or Comparative",
-"Economic History Government, War, Law, International Relations, and Regulation U.S.; Canada Pre-1913",
-"Economic History Government, War, Law, International Relations, and Regulation U.S.; Canada 1913-",
-"Economic History Government, War, Law, International Relations, and Regulation Europe Pre-1913",
-"Economic History Government, War, Law, International Relations, and Regulation Europe 1913-",
-"Economic History Government, War, Law, International Relations, and Regulation Asia including Middle East",
-"Economic History Government, War, Law, International Relations, and Regulation Latin America; Caribbean",
-"Economic History Government, War, Law, International Relations, and Regulation Africa; Oceania",
-"Economic History Agriculture, Natural Resources, Environment, and Extractive Industries , International, or Comparative",
-"Economic History Agriculture, Natural Resources, Environment, and Extractive Industries U.S.; Canada Pre-1913",
-"Economic History Agriculture, Natural Resources, Environment, and Extractive Industries U.S.; Canada 1913-",
-"Economic History Agriculture, Natural Resources, Environment, and Extractive Industries Europe Pre-1913",
-"Economic History Agriculture, Natural Resources, Environment, and Extractive Industries Europe 1913-",
-"Economic History Agriculture, Natural Resources, Environment, and Extractive Industries Asia including Middle East",
-"Economic History Agriculture, Natural Resources, Environment, and Extractive Industries Latin America; Caribbean",
-"Economic History Agriculture, Natural Resources, Environment, and Extractive Industries Africa; Oceania",
-"Economic History Manufacturing and Construction , International, or Comparative",
-"Economic History Manufacturing and Construction U.S.; Canada Pre-1913",
-"Economic History Manufacturing and Construction U.S.; Canada 1913-",
-"Economic History Manufacturing and Construction Europe Pre-1913",
-"Economic History Manufacturing and Construction Europe 1913-",
-"Economic History Manufacturing and Construction Asia including Middle East",
-"Economic History Manufacturing and Construction Latin America; Caribbean",
-"Economic History Manufacturing and Construction Africa; Oceania",
-"Economic History Transport, International and Domestic Trade, Energy, Technology, and  Services , International, or Comparative",
-"Economic History Transport, Trade, Energy, Technology, and  Services U.S.; Canada Pre-1913",
-"Economic History Transport, Trade, Energy, Technology, and  Services U.S.; Canada 1913-",
-"Economic History Transport, Trade, Energy, Technology, and  Services Europe Pre-1913",
-"Economic History Transport, Trade, Energy, Technology, and  Services Europe 1913-",
-"Economic History Transport, Trade, Energy, Technology, and  Services Asia including Middle East",
-"Economic History Transport, Trade, Energy, Technology, and  Services Latin America; Caribbean",
-"Economic History Transport, Trade, Energy, Technology, and  Services Africa; Oceania",
-"Micro-Business History , International, or Comparative",
-"Micro-Business History U.S.; Canada Pre-1913",
-"Micro-Business History U.S.; Canada 1913-",
-"Micro-Business History Europe Pre-1913",
-"Micro-Business History Europe 1913-",
-"Micro-Business History Asia including Middle East",
-"Micro-Business History Latin America; Caribbean",
-"Micro-Business History Africa; Oceania",
-"Regional and Urban History",
-"Regional and Urban History U.S.; Canada Pre-1913",
-"Regional and Urban History U.S.; Canada 1913-",
-"Regional and Urban History Europe Pre-1913",
-"Regional and Urban History Europe 1913-",
-"Regional and Urban History Asia including Middle East",
-"Regional and Urban History Latin America; Caribbean",
-"Regional and Urban History Africa; Oceania",
-"Economic Development, Innovation, Technological Change, and Growth",
-"Economic Development",
-"Macroeconomic Analyses of Economic Development",
-"Microeconomic Analyses of Economic Development",
-"Economic Development Agriculture; Natural Resources; Energy; Environment;  Primary Products",
-"Industrialization; Manufacturing and Service Industries; Choice of Technology",
-"Economic Development Human Resources; Human Development; Income Distribution; Migration",
-"Economic Development Financial Markets; Saving and Capital Investment; Corporate Finance and Governance",
-"Formal and Informal Sectors; Shadow Economy; Institutional Arrangements",
-"Economic Development Urban, Rural, Regional, and Transportation Analysis; Housing; Infrastructure",
-"International Linkages to Development; Role of International Organizations",
-"Development Planning and Policy",
-"Planning Models; Planning Policy",
-"Project Analysis",
-"Fiscal and Monetary Policy in Development",
-"Development Planning and Policy Trade Policy; Factor Movement; Foreign Exchange Policy",
-"Industrial Policy",
-"Development Planning and Policy",
-"Innovation; Research and Development; Technological Change; Intellectual Property Rights",
-"Innovation and Invention Processes and Incentives",
-"Management of Technological Innovation and R&D",
-"Technological Change Choices and Consequences; Diffusion Processes",
-"Intellectual Property and Intellectual Capital",
-"Social Innovation",
-"Open Innovation‡",
-"Technological Change Government Policy",
-"Technological Change",
-"Economic Growth and Aggregate Productivity",
-"One, Two, and Multisector Growth Models",
-"Monetary Growth Models",
-"Institutions and Growth",
-"Environment and Growth",
-"Empirical Studies of Economic Growth; Aggregate Productivity; Cross-Country Output Convergence",
-"Economic Growth and Aggregate Productivity",
-"Economywide Country Studies",
-"Economywide Country Studies U.S.; Canada",
-"Economywide Country Studies Europe",
-"Economywide Country Studies Asia including Middle East",
-"Economywide Country Studies Latin America; Caribbean",
-"Economywide Country Studies Africa",
-"Economywide Country Studies Oceania",
-"Comparative Studies of Countries",
-"Economic Systems",
-"Capitalist Systems",
-"Capitalist Systems Planning, Coordination, and Reform",
-"Capitalist Enterprises",
-"Cooperative Enterprises",
-"Capitalist Systems Property Rights",
-"Capitalist Systems Political Economy",
-"Capitalist Systems Performance and Prospects",
-"Energy; Environment",
-"Capitalist Systems",
-"Socialist Systems and Transitional Economies",
-"Socialist Systems and Transitional Economies Planning, Coordination, and Reform",
-"Socialist Systems and Transitional Economies Prices",
-"Socialist Systems and Transitional Economies Factor and Product Markets; Industry Studies; Population",
-"Socialist Systems and Transitional Economies National Income, Product, and Expenditure; Money; Inflation",
-"Socialist Systems and Transitional Economies Urban, Rural, and Regional Economics",
-"Socialist Systems and Transitional Economies Political Economy; Property Rights",
-"Socialist Systems and Transitional Economies Performance and Prospects",
-"Socialist Systems and Transitional Economies Natural Resources; Energy; Environment",
-"Socialist Systems and Transitional Economies",
-"Socialist Institutions and Their Transitions",
-"Socialist Enterprises and Their Transitions",
-"Collectives; Communes; Agriculture",
-"Socialist Institutions and Their Transitions International Trade, Finance, Investment, Relations, and Aid",
-"Socialist Institutions and Their Transitions Financial Economics",
-"Socialist Institutions and Their Transitions Public Economics",
-"Socialist Institutions and Their Transitions Consumer Economics; Health; Education and Training Welfare, Income, Wealth, and Poverty",
-"Socialist Systems and Transitional Economies Legal Institutions; Illegal Behavior",
-"Socialist Institutions and Their Transitions",
-"Economic Systems",
-"Economic Systems Planning, Coordination, and Reform",
-"Economic Systems Productive Enterprises; Factor and Product Markets; Prices; Population",
-"Economic Systems Public Economics; Financial Economics",
-"Economic Systems National Income, Product, and Expenditure; Money; Inflation",
-"Economic Systems International Trade, Finance, Investment and Aid",
-"Economic Systems Consumer Economics; Health; Education and Training; Welfare, Income, Wealth, and Poverty",
-"Economic Systems Performance and Prospects",
-"Economic Systems Political Economy; Legal Institutions; Property Rights; Natural Resources; Energy; Environment; Regional Studies",
-"Economic Systems",
-"Comparative Economic Systems",
-"Comparative Analysis of Economic Systems",
-"Comparative Studies of Particular Economies",
-"Comparative Economic Systems",
-"Agricultural and Natural Resource Economics; Environmental and Ecological Economics",
-"Sustainable Development",
-"Commodity Markets",
-"Agriculture",
-"Agriculture Aggregate Supply and Demand Analysis; Prices",
-"Micro Analysis of Farm Firms, Farm Households, and Farm Input Markets",
-"Agricultural Markets and Marketing; Cooperatives; Agribusiness",
-"Agricultural Finance",
-"Land Ownership and Tenure; Land Reform; Land Use; Irrigation; Agriculture and Environment",
-"Agricultural R&D; Agricultural Technology; Biofuels; Agricultural Extension Services",
-"Agriculture in International Trade",
-"Agricultural Policy; Food Policy",
-"Agriculture",
-"Renewable Resources and Conservation",
-"Renewable Resources and Conservation Demand and Supply; Prices",
-"Renewable Resources and Conservation Fishery; Aquaculture",
-"Renewable Resources and Conservation Forestry",
-"Renewable Resources and Conservation Land",
-"Renewable Resources and Conservation Water",
-"Recreational Aspects of Natural Resources",
-"Renewable Resources and Conservation Issues in International Trade",
-"Renewable Resources and Conservation Government Policy",
-"Renewable Resources and Conservation",
-"Nonrenewable Resources and Conservation",
-"Nonrenewable Resources and Conservation Demand and Supply; Prices",
-"Exhaustible Resources and Economic Development",
-"Resource Booms",
-"Natural Resources and Domestic and International Conflicts",
-"Hydrocarbon Resources",
-"Nonrenewable Resources and Conservation Issues in International Trade",
-"Nonrenewable Resources and Conservation Government Policy",
-"Nonrenewable Resources and Conservation",
-"Energy",
-"Energy Demand and Supply; Prices",
-"Alternative Energy Sources",
-"Energy and the Macroeconomy",
-"Energy Forecasting",
-"Energy Government Policy",
-"Energy",
-"Environmental Economics",
-"Valuation of Environmental Effects",
-"Pollution Control Adoption and Costs; Distributional Effects; Employment Effects",
-"Air Pollution; Water Pollution; Noise; Hazardous Waste; Solid Waste; Recycling",
-"Climate; Natural Disasters and Their Management; Global Warming",
-"Environmental Economics Technological Innovation",
-"Environment and Development; Environment and Trade; Sustainability; Environmental Accounts and Accounting; Environmental Equity; Population Growth",
-"Ecological Economics Ecosystem Services; Biodiversity Conservation; Bioeconomics; Industrial Ecology",
-"Environmental Economics Government Policy",
-"Environmental Economics",
-"Urban, Rural, Regional, Real Estate, and Transportation Economics",
-"Regional Economics (includes Regional Data)",
-"Regional Economic Activity Growth, Development, Environmental Issues, and Changes",
-"Size and Spatial Distributions of Regional Economic Activity",
-"Equilibrium and Welfare Economic Analysis of Regional Economies",
-"Land Use Patterns",
-"Regional Economics Econometric and Input-Output Models;  Models",
-"Regional Economics",
-"Urban, Rural, Regional, Real Estate, and Transportation Economics Household Analysis",
-"Urban, Rural, Regional, Real Estate, and Transportation Economics Housing Demand",
-"Urban, Rural, Regional, Real Estate, and Transportation Economics  Demand",
-"Urban, Rural, Regional, Real Estate, and Transportation Economics Regional Migration; Regional Labor Markets; Population; Neighborhood Characteristics",
-"Urban, Rural, Regional, Real Estate, and Transportation Economics Government Policy",
-"Urban, Rural, Regional, Real Estate, and Transportation Economics Household Analysis",
-"Real Estate Markets, Spatial Production Analysis, and Firm Location",
-"Housing Supply and Markets",
-"Spatial Production and Pricing Analysis",
-"Nonagricultural and Nonresidential Real Estate Markets",
-"Production Analysis and Firm Location Government Policy",
-"Real Estate Markets, Spatial Production Analysis, and Firm Location",
-"Transportation Economics",
-"Transportation Demand, Supply, and Congestion; Travel Time; Safety and Accidents; Transportation Noise",
-"Transportation Economics Government and Private Investment Analysis; Road Maintenance, Transportation Planning",
-"Transportation Economics Government Pricing and Policy",
-"Transportation Economics",
-"Regional Government Analysis",
-"Finance in Urban and Rural Economies",
-"Regional Government Analysis Land Use and  Regulations",
-"Public Facility Location Analysis; Public Investment and Capital Stock",
-"Regional Development Planning and Policy",
-"Regional Government Analysis",
-"Data Tables and Charts",
-"Introductory Material",
-"Book Reviews (unclassified)",
-"Dissertations (unclassified)",
-"Further Reading (unclassified)",
-"Excerpt",
-"No Author  Discussions",
-"Related Disciplines",
-"Miscellaneous Categories",
-"Pictures and Maps",
-"Novels, Self-Help Books, etc.",
-"Special Topics",
-"Cultural Economics; Economic Sociology; Economic Anthropology",
-"Cultural Economics Economics of the Arts and Literature",
-"Cultural Economics Religion",
-"Economic Sociology; Economic Anthropology; Language; Social and Economic Stratification",
-"Cultural Economics Public Policy",
-"Cultural Economics",
-"Sports Economics",
-"Sports Economics Industry Studies",
-"Sports Economics Labor Issues",
-"Sports Economics Finance",
-"Sports Economics Policy",
-"Sports Economics",
-"Tourism Economics",
-"Tourism Industry Studies",
-"Tourism and Development",
-"Tourism Marketing and Finance",
-"Tourism Policy",
-"Tourism"
-]
+const SUGGESTION_ICONS = {
+  "jel": "https://image.flaticon.com/icons/svg/126/126498.svg",
+  "institution": "https://image.flaticon.com/icons/svg/126/126496.svg",
+  "author": "https://image.flaticon.com/icons/svg/126/126486.svg"
+}
 
 const vm = new Vue ({
   el: '#vue-instance',
@@ -13070,6 +16,8 @@ const vm = new Vue ({
       numHits: null,
       searchOffset: 0,
       selectedAuthor: null,
+      selectedAuthorId: null,
+      digestPages: {},
       idx: 0,
       pub_count: 0,
       currentPubli: null,
@@ -13095,17 +43,17 @@ const vm = new Vue ({
       this.isOpen = true
       this.setSuggestions()
     },
-    setSuggestions() {
-      suggs_t = SUGGESTIONS_JEL.filter(item => item.toLowerCase().indexOf(this.searchTerm.toLowerCase()) > -1).map(function(s) { 
-      	return {"icon_url": "https://image.flaticon.com/icons/svg/126/126498.svg", "label": s} 
-      })
-      suggs_i = SUGGESTIONS_INST.filter(item => item.toLowerCase().indexOf(this.searchTerm.toLowerCase()) > -1).map(function(s) { 
-      	return {"icon_url": "https://image.flaticon.com/icons/svg/126/126496.svg", "label": s} 
-      })
-      suggs_a = SUGGESTIONS_AUTHORS.filter(item => item.toLowerCase().indexOf(this.searchTerm.toLowerCase()) > -1).map(function(s) { 
-      	return {"icon_url": "https://image.flaticon.com/icons/svg/126/126486.svg", "label": s} 
-      })
-      this.suggestions = suggs_t.concat(suggs_i.concat(suggs_a))
+    async setSuggestions() {
+      const term = this.searchTerm
+      if (!term.trim()) {
+        this.suggestions = []
+        return
+      }
+      const response = await axios.get(`${this.baseUrl}/suggest`, { params: { prefix: term } })
+      // Responses to previous keystrokes are ignored
+      if (term === this.searchTerm) {
+        this.suggestions = response.data.map(s => ({ "icon_url": SUGGESTION_ICONS[s.type], "label": s.label }))
+      }
     },
     pickSuggestion(suggestion) {
 		this.searchTerm = suggestion.label
@@ -13154,14 +102,40 @@ const vm = new Vue ({
     noPrevResultsAvailable() {
     	return this.searchOffset <= 0
     },
+    // Returns a page of the publication digest of the selected author, fetched once
+    async getDigestPage(page) {
+      if (!(page in this.digestPages)) {
+        const response = await axios.get(`${this.baseUrl}/digest`, { params: { author_id: this.selectedAuthorId, page: page } })
+        this.digestPages[page] = response.data
+      }
+      return this.digestPages[page]
+    },
+    async getFullPubli(publi_id) {
+      const response = await axios.get(`${this.baseUrl}/publi`, { params: { publi_id: publi_id } })
+      return response.data.hits.hits[0]
+    },
     async getPubli(pub_ids, idx, aliases) {
       try {
         this.idx = idx
         this.pub_count = pub_ids.length
         const publi_id = pub_ids[idx]['pub_id']
-        const response = await axios.get(`${this.baseUrl}/publi`, { params: { publi_id: publi_id } })
-        res = response.data.hits.hits[0]
-        res.coauthors = res._source.authors.map(function(o) { return o.full_name}).filter(function(fn) { return aliases.indexOf(fn) < 0 }).join("; ")
+        if (this.selectedAuthor.digest_pages) {
+          const first = await this.getDigestPage(0)
+          const page = await this.getDigestPage(Math.floor(idx / first.page_size))
+          res = { _id: publi_id, _source: page.publis[idx % first.page_size] }
+          res.coauthors = res._source.authors.filter(function(fn) { return aliases.indexOf(fn) < 0 }).join("; ")
+          if (res._source.truncated) {
+            // The digest only has the beginning of the abstract
+            this.getFullPubli(publi_id).then(full => {
+              if (this.currentPubli && this.currentPubli._id === publi_id) {
+                this.currentPubli.abstract = full._source.abstract
+              }
+            })
+          }
+        } else {
+          res = await this.getFullPubli(publi_id)
+          res.coauthors = res._source.authors.map(function(o) { return o.full_name}).filter(function(fn) { return aliases.indexOf(fn) < 0 }).join("; ")
+        }
         res['abstract'] = res._source.abstract ? res._source.abstract 
         : "<em>Non disponible (cliquer sur le titre de la publication pour la consulter)</em>"
         return res
@@ -13191,6 +165,8 @@ const vm = new Vue ({
       try {
         document.body.style.overflow = 'hidden'
         this.selectedAuthor = searchHit._source
+        this.selectedAuthorId = searchHit._id
+        this.digestPages = {}
         this.currentPubli = await this.getPubli(
         	this.selectedAuthor.pub_ids, 
         	0, 
@@ -13230,6 +206,8 @@ const vm = new Vue ({
     closePubliModal () {
       document.body.style.overflow = 'auto'
       this.selectedAuthor = null
+      this.selectedAuthorId = null
+      this.digestPages = {}
       this.modalOpened = false
     },
     truncate(str, n) {
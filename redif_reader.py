@@ -0,0 +1,73 @@
+import codecs
+import metrics
+
+"""
+	Reader shared by all scripts consuming ReDIF files (and the other flat text files of the project).
+
+	Each file is read in a single call, its encoding detected once (from the BOM, or else by sniffing its bytes),
+	and the decoded text split into stripped lines.
+"""
+
+BOMS = [
+	(codecs.BOM_UTF8, 'utf-8-sig'),
+	(codecs.BOM_UTF16_LE, 'utf-16'),
+	(codecs.BOM_UTF16_BE, 'utf-16')
+]
+
+# Number of leading bytes examined to detect UTF-16 files without a BOM
+SNIFF_SIZE = 4096
+
+# Minimal share of NUL bytes among the even or odd offsets of the sample for a file to be read as UTF-16
+UTF16_NUL_RATIO = 0.3
+
+# Encoding used for files which are neither UTF-16 nor valid UTF-8
+FALLBACK_ENCODING = 'latin-1'
+
+'''
+	Detects the encoding of a file's content: BOM first, then NUL bytes (ASCII text encoded in UTF-16 has
+	every other byte set to zero, whereas a stray NUL in a UTF-8 or latin-1 file does not make it UTF-16), UTF-8 otherwise.
+'''
+def detect_encoding(data):
+	for bom, encoding in BOMS:
+		if data.startswith(bom):
+			return encoding
+	sample = data[:SNIFF_SIZE]
+	if b'\x00' in sample:
+		odd_nuls = sample[1::2].count(0)
+		even_nuls = sample[0::2].count(0)
+		threshold = UTF16_NUL_RATIO * (len(sample) // 2)
+		if max(odd_nuls, even_nuls) >= threshold > 0:
+			return 'utf-16-le' if odd_nuls >= even_nuls else 'utf-16-be'
+	return 'utf-8'
+
+def decode(data):
+	encoding = detect_encoding(data)
+	try:
+		return data.decode(encoding)
+	except UnicodeDecodeError:
+		return data.decode(FALLBACK_ENCODING)
+
+'''
+	Splits text the same way as iterating over a file opened in text mode (universal newlines).
+'''
+def split_lines(text):
+	if '\r' in text:
+		text = text.replace('\r\n', '\n').replace('\r', '\n')
+	l = text.split('\n')
+	if l and not l[-1]:
+		l.pop()
+	return l
+
+def read_text(f):
+	with metrics.timer("read"):
+		with open(f, 'rb') as handle:
+			data = handle.read()
+	metrics.count("bytes_read", len(data))
+	with metrics.timer("decode"):
+		return decode(data)
+
+'''
+	Returns an iterator over the stripped lines of a file.
+'''
+def lines(f):
+	return map(str.strip, split_lines(read_text(f)))
@@ -3,6 +3,7 @@ const Router = require('koa-router')
 const joi = require('joi')
 const validate = require('koa-joi-validate')
 const search = require('./search')
+const suggest = require('./suggest')
 
 const app = new Koa()
 const router = new Router()
@@ -48,6 +49,37 @@ router.get('/publi',
   }
 )
 
+router.get('/digest',
+  validate({
+    query: {
+      author_id: joi.string().max(256).required(),
+      page: joi.number().integer().min(0).default(0)
+    }
+  }),
+  async (ctx, next) => {
+    const { author_id, page } = ctx.request.query
+    const digest = await search.getDigest(author_id, page)
+    if (digest) {
+      ctx.body = digest
+    } else {
+      ctx.status = 404
+    }
+  }
+)
+
+router.get('/suggest',
+  validate({
+    query: {
+      prefix: joi.string().max(256).required(),
+      limit: joi.number().integer().min(1).max(suggest.maxSuggestions).default(suggest.maxSuggestions)
+    }
+  }),
+  async (ctx, next) => {
+    const { prefix, limit } = ctx.request.query
+    ctx.body = suggest.suggest(prefix, limit)
+  }
+)
+
 const port = process.env.PORT || 3000
 
 app
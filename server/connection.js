@@ -2,6 +2,7 @@ const elasticsearch = require('elasticsearch')
 
 const index_publi = 'publication_a'
 const index_author = 'author_a'
+const index_digest = 'author_digest_a'
 const port = 9200
 const host = process.env.ES_HOST || 'localhost'
 const client = new elasticsearch.Client({ host: { host, port } })
@@ -24,5 +25,5 @@ async function checkConnection () {
 
 
 module.exports = {
-  client, index_publi, index_author, checkConnection
+  client, index_publi, index_author, index_digest, checkConnection
 }
\ No newline at end of file
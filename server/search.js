@@ -1,4 +1,4 @@
-const { client, index_publi, index_author, checkConnection } = require('./connection')
+const { client, index_publi, index_author, index_digest, checkConnection } = require('./connection')
 
 module.exports = {
   queryTerm (term, offset = 0) {
@@ -36,5 +36,16 @@ module.exports = {
       }
     }
     return client.search({ index: index_publi, body: body })
-  }  
+  },
+
+  // Returns a page of the publication digest of an author, or null if there is none
+  async getDigest (author_id, page = 0) {
+    try {
+      const response = await client.get({ index: index_digest, id: `${author_id}:${page}` })
+      return response._source
+    } catch (err) {
+      if (err.status === 404) return null
+      throw err
+    }
+  }
 }
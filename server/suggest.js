@@ -0,0 +1,93 @@
+const fs = require('fs')
+const path = require('path')
+
+// Built by suggestions.py
+const suggestionsFile = process.env.SUGGESTIONS_FILE || path.join(__dirname, '..', 'suggestions.json')
+const maxSuggestions = 10
+const shortPrefixLength = 2
+// Sorts after every character of a normalized key (see KEY_END in suggestions.py)
+const keyEnd = '\x7f'
+// Number of suggestion types (TYPES in suggestions.py)
+const typeCount = 3
+
+let index = null
+
+function loadIndex () {
+  if (!index) {
+    index = JSON.parse(fs.readFileSync(suggestionsFile, 'utf8'))
+    console.log(`Loaded ${index.labels.length} suggestions from ${suggestionsFile}`)
+  }
+  return index
+}
+
+// Reloaded when rebuilt
+fs.watchFile(suggestionsFile, () => { index = null })
+
+// Must be kept in sync with normalize() in suggestions.py
+function normalize (s) {
+  return s.toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g, '').replace(/[^a-z0-9]+/g, ' ').trim()
+}
+
+function lowerBound (keys, q) {
+  let lo = 0
+  let hi = keys.length
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1
+    if (keys[mid] < q) lo = mid + 1
+    else hi = mid
+  }
+  return lo
+}
+
+function bestRanks (labels, ids, limit) {
+  const counts = {}
+  const result = []
+  for (const i of ids) {
+    const type = labels[i][0]
+    counts[type] = counts[type] || 0
+    if (counts[type] < limit) {
+      counts[type] += 1
+      result.push(i)
+      if (result.length === limit * typeCount) break
+    }
+  }
+  return result
+}
+
+// Best ranks of each type among those of a range of keys (a label may be found under several keys), kept in sorted
+// arrays of at most limit ranks instead of gathering and sorting the ranks of the whole range
+function bestRanksInRange (labels, ids, lo, hi, limit) {
+  const best = {}
+  for (let k = lo; k < hi; k++) {
+    const i = ids[k]
+    const type = labels[i][0]
+    const ranks = best[type] || (best[type] = [])
+    if ((ranks.length < limit || i < ranks[ranks.length - 1]) && !ranks.includes(i)) {
+      let j = ranks.length
+      while (j > 0 && ranks[j - 1] > i) j--
+      ranks.splice(j, 0, i)
+      if (ranks.length > limit) ranks.pop()
+    }
+  }
+  return [].concat(...Object.values(best)).sort((a, b) => a - b)
+}
+
+module.exports = {
+  maxSuggestions,
+
+  // Returns the suggestions for a prefix, at most limit of each type, best ranked first
+  suggest (prefix, limit = maxSuggestions) {
+    const { labels, keys, ids, top } = loadIndex()
+    const q = normalize(prefix)
+    if (!q) return []
+    let ranks
+    if (q.length <= shortPrefixLength) {
+      ranks = top[q] || []
+    } else {
+      const lo = lowerBound(keys, q)
+      const hi = lowerBound(keys, q + keyEnd)
+      ranks = bestRanksInRange(labels, ids, lo, hi, limit)
+    }
+    return bestRanks(labels, ranks, limit).map(i => ({ type: labels[i][0], label: labels[i][1] }))
+  }
+}
@@ -0,0 +1,209 @@
+#!/usr/bin/python3
+import os, re, sys, json, heapq, argparse, logging, unicodedata
+from bisect import bisect_left
+from collections import Counter
+from redif_reader import lines
+from normalize_institutions import hash_institution
+
+"""
+	Auto-completion suggestions of the search bar, served by the /suggest endpoint of the API (server/suggest.js).
+
+	Suggestions are of three types: JEL topics (English and French labels, as indexed), institutions (from
+	top_institutions and registered_institutions, i.e. the output of normalize_institutions) and authors (from
+	the author index). Each label is indexed under every word it contains, i.e. under the normalized suffixes of
+	its label starting at a word (so that "econ" suggests "Labor Economics"), in a sorted array of keys where
+	the range of keys starting with a prefix is found by binary search. Labels are ranked by type, then
+	popularity: the number of authorships of the JEL topic, the number of authors currently affiliated with the
+	institution, or the influence of the author. The best suggestions for prefixes of at most SHORT_PREFIX_LENGTH
+	characters, which match too many keys, are computed beforehand; those of longer prefixes are selected with
+	a bounded heap per type while scanning their range of keys.
+
+	Usage: python3 suggestions.py [--output suggestions.json] [--query PREFIX]
+	Builds the suggestion index from the author index, or only prints the suggestions for a prefix.
+"""
+
+SUGGESTIONS_FILE = 'suggestions.json'
+
+INSTITUTION_FILES = ['top_institutions', 'registered_institutions']
+
+TYPES = ["jel", "institution", "author"]
+
+# Maximum number of suggestions of each type returned for a prefix
+MAX_SUGGESTIONS = 10
+
+# Prefixes up to that length are answered from precomputed suggestions
+SHORT_PREFIX_LENGTH = 2
+
+# Only the most influential authors are suggested
+MAX_AUTHOR_SUGGESTIONS = 100000
+
+RE_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+# Sorts after every character of a normalized key, so that the keys starting with a prefix q are those in [q, q + KEY_END)
+KEY_END = '\x7f'
+
+'''
+	Normalizes a label or a prefix: lowercase, without accents, words separated by single spaces. Must be kept
+	in sync with normalize() in server/suggest.js.
+'''
+def normalize(s):
+	s = unicodedata.normalize('NFKD', s.lower())
+	s = ''.join([c for c in s if not unicodedata.combining(c)])
+	return RE_NON_ALNUM.sub(' ', s).strip()
+
+'''
+	Returns the keys of a label, i.e. its normalized suffixes starting at each word.
+'''
+def label_keys(label):
+	words = normalize(label).split()
+	return list([' '.join(words[i:]) for i in range(len(words))])
+
+def yield_institutions(paths=INSTITUTION_FILES):
+	for path in paths:
+		for l in lines(path):
+			if l:
+				yield l
+
+'''
+	Reads the popularity of JEL topics and institutions, and the influence of authors, from the author index.
+	Returns a triple (JEL label counts, institution hash counts, list of pairs (author name, influence)).
+'''
+def read_author_index(client, index):
+	from elasticsearch.helpers import scan
+	jel_counts, inst_counts, authors = Counter(), Counter(), []
+	for hit in scan(client, scroll='60m', index=index, query={ "query": { "match_all": {} } },
+		_source=["full_name", "influence", "current_institution", "specialties"]):
+		doc = hit["_source"]
+		if doc.get("full_name"):
+			authors.append((doc["full_name"].strip(), doc.get("influence", 0)))
+		if doc.get("current_institution"):
+			inst_counts[hash_institution(doc["current_institution"])] += 1
+		for d in doc.get("specialties", []):
+			jel_counts[d["label"].strip()] += d["count"]
+	return jel_counts, inst_counts, authors
+
+'''
+	Builds the suggestion index, from lists of pairs (label, popularity) for each type. Returns a dict with
+	"labels" (pairs (type, label) ordered by rank), "keys" (sorted), "ids" (rank of the label of each key) and
+	"top" (mapping from short prefix to the ranks of its best suggestions).
+'''
+def build_index(entries):
+	ranked = []
+	for t, pairs in zip(TYPES, entries):
+		best = { }
+		for label, popularity in pairs:
+			label = label.strip()
+			n = normalize(label)
+			if n and (n not in best or popularity > best[n][1]):
+				best[n] = (label, popularity)
+		ranked.extend(sorted([(TYPES.index(t), -popularity, label) for label, popularity in best.values()]))
+	labels = list([(TYPES[t], label) for t, _, label in ranked])
+	pairs = sorted(set([(key, i) for i, (_, label) in enumerate(labels) for key in label_keys(label)]))
+	top = { }
+	for key, i in pairs:
+		for n in range(1, min(SHORT_PREFIX_LENGTH, len(key)) + 1):
+			top.setdefault(key[:n], set()).add(i)
+	top = dict([(prefix, best_ranks(labels, ids)) for prefix, ids in top.items()])
+	return {
+		"labels": labels,
+		"keys": list([key for key, _ in pairs]),
+		"ids": list([i for _, i in pairs]),
+		"top": top
+	}
+
+'''
+	Returns the limit best ranks of each type among a set of label ranks.
+'''
+def best_ranks(labels, ids, limit=MAX_SUGGESTIONS):
+	counts = Counter()
+	result = []
+	for i in sorted(ids):
+		t = labels[i][0]
+		if counts[t] < limit:
+			counts[t] += 1
+			result.append(i)
+			if len(result) == limit * len(TYPES):
+				break
+	return result
+
+'''
+	Returns the limit best ranks of each type among the label ranks of a range of keys (a label may be found under
+	several keys), keeping a bounded max-heap per type instead of gathering and sorting the ranks of the whole range.
+'''
+def best_ranks_in_range(labels, ids, lo, hi, limit=MAX_SUGGESTIONS):
+	heaps = { }
+	for k in range(lo, hi):
+		i = ids[k]
+		heap = heaps.setdefault(labels[i][0], [])
+		if len(heap) < limit:
+			if -i not in heap:
+				heapq.heappush(heap, -i)
+		elif i < -heap[0] and -i not in heap:
+			heapq.heapreplace(heap, -i)
+	return sorted([-i for heap in heaps.values() for i in heap])
+
+class Suggester:
+	def __init__(self, index):
+		self.index = index
+
+	'''
+		Returns the suggestions for a prefix, as a list of pairs (type, label), at most limit of each type.
+	'''
+	def suggest(self, prefix, limit=MAX_SUGGESTIONS):
+		q = normalize(prefix)
+		if not q:
+			return []
+		if len(q) <= SHORT_PREFIX_LENGTH:
+			ids = self.index["top"].get(q, [])
+		else:
+			keys = self.index["keys"]
+			lo = bisect_left(keys, q)
+			hi = bisect_left(keys, q + KEY_END, lo)
+			ids = best_ranks_in_range(self.index["labels"], self.index["ids"], lo, hi, limit)
+		counts = Counter()
+		result = []
+		for i in ids:
+			t, label = self.index["labels"][i]
+			if counts[t] < limit:
+				counts[t] += 1
+				result.append((t, label))
+		return result
+
+def save_index(index, path=SUGGESTIONS_FILE):
+	tmp = path + ".tmp"
+	with open(tmp, 'w') as f:
+		json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+	os.replace(tmp, path)
+
+def load_index(path=SUGGESTIONS_FILE):
+	with open(path) as f:
+		return json.load(f)
+
+'''
+	Builds the suggestion index from jel_map, the institution lists and the author index.
+'''
+def build_suggestions(client, index):
+	from index_publis import JEL_CODEMAP_EN, JEL_CODEMAP_FR
+	jel_counts, inst_counts, authors = read_author_index(client, index)
+	# Specialties are counted under the French JEL labels
+	jel = list([(label, jel_counts[JEL_CODEMAP_FR[code].strip()]) for code in JEL_CODEMAP_EN
+		for label in [JEL_CODEMAP_EN[code], JEL_CODEMAP_FR[code]]])
+	institutions = list([(inst, inst_counts[hash_institution(inst)]) for inst in yield_institutions()])
+	authors = sorted(authors, key=lambda a: -a[1])[:MAX_AUTHOR_SUGGESTIONS]
+	return build_index([jel, institutions, authors])
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Builds the suggestion index of the search bar")
+	parser.add_argument("--output", default=SUGGESTIONS_FILE)
+	parser.add_argument("--query", help="Only prints the suggestions for a prefix, from an existing suggestion index")
+	args = parser.parse_args()
+	if args.query:
+		for t, label in Suggester(load_index(args.output)).suggest(args.query):
+			print("{}\t{}".format(t, label))
+		sys.exit(0)
+	import local_search
+	from index_authors import ES_INDEX_AUTHOR
+	client = local_search.create_client(os.environ.get('ECONFAST_BACKEND', 'es'))
+	index = build_suggestions(client, ES_INDEX_AUTHOR)
+	save_index(index, args.output)
+	print("Wrote {} suggestions ({} keys) to {}".format(len(index["labels"]), len(index["keys"]), args.output))
@@ -0,0 +1,175 @@
+#!/usr/bin/python3
+import re, sys, argparse
+from redif_reader import lines
+
+"""
+	Institution acronyms, compiled from a single source: the synonyms_inst file, itself derived from
+	registered_institutions (build_synonyms_inst.sh now runs this script).
+
+	Acronyms are expanded when author documents are built, in one pass over the text with an Aho-Corasick
+	automaton, and the synonym filter of the ES mapping is generated from the same rules.
+
+	Usage: python3 synonyms.py [--check]
+	Rebuilds synonyms_inst from registered_institutions, or only checks that it is up to date.
+"""
+
+SYNONYMS_FILE = 'synonyms_inst'
+
+INSTITUTIONS_FILE = 'registered_institutions'
+
+RE_ACRONYM_FIELD = re.compile(r"\([A-Z]+\)")
+
+# Rules which can't be derived from registered_institutions
+EXTRA_RULES = [
+	"Banque de France => Bank of France",
+	"BdF => Bank of France"
+]
+
+# Acronyms with more expansions than that are ambiguous, and are not expanded in documents
+MAX_EXPANSIONS = 1
+
+'''
+	Derives a synonym rule from an institution name ending with its acronym, either as "Name (ACRONYM)" or as
+	"Name - ACRONYM". Returns None for other names.
+'''
+def derive_rule(inst):
+	fields = inst.split()
+	if len(fields) >= 1 and RE_ACRONYM_FIELD.search(fields[-1]):
+		return "{} => {}".format(fields[-1][1:-1], ' '.join(fields[:-1]))
+	if len(fields) >= 2 and fields[-2] == "-":
+		return "{} => {}".format(fields[-1], ' '.join(fields[:-2]))
+	return None
+
+def derive_rules(institutions):
+	return sorted(set(list(filter(None, [derive_rule(inst) for inst in institutions])) + EXTRA_RULES))
+
+'''
+	Parses synonym rules ("ACRONYM => Expansion") into pairs (acronym, expansion).
+'''
+def parse_rules(rules):
+	pairs = []
+	for rule in rules:
+		if "=>" not in rule:
+			continue
+		acronym, expansion = [s.strip() for s in rule.split("=>", 1)]
+		if acronym and expansion:
+			pairs.append((acronym, expansion))
+	return pairs
+
+def load_rules(path=SYNONYMS_FILE):
+	return list([l for l in lines(path) if l])
+
+'''
+	Synonym token filter of the ES mapping, generated from the synonym rules.
+'''
+def synonym_filter(path=SYNONYMS_FILE):
+	return { "type": "synonym", "synonyms": load_rules(path) }
+
+def is_word_char(c):
+	return c.isalnum() or c == '_'
+
+'''
+	Aho-Corasick automaton matching a set of patterns in a text in a single pass. Only whole-word occurrences
+	are reported, the longest one winning among overlapping occurrences.
+'''
+class AhoCorasick:
+	def __init__(self, patterns):
+		self.goto = [{ }]
+		self.fail = [0]
+		self.out = [None]
+		for p in patterns:
+			s = 0
+			for c in p:
+				nxt = self.goto[s].get(c)
+				if nxt is None:
+					nxt = len(self.goto)
+					self.goto[s][c] = nxt
+					self.goto.append({ })
+					self.fail.append(0)
+					self.out.append(None)
+				s = nxt
+			self.out[s] = p
+		# Breadth-first computation of the failure links, the output of a state being the longest pattern
+		# ending there (or at one of its suffixes)
+		queue = list(self.goto[0].values())
+		while queue:
+			s = queue.pop(0)
+			for c, t in self.goto[s].items():
+				queue.append(t)
+				f = self.fail[s]
+				while f and c not in self.goto[f]:
+					f = self.fail[f]
+				self.fail[t] = self.goto[f].get(c, 0) if self.goto[f].get(c) != t else 0
+				if self.out[t] is None:
+					self.out[t] = self.out[self.fail[t]]
+
+	'''
+		Yields the whole-word occurrences of the patterns as triples (start, end, pattern), from left to right.
+	'''
+	def find(self, text):
+		s = 0
+		candidates = []
+		for i, c in enumerate(text):
+			while s and c not in self.goto[s]:
+				s = self.fail[s]
+			s = self.goto[s].get(c, 0)
+			t = s
+			while t and self.out[t] is not None:
+				p = self.out[t]
+				start = i + 1 - len(p)
+				if (start == 0 or not is_word_char(text[start - 1])) and (i + 1 == len(text) or not is_word_char(text[i + 1])):
+					candidates.append((start, i + 1, p))
+					break
+				t = self.fail[t]
+		end = 0
+		for start, stop, p in sorted(candidates, key=lambda m: (m[0], -m[1])):
+			if start >= end:
+				yield start, stop, p
+				end = stop
+
+class AcronymExpander:
+	def __init__(self, pairs):
+		expansions = { }
+		for acronym, expansion in pairs:
+			l = expansions.setdefault(acronym, [])
+			if expansion not in l:
+				l.append(expansion)
+		self.expansions = dict([(acronym, l) for acronym, l in expansions.items() if len(l) <= MAX_EXPANSIONS])
+		self.automaton = AhoCorasick(self.expansions.keys())
+
+	'''
+		Inserts the expansions of the acronyms found in a text right after them, unless already in the text.
+	'''
+	def expand(self, text):
+		out = []
+		last = 0
+		for start, end, acronym in self.automaton.find(text):
+			added = list([e for e in self.expansions[acronym] if e not in text])
+			if added:
+				out.append(text[last:end])
+				out.append(" " + " ".join(added))
+				last = end
+		if last == 0:
+			return text
+		out.append(text[last:])
+		return ''.join(out)
+
+def load_expander(path=SYNONYMS_FILE):
+	return AcronymExpander(parse_rules(load_rules(path)))
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Builds the institution synonyms file from registered_institutions")
+	parser.add_argument("--check", action="store_true", help="Only check that the synonyms file is up to date")
+	args = parser.parse_args()
+	rules = derive_rules(lines(INSTITUTIONS_FILE))
+	if args.check:
+		current = load_rules()
+		if current != rules:
+			print("{} is out of date: {} rules missing, {} rules obsolete".format(SYNONYMS_FILE,
+				len(set(rules) - set(current)), len(set(current) - set(rules))))
+			sys.exit(1)
+		print("{} is up to date ({} rules)".format(SYNONYMS_FILE, len(rules)))
+	else:
+		with open(SYNONYMS_FILE, 'w') as f:
+			f.write(''.join([r + '\n' for r in rules]))
+		print("Wrote {} rules to {}".format(len(rules), SYNONYMS_FILE))
@@ -0,0 +1,146 @@
+#!/usr/bin/python3
+import os, io, sys, random, argparse
+from itertools import accumulate
+from redif_reader import lines
+
+"""
+	Generator of synthetic RePEc archives, used by the tests and the benchmarks instead of a real RePEc mirror.
+
+	The archives follow the layout of repec_data/data (<archive>/<series>/<file>.rdf) and contain articles and
+	papers (plus a few records of other templates, which are skipped by the parser), multi-author records with
+	name variants of recurring authors, affiliations, JEL codes, keywords, abstracts spanning several lines,
+	UTF-16 encoded files and malformed lines.
+"""
+
+SYLLABLES = ["an", "ba", "ber", "ca", "chi", "da", "del", "er", "fa", "gar", "ha", "ito", "ja", "ka", "lin", "lo",
+	"ma", "mar", "no", "ol", "pe", "ra", "ri", "sa", "son", "ta", "tin", "to", "va", "ver", "wa", "yo", "zu"]
+
+WORDS = ["market", "monetary", "policy", "growth", "labor", "trade", "inflation", "credit", "risk", "bank", "firm",
+	"household", "welfare", "tax", "price", "equilibrium", "model", "evidence", "panel", "data", "shock", "income",
+	"inequality", "health", "education", "energy", "climate", "finance", "insurance", "auction", "contract", "game"]
+
+TEMPLATES = ["ReDIF-Article 1.0", "ReDIF-Paper 1.0"]
+
+OTHER_TEMPLATES = ["ReDIF-Book 1.0", "ReDIF-Software 1.0"]
+
+MALFORMED_LINES = [
+	"this line has no field",
+	"Creation-Date: sometime in spring",
+	"Author-Name:",
+	"Classification-JEL: ;;",
+	":::",
+	"\t"
+]
+
+def random_name_token(rnd, syllables):
+	return ''.join([rnd.choice(SYLLABLES) for _ in range(syllables)]).capitalize()
+
+'''
+	Creates a population of authors as (first names, last name) pairs.
+'''
+def author_population(rnd, size):
+	authors = []
+	for _ in range(size):
+		first = [random_name_token(rnd, rnd.randint(1, 3)) for _ in range(rnd.choice([1, 1, 1, 2]))]
+		authors.append((first, random_name_token(rnd, rnd.randint(2, 4))))
+	return authors
+
+'''
+	Spells an author's name the way it may appear in ReDIF files.
+'''
+def name_variant(rnd, first, last):
+	r = rnd.random()
+	if r < 0.6:
+		return "{} {}".format(' '.join(first), last)
+	if r < 0.8:
+		return "{}, {}".format(last, ' '.join(first))
+	if r < 0.9:
+		return "{} {}".format(' '.join([f[0] + '.' for f in first]), last)
+	return "{} {}. {}".format(first[0], rnd.choice("ABCDEFGHJKLMNPRSTW"), last)
+
+def load_jel_codes():
+	return list([l.split("|")[1].strip() for l in lines("jel_map") if l.count("|") >= 2])
+
+def load_institutions():
+	return list([l for l in lines("registered_institutions") if l])
+
+def sentence(rnd, n):
+	return ' '.join([rnd.choice(WORDS) for _ in range(n)]).capitalize()
+
+def record(rnd, ctx, handle):
+	out = []
+	tpl = rnd.choice(OTHER_TEMPLATES) if rnd.random() < ctx["other_ratio"] else rnd.choice(TEMPLATES)
+	out.append("Template-Type: {}".format(tpl))
+	for _ in range(min(1 + int(rnd.expovariate(0.8)), 12)):
+		first, last = rnd.choices(ctx["authors"], cum_weights=ctx["author_weights"])[0]
+		out.append("Author-Name: {}".format(name_variant(rnd, first, last)))
+		if rnd.random() < 0.3:
+			out.append("Author-Name-First: {}".format(' '.join(first)))
+			out.append("Author-Name-Last: {}".format(last))
+		if rnd.random() < 0.6:
+			out.append("Author-Workplace-Name: {}".format(rnd.choice(ctx["institutions"])))
+		if rnd.random() < 0.2:
+			out.append("Author-Email: {}@example.org".format(last.lower()))
+	out.append("Title: {}".format(sentence(rnd, rnd.randint(4, 12))))
+	if rnd.random() < 0.7:
+		out.append("Abstract: {}.".format(sentence(rnd, rnd.randint(10, 25))))
+		for _ in range(rnd.randint(0, 4)):
+			out.append(" {}.".format(sentence(rnd, rnd.randint(10, 25)).lower()))
+	if rnd.random() < 0.8:
+		out.append("Creation-Date: {}-{:02d}".format(rnd.randint(1960, 2020), rnd.randint(1, 12)))
+	if rnd.random() < 0.6:
+		out.append("Classification-JEL: {}".format(', '.join(rnd.sample(ctx["jel_codes"], rnd.randint(1, 4)))))
+	if rnd.random() < 0.5:
+		out.append("Keywords: {}".format('; '.join(rnd.sample(WORDS, rnd.randint(1, 5)))))
+	if rnd.random() < 0.5:
+		out.append("File-URL: https://example.org/{}.pdf".format(handle.replace(":", "/")))
+	if rnd.random() < ctx["malformed_ratio"]:
+		out.insert(rnd.randint(1, len(out)), rnd.choice(MALFORMED_LINES))
+	out.append("Handle: {}".format(handle))
+	return out, tpl in TEMPLATES
+
+'''
+	Writes a synthetic corpus of the given number of records under the root directory, and returns statistics
+	about it (files written, records written, records accepted by the parser).
+'''
+def generate(root, publications, seed=0, publis_per_file=50, files_per_series=20, series_per_archive=5,
+		utf16_ratio=0.05, malformed_ratio=0.05, other_ratio=0.02, author_count=None):
+	rnd = random.Random(seed)
+	authors = author_population(rnd, author_count or max(100, publications // 3))
+	ctx = {
+		"authors": authors,
+		# Skewed (Zipf-like) author popularity, so that prolific authors sign many publications
+		"author_weights": list(accumulate([1.0 / (rank + 10) for rank in range(len(authors))])),
+		"institutions": load_institutions(),
+		"jel_codes": load_jel_codes(),
+		"malformed_ratio": malformed_ratio,
+		"other_ratio": other_ratio
+	}
+	stats = { "files": 0, "records": 0, "accepted": 0 }
+	while stats["records"] < publications:
+		archive = "a{:04d}".format(stats["files"] // (files_per_series * series_per_archive))
+		series = "s{:02d}".format((stats["files"] // files_per_series) % series_per_archive)
+		d = os.path.join(root, archive, series)
+		os.makedirs(d, exist_ok=True)
+		out = []
+		for i in range(min(publis_per_file, publications - stats["records"])):
+			rec, accepted = record(rnd, ctx, "RePEc:{}:{}:{}".format(archive, series, stats["records"]))
+			out.extend(rec)
+			out.append("")
+			stats["records"] += 1
+			stats["accepted"] += 1 if accepted else 0
+		encoding = 'utf-16' if rnd.random() < utf16_ratio else 'utf-8'
+		with io.open(os.path.join(d, "f{:05d}.rdf".format(stats["files"])), 'w', encoding=encoding) as f:
+			f.write('\n'.join(out))
+		stats["files"] += 1
+	return stats
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Generates a synthetic RePEc corpus")
+	parser.add_argument("root", help="Output directory")
+	parser.add_argument("--publications", type=int, default=10000)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--utf16-ratio", type=float, default=0.05)
+	parser.add_argument("--malformed-ratio", type=float, default=0.05)
+	args = parser.parse_args()
+	print(generate(args.root, args.publications, args.seed, utf16_ratio=args.utf16_ratio, malformed_ratio=args.malformed_ratio))
@@ -1,4 +1,12 @@
-import unittest, json
+import unittest, json, io, os, tempfile, threading, time
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from unittest import mock
+from collections import defaultdict, Counter
+import redif_reader, local_search, synthetic_repec, index_publis, index_authors, image_crawl, image_analysis, logo_store, institution_resolver, synonyms, author_disambiguation, influence, suggestions, bulk_sink, metrics, profiling, cli
+import pstats, argparse, subprocess, sys, glob, lazy, publi_reader, coauthor_graph
+from datetime import datetime
+from elasticsearch.exceptions import TransportError
+import numpy as np, cv2
 from index_publis import *
 from index_authors import *
 
@@ -7,6 +15,47 @@ ABSTRACT_0 = u"The aim of this article is to discuss how to increase employment
 
 class TestEconFast(unittest.TestCase):
 
+    # Replaces a module global for the duration of the test
+    def patch(self, module, name, value):
+        patcher = mock.patch.object(module, name, value)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    # Local search client used by both indexers for the duration of the test (with an empty publication index), without
+    # picture crawling nor leftover author specialties
+    def local_client(self):
+        client = local_search.create_client("local")
+        self.patch(index_publis, "ES", client)
+        self.patch(index_authors, "ES", client)
+        self.patch(index_authors, "CRAWL_AUTHOR_PICS", False)
+        self.patch(index_authors, "AUTHOR_SPECIALTIES", defaultdict(Counter))
+        self.patch(index_publis, "INST_COUNTER", Counter())
+        client.indices.create(index=ES_INDEX_PUBLI, body=MAPPING_PUBLI)
+        return client
+
+    # Empties the author index (and the digest index) before a new build
+    def reset_authors(self, client):
+        index_authors.AUTHOR_SPECIALTIES.clear()
+        for index in [ES_INDEX_AUTHOR, index_authors.ES_INDEX_DIGEST]:
+            if client.indices.exists(index=index):
+                client.indices.delete(index=index)
+        client.indices.create(index=ES_INDEX_AUTHOR, body=MAPPING_AUTHOR.resolve())
+
+    # Summaries of the indexed author documents by author ID, compared across builds. Co-authors tied on co-publications
+    # at the MAX_COAUTHORS cut are picked in order of appearance, so only their number is compared unless exact_coauthors
+    def author_summaries(self, client, exact_coauthors=True):
+        hits = client.search(index=ES_INDEX_AUTHOR, body={ "size": 10000, "query": { "match_all": { } } })["hits"]["hits"]
+        def coauthors(doc):
+            l = sorted([(c["coauthor_hash"], c["coauthor_name"], c["copublications"]) for c in doc.get("coauthors", [])])
+            return l if exact_coauthors else len(l)
+        return dict([(h["_id"], {
+            "pub_ids": sorted([t["pub_id"] for t in h["_source"]["pub_ids"]]),
+            "aliases": sorted(h["_source"]["aliases"]),
+            "titles": sorted(h["_source"].get("titles", "").split()),
+            "influence": h["_source"]["influence"],
+            "coauthors": coauthors(h["_source"])
+        }) for h in hits])
+
     def test_parse_journal_file(self):
         path = "repec_data/data/aae/journl/vol12.rdf"
         publis = list(parse_repec_file(path))
@@ -43,5 +92,544 @@ class TestEconFast(unittest.TestCase):
       hashes = set([hash_name(full_name) for full_name in aliases])
       self.assertEqual(len(hashes), 1, "Found several hashes: {}".format(hashes))      
 
+    def test_read_encodings(self):
+        content = u"Template-Type: ReDIF-Article 1.0\r\nTitle: Économie  \nAuthor-Name: Jean Tirole\n"
+        for encoding in ["utf-8", "utf-8-sig", "utf-16", "utf-16-le", "latin-1"]:
+            with tempfile.NamedTemporaryFile(suffix=".rdf", delete=False) as f:
+                f.write(content.encode(encoding))
+            try:
+                self.assertEqual(list(redif_reader.lines(f.name)), 
+                    ["Template-Type: ReDIF-Article 1.0", u"Title: Économie", "Author-Name: Jean Tirole"], encoding)
+            finally:
+                os.unlink(f.name)
+        # A stray NUL byte does not turn a UTF-8 or latin-1 file into UTF-16
+        for encoding in ["utf-8", "latin-1"]:
+            data = content.encode(encoding).replace(b"Jean", b"Je\x00an")
+            self.assertEqual(redif_reader.detect_encoding(data), "utf-8", encoding)
+            self.assertEqual(redif_reader.split_lines(redif_reader.decode(data))[1], u"Title: Économie  ", encoding)
+        self.assertEqual(redif_reader.detect_encoding(content.encode("utf-16-be")), "utf-16-be")
+
+    def test_parse_synthetic_corpus(self):
+        with tempfile.TemporaryDirectory() as d:
+            stats = synthetic_repec.generate(d, 500, seed=1, publis_per_file=20, utf16_ratio=0.2)
+            files = list(index_publis.yield_repec_files(d))
+            publis = [obj for f in files for obj in parse_repec_file(f)]
+            # The parallel parser yields the same publications with a single chunk in flight
+            with index_publis.Pool(2) as pool:
+                parallel = [obj for f, objs in index_publis.yield_parsed_files_parallel(files, pool, 1) for obj in objs]
+            self.assertEqual(sorted([obj["title"] for obj in parallel]), sorted([obj["title"] for obj in publis]))
+        self.assertEqual(len(files), stats["files"])
+        self.assertEqual(len(publis), stats["accepted"])
+        self.assertTrue(all([len(obj["authors"]) > 0 and "title" in obj for obj in publis]))
+
+    def test_local_pipeline(self):
+        client = self.local_client()
+        client.indices.create(index=ES_INDEX_AUTHOR, body=MAPPING_AUTHOR.resolve())
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "test.rdf")
+            with io.open(path, "w", encoding="utf-8") as f:
+                f.write(u"Template-Type: ReDIF-Article 1.0\nAuthor-Name: Stiglitz, Joseph E.\nAuthor-Workplace-Name: Columbia University\n"
+                    + u"Author-Name: Bruce Greenwald\nTitle: Credit rationing\nCreation-Date: 1981-06\n\n"
+                    + u"Template-Type: ReDIF-Paper 1.0\nAuthor-Name: Joseph E. Stiglitz\nTitle: Information and economic analysis\n")
+            index_publis.index_repec_files([path])
+        client.indices.refresh(index=ES_INDEX_PUBLI)
+        index_authors.index_authors_in_memory()
+        resp = client.search(index=ES_INDEX_AUTHOR, body=local_search.author_query("columbia"))
+        self.assertEqual([h["_id"] for h in resp["hits"]["hits"]], ["joseph e stiglitz"])
+        hits = client.search(index=ES_INDEX_AUTHOR, body=local_search.author_query("stiglitz"))["hits"]["hits"]
+        self.assertEqual([h["_id"] for h in hits], ["joseph e stiglitz"])
+        self.assertEqual(hits[0]["_source"]["full_name"], "Joseph E. Stiglitz")
+        self.assertEqual(len(hits[0]["_source"]["pub_ids"]), 2)
+        self.assertEqual(hits[0]["_source"]["coauthors"][0]["coauthor_name"], "Bruce Greenwald")
+        self.assertEqual(hits[0]["_source"]["institution_ids"], ["columbia university"])
+        digest = client.get(index=index_authors.ES_INDEX_DIGEST, id="joseph e stiglitz:0")["_source"]
+        self.assertEqual(digest["pages"], 1)
+        self.assertEqual([p["pub_id"] for p in digest["publis"]], [t["pub_id"] for t in hits[0]["_source"]["pub_ids"]])
+        self.assertIn("Bruce Greenwald", [p for p in digest["publis"] if p["title"] == "Credit rationing"][0]["authors"])
+        # Returned sources are copies, and a scroll keeps the documents as they were when it started
+        hits[0]["_source"]["full_name"] = "Changed"
+        body = { "size": 1, "query": { "match_all": { } }, "sort": ["_id"] }
+        sources = [h["_source"] for h in client.search(index=ES_INDEX_PUBLI, body=dict(body, size=2))["hits"]["hits"]]
+        resp = client.search(index=ES_INDEX_PUBLI, body=body, scroll="1m")
+        for h in client.search(index=ES_INDEX_PUBLI, body=dict(body, size=2))["hits"]["hits"]:
+            client.update(index=ES_INDEX_PUBLI, id=h["_id"], body={ "doc": { "type": "Edited" } })
+        scrolled = client.scroll(scroll_id=resp["_scroll_id"])["hits"]["hits"]
+        self.assertEqual([h["_source"] for h in resp["hits"]["hits"] + scrolled], sources)
+        self.assertEqual(client.get(index=ES_INDEX_AUTHOR, id="joseph e stiglitz")["_source"]["full_name"], "Joseph E. Stiglitz")
+        # Paging with search_after sorts the matches once, until the index changes
+        client.index(index=ES_INDEX_PUBLI, id="no_title", body={ "type": "Edited" })
+        client.index(index=ES_INDEX_PUBLI, id="0", body={ "title": "A", "type": "Edited" })
+        body = { "size": 1, "query": { "term": { "type": "Edited" } }, "sort": [{ "title": "desc" }, "_id"] }
+        expected = [h["_id"] for h in client.search(index=ES_INDEX_PUBLI, body=dict(body, size=10))["hits"]["hits"]]
+        with mock.patch.object(local_search.LocalIndex, "sorted_hits", autospec=True, side_effect=local_search.LocalIndex.sorted_hits) as sorted_hits:
+            pages = []
+            while not pages or pages[-1]:
+                after = { "search_after": pages[-1][0]["sort"] } if pages else { }
+                pages.append(client.search(index=ES_INDEX_PUBLI, body=dict(body, **after))["hits"]["hits"])
+            self.assertEqual([h["_id"] for page in pages for h in page], expected)
+            self.assertEqual((len(expected), expected[1], sorted_hits.call_count), (4, "0", 0))
+            client.delete(index=ES_INDEX_PUBLI, id="0")
+            self.assertEqual(len(client.search(index=ES_INDEX_PUBLI, body=dict(body, size=10))["hits"]["hits"]), 3)
+            self.assertEqual(sorted_hits.call_count, 1)
+
+    def test_image_crawl(self):
+        searches = []
+        class StandIn(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.startswith("/search"):
+                    searches.append(self.path)
+                    body = json.dumps({ "images": ["http://{}:{}/img/{}.png".format(*self.server.server_address, i) for i in range(3)] }).encode()
+                else:
+                    body = self.path.encode()
+                self.send_response(200)
+                self.end_headers()
+                self.wfile.write(body)
+            def log_message(self, *args):
+                pass
+        server = HTTPServer(("127.0.0.1", 0), StandIn)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        with tempfile.TemporaryDirectory() as d:
+            backend = image_crawl.create_backend("http://{}:{}".format(*server.server_address))
+            cache = image_crawl.ImageCache(os.path.join(d, "images.sqlite"))
+            queries = [["Jean Tirole"], ["logo", "Toulouse School"], ["jean  tirole"]]
+            limiter = image_crawl.RateLimiter(delay=0)
+            self.assertEqual(image_crawl.crawl(queries, backend, cache, max_images=2, limiter=limiter), (2, 2))
+            self.assertEqual(len(searches), 2)
+            urls = cache.image_urls(["Jean Tirole"])
+            self.assertEqual(len(urls), 2)
+            self.assertEqual(cache.image(urls[1]), b"/img/1.png")
+            cache.close()
+            # A re-run reuses the persisted cache
+            cache = image_crawl.ImageCache(os.path.join(d, "images.sqlite"))
+            self.assertEqual(image_crawl.crawl(queries, backend, cache, limiter=limiter), (0, 0))
+            self.assertEqual(image_crawl.image_urls(["Jean Tirole"], backend, cache), urls)
+            self.assertEqual(len(searches), 2)
+            # The author build only looks pictures up in the cache, searches being left to the crawl stage
+            with mock.patch.object(index_authors, "IMAGE_CRAWL", [backend, cache]), mock.patch.object(index_authors, "CHECK_FACE_PICTURES", False):
+                self.assertEqual(index_authors.fetch_pic_urls("Jean Tirole"), urls)
+                self.assertEqual(index_authors.fetch_pic_urls("Olivier Blanchard"), [])
+            self.assertEqual(len(searches), 2)
+            # Failed downloads are retried once they are old enough
+            cache.put_image("http://example.org/missing.png", None)
+            self.assertTrue(cache.has_image("http://example.org/missing.png"))
+            self.assertFalse(cache.has_image("http://example.org/missing.png", failed_max_age=-1))
+            self.assertTrue(cache.has_image(urls[0], failed_max_age=-1))
+            cache.close()
+        # The browsers of the fetchers are quit
+        quit = []
+        class Browser:
+            def quit(self):
+                quit.append(self)
+        backend = image_crawl.SeleniumBackend()
+        backend.browsers.update({ 1: Browser(), 2: Browser() })
+        backend.close()
+        self.assertEqual((len(quit), backend.browsers), (2, { }))
+        server.shutdown()
+        server.server_close()
+
+    def test_image_verdicts(self):
+        color = np.zeros((900, 1200, 3), dtype=np.uint8)
+        color[:, :, 2] = 200
+        gray = np.full((900, 1200, 3), 120, dtype=np.uint8)
+        images = [cv2.imencode(".png", img)[1].tobytes() for img in [color, gray, color]] + [b"not an image"]
+        with tempfile.TemporaryDirectory() as d:
+            cache = image_analysis.VerdictCache(os.path.join(d, "verdicts.sqlite"))
+            self.assertEqual(image_analysis.verify_images(images, cache, workers=2), 3)
+            self.assertEqual(cache.get(image_analysis.content_hash(images[0])), (0, False))
+            self.assertEqual(cache.get(image_analysis.content_hash(images[1])), (0, True))
+            self.assertEqual(cache.get(image_analysis.content_hash(images[3])), (None, None))
+            self.assertEqual(image_analysis.verify_images(images, cache), 0)
+            self.assertEqual(image_analysis.cached_verdict(images[1], cache), (0, True))
+            cache.close()
+
+    def test_logo_store(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "logos.sqlite")
+            store = logo_store.LogoStore(path)
+            self.assertEqual(store.stale(["Columbia University", "University, Columbia", "Tilburg University"]), ["Columbia University", "Tilburg University"])
+            store.put_all([("Columbia University", ["http://example.org/columbia.png"]), ("Tilburg University", [])])
+            store.close()
+            store = logo_store.LogoStore(path)
+            self.assertEqual(store.get("University, Columbia"), ["http://example.org/columbia.png"])
+            self.assertEqual(store.get("Tilburg University"), [])
+            self.assertIsNone(store.get("Sorbonne"))
+            self.assertEqual(store.stale(["Columbia University", "Tilburg University"]), [])
+            later = time.time() + (logo_store.EMPTY_LOGO_MAX_AGE_DAYS + 1) * logo_store.DAY_SECONDS
+            self.assertTrue(store.is_stale("Tilburg University", later))
+            self.assertFalse(store.is_stale("Columbia University", later))
+            store.close()
+
+    def test_institution_resolver(self):
+        resolver = institution_resolver.InstitutionResolver(["Columbia University", "Columbia College", "New York University",
+            "Department of Economics", "Toulouse School of Economics (TSE)", "University of British Columbia"])
+        self.assertEqual(resolver.resolve("Columbia University"), "columbia university")
+        self.assertEqual(resolver.resolve("University, Columbia"), "columbia university")
+        self.assertEqual(resolver.resolve("Department of Economics, Columbia University, New York"), "columbia university")
+        self.assertEqual(resolver.canonical_name("Toulouse School of Economics"), "Toulouse School of Economics (TSE)")
+        self.assertEqual(resolver.canonical_name("University of British Columbia, Vancouver"), "University of British Columbia")
+        self.assertIsNone(resolver.resolve("Some Unknown Place"))
+        self.assertEqual(resolver.canonical_name("Some Unknown Place"), "Some Unknown Place")
+
+    def test_synonyms(self):
+        self.assertEqual(synonyms.derive_rule("Toulouse School of Economics (TSE)"), "TSE => Toulouse School of Economics")
+        self.assertEqual(synonyms.derive_rule("Observatoire Francais des Conjonctures Economiques - OFCE"), "OFCE => Observatoire Francais des Conjonctures Economiques")
+        self.assertIsNone(synonyms.derive_rule("Columbia University"))
+        self.assertEqual(synonyms.load_rules(), synonyms.derive_rules(lines("registered_institutions")), "synonyms_inst is out of date")
+        automaton = synonyms.AhoCorasick(["he", "she", "hers", "NBER"])
+        self.assertEqual(list(automaton.find("she and hers, NBERx NBER")), [(0, 3, "she"), (8, 12, "hers"), (20, 24, "NBER")])
+        expander = synonyms.AcronymExpander([("TSE", "Toulouse School of Economics"), ("IEA", "International Economic Association"), ("IEA", "International Energy Agency")])
+        self.assertEqual(expander.expand("TSE, Toulouse"), "TSE Toulouse School of Economics, Toulouse")
+        self.assertEqual(expander.expand("Toulouse School of Economics (TSE)"), "Toulouse School of Economics (TSE)")
+        self.assertEqual(expander.expand("IEA"), "IEA")
+
+    def test_author_disambiguation(self):
+        def publi(*authors):
+            return { "authors": [dict([("full_name", a[0])] + ([("institution", a[1])] if len(a) > 1 else [])) for a in authors] }
+        profiles = author_disambiguation.AuthorProfiles()
+        profiles.add_publications([
+            publi(("Joseph E. Stiglitz", "Columbia University"), ("Bruce Greenwald",)),
+            publi(("Joseph E. Stiglitz",), ("Andrew Weiss",)),
+            publi(("J. Stiglitz",), ("Carl Shapiro",)),
+            publi(("Joseph Stiglitz", "Columbia University")),
+            publi(("John Smith", "Tilburg University")),
+            publi(("Jane Smith", "Tilburg University")),
+            publi(("J. Smith", "Tilburg University")),
+            publi(("Joseph E. Stiglits",), ("Andrew Weiss",)),
+            publi(("Joseph E. Stiglitx",))])
+        mapping = author_disambiguation.disambiguate(profiles)
+        self.assertEqual(mapping.get("j stiglitz"), "joseph e stiglitz")
+        self.assertEqual(mapping.get("joseph stiglitz"), "joseph e stiglitz")
+        # Phonetic variants need a shared co-author or institution
+        self.assertEqual(mapping.get("joseph e stiglits"), "joseph e stiglitz")
+        self.assertNotIn("joseph e stiglitx", mapping)
+        # John and Jane Smith can't be merged, and "J. Smith" is ambiguous
+        self.assertNotEqual(mapping.get("john smith", "john smith"), mapping.get("jane smith", "jane smith"))
+        self.assertEqual(author_disambiguation.soundex("stiglitz"), author_disambiguation.soundex("stiglits"))
+        # The alias with the most publications is canonical, unless another one is a top author
+        profiles = author_disambiguation.AuthorProfiles()
+        profiles.add_publications([publi(("Joseph Stiglitz", "Columbia University"))] * 3 + [publi(("Joseph E. Stiglitz", "Columbia University"))])
+        mapping = author_disambiguation.disambiguate(profiles)
+        self.assertEqual(mapping, { "joseph e stiglitz": "joseph stiglitz" })
+        self.assertEqual(author_disambiguation.disambiguate(profiles, influence.load_top_authors()), { "joseph stiglitz": "joseph e stiglitz" })
+        # Top authors are keyed by canonical author ID
+        self.assertIn("joseph stiglitz", influence.load_top_authors(aliases=mapping))
+        aliases = list(index_authors.AUTHOR_ALIASES)
+        index_authors.AUTHOR_ALIASES[:] = [mapping]
+        index_authors.TOP_AUTHORS.reset()
+        try:
+            self.assertEqual(index_authors.TOP_AUTHORS.get("joseph stiglitz"), "http://www.gsb.columbia.edu/faculty/jstiglitz/")
+            self.assertNotIn("joseph e stiglitz", index_authors.TOP_AUTHORS)
+            # The legacy author build merges the aliases of an author, who is not their own co-author
+            client = local_search.create_client("local")
+            with mock.patch.object(index_authors, "ES", client), mock.patch.object(index_authors, "CRAWL_AUTHOR_PICS", False):
+                for name in ["Joseph Stiglitz", "Joseph E. Stiglitz"]:
+                    client.index(index=ES_INDEX_PUBLI, body={ "authors": [{ "full_name": name }, { "full_name": "Bruce Greenwald" }], "title": "Credit rationing" })
+                index_authors.index_authors_from_publis()
+            docs = dict([(h["_source"]["full_name"], h["_source"]) for h in client.search(index=ES_INDEX_AUTHOR, body={ "query": { "match_all": { } } })["hits"]["hits"]])
+            self.assertEqual(sorted(docs), ["Bruce Greenwald", "Joseph E. Stiglitz"])
+            self.assertEqual([(d["coauthor_hash"], d["copublications"]) for d in docs["Joseph E. Stiglitz"]["coauthors"]], [("bruce greenwald", 2)])
+        finally:
+            index_authors.AUTHOR_ALIASES[:] = aliases
+            index_authors.TOP_AUTHORS.reset()
+
+    def test_influence(self):
+        weights = influence.DEFAULT_WEIGHTS
+        rows = [influence.features(100, 10, "Harvard University", True, True, 5, "a", set(["a"]), set(["Harvard University"])),
+            influence.features(1, 0, None, True, False, 1, "b", set(), set())]
+        scores = influence.influence_scores(rows, weights)
+        self.assertAlmostEqual(scores[0], (40 * 2 + 80 * 1 + 400 + 100 + 150 + 50 * 3) * 2)
+        self.assertAlmostEqual(scores[1], 50)
+        # Only the authors whose influence changed are updated
+        client = local_search.LocalSearch()
+        client.index(index="authors", id="a", body={ "pub_ids": [{ "pub_id": "p1" }] * 10, "abstracts": 0, "influence": 40.0 })
+        client.index(index="authors", id="b", body={ "pub_ids": [{ "pub_id": "p2" }], "abstracts": 0, "influence": 0.0 })
+        weights = dict(weights, publications=20)
+        self.assertEqual(influence.update_influence(client, "authors", weights, set(), set()), (2, 1))
+        self.assertEqual(client.get(index="authors", id="a")["_source"]["influence"], 20.0)
+        self.assertEqual(influence.update_influence(client, "authors", weights, set(), set()), (2, 0))
+
+    def test_suggestions(self):
+        index = suggestions.build_index([
+            [("Labor Economics", 30), ("Économie du travail", 30), ("Health Economics", 50)],
+            [("London School of Economics (LSE)", 12), ("University of Economics, Prague", 1)],
+            [("Lawrence Summers", 900.0), ("Larry Smith", 100.0), ("Lawrence  Summers", 50.0)]])
+        suggester = suggestions.Suggester(index)
+        self.assertEqual(suggester.suggest("econ"), [("jel", "Health Economics"), ("jel", "Labor Economics"), ("jel", "Économie du travail"),
+            ("institution", "London School of Economics (LSE)"), ("institution", "University of Economics, Prague")])
+        self.assertEqual(suggester.suggest("L", limit=1), [("jel", "Labor Economics"), ("institution", "London School of Economics (LSE)"), ("author", "Lawrence Summers")])
+        self.assertEqual(suggester.suggest("summ"), [("author", "Lawrence Summers")])
+        self.assertEqual(suggester.suggest("economie"), [("jel", "Économie du travail")])
+        self.assertEqual(suggester.suggest("xyz"), [])
+        # Only the keys starting with the prefix are considered, the best ranked first
+        index = suggestions.build_index([[], [], [("Smith {}".format(n), n) for n in range(500)] + [("Smiz", 1000), ("Smitz", 0.5)]])
+        suggester = suggestions.Suggester(index)
+        self.assertEqual(suggester.suggest("smit", limit=3), [("author", "Smith 499"), ("author", "Smith 498"), ("author", "Smith 497")])
+        self.assertEqual(suggester.suggest("smitz"), [("author", "Smitz")])
+        # A label found under several keys of the range is suggested once
+        suggester = suggestions.Suggester(suggestions.build_index([[], [], [("Smith {}".format(n), n) for n in range(5)] + [("Smith Smith", 10)]]))
+        self.assertEqual(suggester.suggest("smit", limit=2), [("author", "Smith Smith"), ("author", "Smith 4")])
+
+    def test_bulk_sink(self):
+        from elasticsearch.exceptions import ConnectionTimeout
+        client = local_search.LocalSearch()
+        calls = []
+        class Flaky:
+            transport = client.transport
+            def bulk(self, body, **kwargs):
+                calls.append(body)
+                if len(calls) == 1:
+                    raise ConnectionTimeout("TIMEOUT", "timed out", None)
+                resp = client.bulk(body, **kwargs)
+                if len(calls) == 2:
+                    # The write queue of the node is full for the first item
+                    resp["items"][0]["index"] = dict(resp["items"][0]["index"], status=429)
+                    client.delete(index="docs", id="0")
+                return resp
+        self.patch(bulk_sink, "INITIAL_BACKOFF", 0.01)
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "dead.ndjson")
+            actions = [{ "_index": "docs", "_id": str(i), "n": i } for i in range(10)]
+            actions.append({ "_op_type": "update", "_index": "docs", "_id": "missing", "doc": { "n": 0 } })
+            stats = bulk_sink.BulkSink(Flaky(), "test", dead_letter_file=path).run(actions)
+            self.assertEqual((stats["docs"], stats["failed"]), (10, 1))
+            self.assertEqual(client.count(index="docs")["count"], 10)
+            dead = list(bulk_sink.read_dead_letters(path))
+            self.assertEqual(len(dead), 1)
+            self.assertEqual(json.loads(dead[0][0]), { "update": { "_index": "docs", "_id": "missing" } })
+            # Failed actions can be replayed once fixed
+            client.index(index="docs", id="missing", body={ "n": 1 })
+            stats = bulk_sink.BulkSink(client, "replay", dead_letter_file=None).run_entries(dead)
+            self.assertEqual((stats["docs"], stats["failed"]), (1, 0))
+
+    def test_metrics(self):
+        m = metrics.Metrics()
+        m.job = "test"
+        with m.timer("parse", 3):
+            pass
+        m.set_total("parse", 12)
+        m.count("publications", 40)
+        m.gauge("bulk_in_flight", 2)
+        self.assertEqual(list(m.timed_iter("scan", [1, 2])), [1, 2])
+        # Metrics of a worker process are merged into those of the main process
+        worker = metrics.Metrics()
+        with worker.timer("parse", 2):
+            pass
+        m.merge(worker.drain())
+        self.assertEqual(worker.snapshot()["stages"], { })
+        snap = m.snapshot()
+        self.assertEqual((snap["stages"]["parse"]["calls"], snap["stages"]["parse"]["items"]), (2, 5))
+        self.assertEqual(snap["stages"]["scan"]["items"], 2)
+        text = m.prometheus()
+        self.assertIn('econfast_stage_items_total{job="test",stage="parse"} 5', text)
+        self.assertIn('econfast_events_total{job="test",name="publications"} 40', text)
+        self.assertIn('econfast_gauge{job="test",name="bulk_in_flight"} 2', text)
+        self.assertIn("parse 5/12", m.progress_line())
+        with tempfile.TemporaryDirectory() as d:
+            m.export(os.path.join(d, "metrics.json"))
+            with open(os.path.join(d, "metrics.json")) as f:
+                self.assertEqual(json.load(f)["counters"], { "publications": 40 })
+
+    def test_profiling(self):
+        def work(n):
+            return sum([i * i for i in range(n)])
+        for mode in profiling.PROFILE_MODES:
+            with tempfile.TemporaryDirectory() as d:
+                profiler = profiling.Profiler(d, mode, memory=True, interval=0.001)
+                profiler.start()
+                with metrics.timer("aggregate"):
+                    with metrics.timer("hash_name"):
+                        work(200000)
+                    blocks = [bytearray(1000) for i in range(2000)]
+                    work(200000)
+                # Stages timed by other threads are not profiled
+                thread = threading.Thread(target=lambda: metrics.timer("es_bulk").__enter__())
+                thread.start()
+                thread.join()
+                paths = profiler.stop()
+                self.assertEqual(metrics.STAGE_HOOKS, [])
+                names = sorted([os.path.basename(p) for p in paths])
+                ext = ".pstats" if mode == "cpu" else ".folded"
+                self.assertEqual(names, ["aggregate" + ext, "hash_name" + ext, "main" + ext, "memory.txt"])
+                if mode == "cpu":
+                    stats = pstats.Stats(os.path.join(d, "hash_name.pstats"))
+                    self.assertTrue(any([func[2] == "work" for func in stats.stats]))
+                else:
+                    with open(os.path.join(d, "hash_name.folded")) as f:
+                        stacks = [l.rsplit(" ", 1) for l in f]
+                    self.assertTrue(stacks)
+                    self.assertTrue(all([int(count) > 0 and "work (test_econfast.py" in stack for stack, count in stacks]))
+                with open(os.path.join(d, "memory.txt")) as f:
+                    memory = f.read()
+                self.assertIn("aggregate", memory)
+                self.assertIn("test_econfast.py", memory)
+                del blocks
+
+    def test_flag_options(self):
+        flags = { "__file__": index_authors.__file__, "CRAWL_AUTHOR_PICS": True, "IMAGE_CRAWL_WORKERS": 4, "IMAGE_BACKEND": "selenium" }
+        parser = argparse.ArgumentParser()
+        cli.add_flag_options(parser, flags, ["CRAWL_AUTHOR_PICS", "IMAGE_CRAWL_WORKERS", "IMAGE_BACKEND"])
+        self.assertIn("Number of concurrent image fetchers", parser.format_help())
+        args = parser.parse_args(["--no-crawl-author-pics", "--image-crawl-workers", "8"])
+        cli.apply_flag_options(args, flags, ["CRAWL_AUTHOR_PICS", "IMAGE_CRAWL_WORKERS", "IMAGE_BACKEND"])
+        self.assertEqual((flags["CRAWL_AUTHOR_PICS"], flags["IMAGE_CRAWL_WORKERS"], flags["IMAGE_BACKEND"]), (False, 8, "selenium"))
+
+    def test_lazy_imports(self):
+        calls = []
+        table = lazy.Lazy(lambda: calls.append(1) or { "a": 1 })
+        self.assertEqual(calls, [])
+        self.assertIn("a", table)
+        self.assertEqual((table["a"], len(table), list(table), table.get("b")), (1, 1, ["a"], None))
+        self.assertEqual(calls, [1])
+        table.reset()
+        table.set({ })
+        self.assertEqual((len(table), calls), (0, [1]))
+        # Importing the indexers neither creates the search client nor reads the lookup tables nor imports OpenCV
+        out = subprocess.check_output([sys.executable, "-c", "import sys, index_publis, index_authors; print(index_publis.ES.created, "
+            "index_publis.JEL_CODEMAPS.created, index_authors.ES.created, index_authors.TOP_AUTHORS.created, index_authors.TOP_INSTITS.created, "
+            "index_authors.MAPPING_AUTHOR.created, 'cv2' in sys.modules, 'scipy' in sys.modules)"])
+        self.assertEqual(out.decode().split(), ["False"] * 8)
+        self.assertEqual(len(index_authors.TOP_INSTITS), len(set(lines("top_institutions"))))
+
+    def test_resumable_build(self):
+        client = self.local_client()
+        with tempfile.TemporaryDirectory() as d:
+            synthetic_repec.generate(os.path.join(d, "repec"), 400, seed=2, publis_per_file=20)
+            index_publis.index_repec_files(sorted(glob.glob(os.path.join(d, "repec", "*", "*", "*.rdf"))))
+            client.indices.refresh(index=ES_INDEX_PUBLI)
+            self.assertTrue(publi_reader.has_pub_ids(client, ES_INDEX_PUBLI))
+            self.reset_authors(client)
+            index_authors.index_authors_in_memory()
+            expected = self.author_summaries(client, exact_coauthors=False)
+            # A build interrupted by an error is resumed from its last checkpoint, with the same result
+            class Failing:
+                def __init__(self, searches):
+                    self.searches = searches
+                def __getattr__(self, name):
+                    return getattr(client, name)
+                def search(self, **kwargs):
+                    self.searches -= 1
+                    if self.searches < 0:
+                        raise TransportError(400, "search_phase_execution_exception")
+                    return client.search(**kwargs)
+            self.patch(index_authors, "BUILD_CHECKPOINT_FILE", os.path.join(d, "build.checkpoint"))
+            self.patch(index_authors, "BUILD_CHECKPOINT_INTERVAL", 0)
+            self.patch(index_authors, "PUBLI_READERS", 3)
+            self.patch(publi_reader, "PAGE_SIZE", 50)
+            self.reset_authors(client)
+            with mock.patch.object(index_authors, "ES", Failing(4)):
+                with self.assertRaises(TransportError):
+                    index_authors.index_authors_resumable(datetime(2020, 1, 2))
+            state = index_authors.load_build_state()
+            self.assertTrue(0 < state["publications"] < len(client.search(index=ES_INDEX_PUBLI, body={ "size": 10000 })["hits"]["hits"]))
+            self.reset_authors(client)
+            self.assertEqual(index_authors.index_authors_resumable(datetime(2020, 3, 4)), datetime(2020, 1, 2))
+            self.assertFalse(os.path.exists(index_authors.BUILD_CHECKPOINT_FILE))
+            self.assertEqual(self.author_summaries(client, exact_coauthors=False), expected)
+            # Digests of the publications aggregated before the interruption are fetched again
+            some = next(iter(expected))
+            digest = client.get(index=index_authors.ES_INDEX_DIGEST, id=some + ":0")["_source"]
+            self.assertTrue(all([p.get("title") for p in digest["publis"]]))
+
+    def test_delta_update(self):
+        client = self.local_client()
+        self.patch(index_authors, "MAX_COAUTHORS", 1)
+        self.patch(index_publis, "RUN_DATE", index_publis.RUN_DATE)
+        def record(authors, title):
+            return u"Template-Type: ReDIF-Article 1.0\n" + u"".join([u"Author-Name: {}\n".format(a) for a in authors]) + u"Title: {}\nCreation-Date: 2001\n\n".format(title)
+        def authors():
+            return self.author_summaries(client, exact_coauthors=False)
+        def rebuild():
+            self.reset_authors(client)
+            index_authors.index_authors_in_memory()
+            return authors()
+        def index_files():
+            index_publis.RUN_DATE = datetime.now()
+            index_publis.parse_repec_root_incremental(root, 1)
+            client.indices.refresh(index=ES_INDEX_PUBLI)
+        with tempfile.TemporaryDirectory() as d:
+            root = os.path.join(d, "repec")
+            os.makedirs(os.path.join(root, "a", "b"))
+            f1, f2 = os.path.join(root, "a", "b", "f1.rdf"), os.path.join(root, "a", "b", "f2.rdf")
+            self.patch(index_publis, "MANIFEST_FILE", os.path.join(d, "manifest.json"))
+            self.patch(index_publis, "DELETIONS_FILE", os.path.join(d, "deletions"))
+            self.patch(index_authors, "PUBLI_DELETIONS_FILE", os.path.join(d, "deletions"))
+            with io.open(f1, "w", encoding="utf-8") as f:
+                f.write(record(["Bruce Greenwald", "Andrew Weiss"], "Credit rationing") + record(["Andrew Weiss"], "Efficiency wages"))
+            with io.open(f2, "w", encoding="utf-8") as f:
+                f.write(record(["Carl Shapiro", "Bruce Greenwald"], "Equilibrium unemployment"))
+            index_files()
+            checkpoint = datetime.now().isoformat()
+            rebuild()
+            # A publication whose title and authors are edited is updated, and its former author loses it
+            time.sleep(0.01)
+            with io.open(f1, "w", encoding="utf-8") as f:
+                f.write(record(["Bruce Greenwald", "Michael Rothschild"], "Credit rationing in markets") + record(["Andrew Weiss"], "Efficiency wages"))
+            index_files()
+            previous, checkpoint = checkpoint, datetime.now().isoformat()
+            index_authors.index_authors_delta(previous)
+            updated = authors()
+            self.assertIn("markets", updated["bruce greenwald"]["titles"])
+            self.assertEqual(updated["andrew weiss"]["titles"], ["Efficiency", "wages"])
+            # Co-authors are limited to the top MAX_COAUTHORS, as in a full build
+            self.assertEqual(updated["bruce greenwald"]["coauthors"], 1)
+            self.assertEqual(updated, rebuild())
+            # A deleted publication is removed, as well as the authors left without publications
+            time.sleep(0.01)
+            os.remove(f2)
+            index_files()
+            index_authors.index_authors_delta(checkpoint)
+            updated = authors()
+            self.assertNotIn("carl shapiro", updated)
+            self.assertEqual(len(updated["bruce greenwald"]["pub_ids"]), 1)
+            self.assertEqual(updated, rebuild())
+
+    def test_partitioned_build(self):
+        client = self.local_client()
+        with tempfile.TemporaryDirectory() as d:
+            synthetic_repec.generate(os.path.join(d, "repec"), 400, seed=3, publis_per_file=20)
+            index_publis.index_repec_files(sorted(glob.glob(os.path.join(d, "repec", "*", "*", "*.rdf"))))
+            client.indices.refresh(index=ES_INDEX_PUBLI)
+            self.reset_authors(client)
+            graph = coauthor_graph.CoauthorGraph()
+            index_authors.aggregate_authors(index_authors.yield_publis(), graph=graph)
+            self.reset_authors(client)
+            index_authors.index_authors_in_memory()
+            expected = self.author_summaries(client)
+            self.assertTrue(any([summary["coauthors"] for summary in expected.values()]))
+            # The steps of the processes, run one after the other in this process
+            partitions = 3
+            self.patch(index_authors, "PARTITION_DIR", os.path.join(d, "partitions"))
+            os.makedirs(index_authors.PARTITION_DIR)
+            self.reset_authors(client)
+            # The ranges of the readers are shared out among the processes
+            self.patch(index_authors, "PUBLI_READERS", 5)
+            routed = sum([index_authors.map_publication_range(reader, partitions)[0] for reader in range(partitions)])
+            self.assertEqual(routed, client.count(index=ES_INDEX_PUBLI)["count"])
+            parts = list([index_authors.aggregate_partition(p, partitions) for p in range(partitions)])
+            self.assertEqual(sum([len(accs) for accs, _ in parts]), len(expected))
+            for p, (accs, _) in enumerate(parts):
+                self.assertTrue(all([index_authors.author_partition(name_hash, partitions) == p for name_hash in accs]))
+            m = coauthor_graph.matrix_from_rows([index_authors.load_partition_file(index_authors.partition_file("edges", p)) for p in range(partitions)])
+            self.assertEqual(coauthor_graph.degree_stats(m), coauthor_graph.degree_stats(graph.matrix()))
+            index_authors.crawl_partition_images(partitions)
+            for p, (accs, graph) in enumerate(parts):
+                index_authors.index_partition(p, partitions, accs, graph)
+            self.assertEqual(self.author_summaries(client), expected)
+            # The same steps in parallel processes (whose documents are not indexed in the in-memory client of this process)
+            self.assertEqual(index_authors.index_authors_partitioned(partitions), len(expected))
+            self.assertFalse(os.path.exists(index_authors.PARTITION_DIR))
+
+    def test_coauthor_graph(self):
+        publis = [["a", "b", "c"], ["a", "b"], ["c", "d", None]]
+        graph = coauthor_graph.CoauthorGraph()
+        for name_hashes in publis:
+            graph.add_publication(name_hashes)
+        self.assertEqual((graph.matrix()[0, 1], graph.matrix().nnz, graph.skipped), (2, 8, 0))
+        # Large collaborations are left out only when a limit is set
+        graph = coauthor_graph.CoauthorGraph(max_publi_authors=2)
+        for name_hashes in publis:
+            graph.add_publication(name_hashes)
+        self.assertEqual((graph.matrix()[0, 1], graph.matrix().nnz, graph.skipped), (1, 4, 1))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file